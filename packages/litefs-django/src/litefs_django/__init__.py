@@ -1,9 +1,11 @@
 """Django adapter for LiteFS SQLite replication."""
 
+from litefs.usecases.response_cache import cache_by_txid
+
 from litefs_django.apps import LiteFSDjangoConfig
-from litefs_django.exceptions import NotPrimaryError, SplitBrainError
+from litefs_django.exceptions import NotPrimaryError, SplitBrainError, StaleEpochError
 from litefs_django.settings import get_litefs_settings
-from litefs_django.signals import split_brain_detected
+from litefs_django.signals import replication_changed, split_brain_detected
 
 __version__ = "0.1.0"
 
@@ -11,7 +13,10 @@ __all__ = [
     "LiteFSDjangoConfig",
     "NotPrimaryError",
     "SplitBrainError",
+    "StaleEpochError",
+    "cache_by_txid",
     "get_litefs_settings",
+    "replication_changed",
     "split_brain_detected",
 ]
 
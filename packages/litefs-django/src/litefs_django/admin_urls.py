@@ -0,0 +1,42 @@
+"""Opt-in URL configuration for the LiteFS Django local admin endpoints.
+
+These endpoints expose per-route traffic, the cluster topology and SQL
+statements, so litefs_django.urls does not include them. Include them
+only where every loopback request is trusted, e.g. from a URLconf served
+on an internal port:
+
+    from django.urls import include, path
+
+    urlpatterns = [
+        # ... other patterns
+        path("", include("litefs_django.admin_urls")),
+    ]
+
+The views only answer requests whose REMOTE_ADDR is a loopback address.
+Behind a reverse proxy on the same host every request arrives from
+loopback, so that check does not keep public clients out.
+
+This will expose:
+    /routes - Per-route traffic statistics, read by litefs_top
+              (404 unless LITEFS["ROUTE_STATS"] is enabled)
+    /cluster - Cluster view (Raft, peers, forwarding), read by
+               litefs_status --watch
+    /slow-queries - Slow-query logs, read by litefs_slow_queries (404
+                    unless a database sets "litefs_slow_query_threshold")
+"""
+
+from django.urls import path
+
+from litefs_django.views import (
+    cluster_status_view,
+    route_stats_view,
+    slow_queries_view,
+)
+
+app_name = "litefs_django_admin"
+
+urlpatterns = [
+    path("routes", route_stats_view, name="route_stats"),
+    path("cluster", cluster_status_view, name="cluster_status"),
+    path("slow-queries", slow_queries_view, name="slow_queries"),
+]
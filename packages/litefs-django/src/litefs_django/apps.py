@@ -14,11 +14,17 @@ from litefs_django.settings import (
     get_dev_mode_reason,
     detect_litefs_artifacts,
 )
+from litefs.adapters.inotify_file_watcher import create_file_watcher
+from litefs.domain.events import ReplicationChangeEvent
+from litefs.domain.settings import LiteFSSettings
+from litefs.usecases.change_bus import ChangeBus
 from litefs.usecases.mount_validator import MountValidator
 from litefs.usecases.primary_detector import PrimaryDetector, LiteFSNotRunningError
 from litefs.usecases.primary_initializer import PrimaryInitializer
 from litefs.usecases.primary_marker_writer import PrimaryMarkerWriter
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
 from litefs.adapters.ports import EnvironmentNodeIDResolver, NodeIDResolverPort
+from litefs_django.signals import replication_changed
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +56,31 @@ def _default_primary_marker_writer_factory(mount_path: str) -> PrimaryMarkerWrit
     return PrimaryMarkerWriter(mount_path)
 
 
+def _default_change_bus_factory(litefs_settings: LiteFSSettings) -> ChangeBus:
+    """Default factory for creating ChangeBus instances."""
+    bus_settings = litefs_settings.change_bus
+    assert bus_settings is not None
+    position_reader = ReplicationPositionReader(
+        litefs_settings.mount_path, litefs_settings.database_name
+    )
+    watcher = (
+        create_file_watcher(position_reader.position_file)
+        if bus_settings.use_inotify
+        else None
+    )
+    return ChangeBus(
+        position_reader,
+        watcher=watcher,
+        poll_interval=bus_settings.poll_interval,
+        min_interval=bus_settings.min_interval,
+    )
+
+
+def _send_replication_changed(event: ReplicationChangeEvent) -> None:
+    """Forward change bus events to the replication_changed signal."""
+    replication_changed.send(sender=ChangeBus, event=event)
+
+
 class LiteFSDjangoConfig(AppConfig):
     """Django app configuration for LiteFS adapter."""
 
@@ -73,12 +104,19 @@ class LiteFSDjangoConfig(AppConfig):
     primary_marker_writer_factory: Callable[[str], PrimaryMarkerWriter] = (
         _default_primary_marker_writer_factory
     )
+    change_bus_factory: Callable[[LiteFSSettings], ChangeBus] = (
+        _default_change_bus_factory
+    )
 
-    # Instance attribute for cleanup reference
+    # Instance attributes for cleanup reference
     _marker_writer: PrimaryMarkerWriter | None = None
+    change_bus: ChangeBus | None = None
 
     def ready(self) -> None:
         """Validate LiteFS settings and check availability on startup."""
+        # Connects the service container's setting_changed receiver
+        from litefs_django import services  # noqa: F401
+
         litefs_config = getattr(django_settings, "LITEFS", None)
         debug_mode = getattr(django_settings, "DEBUG", False)
 
@@ -119,6 +157,17 @@ class LiteFSDjangoConfig(AppConfig):
                 )
                 return
 
+            # Start the change bus if enabled (sends replication_changed)
+            if litefs_settings.change_bus and litefs_settings.change_bus.enabled:
+                self._start_change_bus(litefs_settings)
+
+            # Start the active health probes if enabled, so the node is
+            # measured before the first health check
+            if litefs_settings.health_probes and litefs_settings.health_probes.enabled:
+                from litefs_django.services import get_shared_health_monitor
+
+                get_shared_health_monitor()
+
             # Check if this node is primary (optional, for logging)
             # Use different detection method based on leader_election mode
             try:
@@ -172,6 +221,25 @@ class LiteFSDjangoConfig(AppConfig):
             # Don't raise - allow Django to start even if LiteFS config is invalid
             # Application will fail when trying to use database backend
 
+    def _start_change_bus(self, litefs_settings: LiteFSSettings) -> None:
+        """Start the change bus and forward its events to replication_changed.
+
+        Args:
+            litefs_settings: Validated LiteFS settings with change_bus enabled.
+        """
+        if self.change_bus is not None and self.change_bus.is_running:
+            return
+
+        change_bus = self.change_bus_factory(litefs_settings)
+        change_bus.subscribe(_send_replication_changed)
+        change_bus.start()
+        self.change_bus = change_bus
+
+        # Stop the thread and close the watcher on shutdown
+        atexit.register(change_bus.stop, 1.0)
+
+        logger.info("LiteFS change bus started")
+
     def _write_primary_marker(self, mount_path: str, node_id: str) -> None:
         """Write the .primary marker file for static leader election.
 
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import sqlite3
+import time
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from django.conf import settings as django_settings
 from django.db.backends.sqlite3.base import (
@@ -11,12 +14,41 @@ from django.db.backends.sqlite3.base import (
     SQLiteCursorWrapper as SQLite3Cursor,
 )
 
+from litefs.adapters.metrics_port import MetricsPort, NoOpMetricsAdapter
 from litefs.adapters.ports import PrimaryDetectorPort
+from litefs.domain.metrics import (
+    CONNECTION_SETUP_DURATION,
+    QUERY_CACHE_LOOKUPS,
+    SLOW_QUERIES,
+    SQL_CLASSIFICATION_DURATION,
+    STATEMENT_DURATION,
+    STATEMENTS,
+    WRITE_GUARD_DURATION,
+)
+from litefs.usecases.epoch_fence import EpochFence, TransactionFence
 from litefs.usecases.mount_validator import MountValidator
-from litefs.usecases.primary_detector import PrimaryDetector
+from litefs.usecases.query_cache import CachedQueryResult
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
+from litefs.usecases.server_timing import (
+    DB_LOCK_WAIT_SPAN,
+    PRIMARY_CHECK_SPAN,
+    SPLIT_BRAIN_CHECK_SPAN,
+    record_span,
+)
+from litefs.usecases.slow_query_log import SlowQueryLog
 from litefs.usecases.split_brain_detector import SplitBrainDetector
 from litefs.usecases.sql_detector import SQLDetector
-from litefs_django.exceptions import NotPrimaryError, SplitBrainError
+from litefs_django.db.query_cache import (
+    ConnectionQueryCache,
+    get_or_create_query_cache,
+)
+from litefs_django.db.slow_query_log import get_or_create_slow_query_log
+from litefs_django.exceptions import NotPrimaryError, SplitBrainError, StaleEpochError
+from litefs_django.services import (
+    get_shared_epoch_fence,
+    get_shared_metrics,
+    get_shared_primary_detector,
+)
 from litefs_django.settings import (
     is_dev_mode,
     get_dev_mode_reason,
@@ -26,6 +58,19 @@ from litefs_django.settings import (
 if TYPE_CHECKING:
     from sqlite3 import Connection
 
+# Default memory cap of the query-result cache of each alias
+DEFAULT_QUERY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+
+# Defaults of the slow-query log of each alias
+DEFAULT_SLOW_QUERY_LOG_SIZE = 100
+DEFAULT_SLOW_QUERY_EXPLAIN_RATE = 0.1
+
+# Server-Timing span of each write check
+_WRITE_GUARD_SPANS = {
+    "primary": PRIMARY_CHECK_SPAN,
+    "split_brain": SPLIT_BRAIN_CHECK_SPAN,
+}
+
 
 class LiteFSCursor(SQLite3Cursor):
     """Cursor with primary detection and split-brain detection for write operations."""
@@ -36,6 +81,10 @@ class LiteFSCursor(SQLite3Cursor):
         primary_detector: PrimaryDetectorPort,
         split_brain_detector: SplitBrainDetector | None = None,
         dev_mode: bool = False,
+        query_cache: ConnectionQueryCache | None = None,
+        metrics: MetricsPort | None = None,
+        slow_query_log: SlowQueryLog | None = None,
+        transaction_fence: TransactionFence | None = None,
     ) -> None:
         """Initialize LiteFS cursor.
 
@@ -47,12 +96,110 @@ class LiteFSCursor(SQLite3Cursor):
                 for detecting split-brain conditions. If provided, split-brain
                 check is performed BEFORE primary status check on write operations.
             dev_mode: If True, skip all LiteFS-specific checks (primary, split-brain).
+            query_cache: Optional query-result cache binding of the connection.
+                If provided, read results are served from and stored in it,
+                and writes invalidate the tables they touch.
+            metrics: Optional port for statement, write check and query cache
+                metrics. Defaults to NoOpMetricsAdapter.
+            slow_query_log: Optional log of the alias. If provided, statements
+                slower than its threshold are recorded, with the query plan
+                of a sampled fraction of the slow reads.
+            transaction_fence: Optional epoch fence of the connection. If
+                provided, writes are rejected once this node no longer leads
+                under the epoch their transaction began under.
         """
         super().__init__(connection)
         self._primary_detector = primary_detector
         self._split_brain_detector = split_brain_detector
         self._sql_detector = SQLDetector()
         self._dev_mode = dev_mode
+        self._query_cache = query_cache
+        self._metrics: MetricsPort = metrics or NoOpMetricsAdapter()
+        self._slow_query_log = slow_query_log
+        self._transaction_fence = transaction_fence
+        # Classification of the last statement, reused by the checks of one
+        # execute() call
+        self._classified_sql: str | None = None
+        self._classified_is_write = False
+        # Result of the last execute() when served through the query cache
+        self._cached_result: CachedQueryResult | None = None
+        self._cached_rows: deque[tuple[Any, ...]] = deque()
+
+    def _is_write_operation(self, sql: str) -> bool:
+        """Classify a statement as a write, once per statement object.
+
+        The split-brain check, the primary check and the query cache all
+        need the classification of the statement being executed.
+        """
+        if sql is not self._classified_sql:
+            started = time.perf_counter()
+            self._classified_is_write = self._sql_detector.is_write_operation(sql)
+            self._metrics.observe_histogram(
+                SQL_CLASSIFICATION_DURATION, time.perf_counter() - started
+            )
+            self._classified_sql = sql
+        return self._classified_is_write
+
+    def _observe_write_guard(self, check: str, started: float) -> None:
+        """Record the duration of a check performed before a write."""
+        self._metrics.observe_histogram(
+            WRITE_GUARD_DURATION, time.perf_counter() - started, {"check": check}
+        )
+        record_span(_WRITE_GUARD_SPANS[check], started)
+
+    def _observe_statement(self, is_write: bool, started: float) -> float:
+        """Record the count and execution time of a statement.
+
+        Returns:
+            The execution time in seconds.
+        """
+        duration = time.perf_counter() - started
+        labels = {"kind": "write" if is_write else "read"}
+        self._metrics.increment_counter(STATEMENTS, labels=labels)
+        self._metrics.observe_histogram(STATEMENT_DURATION, duration, labels)
+        return duration
+
+    def _record_slow_query(self, sql, params, duration: float, explain: bool) -> None:
+        """Record a statement in the slow-query log if it is slow.
+
+        Args:
+            sql: SQL statement as passed to execute().
+            params: Its parameters, used to capture the query plan.
+            duration: Execution time in seconds.
+            explain: Whether the query plan may be captured for this call.
+        """
+        slow_query_log = self._slow_query_log
+        if slow_query_log is None or not slow_query_log.is_slow(duration):
+            return
+        plan = None
+        if (
+            explain
+            and self._sql_detector.is_query(sql)
+            and slow_query_log.should_explain()
+        ):
+            plan = self._explain_query_plan(sql, params)
+        entry = slow_query_log.record(sql, duration, plan)
+        self._metrics.increment_counter(
+            SLOW_QUERIES, labels={"fingerprint_id": entry.fingerprint_id}
+        )
+
+    def _explain_query_plan(self, sql, params) -> list[str] | None:
+        """Capture the EXPLAIN QUERY PLAN details of a read query.
+
+        Runs on a separate cursor so that the rows of the query are kept.
+
+        Returns:
+            The detail column of each plan step, or None if SQLite cannot
+            explain the statement.
+        """
+        cursor = SQLite3Cursor(self.connection)
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+            return [row[3] for row in cursor.fetchall()]
+        except sqlite3.Error:
+            return None
+        finally:
+            cursor.close()
 
     def _check_split_brain_before_write(self, sql: str) -> None:
         """Check for split-brain condition before write operations.
@@ -71,9 +218,11 @@ class LiteFSCursor(SQLite3Cursor):
             # No detector provided, skip check
             return
 
-        if self._sql_detector.is_write_operation(sql):
+        if self._is_write_operation(sql):
+            started = time.perf_counter()
             try:
                 split_brain_status = self._split_brain_detector.detect_split_brain()
+                self._observe_write_guard("split_brain", started)
                 if split_brain_status.is_split_brain:
                     leader_count = len(split_brain_status.leader_nodes)
                     raise SplitBrainError(
@@ -102,9 +251,12 @@ class LiteFSCursor(SQLite3Cursor):
         if self._dev_mode:
             return
 
-        if self._sql_detector.is_write_operation(sql):
+        if self._is_write_operation(sql):
+            started = time.perf_counter()
             try:
-                if not self._primary_detector.is_primary():
+                is_primary = self._primary_detector.is_primary()
+                self._observe_write_guard("primary", started)
+                if not is_primary:
                     raise NotPrimaryError(
                         "This node is not primary (replica). "
                         "Write operation attempted on replica node. "
@@ -116,6 +268,31 @@ class LiteFSCursor(SQLite3Cursor):
                 # Re-raise other exceptions (e.g., LiteFSNotRunningError)
                 raise
 
+    def _check_epoch_before_write(self, sql: str | None) -> None:
+        """Check that the leader epoch did not change under a write.
+
+        This check is performed AFTER primary status check. The epoch is
+        cached locally by the leader election, so no peer is queried.
+
+        Args:
+            sql: SQL statement to check, or None for a script
+
+        Raises:
+            StaleEpochError: If this node no longer leads under the epoch
+                of the write's transaction
+        """
+        if self._dev_mode or self._transaction_fence is None:
+            return
+
+        fence = self._transaction_fence
+        is_write = sql is None or self._is_write_operation(sql)
+        if is_write and not fence.admits_write(self.connection.in_transaction):
+            raise StaleEpochError(
+                "Leader epoch changed during the transaction "
+                f"(began under epoch {fence.epoch}). "
+                "This node may have been deposed; retry on the new primary."
+            )
+
     def execute(self, sql, params=None):
         """Execute SQL statement with split-brain and primary checks for write operations.
 
@@ -134,7 +311,103 @@ class LiteFSCursor(SQLite3Cursor):
         """
         self._check_split_brain_before_write(sql)
         self._check_primary_before_write(sql)
-        return super().execute(sql, params)
+        self._check_epoch_before_write(sql)
+        self._cached_result = None
+        self._cached_rows.clear()
+        started = time.perf_counter()
+        try:
+            if self._query_cache is None:
+                result = super().execute(sql, params)
+            else:
+                result = self._execute_with_query_cache(sql, params)
+        finally:
+            duration = self._observe_statement(self._is_write_operation(sql), started)
+        self._record_slow_query(sql, params, duration, explain=True)
+        return result
+
+    def _execute_with_query_cache(self, sql, params):
+        """Execute SQL through the query-result cache.
+
+        Read results are buffered in the cursor, so a hit never reaches
+        SQLite. Writes invalidate the cached results of their tables.
+        """
+        query_cache = self._query_cache
+        assert query_cache is not None
+
+        if self._sql_detector.is_transaction_control(sql):
+            result = super().execute(sql, params)
+            if not self.connection.in_transaction:
+                query_cache.end_transaction(
+                    committed=not sql.lstrip().upper().startswith("ROLLBACK")
+                )
+            return result
+
+        if self._is_write_operation(sql):
+            result = super().execute(sql, params)
+            query_cache.record_write(
+                self._sql_detector.extract_table_names(sql),
+                self.connection.in_transaction,
+            )
+            return result
+
+        if not self._sql_detector.is_query(sql):
+            return super().execute(sql, params)
+
+        lookup = query_cache.lookup(sql, params)
+        if lookup is None:
+            return super().execute(sql, params)
+        key, position, cached = lookup
+        self._metrics.increment_counter(
+            QUERY_CACHE_LOOKUPS, labels={"result": "miss" if cached is None else "hit"}
+        )
+        if cached is None:
+            super().execute(sql, params)
+            cached = CachedQueryResult(
+                description=super().description,
+                rows=tuple(super().fetchall()),
+            )
+            query_cache.store(
+                key, position, cached, self._sql_detector.extract_table_names(sql)
+            )
+        self._cached_result = cached
+        self._cached_rows.extend(cached.rows)
+        return self
+
+    @property
+    def description(self):
+        """Get the result columns, including those of cached results."""
+        if self._cached_result is not None:
+            return self._cached_result.description
+        return super().description
+
+    def fetchone(self):
+        """Fetch the next row."""
+        if self._cached_result is None:
+            return super().fetchone()
+        return self._cached_rows.popleft() if self._cached_rows else None
+
+    def fetchmany(self, size=None):
+        """Fetch the next set of rows."""
+        if self._cached_result is None:
+            return super().fetchmany(self.arraysize if size is None else size)
+        count = min(self.arraysize if size is None else size, len(self._cached_rows))
+        return [self._cached_rows.popleft() for _ in range(count)]
+
+    def fetchall(self):
+        """Fetch all remaining rows."""
+        if self._cached_result is None:
+            return super().fetchall()
+        rows = list(self._cached_rows)
+        self._cached_rows.clear()
+        return rows
+
+    def __next__(self):
+        """Iterate over the result rows."""
+        if self._cached_result is None:
+            return super().__next__()
+        if not self._cached_rows:
+            raise StopIteration
+        return self._cached_rows.popleft()
 
     def executemany(self, sql, param_list):
         """Execute SQL statement multiple times with split-brain and primary checks.
@@ -154,7 +427,22 @@ class LiteFSCursor(SQLite3Cursor):
         """
         self._check_split_brain_before_write(sql)
         self._check_primary_before_write(sql)
-        return super().executemany(sql, param_list)
+        self._check_epoch_before_write(sql)
+        self._cached_result = None
+        self._cached_rows.clear()
+        started = time.perf_counter()
+        try:
+            result = super().executemany(sql, param_list)
+        finally:
+            duration = self._observe_statement(self._is_write_operation(sql), started)
+        # The plan of one statement says little about a batch, never explained
+        self._record_slow_query(sql, None, duration, explain=False)
+        if self._query_cache is not None and self._is_write_operation(sql):
+            self._query_cache.record_write(
+                self._sql_detector.extract_table_names(sql),
+                self.connection.in_transaction,
+            )
+        return result
 
     def executescript(self, sql_script):
         """Execute SQL script with split-brain and primary checks (DJANGO-028).
@@ -180,8 +468,10 @@ class LiteFSCursor(SQLite3Cursor):
 
         # Check split-brain first (scripts can be writes)
         if self._split_brain_detector:
+            started = time.perf_counter()
             try:
                 split_brain_status = self._split_brain_detector.detect_split_brain()
+                self._observe_write_guard("split_brain", started)
                 if split_brain_status.is_split_brain:
                     leader_count = len(split_brain_status.leader_nodes)
                     raise SplitBrainError(
@@ -195,13 +485,25 @@ class LiteFSCursor(SQLite3Cursor):
                 raise
 
         # Then check primary status
-        if not self._primary_detector.is_primary():
+        started = time.perf_counter()
+        is_primary = self._primary_detector.is_primary()
+        self._observe_write_guard("primary", started)
+        if not is_primary:
             raise NotPrimaryError(
                 "This node is not primary (replica). "
                 "Script execution attempted on replica node. "
                 "Only the primary node can execute scripts that may contain writes."
             )
-        return super().executescript(sql_script)
+        self._check_epoch_before_write(None)
+        started = time.perf_counter()
+        try:
+            result = super().executescript(sql_script)
+        finally:
+            self._observe_statement(True, started)
+        if self._query_cache is not None:
+            # Tables of multi-statement scripts are not extracted
+            self._query_cache.record_write(None, self.connection.in_transaction)
+        return result
 
 
 class DatabaseWrapper(SQLite3DatabaseWrapper):
@@ -212,6 +514,10 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
     - Enforces IMMEDIATE transaction mode
     - Delegates primary detection to PrimaryDetector use case
     - Checks primary status before write operations
+    - Optionally caches read query results (see litefs_django.db.query_cache)
+    - Optionally logs slow statements (see litefs_django.db.slow_query_log)
+    - With Raft leader election, fences writes by the leader epoch
+      (see litefs.usecases.epoch_fence)
 
     Note: There is a TOCTOU (time-of-check-time-of-use) race condition where
     primary status can change between check and write. This is an architectural
@@ -226,6 +532,8 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
         *,
         primary_detector: PrimaryDetectorPort | None = None,
         split_brain_detector: SplitBrainDetector | None = None,
+        metrics: MetricsPort | None = None,
+        epoch_fence: EpochFence | None = None,
     ) -> None:
         """Initialize LiteFS database backend.
 
@@ -233,16 +541,33 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
             settings_dict: Django database settings dict
             alias: Database alias
             primary_detector: Optional PrimaryDetector instance for dependency
-                injection. If not provided, a new PrimaryDetector is created.
+                injection. If not provided, the process-wide detector from
+                litefs_django.services is shared.
                 Use this for testing with FakePrimaryDetector.
             split_brain_detector: Optional SplitBrainDetector instance for dependency
                 injection. If not provided, a new SplitBrainDetector is created.
                 Use this for testing with FakeSplitBrainDetector.
+            metrics: Optional MetricsPort for dependency injection. If not
+                provided, the process-wide adapter from litefs_django.services
+                is shared.
+            epoch_fence: Optional EpochFence for dependency injection. If not
+                provided, the process-wide fence from litefs_django.services
+                is shared with Raft leader election, on the first cursor.
         """
+        self._metrics: MetricsPort = (
+            metrics if metrics is not None else get_shared_metrics()
+        )
+
         # Check if dev mode is enabled (auto-detect from DEBUG)
         litefs_config = getattr(django_settings, "LITEFS", None)
         debug_mode = getattr(django_settings, "DEBUG", False)
         self._dev_mode = is_dev_mode(litefs_config, debug=debug_mode)
+        self._raft_mode = bool(litefs_config) and (
+            litefs_config.get("LEADER_ELECTION") == "raft"
+        )
+        self._epoch_fence = epoch_fence
+        self._epoch_fence_resolved = epoch_fence is not None
+        self._transaction_fence: TransactionFence | None = None
 
         # Extract OPTIONS for configuration validation
         options = settings_dict.get("OPTIONS", {})
@@ -256,6 +581,40 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
                 f"Must be one of: {', '.join(sorted(valid_modes))}"
             )
 
+        # Slow-query log (per-alias opt-in, in both dev and production mode)
+        slow_query_threshold = options.get("litefs_slow_query_threshold")
+        slow_query_log_size = options.get(
+            "litefs_slow_query_log_size", DEFAULT_SLOW_QUERY_LOG_SIZE
+        )
+        slow_query_explain_rate = options.get(
+            "litefs_slow_query_explain_rate", DEFAULT_SLOW_QUERY_EXPLAIN_RATE
+        )
+        if slow_query_threshold is not None and slow_query_threshold < 0:
+            raise ValueError(
+                f"Invalid litefs_slow_query_threshold {slow_query_threshold}. "
+                "Must be a number of seconds >= 0"
+            )
+        if slow_query_log_size < 1:
+            raise ValueError(
+                f"Invalid litefs_slow_query_log_size {slow_query_log_size}. "
+                "Must be >= 1"
+            )
+        if not 0 <= slow_query_explain_rate <= 1:
+            raise ValueError(
+                f"Invalid litefs_slow_query_explain_rate {slow_query_explain_rate}. "
+                "Must be between 0 and 1"
+            )
+        self._slow_query_log: SlowQueryLog | None = (
+            None
+            if slow_query_threshold is None
+            else get_or_create_slow_query_log(
+                alias,
+                threshold=slow_query_threshold,
+                capacity=slow_query_log_size,
+                explain_rate=slow_query_explain_rate,
+            )
+        )
+
         # Extract LiteFS mount path from OPTIONS
         mount_path = options.get("litefs_mount_path")
 
@@ -263,8 +622,11 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
         if primary_detector is not None:
             primary_detector_instance: PrimaryDetectorPort = primary_detector
         else:
-            # Create a detector - in dev mode it won't be used, but needed for type consistency
-            primary_detector_instance = PrimaryDetector(mount_path or "/tmp")
+            # Share the process-wide detector - in dev mode it won't be used,
+            # but needed for type consistency
+            primary_detector_instance = get_shared_primary_detector(
+                mount_path or "/tmp"
+            )
 
         if split_brain_detector is not None:
             split_brain_detector_instance: SplitBrainDetector | None = (
@@ -291,6 +653,9 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
 
             # Store validated transaction mode
             self._transaction_mode = transaction_mode
+
+            # Query-result cache is keyed on LiteFS positions, off in dev mode
+            self._query_cache: ConnectionQueryCache | None = None
             return
 
         # Production mode: validate mount path and use LiteFS behavior
@@ -318,15 +683,32 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
         # Store validated transaction mode
         self._transaction_mode = transaction_mode
 
+        # Query-result cache (per-alias opt-in, or per-queryset via use_query_cache)
+        self._query_cache = ConnectionQueryCache(
+            get_or_create_query_cache(
+                alias,
+                max_bytes=options.get(
+                    "litefs_query_cache_max_bytes", DEFAULT_QUERY_CACHE_MAX_BYTES
+                ),
+            ),
+            ReplicationPositionReader(mount_path, original_name),
+            cache_all_queries=bool(options.get("litefs_query_cache", False)),
+        )
+
     def get_connection_params(self):
-        """Get connection params without litefs_mount_path.
+        """Get connection params without LiteFS-specific options.
 
-        Override to remove litefs_mount_path from OPTIONS before
-        passing to sqlite3.connect().
+        Override to remove litefs_mount_path, the query cache and the
+        slow-query log options from OPTIONS before passing to sqlite3.connect().
         """
         params = super().get_connection_params()
-        # Remove litefs_mount_path - it's for our use, not sqlite3
+        # Remove LiteFS options - they're for our use, not sqlite3
         params.pop("litefs_mount_path", None)
+        params.pop("litefs_query_cache", None)
+        params.pop("litefs_query_cache_max_bytes", None)
+        params.pop("litefs_slow_query_threshold", None)
+        params.pop("litefs_slow_query_log_size", None)
+        params.pop("litefs_slow_query_explain_rate", None)
         return params
 
     def get_new_connection(self, conn_params):
@@ -335,6 +717,7 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
         Raises:
             LiteFSNotRunningError: If mount_path doesn't exist (DJANGO-025)
         """
+        started = time.perf_counter()
         # Skip mount path validation in dev mode
         if not self._dev_mode:
             # Validate mount_path exists before attempting connection (DJANGO-025)
@@ -358,8 +741,27 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
             finally:
                 cursor.close()
 
+        self._metrics.observe_histogram(
+            CONNECTION_SETUP_DURATION, time.perf_counter() - started
+        )
         return connection
 
+    def _get_transaction_fence(self) -> TransactionFence | None:
+        """Get the epoch fence of the connection, resolved on first use.
+
+        Resolving the shared fence starts Raft leader election, so it is
+        deferred until the first cursor.
+        """
+        if self._dev_mode:
+            return None
+        if not self._epoch_fence_resolved:
+            if self._raft_mode:
+                self._epoch_fence = get_shared_epoch_fence()
+            self._epoch_fence_resolved = True
+        if self._transaction_fence is None and self._epoch_fence is not None:
+            self._transaction_fence = TransactionFence(self._epoch_fence)
+        return self._transaction_fence
+
     def create_cursor(self, name=None):
         """Create cursor with primary detection and split-brain detection."""
         return LiteFSCursor(
@@ -367,13 +769,42 @@ class DatabaseWrapper(SQLite3DatabaseWrapper):
             primary_detector=self._primary_detector,
             split_brain_detector=self._split_brain_detector,
             dev_mode=self._dev_mode,
+            query_cache=self._query_cache,
+            metrics=self._metrics,
+            slow_query_log=self._slow_query_log,
+            transaction_fence=self._get_transaction_fence(),
         )
 
+    def _commit(self):
+        """Commit and invalidate cached results of the tables written."""
+        result = super()._commit()
+        if self._query_cache is not None:
+            self._query_cache.end_transaction(committed=True)
+        if self._transaction_fence is not None:
+            self._transaction_fence.end()
+        return result
+
+    def _rollback(self):
+        """Roll back and reset the query cache and epoch fence state."""
+        try:
+            return super()._rollback()
+        finally:
+            if self._query_cache is not None:
+                self._query_cache.end_transaction(committed=False)
+            if self._transaction_fence is not None:
+                self._transaction_fence.end()
+
     def _start_transaction_under_autocommit(self):
         """Start transaction with configured mode for better lock handling.
 
         Overrides Django's default BEGIN (DEFERRED) to use configured transaction mode
         (default: IMMEDIATE), which acquires a write lock immediately and prevents lock
         contention under concurrent load. This is required for LiteFS's single-writer model.
+
+        The time spent waiting for the lock is reported as a Server-Timing span.
         """
+        started = time.perf_counter()
         self.cursor().execute(f"BEGIN {self._transaction_mode}")
+        record_span(DB_LOCK_WAIT_SPAN, started, self._transaction_mode)
+        if self._transaction_fence is not None:
+            self._transaction_fence.begin()
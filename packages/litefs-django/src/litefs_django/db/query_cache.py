@@ -0,0 +1,261 @@
+"""Query-result cache integration for the LiteFS database backend.
+
+The LiteFS backend can memoize the rows of read queries in a process-wide
+QueryResultCache per database alias. Entries are tagged with the local
+replication position and flushed as soon as it moves forward, or per table
+when this process writes.
+
+Caching is opt-in:
+- per alias, by setting ``"litefs_query_cache": True`` in the database
+  OPTIONS, which caches every read query on that alias;
+- per queryset, with QueryCacheQuerySet.cached() (or use_query_cache() for
+  arbitrary code), which caches only the queries issued while evaluating it.
+
+Only use it for data where serving rows as of the current replication
+position is acceptable; triggers that write to other tables are not seen
+by the per-table invalidation (the position change still flushes them).
+
+Usage:
+    DATABASES = {
+        "default": {
+            "ENGINE": "litefs_django.db.backends.litefs",
+            "OPTIONS": {
+                "litefs_mount_path": "/litefs",
+                "litefs_query_cache_max_bytes": 16 * 1024 * 1024,
+            },
+        }
+    }
+
+    class Article(models.Model):
+        objects = QueryCacheQuerySet.as_manager()
+
+    articles = list(Article.objects.filter(published=True).cached())
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from django.db import models
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.query_cache import (
+    CachedQueryResult,
+    QueryCacheKey,
+    QueryResultCache,
+    make_query_key,
+)
+from litefs.usecases.replication_lag_checker import (
+    ReplicationPositionReaderProtocol,
+)
+from litefs.usecases.response_cache import read_position_or_none
+
+# Whether queries issued in the current context may use the query cache
+_query_cache_enabled: ContextVar[bool] = ContextVar(
+    "litefs_query_cache_enabled", default=False
+)
+
+# Process-wide caches keyed by database alias
+_caches: dict[str, QueryResultCache] = {}
+_caches_lock = threading.Lock()
+
+
+@contextmanager
+def use_query_cache() -> Iterator[None]:
+    """Cache read queries issued inside the block.
+
+    Has no effect on aliases that do not use the LiteFS backend.
+
+    Example:
+        with use_query_cache():
+            categories = list(Category.objects.all())
+    """
+    token = _query_cache_enabled.set(True)
+    try:
+        yield
+    finally:
+        _query_cache_enabled.reset(token)
+
+
+def is_query_cache_enabled() -> bool:
+    """Check whether use_query_cache() is active in the current context."""
+    return _query_cache_enabled.get()
+
+
+def get_query_cache(alias: str = "default") -> QueryResultCache | None:
+    """Get the query-result cache of a database alias.
+
+    Args:
+        alias: Database alias.
+
+    Returns:
+        The alias's cache, or None if no LiteFS connection has created one.
+    """
+    return _caches.get(alias)
+
+
+def get_or_create_query_cache(alias: str, max_bytes: int) -> QueryResultCache:
+    """Get the query-result cache of an alias, creating it if needed.
+
+    Connections are per thread, so all connections of an alias share the
+    cache created by the first one.
+
+    Args:
+        alias: Database alias.
+        max_bytes: Memory cap used if the cache is created.
+
+    Returns:
+        The alias's cache.
+    """
+    with _caches_lock:
+        cache = _caches.get(alias)
+        if cache is None:
+            cache = QueryResultCache(
+                max_bytes=max_bytes, max_entry_bytes=min(max_bytes, 1024 * 1024)
+            )
+            _caches[alias] = cache
+        return cache
+
+
+class ConnectionQueryCache:
+    """Per-connection view of an alias's query-result cache.
+
+    Tracks the tables written by the connection's open transaction. Reads
+    bypass the cache once the transaction has written, since they may see
+    uncommitted rows, and the written tables are invalidated again when
+    the transaction commits.
+
+    Not thread-safe: like the database connection, each instance belongs
+    to a single thread.
+    """
+
+    def __init__(
+        self,
+        cache: QueryResultCache,
+        position_reader: ReplicationPositionReaderProtocol,
+        cache_all_queries: bool = False,
+    ) -> None:
+        """Initialize the connection's cache binding.
+
+        Args:
+            cache: Process-wide cache of the alias.
+            position_reader: Reader for the local replication position.
+            cache_all_queries: If True, cache every read query; otherwise
+                              only inside use_query_cache().
+        """
+        self._cache = cache
+        self._position_reader = position_reader
+        self._cache_all_queries = cache_all_queries
+        self._pending_tables: set[str] | None = set()
+        self._dirty = False
+
+    @property
+    def cache(self) -> QueryResultCache:
+        """Get the process-wide cache of the alias."""
+        return self._cache
+
+    def lookup(
+        self, sql: str, params: Sequence[Any] | Mapping[str, Any] | None
+    ) -> tuple[QueryCacheKey, ReplicationPosition, CachedQueryResult | None] | None:
+        """Look up a read query.
+
+        Args:
+            sql: SQL statement.
+            params: Query parameters.
+
+        Returns:
+            (key, position, cached result or None), or None if the query
+            must bypass the cache.
+        """
+        if self._dirty:
+            return None
+        if not (self._cache_all_queries or is_query_cache_enabled()):
+            return None
+        key = make_query_key(sql, params)
+        if key is None:
+            return None
+        position = read_position_or_none(self._position_reader)
+        if position is None:
+            return None
+        return key, position, self._cache.get(key, position)
+
+    def store(
+        self,
+        key: QueryCacheKey,
+        position: ReplicationPosition,
+        result: CachedQueryResult,
+        tables: frozenset[str] | None,
+    ) -> None:
+        """Store the rows of a read query executed at a position."""
+        self._cache.put(key, position, result, tables)
+
+    def record_write(self, tables: Iterable[str] | None, in_transaction: bool) -> None:
+        """Invalidate the tables written by a statement.
+
+        Args:
+            tables: Written tables, or None if unknown.
+            in_transaction: Whether the write is part of an open transaction.
+                           If not, it is already committed.
+        """
+        self._cache.invalidate_tables(tables)
+        if not in_transaction:
+            return
+        self._dirty = True
+        if tables is None:
+            self._pending_tables = None
+        elif self._pending_tables is not None:
+            self._pending_tables.update(tables)
+
+    def end_transaction(self, committed: bool) -> None:
+        """Finish the connection's transaction.
+
+        Args:
+            committed: True on commit, False on rollback.
+        """
+        if committed and self._dirty:
+            self._cache.invalidate_tables(self._pending_tables)
+        self._pending_tables = set()
+        self._dirty = False
+
+
+class QueryCacheQuerySet(models.QuerySet):
+    """QuerySet with per-queryset opt-in to the LiteFS query-result cache.
+
+    Example:
+        class Article(models.Model):
+            objects = QueryCacheQuerySet.as_manager()
+
+        Article.objects.filter(published=True).cached()
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the queryset with caching disabled."""
+        super().__init__(*args, **kwargs)
+        self._litefs_query_cache = False
+
+    def cached(self) -> QueryCacheQuerySet:
+        """Return a copy whose evaluation uses the query-result cache.
+
+        Returns:
+            New queryset that caches the rows it fetches.
+        """
+        clone = self._chain()
+        clone._litefs_query_cache = True
+        return clone
+
+    def _clone(self) -> QueryCacheQuerySet:
+        """Copy the queryset, preserving the cache opt-in."""
+        clone = super()._clone()
+        clone._litefs_query_cache = self._litefs_query_cache
+        return clone
+
+    def _fetch_all(self) -> None:
+        """Evaluate the queryset, inside use_query_cache() if opted in."""
+        if not self._litefs_query_cache:
+            super()._fetch_all()
+            return
+        with use_query_cache():
+            super()._fetch_all()
@@ -0,0 +1,79 @@
+"""Slow-query log integration for the LiteFS database backend.
+
+The LiteFS backend can record statements slower than a threshold in a
+process-wide SlowQueryLog per database alias, capturing the EXPLAIN QUERY
+PLAN of a sampled fraction of the slow reads. The logs are served by the
+slow-queries view and read with the litefs_slow_queries command.
+
+The log is opt-in per alias, by setting a threshold in the database
+OPTIONS:
+
+Usage:
+    DATABASES = {
+        "default": {
+            "ENGINE": "litefs_django.db.backends.litefs",
+            "OPTIONS": {
+                "litefs_mount_path": "/litefs",
+                "litefs_slow_query_threshold": 0.1,  # seconds
+                "litefs_slow_query_log_size": 100,
+                "litefs_slow_query_explain_rate": 0.1,
+            },
+        }
+    }
+"""
+
+from __future__ import annotations
+
+import threading
+
+from litefs.usecases.slow_query_log import SlowQueryLog
+
+# Process-wide logs keyed by database alias
+_logs: dict[str, SlowQueryLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_slow_query_log(alias: str = "default") -> SlowQueryLog | None:
+    """Get the slow-query log of a database alias.
+
+    Args:
+        alias: Database alias.
+
+    Returns:
+        The alias's log, or None if no LiteFS connection has created one.
+    """
+    return _logs.get(alias)
+
+
+def get_slow_query_logs() -> dict[str, SlowQueryLog]:
+    """Get the slow-query logs of all aliases that have one."""
+    with _logs_lock:
+        return dict(_logs)
+
+
+def get_or_create_slow_query_log(
+    alias: str, threshold: float, capacity: int, explain_rate: float
+) -> SlowQueryLog:
+    """Get the slow-query log of an alias, creating it if needed.
+
+    Connections are per thread, so all connections of an alias share the
+    log created by the first one.
+
+    Args:
+        alias: Database alias.
+        threshold: Slow-query threshold in seconds, used if the log is created.
+        capacity: Number of entries kept, used if the log is created.
+        explain_rate: Fraction of slow reads whose plan is captured, used if
+                     the log is created.
+
+    Returns:
+        The alias's log.
+    """
+    with _logs_lock:
+        log = _logs.get(alias)
+        if log is None:
+            log = SlowQueryLog(
+                threshold=threshold, capacity=capacity, explain_rate=explain_rate
+            )
+            _logs[alias] = log
+        return log
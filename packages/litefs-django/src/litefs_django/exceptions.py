@@ -6,6 +6,7 @@ Exception hierarchy:
   The underlying domain logic uses LiteFSNotRunningError (from domain) for
   configuration issues, but this adapter exception is raised for runtime
   write operation violations.
+  - StaleEpochError: write on a primary deposed since its transaction began.
 
 Relationship to domain exceptions:
 - Domain exceptions (LiteFSConfigError, LiteFSNotRunningError) are raised
@@ -48,5 +49,14 @@ class SplitBrainError(DatabaseError):
     pass
 
 
+class StaleEpochError(NotPrimaryError):
+    """Raised when a write is attempted after the leader epoch changed.
 
+    With Raft leader election, each transaction records the epoch this node
+    leads under when it begins. A write is rejected once the node no longer
+    leads under that epoch: it was deposed, possibly while partitioned,
+    and another node may already accept writes.
 
+    Subclasses NotPrimaryError, so handlers of writes on replicas also
+    handle writes on a deposed primary.
+    """
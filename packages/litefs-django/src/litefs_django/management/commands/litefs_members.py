@@ -0,0 +1,121 @@
+"""Django management command changing the voting members of a Raft cluster."""
+
+import json
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.factories import PyLeaderNotInstalledError, create_raft_membership_client
+
+from litefs_django.settings import get_litefs_settings
+
+
+class Command(BaseCommand):
+    """List, add or remove voting members of the running Raft cluster."""
+
+    help = (
+        "List, add or remove voting members of the running Raft cluster "
+        "(requires LITEFS['RAFT_DYNAMIC_MEMBERSHIP'])"
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "action",
+            choices=["list", "add", "remove"],
+            help="list the members, add a member or remove a member",
+        )
+        parser.add_argument(
+            "member",
+            nargs="?",
+            help="Raft address of the member to add or remove (host:port)",
+        )
+        parser.add_argument(
+            "--node",
+            help=(
+                "Raft address of the member receiving the change "
+                "(default: RAFT_SELF_ADDR, or the first RAFT_PEERS on an observer)"
+            ),
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=10.0,
+            help="Seconds to wait for the change to commit (default: 10.0)",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            dest="format",
+            help="Output format: text (default) or json",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Execute the members command.
+
+        Args:
+            *args: Variable length argument list (unused)
+            **options: Arbitrary keyword arguments containing command options
+
+        Raises:
+            CommandError: If the settings are invalid, the node cannot be
+                reached or the change did not commit
+        """
+        action = options.get("action", "list")
+        member = options.get("member")
+        output_format = options.get("format", "text")
+
+        if action != "list" and (not member or ":" not in member):
+            raise CommandError(
+                f"{action} needs the member's Raft address in 'host:port' format"
+            )
+
+        try:
+            litefs_settings = get_litefs_settings(getattr(settings, "LITEFS", {}))
+            client = create_raft_membership_client(
+                litefs_settings,
+                options.get("node"),
+                options.get("timeout", 10.0),
+            )
+        except LiteFSConfigError as e:
+            raise CommandError(f"Invalid LiteFS configuration: {e}") from e
+        except (ValueError, PyLeaderNotInstalledError) as e:
+            raise CommandError(str(e)) from e
+
+        try:
+            if action == "list":
+                members = client.get_cluster_members()
+            elif action == "add":
+                change = client.add_member(member)
+            else:
+                change = client.remove_member(member)
+        except ConnectionError as e:
+            raise CommandError(f"Failed to {action} members: {e}") from e
+
+        if action == "list":
+            if output_format == "json":
+                self.stdout.write(json.dumps({"members": list(members)}))
+            else:
+                self.stdout.write("\n".join(members))
+            return
+
+        if output_format == "json":
+            self.stdout.write(
+                json.dumps(
+                    {
+                        "succeeded": change.succeeded,
+                        "action": action,
+                        "member": member,
+                        "members": list(change.members),
+                        "reason": change.reason,
+                    }
+                )
+            )
+        elif change.succeeded:
+            verb = "Added" if action == "add" else "Removed"
+            self.stdout.write(self.style.SUCCESS(f"{verb} {member}"))
+            self.stdout.write(f"Members: {', '.join(change.members)}")
+        if not change.succeeded:
+            raise CommandError(f"Failed to {action} {member}: {change.reason}")
@@ -0,0 +1,133 @@
+"""Django management command showing the slow-query logs of a server."""
+
+import json
+import time
+from typing import Any
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+_COUNTS_HEADER = f"{'COUNT':>7}  {'ID':<12}  FINGERPRINT"
+
+
+class Command(BaseCommand):
+    """Show the slowest statements and their query plans."""
+
+    help = (
+        "Display the slow-query logs served by the litefs_django slow-queries "
+        "endpoint (a database must set OPTIONS['litefs_slow_query_threshold'])"
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/slow-queries",
+            help=(
+                "URL of the slow-queries endpoint "
+                "(default: http://127.0.0.1:8000/slow-queries)"
+            ),
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=10,
+            help="Number of fingerprints and recent entries to show (default: 10)",
+        )
+        parser.add_argument(
+            "--full-scans",
+            action="store_true",
+            help="Only show entries whose query plan scans a whole table",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            dest="format",
+            help="Output format: text (default) or json",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Execute the slow-queries command.
+
+        Args:
+            *args: Variable length argument list (unused)
+            **options: Arbitrary keyword arguments containing command options
+
+        Raises:
+            CommandError: If the endpoint cannot be read
+        """
+        url = options.get("url", "http://127.0.0.1:8000/slow-queries")
+        limit = options.get("limit", 10)
+        full_scans = options.get("full_scans", False)
+        output_format = options.get("format", "text")
+
+        aliases = {
+            alias: self._select(log, limit, full_scans)
+            for alias, log in self._fetch(url).get("aliases", {}).items()
+        }
+        if output_format == "json":
+            self.stdout.write(json.dumps({"aliases": aliases}))
+            return
+        self.stdout.write(self._format_text(aliases, url))
+
+    def _fetch(self, url: str) -> dict[str, Any]:
+        """Read the logs from the slow-queries endpoint.
+
+        Raises:
+            CommandError: If the endpoint cannot be read.
+        """
+        try:
+            response = httpx.get(url, timeout=5.0)
+        except httpx.HTTPError as e:
+            raise CommandError(f"Failed to read {url}: {e}") from e
+        if response.status_code != 200:
+            raise CommandError(
+                f"Failed to read {url}: HTTP {response.status_code} "
+                f"{response.text.strip()}"
+            )
+        return response.json()
+
+    @staticmethod
+    def _select(log: dict[str, Any], limit: int, full_scans: bool) -> dict[str, Any]:
+        """Keep the top fingerprints and the most recent matching entries."""
+        entries = log.get("entries", [])
+        if full_scans:
+            entries = [entry for entry in entries if entry.get("full_scan")]
+        return {
+            **log,
+            "counts": log.get("counts", [])[:limit],
+            "entries": entries[:limit],
+        }
+
+    @staticmethod
+    def _format_text(aliases: dict[str, dict[str, Any]], url: str) -> str:
+        """Format the logs for display."""
+        lines = [f"LiteFS slow queries at {url}"]
+        for alias, log in aliases.items():
+            lines += [
+                "",
+                f"Database {alias!r} (threshold {log['threshold_ms']:g} ms)",
+                "",
+                _COUNTS_HEADER,
+            ]
+            for count in log["counts"]:
+                lines.append(
+                    f"{count['count']:>7}  {count['fingerprint_id']:<12}  "
+                    f"{count['fingerprint']}"
+                )
+            if not log["counts"]:
+                lines.append("(no slow queries recorded yet)")
+            if log["entries"]:
+                lines += ["", "Recent:"]
+            for entry in log["entries"]:
+                finished = time.strftime("%H:%M:%S", time.localtime(entry["timestamp"]))
+                flag = "  FULL SCAN" if entry["full_scan"] else ""
+                lines.append(
+                    f"  {finished}  {entry['duration_ms']:>9.1f} ms  "
+                    f"{entry['fingerprint_id']}{flag}"
+                )
+                lines.append(f"    {entry['sql']}")
+                for step in entry["plan"] or []:
+                    lines.append(f"      {step}")
+        return "\n".join(lines)
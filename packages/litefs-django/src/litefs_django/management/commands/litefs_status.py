@@ -1,14 +1,25 @@
 """Django management command to display LiteFS status."""
 
 import json
+import time
 from typing import Any
+
+import httpx
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 
 from litefs.usecases.primary_detector import PrimaryDetector, LiteFSNotRunningError
 from litefs.usecases.health_checker import HealthChecker
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
+from litefs.usecases.primary_url_detector import PrimaryURLDetector
 from litefs_django.settings import get_litefs_settings
 from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.settings import LiteFSSettings
+from litefs.domain.replication import ReplicationLag
+
+# ANSI sequence moving the cursor home and clearing the screen
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
 
 
 class Command(BaseCommand):
@@ -29,7 +40,27 @@ class Command(BaseCommand):
             choices=["text", "json"],
             default="text",
             dest="format",
-            help="Output format: text (default) or json",
+            help="Output format: text (default) or json (NDJSON with --watch)",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Refresh the status every --interval seconds until interrupted",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds between refreshes with --watch (default: 2.0)",
+        )
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/cluster",
+            help=(
+                "Cluster status view of the local server, read with --watch "
+                "for Raft, peer and forwarding state "
+                "(default: http://127.0.0.1:8000/cluster)"
+            ),
         )
 
     def handle(self, *args: Any, **options: Any) -> None:
@@ -85,15 +116,32 @@ class Command(BaseCommand):
                 )
             return
 
+        if options.get("watch", False):
+            self._watch(
+                litefs_settings,
+                url=options.get("url", "http://127.0.0.1:8000/cluster"),
+                interval=options.get("interval", 2.0),
+                output_format=output_format,
+            )
+            return
+
         # Determine node role and health status
         try:
             detector = PrimaryDetector(litefs_settings.mount_path)
             is_primary = detector.is_primary()
             role = "primary" if is_primary else "replica"
 
-            # Get health status from HealthChecker
-            health_checker = HealthChecker(detector)
+            # Get health status and replication lag from HealthChecker
+            lag_checker = ReplicationLagChecker(
+                position_reader=ReplicationPositionReader(
+                    litefs_settings.mount_path, litefs_settings.database_name
+                ),
+                primary_detector=detector,
+                settings=litefs_settings.replication,
+            )
+            health_checker = HealthChecker(detector, lag_checker=lag_checker)
             health_status = health_checker.check_health()
+            replication_lag = health_checker.last_replication_lag
         except LiteFSNotRunningError as e:
             if output_format == "json":
                 self._output_json(
@@ -116,6 +164,16 @@ class Command(BaseCommand):
                 "enabled": True,
                 "leader_election": litefs_settings.leader_election,
                 "health_status": health_status.state,
+                "txid": replication_lag.local_txid if replication_lag else None,
+                "replication_lag": (
+                    {
+                        "primary_txid": replication_lag.primary_txid,
+                        "txids": replication_lag.txid_lag,
+                        "seconds": replication_lag.seconds_lag,
+                    }
+                    if replication_lag
+                    else None
+                ),
             }
             if verbosity >= 2:
                 data.update(
@@ -143,6 +201,10 @@ class Command(BaseCommand):
         self.stdout.write("  Enabled:       True")
         self.stdout.write(f"  Leader Mode:   {litefs_settings.leader_election.upper()}")
         self.stdout.write(f"  Health:        {health_display}")
+        txid = replication_lag.local_txid if replication_lag else None
+        self.stdout.write(f"  TXID:          {txid if txid is not None else 'Unknown'}")
+        if role == "replica":
+            self.stdout.write(f"  Lag:           {self._format_lag(replication_lag)}")
 
         # verbosity >= 2: detailed output
         if verbosity >= 2:
@@ -151,6 +213,267 @@ class Command(BaseCommand):
             self.stdout.write(f"  Proxy Address: {litefs_settings.proxy_addr}")
             self.stdout.write(f"  Retention:     {litefs_settings.retention}")
 
+    @staticmethod
+    def _format_lag(replication_lag: ReplicationLag | None) -> str:
+        """Format replication lag for text output."""
+        if replication_lag is None or replication_lag.txid_lag is None:
+            return "Unknown"
+        lag = f"{replication_lag.txid_lag} txids"
+        if replication_lag.seconds_lag is not None:
+            lag += f" (~{replication_lag.seconds_lag:.1f}s)"
+        return lag
+
+    def _watch(
+        self,
+        litefs_settings: LiteFSSettings,
+        url: str,
+        interval: float,
+        output_format: str,
+    ) -> None:
+        """Refresh the status every interval until interrupted.
+
+        Local state (role, primary, health, TXID, lag) is read from the
+        mount; cluster state (Raft term, quorum, peers, forwarding, split
+        brain) is read from the server's cluster status view at url. Each
+        refresh reports the changes since the previous one, and rates per
+        second for the TXID and forwarding counters.
+
+        Text output redraws a dashboard; json output writes one JSON object
+        per line (NDJSON).
+        """
+        detector = PrimaryDetector(litefs_settings.mount_path)
+        url_detector = PrimaryURLDetector(litefs_settings.mount_path)
+        lag_checker = ReplicationLagChecker(
+            position_reader=ReplicationPositionReader(
+                litefs_settings.mount_path, litefs_settings.database_name
+            ),
+            primary_detector=detector,
+            settings=litefs_settings.replication,
+        )
+        health_checker = HealthChecker(detector, lag_checker=lag_checker)
+
+        previous: dict[str, Any] | None = None
+        try:
+            while True:
+                status = self._collect_watch_status(
+                    detector, url_detector, health_checker, url
+                )
+                status.update(_changes(previous, status))
+                previous = status
+                if output_format == "json":
+                    self.stdout.write(json.dumps(status))
+                else:
+                    self.stdout.write(_CLEAR_SCREEN, ending="")
+                    self.stdout.write(self._format_dashboard(status, interval))
+                self.stdout.flush()
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+
+    @staticmethod
+    def _collect_watch_status(
+        detector: PrimaryDetector,
+        url_detector: PrimaryURLDetector,
+        health_checker: HealthChecker,
+        url: str,
+    ) -> dict[str, Any]:
+        """Collect one refresh of the watched status."""
+        status: dict[str, Any] = {
+            "timestamp": time.time(),
+            "role": None,
+            "primary_url": None,
+            "health_status": None,
+            "txid": None,
+            "replication_lag": None,
+            "error": None,
+        }
+        try:
+            status["role"] = "primary" if detector.is_primary() else "replica"
+            status["primary_url"] = url_detector.get_primary_url()
+            status["health_status"] = health_checker.check_health().state
+        except LiteFSNotRunningError as e:
+            status["error"] = str(e)
+        else:
+            replication_lag = health_checker.last_replication_lag
+            if replication_lag is not None:
+                status["txid"] = replication_lag.local_txid
+                status["replication_lag"] = {
+                    "primary_txid": replication_lag.primary_txid,
+                    "txids": replication_lag.txid_lag,
+                    "seconds": replication_lag.seconds_lag,
+                }
+
+        status["cluster"], status["cluster_error"] = _fetch_cluster(url)
+        return status
+
+    def _format_dashboard(self, status: dict[str, Any], interval: float) -> str:
+        """Format one refresh of the watched status as text."""
+        deltas = status["deltas"]
+        rates = status["rates"]
+        updated = time.strftime("%H:%M:%S", time.localtime(status["timestamp"]))
+        lines = [self.style.SUCCESS(f"LiteFS Status (every {interval:g}s, {updated}):")]
+        if status["error"] is not None:
+            lines.append(self.style.ERROR(f"  LiteFS:        {status['error']}"))
+        else:
+            primary_url = status["primary_url"]
+            if primary_url is None:
+                primary_url = "None elected"
+            elif primary_url == "":
+                primary_url = "This node"
+            lines.extend(
+                [
+                    f"  Node Role:     {status['role'].capitalize()}",
+                    f"  Primary:       {primary_url}",
+                    f"  Health:        {status['health_status'].capitalize()}",
+                    f"  TXID:          {_format_counter(status['txid'], deltas['txid'], rates['txid_per_second'])}",
+                ]
+            )
+            lag = status["replication_lag"]
+            if status["role"] == "replica":
+                lag_text = "Unknown"
+                if lag is not None and lag["txids"] is not None:
+                    lag_text = (
+                        f"{lag['txids']} txids{_format_delta(deltas['lag_txids'])}"
+                    )
+                    if lag["seconds"] is not None:
+                        lag_text += f" (~{lag['seconds']:.1f}s)"
+                lines.append(f"  Lag:           {lag_text}")
+
+        cluster = status["cluster"]
+        if cluster is None:
+            lines.append(
+                self.style.WARNING(f"  Cluster:       {status['cluster_error']}")
+            )
+            return "\n".join(lines)
+
+        raft = cluster["raft"]
+        if raft is not None:
+            term = raft["term"]
+            term_text = (
+                "Unknown"
+                if term is None
+                else f"{term}{_format_delta(deltas['raft_term'])}"
+            )
+            lines.append(f"  Raft Term:     {term_text}")
+            lines.append(
+                f"  Quorum:        {'Reached' if raft['quorum'] else 'Lost'} "
+                f"({len(raft['members'])} members)"
+            )
+        split_brain = cluster["split_brain"]
+        if split_brain is not None:
+            if split_brain["detected"]:
+                lines.append(
+                    self.style.ERROR(
+                        "  Split-Brain:   DETECTED "
+                        f"(leaders: {', '.join(split_brain['leaders'])})"
+                    )
+                )
+            else:
+                lines.append("  Split-Brain:   No")
+        forwarding = cluster["forwarding"]
+        lines.append(
+            "  Forwarding:    "
+            f"{_format_counter(forwarding['forwarded'], deltas['forwarded'], rates['forwarded_per_second'])} "
+            f"forwarded, {forwarding['failed']}{_format_delta(deltas['forward_failed'])} failed, "
+            f"breaker {forwarding['circuit_breaker'] or 'not configured'}"
+        )
+        if cluster["peers"]:
+            lines.append("  Peers:")
+            for peer in cluster["peers"]:
+                if not peer["reachable"]:
+                    lines.append(f"    {peer['node_id']:<20} unreachable")
+                    continue
+                latency = peer["latency_ms"]
+                latency_text = "" if latency is None else f"{latency:8.1f} ms"
+                leader = "  leader" if peer["is_leader"] else ""
+                lines.append(
+                    f"    {peer['node_id']:<20} reachable {latency_text}{leader}"
+                )
+        return "\n".join(lines)
+
     def _output_json(self, data: dict[str, Any], error: bool = False) -> None:
         """Output data as JSON."""
         self.stdout.write(json.dumps(data, indent=2))
+
+
+def _fetch_cluster(url: str) -> tuple[dict[str, Any] | None, str | None]:
+    """Read the cluster status view.
+
+    Returns:
+        Tuple of (payload, error): the payload, or None and why it could not
+        be read.
+    """
+    try:
+        response = httpx.get(url, timeout=5.0)
+    except httpx.HTTPError as e:
+        return None, f"unavailable at {url}: {e}"
+    if response.status_code != 200:
+        return None, f"unavailable at {url}: HTTP {response.status_code}"
+    return response.json(), None
+
+
+def _changes(
+    previous: dict[str, Any] | None, current: dict[str, Any]
+) -> dict[str, dict[str, Any]]:
+    """Compute the changes since the previous refresh.
+
+    Returns:
+        Dict with "deltas" (txid, lag_txids, raft_term, forwarded,
+        forward_failed) and "rates" per second (txid_per_second,
+        forwarded_per_second). A value is None when either refresh lacks it.
+    """
+    values = _watched_values(current)
+    deltas: dict[str, Any] = dict.fromkeys(values)
+    rates: dict[str, Any] = {"txid_per_second": None, "forwarded_per_second": None}
+    if previous is None:
+        return {"deltas": deltas, "rates": rates}
+
+    previous_values = _watched_values(previous)
+    for key, value in values.items():
+        if value is not None and previous_values[key] is not None:
+            deltas[key] = value - previous_values[key]
+
+    elapsed = current["timestamp"] - previous["timestamp"]
+    if elapsed > 0:
+        for key, rate in (
+            ("txid", "txid_per_second"),
+            ("forwarded", "forwarded_per_second"),
+        ):
+            if deltas[key] is not None:
+                rates[rate] = round(deltas[key] / elapsed, 2)
+    return {"deltas": deltas, "rates": rates}
+
+
+def _watched_values(status: dict[str, Any]) -> dict[str, int | None]:
+    """Return the values of a refresh whose changes are reported."""
+    return {
+        "txid": _path(status, "txid"),
+        "lag_txids": _path(status, "replication_lag", "txids"),
+        "raft_term": _path(status, "cluster", "raft", "term"),
+        "forwarded": _path(status, "cluster", "forwarding", "forwarded"),
+        "forward_failed": _path(status, "cluster", "forwarding", "failed"),
+    }
+
+
+def _path(data: dict[str, Any] | None, *keys: str) -> Any:
+    """Read a nested value, or None if any level is missing."""
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _format_delta(delta: int | None) -> str:
+    """Format a change since the previous refresh, e.g. " (+3)"."""
+    return "" if delta is None else f" ({delta:+d})"
+
+
+def _format_counter(value: int | None, delta: int | None, rate: float | None) -> str:
+    """Format a counter with its change and rate since the previous refresh."""
+    if value is None:
+        return "Unknown"
+    text = f"{value}{_format_delta(delta)}"
+    if rate is not None:
+        text += f" {rate:.1f}/s"
+    return text
@@ -0,0 +1,198 @@
+"""Django management command showing live per-route traffic statistics."""
+
+import json
+import time
+from typing import Any
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+# Sort keys and how to read them from a route of the /routes endpoint
+_SORT_KEYS: dict[str, Any] = {
+    "requests": lambda route: route["requests"],
+    "forwarded": lambda route: route["forwarded"],
+    "retries": lambda route: route["retries"],
+    "failures": lambda route: route["failures"],
+    "p50": lambda route: route["latency"]["p50_ms"] or 0.0,
+    "p90": lambda route: route["latency"]["p90_ms"] or 0.0,
+    "p99": lambda route: route["latency"]["p99_ms"] or 0.0,
+    "bytes_in": lambda route: route["request_bytes"],
+    "bytes_out": lambda route: route["response_bytes"],
+}
+
+_HEADER = (
+    f"{'METHOD':<7} {'ROUTE':<40} {'REQS':>8} {'FWD':>8} {'RETRY':>6} "
+    f"{'FAIL':>6} {'P50ms':>9} {'P90ms':>9} {'P99ms':>9} {'IN':>8} {'OUT':>8}"
+)
+
+# ANSI sequence moving the cursor home and clearing the screen
+_CLEAR_SCREEN = "\x1b[H\x1b[2J"
+
+
+class Command(BaseCommand):
+    """Show a live, sortable view of per-route traffic and forwarding."""
+
+    help = (
+        "Display per-route traffic and forwarding statistics served by the "
+        "litefs_django routes endpoint (LITEFS['ROUTE_STATS'] must be enabled)"
+    )
+
+    def add_arguments(self, parser: Any) -> None:
+        """Add command-line arguments."""
+        parser.add_argument(
+            "--url",
+            default="http://127.0.0.1:8000/routes",
+            help="URL of the routes endpoint (default: http://127.0.0.1:8000/routes)",
+        )
+        parser.add_argument(
+            "--sort",
+            choices=sorted(_SORT_KEYS),
+            default="requests",
+            help="Column to sort routes by, descending (default: requests)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of routes to show (default: 20)",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=2.0,
+            help="Seconds between refreshes (default: 2.0)",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Show the statistics once and exit",
+        )
+        parser.add_argument(
+            "--format",
+            choices=["text", "json"],
+            default="text",
+            dest="format",
+            help="Output format: text table (default) or one JSON line per refresh",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Execute the top command.
+
+        Polls the routes endpoint and redraws the table every interval
+        until interrupted, or once with --once.
+
+        Args:
+            *args: Variable length argument list (unused)
+            **options: Arbitrary keyword arguments containing command options
+
+        Raises:
+            CommandError: If the endpoint cannot be read with --once
+        """
+        url = options.get("url", "http://127.0.0.1:8000/routes")
+        sort = options.get("sort", "requests")
+        limit = options.get("limit", 20)
+        interval = options.get("interval", 2.0)
+        once = options.get("once", False)
+        output_format = options.get("format", "text")
+
+        try:
+            while True:
+                try:
+                    snapshot = self._fetch(url)
+                except CommandError as e:
+                    if once:
+                        raise
+                    self._write_frame(str(e), output_format, clear=True)
+                else:
+                    routes = self._top_routes(snapshot, sort, limit)
+                    if output_format == "json":
+                        frame = json.dumps({**snapshot, "routes": routes})
+                    else:
+                        frame = self._format_table(snapshot, routes, url, sort)
+                    self._write_frame(frame, output_format, clear=not once)
+                if once:
+                    return
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            return
+
+    def _fetch(self, url: str) -> dict[str, Any]:
+        """Read the statistics from the routes endpoint.
+
+        Raises:
+            CommandError: If the endpoint cannot be read.
+        """
+        try:
+            response = httpx.get(url, timeout=5.0)
+        except httpx.HTTPError as e:
+            raise CommandError(f"Failed to read {url}: {e}") from e
+        if response.status_code != 200:
+            raise CommandError(
+                f"Failed to read {url}: HTTP {response.status_code} "
+                f"{response.text.strip()}"
+            )
+        return response.json()
+
+    @staticmethod
+    def _top_routes(
+        snapshot: dict[str, Any], sort: str, limit: int
+    ) -> list[dict[str, Any]]:
+        """Return the routes sorted by a column, descending, up to limit."""
+        routes = sorted(snapshot.get("routes", []), key=_SORT_KEYS[sort], reverse=True)
+        return routes[:limit]
+
+    def _write_frame(self, frame: str, output_format: str, clear: bool) -> None:
+        """Write one refresh, clearing the screen first for live text output."""
+        if clear and output_format == "text":
+            self.stdout.write(_CLEAR_SCREEN, ending="")
+        self.stdout.write(frame)
+
+    @staticmethod
+    def _format_table(
+        snapshot: dict[str, Any],
+        routes: list[dict[str, Any]],
+        url: str,
+        sort: str,
+    ) -> str:
+        """Format routes as a fixed-width table."""
+        since = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(snapshot["since"]))
+        lines = [
+            f"LiteFS routes at {url} since {since}, sorted by {sort}",
+            "",
+            _HEADER,
+        ]
+        for route in routes:
+            latency = route["latency"]
+            lines.append(
+                f"{route['method']:<7} {_truncate(route['route'], 40):<40} "
+                f"{route['requests']:>8} {route['forwarded']:>8} "
+                f"{route['retries']:>6} {route['failures']:>6} "
+                f"{_format_ms(latency['p50_ms']):>9} "
+                f"{_format_ms(latency['p90_ms']):>9} "
+                f"{_format_ms(latency['p99_ms']):>9} "
+                f"{_format_bytes(route['request_bytes']):>8} "
+                f"{_format_bytes(route['response_bytes']):>8}"
+            )
+        if not routes:
+            lines.append("(no requests recorded yet)")
+        return "\n".join(lines)
+
+
+def _truncate(text: str, width: int) -> str:
+    """Shorten text to width, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def _format_ms(value: float | None) -> str:
+    """Format a latency in milliseconds."""
+    return "-" if value is None else f"{value:.1f}"
+
+
+def _format_bytes(value: int) -> str:
+    """Format a byte count with a binary unit suffix."""
+    size = float(value)
+    for unit in ("B", "K", "M", "G"):
+        if size < 1024 or unit == "G":
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}G"
@@ -1,6 +1,6 @@
-"""Django middleware for split-brain detection and write forwarding.
+"""Django middleware for split-brain detection, write forwarding and caching.
 
-This module provides two middleware classes:
+This module provides four middleware classes:
 
 1. SplitBrainMiddleware: Checks for split-brain conditions on each request and
    prevents access when multiple nodes claim leadership.
@@ -8,6 +8,13 @@ This module provides two middleware classes:
 2. WriteForwardingMiddleware: Forwards write requests (POST, PUT, PATCH, DELETE)
    from replica nodes to the primary node.
 
+3. ResponseCacheMiddleware: Caches GET responses of views decorated with
+   cache_by_txid, keyed by the local TXID so that cached responses expire
+   as soon as replication advances.
+
+4. ServerTimingMiddleware: Reports the time spent in LiteFS layers in a
+   Server-Timing response header (opt-in via LITEFS["SERVER_TIMING"]).
+
 Usage:
     Add to Django MIDDLEWARE in settings:
 
@@ -15,6 +22,7 @@ Usage:
             ...
             'litefs_django.middleware.SplitBrainMiddleware',
             'litefs_django.middleware.WriteForwardingMiddleware',
+            'litefs_django.middleware.ResponseCacheMiddleware',
             ...
         ]
 
@@ -31,6 +39,27 @@ Usage:
     4. Add X-LiteFS-Forwarded and X-LiteFS-Primary-Node headers
     5. Retry transient failures with exponential backoff
     6. Open circuit breaker after consecutive failures
+    7. Provide read-your-writes consistency via TXID tokens (see below)
+    8. Report spans to the tracer of LITEFS["TRACER"] (see below)
+    9. Aggregate traffic per URL route when LITEFS["ROUTE_STATS"] is enabled,
+       served by the routes view and shown by the litefs_top command
+
+Read-your-writes:
+    After a write, the primary adds its post-commit TXID to the response in
+    the X-LiteFS-TXID header and the __litefs_txid cookie. When a replica
+    receives a read carrying that token (cookie or header), it waits until
+    its local TXID catches up before handling the read locally. If the
+    replica does not catch up within READ_YOUR_WRITES_TIMEOUT, the read is
+    forwarded to the primary instead.
+
+Tracing:
+    LITEFS["TRACER"] is the dotted path of a TracerPort class (see
+    litefs.adapters.ports), instantiated without arguments. The middleware
+    reports its routing decision, each forwarding attempt, retry backoffs
+    and circuit breaker checks as spans. A traceparent header on the
+    incoming request is the parent of these spans, and forwarded requests
+    carry a traceparent header, so the primary's spans join the replica's
+    trace.
 """
 
 from __future__ import annotations
@@ -38,62 +67,145 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING
 
-from django.http import HttpResponse, HttpRequest
+from django.apps import apps
+from django.http import HttpResponse, HttpRequest, HttpResponseNotModified
 from django.conf import settings as django_settings
+from django.urls import Resolver404, resolve
 
-from litefs.usecases.split_brain_detector import SplitBrainDetector
+from litefs.usecases.epoch_fence import EpochFence
+from litefs.usecases.split_brain_detector import SplitBrainDetector, SplitBrainMonitor
 from litefs.usecases.path_exclusion_matcher import PathExclusionMatcher
 from litefs.usecases.primary_url_resolver import PrimaryURLResolver
+from litefs.adapters.metrics_port import MetricsPort, NoOpMetricsAdapter
 from litefs.adapters.ports import (
-    SplitBrainDetectorPort,
+    ClusterMetadataPort,
     ForwardingPort,
     ForwardingResult,
+    NoOpTracer,
     PrimaryDetectorPort,
+    RealSleeper,
     RealTimeProvider,
+    Sleeper,
     TimeProvider,
+    TracerPort,
+    TraceSpanPort,
+)
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.fencing import EPOCH_HEADER_NAME, parse_epoch
+from litefs.domain.metrics import (
+    CIRCUIT_BREAKER_TRANSITIONS,
+    FORWARD_ATTEMPT_DURATION,
+    FORWARD_RETRIES,
+)
+from litefs.domain.replication import (
+    TXID_COOKIE_NAME,
+    TXID_HEADER_NAME,
+    format_txid,
+    parse_txid,
 )
 from litefs.domain.retry import RetryPolicy
+from litefs.domain.tracing import (
+    BACKOFF_SECONDS_ATTRIBUTE,
+    CIRCUIT_ALLOWED_ATTRIBUTE,
+    CIRCUIT_BREAKER_SPAN,
+    CIRCUIT_STATE_ATTRIBUTE,
+    DECISION_ATTRIBUTE,
+    DECISION_EXCLUDED,
+    DECISION_FORWARD,
+    DECISION_LOCAL_READ,
+    DECISION_PRIMARY,
+    FORWARD_ATTEMPT_ATTRIBUTE,
+    FORWARD_REQUEST_SPAN,
+    RETRY_BACKOFF_SPAN,
+    TRACEPARENT_HEADER_NAME,
+    WRITE_FORWARDING_SPAN,
+    TraceContext,
+)
+from litefs.usecases.server_timing import (
+    FORWARD_ATTEMPT_SPAN,
+    FORWARD_BACKOFF_SPAN,
+    PRIMARY_CHECK_SPAN,
+    SERVER_TIMING_HEADER_NAME,
+    SPLIT_BRAIN_CHECK_SPAN,
+    TOTAL_SPAN,
+    TXID_WAIT_SPAN,
+    collect_server_timing,
+    log_server_timing,
+    record_span,
+)
+from litefs.usecases.tracing import trace_span
+from litefs.usecases.forwarding_status import ForwardingStatus
+from litefs.usecases.route_stats import (
+    UNMATCHED_ROUTE,
+    RouteSample,
+    RouteStatsCollector,
+)
+from litefs.usecases.response_cache import (
+    CACHE_STATUS_HEADER_NAME,
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheKey,
+    etag_matches,
+    get_cache_options,
+    is_cacheable_response,
+    read_position_or_none,
+)
 from litefs.domain.circuit_breaker import CircuitBreaker, CircuitBreakerState
 from litefs_django.signals import split_brain_detected
 
 if TYPE_CHECKING:
     from typing import Callable
 
+    from litefs.usecases.change_bus import ChangeBus
+    from litefs.usecases.replication_lag_checker import (
+        ReplicationPositionReaderProtocol,
+    )
+    from litefs.usecases.txid_waiter import TxidWaiter
+
 logger = logging.getLogger(__name__)
 
 # Gateway status codes that indicate transient failures
 _GATEWAY_STATUS_CODES = frozenset({502, 503, 504})
 
+# Lifetime of the read-your-writes cookie; replicas normally catch up well
+# within this window, after which the token is no longer useful
+_TXID_COOKIE_MAX_AGE = 10
 
-class Sleeper(Protocol):
-    """Protocol for sleep operations (enables testing without real delays)."""
+# Request attribute carrying the forwarding outcome for route statistics
+_ROUTE_SAMPLE_ATTR = "_litefs_route_sample"
 
-    def sleep(self, seconds: float) -> None:
-        """Sleep for the specified number of seconds."""
-        ...
 
-
-class RealSleeper:
-    """Default sleeper using time.sleep."""
-
-    def sleep(self, seconds: float) -> None:
-        """Sleep for the specified number of seconds."""
-        time.sleep(seconds)
+def _get_change_bus() -> ChangeBus | None:
+    """Get the change bus started by the litefs_django app, if any."""
+    try:
+        return apps.get_app_config("litefs_django").change_bus
+    except LookupError:
+        return None
 
 
 class SplitBrainMiddleware:
     """Middleware to detect and prevent requests during split-brain scenarios.
 
     The middleware operates by:
-    1. Checking cluster state via SplitBrainDetector on each request
+    1. Checking cluster state via SplitBrainDetector
     2. Returning 503 if multiple nodes claim leadership (split-brain)
     3. Sending split_brain_detected signal for applications to react
     4. Failing open (allowing requests) if detection fails
 
-    Split-brain is a critical failure that must be detected early. The detector
-    runs on every request to catch transitions to split-brain state.
+    In Raft mode, detection runs in a background SplitBrainMonitor shared
+    through litefs_django.services, once per election timeout, and each
+    request reads its latest status. With epoch fencing this is the
+    split-brain monitor (a deposed primary also rejects writes on its own),
+    otherwise the cluster state monitor that queries the peers'
+    /health/position endpoints. A split brain is therefore reported up to
+    one election timeout late, but requests never wait on the peers.
+    Until the first round completes, requests are allowed. In static mode,
+    which has a single configured primary, the middleware does nothing.
+
+    A detector set without a monitor (e.g. injected in tests) runs on every
+    request.
 
     Thread safety:
         - Each request is handled independently
@@ -109,6 +221,7 @@ class SplitBrainMiddleware:
         """
         self.get_response = get_response
         self.detector: SplitBrainDetector | None = None
+        self.monitor: SplitBrainMonitor | None = None
 
         # Try to initialize detector from settings on middleware load
         self._initialize_detector()
@@ -140,23 +253,23 @@ class SplitBrainMiddleware:
                 )
                 return
 
-            # Raft mode: create detector with cluster state port
-            # The port is obtained from LiteFS via the mount path
-            from litefs.usecases.primary_detector import PrimaryDetector
-
-            # Use PrimaryDetector's port for cluster state access
-            detector_port = PrimaryDetector(litefs_settings.mount_path)
+            # Raft mode: share the detector built on the process-wide election
+            from litefs_django.services import get_services
 
-            # Verify port implements SplitBrainDetectorPort Protocol
-            if not isinstance(detector_port, SplitBrainDetectorPort):
+            services = get_services()
+            self.detector = services.split_brain_detector
+            if self.detector is None:
                 logger.warning(
-                    "PrimaryDetector does not implement SplitBrainDetectorPort. "
+                    "Leader election does not expose cluster state. "
                     "Split-brain detection unavailable."
                 )
                 return
 
-            # Create detector
-            self.detector = SplitBrainDetector(detector_port)
+            # Detection runs in the background, so requests never query the
+            # peers: the cluster state queries shared with the lag checks
+            monitor = services.cluster_state_monitor
+            if isinstance(monitor, SplitBrainMonitor):
+                self.monitor = monitor
             logger.debug("SplitBrainMiddleware initialized successfully.")
 
         except Exception as e:
@@ -165,6 +278,7 @@ class SplitBrainMiddleware:
                 "Split-brain detection disabled. Requests will be allowed."
             )
             self.detector = None
+            self.monitor = None
 
     def __call__(self, request: HttpRequest) -> HttpResponse:
         """Process request through split-brain detection.
@@ -184,7 +298,15 @@ class SplitBrainMiddleware:
 
         try:
             # Detect split-brain condition
-            status = self.detector.detect_split_brain()
+            started = time.perf_counter()
+            if self.monitor is not None:
+                status = self.monitor.latest()
+            else:
+                status = self.detector.detect_split_brain()
+            record_span(SPLIT_BRAIN_CHECK_SPAN, started)
+            if status is None:
+                # No completed background round: fail open
+                return self.get_response(request)
 
             # Send signal with detection result
             # Signal is sent for all detections (both split-brain and healthy)
@@ -238,10 +360,33 @@ class WriteForwardingMiddleware:
     - X-LiteFS-Forwarded: true
     - X-LiteFS-Primary-Node: <primary_url>
 
+    Epoch fencing:
+    - With replicated cluster metadata, forwarded writes carry the leader
+      epoch known to the replica in the X-LiteFS-Epoch header
+    - On the primary, a forwarded write carrying a newer epoch than the
+      one this node leads under is rejected with 503: the node was deposed
+
+    Read-your-writes:
+    - On the primary, write responses carry the post-commit TXID in the
+      X-LiteFS-TXID header and the __litefs_txid cookie
+    - On a replica, reads carrying a TXID token wait for the local TXID to
+      catch up, and are forwarded to the primary if the wait times out
+
     Resilience features:
     - Retries transient failures with exponential backoff
     - Circuit breaker to prevent cascading failures
     - Returns 503 with Retry-After when circuit is open
+    - Forwarding outcomes and breaker transitions are published to the
+      process-wide ForwardingStatus read by the cluster status view
+
+    Tracing:
+    - Each request is a litefs.write_forwarding span with the routing
+      decision; forwarding attempts, backoffs and circuit breaker checks
+      are child spans
+
+    Route statistics:
+    - With a RouteStatsCollector, each request is recorded under its URL
+      route with its latency, body sizes, retries and forwarding failures
 
     Thread safety:
         - Each request is handled independently
@@ -264,6 +409,8 @@ class WriteForwardingMiddleware:
         self._excluded_paths: tuple[str, ...] = ()
         self._path_matcher: PathExclusionMatcher | None = None
         self._url_resolver: PrimaryURLResolver | None = None
+        self._cluster_metadata: ClusterMetadataPort | None = None
+        self._epoch_fence: EpochFence | None = None
 
         # Resilience components
         self._retry_policy: RetryPolicy | None = None
@@ -271,6 +418,14 @@ class WriteForwardingMiddleware:
         self._time_provider: TimeProvider = RealTimeProvider()
         self._sleeper: Sleeper = RealSleeper()
         self._circuit_lock: threading.Lock = threading.Lock()
+        self._metrics: MetricsPort = NoOpMetricsAdapter()
+        self._tracer: TracerPort = NoOpTracer()
+        self._route_stats: RouteStatsCollector | None = None
+        self._forwarding_status: ForwardingStatus = ForwardingStatus()
+
+        # Read-your-writes components (None disables TXID tokens)
+        self._txid_waiter: TxidWaiter | None = None
+        self._read_your_writes_timeout: float = 1.0
 
         # Try to initialize from settings
         self._initialize_forwarding()
@@ -312,16 +467,35 @@ class WriteForwardingMiddleware:
                 forwarding
             )
 
-            # Create primary detector
-            from litefs.usecases.primary_detector import PrimaryDetector
+            # Share the process-wide primary detector
+            from litefs_django.services import get_shared_primary_detector
+
+            self._primary_detector = get_shared_primary_detector(
+                litefs_settings.mount_path
+            )
+
+            # Read the leader's forwarding URL from the replicated metadata
+            cluster_metadata = None
+            if litefs_settings.raft_cluster_metadata:
+                from litefs_django.services import get_services
+
+                election = get_services().leader_election
+                if isinstance(election, ClusterMetadataPort):
+                    cluster_metadata = election
+            self._cluster_metadata = cluster_metadata
 
-            self._primary_detector = PrimaryDetector(litefs_settings.mount_path)
+            # Reject forwarded writes addressed to a deposed leader
+            if litefs_settings.leader_election == "raft":
+                from litefs_django.services import get_shared_epoch_fence
+
+                self._epoch_fence = get_shared_epoch_fence()
 
             # Create URL resolver (supports both static and Raft modes)
             self._url_resolver = PrimaryURLResolver(
                 forwarding=forwarding,
                 primary_url_detector=self._primary_detector,
                 scheme=forwarding.scheme,
+                cluster_metadata=cluster_metadata,
             )
 
             # Create forwarding adapter with timeout configuration
@@ -343,6 +517,42 @@ class WriteForwardingMiddleware:
                 disabled=not forwarding.circuit_breaker_enabled,
             )
 
+            # Share the process-wide metrics adapter
+            from litefs_django.services import get_shared_metrics
+
+            self._metrics = get_shared_metrics()
+
+            # Share the process-wide route statistics (None if disabled)
+            from litefs_django.services import get_shared_route_stats
+
+            self._route_stats = get_shared_route_stats()
+
+            # Publish forwarding counters and breaker state process-wide
+            from litefs_django.services import get_shared_forwarding_status
+
+            self._forwarding_status = get_shared_forwarding_status()
+            self._forwarding_status.set_circuit_breaker(self._circuit_breaker)
+
+            # Create the tracer from its dotted path
+            tracer_path = litefs_config.get("TRACER")
+            if tracer_path:
+                self._tracer = self._load_tracer(tracer_path)
+
+            # Create TXID waiter for read-your-writes consistency
+            if forwarding.read_your_writes:
+                from litefs.usecases.replication_position_reader import (
+                    ReplicationPositionReader,
+                )
+                from litefs.usecases.txid_waiter import TxidWaiter
+
+                self._txid_waiter = TxidWaiter(
+                    ReplicationPositionReader(
+                        litefs_settings.mount_path, litefs_settings.database_name
+                    ),
+                    change_bus=_get_change_bus(),
+                )
+                self._read_your_writes_timeout = forwarding.read_your_writes_timeout
+
             logger.debug(
                 f"WriteForwardingMiddleware initialized. "
                 f"Primary URL: {self._primary_url}, "
@@ -359,11 +569,33 @@ class WriteForwardingMiddleware:
             )
             self._forwarding_enabled = False
 
+    @staticmethod
+    def _load_tracer(tracer_path: str) -> TracerPort:
+        """Instantiate the tracer class of LITEFS["TRACER"].
+
+        Args:
+            tracer_path: Dotted path of a TracerPort class.
+
+        Returns:
+            The tracer, or a NoOpTracer if the class cannot be loaded.
+        """
+        from django.utils.module_loading import import_string
+
+        try:
+            return import_string(tracer_path)()
+        except Exception as e:
+            logger.warning(
+                f"Failed to load LiteFS tracer {tracer_path!r}: {e}. Tracing disabled.",
+                exc_info=True,
+            )
+            return NoOpTracer()
+
     def __call__(self, request: HttpRequest) -> HttpResponse:
         """Process request through write forwarding logic.
 
         Forwards write requests to primary if this is a replica node.
-        Read requests and requests on primary are handled locally.
+        Read requests and requests on primary are handled locally, except
+        reads whose read-your-writes token the replica cannot honour in time.
 
         Args:
             request: Django HttpRequest object
@@ -379,21 +611,204 @@ class WriteForwardingMiddleware:
         if self._forwarding_port is None:
             return self.get_response(request)
 
-        # Check if this is a write method
-        if request.method not in _WRITE_METHODS:
+        if self._route_stats is None:
+            return self._route_request(request)
+        return self._route_request_with_stats(request, self._route_stats)
+
+    def _route_request_with_stats(
+        self, request: HttpRequest, route_stats: RouteStatsCollector
+    ) -> HttpResponse:
+        """Route a request and record it in the per-route statistics.
+
+        Args:
+            request: Django HttpRequest object
+            route_stats: Collector receiving the request
+
+        Returns:
+            Response from primary (if forwarded) or local application response
+        """
+        sample = RouteSample()
+        setattr(request, _ROUTE_SAMPLE_ATTR, sample)
+        started = time.perf_counter()
+        response = self._route_request(request)
+        route_stats.record(
+            request.method or "",
+            self._resolve_route(request),
+            time.perf_counter() - started,
+            sample,
+            request_bytes=self._content_length(request),
+            response_bytes=0 if response.streaming else len(response.content),
+        )
+        return response
+
+    @staticmethod
+    def _resolve_route(request: HttpRequest) -> str:
+        """Return the URL route pattern of a request.
+
+        Args:
+            request: Django HttpRequest object
+
+        Returns:
+            The matching route (e.g. "/articles/<int:pk>/"), or
+            UNMATCHED_ROUTE if no URL pattern matches.
+        """
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return UNMATCHED_ROUTE
+        return "/" + match.route
+
+    @staticmethod
+    def _content_length(request: HttpRequest) -> int:
+        """Return the declared request body size, without reading the body."""
+        try:
+            return int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            return 0
+
+    def _route_request(self, request: HttpRequest) -> HttpResponse:
+        """Handle a request locally or forward it to the primary.
+
+        Args:
+            request: Django HttpRequest object
+
+        Returns:
+            Response from primary (if forwarded) or local application response
+        """
+        with trace_span(
+            self._tracer,
+            WRITE_FORWARDING_SPAN,
+            {"http.request.method": request.method, "url.path": request.path},
+            parent=self._extract_trace_context(request),
+        ) as span:
+            # Check if path is excluded
+            if self._is_excluded_path(request.path):
+                span.set_attribute(DECISION_ATTRIBUTE, DECISION_EXCLUDED)
+                return self.get_response(request)
+
+            # Reads are handled locally once the replica has caught up
+            if request.method not in _WRITE_METHODS:
+                return self._handle_read(request, span)
+
+            # Check if this node is primary
+            if self._is_primary():
+                span.set_attribute(DECISION_ATTRIBUTE, DECISION_PRIMARY)
+                if not self._admits_forwarded_epoch(request):
+                    return self._create_stale_epoch_response()
+                response = self.get_response(request)
+                self._add_txid_token(response)
+                return response
+
+            # Forward write request to primary
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_FORWARD)
+            return self._forward_request(request)
+
+    def _handle_read(self, request: HttpRequest, span: TraceSpanPort) -> HttpResponse:
+        """Handle a read request, honouring any read-your-writes token.
+
+        Args:
+            request: Django HttpRequest with a read method
+            span: Span of the request, receiving the routing decision
+
+        Returns:
+            Local response once the replica has applied the token's TXID,
+            or the primary's response if the wait timed out.
+        """
+        if self._txid_waiter is None:
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             return self.get_response(request)
 
-        # Check if path is excluded
-        if self._is_excluded_path(request.path):
+        txid = self._extract_txid_token(request)
+        if txid is None or self._is_primary():
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             return self.get_response(request)
 
-        # Check if this node is primary
-        if self._is_primary():
+        started = time.perf_counter()
+        caught_up = self._txid_waiter.wait_for_txid(
+            txid, self._read_your_writes_timeout
+        )
+        record_span(TXID_WAIT_SPAN, started)
+        if caught_up:
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             return self.get_response(request)
 
-        # Forward write request to primary
+        logger.debug(
+            f"Replica did not reach TXID {format_txid(txid)} within "
+            f"{self._read_your_writes_timeout}s. Forwarding read to primary."
+        )
+        span.set_attribute(DECISION_ATTRIBUTE, DECISION_FORWARD)
         return self._forward_request(request)
 
+    @staticmethod
+    def _extract_trace_context(request: HttpRequest) -> TraceContext | None:
+        """Extract the caller's trace context from the traceparent header.
+
+        Args:
+            request: Django HttpRequest
+
+        Returns:
+            The caller's context, or None if the header is missing or invalid.
+        """
+        header_key = "HTTP_" + TRACEPARENT_HEADER_NAME.upper()
+        traceparent = request.META.get(header_key)
+        if not traceparent:
+            return None
+        return TraceContext.from_traceparent(traceparent)
+
+    def _extract_txid_token(self, request: HttpRequest) -> int | None:
+        """Extract the read-your-writes TXID token from a request.
+
+        The X-LiteFS-TXID header takes precedence over the cookie.
+
+        Args:
+            request: Django HttpRequest
+
+        Returns:
+            The requested TXID, or None if no valid token is present.
+        """
+        header_key = "HTTP_" + TXID_HEADER_NAME.upper().replace("-", "_")
+        token = request.META.get(header_key) or request.COOKIES.get(TXID_COOKIE_NAME)
+        if not token:
+            return None
+
+        try:
+            return parse_txid(token)
+        except LiteFSConfigError:
+            logger.debug(f"Ignoring invalid TXID token: {token!r}")
+            return None
+
+    def _add_txid_token(self, response: HttpResponse) -> None:
+        """Add the primary's post-commit TXID to a write response.
+
+        Args:
+            response: Response to a write handled on this (primary) node
+        """
+        if self._txid_waiter is None:
+            return
+
+        txid = self._txid_waiter.current_txid()
+        if txid is None:
+            return
+
+        self._set_txid_token(response, format_txid(txid))
+
+    @staticmethod
+    def _set_txid_token(response: HttpResponse, token: str) -> None:
+        """Set the read-your-writes token header and cookie on a response.
+
+        Args:
+            response: Response to modify
+            token: Hex TXID token
+        """
+        response[TXID_HEADER_NAME] = token
+        response.set_cookie(
+            TXID_COOKIE_NAME,
+            token,
+            max_age=_TXID_COOKIE_MAX_AGE,
+            httponly=True,
+            samesite="Lax",
+        )
+
     def _is_excluded_path(self, path: str) -> bool:
         """Check if path matches any exclusion pattern.
 
@@ -422,11 +837,43 @@ class WriteForwardingMiddleware:
             # If no detector, assume we should forward (safer default)
             return False
 
+        started = time.perf_counter()
         try:
             return self._primary_detector.is_primary()
         except Exception as e:
             logger.warning(f"Failed to check primary status: {e}. Assuming replica.")
             return False
+        finally:
+            record_span(PRIMARY_CHECK_SPAN, started)
+
+    def _admits_forwarded_epoch(self, request: HttpRequest) -> bool:
+        """Check the leader epoch of a write forwarded by a replica.
+
+        Args:
+            request: Write request handled on this (primary) node
+
+        Returns:
+            False if the replica knows of a newer leader than this node,
+            True otherwise, including for writes without an epoch.
+        """
+        if self._epoch_fence is None:
+            return True
+        header_key = "HTTP_" + EPOCH_HEADER_NAME.upper().replace("-", "_")
+        epoch = parse_epoch(request.META.get(header_key))
+        if epoch is None:
+            return True
+        return self._epoch_fence.admits_forwarded(epoch)
+
+    @staticmethod
+    def _create_stale_epoch_response() -> HttpResponse:
+        """Create the 503 response to a write sent to a deposed leader."""
+        response = HttpResponse(
+            "Service Unavailable: this node is no longer the leader",
+            status=503,
+            content_type="text/plain",
+        )
+        response["Retry-After"] = "1"
+        return response
 
     def _forward_request(self, request: HttpRequest) -> HttpResponse:
         """Forward a write request to the primary node.
@@ -445,18 +892,38 @@ class WriteForwardingMiddleware:
             logger.error("Cannot forward: forwarding port not configured")
             return self.get_response(request)
 
+        sample: RouteSample | None = getattr(request, _ROUTE_SAMPLE_ATTR, None)
+        if sample is None:
+            sample = RouteSample()
+        sample.forwarded = True
+        try:
+            return self._forward_sampled(request, sample)
+        finally:
+            self._forwarding_status.record(sample)
+
+    def _forward_sampled(
+        self, request: HttpRequest, sample: RouteSample
+    ) -> HttpResponse:
+        """Forward a write request, recording its outcome in a sample.
+
+        Args:
+            request: Django HttpRequest to forward
+            sample: Sample receiving retries and failures
+
+        Returns:
+            HttpResponse from the primary node, or 503 if the circuit is
+            open, the primary is unknown or all retries are exhausted.
+        """
         # Check circuit breaker first
-        current_time = self._time_provider.get_time_seconds()
-        if not self._should_allow_request(current_time):
+        if not self._check_circuit_breaker():
+            sample.failed = True
             return self._create_circuit_open_response()
 
-        # Transition to half-open if timeout elapsed
-        self._maybe_transition_to_half_open(current_time)
-
         # Resolve the primary URL using PrimaryURLResolver or fallback
         primary_url = self._resolve_primary_url()
         if primary_url is None:
             logger.error("Cannot forward: primary URL could not be resolved")
+            sample.failed = True
             return HttpResponse(
                 "Service Unavailable: primary node unknown",
                 status=503,
@@ -468,6 +935,7 @@ class WriteForwardingMiddleware:
 
         # Add X-Forwarded-* headers
         self._add_forwarded_headers(request, headers)
+        self._add_epoch_header(headers)
 
         # Get request body
         body = request.body if request.body else None
@@ -480,8 +948,29 @@ class WriteForwardingMiddleware:
             headers=headers,
             body=body,
             query_string=request.META.get("QUERY_STRING", ""),
+            sample=sample,
         )
 
+    def _check_circuit_breaker(self) -> bool:
+        """Check the circuit breaker before forwarding, in a traced span.
+
+        Transitions the circuit to half-open if its reset timeout elapsed.
+
+        Returns:
+            True if the request may be forwarded, False if the circuit is open.
+        """
+        with trace_span(self._tracer, CIRCUIT_BREAKER_SPAN) as span:
+            current_time = self._time_provider.get_time_seconds()
+            allowed = self._should_allow_request(current_time)
+            if allowed:
+                # Transition to half-open if timeout elapsed
+                self._maybe_transition_to_half_open(current_time)
+            span.set_attribute(CIRCUIT_ALLOWED_ATTRIBUTE, allowed)
+            circuit_breaker = self._circuit_breaker
+            if circuit_breaker is not None:
+                span.set_attribute(CIRCUIT_STATE_ATTRIBUTE, circuit_breaker.state.value)
+            return allowed
+
     def _should_allow_request(self, current_time: float) -> bool:
         """Check if circuit breaker allows the request.
 
@@ -507,7 +996,7 @@ class WriteForwardingMiddleware:
         with self._circuit_lock:
             if self._circuit_breaker.is_half_open(current_time):
                 if self._circuit_breaker.state == CircuitBreakerState.OPEN:
-                    self._circuit_breaker = (
+                    self._set_circuit_breaker(
                         self._circuit_breaker.transition_to_half_open()
                     )
 
@@ -536,6 +1025,7 @@ class WriteForwardingMiddleware:
         headers: dict[str, str],
         body: bytes | None,
         query_string: str,
+        sample: RouteSample | None = None,
     ) -> HttpResponse:
         """Forward request with retry logic.
 
@@ -546,6 +1036,7 @@ class WriteForwardingMiddleware:
             headers: Request headers.
             body: Request body.
             query_string: Query string.
+            sample: Route statistics sample receiving retries and failures.
 
         Returns:
             HttpResponse from primary or error response.
@@ -557,8 +1048,15 @@ class WriteForwardingMiddleware:
         attempt = 0
 
         while True:
+            if attempt:
+                self._metrics.increment_counter(FORWARD_RETRIES)
+                if sample is not None:
+                    sample.retries = attempt
+            started = time.perf_counter()
             try:
-                result = self._forwarding_port.forward_request(
+                result = self._send_attempt(
+                    self._forwarding_port,
+                    attempt,
                     primary_url=primary_url,
                     method=method,
                     path=path,
@@ -569,48 +1067,157 @@ class WriteForwardingMiddleware:
 
                 # Check if response indicates a gateway error (transient)
                 if result.status_code in _GATEWAY_STATUS_CODES:
+                    self._observe_forward_attempt("gateway_error", started, attempt)
                     if retry_policy.should_retry(attempt):
                         self._record_failure()
-                        backoff = retry_policy.calculate_backoff(attempt)
-                        self._sleeper.sleep(backoff)
+                        self._sleep_before_retry(retry_policy, attempt)
                         attempt += 1
                         continue
                     # No more retries - record failure and return
                     self._record_failure()
+                    if sample is not None:
+                        sample.failed = True
                     return self._create_response(result, primary_url)
 
                 # Success - record and return
+                self._observe_forward_attempt("success", started, attempt)
                 self._record_success()
                 return self._create_response(result, primary_url)
 
             except (ConnectionError, TimeoutError, OSError) as e:
+                self._observe_forward_attempt("connection_error", started, attempt)
                 if retry_policy.is_transient_error(e) and retry_policy.should_retry(
                     attempt
                 ):
                     self._record_failure()
-                    backoff = retry_policy.calculate_backoff(attempt)
-                    self._sleeper.sleep(backoff)
+                    self._sleep_before_retry(retry_policy, attempt)
                     attempt += 1
                     continue
                 # No more retries or non-transient error
                 self._record_failure()
+                if sample is not None:
+                    sample.failed = True
                 logger.error(f"Failed to forward request to primary: {e}")
                 return self._create_forward_error_response()
 
+    def _send_attempt(
+        self,
+        forwarding_port: ForwardingPort,
+        attempt: int,
+        primary_url: str,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: bytes | None,
+        query_string: str,
+    ) -> ForwardingResult:
+        """Send one forwarding attempt in a traced span.
+
+        The forwarded request carries the span's context in its traceparent
+        header.
+
+        Args:
+            forwarding_port: Port sending the request.
+            attempt: Zero-based attempt number.
+            primary_url: URL of the primary node.
+            method: HTTP method.
+            path: Request path.
+            headers: Request headers.
+            body: Request body.
+            query_string: Query string.
+
+        Returns:
+            ForwardingResult from the primary.
+        """
+        with trace_span(
+            self._tracer,
+            FORWARD_REQUEST_SPAN,
+            {FORWARD_ATTEMPT_ATTRIBUTE: attempt + 1, "server.address": primary_url},
+        ) as span:
+            result = forwarding_port.forward_request(
+                primary_url=primary_url,
+                method=method,
+                path=path,
+                headers=headers,
+                body=body,
+                query_string=query_string,
+            )
+            span.set_attribute("http.response.status_code", result.status_code)
+            return result
+
+    def _observe_forward_attempt(
+        self, outcome: str, started: float, attempt: int
+    ) -> None:
+        """Record the round-trip time of one forwarding attempt.
+
+        Args:
+            outcome: "success", "gateway_error" or "connection_error".
+            started: time.perf_counter() value when the attempt started.
+            attempt: Zero-based attempt number.
+        """
+        self._metrics.observe_histogram(
+            FORWARD_ATTEMPT_DURATION,
+            time.perf_counter() - started,
+            {"outcome": outcome},
+        )
+        record_span(FORWARD_ATTEMPT_SPAN, started, f"attempt {attempt + 1} {outcome}")
+
+    def _sleep_before_retry(self, retry_policy: RetryPolicy, attempt: int) -> None:
+        """Wait for the backoff of a failed forwarding attempt.
+
+        Args:
+            retry_policy: Policy computing the backoff.
+            attempt: Zero-based number of the failed attempt.
+        """
+        backoff = retry_policy.calculate_backoff(attempt)
+        started = time.perf_counter()
+        with trace_span(
+            self._tracer,
+            RETRY_BACKOFF_SPAN,
+            {
+                FORWARD_ATTEMPT_ATTRIBUTE: attempt + 1,
+                BACKOFF_SECONDS_ATTRIBUTE: backoff,
+            },
+        ):
+            self._sleeper.sleep(backoff)
+        record_span(FORWARD_BACKOFF_SPAN, started, f"after attempt {attempt + 1}")
+
     def _record_failure(self) -> None:
         """Record a failure in the circuit breaker."""
         if self._circuit_breaker is None:
             return
         current_time = self._time_provider.get_time_seconds()
         with self._circuit_lock:
-            self._circuit_breaker = self._circuit_breaker.record_failure(current_time)
+            self._set_circuit_breaker(
+                self._circuit_breaker.record_failure(current_time)
+            )
 
     def _record_success(self) -> None:
         """Record a success in the circuit breaker."""
         if self._circuit_breaker is None:
             return
         with self._circuit_lock:
-            self._circuit_breaker = self._circuit_breaker.record_success()
+            self._set_circuit_breaker(self._circuit_breaker.record_success())
+
+    def _set_circuit_breaker(self, circuit_breaker: CircuitBreaker) -> None:
+        """Replace the circuit breaker, counting state transitions.
+
+        Must be called with the circuit lock held.
+
+        Args:
+            circuit_breaker: New circuit breaker state.
+        """
+        previous = self._circuit_breaker
+        self._circuit_breaker = circuit_breaker
+        if previous is not None and previous.state != circuit_breaker.state:
+            self._forwarding_status.set_circuit_breaker(circuit_breaker)
+            self._metrics.increment_counter(
+                CIRCUIT_BREAKER_TRANSITIONS,
+                labels={
+                    "from_state": previous.state.value,
+                    "to_state": circuit_breaker.state.value,
+                },
+            )
 
     def _create_forward_error_response(self) -> HttpResponse:
         """Create error response when forwarding fails.
@@ -698,6 +1305,23 @@ class WriteForwardingMiddleware:
         scheme = "https" if request.is_secure() else "http"
         headers["X-Forwarded-Proto"] = scheme
 
+    def _add_epoch_header(self, headers: dict[str, str]) -> None:
+        """Set the epoch of the known leader on a forwarded request.
+
+        An epoch sent by the client is never passed on. Modifies headers
+        dict in place.
+
+        Args:
+            headers: Headers dict to modify
+        """
+        for name in [n for n in headers if n.lower() == EPOCH_HEADER_NAME.lower()]:
+            del headers[name]
+        if self._cluster_metadata is None:
+            return
+        epoch = self._cluster_metadata.get_cluster_metadata().get("epoch")
+        if isinstance(epoch, int):
+            headers[EPOCH_HEADER_NAME] = str(epoch)
+
     def _create_response(
         self, result: ForwardingResult, primary_url: str | None = None
     ) -> HttpResponse:
@@ -726,4 +1350,363 @@ class WriteForwardingMiddleware:
         response["X-LiteFS-Forwarded"] = "true"
         response["X-LiteFS-Primary-Node"] = primary_url or self._primary_url or ""
 
+        # Hand the primary's TXID token to the client so that its next read
+        # on this replica waits for the write to be replicated
+        token = self._get_result_header(result, TXID_HEADER_NAME)
+        if token is not None:
+            self._set_txid_token(response, token)
+
+        return response
+
+    @staticmethod
+    def _get_result_header(result: ForwardingResult, name: str) -> str | None:
+        """Get a header from a forwarding result, case-insensitively.
+
+        Args:
+            result: ForwardingResult from the primary node
+            name: Header name
+
+        Returns:
+            Header value, or None if not present.
+        """
+        for header_name, header_value in result.headers.items():
+            if header_name.lower() == name.lower():
+                return header_value
+        return None
+
+
+# Request attribute carrying the pending cache entry from process_view to __call__
+_CACHE_PENDING_ATTR = "_litefs_response_cache_pending"
+
+
+class ResponseCacheMiddleware:
+    """Middleware caching opted-in GET responses per replication position.
+
+    Views opt in with the cache_by_txid decorator. For those views the
+    middleware:
+    1. Reads the local replication position (TXID and checksum)
+    2. Returns 304 Not Modified if the client's If-None-Match matches the
+       ETag derived from the position, without running the view
+    3. Returns the cached response if one exists for the request's path,
+       query string, vary headers and position
+    4. Otherwise runs the view and caches a cacheable response
+
+    Because the position is part of the cache key, every transaction
+    applied on this node invalidates the cache without any explicit purge.
+    Responses carry an ETag and an X-LiteFS-Cache header (HIT or MISS).
+
+    Place it after WriteForwardingMiddleware so that reads forwarded to the
+    primary bypass the cache:
+
+        MIDDLEWARE = [
+            ...
+            'litefs_django.middleware.WriteForwardingMiddleware',
+            'litefs_django.middleware.ResponseCacheMiddleware',
+            ...
+        ]
+
+    Thread safety:
+        - Each request is handled independently
+        - The response cache is protected by its own lock
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the response cache middleware.
+
+        Args:
+            get_response: Django WSGI application callable
+        """
+        self.get_response = get_response
+
+        # These are set during initialization or via test injection
+        self._cache: ResponseCache | None = None
+        self._position_reader: ReplicationPositionReaderProtocol | None = None
+        self._vary_headers: tuple[str, ...] = ()
+
+        # Try to initialize from settings
+        self._initialize_cache()
+
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Get the response cache, or None if caching is disabled."""
+        return self._cache
+
+    def _initialize_cache(self) -> None:
+        """Initialize the response cache from Django settings.
+
+        Attempts to configure the cache from LITEFS settings.
+        If initialization fails, caching remains disabled.
+        """
+        try:
+            from litefs.usecases.replication_position_reader import (
+                ReplicationPositionReader,
+            )
+
+            from litefs_django.settings import get_litefs_settings, is_dev_mode
+
+            litefs_config = getattr(django_settings, "LITEFS", None)
+            debug_mode = getattr(django_settings, "DEBUG", False)
+
+            if is_dev_mode(litefs_config, debug=debug_mode):
+                logger.debug("LiteFS dev mode enabled. Response cache disabled.")
+                return
+
+            litefs_settings = get_litefs_settings(litefs_config)
+            cache_settings = litefs_settings.response_cache
+            if cache_settings is None or not cache_settings.enabled:
+                logger.debug("Response cache not enabled in settings.")
+                return
+
+            self._position_reader = ReplicationPositionReader(
+                litefs_settings.mount_path, litefs_settings.database_name
+            )
+            self._vary_headers = cache_settings.vary_headers
+
+            # Report hits, misses and size through the process-wide adapter
+            from litefs_django.services import get_shared_metrics
+
+            self._cache = ResponseCache(
+                max_bytes=cache_settings.max_bytes,
+                max_entry_bytes=cache_settings.max_entry_bytes,
+                metrics=get_shared_metrics(),
+            )
+
+            logger.debug(
+                f"ResponseCacheMiddleware initialized. "
+                f"Max bytes: {cache_settings.max_bytes}, "
+                f"Vary headers: {', '.join(cache_settings.vary_headers)}"
+            )
+
+        except Exception as e:
+            logger.warning(
+                f"Failed to initialize ResponseCacheMiddleware: {e}. "
+                "Response cache disabled.",
+                exc_info=True,
+            )
+            self._cache = None
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process request, storing the response of a cache miss.
+
+        Args:
+            request: Django HttpRequest object
+
+        Returns:
+            Response from the cache, a 304, or the application response
+        """
+        response = self.get_response(request)
+
+        pending = getattr(request, _CACHE_PENDING_ATTR, None)
+        if pending is not None:
+            key, vary_headers = pending
+            self._store(key, vary_headers, response)
+
+        return response
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        view_func: Callable[..., HttpResponse],
+        view_args: tuple[object, ...],
+        view_kwargs: dict[str, object],
+    ) -> HttpResponse | None:
+        """Answer opted-in GET requests from the cache when possible.
+
+        Args:
+            request: Django HttpRequest object
+            view_func: View about to handle the request
+            view_args: Positional view arguments
+            view_kwargs: Keyword view arguments
+
+        Returns:
+            A 304 or cached response, or None to run the view.
+        """
+        if self._cache is None or self._position_reader is None:
+            return None
+
+        if request.method != "GET":
+            return None
+
+        options = get_cache_options(view_func)
+        if options is None:
+            return None
+
+        position = read_position_or_none(self._position_reader)
+        if position is None:
+            return None
+
+        vary_headers = (
+            options.vary_headers
+            if options.vary_headers is not None
+            else self._vary_headers
+        )
+        key = ResponseCacheKey.build(
+            path=request.path,
+            query_string=request.META.get("QUERY_STRING", ""),
+            vary_headers=vary_headers,
+            get_header=request.headers.get,
+            position=position,
+        )
+
+        if etag_matches(request.headers.get("If-None-Match"), key.etag):
+            not_modified = HttpResponseNotModified()
+            not_modified["ETag"] = key.etag
+            return not_modified
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return self._create_cached_response(cached)
+
+        setattr(request, _CACHE_PENDING_ATTR, (key, vary_headers))
+        return None
+
+    def _store(
+        self,
+        key: ResponseCacheKey,
+        vary_headers: tuple[str, ...],
+        response: HttpResponse,
+    ) -> None:
+        """Tag a cacheable response with its ETag and store it.
+
+        Args:
+            key: Cache key computed before the view ran
+            vary_headers: Request headers that are part of the key
+            response: Response produced by the view
+        """
+        if self._cache is None or response.streaming or response.cookies:
+            return
+
+        headers = {name.lower(): value for name, value in response.items()}
+        if not is_cacheable_response(response.status_code, headers, vary_headers):
+            return
+
+        response["ETag"] = key.etag
+        response[CACHE_STATUS_HEADER_NAME] = "MISS"
+
+        # Only cache if no transaction was applied while the view ran, as the
+        # response may already reflect it
+        if self._position_reader is None:
+            return
+        if read_position_or_none(self._position_reader) != key.position:
+            return
+
+        self._cache.put(
+            key,
+            CachedResponse(
+                status_code=response.status_code,
+                headers=tuple(response.items()),
+                body=response.content,
+            ),
+        )
+
+    @staticmethod
+    def _create_cached_response(cached: CachedResponse) -> HttpResponse:
+        """Create a Django HttpResponse from a cached response.
+
+        Args:
+            cached: Response from the cache
+
+        Returns:
+            HttpResponse with the cached status, headers and body
+        """
+        response = HttpResponse(content=cached.body, status=cached.status_code)
+        for header_name, header_value in cached.headers:
+            response[header_name] = header_value
+        response[CACHE_STATUS_HEADER_NAME] = "HIT"
+        return response
+
+
+class ServerTimingMiddleware:
+    """Middleware reporting the time spent in LiteFS layers per request.
+
+    While a request is handled, LiteFS components record timing spans: the
+    split-brain and primary checks (in middleware and before database
+    writes), each forwarding attempt and the backoff between attempts, the
+    read-your-writes TXID wait and the wait for the database write lock.
+    The spans and the total time are returned in a Server-Timing header,
+    and optionally logged (LITEFS["SERVER_TIMING"]["LOG"]).
+
+    Enable it in settings and place it first, so that it wraps the other
+    LiteFS middleware:
+
+        LITEFS = {..., "SERVER_TIMING": {"ENABLED": True}}
+
+        MIDDLEWARE = [
+            'litefs_django.middleware.ServerTimingMiddleware',
+            'litefs_django.middleware.SplitBrainMiddleware',
+            'litefs_django.middleware.WriteForwardingMiddleware',
+            ...
+        ]
+
+    When disabled, requests pass straight through and LiteFS components
+    only check that no spans are being collected.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        """Initialize the Server-Timing middleware.
+
+        Args:
+            get_response: Django WSGI application callable
+        """
+        self.get_response = get_response
+
+        # Set during initialization or via test injection
+        self._enabled = False
+        self._log = False
+
+        # Try to initialize from settings
+        self._initialize_settings()
+
+    def _initialize_settings(self) -> None:
+        """Read LITEFS["SERVER_TIMING"], leaving the middleware disabled on error."""
+        try:
+            from litefs_django.settings import get_litefs_settings
+
+            litefs_config = getattr(django_settings, "LITEFS", None)
+            if not litefs_config:
+                logger.debug("LITEFS settings not configured. Server-Timing disabled.")
+                return
+
+            timing_settings = get_litefs_settings(litefs_config).server_timing
+            if timing_settings is None or not timing_settings.enabled:
+                logger.debug("Server-Timing not enabled in settings.")
+                return
+
+            self._enabled = True
+            self._log = timing_settings.log
+
+        except Exception as e:
+            logger.warning(
+                f"Failed to initialize ServerTimingMiddleware: {e}. "
+                "Server-Timing disabled.",
+                exc_info=True,
+            )
+            self._enabled = False
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Process request, collecting the spans recorded while handling it.
+
+        Args:
+            request: Django HttpRequest object
+
+        Returns:
+            Application response with a Server-Timing header
+        """
+        if not self._enabled:
+            return self.get_response(request)
+
+        started = time.perf_counter()
+        with collect_server_timing() as timing:
+            response = self.get_response(request)
+        timing.record(TOTAL_SPAN, time.perf_counter() - started)
+
+        existing = response.get(SERVER_TIMING_HEADER_NAME)
+        header_value = timing.header_value()
+        response[SERVER_TIMING_HEADER_NAME] = (
+            f"{existing}, {header_value}" if existing else header_value
+        )
+        if self._log:
+            log_server_timing(
+                timing, request.method or "", request.path, response.status_code
+            )
         return response
@@ -0,0 +1,262 @@
+"""Process-wide LiteFS service container for Django.
+
+Views, middleware and the database backend share one LiteFSServices
+instance built lazily from settings.LITEFS, so that health probes do not
+re-parse settings or start a new Raft node on every request:
+
+    from litefs_django.services import get_services
+
+    readiness = get_services().readiness_checker.check_readiness()
+
+The container is rebuilt only when Django's setting_changed signal reports
+a change to LITEFS (e.g. override_settings in tests). The previous
+container is closed, shutting down its Raft node.
+
+When LITEFS["HEALTH_SNAPSHOT"]["ENABLED"] is set, a HealthSnapshotEvaluator
+precomputes the health view responses in the background; it is refreshed
+early on every replication_changed signal.
+
+When LITEFS["HEALTH_PROBES"]["ENABLED"] is set, the container's
+ActiveHealthMonitor measures the node in the background and feeds the
+health checker; the app config starts it with Django.
+
+With Raft leader election, writes are fenced by the leader epoch and
+split-brain detection runs in the container's SplitBrainMonitor rather
+than before each write.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from litefs.adapters.metrics_port import MetricsPort, NoOpMetricsAdapter
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.services import LiteFSServices
+from litefs.usecases.epoch_fence import EpochFence
+from litefs.usecases.forwarding_status import ForwardingStatus
+from litefs.usecases.health_probes import ActiveHealthMonitor
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator
+from litefs.usecases.primary_detector import PrimaryDetector
+from litefs.usecases.route_stats import RouteStatsCollector
+from litefs.usecases.split_brain_detector import SplitBrainMonitor
+
+from litefs_django.settings import get_litefs_settings
+from litefs_django.signals import replication_changed
+
+logger = logging.getLogger(__name__)
+
+_services: LiteFSServices | None = None
+_services_lock = threading.Lock()
+
+# Evaluator for the health views, resolved once per container
+_health_snapshots: HealthSnapshotEvaluator | None = None
+_health_snapshots_resolved = False
+
+
+def get_services() -> LiteFSServices:
+    """Get the process-wide service container, creating it on first use.
+
+    Returns:
+        LiteFSServices built from settings.LITEFS.
+
+    Raises:
+        RuntimeError: If LITEFS settings are not available.
+        LiteFSConfigError: If LITEFS settings are invalid.
+    """
+    global _services
+    services = _services
+    if services is not None:
+        return services
+
+    with _services_lock:
+        if _services is None:
+            from django.conf import settings as django_settings
+
+            litefs_config = getattr(django_settings, "LITEFS", None)
+            if not litefs_config:
+                raise RuntimeError("LITEFS settings not configured")
+            _services = LiteFSServices(get_litefs_settings(litefs_config))
+        return _services
+
+
+def reset_services() -> None:
+    """Discard the process-wide container so the next use rebuilds it.
+
+    The discarded container is closed, shutting down its Raft node if one
+    was started.
+    """
+    global _services, _health_snapshots, _health_snapshots_resolved
+    with _services_lock:
+        services, _services = _services, None
+        evaluator, _health_snapshots = _health_snapshots, None
+        _health_snapshots_resolved = False
+    if evaluator is not None:
+        replication_changed.disconnect(evaluator.request_refresh)
+        evaluator.stop(timeout=1.0)
+    if services is not None:
+        services.close()
+
+
+def get_health_snapshot_evaluator() -> HealthSnapshotEvaluator | None:
+    """Get the running health snapshot evaluator, starting it on first use.
+
+    Returns:
+        The evaluator, or None if health snapshots are disabled or LITEFS
+        settings are missing or invalid.
+    """
+    global _health_snapshots, _health_snapshots_resolved
+    if _health_snapshots_resolved:
+        return _health_snapshots
+
+    try:
+        services = get_services()
+    except (RuntimeError, LiteFSConfigError):
+        return None
+
+    with _services_lock:
+        if not _health_snapshots_resolved:
+            snapshot_settings = services.settings.health_snapshot
+            if snapshot_settings is not None and snapshot_settings.enabled:
+                from litefs_django.views import (
+                    build_health_payload,
+                    build_liveness_payload,
+                    build_readiness_payload,
+                )
+
+                evaluator = HealthSnapshotEvaluator(
+                    {
+                        "health": build_health_payload,
+                        "live": build_liveness_payload,
+                        "ready": build_readiness_payload,
+                    },
+                    interval=snapshot_settings.interval,
+                    max_age=snapshot_settings.max_age,
+                )
+                replication_changed.connect(evaluator.request_refresh, weak=False)
+                evaluator.start()
+                _health_snapshots = evaluator
+            _health_snapshots_resolved = True
+        return _health_snapshots
+
+
+def get_shared_primary_detector(mount_path: str) -> PrimaryDetector:
+    """Get the container's PrimaryDetector if it watches the given mount.
+
+    Used by the database backend, whose mount path comes from the database
+    OPTIONS rather than from settings.LITEFS.
+
+    Args:
+        mount_path: LiteFS mount path to detect the primary for.
+
+    Returns:
+        The shared detector, or a new one if LITEFS settings are missing,
+        invalid, or configure another mount path.
+    """
+    try:
+        services = get_services()
+    except (RuntimeError, LiteFSConfigError):
+        return PrimaryDetector(mount_path)
+    if services.settings.mount_path != mount_path:
+        return PrimaryDetector(mount_path)
+    return services.primary_detector
+
+
+def get_shared_metrics() -> MetricsPort:
+    """Get the container's metrics adapter.
+
+    Returns:
+        The shared adapter, or a NoOpMetricsAdapter if LITEFS settings are
+        missing or invalid, or if prometheus-client is not installed.
+    """
+    try:
+        return get_services().metrics
+    except (RuntimeError, LiteFSConfigError):
+        return NoOpMetricsAdapter()
+    except ImportError as e:
+        logger.warning(f"LiteFS metrics enabled but unavailable: {e}")
+        return NoOpMetricsAdapter()
+
+
+def get_shared_route_stats() -> RouteStatsCollector | None:
+    """Get the container's per-route statistics collector.
+
+    Returns:
+        The shared collector, or None if route statistics are disabled or
+        LITEFS settings are missing or invalid.
+    """
+    try:
+        return get_services().route_stats
+    except (RuntimeError, LiteFSConfigError):
+        return None
+
+
+def get_shared_forwarding_status() -> ForwardingStatus:
+    """Get the container's write forwarding status.
+
+    Returns:
+        The shared status, or a private ForwardingStatus if LITEFS settings
+        are missing or invalid.
+    """
+    try:
+        return get_services().forwarding_status
+    except (RuntimeError, LiteFSConfigError):
+        return ForwardingStatus()
+
+
+def get_shared_health_monitor() -> ActiveHealthMonitor | None:
+    """Get the container's active health monitor, starting it on first use.
+
+    Returns:
+        The running monitor, or None if health probes are disabled or
+        LITEFS settings are missing or invalid.
+    """
+    try:
+        return get_services().health_monitor
+    except (RuntimeError, LiteFSConfigError):
+        return None
+
+
+def get_shared_epoch_fence() -> EpochFence | None:
+    """Get the container's epoch fence, starting leader election if needed.
+
+    Returns:
+        The shared fence, or None if the election has no leader epoch, or
+        LITEFS settings are missing or invalid, or py-leader is not
+        installed.
+    """
+    try:
+        return get_services().epoch_fence
+    except (RuntimeError, LiteFSConfigError):
+        return None
+    except ImportError as e:
+        logger.warning(f"LiteFS epoch fencing unavailable: {e}")
+        return None
+
+
+def get_shared_split_brain_monitor() -> SplitBrainMonitor | None:
+    """Get the container's background split-brain detection, if running.
+
+    Returns:
+        The running monitor, or None if writes are not fenced by epoch, or
+        LITEFS settings are missing or invalid, or py-leader is not
+        installed.
+    """
+    try:
+        return get_services().split_brain_monitor
+    except (RuntimeError, LiteFSConfigError):
+        return None
+    except ImportError as e:
+        logger.warning(f"LiteFS split-brain monitor unavailable: {e}")
+        return None
+
+
+@receiver(setting_changed)
+def _reset_on_setting_changed(*, setting: str, **kwargs: Any) -> None:
+    """Rebuild the container when LITEFS settings change."""
+    if setting == "LITEFS":
+        logger.debug("LITEFS settings changed, resetting LiteFS services")
+        reset_services()
@@ -3,11 +3,20 @@
 from typing import Any
 
 from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.health import ProbeThresholds
 from litefs.domain.settings import (
     LiteFSSettings,
     StaticLeaderConfig,
     ProxySettings,
     ForwardingSettings,
+    ReplicationSettings,
+    ResponseCacheSettings,
+    ChangeBusSettings,
+    HealthSnapshotSettings,
+    HealthProbeSettings,
+    RouteStatsSettings,
+    ServerTimingSettings,
+    default_probe_thresholds,
 )
 
 # Required fields that must be present in Django settings
@@ -57,6 +66,20 @@ def get_litefs_settings(django_settings: dict[str, Any]) -> LiteFSSettings:
         "RETENTION": "retention",
         "RAFT_SELF_ADDR": "raft_self_addr",
         "RAFT_PEERS": "raft_peers",
+        "RAFT_OBSERVERS": "raft_observers",
+        "RAFT_DYNAMIC_MEMBERSHIP": "raft_dynamic_membership",
+        "RAFT_MEMBERSHIP_FILE": "raft_membership_file",
+        "RAFT_PRIORITIES": "raft_priorities",
+        "RAFT_REBALANCE_AFTER": "raft_rebalance_after",
+        "RAFT_ELECTION_TIMEOUT": "raft_election_timeout",
+        "RAFT_HEARTBEAT_INTERVAL": "raft_heartbeat_interval",
+        "RAFT_ADAPTIVE_TIMEOUTS": "raft_adaptive_timeouts",
+        "RAFT_MIN_ELECTION_TIMEOUT": "raft_min_election_timeout",
+        "RAFT_MIN_HEARTBEAT_INTERVAL": "raft_min_heartbeat_interval",
+        "RAFT_PRE_VOTE": "raft_pre_vote",
+        "RAFT_CHECK_QUORUM": "raft_check_quorum",
+        "RAFT_CLUSTER_METADATA": "raft_cluster_metadata",
+        "RAFT_FORWARDING_URL": "raft_forwarding_url",
     }
 
     # Convert Django dict to domain object kwargs
@@ -131,15 +154,132 @@ def get_litefs_settings(django_settings: dict[str, Any]) -> LiteFSSettings:
                 "CIRCUIT_BREAKER_RESET_TIMEOUT", 30.0
             ),
             circuit_breaker_enabled=fwd_dict.get("CIRCUIT_BREAKER_ENABLED", True),
+            read_your_writes=fwd_dict.get("READ_YOUR_WRITES", True),
+            read_your_writes_timeout=fwd_dict.get("READ_YOUR_WRITES_TIMEOUT", 1.0),
         )
     else:
         # forwarding is None if not provided
         kwargs["forwarding"] = None
 
+    # Parse replication lag configuration if provided
+    if "REPLICATION" in django_settings:
+        repl_dict = django_settings["REPLICATION"]
+        kwargs["replication"] = ReplicationSettings(
+            max_lag_txids=repl_dict.get("MAX_LAG_TXIDS", 1000),
+            max_lag_seconds=repl_dict.get("MAX_LAG_SECONDS", 30.0),
+            rate_window_seconds=repl_dict.get("RATE_WINDOW_SECONDS", 60.0),
+        )
+    else:
+        # replication is None if not provided
+        kwargs["replication"] = None
+
+    # Parse response cache configuration if provided
+    if "RESPONSE_CACHE" in django_settings:
+        cache_dict = django_settings["RESPONSE_CACHE"]
+        kwargs["response_cache"] = ResponseCacheSettings(
+            enabled=cache_dict.get("ENABLED", False),
+            max_bytes=cache_dict.get("MAX_BYTES", 32 * 1024 * 1024),
+            max_entry_bytes=cache_dict.get("MAX_ENTRY_BYTES", 1024 * 1024),
+            vary_headers=tuple(
+                cache_dict.get("VARY_HEADERS", ("Accept", "Accept-Encoding"))
+            ),
+        )
+    else:
+        # response_cache is None if not provided
+        kwargs["response_cache"] = None
+
+    # Parse change bus configuration if provided
+    if "CHANGE_BUS" in django_settings:
+        bus_dict = django_settings["CHANGE_BUS"]
+        kwargs["change_bus"] = ChangeBusSettings(
+            enabled=bus_dict.get("ENABLED", False),
+            poll_interval=bus_dict.get("POLL_INTERVAL", 0.5),
+            min_interval=bus_dict.get("MIN_INTERVAL", 0.1),
+            use_inotify=bus_dict.get("USE_INOTIFY", True),
+        )
+    else:
+        # change_bus is None if not provided
+        kwargs["change_bus"] = None
+
+    # Parse health snapshot configuration if provided
+    if "HEALTH_SNAPSHOT" in django_settings:
+        snapshot_dict = django_settings["HEALTH_SNAPSHOT"]
+        kwargs["health_snapshot"] = HealthSnapshotSettings(
+            enabled=snapshot_dict.get("ENABLED", False),
+            interval=snapshot_dict.get("INTERVAL", 1.0),
+            max_age=snapshot_dict.get("MAX_AGE", 10.0),
+        )
+    else:
+        # health_snapshot is None if not provided
+        kwargs["health_snapshot"] = None
+
+    # Parse Server-Timing configuration if provided
+    if "SERVER_TIMING" in django_settings:
+        timing_dict = django_settings["SERVER_TIMING"]
+        kwargs["server_timing"] = ServerTimingSettings(
+            enabled=timing_dict.get("ENABLED", False),
+            log=timing_dict.get("LOG", False),
+        )
+
+    # Parse per-route statistics configuration if provided
+    if "ROUTE_STATS" in django_settings:
+        stats_dict = django_settings["ROUTE_STATS"]
+        kwargs["route_stats"] = RouteStatsSettings(
+            enabled=stats_dict.get("ENABLED", False),
+            max_routes=stats_dict.get("MAX_ROUTES", 200),
+            relative_accuracy=stats_dict.get("RELATIVE_ACCURACY", 0.01),
+        )
+
+    # Parse active health probe configuration if provided
+    if "HEALTH_PROBES" in django_settings:
+        probes_dict = django_settings["HEALTH_PROBES"]
+        kwargs["health_probes"] = HealthProbeSettings(
+            enabled=probes_dict.get("ENABLED", False),
+            interval=probes_dict.get("INTERVAL", 5.0),
+            failure_threshold=probes_dict.get("FAILURE_THRESHOLD", 3),
+            recovery_threshold=probes_dict.get("RECOVERY_THRESHOLD", 2),
+            thresholds={
+                name: _parse_probe_thresholds(name, thresholds)
+                for name, thresholds in probes_dict.get("THRESHOLDS", {}).items()
+            },
+        )
+
+    # Parse metrics configuration if provided
+    if "METRICS" in django_settings:
+        metrics_dict = django_settings["METRICS"]
+        kwargs["metrics_enabled"] = metrics_dict.get("ENABLED", False)
+        kwargs["metrics_prefix"] = metrics_dict.get("PREFIX", "litefs")
+        kwargs["metrics_histogram_buckets"] = metrics_dict.get("HISTOGRAM_BUCKETS")
+        kwargs["metrics_exposition_ttl"] = metrics_dict.get("EXPOSITION_TTL", 1.0)
+
     # Create domain object (validation happens in __post_init__)
     return LiteFSSettings(**kwargs)
 
 
+def _parse_probe_thresholds(
+    name: str, thresholds: dict[str, Any] | None
+) -> ProbeThresholds | None:
+    """Convert the THRESHOLDS entry of a health probe.
+
+    Args:
+        name: Probe name, e.g. "query_latency".
+        thresholds: Dict with DEGRADED and UNHEALTHY keys, or None to
+                   disable the probe.
+
+    Returns:
+        The probe thresholds, keeping the probe's direction (free disk
+        space is worse when lower), or None.
+    """
+    if thresholds is None:
+        return None
+    default = default_probe_thresholds().get(name)
+    return ProbeThresholds(
+        degraded=thresholds.get("DEGRADED"),
+        unhealthy=thresholds.get("UNHEALTHY"),
+        higher_is_worse=default.higher_is_worse if default is not None else True,
+    )
+
+
 def is_dev_mode(
     django_settings: dict[str, Any] | None,
     *,
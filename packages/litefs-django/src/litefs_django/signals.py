@@ -1,4 +1,4 @@
-"""Django signals for split-brain detection events.
+"""Django signals for split-brain detection and replication events.
 
 Signals allow applications to react to split-brain detection events without
 modifying the middleware code. Use by connecting a receiver function:
@@ -12,6 +12,21 @@ modifying the middleware code. Use by connecting a receiver function:
         logger.error(f"Split brain detected: {len(status.leader_nodes)} leaders")
 
     split_brain_detected.connect(handle_split_brain)
+
+When the change bus is enabled (LITEFS["CHANGE_BUS"]["ENABLED"]), the
+replication_changed signal is sent whenever new transactions are applied
+to the local database:
+
+    from litefs_django.signals import replication_changed
+
+    def bust_caches(sender, event, **kwargs):
+        # event is a ReplicationChangeEvent with old_txid, new_txid, timestamp
+        cache.clear()
+
+    replication_changed.connect(bust_caches)
+
+Receivers run on the change bus thread, one after another; bursts of
+transactions are coalesced into a single signal.
 """
 
 from django.dispatch import Signal
@@ -19,3 +34,7 @@ from django.dispatch import Signal
 # Signal sent when split-brain is detected or cleared
 # Provides the SplitBrainStatus object containing is_split_brain flag and leader nodes
 split_brain_detected: Signal = Signal()
+
+# Signal sent when the local replication position moves
+# Provides the ReplicationChangeEvent covering the applied transactions
+replication_changed: Signal = Signal()
@@ -12,11 +12,23 @@ This will expose:
     /health/ - Full health status (leader, health, cluster state)
     /health/live - Liveness probe (is LiteFS running?)
     /health/ready - Readiness probe (can accept traffic?)
+    /health/position - Leadership and TXID, queried by Raft peers
+    /metrics - Prometheus metrics (404 unless LITEFS["METRICS"] is enabled)
+
+The local admin endpoints read by the litefs_top, litefs_status --watch and
+litefs_slow_queries commands are in litefs_django.admin_urls, which must be
+included separately.
 """
 
 from django.urls import path
 
-from litefs_django.views import health_check_view, liveness_view, readiness_view
+from litefs_django.views import (
+    health_check_view,
+    liveness_view,
+    metrics_view,
+    position_view,
+    readiness_view,
+)
 
 app_name = "litefs_django"
 
@@ -24,4 +36,6 @@ urlpatterns = [
     path("health/", health_check_view, name="health_check"),
     path("health/live", liveness_view, name="liveness"),
     path("health/ready", readiness_view, name="readiness"),
+    path("health/position", position_view, name="position"),
+    path("metrics", metrics_view, name="metrics"),
 ]
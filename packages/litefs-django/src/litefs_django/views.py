@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
+import ipaddress
 import logging
 from typing import TYPE_CHECKING
 
-from django.http import JsonResponse
+from django.http import HttpResponse, JsonResponse
 from django.views.decorators.http import require_http_methods
 
-from litefs.usecases.primary_detector import PrimaryDetector, LiteFSNotRunningError
+from litefs.usecases.primary_detector import LiteFSNotRunningError
 from litefs.usecases.health_checker import HealthChecker
 from litefs.usecases.failover_coordinator import FailoverCoordinator
 from litefs.usecases.liveness_checker import LivenessChecker
 from litefs.usecases.readiness_checker import ReadinessChecker
-from litefs.adapters.ports import PrimaryDetectorPort, LeaderElectionPort
-from litefs_django.settings import get_litefs_settings
-from litefs_django.adapters import StaticLeaderElection
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.adapters.ports import PrimaryDetectorPort, RaftLeaderElectionPort
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.health import ProbeResult
+from litefs.domain.replication import ReplicationLag
+from litefs_django.db.slow_query_log import get_slow_query_logs
+from litefs_django.services import (
+    get_health_snapshot_evaluator,
+    get_services,
+    get_shared_health_monitor,
+    get_shared_route_stats,
+)
 
 if TYPE_CHECKING:
     from django.http import HttpRequest
@@ -24,7 +34,7 @@ logger = logging.getLogger(__name__)
 
 
 def get_primary_detector() -> PrimaryDetectorPort:
-    """Get or create PrimaryDetector instance.
+    """Get the shared PrimaryDetector instance.
 
     Returns:
         PrimaryDetectorPort implementation for checking if node is primary.
@@ -32,18 +42,26 @@ def get_primary_detector() -> PrimaryDetectorPort:
     Raises:
         RuntimeError: If LITEFS settings are not available.
     """
-    from django.conf import settings as django_settings
+    return get_services().primary_detector
 
-    litefs_config = getattr(django_settings, "LITEFS", None)
-    if not litefs_config:
-        raise RuntimeError("LITEFS settings not configured")
 
-    litefs_settings = get_litefs_settings(litefs_config)
-    return PrimaryDetector(litefs_settings.mount_path)
+def get_replication_lag_checker() -> ReplicationLagChecker:
+    """Get the shared ReplicationLagChecker instance.
+
+    In Raft mode, replicas compute their lag against the leader's TXID,
+    queried from the peers' position endpoints in the background.
+
+    Returns:
+        ReplicationLagChecker use case for checking replication lag.
+
+    Raises:
+        RuntimeError: If LITEFS settings are not available.
+    """
+    return get_services().replication_lag_checker
 
 
 def get_health_checker() -> HealthChecker:
-    """Get or create HealthChecker instance.
+    """Get the shared HealthChecker instance.
 
     Returns:
         HealthChecker use case for checking node health.
@@ -51,12 +69,11 @@ def get_health_checker() -> HealthChecker:
     Raises:
         RuntimeError: If LITEFS settings are not available.
     """
-    primary_detector = get_primary_detector()
-    return HealthChecker(primary_detector=primary_detector)
+    return get_services().health_checker
 
 
 def get_liveness_checker() -> LivenessChecker:
-    """Get or create LivenessChecker instance.
+    """Get the shared LivenessChecker instance.
 
     Returns:
         LivenessChecker use case for checking if LiteFS is running.
@@ -64,55 +81,23 @@ def get_liveness_checker() -> LivenessChecker:
     Raises:
         RuntimeError: If LITEFS settings are not available.
     """
-    primary_detector = get_primary_detector()
-    return LivenessChecker(primary_detector=primary_detector)
+    return get_services().liveness_checker
 
 
 def get_failover_coordinator() -> FailoverCoordinator:
-    """Get or create FailoverCoordinator instance.
+    """Get the shared FailoverCoordinator instance.
 
     Returns:
         FailoverCoordinator for accessing node state.
 
     Raises:
-        RuntimeError: If leader election is not configured.
+        RuntimeError: If LITEFS settings are not available.
     """
-    from django.conf import settings as django_settings
-    from litefs.adapters.ports import EnvironmentNodeIDResolver
-    from litefs.factories import create_raft_leader_election
-    from litefs.usecases.primary_initializer import PrimaryInitializer
-
-    litefs_config = getattr(django_settings, "LITEFS", None)
-    if not litefs_config:
-        raise RuntimeError("LITEFS settings not configured")
-
-    litefs_settings = get_litefs_settings(litefs_config)
-
-    # Type annotation for the election variable
-    election: LeaderElectionPort
-
-    # Determine election mode and create appropriate leader election port
-    if litefs_settings.leader_election == "static":
-        if litefs_settings.static_leader_config is None:
-            raise RuntimeError("Static leader election configured but no config found")
-
-        resolver = EnvironmentNodeIDResolver()
-        current_node_id = resolver.resolve_node_id()
-        initializer = PrimaryInitializer(litefs_settings.static_leader_config)
-
-        # Use the extracted StaticLeaderElection adapter
-        election = StaticLeaderElection(initializer, current_node_id)
-    else:
-        # Raft mode - use factory
-        resolver = EnvironmentNodeIDResolver()
-        node_id = resolver.resolve_node_id()
-        election = create_raft_leader_election(litefs_settings, node_id)
-
-    return FailoverCoordinator(election)
+    return get_services().failover_coordinator
 
 
 def get_readiness_checker() -> ReadinessChecker:
-    """Get or create ReadinessChecker instance.
+    """Get the shared ReadinessChecker instance.
 
     Returns:
         ReadinessChecker use case for checking node readiness.
@@ -120,34 +105,53 @@ def get_readiness_checker() -> ReadinessChecker:
     Raises:
         RuntimeError: If LITEFS settings are not available.
     """
-    health_checker = get_health_checker()
-    failover_coordinator = get_failover_coordinator()
-    return ReadinessChecker(
-        health_checker=health_checker,
-        failover_coordinator=failover_coordinator,
-    )
+    return get_services().readiness_checker
 
 
-@require_http_methods(["GET"])
-def health_check_view(request: HttpRequest) -> JsonResponse:
-    """Health check endpoint returning leader status, cluster state, replication lag.
-
-    Returns JSON with:
-    - is_primary: Boolean indicating if this node is the primary
-    - health_status: Health status from HealthChecker (healthy/degraded/unhealthy)
-    - cluster: Cluster information including node state
+def _replication_lag_data(replication_lag: ReplicationLag) -> dict[str, object]:
+    """Serialize replication lag for health responses.
 
     Args:
-        request: Django HttpRequest object
+        replication_lag: Replication lag from the last health check.
 
     Returns:
-        JsonResponse with health check data
+        Dict with the local TXID and the lag relative to the primary.
+    """
+    return {
+        "txid": replication_lag.local_txid,
+        "replication_lag": {
+            "primary_txid": replication_lag.primary_txid,
+            "txids": replication_lag.txid_lag,
+            "seconds": replication_lag.seconds_lag,
+        },
+    }
+
+
+def _probe_data(results: dict[str, ProbeResult]) -> dict[str, object]:
+    """Serialize the latest active health probe results."""
+    return {
+        name: {
+            "state": result.state,
+            "value": result.value,
+            "sample_state": result.sample_state,
+            "error": result.error,
+            "streak": result.streak,
+        }
+        for name, result in results.items()
+    }
+
+
+def build_health_payload() -> tuple[dict[str, object], int]:
+    """Evaluate the health check endpoint.
+
+    Returns:
+        Response payload and HTTP status code.
     """
     try:
         # Get all required services
         detector = get_primary_detector()
-        health_checker = get_health_checker()
         coordinator = get_failover_coordinator()
+        health_checker = get_health_checker()
 
         # Check primary status
         try:
@@ -155,14 +159,14 @@ def health_check_view(request: HttpRequest) -> JsonResponse:
         except LiteFSNotRunningError as e:
             logger.warning("LiteFS not running, marking as unhealthy")
             # Return 503 with error details when LiteFS is not running
-            return JsonResponse(
+            return (
                 {
                     "error": str(e),
                     "health_status": "unhealthy",
                     "is_primary": False,
                     "is_ready": False,
                 },
-                status=503,
+                503,
             )
 
         # Check health status
@@ -180,7 +184,7 @@ def health_check_view(request: HttpRequest) -> JsonResponse:
         is_ready = health_status.state == "healthy"
 
         # Build response with node_state at top level (uppercase) and in cluster (lowercase for backward compat)
-        response_data = {
+        response_data: dict[str, object] = {
             "is_primary": is_primary,
             "health_status": health_status.state,
             "node_state": node_state_upper,
@@ -190,50 +194,227 @@ def health_check_view(request: HttpRequest) -> JsonResponse:
             },
         }
 
-        return JsonResponse(response_data, status=200)
+        replication_lag = health_checker.last_replication_lag
+        if replication_lag is not None:
+            response_data.update(_replication_lag_data(replication_lag))
+
+        health_monitor = get_shared_health_monitor()
+        if health_monitor is not None:
+            response_data["probes"] = _probe_data(health_monitor.results())
+
+        return response_data, 200
 
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         # Return error response
-        return JsonResponse(
+        return (
             {
                 "error": str(e),
                 "health_status": "unhealthy",
                 "is_primary": False,
                 "is_ready": False,
             },
-            status=503,
+            503,
         )
 
 
+def build_liveness_payload() -> tuple[dict[str, object], int]:
+    """Evaluate the liveness probe endpoint.
+
+    Returns:
+        Response payload and HTTP status code.
+    """
+    liveness_checker = get_liveness_checker()
+    result = liveness_checker.check_liveness()
+
+    if result.is_live:
+        return {"is_live": True}, 200
+    else:
+        return {"is_live": False, "error": result.error}, 503
+
+
+def build_readiness_payload() -> tuple[dict[str, object], int]:
+    """Evaluate the readiness probe endpoint.
+
+    Returns:
+        Response payload and HTTP status code.
+    """
+    readiness_checker = get_readiness_checker()
+    result = readiness_checker.check_readiness()
+
+    response_data: dict[str, object] = {
+        "is_ready": result.is_ready,
+        "can_accept_writes": result.can_accept_writes,
+        "health_status": result.health_status.state,
+        "split_brain_detected": result.split_brain_detected,
+    }
+
+    if result.replication_lag is not None:
+        response_data.update(_replication_lag_data(result.replication_lag))
+
+    if result.error is not None:
+        response_data["error"] = result.error
+
+    status_code = 200 if result.is_ready else 503
+    return response_data, status_code
+
+
+def build_position_payload() -> tuple[dict[str, object], int]:
+    """Evaluate the position endpoint queried by cluster peers.
+
+    Reports whether this node is the elected leader and its local TXID,
+    without evaluating health or querying other nodes.
+
+    Returns:
+        Response payload and HTTP status code.
+    """
+    services = get_services()
+    try:
+        is_leader = services.leader_election.is_leader_elected()
+        txid = services.replication_lag_checker.read_local_txid()
+    except (LiteFSNotRunningError, LiteFSConfigError) as e:
+        return {"error": str(e), "is_leader": False}, 503
+    return {"is_leader": is_leader, "txid": txid}, 200
+
+
+def build_cluster_payload() -> dict[str, object]:
+    """Collect the cluster view of this process for the cluster status view.
+
+    Reports the node state, the Raft term and quorum (Raft mode only), the
+    split-brain status with each peer's reachability and query latency,
+    and the write forwarding counters and circuit breaker state. Querying
+    peers makes one health request per cluster member.
+
+    Returns:
+        JSON-serializable payload.
+
+    Raises:
+        RuntimeError: If LITEFS settings are not configured.
+        LiteFSConfigError: If LITEFS settings are invalid.
+    """
+    services = get_services()
+    election = services.leader_election
+    payload: dict[str, object] = {
+        "node_id": services.node_id,
+        "node_state": services.failover_coordinator.state.value,
+        "leader_election": services.settings.leader_election,
+        "raft": None,
+        "split_brain": None,
+        "peers": [],
+        "forwarding": services.forwarding_status.snapshot(),
+    }
+
+    if isinstance(election, RaftLeaderElectionPort):
+        # The term is optional: only py-leader elections report it
+        get_raft_term = getattr(election, "get_raft_term", None)
+        payload["raft"] = {
+            "term": get_raft_term() if callable(get_raft_term) else None,
+            "quorum": election.is_quorum_reached(),
+            "members": election.get_cluster_members(),
+        }
+
+    split_brain_detector = services.split_brain_detector
+    if split_brain_detector is not None:
+        status = split_brain_detector.detect_split_brain()
+        payload["split_brain"] = {
+            "detected": status.is_split_brain,
+            "leaders": [node.node_id for node in status.leader_nodes],
+        }
+        if status.cluster_state is not None:
+            payload["peers"] = [
+                {
+                    "node_id": node.node_id,
+                    "is_leader": node.is_leader,
+                    "reachable": node.reachable,
+                    "latency_ms": (
+                        None
+                        if node.latency_seconds is None
+                        else round(node.latency_seconds * 1000, 3)
+                    ),
+                    "txid": node.txid,
+                }
+                for node in status.cluster_state.nodes
+                if node.node_id != services.node_id
+            ]
+
+    return payload
+
+
+def _snapshot_response(name: str) -> HttpResponse | None:
+    """Return the precomputed response of an endpoint, if available.
+
+    Args:
+        name: Endpoint name ("health", "live" or "ready").
+
+    Returns:
+        HttpResponse with the snapshot body and an Age header, or None when
+        snapshots are disabled or no fresh snapshot exists yet.
+    """
+    evaluator = get_health_snapshot_evaluator()
+    if evaluator is None:
+        return None
+    snapshot = evaluator.get(name)
+    if snapshot is None:
+        return None
+    response = HttpResponse(
+        snapshot.body, status=snapshot.status_code, content_type="application/json"
+    )
+    response["Age"] = str(snapshot.age(evaluator.now()))
+    return response
+
+
+@require_http_methods(["GET"])
+def health_check_view(request: HttpRequest) -> HttpResponse:
+    """Health check endpoint returning leader status, cluster state, replication lag.
+
+    Returns JSON with:
+    - is_primary: Boolean indicating if this node is the primary
+    - health_status: Health status from HealthChecker (healthy/degraded/unhealthy)
+    - cluster: Cluster information including node state
+    - txid: Local replication position (when tracked)
+    - replication_lag: Lag relative to the primary (when tracked)
+
+    When LITEFS["HEALTH_SNAPSHOT"] is enabled, the precomputed response is
+    returned with an Age header instead.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        JsonResponse with health check data
+    """
+    snapshot = _snapshot_response("health")
+    if snapshot is not None:
+        return snapshot
+    response_data, status_code = build_health_payload()
+    return JsonResponse(response_data, status=status_code)
+
+
 @require_http_methods(["GET"])
-def liveness_view(request: HttpRequest) -> JsonResponse:
+def liveness_view(request: HttpRequest) -> HttpResponse:
     """Liveness probe endpoint for Kubernetes/orchestrator health checks.
 
     Returns JSON indicating if the LiteFS process is running:
     - 200 OK: {'is_live': True} - LiteFS is running
     - 503 Service Unavailable: {'is_live': False, 'error': '...'} - LiteFS not running
 
+    Served from the health snapshot when enabled.
+
     Args:
         request: Django HttpRequest object
 
     Returns:
         JsonResponse with liveness status
     """
-    liveness_checker = get_liveness_checker()
-    result = liveness_checker.check_liveness()
-
-    if result.is_live:
-        return JsonResponse({"is_live": True}, status=200)
-    else:
-        return JsonResponse(
-            {"is_live": False, "error": result.error},
-            status=503,
-        )
+    snapshot = _snapshot_response("live")
+    if snapshot is not None:
+        return snapshot
+    response_data, status_code = build_liveness_payload()
+    return JsonResponse(response_data, status=status_code)
 
 
 @require_http_methods(["GET"])
-def readiness_view(request: HttpRequest) -> JsonResponse:
+def readiness_view(request: HttpRequest) -> HttpResponse:
     """Readiness probe endpoint for Kubernetes/orchestrator health checks.
 
     Returns JSON indicating if the node is ready to accept traffic:
@@ -245,6 +426,9 @@ def readiness_view(request: HttpRequest) -> JsonResponse:
     - can_accept_writes: Boolean indicating if node can accept writes (is PRIMARY)
     - health_status: Health status (healthy/degraded/unhealthy)
     - split_brain_detected: Boolean indicating if split brain detected
+    - txid, replication_lag: Replication position and lag (when tracked)
+
+    Served from the health snapshot when enabled.
 
     Args:
         request: Django HttpRequest object
@@ -252,18 +436,176 @@ def readiness_view(request: HttpRequest) -> JsonResponse:
     Returns:
         JsonResponse with readiness status
     """
-    readiness_checker = get_readiness_checker()
-    result = readiness_checker.check_readiness()
+    snapshot = _snapshot_response("ready")
+    if snapshot is not None:
+        return snapshot
+    response_data, status_code = build_readiness_payload()
+    return JsonResponse(response_data, status=status_code)
 
-    response_data: dict[str, object] = {
-        "is_ready": result.is_ready,
-        "can_accept_writes": result.can_accept_writes,
-        "health_status": result.health_status.state,
-        "split_brain_detected": result.split_brain_detected,
-    }
 
-    if result.error is not None:
-        response_data["error"] = result.error
+@require_http_methods(["GET"])
+def position_view(request: HttpRequest) -> HttpResponse:
+    """Replication position endpoint queried by Raft peers.
 
-    status_code = 200 if result.is_ready else 503
+    Returns JSON with:
+    - is_leader: Boolean indicating if this node is the elected leader
+    - txid: Local replication position, or None before LiteFS wrote one
+
+    Replicas read the leader's TXID from it to compute their replication
+    lag, and split-brain detection reads each peer's leadership.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        JsonResponse with the leadership and position of this node
+    """
+    response_data, status_code = build_position_payload()
     return JsonResponse(response_data, status=status_code)
+
+
+@require_http_methods(["GET"])
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    """Prometheus scrape endpoint.
+
+    Returns the metrics in the Prometheus text format. Under a multiprocess
+    server with PROMETHEUS_MULTIPROC_DIR set, values of all workers are
+    aggregated. The output is reused for LITEFS["METRICS"]["EXPOSITION_TTL"]
+    seconds.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        HttpResponse with the exposition, or 404 when LiteFS metrics are
+        disabled or unavailable
+    """
+    try:
+        exposition = get_services().metrics_exposition
+    except (RuntimeError, LiteFSConfigError):
+        exposition = None
+    except ImportError as e:
+        logger.warning(f"LiteFS metrics enabled but unavailable: {e}")
+        exposition = None
+
+    if exposition is None:
+        return HttpResponse(
+            "LiteFS metrics are disabled\n", status=404, content_type="text/plain"
+        )
+    return HttpResponse(exposition.render(), content_type=exposition.content_type)
+
+
+def _is_local_request(request: HttpRequest) -> bool:
+    """Check whether a request comes from the loopback interface.
+
+    Behind a reverse proxy on the same host every request is local, so the
+    views relying on this check are only in the opt-in
+    litefs_django.admin_urls.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        True if REMOTE_ADDR is a loopback address
+    """
+    try:
+        return ipaddress.ip_address(request.META.get("REMOTE_ADDR", "")).is_loopback
+    except ValueError:
+        return False
+
+
+@require_http_methods(["GET"])
+def route_stats_view(request: HttpRequest) -> HttpResponse:
+    """Local admin endpoint for the per-route traffic statistics.
+
+    Returns the aggregate of the write forwarding middleware of this
+    process (see litefs.usecases.route_stats), as read by the litefs_top
+    management command. Only answers requests from the loopback interface,
+    since route patterns and traffic volumes are internal details.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        JsonResponse with the statistics, 403 for non-local requests, or
+        404 when LITEFS["ROUTE_STATS"] is not enabled
+    """
+    if not _is_local_request(request):
+        return HttpResponse(
+            "Route statistics are only served locally\n",
+            status=403,
+            content_type="text/plain",
+        )
+
+    route_stats = get_shared_route_stats()
+    if route_stats is None:
+        return HttpResponse(
+            "LiteFS route statistics are disabled\n",
+            status=404,
+            content_type="text/plain",
+        )
+    return JsonResponse(route_stats.snapshot())
+
+
+@require_http_methods(["GET"])
+def cluster_status_view(request: HttpRequest) -> HttpResponse:
+    """Local admin endpoint for the cluster view of this process.
+
+    Returns build_cluster_payload(), as read by `litefs_status --watch`.
+    Only answers requests from the loopback interface, like the routes
+    view.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        JsonResponse with the cluster view, 403 for non-local requests, or
+        503 with an error if it cannot be collected
+    """
+    if not _is_local_request(request):
+        return HttpResponse(
+            "Cluster status is only served locally\n",
+            status=403,
+            content_type="text/plain",
+        )
+
+    try:
+        return JsonResponse(build_cluster_payload())
+    except Exception as e:
+        logger.exception("Cluster status failed")
+        return JsonResponse({"error": str(e)}, status=503)
+
+
+@require_http_methods(["GET"])
+def slow_queries_view(request: HttpRequest) -> HttpResponse:
+    """Local admin endpoint for the slow-query logs of this process.
+
+    Returns the log of each database alias with a slow-query threshold
+    (see litefs_django.db.slow_query_log), as read by the
+    litefs_slow_queries management command. Only answers requests from the
+    loopback interface, since statements can reveal the schema.
+
+    Args:
+        request: Django HttpRequest object
+
+    Returns:
+        JsonResponse with the logs by alias, 403 for non-local requests, or
+        404 when no alias has a slow-query log
+    """
+    if not _is_local_request(request):
+        return HttpResponse(
+            "Slow queries are only served locally\n",
+            status=403,
+            content_type="text/plain",
+        )
+
+    logs = get_slow_query_logs()
+    if not logs:
+        return HttpResponse(
+            "LiteFS slow-query log is disabled\n",
+            status=404,
+            content_type="text/plain",
+        )
+    return JsonResponse(
+        {"aliases": {alias: log.snapshot() for alias, log in sorted(logs.items())}}
+    )
@@ -1,12 +1,34 @@
 """FastAPI adapter for LiteFS SQLite replication."""
 
-from litefs_fastapi.middleware import SplitBrainMiddleware, WriteForwardingMiddleware
-from litefs_fastapi.routes import create_health_router
+from litefs.usecases.response_cache import cache_by_txid
+
+from litefs_fastapi.middleware import (
+    ResponseCacheMiddleware,
+    ServerTimingMiddleware,
+    SplitBrainMiddleware,
+    WriteForwardingMiddleware,
+)
+from litefs_fastapi.routes import (
+    create_health_router,
+    create_health_snapshot_evaluator,
+    create_metrics_router,
+    create_services_health_router,
+)
+from litefs_fastapi.services import create_lifespan, get_health_snapshots, get_services
 from litefs_fastapi.settings import get_litefs_settings
 
 __all__ = [
+    "cache_by_txid",
     "create_health_router",
+    "create_health_snapshot_evaluator",
+    "create_lifespan",
+    "create_metrics_router",
+    "create_services_health_router",
+    "get_health_snapshots",
     "get_litefs_settings",
+    "get_services",
+    "ResponseCacheMiddleware",
+    "ServerTimingMiddleware",
     "SplitBrainMiddleware",
     "WriteForwardingMiddleware",
 ]
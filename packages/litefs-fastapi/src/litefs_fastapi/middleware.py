@@ -1,33 +1,110 @@
-"""FastAPI ASGI middleware for split-brain detection and write forwarding.
+"""FastAPI ASGI middleware for split-brain detection, write forwarding and caching.
 
-This module provides two middleware classes:
+This module provides four middleware classes:
 
 1. SplitBrainMiddleware: Checks for split-brain conditions on each request and
    prevents access when multiple nodes claim leadership.
 
 2. WriteForwardingMiddleware: Forwards write requests (POST, PUT, PATCH, DELETE)
-   from replica nodes to the primary node.
+   from replica nodes to the primary node, and provides read-your-writes
+   consistency via TXID tokens when given a TxidWaiter. Its routing
+   decision and forwarding attempts are reported to an optional TracerPort,
+   and forwarded requests carry a traceparent header.
+
+3. ResponseCacheMiddleware: Caches GET responses of endpoints decorated with
+   cache_by_txid, keyed by the local TXID so that cached responses expire
+   as soon as replication advances.
+
+4. ServerTimingMiddleware: Reports the time spent in LiteFS layers in a
+   Server-Timing response header.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from typing import TYPE_CHECKING, Protocol
 
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response, PlainTextResponse
+from starlette.routing import Match
+
+from litefs.adapters.ports import NoOpTracer
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.metrics import FORWARD_ATTEMPT_DURATION
+from litefs.domain.replication import (
+    TXID_COOKIE_NAME,
+    TXID_HEADER_NAME,
+    format_txid,
+    parse_txid,
+)
+from litefs.domain.settings import ResponseCacheSettings, ServerTimingSettings
+from litefs.domain.tracing import (
+    DECISION_ATTRIBUTE,
+    DECISION_EXCLUDED,
+    DECISION_FORWARD,
+    DECISION_LOCAL_READ,
+    DECISION_PRIMARY,
+    FORWARD_ATTEMPT_ATTRIBUTE,
+    FORWARD_REQUEST_SPAN,
+    TRACEPARENT_HEADER_NAME,
+    WRITE_FORWARDING_SPAN,
+    TraceContext,
+)
+from litefs.usecases.response_cache import (
+    CACHE_STATUS_HEADER_NAME,
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheKey,
+    ResponseCacheOptions,
+    etag_matches,
+    get_cache_options,
+    is_cacheable_response,
+    read_position_or_none_async,
+)
+from litefs.usecases.server_timing import (
+    FORWARD_ATTEMPT_SPAN,
+    PRIMARY_CHECK_SPAN,
+    SERVER_TIMING_HEADER_NAME,
+    SPLIT_BRAIN_CHECK_SPAN,
+    TOTAL_SPAN,
+    TXID_WAIT_SPAN,
+    collect_server_timing,
+    log_server_timing,
+    record_span,
+)
+from litefs.usecases.tracing import trace_span
 
 if TYPE_CHECKING:
-    from starlette.types import ASGIApp, Receive, Scope, Send
-    from litefs.adapters.ports import ForwardingPort, PrimaryDetectorPort
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+    from litefs.adapters.metrics_port import MetricsPort
+    from litefs.adapters.ports import (
+        ForwardingPort,
+        ForwardingResult,
+        PrimaryDetectorPort,
+        TracerPort,
+        TraceSpanPort,
+    )
+    from litefs.usecases.replication_lag_checker import (
+        ReplicationPositionReaderProtocol,
+    )
     from litefs.usecases.split_brain_detector import SplitBrainStatus
+    from litefs.usecases.txid_waiter import TxidWaiter
 
 logger = logging.getLogger(__name__)
 
 # HTTP methods considered as writes that should be forwarded to primary
 _WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
+# Gateway status codes that indicate the primary could not handle the request
+_GATEWAY_STATUS_CODES = frozenset({502, 503, 504})
+
+# Lifetime of the read-your-writes cookie; replicas normally catch up well
+# within this window, after which the token is no longer useful
+_TXID_COOKIE_MAX_AGE = 10
+
 
 class SplitBrainDetectorProtocol(Protocol):
     """Protocol for split-brain detection."""
@@ -95,7 +172,9 @@ class SplitBrainMiddleware:
 
         try:
             # Detect split-brain condition
+            started = time.perf_counter()
             status = self.detector.detect_split_brain()
+            record_span(SPLIT_BRAIN_CHECK_SPAN, started)
 
             if status.is_split_brain:
                 logger.error(
@@ -132,15 +211,32 @@ class WriteForwardingMiddleware:
     - X-LiteFS-Forwarded: true
     - X-LiteFS-Primary-Node: <primary_url>
 
+    When a TxidWaiter is provided, the middleware also provides
+    read-your-writes consistency:
+    - On the primary, write responses carry the post-commit TXID in the
+      X-LiteFS-TXID header and the __litefs_txid cookie
+    - On a replica, reads carrying a TXID token wait (without blocking the
+      event loop) for the local TXID to catch up, and are forwarded to the
+      primary if the wait times out
+
+    When a TracerPort is provided, each request is a litefs.write_forwarding
+    span with the routing decision, and the forwarding attempt is a child
+    span. A traceparent header on the incoming request is the parent of
+    these spans.
+
     Usage:
         from litefs_fastapi.middleware import WriteForwardingMiddleware
         from litefs.adapters.httpx_forwarding import HTTPXForwardingAdapter
+        from litefs.usecases import ReplicationPositionReader, TxidWaiter
 
         app.add_middleware(
             WriteForwardingMiddleware,
             primary_detector=primary_detector,
             forwarding_port=HTTPXForwardingAdapter(),
             primary_url="http://primary:8000",
+            txid_waiter=TxidWaiter(
+                ReplicationPositionReader("/litefs", "db.sqlite3")
+            ),
         )
     """
 
@@ -151,6 +247,10 @@ class WriteForwardingMiddleware:
         forwarding_port: "ForwardingPort | None" = None,
         primary_url: str = "",
         excluded_paths: tuple[str, ...] = (),
+        txid_waiter: TxidWaiter | None = None,
+        read_your_writes_timeout: float = 1.0,
+        metrics: MetricsPort | None = None,
+        tracer: TracerPort | None = None,
     ) -> None:
         """Initialize the write forwarding middleware.
 
@@ -161,18 +261,29 @@ class WriteForwardingMiddleware:
                            If None, forwarding is disabled.
             primary_url: URL of the primary node (e.g., "http://primary:8000")
             excluded_paths: Paths to exclude from forwarding (handled locally)
+            txid_waiter: TxidWaiter for read-your-writes consistency.
+                        If None, TXID tokens are neither issued nor honoured.
+            read_your_writes_timeout: Maximum seconds a replica waits for a
+                                     client's TXID before forwarding the read.
+            metrics: Optional port for emitting forwarding round-trip times.
+            tracer: Optional port receiving the middleware's spans.
         """
         self.app = app
         self.primary_detector = primary_detector
         self.forwarding_port = forwarding_port
         self.primary_url = primary_url
         self.excluded_paths = excluded_paths
+        self.txid_waiter = txid_waiter
+        self.read_your_writes_timeout = read_your_writes_timeout
+        self.metrics = metrics
+        self.tracer: TracerPort = tracer or NoOpTracer()
 
     async def __call__(self, scope: "Scope", receive: "Receive", send: "Send") -> None:
         """Process request through write forwarding logic.
 
         For HTTP requests:
-        - Read methods (GET, HEAD, OPTIONS) are handled locally
+        - Read methods (GET, HEAD, OPTIONS) are handled locally, once the
+          replica has caught up with the client's TXID token (if any)
         - Write methods on primary are handled locally
         - Write methods on replica are forwarded to primary (if configured)
 
@@ -194,32 +305,181 @@ class WriteForwardingMiddleware:
         method = scope.get("method", "GET")
         path = scope.get("path", "/")
 
-        # Read methods are always handled locally
-        if method not in _WRITE_METHODS:
-            await self.app(scope, receive, send)
-            return
+        with trace_span(
+            self.tracer,
+            WRITE_FORWARDING_SPAN,
+            {"http.request.method": method, "url.path": path},
+            parent=self._extract_trace_context(scope),
+        ) as span:
+            # Check if path is excluded from forwarding
+            if self._is_path_excluded(path):
+                span.set_attribute(DECISION_ATTRIBUTE, DECISION_EXCLUDED)
+                await self.app(scope, receive, send)
+                return
+
+            # Reads are handled locally once the replica has caught up
+            if method not in _WRITE_METHODS:
+                await self._handle_read(scope, receive, send, span)
+                return
+
+            # Check if this node is primary
+            started = time.perf_counter()
+            try:
+                is_primary = self.primary_detector.is_primary()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to check primary status: {e}. Handling locally."
+                )
+                await self.app(scope, receive, send)
+                return
+            finally:
+                record_span(PRIMARY_CHECK_SPAN, started)
+
+            # Primary handles writes locally
+            if is_primary:
+                span.set_attribute(DECISION_ATTRIBUTE, DECISION_PRIMARY)
+                await self.app(scope, receive, self._txid_token_sender(send))
+                return
+
+            # Replica forwards writes to primary
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_FORWARD)
+            await self._forward_request(scope, receive, send)
+
+    async def _handle_read(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+        span: TraceSpanPort,
+    ) -> None:
+        """Handle a read request, honouring any read-your-writes token.
 
-        # Check if path is excluded from forwarding
-        if self._is_path_excluded(path):
+        Args:
+            scope: ASGI scope dictionary
+            receive: ASGI receive callable
+            send: ASGI send callable
+            span: Span of the request, receiving the routing decision
+        """
+        txid = self._extract_txid_token(scope) if self.txid_waiter else None
+        if txid is None or self.txid_waiter is None:
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             await self.app(scope, receive, send)
             return
 
-        # Check if this node is primary
+        started = time.perf_counter()
         try:
             is_primary = self.primary_detector.is_primary()
         except Exception as e:
-            logger.warning(f"Failed to check primary status: {e}. Handling locally.")
+            logger.warning(
+                f"Failed to check primary status: {e}. Handling locally.",
+                exc_info=True,
+            )
+            is_primary = False
+        record_span(PRIMARY_CHECK_SPAN, started)
+
+        if is_primary:
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             await self.app(scope, receive, send)
             return
 
-        # Primary handles writes locally
-        if is_primary:
+        started = time.perf_counter()
+        caught_up = await self.txid_waiter.wait_for_txid_async(
+            txid, self.read_your_writes_timeout
+        )
+        record_span(TXID_WAIT_SPAN, started)
+        if caught_up:
+            span.set_attribute(DECISION_ATTRIBUTE, DECISION_LOCAL_READ)
             await self.app(scope, receive, send)
             return
 
-        # Replica forwards writes to primary
+        logger.debug(
+            f"Replica did not reach TXID {format_txid(txid)} within "
+            f"{self.read_your_writes_timeout}s. Forwarding read to primary."
+        )
+        span.set_attribute(DECISION_ATTRIBUTE, DECISION_FORWARD)
         await self._forward_request(scope, receive, send)
 
+    @staticmethod
+    def _extract_trace_context(scope: Scope) -> TraceContext | None:
+        """Extract the caller's trace context from the traceparent header.
+
+        Args:
+            scope: ASGI scope dictionary
+
+        Returns:
+            The caller's context, or None if the header is missing or invalid.
+        """
+        traceparent = Headers(scope=scope).get(TRACEPARENT_HEADER_NAME)
+        if not traceparent:
+            return None
+        return TraceContext.from_traceparent(traceparent)
+
+    def _extract_txid_token(self, scope: Scope) -> int | None:
+        """Extract the read-your-writes TXID token from a request.
+
+        The X-LiteFS-TXID header takes precedence over the cookie.
+
+        Args:
+            scope: ASGI scope dictionary
+
+        Returns:
+            The requested TXID, or None if no valid token is present.
+        """
+        request = Request(scope)
+        token = request.headers.get(TXID_HEADER_NAME) or request.cookies.get(
+            TXID_COOKIE_NAME
+        )
+        if not token:
+            return None
+
+        try:
+            return parse_txid(token)
+        except LiteFSConfigError:
+            logger.debug(f"Ignoring invalid TXID token: {token!r}")
+            return None
+
+    def _txid_token_sender(self, send: Send) -> Send:
+        """Wrap send to add the post-commit TXID token to a write response.
+
+        The TXID is read when the response starts, after the application
+        has handled (and committed) the write.
+
+        Args:
+            send: ASGI send callable
+
+        Returns:
+            ASGI send callable adding the TXID token header and cookie.
+        """
+        if self.txid_waiter is None:
+            return send
+
+        waiter = self.txid_waiter
+
+        async def send_with_token(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                txid = await waiter.current_txid_async()
+                if txid is not None:
+                    headers = MutableHeaders(scope=message)
+                    self._set_txid_token(headers, format_txid(txid))
+            await send(message)
+
+        return send_with_token
+
+    @staticmethod
+    def _set_txid_token(headers: MutableHeaders, token: str) -> None:
+        """Set the read-your-writes token header and cookie.
+
+        Args:
+            headers: Response headers to modify
+            token: Hex TXID token
+        """
+        headers[TXID_HEADER_NAME] = token
+        headers.append(
+            "set-cookie",
+            f"{TXID_COOKIE_NAME}={token}; Max-Age={_TXID_COOKIE_MAX_AGE}; "
+            "HttpOnly; Path=/; SameSite=lax",
+        )
+
     def _is_path_excluded(self, path: str) -> bool:
         """Check if path is excluded from forwarding.
 
@@ -258,13 +518,24 @@ class WriteForwardingMiddleware:
 
         try:
             # Forward the request
-            result = self.forwarding_port.forward_request(  # type: ignore
-                primary_url=self.primary_url,
-                method=method,
-                path=path,
-                headers=headers,
-                body=body,
-                query_string=query_string,
+            started = time.perf_counter()
+            try:
+                result = self._send_attempt(
+                    self.forwarding_port,  # type: ignore[arg-type]
+                    method=method,
+                    path=path,
+                    headers=headers,
+                    body=body,
+                    query_string=query_string,
+                )
+            except Exception:
+                self._observe_forward_attempt("connection_error", started)
+                raise
+            self._observe_forward_attempt(
+                "gateway_error"
+                if result.status_code in _GATEWAY_STATUS_CODES
+                else "success",
+                started,
             )
 
             # Build response with forwarding headers
@@ -277,6 +548,13 @@ class WriteForwardingMiddleware:
                 status_code=result.status_code,
                 headers=response_headers,
             )
+
+            # Hand the primary's TXID token to the client so that its next
+            # read on this replica waits for the write to be replicated
+            token = response.headers.get(TXID_HEADER_NAME)
+            if token is not None and self.txid_waiter is not None:
+                self._set_txid_token(response.headers, token)
+
             await response(scope, receive, send)
 
         except Exception as e:
@@ -288,6 +566,63 @@ class WriteForwardingMiddleware:
             )
             await response(scope, receive, send)
 
+    def _send_attempt(
+        self,
+        forwarding_port: ForwardingPort,
+        method: str,
+        path: str,
+        headers: dict[str, str],
+        body: bytes,
+        query_string: str,
+    ) -> ForwardingResult:
+        """Send the forwarding attempt in a traced span.
+
+        The forwarded request carries the span's context in its traceparent
+        header.
+
+        Args:
+            forwarding_port: Port sending the request
+            method: HTTP method
+            path: Request path
+            headers: Request headers
+            body: Request body
+            query_string: Query string
+
+        Returns:
+            ForwardingResult from the primary
+        """
+        with trace_span(
+            self.tracer,
+            FORWARD_REQUEST_SPAN,
+            {FORWARD_ATTEMPT_ATTRIBUTE: 1, "server.address": self.primary_url},
+        ) as span:
+            result = forwarding_port.forward_request(
+                primary_url=self.primary_url,
+                method=method,
+                path=path,
+                headers=headers,
+                body=body,
+                query_string=query_string,
+            )
+            span.set_attribute("http.response.status_code", result.status_code)
+            return result
+
+    def _observe_forward_attempt(self, outcome: str, started: float) -> None:
+        """Record the round-trip time of a forwarding attempt.
+
+        Args:
+            outcome: "success", "gateway_error" or "connection_error".
+            started: time.perf_counter() value when the attempt started.
+        """
+        record_span(FORWARD_ATTEMPT_SPAN, started, f"attempt 1 {outcome}")
+        if self.metrics is None:
+            return
+        self.metrics.observe_histogram(
+            FORWARD_ATTEMPT_DURATION,
+            time.perf_counter() - started,
+            {"outcome": outcome},
+        )
+
     async def _read_body(self, receive: "Receive") -> bytes:
         """Read the full request body.
 
@@ -304,3 +639,307 @@ class WriteForwardingMiddleware:
             if not message.get("more_body", False):
                 break
         return body
+
+
+class ResponseCacheMiddleware:
+    """ASGI middleware caching opted-in GET responses per replication position.
+
+    Endpoints opt in with the cache_by_txid decorator. For those endpoints
+    the middleware:
+    1. Reads the local replication position (TXID and checksum)
+    2. Returns 304 Not Modified if the client's If-None-Match matches the
+       ETag derived from the position, without running the endpoint
+    3. Returns the cached response if one exists for the request's path,
+       query string, vary headers and position
+    4. Otherwise runs the endpoint and caches a cacheable response
+
+    Because the position is part of the cache key, every transaction
+    applied on this node invalidates the cache without any explicit purge.
+    Responses carry an ETag and an X-LiteFS-Cache header (HIT or MISS).
+
+    Usage:
+        from litefs.domain.settings import ResponseCacheSettings
+        from litefs.usecases.replication_position_reader import (
+            ReplicationPositionReader,
+        )
+        from litefs_fastapi import ResponseCacheMiddleware, cache_by_txid
+
+        app.add_middleware(
+            ResponseCacheMiddleware,
+            position_reader=ReplicationPositionReader("/litefs", "db.sqlite3"),
+            settings=ResponseCacheSettings(enabled=True),
+        )
+
+        @app.get("/articles")
+        @cache_by_txid
+        def list_articles() -> list[dict]: ...
+
+    Add it before WriteForwardingMiddleware (so that it runs inside it) to
+    keep reads forwarded to the primary out of the cache.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        position_reader: ReplicationPositionReaderProtocol | None = None,
+        settings: ResponseCacheSettings | None = None,
+        cache: ResponseCache | None = None,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        """Initialize the response cache middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            position_reader: Reader for the local replication position.
+                           If None, caching is disabled.
+            settings: Cache size limits and default vary headers. If given
+                     with enabled=False, caching is disabled. Defaults to
+                     ResponseCacheSettings().
+            cache: Response cache to use. Defaults to a cache sized from
+                  settings.
+            metrics: Optional port for emitting cache hit/miss metrics when
+                    the default cache is created.
+        """
+        self.app = app
+        self.position_reader = position_reader
+        self.settings = settings or ResponseCacheSettings()
+        self.cache: ResponseCache | None = None
+
+        if position_reader is not None and (settings is None or settings.enabled):
+            self.cache = cache or ResponseCache(
+                max_bytes=self.settings.max_bytes,
+                max_entry_bytes=self.settings.max_entry_bytes,
+                metrics=metrics,
+            )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process ASGI request through the response cache.
+
+        Args:
+            scope: ASGI scope dictionary
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if (
+            scope["type"] != "http"
+            or scope.get("method") != "GET"
+            or self.cache is None
+            or self.position_reader is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        options = self._find_cache_options(scope)
+        if options is None:
+            await self.app(scope, receive, send)
+            return
+
+        position = await read_position_or_none_async(self.position_reader)
+        if position is None:
+            await self.app(scope, receive, send)
+            return
+
+        vary_headers = (
+            options.vary_headers
+            if options.vary_headers is not None
+            else self.settings.vary_headers
+        )
+        request_headers = Headers(scope=scope)
+        key = ResponseCacheKey.build(
+            path=scope.get("path", "/"),
+            query_string=scope.get("query_string", b"").decode("latin-1"),
+            vary_headers=vary_headers,
+            get_header=request_headers.get,
+            position=position,
+        )
+
+        if etag_matches(request_headers.get("if-none-match"), key.etag):
+            response = Response(status_code=304, headers={"ETag": key.etag})
+            await response(scope, receive, send)
+            return
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            await self._send_cached(cached, send)
+            return
+
+        await self.app(scope, receive, self._caching_sender(send, key, vary_headers))
+
+    @staticmethod
+    def _find_cache_options(scope: Scope) -> ResponseCacheOptions | None:
+        """Find the cache options of the endpoint handling a request.
+
+        Args:
+            scope: ASGI scope dictionary
+
+        Returns:
+            Options set by cache_by_txid on the matching endpoint, or None.
+        """
+        router = getattr(scope.get("app"), "router", None)
+        for route in getattr(router, "routes", ()):
+            match, _ = route.matches(scope)
+            if match == Match.FULL:
+                return get_cache_options(getattr(route, "endpoint", None))
+        return None
+
+    @staticmethod
+    async def _send_cached(cached: CachedResponse, send: Send) -> None:
+        """Send a cached response.
+
+        Args:
+            cached: Response from the cache
+            send: ASGI send callable
+        """
+        headers = [
+            (name.encode("latin-1"), value.encode("latin-1"))
+            for name, value in cached.headers
+        ]
+        headers.append((CACHE_STATUS_HEADER_NAME.lower().encode("latin-1"), b"HIT"))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": cached.status_code,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": cached.body})
+
+    def _caching_sender(
+        self, send: Send, key: ResponseCacheKey, vary_headers: tuple[str, ...]
+    ) -> Send:
+        """Wrap send to tag and capture a cacheable response.
+
+        The response is streamed to the client unchanged apart from the
+        ETag and X-LiteFS-Cache headers; a copy of the body is kept until
+        it is complete or exceeds the cache's max_entry_bytes.
+
+        Args:
+            send: ASGI send callable
+            key: Cache key computed before the endpoint ran
+            vary_headers: Request headers that are part of the key
+
+        Returns:
+            ASGI send callable
+        """
+        cache = self.cache
+        position_reader = self.position_reader
+        status_code = 0
+        stored_headers: tuple[tuple[str, str], ...] = ()
+        chunks: list[bytes] = []
+        size = 0
+        capturing = False
+
+        async def send_and_capture(message: Message) -> None:
+            nonlocal status_code, stored_headers, size, capturing
+
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                lowered = {name.lower(): value for name, value in headers.items()}
+                if is_cacheable_response(message["status"], lowered, vary_headers):
+                    headers["ETag"] = key.etag
+                    status_code = message["status"]
+                    stored_headers = tuple(headers.items())
+                    headers[CACHE_STATUS_HEADER_NAME] = "MISS"
+                    capturing = True
+
+            elif message["type"] == "http.response.body" and capturing:
+                chunk = message.get("body", b"")
+                size += len(chunk)
+                if cache is None or size > cache.max_entry_bytes:
+                    capturing = False
+                    chunks.clear()
+                else:
+                    chunks.append(chunk)
+
+                # Only cache if no transaction was applied while the endpoint
+                # ran, as the response may already reflect it
+                if (
+                    capturing
+                    and not message.get("more_body", False)
+                    and cache is not None
+                    and position_reader is not None
+                    and await read_position_or_none_async(position_reader)
+                    == key.position
+                ):
+                    cache.put(
+                        key,
+                        CachedResponse(
+                            status_code=status_code,
+                            headers=stored_headers,
+                            body=b"".join(chunks),
+                        ),
+                    )
+
+            await send(message)
+
+        return send_and_capture
+
+
+class ServerTimingMiddleware:
+    """ASGI middleware reporting the time spent in LiteFS layers per request.
+
+    While a request is handled, the LiteFS middleware record timing spans:
+    the split-brain and primary checks, the attempt to forward the request
+    and the read-your-writes TXID wait. The spans and the total time until
+    the response starts are returned in a Server-Timing header, and
+    optionally logged.
+
+    Usage:
+        from litefs_fastapi import ServerTimingMiddleware
+
+        app.add_middleware(SplitBrainMiddleware, detector=detector)
+        app.add_middleware(ServerTimingMiddleware)
+
+    Add it last, so that it runs outermost and wraps the other LiteFS
+    middleware. When disabled, requests pass straight through and LiteFS
+    components only check that no spans are being collected.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        settings: ServerTimingSettings | None = None,
+    ) -> None:
+        """Initialize the Server-Timing middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            settings: Whether to add the header and log the spans. If given
+                     with enabled=False, requests pass through. Defaults to
+                     adding the header without logging.
+        """
+        self.app = app
+        self.settings = settings or ServerTimingSettings(enabled=True)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request, collecting the spans recorded while handling it.
+
+        Args:
+            scope: ASGI scope dictionary
+            receive: ASGI receive callable
+            send: ASGI send callable
+        """
+        if scope["type"] != "http" or not self.settings.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        with collect_server_timing() as timing:
+
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    timing.record(TOTAL_SPAN, time.perf_counter() - started)
+                    headers = MutableHeaders(scope=message)
+                    headers.append(SERVER_TIMING_HEADER_NAME, timing.header_value())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        if self.settings.log:
+            log_server_timing(
+                timing, scope.get("method", ""), scope.get("path", "/"), status_code
+            )
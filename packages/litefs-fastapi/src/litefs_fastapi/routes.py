@@ -1,14 +1,190 @@
 """FastAPI routes for LiteFS integration."""
 
+from collections.abc import Callable
 from typing import Any
 
-from fastapi import APIRouter
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
+from litefs.adapters.ports import LeaderElectionPort
+from litefs.adapters.prometheus_exposition import PrometheusExposition
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationLag
+from litefs.domain.settings import HealthSnapshotSettings
 from litefs.usecases.health_checker import HealthChecker
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator
 from litefs.usecases.liveness_checker import LivenessChecker
+from litefs.usecases.primary_detector import LiteFSNotRunningError
 from litefs.usecases.readiness_checker import ReadinessChecker
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
 from litefs.usecases.split_brain_detector import SplitBrainDetector
+from litefs_fastapi.services import get_health_snapshots, get_services
+
+# Endpoint payload and HTTP status code
+Payload = tuple[dict[str, Any], int]
+
+
+def _replication_lag_data(replication_lag: ReplicationLag) -> dict[str, Any]:
+    """Serialize replication lag for health responses.
+
+    Args:
+        replication_lag: Replication lag from the last health check.
+
+    Returns:
+        Dict with the local TXID and the lag relative to the primary.
+    """
+    return {
+        "txid": replication_lag.local_txid,
+        "replication_lag": {
+            "primary_txid": replication_lag.primary_txid,
+            "txids": replication_lag.txid_lag,
+            "seconds": replication_lag.seconds_lag,
+        },
+    }
+
+
+def build_health_payload(
+    health_checker: HealthChecker,
+    split_brain_detector: SplitBrainDetector | None,
+) -> Payload:
+    """Evaluate the /health endpoint.
+
+    Args:
+        health_checker: HealthChecker use case for node health status
+        split_brain_detector: SplitBrainDetector use case, or None when the
+                             leader election has no cluster view
+
+    Returns:
+        Response payload and HTTP status code
+    """
+    # Check health status
+    health_status = health_checker.check_health()
+
+    # Build response
+    response: dict[str, Any] = {
+        "health_state": health_status.state,
+        "is_split_brain": False,
+        "leader_nodes": [],
+    }
+
+    # Detect split-brain condition
+    if split_brain_detector is not None:
+        split_brain_status = split_brain_detector.detect_split_brain()
+        response["is_split_brain"] = split_brain_status.is_split_brain
+        response["leader_nodes"] = [
+            {"node_id": node.node_id, "is_leader": node.is_leader}
+            for node in split_brain_status.leader_nodes
+        ]
+
+    replication_lag = health_checker.last_replication_lag
+    if replication_lag is not None:
+        response.update(_replication_lag_data(replication_lag))
+
+    return response, 200
+
+
+def build_liveness_payload(liveness_checker: LivenessChecker) -> Payload:
+    """Evaluate the /health/live endpoint.
+
+    Args:
+        liveness_checker: LivenessChecker use case for liveness probes
+
+    Returns:
+        Response payload and HTTP status code
+    """
+    result = liveness_checker.check_liveness()
+
+    if result.is_live:
+        return {"is_live": True}, 200
+    else:
+        return {"is_live": False, "error": result.error}, 503
+
+
+def build_readiness_payload(readiness_checker: ReadinessChecker) -> Payload:
+    """Evaluate the /health/ready endpoint.
+
+    Args:
+        readiness_checker: ReadinessChecker use case for readiness probes
+
+    Returns:
+        Response payload and HTTP status code
+    """
+    result = readiness_checker.check_readiness()
+
+    response_data: dict[str, Any] = {
+        "is_ready": result.is_ready,
+        "can_accept_writes": result.can_accept_writes,
+        "health_status": result.health_status.state,
+        "split_brain_detected": result.split_brain_detected,
+    }
+
+    if result.replication_lag is not None:
+        response_data.update(_replication_lag_data(result.replication_lag))
+
+    if result.error is not None:
+        response_data["error"] = result.error
+
+    status_code = 200 if result.is_ready else 503
+    return response_data, status_code
+
+
+def build_position_payload(
+    leader_election: LeaderElectionPort, lag_checker: ReplicationLagChecker
+) -> Payload:
+    """Evaluate the /health/position endpoint queried by cluster peers.
+
+    Reports whether this node is the elected leader and its local TXID,
+    without evaluating health or querying other nodes.
+
+    Args:
+        leader_election: LeaderElectionPort of this node
+        lag_checker: ReplicationLagChecker reading the local TXID
+
+    Returns:
+        Response payload and HTTP status code
+    """
+    try:
+        is_leader = leader_election.is_leader_elected()
+        txid = lag_checker.read_local_txid()
+    except (LiteFSNotRunningError, LiteFSConfigError) as e:
+        return {"error": str(e), "is_leader": False}, 503
+    return {"is_leader": is_leader, "txid": txid}, 200
+
+
+def create_health_snapshot_evaluator(
+    health_checker: HealthChecker,
+    split_brain_detector: SplitBrainDetector | None,
+    liveness_checker: LivenessChecker,
+    readiness_checker: ReadinessChecker,
+    settings: HealthSnapshotSettings | None = None,
+) -> HealthSnapshotEvaluator:
+    """Create an evaluator precomputing the health endpoint responses.
+
+    The caller starts and stops the evaluator, e.g. in the app lifespan.
+
+    Args:
+        health_checker: HealthChecker use case for node health status
+        split_brain_detector: SplitBrainDetector use case, or None
+        liveness_checker: LivenessChecker use case for liveness probes
+        readiness_checker: ReadinessChecker use case for readiness probes
+        settings: Evaluation interval and maximum snapshot age. Defaults
+                 to HealthSnapshotSettings().
+
+    Returns:
+        HealthSnapshotEvaluator to pass to create_health_router()
+    """
+    settings = settings or HealthSnapshotSettings()
+    return HealthSnapshotEvaluator(
+        {
+            "health": lambda: build_health_payload(
+                health_checker, split_brain_detector
+            ),
+            "live": lambda: build_liveness_payload(liveness_checker),
+            "ready": lambda: build_readiness_payload(readiness_checker),
+        },
+        interval=settings.interval,
+        max_age=settings.max_age,
+    )
 
 
 def create_health_router(
@@ -16,6 +192,7 @@ def create_health_router(
     split_brain_detector: SplitBrainDetector,
     liveness_checker: LivenessChecker,
     readiness_checker: ReadinessChecker,
+    snapshots: HealthSnapshotEvaluator | None = None,
 ) -> APIRouter:
     """Create FastAPI router with health endpoints.
 
@@ -29,44 +206,110 @@ def create_health_router(
         split_brain_detector: SplitBrainDetector use case for cluster split-brain detection
         liveness_checker: LivenessChecker use case for liveness probes
         readiness_checker: ReadinessChecker use case for readiness probes
+        snapshots: Optional running HealthSnapshotEvaluator. Its fresh
+                  snapshots are returned with an Age header instead of
+                  evaluating health on each request.
+
+    Returns:
+        APIRouter configured with health endpoints
+    """
+    return _build_health_router(
+        lambda request: build_health_payload(health_checker, split_brain_detector),
+        lambda request: build_liveness_payload(liveness_checker),
+        lambda request: build_readiness_payload(readiness_checker),
+        lambda request: snapshots,
+    )
+
+
+def create_services_health_router() -> APIRouter:
+    """Create the health router backed by the application's LiteFSServices.
+
+    The use cases are looked up per request on the container installed by
+    create_lifespan(), so the router can be included at import time while
+    the container is only built when the application starts. Snapshots
+    are served when the lifespan started a health snapshot evaluator.
+    /health/position, queried by Raft peers for the leader's TXID, is
+    also served.
+
+    Returns:
+        APIRouter configured with health endpoints
+    """
+
+    def health(request: Request) -> Payload:
+        services = get_services(request)
+        return build_health_payload(
+            services.health_checker, services.split_brain_detector
+        )
+
+    return _build_health_router(
+        health,
+        lambda request: build_liveness_payload(get_services(request).liveness_checker),
+        lambda request: build_readiness_payload(
+            get_services(request).readiness_checker
+        ),
+        get_health_snapshots,
+        lambda request: build_position_payload(
+            get_services(request).leader_election,
+            get_services(request).replication_lag_checker,
+        ),
+    )
+
+
+def _build_health_router(
+    get_health_payload: Callable[[Request], Payload],
+    get_liveness_payload: Callable[[Request], Payload],
+    get_readiness_payload: Callable[[Request], Payload],
+    get_snapshots: Callable[[Request], HealthSnapshotEvaluator | None],
+    get_position_payload: Callable[[Request], Payload] | None = None,
+) -> APIRouter:
+    """Create the health router from per-request payload builders.
+
+    Args:
+        get_health_payload: Evaluates /health for a request
+        get_liveness_payload: Evaluates /health/live for a request
+        get_readiness_payload: Evaluates /health/ready for a request
+        get_snapshots: Returns the snapshot evaluator for a request, if any
+        get_position_payload: Evaluates /health/position for a request;
+                             the endpoint is omitted when None
 
     Returns:
         APIRouter configured with health endpoints
     """
     router = APIRouter()
 
+    def respond(
+        request: Request, name: str, evaluate: Callable[[Request], Payload]
+    ) -> Response:
+        snapshots = get_snapshots(request)
+        snapshot = snapshots.get(name) if snapshots is not None else None
+        if snapshots is not None and snapshot is not None:
+            return Response(
+                content=snapshot.body,
+                status_code=snapshot.status_code,
+                media_type="application/json",
+                headers={"Age": str(snapshot.age(snapshots.now()))},
+            )
+        payload, status_code = evaluate(request)
+        return JSONResponse(content=payload, status_code=status_code)
+
     @router.get("/health")
-    def get_health() -> dict[str, Any]:
+    def get_health(request: Request) -> Response:
         """Get health status of the LiteFS node.
 
         Returns JSON response including:
         - health_state: One of "healthy", "degraded", or "unhealthy"
         - is_split_brain: Boolean indicating if cluster split-brain is detected
         - leader_nodes: List of nodes claiming leadership in the cluster
+        - txid, replication_lag: Replication position and lag, when the
+          health checker is configured with a ReplicationLagChecker
 
         Returns:
-            dict with keys: health_state, is_split_brain, leader_nodes
+            JSONResponse with keys: health_state, is_split_brain, leader_nodes
         """
-        # Check health status
-        health_status = health_checker.check_health()
-
-        # Detect split-brain condition
-        split_brain_status = split_brain_detector.detect_split_brain()
-
-        # Build response
-        response: dict[str, Any] = {
-            "health_state": health_status.state,
-            "is_split_brain": split_brain_status.is_split_brain,
-            "leader_nodes": [
-                {"node_id": node.node_id, "is_leader": node.is_leader}
-                for node in split_brain_status.leader_nodes
-            ],
-        }
-
-        return response
+        return respond(request, "health", get_health_payload)
 
     @router.get("/health/live")
-    def get_liveness() -> JSONResponse:
+    def get_liveness(request: Request) -> Response:
         """Liveness probe endpoint for Kubernetes/orchestrator health checks.
 
         Returns JSON indicating if the LiteFS process is running:
@@ -76,21 +319,10 @@ def create_health_router(
         Returns:
             JSONResponse with liveness status
         """
-        result = liveness_checker.check_liveness()
-
-        if result.is_live:
-            return JSONResponse(
-                content={"is_live": True},
-                status_code=200,
-            )
-        else:
-            return JSONResponse(
-                content={"is_live": False, "error": result.error},
-                status_code=503,
-            )
+        return respond(request, "live", get_liveness_payload)
 
     @router.get("/health/ready")
-    def get_readiness() -> JSONResponse:
+    def get_readiness(request: Request) -> Response:
         """Readiness probe endpoint for Kubernetes/orchestrator health checks.
 
         Returns JSON indicating if the node is ready to accept traffic:
@@ -102,23 +334,55 @@ def create_health_router(
         - can_accept_writes: Boolean indicating if node can accept writes (is PRIMARY)
         - health_status: Health status (healthy/degraded/unhealthy)
         - split_brain_detected: Boolean indicating if split brain detected
+        - txid, replication_lag: Replication position and lag (when tracked)
 
         Returns:
             JSONResponse with readiness status
         """
-        result = readiness_checker.check_readiness()
+        return respond(request, "ready", get_readiness_payload)
+
+    if get_position_payload is not None:
+        evaluate_position = get_position_payload
+
+        @router.get("/health/position")
+        def get_position(request: Request) -> Response:
+            """Leadership and replication position, queried by Raft peers.
+
+            Returns JSON with is_leader and txid (the local replication
+            position, or None before LiteFS wrote one). Never served from
+            a snapshot.
+            """
+            payload, status_code = evaluate_position(request)
+            return JSONResponse(content=payload, status_code=status_code)
+
+    return router
+
 
-        response_data: dict[str, Any] = {
-            "is_ready": result.is_ready,
-            "can_accept_writes": result.can_accept_writes,
-            "health_status": result.health_status.state,
-            "split_brain_detected": result.split_brain_detected,
-        }
+def create_metrics_router(exposition: PrometheusExposition | None = None) -> APIRouter:
+    """Create FastAPI router with the Prometheus /metrics endpoint.
 
-        if result.error is not None:
-            response_data["error"] = result.error
+    Under a multiprocess server with PROMETHEUS_MULTIPROC_DIR set, values
+    of all workers are aggregated. The output is reused for the
+    exposition's TTL (settings.metrics_exposition_ttl).
+
+    Args:
+        exposition: Exposition to render. Defaults to the one of the
+                   LiteFSServices installed by create_lifespan(), looked up
+                   per request.
+
+    Returns:
+        APIRouter serving /metrics, or 404 when LiteFS metrics are disabled
+    """
+    router = APIRouter()
 
-        status_code = 200 if result.is_ready else 503
-        return JSONResponse(content=response_data, status_code=status_code)
+    @router.get("/metrics")
+    def get_metrics(request: Request) -> Response:
+        """Get LiteFS metrics in the Prometheus text format."""
+        current = exposition
+        if current is None:
+            current = get_services(request).metrics_exposition
+        if current is None:
+            return PlainTextResponse("LiteFS metrics are disabled\n", status_code=404)
+        return Response(content=current.render(), media_type=current.content_type)
 
     return router
@@ -0,0 +1,175 @@
+"""Lifespan-managed LiteFS service container for FastAPI.
+
+The container holding the LiteFS use cases (detectors, leader election,
+failover coordinator and health checkers) is created when the application
+starts and closed when it shuts down, which stops the Raft node in Raft
+mode. Routes and dependencies reach it through the request:
+
+    settings = get_litefs_settings(config)
+    app = FastAPI(lifespan=create_lifespan(settings))
+    app.include_router(create_services_health_router())
+
+    @app.get("/role")
+    def role(services: Annotated[LiteFSServices, Depends(get_services)]) -> dict:
+        return {"is_primary": services.primary_detector.is_primary()}
+
+When settings.health_snapshot is enabled, the lifespan also runs a
+HealthSnapshotEvaluator, and the services health router returns its
+precomputed responses.
+
+When settings.health_probes is enabled, the lifespan starts the
+container's ActiveHealthMonitor with the application and adds a probe of
+the application's event loop lag.
+
+When settings.raft_event_loop is enabled in Raft mode, the lifespan starts
+the Raft node on the application's event loop instead of on first use, so
+it runs without a tick thread of its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+
+from fastapi import FastAPI, Request
+from litefs.adapters.ports import NodeIDResolverPort, RaftLeaderElectionPort
+from litefs.domain.health import EVENT_LOOP_LAG
+from litefs.domain.settings import LiteFSSettings
+from litefs.services import LiteFSServices
+from litefs.usecases.health_probes import EventLoopLagProbe
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator
+
+# Attributes of app.state holding the container and the snapshot evaluator
+_STATE_ATTRIBUTE = "litefs_services"
+_SNAPSHOTS_STATE_ATTRIBUTE = "litefs_health_snapshots"
+
+
+def create_lifespan(
+    settings: LiteFSSettings,
+    node_id_resolver: NodeIDResolverPort | None = None,
+    leader_election_factory: (
+        Callable[[LiteFSSettings, str], RaftLeaderElectionPort] | None
+    ) = None,
+) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    """Create a FastAPI lifespan owning a LiteFSServices container.
+
+    Members are still built lazily, on first use by a request, unless
+    health snapshots are enabled: the snapshot evaluator starts with the
+    application and builds the health checkers in the background. A Raft
+    node on the event loop (settings.raft_event_loop) starts with the
+    application, since sync routes run in worker threads.
+
+    Args:
+        settings: LiteFS configuration for the container.
+        node_id_resolver: Resolver for this node's ID. Defaults to
+                         EnvironmentNodeIDResolver.
+        leader_election_factory: Creates the Raft leader election.
+                                Defaults to create_raft_leader_election.
+
+    Returns:
+        Lifespan function to pass to FastAPI(lifespan=...).
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        services = LiteFSServices(
+            settings,
+            node_id_resolver=node_id_resolver,
+            leader_election_factory=leader_election_factory,
+        )
+        setattr(app.state, _STATE_ATTRIBUTE, services)
+        _start_raft_on_event_loop(services)
+        _start_health_probes(services)
+        snapshots = _create_health_snapshots(services)
+        if snapshots is not None:
+            setattr(app.state, _SNAPSHOTS_STATE_ATTRIBUTE, snapshots)
+            snapshots.start()
+        try:
+            yield
+        finally:
+            if snapshots is not None:
+                delattr(app.state, _SNAPSHOTS_STATE_ATTRIBUTE)
+                snapshots.stop(timeout=1.0)
+            delattr(app.state, _STATE_ATTRIBUTE)
+            services.close()
+
+    return lifespan
+
+
+def get_services(request: Request) -> LiteFSServices:
+    """FastAPI dependency returning the application's LiteFSServices.
+
+    Args:
+        request: Current request.
+
+    Returns:
+        Container created by the lifespan from create_lifespan().
+
+    Raises:
+        RuntimeError: If the application was not started with that lifespan.
+    """
+    services = getattr(request.app.state, _STATE_ATTRIBUTE, None)
+    if services is None:
+        raise RuntimeError(
+            "LiteFS services not available. "
+            "Create the app with FastAPI(lifespan=create_lifespan(settings))."
+        )
+    return services
+
+
+def get_health_snapshots(request: Request) -> HealthSnapshotEvaluator | None:
+    """Return the application's health snapshot evaluator, if running.
+
+    Args:
+        request: Current request.
+
+    Returns:
+        Evaluator started by the lifespan, or None if snapshots are disabled.
+    """
+    return getattr(request.app.state, _SNAPSHOTS_STATE_ATTRIBUTE, None)
+
+
+def _start_raft_on_event_loop(services: LiteFSServices) -> None:
+    """Create the Raft election now if it is to run on the event loop."""
+    settings = services.settings
+    if settings.leader_election == "raft" and settings.raft_event_loop:
+        services.leader_election  # noqa: B018
+
+
+def _start_health_probes(services: LiteFSServices) -> None:
+    """Start the active health monitor, probing the running event loop."""
+    probe_settings = services.settings.health_probes
+    if probe_settings is None or not probe_settings.enabled:
+        return
+    monitor = services.health_monitor
+    thresholds = probe_settings.probe_thresholds(EVENT_LOOP_LAG)
+    if monitor is not None and thresholds is not None:
+        monitor.add_probe(EventLoopLagProbe(asyncio.get_running_loop()), thresholds)
+
+
+def _create_health_snapshots(
+    services: LiteFSServices,
+) -> HealthSnapshotEvaluator | None:
+    """Create the health snapshot evaluator if enabled in settings."""
+    snapshot_settings = services.settings.health_snapshot
+    if snapshot_settings is None or not snapshot_settings.enabled:
+        return None
+
+    from litefs_fastapi.routes import (
+        build_health_payload,
+        build_liveness_payload,
+        build_readiness_payload,
+    )
+
+    return HealthSnapshotEvaluator(
+        {
+            "health": lambda: build_health_payload(
+                services.health_checker, services.split_brain_detector
+            ),
+            "live": lambda: build_liveness_payload(services.liveness_checker),
+            "ready": lambda: build_readiness_payload(services.readiness_checker),
+        },
+        interval=snapshot_settings.interval,
+        max_age=snapshot_settings.max_age,
+    )
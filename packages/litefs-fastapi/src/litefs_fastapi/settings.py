@@ -3,7 +3,18 @@
 from typing import Any
 
 from litefs.domain.exceptions import LiteFSConfigError
-from litefs.domain.settings import LiteFSSettings, StaticLeaderConfig
+from litefs.domain.health import ProbeThresholds
+from litefs.domain.settings import (
+    ChangeBusSettings,
+    HealthProbeSettings,
+    HealthSnapshotSettings,
+    LiteFSSettings,
+    ReplicationSettings,
+    ResponseCacheSettings,
+    ServerTimingSettings,
+    StaticLeaderConfig,
+    default_probe_thresholds,
+)
 
 # Required fields that must be present in Pydantic settings
 _REQUIRED_FIELDS = (
@@ -53,6 +64,26 @@ def get_litefs_settings(pydantic_settings: dict[str, Any]) -> LiteFSSettings:
         else:
             kwargs[field] = None
 
+    for field in (
+        "raft_observers",
+        "raft_dynamic_membership",
+        "raft_membership_file",
+        "raft_priorities",
+        "raft_rebalance_after",
+        "raft_election_timeout",
+        "raft_heartbeat_interval",
+        "raft_adaptive_timeouts",
+        "raft_min_election_timeout",
+        "raft_min_heartbeat_interval",
+        "raft_pre_vote",
+        "raft_check_quorum",
+        "raft_event_loop",
+        "raft_cluster_metadata",
+        "raft_forwarding_url",
+    ):
+        if field in pydantic_settings:
+            kwargs[field] = pydantic_settings[field]
+
     # Parse static leader configuration if leader_election is "static"
     leader_election = kwargs.get("leader_election")
     if leader_election == "static":
@@ -73,5 +104,103 @@ def get_litefs_settings(pydantic_settings: dict[str, Any]) -> LiteFSSettings:
         # static_leader_config is None for non-static modes
         kwargs["static_leader_config"] = None
 
+    # Parse replication lag configuration if provided
+    replication = pydantic_settings.get("replication")
+    if replication is not None:
+        kwargs["replication"] = ReplicationSettings(
+            max_lag_txids=replication.get("max_lag_txids", 1000),
+            max_lag_seconds=replication.get("max_lag_seconds", 30.0),
+            rate_window_seconds=replication.get("rate_window_seconds", 60.0),
+        )
+    else:
+        kwargs["replication"] = None
+
+    # Parse response cache configuration if provided
+    response_cache = pydantic_settings.get("response_cache")
+    if response_cache is not None:
+        kwargs["response_cache"] = ResponseCacheSettings(
+            enabled=response_cache.get("enabled", False),
+            max_bytes=response_cache.get("max_bytes", 32 * 1024 * 1024),
+            max_entry_bytes=response_cache.get("max_entry_bytes", 1024 * 1024),
+            vary_headers=tuple(
+                response_cache.get("vary_headers", ("Accept", "Accept-Encoding"))
+            ),
+        )
+    else:
+        kwargs["response_cache"] = None
+
+    # Parse change bus configuration if provided
+    change_bus = pydantic_settings.get("change_bus")
+    if change_bus is not None:
+        kwargs["change_bus"] = ChangeBusSettings(
+            enabled=change_bus.get("enabled", False),
+            poll_interval=change_bus.get("poll_interval", 0.5),
+            min_interval=change_bus.get("min_interval", 0.1),
+            use_inotify=change_bus.get("use_inotify", True),
+        )
+    else:
+        kwargs["change_bus"] = None
+
+    health_snapshot = pydantic_settings.get("health_snapshot")
+    if health_snapshot is not None:
+        kwargs["health_snapshot"] = HealthSnapshotSettings(
+            enabled=health_snapshot.get("enabled", False),
+            interval=health_snapshot.get("interval", 1.0),
+            max_age=health_snapshot.get("max_age", 10.0),
+        )
+    else:
+        kwargs["health_snapshot"] = None
+
+    server_timing = pydantic_settings.get("server_timing")
+    if server_timing is not None:
+        kwargs["server_timing"] = ServerTimingSettings(
+            enabled=server_timing.get("enabled", False),
+            log=server_timing.get("log", False),
+        )
+
+    health_probes = pydantic_settings.get("health_probes")
+    if health_probes is not None:
+        kwargs["health_probes"] = HealthProbeSettings(
+            enabled=health_probes.get("enabled", False),
+            interval=health_probes.get("interval", 5.0),
+            failure_threshold=health_probes.get("failure_threshold", 3),
+            recovery_threshold=health_probes.get("recovery_threshold", 2),
+            thresholds={
+                name: _parse_probe_thresholds(name, thresholds)
+                for name, thresholds in health_probes.get("thresholds", {}).items()
+            },
+        )
+
+    metrics = pydantic_settings.get("metrics")
+    if metrics is not None:
+        kwargs["metrics_enabled"] = metrics.get("enabled", False)
+        kwargs["metrics_prefix"] = metrics.get("prefix", "litefs")
+        kwargs["metrics_histogram_buckets"] = metrics.get("histogram_buckets")
+        kwargs["metrics_exposition_ttl"] = metrics.get("exposition_ttl", 1.0)
+
     # Create domain object (validation happens in __post_init__)
     return LiteFSSettings(**kwargs)
+
+
+def _parse_probe_thresholds(
+    name: str, thresholds: dict[str, Any] | None
+) -> ProbeThresholds | None:
+    """Convert the thresholds entry of a health probe.
+
+    Args:
+        name: Probe name, e.g. "event_loop_lag".
+        thresholds: Dict with degraded and unhealthy keys, or None to
+                   disable the probe.
+
+    Returns:
+        The probe thresholds, keeping the probe's direction (free disk
+        space is worse when lower), or None.
+    """
+    if thresholds is None:
+        return None
+    default = default_probe_thresholds().get(name)
+    return ProbeThresholds(
+        degraded=thresholds.get("degraded"),
+        unhealthy=thresholds.get("unhealthy"),
+        higher_is_worse=default.higher_is_worse if default is not None else True,
+    )
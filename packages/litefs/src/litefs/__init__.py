@@ -6,7 +6,11 @@ from litefs.domain.settings import LiteFSSettings
 from litefs.domain.exceptions import LiteFSConfigError
 from litefs.usecases.config_generator import ConfigGenerator
 from litefs.usecases.primary_detector import PrimaryDetector, LiteFSNotRunningError
-from litefs.factories import create_raft_leader_election, PyLeaderNotInstalledError
+from litefs.factories import (
+    create_raft_leader_election,
+    create_raft_membership_client,
+    PyLeaderNotInstalledError,
+)
 
 __all__ = [
     "LiteFSSettings",
@@ -15,6 +19,7 @@ __all__ = [
     "PrimaryDetector",
     "LiteFSNotRunningError",
     "create_raft_leader_election",
+    "create_raft_membership_client",
     "PyLeaderNotInstalledError",
 ]
 
@@ -6,12 +6,21 @@ from litefs.adapters.ports import (
     PrimaryDetectorPort,
     LeaderElectionPort,
     RaftLeaderElectionPort,
+    LeadershipTransferPort,
+    RaftMembershipPort,
+    ClusterMetadataPort,
+    FencingEpochPort,
+    RaftTimingPort,
     SplitBrainDetectorPort,
     ForwardingPort,
     ForwardingResult,
     PlatformDetectorPort,
     BinaryDownloaderPort,
     BinaryResolverPort,
+    FileWatcherPort,
+    TracerPort,
+    TraceSpanPort,
+    NoOpTracer,
 )
 from litefs.adapters.metrics_port import MetricsPort, NoOpMetricsAdapter
 from litefs.adapters.raft_leader_election_adapter import RaftLeaderElectionAdapter
@@ -19,6 +28,8 @@ from litefs.adapters.httpx_forwarding import HTTPXForwardingAdapter
 from litefs.adapters.platform_detector import OsPlatformDetector
 from litefs.adapters.httpx_binary_downloader import HttpxBinaryDownloader
 from litefs.adapters.filesystem_binary_resolver import FilesystemBinaryResolver
+from litefs.adapters.inotify_file_watcher import InotifyFileWatcher
+from litefs.adapters.static_leader_election import StaticLeaderElection
 
 __all__ = [
     "PrimaryDetectorPort",
@@ -27,6 +38,11 @@ __all__ = [
     "LeaderElectionPort",
     "RaftLeaderElectionPort",
     "RaftLeaderElectionAdapter",
+    "LeadershipTransferPort",
+    "RaftMembershipPort",
+    "ClusterMetadataPort",
+    "FencingEpochPort",
+    "RaftTimingPort",
     "SplitBrainDetectorPort",
     "ForwardingPort",
     "ForwardingResult",
@@ -39,4 +55,10 @@ __all__ = [
     "FilesystemBinaryResolver",
     "MetricsPort",
     "NoOpMetricsAdapter",
+    "FileWatcherPort",
+    "TracerPort",
+    "TraceSpanPort",
+    "NoOpTracer",
+    "InotifyFileWatcher",
+    "StaticLeaderElection",
 ]
@@ -8,6 +8,7 @@ from litefs.adapters.fakes.fake_binary_downloader import FakeBinaryDownloader
 from litefs.adapters.fakes.fake_binary_resolver import FakeBinaryResolver
 from litefs.adapters.fakes.fake_platform_detector import FakePlatformDetector
 from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter, MetricCall
+from litefs.adapters.fakes.fake_tracer import InMemoryTracer, RecordedSpan
 
 __all__ = [
     "FakeBinaryDownloader",
@@ -15,4 +16,6 @@ __all__ = [
     "FakePlatformDetector",
     "FakeMetricsAdapter",
     "MetricCall",
+    "InMemoryTracer",
+    "RecordedSpan",
 ]
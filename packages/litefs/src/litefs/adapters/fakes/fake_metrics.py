@@ -6,6 +6,7 @@ for assertion in tests.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Literal
 
@@ -27,7 +28,9 @@ class FakeMetricsAdapter:
     """Fake implementation of MetricsPort for testing.
 
     Records all metric updates for later assertion. Provides methods
-    to inspect current state and call history.
+    to inspect current state and call history. Gauge updates are listed in
+    calls; histogram observations and counter increments are inspected
+    with histogram_values() and counter_value().
 
     Example:
         >>> fake = FakeMetricsAdapter()
@@ -44,6 +47,13 @@ class FakeMetricsAdapter:
         self._health_status: str | None = None
         self._split_brain_detected: bool | None = None
         self._leader_elected: bool | None = None
+        self._local_txid: int | None = None
+        self._replication_lag: tuple[int, float | None] | None = None
+        self._response_cache_stats: tuple[int, int, int] | None = None
+        self._query_cache_stats: tuple[int, int, int] | None = None
+        self._raft_timing: tuple[float, float] | None = None
+        self._histograms: dict[str, list[tuple[float, dict[str, str]]]] = {}
+        self._counters: dict[tuple[str, frozenset[tuple[str, str]]], float] = {}
         self._calls: list[MetricCall] = []
 
     @property
@@ -77,6 +87,64 @@ class FakeMetricsAdapter:
         """Return last set leader election state, or None if never set."""
         return self._leader_elected
 
+    @property
+    def current_local_txid(self) -> int | None:
+        """Return last set local TXID, or None if never set."""
+        return self._local_txid
+
+    @property
+    def current_replication_lag(self) -> tuple[int, float | None] | None:
+        """Return last set (txids, seconds) replication lag, or None if never set."""
+        return self._replication_lag
+
+    @property
+    def current_response_cache_stats(self) -> tuple[int, int, int] | None:
+        """Return last set (hits, misses, size_bytes), or None if never set."""
+        return self._response_cache_stats
+
+    @property
+    def current_query_cache_stats(self) -> tuple[int, int, int] | None:
+        """Return last set (hits, misses, size_bytes), or None if never set."""
+        return self._query_cache_stats
+
+    @property
+    def current_raft_timing(self) -> tuple[float, float] | None:
+        """Return last set (heartbeat_interval, election_timeout), or None."""
+        return self._raft_timing
+
+    def histogram_values(self, name: str, **labels: str) -> list[float]:
+        """Return the values observed in a histogram.
+
+        Args:
+            name: Histogram name.
+            **labels: If given, only observations with these label values.
+
+        Returns:
+            Observed values in order of observation.
+        """
+        return [
+            value
+            for value, observed_labels in self._histograms.get(name, [])
+            if all(observed_labels.get(k) == v for k, v in labels.items())
+        ]
+
+    def counter_value(self, name: str, **labels: str) -> float:
+        """Return the total of a counter.
+
+        Args:
+            name: Counter name.
+            **labels: If given, only increments with these label values.
+
+        Returns:
+            Sum of matching increments, 0 if none.
+        """
+        return sum(
+            amount
+            for (counter_name, counter_labels), amount in self._counters.items()
+            if counter_name == name
+            and all(dict(counter_labels).get(k) == v for k, v in labels.items())
+        )
+
     def set_node_state(self, is_primary: bool) -> None:
         """Record node state update.
 
@@ -116,6 +184,101 @@ class FakeMetricsAdapter:
         self._leader_elected = is_elected
         self._calls.append(MetricCall("leader_elected", is_elected))
 
+    def set_local_txid(self, txid: int) -> None:
+        """Record local TXID update.
+
+        Args:
+            txid: TXID of the last applied transaction.
+        """
+        self._local_txid = txid
+        self._calls.append(MetricCall("local_txid", txid))
+
+    def set_replication_lag(self, txids: int, seconds: float | None) -> None:
+        """Record replication lag update.
+
+        Args:
+            txids: Number of transactions behind the primary.
+            seconds: Estimated seconds behind, or None.
+        """
+        self._replication_lag = (txids, seconds)
+        self._calls.append(MetricCall("replication_lag_txids", txids))
+        if seconds is not None:
+            self._calls.append(MetricCall("replication_lag_seconds", seconds))
+
+    def set_response_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Record response cache stats update.
+
+        Args:
+            hits: Total cache hits.
+            misses: Total cache misses.
+            size_bytes: Memory held by cached responses.
+        """
+        self._response_cache_stats = (hits, misses, size_bytes)
+        self._calls.append(MetricCall("response_cache_hits", hits))
+        self._calls.append(MetricCall("response_cache_misses", misses))
+        self._calls.append(MetricCall("response_cache_bytes", size_bytes))
+
+    def set_query_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Record query-result cache stats update.
+
+        Args:
+            hits: Total cache hits.
+            misses: Total cache misses.
+            size_bytes: Memory held by cached query results.
+        """
+        self._query_cache_stats = (hits, misses, size_bytes)
+        self._calls.append(MetricCall("query_cache_hits", hits))
+        self._calls.append(MetricCall("query_cache_misses", misses))
+        self._calls.append(MetricCall("query_cache_bytes", size_bytes))
+
+    def set_raft_timing(
+        self, heartbeat_interval: float, election_timeout: float
+    ) -> None:
+        """Record Raft timing update.
+
+        Args:
+            heartbeat_interval: Seconds between heartbeats.
+            election_timeout: Seconds before standing for election.
+        """
+        self._raft_timing = (heartbeat_interval, election_timeout)
+        self._calls.append(
+            MetricCall("raft_heartbeat_interval_seconds", heartbeat_interval)
+        )
+        self._calls.append(
+            MetricCall("raft_election_timeout_seconds", election_timeout)
+        )
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record a histogram observation.
+
+        Args:
+            name: Histogram name.
+            value: Observed value.
+            labels: Optional label values.
+        """
+        self._histograms.setdefault(name, []).append((value, dict(labels or {})))
+
+    def increment_counter(
+        self,
+        name: str,
+        amount: float = 1.0,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record a counter increment.
+
+        Args:
+            name: Counter name.
+            amount: Increment.
+            labels: Optional label values.
+        """
+        key = (name, frozenset((labels or {}).items()))
+        self._counters[key] = self._counters.get(key, 0.0) + amount
+
     def clear_calls(self) -> None:
         """Clear the recorded calls list.
 
@@ -132,4 +295,11 @@ class FakeMetricsAdapter:
         self._health_status = None
         self._split_brain_detected = None
         self._leader_elected = None
+        self._local_txid = None
+        self._replication_lag = None
+        self._response_cache_stats = None
+        self._query_cache_stats = None
+        self._raft_timing = None
+        self._histograms.clear()
+        self._counters.clear()
         self._calls.clear()
@@ -0,0 +1,97 @@
+"""In-memory tracer for testing.
+
+Provides a TracerPort implementation that records every span, so tests
+can assert on span names, attributes and parent/child relationships.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+from litefs.adapters.ports import SpanAttributeValue
+from litefs.domain.tracing import TraceContext
+
+
+@dataclass
+class RecordedSpan:
+    """Span recorded by InMemoryTracer.
+
+    Attributes:
+        name: Span name.
+        context: Trace context of the span.
+        parent: Context of the parent span, or None for a root span.
+        attributes: Attributes set on the span.
+        ended: Whether end() was called.
+    """
+
+    name: str
+    context: TraceContext
+    parent: TraceContext | None = None
+    attributes: dict[str, SpanAttributeValue] = field(default_factory=dict)
+    ended: bool = False
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+    def end(self) -> None:
+        """Mark the span as ended."""
+        self.ended = True
+
+    def is_child_of(self, other: RecordedSpan) -> bool:
+        """Return whether this span's parent is the given span."""
+        return self.parent == other.context
+
+
+class InMemoryTracer:
+    """TracerPort implementation recording spans in memory.
+
+    Example:
+        >>> tracer = InMemoryTracer()
+        >>> tracer.start_span("litefs.forward").end()
+        >>> tracer.span_names()
+        ['litefs.forward']
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no recorded spans."""
+        self._spans: list[RecordedSpan] = []
+        self._lock = threading.Lock()
+
+    @property
+    def spans(self) -> list[RecordedSpan]:
+        """Return the spans in the order they were started."""
+        with self._lock:
+            return list(self._spans)
+
+    def start_span(
+        self,
+        name: str,
+        parent: TraceContext | None = None,
+        attributes: Mapping[str, SpanAttributeValue] | None = None,
+    ) -> RecordedSpan:
+        """Start and record a span in the parent's trace."""
+        span = RecordedSpan(
+            name=name,
+            context=TraceContext.generate(parent),
+            parent=parent,
+            attributes=dict(attributes or {}),
+        )
+        with self._lock:
+            self._spans.append(span)
+        return span
+
+    def span_names(self) -> list[str]:
+        """Return the names of the recorded spans in start order."""
+        return [span.name for span in self.spans]
+
+    def find(self, name: str) -> list[RecordedSpan]:
+        """Return the recorded spans with the given name."""
+        return [span for span in self.spans if span.name == name]
+
+    def clear(self) -> None:
+        """Discard all recorded spans."""
+        with self._lock:
+            self._spans.clear()
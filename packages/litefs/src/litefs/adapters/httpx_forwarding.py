@@ -11,6 +11,8 @@ from urllib.parse import urljoin, urlparse
 import httpx
 
 from litefs.adapters.ports import ForwardingPort, ForwardingResult
+from litefs.domain.tracing import TRACEPARENT_HEADER_NAME
+from litefs.usecases.tracing import current_trace_context
 
 if TYPE_CHECKING:
     from litefs.domain.settings import ForwardingSettings
@@ -21,6 +23,8 @@ class HTTPXForwardingAdapter:
 
     Uses httpx to make HTTP requests to the primary, preserving headers,
     body, and query parameters while adding appropriate X-Forwarded-* headers.
+    The current trace context, if any, replaces the incoming traceparent
+    header so that the primary's spans join the replica's trace.
 
     This adapter implements ForwardingPort for use by the forwarding middleware
     or use cases that need to redirect write requests to the primary.
@@ -60,7 +64,8 @@ class HTTPXForwardingAdapter:
         """Forward an HTTP request to the primary node.
 
         Preserves all headers except Host (rewritten to primary's host).
-        Adds X-Forwarded-For, X-Forwarded-Host, and X-Forwarded-Proto headers.
+        Adds X-Forwarded-For, X-Forwarded-Host, and X-Forwarded-Proto headers,
+        and a traceparent header inside a traced span.
 
         Args:
             primary_url: Base URL of the primary node (e.g., "http://primary:8080").
@@ -100,6 +105,9 @@ class HTTPXForwardingAdapter:
             "X-Forwarded-Proto", headers.get("x-forwarded-proto", "http")
         )
 
+        # Continue the current trace (if any) on the primary
+        trace_context = current_trace_context()
+
         # Build new headers
         new_headers: dict[str, str] = {}
         for key, value in headers.items():
@@ -107,6 +115,8 @@ class HTTPXForwardingAdapter:
             lower_key = key.lower()
             if lower_key in ("host", "content-length", "transfer-encoding"):
                 continue
+            if trace_context is not None and lower_key == TRACEPARENT_HEADER_NAME:
+                continue
             new_headers[key] = value
 
         # Set Host to primary
@@ -118,6 +128,8 @@ class HTTPXForwardingAdapter:
         if existing_forwarded_for:
             new_headers["X-Forwarded-For"] = existing_forwarded_for
         new_headers["X-Forwarded-Proto"] = original_proto
+        if trace_context is not None:
+            new_headers[TRACEPARENT_HEADER_NAME] = trace_context.to_traceparent()
 
         # Make the request
         if self._client is not None:
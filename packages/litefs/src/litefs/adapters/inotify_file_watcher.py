@@ -0,0 +1,135 @@
+"""inotify file watcher adapter.
+
+This module provides an adapter that implements FileWatcherPort using the
+Linux inotify API through ctypes, so no extra dependency is required. On
+other platforms, or when inotify is unavailable, create_file_watcher()
+returns None and callers fall back to polling.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# inotify event masks (see inotify(7))
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_WATCH_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+class InotifyFileWatcher:
+    """Adapter that waits for changes to a file using inotify.
+
+    Implements FileWatcherPort by watching the file's parent directory, so
+    the file may be created or atomically replaced after the watcher starts.
+    Events for other files in the directory are ignored.
+
+    Raises OSError on construction if inotify is not available.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Start watching a file.
+
+        Args:
+            path: File to watch. Its parent directory must exist.
+
+        Raises:
+            OSError: If inotify is unavailable or the directory cannot be
+                    watched.
+        """
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._name = os.fsencode(path.name)
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+        watch = libc.inotify_add_watch(
+            self._fd, os.fsencode(path.parent), ctypes.c_uint32(_WATCH_MASK)
+        )
+        if watch < 0:
+            errno = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(
+                errno, f"inotify_add_watch failed for {path.parent}: {os.strerror(errno)}"
+            )
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the file is written or replaced, or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if a change to the file was reported, False on timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            readable, _, _ = select.select([self._fd], [], [], remaining)
+            if readable and self._drain():
+                return True
+
+    def close(self) -> None:
+        """Stop watching and close the inotify descriptor."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _drain(self) -> bool:
+        """Read all pending events.
+
+        Returns:
+            True if any event concerns the watched file.
+        """
+        matched = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                return matched
+            offset = 0
+            while offset + _EVENT_HEADER.size <= len(data):
+                _, _, _, name_len = _EVENT_HEADER.unpack_from(data, offset)
+                start = offset + _EVENT_HEADER.size
+                name = data[start : start + name_len].rstrip(b"\0")
+                matched = matched or name == self._name
+                offset = start + name_len
+
+
+def create_file_watcher(path: Path) -> InotifyFileWatcher | None:
+    """Create an inotify watcher for a file if the platform supports it.
+
+    Args:
+        path: File to watch.
+
+    Returns:
+        The watcher, or None if inotify is unavailable and the caller
+        should poll instead.
+    """
+    try:
+        return InotifyFileWatcher(path)
+    except (OSError, AttributeError) as e:
+        # AttributeError: libc without inotify symbols
+        logger.debug(f"inotify unavailable for {path}, falling back to polling: {e}")
+        return None
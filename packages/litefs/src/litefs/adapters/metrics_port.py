@@ -6,6 +6,7 @@ buffer, sample, or drop metrics as needed. No exceptions should propagate.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Literal, Protocol, runtime_checkable
 
 
@@ -20,6 +21,9 @@ class MetricsPort(Protocol):
     Contract:
         - All methods are fire-and-forget (no return value, no exceptions)
         - set_* methods update gauges to specific values
+        - observe_histogram/increment_counter take metric names from
+          litefs.domain.metrics; a metric must always be emitted with the
+          same label names
         - Thread safety is implementation-defined
         - Implementations may no-op if metrics are disabled
     """
@@ -65,6 +69,86 @@ class MetricsPort(Protocol):
         """
         ...
 
+    def set_local_txid(self, txid: int) -> None:
+        """Set the local replication position gauge.
+
+        Args:
+            txid: TXID of the last transaction applied on this node.
+        """
+        ...
+
+    def set_replication_lag(self, txids: int, seconds: float | None) -> None:
+        """Set the replication lag gauges.
+
+        Args:
+            txids: Number of transactions this node trails the primary.
+            seconds: Estimated seconds behind the primary, or None if the
+                    estimate is unavailable.
+        """
+        ...
+
+    def set_response_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Set the response cache gauges.
+
+        Args:
+            hits: Total lookups served from the response cache.
+            misses: Total lookups not found in the response cache.
+            size_bytes: Memory currently held by cached responses.
+        """
+        ...
+
+    def set_query_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Set the query-result cache gauges.
+
+        Args:
+            hits: Total queries answered from the query-result cache.
+            misses: Total cacheable queries that had to be executed.
+            size_bytes: Memory currently held by cached query results.
+        """
+        ...
+
+    def set_raft_timing(
+        self, heartbeat_interval: float, election_timeout: float
+    ) -> None:
+        """Set the Raft timing gauges.
+
+        Args:
+            heartbeat_interval: Seconds between the leader's heartbeats.
+            election_timeout: Seconds without a heartbeat before this node
+                stands for election.
+        """
+        ...
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record an observation in a histogram.
+
+        Args:
+            name: Metric name without prefix (e.g. WRITE_GUARD_DURATION).
+            value: Observed value, in seconds for durations.
+            labels: Optional label values.
+        """
+        ...
+
+    def increment_counter(
+        self,
+        name: str,
+        amount: float = 1.0,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Metric name without prefix or _total suffix.
+            amount: Non-negative increment. Defaults to 1.
+            labels: Optional label values.
+        """
+        ...
+
 
 class NoOpMetricsAdapter:
     """No-operation metrics adapter for when metrics are disabled.
@@ -96,3 +180,36 @@ class NoOpMetricsAdapter:
     def set_leader_elected(self, is_elected: bool) -> None:
         """No-op."""
         pass
+
+    def set_local_txid(self, txid: int) -> None:
+        """No-op."""
+
+    def set_replication_lag(self, txids: int, seconds: float | None) -> None:
+        """No-op."""
+
+    def set_response_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """No-op."""
+
+    def set_query_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """No-op."""
+
+    def set_raft_timing(
+        self, heartbeat_interval: float, election_timeout: float
+    ) -> None:
+        """No-op."""
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """No-op."""
+
+    def increment_counter(
+        self,
+        name: str,
+        amount: float = 1.0,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """No-op."""
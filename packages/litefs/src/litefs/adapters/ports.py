@@ -8,14 +8,19 @@ from __future__ import annotations
 
 import os
 import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from litefs.domain.binary import BinaryLocation, BinaryMetadata, Platform
     from litefs.domain.events import FailoverEvent
     from litefs.domain.split_brain import RaftClusterState
+    from litefs.domain.tracing import TraceContext
+
+# Values accepted as span attributes
+SpanAttributeValue = str | int | float | bool
 
 
 @dataclass(frozen=True)
@@ -201,6 +206,202 @@ class RaftLeaderElectionPort(LeaderElectionPort, Protocol):
         ...
 
 
+class LeadershipTransferResult(Protocol):
+    """Outcome of a leadership transfer (see LeadershipTransferPort)."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether leadership moved to another node."""
+        ...
+
+    @property
+    def new_leader(self) -> str | None:
+        """Address of the leader when the transfer ended, if known."""
+        ...
+
+    @property
+    def duration(self) -> float:
+        """Seconds this node refused writes during the transfer."""
+        ...
+
+    @property
+    def reason(self) -> str | None:
+        """Why the transfer failed, None if it succeeded."""
+        ...
+
+
+@runtime_checkable
+class LeadershipTransferPort(Protocol):
+    """Port for leader elections able to hand leadership to a follower.
+
+    Optional capability of a LeaderElectionPort. Without it, stepping down
+    means waiting for followers to notice the leader is gone (an election
+    timeout of write unavailability); a transfer (Raft TimeoutNow) lets a
+    caught-up follower start its election immediately.
+
+    Contract:
+        - transfer_leadership() blocks until another node leads or gives up
+        - While it runs, is_leader_elected() returns False
+        - If no follower can take over, this node remains leader
+    """
+
+    def transfer_leadership(self) -> LeadershipTransferResult:
+        """Hand leadership to the most suitable follower.
+
+        Returns:
+            The outcome, including how long the handoff took.
+        """
+        ...
+
+
+class MembershipChangeResult(Protocol):
+    """Outcome of a membership change (see RaftMembershipPort)."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the change was committed."""
+        ...
+
+    @property
+    def members(self) -> tuple[str, ...]:
+        """Voting members known once the change ended."""
+        ...
+
+    @property
+    def reason(self) -> str | None:
+        """Why the change failed, None if it succeeded."""
+        ...
+
+
+@runtime_checkable
+class RaftMembershipPort(Protocol):
+    """Port for changing the voting members of a running Raft cluster.
+
+    Optional capability of a RaftLeaderElectionPort, also provided by
+    clients talking to a cluster node from another process. Members are
+    added or removed one at a time through the Raft log, so the cluster
+    keeps serving while it grows or shrinks.
+
+    Contract:
+        - add_member() and remove_member() block until the change commits
+          or fails
+        - Only one change is in progress at a time
+        - get_cluster_members() returns the live member list
+    """
+
+    def get_cluster_members(self) -> list[str]:
+        """Get the voting members of the cluster.
+
+        Returns:
+            Member addresses in "host:port" format.
+        """
+        ...
+
+    def add_member(self, address: str) -> MembershipChangeResult:
+        """Add a voting member.
+
+        Args:
+            address: Address of the new member in "host:port" format.
+
+        Returns:
+            The outcome of the change.
+        """
+        ...
+
+    def remove_member(self, address: str) -> MembershipChangeResult:
+        """Remove a voting member.
+
+        Args:
+            address: Address of the member in "host:port" format.
+
+        Returns:
+            The outcome of the change.
+        """
+        ...
+
+
+@runtime_checkable
+class FencingEpochPort(Protocol):
+    """Port for leader elections exposing a fencing epoch.
+
+    Optional capability of a LeaderElectionPort. The epoch identifies one
+    leadership: it increases with every election, so a primary deposed
+    during a partition can tell that writes started under its epoch must
+    be rejected.
+
+    Contract:
+        - get_leader_epoch() is a local, constant-time read
+        - It returns None while this node is not the elected leader
+        - Epochs only increase across successive leaders
+    """
+
+    def get_leader_epoch(self) -> int | None:
+        """Get the epoch of this node's current leadership.
+
+        Returns:
+            The epoch, or None if this node is not the leader.
+        """
+        ...
+
+
+@runtime_checkable
+class ClusterMetadataPort(Protocol):
+    """Port for leader elections replicating cluster metadata.
+
+    Optional capability of a RaftLeaderElectionPort. The metadata is
+    replicated through the Raft log, so every node reads it locally
+    without querying its peers.
+
+    Contract:
+        - get_cluster_metadata() makes no network calls
+        - "leader" is the leader's "host:port" address
+        - "epoch" is the term the leader was elected in; it only increases
+        - "forwarding_url" is the full URL the leader accepts forwarded
+          writes on, if it published one
+        - "leader" and "forwarding_url" are absent while this node has not
+          yet received the entry of the current leader
+    """
+
+    def get_cluster_metadata(self) -> Mapping[str, Any]:
+        """Get the replicated cluster metadata.
+
+        Returns:
+            The metadata; empty if none has been replicated yet.
+        """
+        ...
+
+
+@runtime_checkable
+class RaftTimingPort(Protocol):
+    """Port for leader elections reporting their Raft timing.
+
+    Optional capability of a RaftLeaderElectionPort. The leader measures
+    the round trip of each heartbeat; with adaptive timeouts, the heartbeat
+    interval and election timeout follow the measured delays.
+
+    Contract:
+        - Listeners run on the Raft thread and must return quickly
+        - Round trips are reported only while this node leads
+        - Timing listeners are called only when a value changes
+    """
+
+    def get_heartbeat_interval(self) -> float:
+        """Get the heartbeat interval in use, in seconds."""
+        ...
+
+    def get_election_timeout(self) -> float:
+        """Get the election timeout in use, in seconds."""
+        ...
+
+    def add_rtt_listener(self, callback: Callable[[str, float], None]) -> None:
+        """Call callback(peer, seconds) for each heartbeat round trip."""
+        ...
+
+    def add_timing_listener(self, callback: Callable[[float, float], None]) -> None:
+        """Call callback(heartbeat_interval, election_timeout) on change."""
+        ...
+
+
 @runtime_checkable
 class SplitBrainDetectorPort(Protocol):
     """Port interface for split-brain detection.
@@ -281,6 +482,109 @@ class LoggingPort(Protocol):
         ...
 
 
+@runtime_checkable
+class TraceSpanPort(Protocol):
+    """Port interface for a span started by a TracerPort.
+
+    Contract:
+        - context is the span's own trace context, propagated to the
+          primary when a request is forwarded while the span is current
+        - set_attribute() and end() are fire-and-forget
+        - end() is called exactly once
+    """
+
+    @property
+    def context(self) -> TraceContext | None:
+        """Trace context of the span, or None if it is not traced."""
+        ...
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        """Set an attribute of the span.
+
+        Args:
+            key: Attribute name, e.g. "litefs.decision".
+            value: Attribute value.
+        """
+        ...
+
+    def end(self) -> None:
+        """End the span."""
+        ...
+
+
+@runtime_checkable
+class TracerPort(Protocol):
+    """Port interface for tracing hooks.
+
+    Implementations bridge LiteFS spans to a tracing backend (e.g. an
+    OpenTelemetry tracer). Span names are defined in litefs.domain.tracing.
+
+    Contract:
+        - start_span() returns a started span, which the caller ends
+        - A span with a parent context must belong to the parent's trace
+        - No exceptions are propagated
+        - Must be safe to call from several threads
+    """
+
+    def start_span(
+        self,
+        name: str,
+        parent: TraceContext | None = None,
+        attributes: Mapping[str, SpanAttributeValue] | None = None,
+    ) -> TraceSpanPort:
+        """Start a span.
+
+        Args:
+            name: Span name.
+            parent: Context of the parent span, or None to start a trace.
+            attributes: Initial span attributes.
+
+        Returns:
+            The started span.
+        """
+        ...
+
+
+class NoOpTraceSpan:
+    """Span of NoOpTracer: records nothing and keeps the parent's context."""
+
+    def __init__(self, context: TraceContext | None = None) -> None:
+        """Initialize the span.
+
+        Args:
+            context: Context of the parent span, propagated unchanged.
+        """
+        self._context = context
+
+    @property
+    def context(self) -> TraceContext | None:
+        """Trace context of the parent span."""
+        return self._context
+
+    def set_attribute(self, key: str, value: SpanAttributeValue) -> None:
+        """Ignore the attribute."""
+
+    def end(self) -> None:
+        """Do nothing."""
+
+
+class NoOpTracer:
+    """Default implementation: records no spans.
+
+    Spans keep their parent's context, so an incoming traceparent is still
+    propagated to the primary unchanged.
+    """
+
+    def start_span(
+        self,
+        name: str,
+        parent: TraceContext | None = None,
+        attributes: Mapping[str, SpanAttributeValue] | None = None,
+    ) -> NoOpTraceSpan:
+        """Return a span that records nothing."""
+        return NoOpTraceSpan(parent)
+
+
 class EnvironmentNodeIDResolver:
     """Default implementation: resolve node ID from LITEFS_NODE_ID environment variable.
 
@@ -320,6 +624,8 @@ class ForwardingPort(Protocol):
         - forward_request() sends request to primary and returns response
         - All headers except Host should be preserved
         - X-Forwarded-* headers should be added
+        - The current trace context (litefs.usecases.tracing) should be
+          sent in a traceparent header
         - May raise exceptions for network errors
     """
 
@@ -392,6 +698,49 @@ class RealTimeProvider:
         return time.time()
 
 
+class Sleeper(Protocol):
+    """Port interface for sleep operations.
+
+    Enables testing of waits, retries and backoff without real delays.
+    """
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for the specified number of seconds."""
+        ...
+
+
+class RealSleeper:
+    """Default implementation: sleeps using time.sleep."""
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep for the specified number of seconds."""
+        time.sleep(seconds)
+
+
+class FileWatcherPort(Protocol):
+    """Port interface for waiting on changes to a file.
+
+    Notifications are only a hint to check the file sooner: callers must
+    still re-read the file after a timeout, since some filesystems (such
+    as FUSE mounts updated by their daemon) do not report every change.
+    """
+
+    def wait(self, timeout: float) -> bool:
+        """Block until the file may have changed or the timeout expires.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if a change was reported, False on timeout.
+        """
+        ...
+
+    def close(self) -> None:
+        """Release the resources held by the watcher."""
+        ...
+
+
 @runtime_checkable
 class BinaryDownloaderPort(Protocol):
     """Port interface for downloading LiteFS binary from remote URL.
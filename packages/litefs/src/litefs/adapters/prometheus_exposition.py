@@ -0,0 +1,133 @@
+"""Prometheus text exposition for the /metrics endpoints.
+
+Renders the metrics recorded by PrometheusMetricsAdapter. In a single
+process the default registry is rendered. Under a multiprocess server
+(PROMETHEUS_MULTIPROC_DIR set for every worker), the values written by all
+workers are aggregated, so a scrape sees the whole server whichever worker
+answers it.
+
+Aggregation reads every worker's files, so the rendered output is reused
+for a short TTL. Multiprocess deployments must also discard the files of
+exited workers, e.g. in gunicorn.conf.py:
+
+    from litefs.adapters.prometheus_exposition import mark_process_dead
+
+    def child_exit(server, worker):
+        mark_process_dead(worker.pid)
+
+Requires prometheus-client (raises ImportError at init if missing).
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from prometheus_client import CollectorRegistry
+
+# Environment variable enabling prometheus-client's multiprocess mode
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+class PrometheusExposition:
+    """Renders metrics in the Prometheus text format, with a short cache.
+
+    Thread safety:
+        Safe to share between threads; concurrent scrapes after the TTL
+        expired trigger a single re-render.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 1.0,
+        multiprocess_dir: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the exposition.
+
+        Args:
+            ttl: Seconds a rendered output is reused. 0 renders every call.
+            multiprocess_dir: Directory holding the workers' metric files.
+                             Defaults to $PROMETHEUS_MULTIPROC_DIR; when
+                             neither is set, the default registry of this
+                             process is rendered.
+            clock: Monotonic clock, injectable for tests.
+
+        Raises:
+            ImportError: If prometheus-client is not installed.
+        """
+        from prometheus_client import CONTENT_TYPE_LATEST
+
+        self._ttl = ttl
+        self._multiprocess_dir = multiprocess_dir or os.environ.get(MULTIPROC_DIR_ENV)
+        self._clock = clock
+        self._content_type = CONTENT_TYPE_LATEST
+        self._registry: CollectorRegistry | None = None
+        self._output: bytes | None = None
+        self._rendered_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type of the rendered output."""
+        return self._content_type
+
+    @property
+    def is_multiprocess(self) -> bool:
+        """Whether values are aggregated across worker processes."""
+        return self._multiprocess_dir is not None
+
+    def render(self) -> bytes:
+        """Return the exposition, re-rendering it once the TTL expired.
+
+        Returns:
+            Metrics in the Prometheus text format.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._output is None or now - self._rendered_at >= self._ttl:
+                from prometheus_client import generate_latest
+
+                self._output = generate_latest(self._get_registry())
+                self._rendered_at = now
+            return self._output
+
+    def _get_registry(self) -> CollectorRegistry:
+        """Return the registry to render, built on first use."""
+        if self._registry is None:
+            from prometheus_client import REGISTRY, CollectorRegistry
+
+            if self._multiprocess_dir is None:
+                self._registry = REGISTRY
+            else:
+                from prometheus_client.multiprocess import MultiProcessCollector
+
+                registry = CollectorRegistry()
+                MultiProcessCollector(registry, path=self._multiprocess_dir)
+                self._registry = registry
+        return self._registry
+
+
+def mark_process_dead(pid: int, multiprocess_dir: str | None = None) -> None:
+    """Discard the live gauge values of an exited worker.
+
+    Call from the server's worker exit hook (gunicorn's child_exit) so that
+    live gauges only aggregate running workers. Does nothing outside
+    multiprocess mode.
+
+    Args:
+        pid: Process ID of the exited worker.
+        multiprocess_dir: Directory holding the metric files. Defaults to
+                         $PROMETHEUS_MULTIPROC_DIR.
+    """
+    path = multiprocess_dir or os.environ.get(MULTIPROC_DIR_ENV)
+    if path is None:
+        return
+
+    from prometheus_client.multiprocess import mark_process_dead as _mark_dead
+
+    _mark_dead(pid, path)
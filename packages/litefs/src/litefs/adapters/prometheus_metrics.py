@@ -6,10 +6,18 @@ Gracefully handles missing prometheus-client (raises ImportError at init).
 
 from __future__ import annotations
 
+import threading
+from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, Literal
 
+from litefs.domain.metrics import (
+    DEFAULT_BUCKETS_KEY,
+    DEFAULT_HISTOGRAM_BUCKETS,
+    METRIC_DESCRIPTIONS,
+)
+
 if TYPE_CHECKING:
-    from prometheus_client import Gauge
+    from prometheus_client import Counter, Gauge, Histogram
 
 
 class PrometheusMetricsAdapter:
@@ -18,6 +26,21 @@ class PrometheusMetricsAdapter:
     Creates and manages Prometheus gauges for LiteFS state metrics.
     All gauges use a configurable prefix (default 'litefs_') for namespace clarity.
 
+    Histograms and counters are registered on first use, with the label
+    names of that first observation.
+
+    Multiprocess servers (gunicorn, uWSGI) are supported through
+    prometheus-client's multiprocess mode: when PROMETHEUS_MULTIPROC_DIR is
+    set before prometheus-client is imported, each worker writes its values
+    to mmap-backed files in that directory, and PrometheusExposition
+    aggregates them. Counters and histograms are summed across workers;
+    gauges use the mode matching what they measure:
+        - node state, health, split-brain, leader: max over live workers
+        - TXID, replication lag and Raft timing: most recent value of
+          live workers
+        - cache hits, misses and bytes: sum over live workers
+        - cache hit ratios: one series per live worker (pid label)
+
     This adapter requires prometheus-client to be installed:
         pip install litefs-py[metrics]
 
@@ -30,12 +53,19 @@ class PrometheusMetricsAdapter:
         ImportError: If prometheus-client is not installed.
     """
 
-    def __init__(self, prefix: str = "litefs") -> None:
+    def __init__(
+        self,
+        prefix: str = "litefs",
+        histogram_buckets: Mapping[str, Sequence[float]] | None = None,
+    ) -> None:
         """Initialize Prometheus gauges.
 
         Args:
             prefix: Metric name prefix. Defaults to "litefs".
                    All gauge names will be {prefix}_<metric_name>.
+            histogram_buckets: Bucket upper bounds by histogram name. The
+                              "default" key applies to histograms not listed.
+                              Defaults to DEFAULT_HISTOGRAM_BUCKETS.
 
         Raises:
             ImportError: If prometheus-client is not installed.
@@ -43,21 +73,96 @@ class PrometheusMetricsAdapter:
         # Import here to make prometheus-client optional
         from prometheus_client import Gauge
 
+        self._prefix = prefix
+        self._histogram_buckets = dict(histogram_buckets or {})
+        self._histograms: dict[str, Histogram] = {}
+        self._counters: dict[str, Counter] = {}
+        self._collectors_lock = threading.Lock()
+
         self._node_state: Gauge = Gauge(
             f"{prefix}_node_state",
             "Current node state: 1=PRIMARY, 0=REPLICA",
+            multiprocess_mode="livemax",
         )
         self._health_status: Gauge = Gauge(
             f"{prefix}_health_status",
             "Health status: 1.0=healthy, 0.5=degraded, 0.0=unhealthy",
+            multiprocess_mode="livemax",
         )
         self._split_brain_detected: Gauge = Gauge(
             f"{prefix}_split_brain_detected",
             "Split-brain detected: 1=yes, 0=no",
+            multiprocess_mode="livemax",
         )
         self._leader_elected: Gauge = Gauge(
             f"{prefix}_is_leader_elected",
             "Leader election status: 1=elected, 0=not elected",
+            multiprocess_mode="livemax",
+        )
+        self._local_txid: Gauge = Gauge(
+            f"{prefix}_local_txid",
+            "TXID of the last transaction applied on this node",
+            multiprocess_mode="livemostrecent",
+        )
+        self._replication_lag_txids: Gauge = Gauge(
+            f"{prefix}_replication_lag_txids",
+            "Number of transactions this node trails the primary",
+            multiprocess_mode="livemostrecent",
+        )
+        self._replication_lag_seconds: Gauge = Gauge(
+            f"{prefix}_replication_lag_seconds",
+            "Estimated seconds this node trails the primary (NaN if unknown)",
+            multiprocess_mode="livemostrecent",
+        )
+        self._raft_heartbeat_interval: Gauge = Gauge(
+            f"{prefix}_raft_heartbeat_interval_seconds",
+            "Seconds between the Raft leader's heartbeats",
+            multiprocess_mode="livemostrecent",
+        )
+        self._raft_election_timeout: Gauge = Gauge(
+            f"{prefix}_raft_election_timeout_seconds",
+            "Seconds without a heartbeat before this node stands for election",
+            multiprocess_mode="livemostrecent",
+        )
+        self._response_cache_hits: Gauge = Gauge(
+            f"{prefix}_response_cache_hits",
+            "Total lookups served from the TXID response cache",
+            multiprocess_mode="livesum",
+        )
+        self._response_cache_misses: Gauge = Gauge(
+            f"{prefix}_response_cache_misses",
+            "Total lookups not found in the TXID response cache",
+            multiprocess_mode="livesum",
+        )
+        self._response_cache_hit_ratio: Gauge = Gauge(
+            f"{prefix}_response_cache_hit_ratio",
+            "Fraction of response cache lookups that were hits (NaN if none)",
+            multiprocess_mode="liveall",
+        )
+        self._response_cache_bytes: Gauge = Gauge(
+            f"{prefix}_response_cache_bytes",
+            "Memory held by cached responses in bytes",
+            multiprocess_mode="livesum",
+        )
+        self._query_cache_hits: Gauge = Gauge(
+            f"{prefix}_query_cache_hits",
+            "Total queries answered from the query-result cache",
+            multiprocess_mode="livesum",
+        )
+        self._query_cache_misses: Gauge = Gauge(
+            f"{prefix}_query_cache_misses",
+            "Total cacheable queries executed against the database",
+            multiprocess_mode="livesum",
+        )
+        self._query_cache_hit_ratio: Gauge = Gauge(
+            f"{prefix}_query_cache_hit_ratio",
+            "Fraction of cacheable queries answered from cache (NaN if none)",
+            multiprocess_mode="liveall",
+        )
+        self._query_cache_bytes: Gauge = Gauge(
+            f"{prefix}_query_cache_bytes",
+            "Memory held by cached query results in bytes",
+            multiprocess_mode="livesum",
         )
 
     def set_node_state(self, is_primary: bool) -> None:
@@ -102,3 +207,149 @@ class PrometheusMetricsAdapter:
             is_elected: True if elected (1), False otherwise (0).
         """
         self._leader_elected.set(1 if is_elected else 0)
+
+    def set_local_txid(self, txid: int) -> None:
+        """Set local TXID gauge.
+
+        Args:
+            txid: TXID of the last transaction applied on this node.
+        """
+        self._local_txid.set(txid)
+
+    def set_replication_lag(self, txids: int, seconds: float | None) -> None:
+        """Set replication lag gauges.
+
+        Args:
+            txids: Number of transactions behind the primary.
+            seconds: Estimated seconds behind, or None (exported as NaN).
+        """
+        self._replication_lag_txids.set(txids)
+        self._replication_lag_seconds.set(
+            seconds if seconds is not None else float("nan")
+        )
+
+    def set_response_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Set response cache gauges.
+
+        Args:
+            hits: Total cache hits.
+            misses: Total cache misses.
+            size_bytes: Memory held by cached responses.
+        """
+        lookups = hits + misses
+        self._response_cache_hits.set(hits)
+        self._response_cache_misses.set(misses)
+        self._response_cache_hit_ratio.set(
+            hits / lookups if lookups else float("nan")
+        )
+        self._response_cache_bytes.set(size_bytes)
+
+    def set_query_cache_stats(self, hits: int, misses: int, size_bytes: int) -> None:
+        """Set query-result cache gauges.
+
+        Args:
+            hits: Total cache hits.
+            misses: Total cache misses.
+            size_bytes: Memory held by cached query results.
+        """
+        lookups = hits + misses
+        self._query_cache_hits.set(hits)
+        self._query_cache_misses.set(misses)
+        self._query_cache_hit_ratio.set(hits / lookups if lookups else float("nan"))
+        self._query_cache_bytes.set(size_bytes)
+
+    def set_raft_timing(
+        self, heartbeat_interval: float, election_timeout: float
+    ) -> None:
+        """Set Raft timing gauges.
+
+        Args:
+            heartbeat_interval: Seconds between heartbeats.
+            election_timeout: Seconds before standing for election.
+        """
+        self._raft_heartbeat_interval.set(heartbeat_interval)
+        self._raft_election_timeout.set(election_timeout)
+
+    def observe_histogram(
+        self,
+        name: str,
+        value: float,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record an observation in a histogram.
+
+        Args:
+            name: Histogram name without prefix.
+            value: Observed value.
+            labels: Optional label values.
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._get_or_create_histogram(name, labels)
+        if labels:
+            histogram.labels(**labels).observe(value)
+        else:
+            histogram.observe(value)
+
+    def increment_counter(
+        self,
+        name: str,
+        amount: float = 1.0,
+        labels: Mapping[str, str] | None = None,
+    ) -> None:
+        """Increment a counter.
+
+        Args:
+            name: Counter name without prefix or _total suffix.
+            amount: Non-negative increment.
+            labels: Optional label values.
+        """
+        counter = self._counters.get(name)
+        if counter is None:
+            counter = self._get_or_create_counter(name, labels)
+        if labels:
+            counter.labels(**labels).inc(amount)
+        else:
+            counter.inc(amount)
+
+    def get_histogram_buckets(self, name: str) -> tuple[float, ...]:
+        """Return the bucket upper bounds used for a histogram.
+
+        Args:
+            name: Histogram name without prefix.
+        """
+        buckets = self._histogram_buckets.get(
+            name, self._histogram_buckets.get(DEFAULT_BUCKETS_KEY)
+        )
+        return tuple(buckets) if buckets else DEFAULT_HISTOGRAM_BUCKETS
+
+    def _get_or_create_histogram(
+        self, name: str, labels: Mapping[str, str] | None
+    ) -> Histogram:
+        """Register a histogram on first use."""
+        from prometheus_client import Histogram
+
+        with self._collectors_lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(
+                    f"{self._prefix}_{name}",
+                    METRIC_DESCRIPTIONS.get(name, name),
+                    labelnames=sorted(labels or ()),
+                    buckets=self.get_histogram_buckets(name),
+                )
+            return self._histograms[name]
+
+    def _get_or_create_counter(
+        self, name: str, labels: Mapping[str, str] | None
+    ) -> Counter:
+        """Register a counter on first use."""
+        from prometheus_client import Counter
+
+        with self._collectors_lock:
+            if name not in self._counters:
+                self._counters[name] = Counter(
+                    f"{self._prefix}_{name}",
+                    METRIC_DESCRIPTIONS.get(name, name),
+                    labelnames=sorted(labels or ()),
+                )
+            return self._counters[name]
@@ -2,15 +2,22 @@
 
 This adapter queries all nodes in a Raft cluster to determine their leadership
 status, enabling split-brain detection. For this node, it uses the local
-RaftLeaderElectionPort. For other nodes, it makes HTTP requests to their
-health endpoints.
+RaftLeaderElectionPort. For other nodes, it reads the leader from the
+replicated cluster metadata when available, and otherwise makes HTTP requests
+to their health endpoints.
 """
 
 from __future__ import annotations
 
+import time
+
 import httpx
 
-from litefs.adapters.ports import RaftLeaderElectionPort, SplitBrainDetectorPort
+from litefs.adapters.ports import (
+    ClusterMetadataPort,
+    RaftLeaderElectionPort,
+    SplitBrainDetectorPort,
+)
 from litefs.domain.split_brain import RaftClusterState, RaftNodeState
 
 
@@ -20,10 +27,26 @@ class SplitBrainDetectorAdapter:
     Queries all nodes in the cluster to determine their leadership status.
     For the local node, uses the RaftLeaderElectionPort directly.
     For remote nodes, makes HTTP requests to their health endpoints.
+    The members are read from the election on every call, so members added
+    or removed at runtime are followed without reconfiguration.
 
     The health endpoint must return JSON with at minimum:
         {"is_leader": bool}
 
+    The Django and FastAPI adapters serve it at /health/position.
+
+    If the response also contains a "txid" integer, it is recorded as the
+    node's replication position so replicas can compute their lag against
+    the leader. Each remote state records whether the node answered and
+    the round-trip time of the query.
+
+    With cluster metadata, remote states are derived from the leader
+    recorded in it, without network calls: the recorded leader is the only
+    remote leader. A stale local leader still shows up as a second leader.
+    These states carry no TXID, so callers needing the leader's position
+    should not pass metadata. Nodes are queried over HTTP while the
+    metadata has no current leader.
+
     This adapter implements SplitBrainDetectorPort for use by the
     SplitBrainDetector use case.
     """
@@ -33,11 +56,12 @@ class SplitBrainDetectorAdapter:
         raft_election: RaftLeaderElectionPort,
         this_node_id: str,
         *,
-        health_endpoint_path: str = "/health/status",
+        health_endpoint_path: str = "/health/position",
         health_endpoint_port: int = 8080,
         connect_timeout: float = 2.0,
         read_timeout: float = 5.0,
         client: httpx.Client | None = None,
+        cluster_metadata: ClusterMetadataPort | None = None,
     ) -> None:
         """Initialize the split-brain detector adapter.
 
@@ -46,12 +70,15 @@ class SplitBrainDetectorAdapter:
                           getting cluster members.
             this_node_id: ID of this node (hostname part of cluster member).
             health_endpoint_path: URL path for health endpoint. Defaults to
-                                 "/health/status".
+                                 "/health/position".
             health_endpoint_port: Port for health endpoint HTTP server.
                                  Defaults to 8080.
             connect_timeout: Connection timeout in seconds. Defaults to 2.0.
             read_timeout: Read timeout in seconds. Defaults to 5.0.
             client: Optional httpx.Client for dependency injection (testing).
+            cluster_metadata: Optional replicated cluster metadata to read
+                             remote leadership from instead of querying
+                             the nodes.
         """
         self._raft_election = raft_election
         self._this_node_id = this_node_id
@@ -64,11 +91,12 @@ class SplitBrainDetectorAdapter:
             pool=connect_timeout,
         )
         self._client = client
+        self._cluster_metadata = cluster_metadata
 
     def get_cluster_state(self) -> RaftClusterState:
         """Get the current state of all nodes in the cluster.
 
-        Queries each cluster member for their leadership status.
+        Queries each current cluster member for their leadership status.
         For this node, uses local Raft state directly.
         For other nodes, makes HTTP requests to their health endpoints.
 
@@ -82,21 +110,42 @@ class SplitBrainDetectorAdapter:
         """
         cluster_members = self._raft_election.get_cluster_members()
         node_states: list[RaftNodeState] = []
+        leader = self._metadata_leader()
 
         for member in cluster_members:
             node_id = self._extract_node_id(member)
 
             if node_id == self._this_node_id:
                 # Use local Raft state for this node
-                is_leader = self._raft_election.is_leader_elected()
+                node_states.append(
+                    RaftNodeState(
+                        node_id=node_id,
+                        is_leader=self._raft_election.is_leader_elected(),
+                    )
+                )
+            elif leader is not None:
+                # Replicated metadata names the current leader
+                node_states.append(
+                    RaftNodeState(node_id=node_id, is_leader=member == leader)
+                )
             else:
                 # Query remote node's health endpoint
-                is_leader = self._query_remote_node_leadership(member)
-
-            node_states.append(RaftNodeState(node_id=node_id, is_leader=is_leader))
+                node_states.append(self._query_remote_node_state(member))
 
         return RaftClusterState(nodes=node_states)
 
+    def _metadata_leader(self) -> str | None:
+        """Get the current leader recorded in the cluster metadata.
+
+        Returns:
+            The leader's "host:port" address, or None if no metadata is
+            configured or it has no current leader.
+        """
+        if self._cluster_metadata is None:
+            return None
+        leader = self._cluster_metadata.get_cluster_metadata().get("leader")
+        return leader if isinstance(leader, str) and leader else None
+
     def _extract_node_id(self, member: str) -> str:
         """Extract node ID (hostname) from cluster member address.
 
@@ -108,21 +157,23 @@ class SplitBrainDetectorAdapter:
         """
         return member.split(":")[0]
 
-    def _query_remote_node_leadership(self, member: str) -> bool:
-        """Query a remote node's health endpoint to determine leadership.
+    def _query_remote_node_state(self, member: str) -> RaftNodeState:
+        """Query a remote node's health endpoint for leadership and position.
 
         Args:
             member: Cluster member in "host:port" format.
 
         Returns:
-            True if the node claims to be leader, False otherwise.
-            Returns False if the node is unreachable or returns invalid data.
+            The node's state. It is a non-leader without TXID, marked
+            unreachable, if the node is unreachable or returns invalid data.
+            txid is None if the node does not report a replication position.
         """
         node_id = self._extract_node_id(member)
         url = (
             f"http://{node_id}:{self._health_endpoint_port}{self._health_endpoint_path}"
         )
 
+        started = time.perf_counter()
         try:
             if self._client is not None:
                 response = self._client.get(url, timeout=self._timeout)
@@ -132,13 +183,22 @@ class SplitBrainDetectorAdapter:
 
             if response.status_code == 200:
                 data = response.json()
-                return bool(data.get("is_leader", False))
+                is_leader = bool(data.get("is_leader", False))
+                txid = data.get("txid")
+                if not isinstance(txid, int) or isinstance(txid, bool) or txid < 0:
+                    txid = None
+                return RaftNodeState(
+                    node_id=node_id,
+                    is_leader=is_leader,
+                    txid=txid,
+                    latency_seconds=time.perf_counter() - started,
+                )
 
         except (httpx.RequestError, httpx.HTTPStatusError, ValueError, KeyError):
             # Network error, HTTP error, or invalid JSON - assume not leader
             pass
 
-        return False
+        return RaftNodeState(node_id=node_id, is_leader=False, reachable=False)
 
 
 # Runtime protocol check
@@ -2,7 +2,8 @@
 
 from litefs.domain.settings import LiteFSSettings, StaticLeaderConfig
 from litefs.domain.exceptions import LiteFSConfigError
-from litefs.domain.health import HealthStatus
+from litefs.domain.health import HealthStatus, ProbeResult, ProbeThresholds
+from litefs.domain.replication import ReplicationLag, ReplicationPosition
 from litefs.domain.split_brain import RaftNodeState, RaftClusterState
 
 __all__ = [
@@ -10,6 +11,10 @@ __all__ = [
     "StaticLeaderConfig",
     "LiteFSConfigError",
     "HealthStatus",
+    "ProbeResult",
+    "ProbeThresholds",
+    "ReplicationLag",
+    "ReplicationPosition",
     "RaftNodeState",
     "RaftClusterState",
 ]
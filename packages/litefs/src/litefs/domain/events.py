@@ -42,3 +42,39 @@ class FailoverEvent:
 
     event_type: FailoverEventType
     reason: str | None = None
+
+
+@dataclass(frozen=True)
+class ReplicationChangeEvent:
+    """Immutable event representing transactions applied to the local database.
+
+    Value object published by ChangeBus when the local replication position
+    moves. A single event may cover many transactions when changes arrive
+    in bursts.
+
+    Attributes:
+        old_txid: TXID before the change, or None if the database did not
+                 exist yet.
+        new_txid: TXID after the change. Lower than old_txid if the database
+                 was restored from an older snapshot.
+        timestamp: Time the change was observed, in seconds since the epoch.
+    """
+
+    old_txid: int | None
+    new_txid: int
+    timestamp: float
+
+    def merge(self, later: ReplicationChangeEvent) -> ReplicationChangeEvent:
+        """Combine this event with a later one into a single event.
+
+        Args:
+            later: Event observed after this one.
+
+        Returns:
+            Event spanning from this event's old TXID to the later new TXID.
+        """
+        return ReplicationChangeEvent(
+            old_txid=self.old_txid,
+            new_txid=later.new_txid,
+            timestamp=later.timestamp,
+        )
@@ -0,0 +1,31 @@
+"""Leader epoch fencing domain values.
+
+Every election gives the new leader a higher epoch (the Raft term it was
+elected in). Writes tagged with an epoch can therefore be rejected by a
+primary that no longer leads under it, without querying the cluster.
+
+Replicas forwarding a write to the primary send the epoch of the leader
+they know of in a request header.
+"""
+
+from __future__ import annotations
+
+# Request header carrying the leader epoch known to the forwarding replica
+EPOCH_HEADER_NAME = "X-LiteFS-Epoch"
+
+
+def parse_epoch(value: str | None) -> int | None:
+    """Parse an epoch header value.
+
+    Args:
+        value: Header value, a non-negative decimal integer.
+
+    Returns:
+        The epoch, or None if the value is missing or malformed.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if not value.isascii() or not value.isdigit():
+        return None
+    return int(value)
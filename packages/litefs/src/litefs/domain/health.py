@@ -1,9 +1,10 @@
-"""Health status domain value object."""
+"""Health status domain value objects."""
 
 from dataclasses import dataclass
 from typing import Literal
 
 from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationLag
 
 
 @dataclass(frozen=True)
@@ -73,6 +74,7 @@ class ReadinessResult:
         split_brain_detected: True if multiple leaders are detected.
         leader_node_ids: Tuple of node IDs claiming leadership.
         error: Optional error message if the node is not ready.
+        replication_lag: Replication lag of this node, or None if not tracked.
     """
 
     is_ready: bool
@@ -81,3 +83,102 @@ class ReadinessResult:
     split_brain_detected: bool
     leader_node_ids: tuple[str, ...]
     error: str | None = None
+    replication_lag: ReplicationLag | None = None
+
+
+# Health states ordered from best to worst
+HEALTH_STATES: tuple[str, ...] = ("healthy", "degraded", "unhealthy")
+
+# Names of the active health probes (see litefs.usecases.health_probes)
+FUSE_READ_LATENCY = "fuse_read_latency"
+QUERY_LATENCY = "query_latency"
+WAL_SIZE = "wal_size"
+FREE_DISK = "free_disk"
+REPLICATION_LAG = "replication_lag"
+EVENT_LOOP_LAG = "event_loop_lag"
+EXECUTOR_DELAY = "executor_delay"
+
+
+@dataclass(frozen=True)
+class ProbeThresholds:
+    """Thresholds classifying the value measured by a health probe.
+
+    A value beyond the degraded threshold is a degraded sample, beyond the
+    unhealthy threshold an unhealthy one. "Beyond" means above, or below
+    when higher_is_worse is False (e.g. free disk space).
+
+    This is a domain value object with zero external dependencies.
+
+    Attributes:
+        degraded: Threshold of a degraded sample, or None to never degrade.
+        unhealthy: Threshold of an unhealthy sample, or None to never be
+                  unhealthy.
+        higher_is_worse: Whether larger values are worse. Defaults to True.
+    """
+
+    degraded: float | None = None
+    unhealthy: float | None = None
+    higher_is_worse: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate threshold ordering."""
+        self._validate_order()
+
+    def _validate_order(self) -> None:
+        """Validate that the unhealthy threshold is beyond the degraded one."""
+        if self.degraded is None or self.unhealthy is None:
+            return
+        if self.higher_is_worse and self.unhealthy < self.degraded:
+            raise LiteFSConfigError(
+                "unhealthy threshold must be at least the degraded threshold"
+            )
+        if not self.higher_is_worse and self.unhealthy > self.degraded:
+            raise LiteFSConfigError(
+                "unhealthy threshold must be at most the degraded threshold"
+            )
+
+    def classify(self, value: float) -> Literal["healthy", "unhealthy", "degraded"]:
+        """Classify a measured value.
+
+        Args:
+            value: Value measured by the probe.
+
+        Returns:
+            The health state of the sample.
+        """
+        if self._breaches(value, self.unhealthy):
+            return "unhealthy"
+        if self._breaches(value, self.degraded):
+            return "degraded"
+        return "healthy"
+
+    def _breaches(self, value: float, threshold: float | None) -> bool:
+        """Check whether a value is beyond a threshold."""
+        if threshold is None:
+            return False
+        return value > threshold if self.higher_is_worse else value < threshold
+
+
+@dataclass(frozen=True)
+class ProbeResult:
+    """Latest outcome of an active health probe.
+
+    This is a domain value object with zero external dependencies.
+
+    Attributes:
+        name: Probe name.
+        state: Health state of the probe after hysteresis.
+        value: Last measured value, or None if the last run measured
+              nothing (e.g. the database does not exist yet) or failed.
+        sample_state: State of the last sample alone, before hysteresis.
+        error: Error of the last run, or None if it succeeded.
+        streak: Consecutive samples disagreeing with state, counting toward
+               the next transition.
+    """
+
+    name: str
+    state: Literal["healthy", "unhealthy", "degraded"]
+    value: float | None = None
+    sample_state: Literal["healthy", "unhealthy", "degraded"] = "healthy"
+    error: str | None = None
+    streak: int = 0
@@ -0,0 +1,76 @@
+"""Metric names, descriptions and histogram bucket layouts.
+
+Names are given without the configurable prefix (see
+LiteFSSettings.metrics_prefix). Counter names omit the ``_total`` suffix,
+which exporters such as Prometheus append themselves.
+"""
+
+from __future__ import annotations
+
+# Histograms
+FORWARD_ATTEMPT_DURATION = "forward_attempt_duration_seconds"
+WRITE_GUARD_DURATION = "write_guard_duration_seconds"
+SQL_CLASSIFICATION_DURATION = "sql_classification_duration_seconds"
+STATEMENT_DURATION = "statement_duration_seconds"
+CLUSTER_STATE_REFRESH_DURATION = "cluster_state_refresh_duration_seconds"
+CONNECTION_SETUP_DURATION = "connection_setup_duration_seconds"
+LEADERSHIP_TRANSFER_DURATION = "leadership_transfer_duration_seconds"
+RAFT_PEER_RTT = "raft_peer_rtt_seconds"
+
+# Counters
+FORWARD_RETRIES = "forward_retries"
+CIRCUIT_BREAKER_TRANSITIONS = "circuit_breaker_transitions"
+QUERY_CACHE_LOOKUPS = "query_cache_lookups"
+STATEMENTS = "statements"
+SLOW_QUERIES = "slow_queries"
+HEALTH_PROBE_TRANSITIONS = "health_probe_transitions"
+FENCED_WRITES = "fenced_writes"
+
+METRIC_DESCRIPTIONS: dict[str, str] = {
+    FORWARD_ATTEMPT_DURATION: (
+        "Round-trip time of each attempt to forward a request to the primary"
+    ),
+    WRITE_GUARD_DURATION: (
+        "Time spent checking primary status or split-brain before a write"
+    ),
+    SQL_CLASSIFICATION_DURATION: "Time spent classifying SQL statements",
+    STATEMENT_DURATION: "Execution time of SQL statements by kind",
+    CLUSTER_STATE_REFRESH_DURATION: "Time spent reading the Raft cluster state",
+    CONNECTION_SETUP_DURATION: "Time spent opening a database connection",
+    LEADERSHIP_TRANSFER_DURATION: (
+        "Write unavailability while handing leadership to a follower"
+    ),
+    RAFT_PEER_RTT: "Round-trip time of Raft heartbeats from the leader by peer",
+    FORWARD_RETRIES: "Retried attempts to forward a request to the primary",
+    CIRCUIT_BREAKER_TRANSITIONS: "Forwarding circuit breaker state transitions",
+    QUERY_CACHE_LOOKUPS: "Query-result cache lookups by result",
+    STATEMENTS: "SQL statements executed by kind",
+    SLOW_QUERIES: "SQL statements slower than the slow-query threshold",
+    HEALTH_PROBE_TRANSITIONS: "Active health probe state transitions",
+    FENCED_WRITES: "Writes rejected because the leader epoch changed",
+}
+
+# Key of LiteFSSettings.metrics_histogram_buckets applying to every histogram
+# without its own layout
+DEFAULT_BUCKETS_KEY = "default"
+
+# Default histogram layout in seconds: LiteFS overhead is mostly sub-millisecond
+# (file reads, SQL classification), forwarding round trips reach seconds
+DEFAULT_HISTOGRAM_BUCKETS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
@@ -15,29 +15,42 @@ class RaftSettings:
 
     Attributes:
         node_id: Unique identifier for this node in the cluster.
-                Must be non-empty, non-whitespace, and a member of cluster_members.
-        cluster_members: Tuple of all node IDs in the cluster.
+                Must be non-empty, non-whitespace, and a member of
+                cluster_members or observers.
+        cluster_members: Tuple of the voting node IDs in the cluster.
                         Must be non-empty, contain non-empty strings.
-        quorum_size: Calculated as floor(n/2) + 1, where n is cluster size.
-                    This ensures majority consensus for leader election.
+        quorum_size: Calculated as floor(n/2) + 1, where n is the number of
+                    voting members. This ensures majority consensus for
+                    leader election.
+        observers: Tuple of non-voting node IDs. Observers follow the leader
+                  but never vote or stand for election, so they do not
+                  change quorum_size.
 
     Invariants:
-        - node_id must be in cluster_members
+        - node_id must be in cluster_members or observers
         - cluster_members must not be empty
+        - observers must not overlap cluster_members
         - quorum_size > n/2 (majority requirement)
     """
 
     node_id: str
     cluster_members: tuple[str, ...] | list[str]
     quorum_size: int = 0  # Will be calculated in __post_init__
+    observers: tuple[str, ...] | list[str] = ()
 
     def __post_init__(self) -> None:
         """Validate Raft settings and calculate quorum size."""
         self._validate_node_id()
+        self._validate_observers()
         self._validate_cluster_members()
         self._normalize_cluster_members()
         self._calculate_quorum_size()
 
+    @property
+    def is_observer(self) -> bool:
+        """Whether this node is a non-voting observer."""
+        return self.node_id in self.observers
+
     def _validate_node_id(self) -> None:
         """Validate node_id is non-empty and non-whitespace."""
         if not self.node_id:
@@ -61,16 +74,33 @@ class RaftSettings:
                     "cluster_members contains whitespace-only strings"
                 )
 
-        # Check that node_id is in cluster_members
-        if self.node_id not in self.cluster_members:
+        # Check that node_id is in cluster_members (or is an observer)
+        if self.node_id not in self.cluster_members and not self.is_observer:
             raise LiteFSConfigError(
                 f"node_id '{self.node_id}' must be a member of cluster_members"
             )
 
+    def _validate_observers(self) -> None:
+        """Validate observers contains distinct non-voting node IDs."""
+        for observer in self.observers:
+            if not observer or not observer.strip():
+                raise LiteFSConfigError("observers contains empty strings")
+
+        if len(set(self.observers)) != len(self.observers):
+            raise LiteFSConfigError("observers contains duplicates")
+
+        voters = set(self.observers).intersection(self.cluster_members)
+        if voters:
+            raise LiteFSConfigError(
+                f"observers {sorted(voters)} are also cluster_members"
+            )
+
     def _normalize_cluster_members(self) -> None:
-        """Convert cluster_members to tuple for immutability and hashing."""
+        """Convert member lists to tuples for immutability and hashing."""
         if isinstance(self.cluster_members, list):
             object.__setattr__(self, "cluster_members", tuple(self.cluster_members))
+        if isinstance(self.observers, list):
+            object.__setattr__(self, "observers", tuple(self.observers))
 
     def _calculate_quorum_size(self) -> None:
         """Calculate quorum size as floor(n/2) + 1.
@@ -78,6 +108,7 @@ class RaftSettings:
         This ensures that a quorum is always a strict majority.
         For a 3-node cluster: floor(3/2) + 1 = 2 (need >1.5 nodes)
         For a 5-node cluster: floor(5/2) + 1 = 3 (need >2.5 nodes)
+        Observers are not counted.
         """
         # We need to use object.__setattr__ because this is a frozen dataclass
         quorum = len(self.cluster_members) // 2 + 1
@@ -0,0 +1,157 @@
+"""Replication position and lag domain value objects.
+
+LiteFS exposes the replication position of each database as a small text
+file next to the database on the FUSE mount (``<db>-pos``). The file holds
+the current transaction ID (TXID) and the rolling checksum after that
+transaction, both as 16-digit hex numbers separated by a slash:
+
+    0000000000000003/f8c4d8c1bbcbd4a2
+
+These value objects model that position and the lag of a replica relative
+to the primary.
+
+The same hex TXID format is used for read-your-writes tokens: after a write,
+the primary hands the client its post-commit TXID (header and cookie), and a
+replica serving the client's next read waits until it has applied that TXID.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+from litefs.domain.exceptions import LiteFSConfigError
+
+# Response/request header carrying a read-your-writes TXID token
+TXID_HEADER_NAME = "X-LiteFS-TXID"
+
+# Cookie carrying a read-your-writes TXID token between requests
+TXID_COOKIE_NAME = "__litefs_txid"
+
+# A TXID is an unsigned 64-bit integer rendered as hex
+_TXID_PATTERN = re.compile(r"[0-9a-fA-F]{1,16}")
+
+
+def format_txid(txid: int) -> str:
+    """Format a TXID the way LiteFS does (16-digit lowercase hex).
+
+    Args:
+        txid: Transaction ID to format.
+
+    Returns:
+        Zero-padded lowercase hex representation of the TXID.
+    """
+    return f"{txid:016x}"
+
+
+def parse_txid(value: str) -> int:
+    """Parse a hex TXID, e.g. from a read-your-writes token.
+
+    Args:
+        value: Hex TXID string of at most 16 digits (zero padding optional).
+
+    Returns:
+        The TXID as an integer.
+
+    Raises:
+        LiteFSConfigError: If the value is not a hex TXID.
+    """
+    stripped = value.strip()
+    if not _TXID_PATTERN.fullmatch(stripped):
+        raise LiteFSConfigError(f"invalid txid, expected hex value, got: {value!r}")
+    return int(stripped, 16)
+
+
+@dataclass(frozen=True)
+class ReplicationPosition:
+    """Replication position of a LiteFS database.
+
+    Value object representing the TXID and checksum LiteFS reports for a
+    database. Immutable and hashable.
+
+    Attributes:
+        txid: Transaction ID of the last applied transaction. Non-negative.
+        checksum: Rolling database checksum after that transaction, as a
+                 lowercase hex string.
+    """
+
+    txid: int
+    checksum: str
+
+    def __post_init__(self) -> None:
+        """Validate replication position."""
+        self._validate_txid()
+
+    def _validate_txid(self) -> None:
+        """Validate txid is non-negative."""
+        if self.txid < 0:
+            raise LiteFSConfigError(f"txid cannot be negative, got: {self.txid}")
+
+    @classmethod
+    def parse(cls, content: str) -> ReplicationPosition:
+        """Parse the content of a LiteFS position file.
+
+        Args:
+            content: Raw file content in "TXID/CHECKSUM" hex format.
+
+        Returns:
+            ReplicationPosition parsed from the content.
+
+        Raises:
+            LiteFSConfigError: If the content is not a valid position.
+        """
+        txid_part, sep, checksum_part = content.strip().partition("/")
+        if not sep or not txid_part or not checksum_part:
+            raise LiteFSConfigError(
+                f"invalid replication position, expected 'TXID/CHECKSUM', got: {content!r}"
+            )
+
+        try:
+            txid = int(txid_part, 16)
+            int(checksum_part, 16)
+        except ValueError as exc:
+            raise LiteFSConfigError(
+                f"invalid replication position, expected hex values, got: {content!r}"
+            ) from exc
+
+        return cls(txid=txid, checksum=checksum_part.lower())
+
+    def format_txid(self) -> str:
+        """Format the TXID the way LiteFS does (16-digit hex).
+
+        Returns:
+            Zero-padded lowercase hex representation of the TXID.
+        """
+        return format_txid(self.txid)
+
+
+@dataclass(frozen=True)
+class ReplicationLag:
+    """Replication lag of this node relative to the primary.
+
+    Value object representing how far behind the primary this node is.
+    Fields are None when the value cannot be determined (e.g., no position
+    file yet, primary position unknown, or not enough samples to estimate
+    the transaction rate).
+
+    Attributes:
+        local_txid: TXID applied on this node, or None if unknown.
+        primary_txid: TXID reported by the primary, or None if unknown.
+        txid_lag: Number of transactions this node is behind, or None.
+        seconds_lag: Estimated seconds behind the primary, derived from the
+                    observed TXID rate, or None if it cannot be estimated.
+    """
+
+    local_txid: int | None = None
+    primary_txid: int | None = None
+    txid_lag: int | None = None
+    seconds_lag: float | None = None
+
+    @property
+    def is_known(self) -> bool:
+        """Check whether the TXID lag could be determined.
+
+        Returns:
+            True if txid_lag is known, False otherwise.
+        """
+        return self.txid_lag is not None
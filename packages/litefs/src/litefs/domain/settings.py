@@ -1,10 +1,22 @@
 """LiteFS settings domain entity."""
 
+import itertools
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Literal
 
 from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.health import (
+    EVENT_LOOP_LAG,
+    EXECUTOR_DELAY,
+    FREE_DISK,
+    FUSE_READ_LATENCY,
+    QUERY_LATENCY,
+    REPLICATION_LAG,
+    WAL_SIZE,
+    ProbeThresholds,
+)
 
 
 @dataclass(frozen=True)
@@ -19,15 +31,25 @@ class RaftConfig:
                   Must be non-empty and non-whitespace.
         peers: List of peer node addresses for cluster communication.
                Must be a non-empty list of non-empty strings.
+        priorities: Leader priority by node address; higher is preferred and
+                   unlisted nodes have priority 0. Must only name self_addr
+                   and peers.
     """
 
     self_addr: str
     peers: list[str]
+    priorities: Mapping[str, int] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Validate Raft configuration."""
         self._validate_self_addr()
         self._validate_peers()
+        self._validate_priorities()
+
+    @property
+    def priority(self) -> int:
+        """Leader priority of this node."""
+        return self.priorities.get(self.self_addr, 0)
 
     def _validate_self_addr(self) -> None:
         """Validate self_addr is non-empty and contains no whitespace-only values."""
@@ -42,6 +64,31 @@ class RaftConfig:
         if not self.peers:
             raise LiteFSConfigError("peers list cannot be empty")
 
+    def _validate_priorities(self) -> None:
+        """Validate priorities are integers of cluster nodes."""
+        _validate_raft_priorities(
+            "priorities", self.priorities, [self.self_addr, *self.peers]
+        )
+
+
+def _validate_raft_priorities(
+    name: str, priorities: Mapping[str, int], members: list[str]
+) -> None:
+    """Validate leader priorities are integers of the given members.
+
+    Raises:
+        LiteFSConfigError: If a priority names an unknown node or is not an
+            integer.
+    """
+    unknown = set(priorities).difference(members)
+    if unknown:
+        raise LiteFSConfigError(f"{name} {sorted(unknown)} are not Raft voters")
+    for address, priority in priorities.items():
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            raise LiteFSConfigError(
+                f"{name}[{address!r}] must be an integer, got: {priority!r}"
+            )
+
 
 @dataclass(frozen=True)
 class StaticLeaderConfig:
@@ -116,6 +163,13 @@ class ForwardingSettings:
         circuit_breaker_enabled: Whether circuit breaker is enabled.
                                 If False, circuit breaker logic is bypassed.
                                 Defaults to True.
+        read_your_writes: Whether to hand clients a TXID token after writes
+                         and make replicas wait for that TXID before serving
+                         the client's reads. Defaults to True.
+        read_your_writes_timeout: Maximum seconds a replica waits to catch up
+                                 with a client's TXID token before forwarding
+                                 the read to the primary. Must be positive.
+                                 Defaults to 1.0.
     """
 
     enabled: bool = False
@@ -130,12 +184,15 @@ class ForwardingSettings:
     circuit_breaker_threshold: int = 5
     circuit_breaker_reset_timeout: float = 30.0
     circuit_breaker_enabled: bool = True
+    read_your_writes: bool = True
+    read_your_writes_timeout: float = 1.0
 
     def __post_init__(self) -> None:
         """Validate forwarding settings."""
         self._validate_timeouts()
         self._validate_retry_backoff()
         self._validate_circuit_breaker()
+        self._validate_read_your_writes()
 
     def _validate_timeouts(self) -> None:
         """Validate that timeout values are positive."""
@@ -156,6 +213,294 @@ class ForwardingSettings:
         if self.circuit_breaker_reset_timeout <= 0:
             raise LiteFSConfigError("circuit_breaker_reset_timeout must be positive")
 
+    def _validate_read_your_writes(self) -> None:
+        """Validate read-your-writes wait timeout is positive."""
+        if self.read_your_writes_timeout <= 0:
+            raise LiteFSConfigError("read_your_writes_timeout must be positive")
+
+
+@dataclass(frozen=True)
+class ReplicationSettings:
+    """Replication lag monitoring configuration for replica nodes.
+
+    Value object for configuring when a replica is considered too far
+    behind the primary. A lagging replica reports a degraded health status
+    and is not ready, so load balancers can drain it until it catches up.
+
+    Attributes:
+        max_lag_txids: Maximum number of transactions a replica may trail
+                      the primary before it is considered lagging.
+                      Must be positive. Defaults to 1000.
+        max_lag_seconds: Maximum estimated seconds a replica may trail the
+                        primary before it is considered lagging.
+                        Must be positive. Defaults to 30.0.
+        rate_window_seconds: Sliding window in seconds used to estimate the
+                            primary's TXID rate for lag-in-seconds estimates.
+                            Must be positive. Defaults to 60.0.
+    """
+
+    max_lag_txids: int = 1000
+    max_lag_seconds: float = 30.0
+    rate_window_seconds: float = 60.0
+
+    def __post_init__(self) -> None:
+        """Validate replication settings."""
+        self._validate_thresholds()
+        self._validate_rate_window()
+
+    def _validate_thresholds(self) -> None:
+        """Validate that lag thresholds are positive."""
+        if self.max_lag_txids < 1:
+            raise LiteFSConfigError("max_lag_txids must be positive")
+        if self.max_lag_seconds <= 0:
+            raise LiteFSConfigError("max_lag_seconds must be positive")
+
+    def _validate_rate_window(self) -> None:
+        """Validate that the rate window is positive."""
+        if self.rate_window_seconds <= 0:
+            raise LiteFSConfigError("rate_window_seconds must be positive")
+
+
+@dataclass(frozen=True)
+class ResponseCacheSettings:
+    """TXID-versioned HTTP response cache configuration.
+
+    Value object for the opt-in response cache. Cached GET responses are
+    keyed by path, query string, the values of the vary headers and the
+    local TXID, so every applied transaction invalidates them implicitly.
+    Only views opted in with the cache_by_txid decorator are cached.
+
+    Attributes:
+        enabled: Whether the response cache is enabled. Defaults to False.
+        max_bytes: Upper bound on the memory held by cached responses.
+                  Least recently used entries are evicted beyond it.
+                  Must be positive. Defaults to 32 MiB.
+        max_entry_bytes: Responses larger than this are never cached.
+                        Must be positive and at most max_bytes.
+                        Defaults to 1 MiB.
+        vary_headers: Request headers whose values are part of the cache
+                     key. Uses tuple for immutability.
+                     Defaults to ("Accept", "Accept-Encoding").
+    """
+
+    enabled: bool = False
+    max_bytes: int = 32 * 1024 * 1024
+    max_entry_bytes: int = 1024 * 1024
+    vary_headers: tuple[str, ...] = ("Accept", "Accept-Encoding")
+
+    def __post_init__(self) -> None:
+        """Validate response cache settings."""
+        self._validate_sizes()
+
+    def _validate_sizes(self) -> None:
+        """Validate that memory limits are positive and consistent."""
+        if self.max_bytes < 1:
+            raise LiteFSConfigError("max_bytes must be positive")
+        if self.max_entry_bytes < 1:
+            raise LiteFSConfigError("max_entry_bytes must be positive")
+        if self.max_entry_bytes > self.max_bytes:
+            raise LiteFSConfigError("max_entry_bytes cannot exceed max_bytes")
+
+
+@dataclass(frozen=True)
+class ChangeBusSettings:
+    """Replication change notification configuration.
+
+    Value object for the opt-in change bus, which watches the LiteFS
+    position file and notifies in-process subscribers when the local TXID
+    moves.
+
+    Attributes:
+        enabled: Whether the change bus is started. Defaults to False.
+        poll_interval: Maximum delay in seconds between position checks.
+                      Must be positive. Defaults to 0.5.
+        min_interval: Minimum delay in seconds between two notifications;
+                     changes within it are coalesced into one event. Must
+                     be non-negative. Defaults to 0.1.
+        use_inotify: Whether to wake up early on inotify notifications
+                    (Linux only, polling is always used as a fallback).
+                    Defaults to True.
+    """
+
+    enabled: bool = False
+    poll_interval: float = 0.5
+    min_interval: float = 0.1
+    use_inotify: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate change bus settings."""
+        self._validate_intervals()
+
+    def _validate_intervals(self) -> None:
+        """Validate that intervals are usable."""
+        if self.poll_interval <= 0:
+            raise LiteFSConfigError("poll_interval must be positive")
+        if self.min_interval < 0:
+            raise LiteFSConfigError("min_interval cannot be negative")
+
+
+@dataclass(frozen=True)
+class HealthSnapshotSettings:
+    """Precomputed health endpoint configuration.
+
+    Value object for the opt-in health snapshot evaluator, which recomputes
+    health, liveness and readiness in the background so that probe
+    endpoints return ready-made responses.
+
+    Attributes:
+        enabled: Whether probe endpoints serve snapshots. Defaults to False.
+        interval: Delay in seconds between two evaluations. Must be
+                 positive. Defaults to 1.0.
+        max_age: Oldest snapshot in seconds that may be served; older
+                snapshots are ignored and the endpoint evaluates health
+                synchronously. Must be at least interval. Defaults to 10.0.
+    """
+
+    enabled: bool = False
+    interval: float = 1.0
+    max_age: float = 10.0
+
+    def __post_init__(self) -> None:
+        """Validate health snapshot settings."""
+        self._validate_intervals()
+
+    def _validate_intervals(self) -> None:
+        """Validate that interval and max_age are usable."""
+        if self.interval <= 0:
+            raise LiteFSConfigError("interval must be positive")
+        if self.max_age < self.interval:
+            raise LiteFSConfigError("max_age must be at least interval")
+
+
+@dataclass(frozen=True)
+class ServerTimingSettings:
+    """Server-Timing header configuration.
+
+    Value object for the opt-in ServerTimingMiddleware, which reports the
+    time spent in LiteFS layers (primary and split-brain checks, forwarding,
+    database lock wait) for each request.
+
+    Attributes:
+        enabled: Whether responses carry a Server-Timing header. Defaults
+                to False.
+        log: Whether the spans of each request are also logged as a
+            structured line. Defaults to False.
+    """
+
+    enabled: bool = False
+    log: bool = False
+
+
+@dataclass(frozen=True)
+class RouteStatsSettings:
+    """Per-route traffic statistics configuration.
+
+    Value object for the opt-in per-route aggregate of the write forwarding
+    middleware (see litefs.usecases.route_stats).
+
+    Attributes:
+        enabled: Whether requests are aggregated by route. Defaults to False.
+        max_routes: Routes tracked individually; further routes are
+                   aggregated together. Must be positive. Defaults to 200.
+        relative_accuracy: Relative error of the latency quantiles. Must be
+                          between 0 and 1 (exclusive). Defaults to 0.01.
+    """
+
+    enabled: bool = False
+    max_routes: int = 200
+    relative_accuracy: float = 0.01
+
+    def __post_init__(self) -> None:
+        """Validate route statistics settings."""
+        self._validate_bounds()
+
+    def _validate_bounds(self) -> None:
+        """Validate that max_routes and relative_accuracy are usable."""
+        if self.max_routes <= 0:
+            raise LiteFSConfigError("max_routes must be positive")
+        if not 0 < self.relative_accuracy < 1:
+            raise LiteFSConfigError("relative_accuracy must be between 0 and 1")
+
+
+def default_probe_thresholds() -> dict[str, ProbeThresholds | None]:
+    """Return the default thresholds of each active health probe.
+
+    Latencies are in seconds and sizes in bytes. The event loop and
+    executor probes only run where the framework adapter provides them.
+    """
+    return {
+        FUSE_READ_LATENCY: ProbeThresholds(degraded=0.1, unhealthy=1.0),
+        QUERY_LATENCY: ProbeThresholds(degraded=0.1, unhealthy=1.0),
+        WAL_SIZE: ProbeThresholds(degraded=256 * 1024 * 1024),
+        FREE_DISK: ProbeThresholds(
+            degraded=1024 * 1024 * 1024,
+            unhealthy=100 * 1024 * 1024,
+            higher_is_worse=False,
+        ),
+        REPLICATION_LAG: ProbeThresholds(degraded=30.0),
+        EVENT_LOOP_LAG: ProbeThresholds(degraded=0.1, unhealthy=1.0),
+        EXECUTOR_DELAY: ProbeThresholds(degraded=0.1, unhealthy=1.0),
+    }
+
+
+@dataclass(frozen=True)
+class HealthProbeSettings:
+    """Active health probe configuration.
+
+    Value object for the opt-in ActiveHealthMonitor, which measures the
+    node in the background and degrades it, or marks it unhealthy, when
+    probes breach their thresholds (see litefs.usecases.health_probes).
+
+    Attributes:
+        enabled: Whether probes run. Defaults to False.
+        interval: Delay in seconds between two rounds of probes. Must be
+                 positive. Defaults to 5.0.
+        failure_threshold: Consecutive breaches before a probe degrades or
+                          becomes unhealthy. Must be positive. Defaults to 3.
+        recovery_threshold: Consecutive good samples before a probe
+                           recovers. Must be positive. Defaults to 2.
+        thresholds: Thresholds by probe name; None disables a probe.
+                   Probes not listed use default_probe_thresholds().
+    """
+
+    enabled: bool = False
+    interval: float = 5.0
+    failure_threshold: int = 3
+    recovery_threshold: int = 2
+    thresholds: dict[str, ProbeThresholds | None] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Validate health probe settings."""
+        self._validate_schedule()
+        self._validate_thresholds()
+
+    def _validate_schedule(self) -> None:
+        """Validate interval and hysteresis counts."""
+        if self.interval <= 0:
+            raise LiteFSConfigError("interval must be positive")
+        if self.failure_threshold < 1:
+            raise LiteFSConfigError("failure_threshold must be positive")
+        if self.recovery_threshold < 1:
+            raise LiteFSConfigError("recovery_threshold must be positive")
+
+    def _validate_thresholds(self) -> None:
+        """Validate that thresholds name known probes."""
+        unknown = set(self.thresholds) - set(default_probe_thresholds())
+        if unknown:
+            raise LiteFSConfigError(
+                f"unknown health probes in thresholds: {sorted(unknown)}"
+            )
+
+    def probe_thresholds(self, name: str) -> ProbeThresholds | None:
+        """Return the thresholds of a probe, or None if it is disabled.
+
+        Args:
+            name: Probe name.
+        """
+        if name in self.thresholds:
+            return self.thresholds[name]
+        return default_probe_thresholds()[name]
+
 
 @dataclass(frozen=True)
 class ProxySettings:
@@ -228,11 +573,60 @@ class LiteFSSettings:
     retention: str
     raft_self_addr: str | None = None
     raft_peers: list[str] | None = None
+    # Non-voting members, the same list on every node. A node whose
+    # raft_self_addr is listed observes the voters in raft_peers.
+    raft_observers: list[str] | None = None
+    # Allow voters to be added and removed at runtime (see litefs_members)
+    raft_dynamic_membership: bool = False
+    # Absolute path the live voter list is saved to; it replaces raft_peers
+    # on restart once it exists. Requires raft_dynamic_membership.
+    raft_membership_file: str | None = None
+    # Leader priority by voter address, the same on every node; higher is
+    # preferred. Lower-priority nodes wait longer to stand for election.
+    raft_priorities: dict[str, int] | None = None
+    # Seconds a lower-priority leader keeps leadership before handing it to
+    # a caught-up, higher-priority voter
+    raft_rebalance_after: float = 30.0
+    # Seconds without a heartbeat before a follower stands for election, and
+    # between the leader's heartbeats
+    raft_election_timeout: float = 5.0
+    raft_heartbeat_interval: float = 1.0
+    # Derive the heartbeat interval and election timeout from measured
+    # heartbeat round trips, between the minimums below and the two values
+    # above, which are also the starting values
+    raft_adaptive_timeouts: bool = False
+    raft_min_election_timeout: float = 0.3
+    raft_min_heartbeat_interval: float = 0.03
+    # Stand for election only after a majority agreed in a pre-vote, so a
+    # node returning from a partition cannot depose a healthy leader
+    raft_pre_vote: bool = True
+    # Step down as leader after an election timeout without a majority
+    raft_check_quorum: bool = True
+    # Run the Raft node on the application's asyncio event loop instead of a
+    # tick thread. The election must then be created on that loop, as the
+    # FastAPI lifespan does.
+    raft_event_loop: bool = False
+    # Replicate the leader's address, epoch and forwarding URL on the Raft log
+    raft_cluster_metadata: bool = False
+    # Full URL this node publishes for forwarded writes while it leads
+    raft_forwarding_url: str | None = None
     static_leader_config: StaticLeaderConfig | None = None
     proxy: ProxySettings | None = None
     forwarding: ForwardingSettings | None = None
+    replication: ReplicationSettings | None = None
+    response_cache: ResponseCacheSettings | None = None
+    change_bus: ChangeBusSettings | None = None
+    health_snapshot: HealthSnapshotSettings | None = None
+    server_timing: ServerTimingSettings | None = None
+    route_stats: RouteStatsSettings | None = None
+    health_probes: HealthProbeSettings | None = None
     metrics_enabled: bool = False
     metrics_prefix: str = "litefs"
+    # Histogram bucket upper bounds by metric name (see litefs.domain.metrics),
+    # with the "default" key applying to histograms not listed
+    metrics_histogram_buckets: dict[str, tuple[float, ...]] | None = None
+    # Seconds a rendered /metrics exposition is reused before re-aggregating
+    metrics_exposition_ttl: float = 1.0
 
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
@@ -240,6 +634,8 @@ class LiteFSSettings:
         self._validate_paths()
         self._validate_leader_election()
         self._validate_raft_config()
+        self._validate_metrics_histogram_buckets()
+        self._validate_metrics_exposition_ttl()
 
     def _validate_database_name(self) -> None:
         """Validate that database_name is not empty or whitespace-only."""
@@ -280,7 +676,8 @@ class LiteFSSettings:
         """Validate Raft configuration when leader_election is 'raft'.
 
         When leader_election="raft", both raft_self_addr and raft_peers must be
-        present and non-empty. When leader_election="static", these fields are ignored.
+        present and non-empty. raft_observers must not list any of raft_peers.
+        When leader_election="static", these fields are ignored.
         """
         if self.leader_election != "raft":
             return
@@ -308,3 +705,123 @@ class LiteFSSettings:
             raise LiteFSConfigError(
                 "raft_peers cannot be empty when leader_election='raft'"
             )
+
+        if self.raft_observers:
+            if any(not o or not o.strip() for o in self.raft_observers):
+                raise LiteFSConfigError("raft_observers contains empty addresses")
+            if len(set(self.raft_observers)) != len(self.raft_observers):
+                raise LiteFSConfigError("raft_observers contains duplicates")
+            voters = set(self.raft_observers).intersection(self.raft_peers)
+            if voters:
+                raise LiteFSConfigError(
+                    f"raft_observers {sorted(voters)} are also in raft_peers"
+                )
+
+        if self.raft_membership_file is not None:
+            if not self.raft_dynamic_membership:
+                raise LiteFSConfigError(
+                    "raft_membership_file requires raft_dynamic_membership"
+                )
+            if not Path(self.raft_membership_file).is_absolute():
+                raise LiteFSConfigError(
+                    "raft_membership_file must be an absolute path, "
+                    f"got: {self.raft_membership_file}"
+                )
+
+        if self.raft_priorities:
+            voters = [*self.raft_peers]
+            if self.raft_self_addr not in (self.raft_observers or []):
+                voters.append(self.raft_self_addr)
+            _validate_raft_priorities("raft_priorities", self.raft_priorities, voters)
+        if self.raft_rebalance_after <= 0:
+            raise LiteFSConfigError(
+                "raft_rebalance_after must be positive, "
+                f"got: {self.raft_rebalance_after}"
+            )
+        self._validate_raft_timing()
+
+        if self.raft_forwarding_url is not None:
+            if not self.raft_cluster_metadata:
+                raise LiteFSConfigError(
+                    "raft_forwarding_url requires raft_cluster_metadata"
+                )
+            if "://" not in self.raft_forwarding_url:
+                raise LiteFSConfigError(
+                    "raft_forwarding_url must be a full URL with scheme, "
+                    f"got: {self.raft_forwarding_url!r}"
+                )
+
+    def _validate_raft_timing(self) -> None:
+        """Validate the Raft heartbeat interval and election timeout.
+
+        With raft_adaptive_timeouts, the minimums must not exceed the
+        configured values, and the shortest election timeout must span more
+        than three of the shortest heartbeat intervals.
+        """
+        if self.raft_heartbeat_interval <= 0:
+            raise LiteFSConfigError(
+                "raft_heartbeat_interval must be positive, "
+                f"got: {self.raft_heartbeat_interval}"
+            )
+        if self.raft_election_timeout <= self.raft_heartbeat_interval:
+            raise LiteFSConfigError(
+                "raft_election_timeout must be greater than "
+                f"raft_heartbeat_interval, got: {self.raft_election_timeout}"
+            )
+        if not self.raft_adaptive_timeouts:
+            return
+        if not 0 < self.raft_min_heartbeat_interval <= self.raft_heartbeat_interval:
+            raise LiteFSConfigError(
+                "raft_min_heartbeat_interval must be positive and at most "
+                f"raft_heartbeat_interval, got: {self.raft_min_heartbeat_interval}"
+            )
+        if self.raft_min_election_timeout > self.raft_election_timeout:
+            raise LiteFSConfigError(
+                "raft_min_election_timeout must be at most raft_election_timeout, "
+                f"got: {self.raft_min_election_timeout}"
+            )
+        if self.raft_min_election_timeout <= 3 * self.raft_min_heartbeat_interval:
+            raise LiteFSConfigError(
+                "raft_min_election_timeout must be more than 3 * "
+                f"raft_min_heartbeat_interval, got: {self.raft_min_election_timeout}"
+            )
+
+    def _validate_metrics_histogram_buckets(self) -> None:
+        """Validate that histogram bucket layouts are usable.
+
+        Each layout must be a non-empty, strictly increasing sequence of
+        positive upper bounds. Layouts are normalized to tuples of floats.
+        """
+        if self.metrics_histogram_buckets is None:
+            return
+
+        layouts: dict[str, tuple[float, ...]] = {}
+        for name, bounds in self.metrics_histogram_buckets.items():
+            try:
+                layout = tuple(float(bound) for bound in bounds)
+            except (TypeError, ValueError):
+                raise LiteFSConfigError(
+                    f"metrics_histogram_buckets[{name!r}] must be a sequence "
+                    f"of numbers, got: {bounds!r}"
+                ) from None
+            if not layout:
+                raise LiteFSConfigError(
+                    f"metrics_histogram_buckets[{name!r}] cannot be empty"
+                )
+            if layout[0] <= 0 or any(
+                upper <= lower for lower, upper in itertools.pairwise(layout)
+            ):
+                raise LiteFSConfigError(
+                    f"metrics_histogram_buckets[{name!r}] must be positive and "
+                    f"strictly increasing, got: {layout}"
+                )
+            layouts[name] = layout
+        self.metrics_histogram_buckets = layouts
+
+    def _validate_metrics_exposition_ttl(self) -> None:
+        """Validate that the exposition cache TTL is not negative."""
+        if self.metrics_exposition_ttl < 0:
+            raise LiteFSConfigError(
+                f"metrics_exposition_ttl must be non-negative, got: "
+                f"{self.metrics_exposition_ttl}"
+            )
@@ -24,10 +24,19 @@ class RaftNodeState:
                 Must be non-empty and non-whitespace.
         is_leader: Boolean indicating whether this node is the elected leader
                   in the cluster.
+        txid: Replication position (TXID) reported by the node, or None if
+             the node did not report one.
+        reachable: Whether the node answered the state query. Unreachable
+                  nodes are reported as non-leaders.
+        latency_seconds: Round-trip time of the state query, or None if the
+                        node was not queried over the network.
     """
 
     node_id: str
     is_leader: bool
+    txid: int | None = None
+    reachable: bool = True
+    latency_seconds: float | None = None
 
     def __post_init__(self) -> None:
         """Validate node state."""
@@ -101,6 +110,19 @@ class RaftClusterState:
         """
         return [node for node in self.nodes if node.is_leader]
 
+    def get_leader_txid(self) -> int | None:
+        """Get the replication position reported by the single leader.
+
+        Returns:
+            The leader's TXID if exactly one node claims leadership and it
+            reported a TXID, None otherwise (no leader, split-brain, or
+            position not reported).
+        """
+        leaders = self.get_leader_nodes()
+        if len(leaders) != 1:
+            return None
+        return leaders[0].txid
+
     def get_replica_nodes(self) -> list[RaftNodeState]:
         """Get all nodes that are not leaders.
 
@@ -0,0 +1,121 @@
+"""W3C Trace Context and the names of the spans emitted by LiteFS.
+
+A forwarded write is handled on two nodes. The replica sends its current
+trace context to the primary in the traceparent header, so that the
+primary's spans join the replica's trace:
+
+    traceparent: 00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01
+
+See https://www.w3.org/TR/trace-context/.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+
+TRACEPARENT_HEADER_NAME = "traceparent"
+
+# Span names
+WRITE_FORWARDING_SPAN = "litefs.write_forwarding"
+CIRCUIT_BREAKER_SPAN = "litefs.circuit_breaker"
+FORWARD_REQUEST_SPAN = "litefs.forward"
+RETRY_BACKOFF_SPAN = "litefs.forward.backoff"
+
+# Span attributes
+DECISION_ATTRIBUTE = "litefs.decision"
+FORWARD_ATTEMPT_ATTRIBUTE = "litefs.forward.attempt"
+BACKOFF_SECONDS_ATTRIBUTE = "litefs.forward.backoff_seconds"
+CIRCUIT_ALLOWED_ATTRIBUTE = "litefs.circuit_breaker.allowed"
+CIRCUIT_STATE_ATTRIBUTE = "litefs.circuit_breaker.state"
+
+# Values of DECISION_ATTRIBUTE
+DECISION_EXCLUDED = "excluded"
+DECISION_LOCAL_READ = "local_read"
+DECISION_PRIMARY = "primary"
+DECISION_FORWARD = "forward"
+
+_TRACEPARENT_PATTERN = re.compile(
+    r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$"
+)
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+_SAMPLED_FLAG = 0x01
+
+
+@dataclass(frozen=True)
+class TraceContext:
+    """Position of a span in a distributed trace.
+
+    Attributes:
+        trace_id: 32 lowercase hex digits identifying the trace.
+        span_id: 16 lowercase hex digits identifying the span.
+        sampled: Whether the trace is recorded by the caller.
+    """
+
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    @classmethod
+    def generate(cls, parent: TraceContext | None = None) -> TraceContext:
+        """Create the context of a new span.
+
+        Args:
+            parent: Context of the parent span. Without a parent, the span
+                   starts a new sampled trace.
+
+        Returns:
+            Context with a new span ID, in the parent's trace if given.
+        """
+        if parent is None:
+            return cls(trace_id=_random_id(128), span_id=_random_id(64))
+        return cls(
+            trace_id=parent.trace_id,
+            span_id=_random_id(64),
+            sampled=parent.sampled,
+        )
+
+    @classmethod
+    def from_traceparent(cls, value: str) -> TraceContext | None:
+        """Parse a traceparent header.
+
+        Headers of future versions are parsed by their version 00 prefix,
+        as the specification requires.
+
+        Args:
+            value: traceparent header value.
+
+        Returns:
+            The parsed context, or None if the header is invalid (the
+            request then starts a new trace).
+        """
+        match = _TRACEPARENT_PATTERN.match(value.strip())
+        if match is None:
+            return None
+
+        version, trace_id, span_id, flags, rest = match.groups()
+        if version == "ff" or (version == "00" and rest is not None):
+            return None
+        if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+            return None
+
+        return cls(
+            trace_id=trace_id,
+            span_id=span_id,
+            sampled=bool(int(flags, 16) & _SAMPLED_FLAG),
+        )
+
+    def to_traceparent(self) -> str:
+        """Format the context as a version 00 traceparent header value."""
+        flags = _SAMPLED_FLAG if self.sampled else 0
+        return f"00-{self.trace_id}-{self.span_id}-{flags:02x}"
+
+
+def _random_id(bits: int) -> str:
+    """Return a random non-zero ID of the given size as lowercase hex."""
+    value = 0
+    while value == 0:
+        value = random.getrandbits(bits)
+    return f"{value:0{bits // 4}x}"
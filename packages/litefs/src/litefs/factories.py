@@ -1,13 +1,22 @@
-"""Factory functions for creating leader election instances.
+"""Factory functions for creating leader election and metrics instances.
 
-Provides factory methods to instantiate leader election implementations
-from settings. Handles optional dependency imports gracefully.
+Provides factory methods to instantiate leader election and metrics
+implementations from settings. Handles optional dependency imports gracefully.
 """
 
 from __future__ import annotations
 
+import threading
+from typing import Any
+
 from litefs.domain.settings import LiteFSSettings
-from litefs.adapters.ports import RaftLeaderElectionPort
+from litefs.adapters.metrics_port import MetricsPort, NoOpMetricsAdapter
+from litefs.adapters.ports import RaftLeaderElectionPort, RaftMembershipPort
+
+# Prometheus collectors are registered process-wide, so one adapter is
+# shared per prefix; the bucket layouts of the first settings win
+_prometheus_adapters: dict[str, MetricsPort] = {}
+_prometheus_adapters_lock = threading.Lock()
 
 
 class PyLeaderNotInstalledError(ImportError):
@@ -26,8 +35,8 @@ class PyLeaderNotInstalledError(ImportError):
 def create_raft_leader_election(
     settings: LiteFSSettings,
     node_id: str,
-    election_timeout: float = 5.0,
-    heartbeat_interval: float = 1.0,
+    election_timeout: float | None = None,
+    heartbeat_interval: float | None = None,
 ) -> RaftLeaderElectionPort:
     """Create a RaftLeaderElection instance from LiteFSSettings.
 
@@ -37,9 +46,18 @@ def create_raft_leader_election(
     Args:
         settings: LiteFSSettings configured for Raft leader election.
                  Must have leader_election="raft" with valid raft_self_addr and raft_peers.
+                 If raft_self_addr is one of raft_observers, the node observes
+                 the voters in raft_peers without voting. With
+                 raft_dynamic_membership, members saved to
+                 raft_membership_file replace raft_peers. raft_priorities
+                 prefer some voters as leader. raft_adaptive_timeouts
+                 derives the timing from measured delays. raft_pre_vote
+                 and raft_check_quorum protect a stable leader. With
+                 raft_event_loop, the node runs on the running event loop
+                 (AsyncRaftLeaderElection).
         node_id: Unique identifier for this node in the cluster.
-        election_timeout: Timeout in seconds for election (default 5.0, must be > heartbeat_interval).
-        heartbeat_interval: Interval in seconds for leader heartbeats (default 1.0, must be > 0).
+        election_timeout: Timeout in seconds for election (default settings.raft_election_timeout, must be > heartbeat_interval).
+        heartbeat_interval: Interval in seconds for leader heartbeats (default settings.raft_heartbeat_interval, must be > 0).
 
     Returns:
         A RaftLeaderElectionPort implementation (RaftLeaderElection from py-leader).
@@ -49,6 +67,8 @@ def create_raft_leader_election(
         ValueError: If settings.leader_election != "raft" or required Raft config is missing.
         ValueError: If election_timeout <= heartbeat_interval or if either is <= 0.
         ValueError: If node_id not in cluster_members.
+        RaftLeaderElectionError: If raft_event_loop is set and no event loop
+            runs in this thread.
 
     Example:
         >>> settings = LiteFSSettings(
@@ -76,20 +96,139 @@ def create_raft_leader_election(
     if settings.raft_peers is None:
         raise ValueError("settings.raft_peers is required for Raft leader election")
 
-    # Build cluster members list: self + peers
-    cluster_members = [settings.raft_self_addr, *settings.raft_peers]
+    # Build cluster members list: self + peers, unless self is an observer
+    observers = list(settings.raft_observers or [])
+    if settings.raft_self_addr in observers:
+        cluster_members = list(settings.raft_peers)
+    else:
+        cluster_members = [settings.raft_self_addr, *settings.raft_peers]
 
     # Import py-leader (optional dependency)
     try:
-        from py_leader import RaftLeaderElection  # type: ignore[import-not-found]
+        from py_leader import (  # type: ignore[import-not-found]
+            AsyncRaftLeaderElection,
+            RaftLeaderElection,
+        )
     except ImportError as exc:
         raise PyLeaderNotInstalledError() from exc
+    election_class = (
+        AsyncRaftLeaderElection if settings.raft_event_loop else RaftLeaderElection
+    )
+
+    kwargs: dict[str, Any] = {}
+    if settings.raft_cluster_metadata:
+        kwargs["replicate_metadata"] = True
+        kwargs["forwarding_url"] = settings.raft_forwarding_url
+    if observers:
+        kwargs["observers"] = observers
+    if settings.raft_dynamic_membership:
+        kwargs["dynamic_membership"] = True
+        kwargs["membership_file"] = settings.raft_membership_file
+    if settings.raft_priorities:
+        kwargs["priorities"] = dict(settings.raft_priorities)
+        kwargs["rebalance_after"] = settings.raft_rebalance_after
+    if settings.raft_adaptive_timeouts:
+        kwargs["adaptive_timeouts"] = True
+        kwargs["min_election_timeout"] = settings.raft_min_election_timeout
+        kwargs["min_heartbeat_interval"] = settings.raft_min_heartbeat_interval
+    if not settings.raft_pre_vote:
+        kwargs["pre_vote"] = False
+    if not settings.raft_check_quorum:
+        kwargs["check_quorum"] = False
 
     # RaftLeaderElection implements RaftLeaderElectionPort
-    result: RaftLeaderElectionPort = RaftLeaderElection(
+    result: RaftLeaderElectionPort = election_class(
         node_id=node_id,
         cluster_members=cluster_members,
-        election_timeout=election_timeout,
-        heartbeat_interval=heartbeat_interval,
+        election_timeout=(
+            settings.raft_election_timeout
+            if election_timeout is None
+            else election_timeout
+        ),
+        heartbeat_interval=(
+            settings.raft_heartbeat_interval
+            if heartbeat_interval is None
+            else heartbeat_interval
+        ),
+        **kwargs,
     )
     return result
+
+
+def create_raft_membership_client(
+    settings: LiteFSSettings,
+    node: str | None = None,
+    timeout: float = 10.0,
+) -> RaftMembershipPort:
+    """Create a client changing the voting members of the running cluster.
+
+    The client sends membership changes to the Raft port of a voting
+    member, which forwards them to the leader. It works from another
+    process, such as a management command.
+
+    Args:
+        settings: LiteFSSettings configured for Raft leader election with
+                 raft_dynamic_membership.
+        node: Raft address of the member to talk to. Defaults to
+              raft_self_addr, or the first of raft_peers on an observer.
+        timeout: Seconds to wait for each command.
+
+    Returns:
+        A RaftMembershipPort implementation (RaftMembershipClient from py-leader).
+
+    Raises:
+        PyLeaderNotInstalledError: If py-leader is not installed.
+        ValueError: If settings do not enable dynamic Raft membership.
+    """
+    if settings.leader_election != "raft" or not settings.raft_dynamic_membership:
+        raise ValueError("settings.raft_dynamic_membership is not enabled")
+
+    if node is None:
+        if settings.raft_self_addr in (settings.raft_observers or []):
+            node = (settings.raft_peers or [None])[0]
+        else:
+            node = settings.raft_self_addr
+    if node is None:
+        raise ValueError("no Raft member address to connect to")
+
+    try:
+        from py_leader import RaftMembershipClient  # type: ignore[import-not-found]
+    except ImportError as exc:
+        raise PyLeaderNotInstalledError() from exc
+
+    client: RaftMembershipPort = RaftMembershipClient(node, timeout=timeout)
+    return client
+
+
+def create_metrics_adapter(settings: LiteFSSettings) -> MetricsPort:
+    """Create the metrics adapter configured by LiteFSSettings.
+
+    Returns a PrometheusMetricsAdapter when settings.metrics_enabled is set,
+    and a NoOpMetricsAdapter otherwise. Prometheus adapters are created once
+    per metrics prefix and shared, since prometheus-client rejects metrics
+    registered twice under the same name.
+
+    Args:
+        settings: LiteFSSettings with the metrics configuration.
+
+    Returns:
+        MetricsPort implementation.
+
+    Raises:
+        ImportError: If metrics are enabled and prometheus-client is not
+                    installed.
+    """
+    if not settings.metrics_enabled:
+        return NoOpMetricsAdapter()
+
+    from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+    with _prometheus_adapters_lock:
+        adapter = _prometheus_adapters.get(settings.metrics_prefix)
+        if adapter is None:
+            adapter = PrometheusMetricsAdapter(
+                prefix=settings.metrics_prefix,
+                histogram_buckets=settings.metrics_histogram_buckets,
+            )
+            _prometheus_adapters[settings.metrics_prefix] = adapter
+        return adapter
@@ -0,0 +1,546 @@
+"""Shared service container for framework adapters.
+
+Health, readiness and failover endpoints need the same graph of objects:
+detectors, the leader election port, the failover coordinator and the
+checkers built on top of them. Building that graph per request is wasteful
+and, in Raft mode, wrong: every new RaftLeaderElection starts its own
+PySyncObj node. LiteFSServices builds each object once, on first use, and
+shares it for the lifetime of the container.
+
+Framework adapters decide the container's lifetime: litefs_django keeps a
+process-wide instance rebuilt when settings change, litefs_fastapi ties
+one to the application lifespan.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from litefs.adapters.metrics_port import MetricsPort
+from litefs.adapters.ports import (
+    ClusterMetadataPort,
+    EnvironmentNodeIDResolver,
+    FencingEpochPort,
+    LeaderElectionPort,
+    NodeIDResolverPort,
+    RaftLeaderElectionPort,
+    RaftTimingPort,
+)
+from litefs.adapters.static_leader_election import StaticLeaderElection
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.health import (
+    FREE_DISK,
+    FUSE_READ_LATENCY,
+    QUERY_LATENCY,
+    REPLICATION_LAG,
+    WAL_SIZE,
+)
+from litefs.domain.metrics import RAFT_PEER_RTT
+from litefs.domain.settings import LiteFSSettings, ReplicationSettings
+from litefs.usecases.epoch_fence import EpochFence
+from litefs.usecases.failover_coordinator import FailoverCoordinator
+from litefs.usecases.forwarding_status import ForwardingStatus
+from litefs.usecases.health_checker import HealthChecker
+from litefs.usecases.health_probes import (
+    ActiveHealthMonitor,
+    FreeDiskProbe,
+    FuseReadLatencyProbe,
+    HealthProbe,
+    HealthState,
+    QueryLatencyProbe,
+    ReplicationLagProbe,
+    WalSizeProbe,
+)
+from litefs.usecases.liveness_checker import LivenessChecker
+from litefs.usecases.primary_detector import PrimaryDetector
+from litefs.usecases.primary_initializer import PrimaryInitializer
+from litefs.usecases.readiness_checker import ReadinessChecker
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
+from litefs.usecases.route_stats import RouteStatsCollector
+from litefs.usecases.split_brain_detector import (
+    SplitBrainDetector,
+    SplitBrainMonitor,
+)
+from litefs.usecases.txid_rate_tracker import TxidRateTracker
+
+if TYPE_CHECKING:
+    from litefs.adapters.prometheus_exposition import PrometheusExposition
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LiteFSServices:
+    """Lazily built, shared LiteFS use case objects for one configuration.
+
+    Each member is created on first access and then reused. Members depend
+    on each other (the readiness checker uses the health checker, which
+    uses the replication lag checker, ...), so accessing one member may
+    build several.
+
+    Thread safety:
+        Members are created under a reentrant lock, so concurrent first
+        accesses build each object exactly once.
+    """
+
+    def __init__(
+        self,
+        settings: LiteFSSettings,
+        node_id_resolver: NodeIDResolverPort | None = None,
+        leader_election_factory: (
+            Callable[[LiteFSSettings, str], RaftLeaderElectionPort] | None
+        ) = None,
+    ) -> None:
+        """Initialize the container. No member is built until first use.
+
+        Args:
+            settings: LiteFS configuration shared by all members.
+            node_id_resolver: Resolver for this node's ID. Defaults to
+                             EnvironmentNodeIDResolver.
+            leader_election_factory: Creates the Raft leader election.
+                                    Defaults to create_raft_leader_election.
+        """
+        self._settings = settings
+        self._node_id_resolver = node_id_resolver or EnvironmentNodeIDResolver()
+        self._leader_election_factory = leader_election_factory
+        self._members: dict[str, object] = {}
+        self._lock = threading.RLock()
+        self._closed = False
+        self._demotion_thread: threading.Thread | None = None
+
+    @property
+    def settings(self) -> LiteFSSettings:
+        """LiteFS configuration the members were built from."""
+        return self._settings
+
+    @property
+    def metrics(self) -> MetricsPort:
+        """Metrics adapter: Prometheus if metrics are enabled, else no-op."""
+        from litefs.factories import create_metrics_adapter
+
+        return self._get_or_create(
+            "metrics", lambda: create_metrics_adapter(self._settings)
+        )
+
+    @property
+    def metrics_exposition(self) -> PrometheusExposition | None:
+        """Renderer for /metrics endpoints, or None if metrics are disabled.
+
+        Raises:
+            ImportError: If metrics are enabled and prometheus-client is not
+                        installed.
+        """
+        return self._get_or_create("metrics_exposition", self._create_exposition)
+
+    @property
+    def route_stats(self) -> RouteStatsCollector | None:
+        """Per-route traffic statistics, or None if they are disabled."""
+        return self._get_or_create("route_stats", self._create_route_stats)
+
+    @property
+    def forwarding_status(self) -> ForwardingStatus:
+        """Write forwarding counters and circuit breaker state."""
+        return self._get_or_create("forwarding_status", ForwardingStatus)
+
+    @property
+    def node_id(self) -> str:
+        """ID of this node, resolved once."""
+        return self._get_or_create("node_id", self._node_id_resolver.resolve_node_id)
+
+    @property
+    def primary_detector(self) -> PrimaryDetector:
+        """Detector reading the LiteFS .primary file."""
+        return self._get_or_create(
+            "primary_detector", lambda: PrimaryDetector(self._settings.mount_path)
+        )
+
+    @property
+    def position_reader(self) -> ReplicationPositionReader:
+        """Reader for the local replication position."""
+        return self._get_or_create(
+            "position_reader",
+            lambda: ReplicationPositionReader(
+                self._settings.mount_path, self._settings.database_name
+            ),
+        )
+
+    @property
+    def txid_rate_tracker(self) -> TxidRateTracker:
+        """Tracker of the primary's TXID rate, observed across checks."""
+        return self._get_or_create(
+            "txid_rate_tracker",
+            lambda: TxidRateTracker(
+                window_seconds=self._replication_settings.rate_window_seconds
+            ),
+        )
+
+    @property
+    def leader_election(self) -> LeaderElectionPort:
+        """Leader election port for the configured election mode.
+
+        In Raft mode this starts the Raft node, so it is created only when
+        a member needing it is first used.
+
+        Raises:
+            LiteFSConfigError: If static mode has no static leader config.
+            PyLeaderNotInstalledError: If Raft mode is used without py-leader.
+        """
+        return self._get_or_create("leader_election", self._create_leader_election)
+
+    @property
+    def failover_coordinator(self) -> FailoverCoordinator:
+        """Coordinator tracking this node's PRIMARY/REPLICA state.
+
+        With a Raft election, the state follows the election after every
+        round of the cluster state monitor.
+        """
+        return self._get_or_create(
+            "failover_coordinator", self._create_failover_coordinator
+        )
+
+    @property
+    def split_brain_detector(self) -> SplitBrainDetector | None:
+        """Split-brain detector, or None when the election has no cluster view.
+
+        Only Raft elections expose the cluster state needed to detect
+        multiple leaders.
+        """
+        return self._get_or_create("split_brain_detector", self._create_split_brain)
+
+    @property
+    def epoch_fence(self) -> EpochFence | None:
+        """Fence admitting writes under the leader epoch, or None.
+
+        Only elections exposing a leader epoch can fence writes.
+        """
+        return self._get_or_create("epoch_fence", self._create_epoch_fence)
+
+    @property
+    def split_brain_monitor(self) -> SplitBrainMonitor | None:
+        """Running background split-brain detection, or None.
+
+        Available when writes are fenced by epoch, which makes a split-brain
+        query before each write unnecessary. This is the cluster state
+        monitor, so the peers are queried once per election timeout for
+        both split-brain detection and replication lag.
+        """
+        if self.epoch_fence is None:
+            return None
+        return self.cluster_state_monitor
+
+    @property
+    def cluster_state_monitor(self) -> SplitBrainMonitor | None:
+        """Running background query of the cluster state, or None.
+
+        Available with Raft elections. Every election timeout, the peers'
+        /health/position endpoints are queried for the leader's TXID and
+        for split-brain detection, so replication lag checks and requests
+        read the snapshot without network calls. Started on first access
+        and stopped by close().
+        """
+        return self._get_or_create(
+            "cluster_state_monitor", self._create_cluster_state_monitor
+        )
+
+    @property
+    def replication_lag_checker(self) -> ReplicationLagChecker:
+        """Checker comparing the local TXID to the primary's."""
+        return self._get_or_create(
+            "replication_lag_checker", self._create_replication_lag_checker
+        )
+
+    @property
+    def health_checker(self) -> HealthChecker:
+        """Node health checker including replication lag."""
+        return self._get_or_create(
+            "health_checker",
+            lambda: HealthChecker(
+                primary_detector=self.primary_detector,
+                lag_checker=self.replication_lag_checker,
+                metrics=self.metrics,
+                probe_monitor=self.health_monitor,
+            ),
+        )
+
+    @property
+    def health_monitor(self) -> ActiveHealthMonitor | None:
+        """Running active health monitor, or None if probes are disabled.
+
+        Started on first access and stopped by close(). When the node
+        becomes unhealthy, the failover coordinator is marked unhealthy and
+        steps down in a background thread; it is marked healthy again once
+        the node recovers.
+        """
+        return self._get_or_create("health_monitor", self._create_health_monitor)
+
+    @property
+    def liveness_checker(self) -> LivenessChecker:
+        """Checker for whether LiteFS is running."""
+        return self._get_or_create(
+            "liveness_checker",
+            lambda: LivenessChecker(primary_detector=self.primary_detector),
+        )
+
+    @property
+    def readiness_checker(self) -> ReadinessChecker:
+        """Checker for whether this node can accept traffic."""
+        return self._get_or_create(
+            "readiness_checker",
+            lambda: ReadinessChecker(
+                health_checker=self.health_checker,
+                failover_coordinator=self.failover_coordinator,
+            ),
+        )
+
+    def close(self) -> None:
+        """Release members holding resources and forget all members.
+
+        Shuts down the Raft node, if one was started. The container must
+        not be used afterwards.
+        """
+        with self._lock:
+            election = self._members.get("leader_election")
+            monitor = self._members.get("health_monitor")
+            cluster_state_monitor = self._members.get("cluster_state_monitor")
+            demotion = self._demotion_thread
+            self._members.clear()
+            self._closed = True
+
+        if isinstance(monitor, ActiveHealthMonitor):
+            monitor.stop(timeout=1.0)
+        if demotion is not None:
+            demotion.join(timeout=1.0)
+        if isinstance(cluster_state_monitor, SplitBrainMonitor):
+            cluster_state_monitor.stop(timeout=1.0)
+
+        destroy = getattr(election, "destroy", None)
+        if callable(destroy):
+            try:
+                destroy()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to shut down leader election: {e}", exc_info=True
+                )
+
+    @property
+    def _replication_settings(self) -> ReplicationSettings:
+        """Replication settings, with defaults when not configured."""
+        return self._settings.replication or ReplicationSettings()
+
+    def _get_or_create(self, name: str, factory: Callable[[], T]) -> T:
+        """Return a member, creating it on first access.
+
+        Raises:
+            RuntimeError: If the container was closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("LiteFSServices has been closed")
+            if name not in self._members:
+                self._members[name] = factory()
+            return self._members[name]  # type: ignore[return-value]
+
+    def _create_exposition(self) -> PrometheusExposition | None:
+        """Create the metrics exposition if metrics are enabled."""
+        if not self._settings.metrics_enabled:
+            return None
+
+        from litefs.adapters.prometheus_exposition import PrometheusExposition
+
+        # Registers the LiteFS collectors before the first render
+        self.metrics  # noqa: B018
+        return PrometheusExposition(ttl=self._settings.metrics_exposition_ttl)
+
+    def _create_route_stats(self) -> RouteStatsCollector | None:
+        """Create the per-route statistics collector if enabled."""
+        route_stats = self._settings.route_stats
+        if route_stats is None or not route_stats.enabled:
+            return None
+        return RouteStatsCollector(
+            max_routes=route_stats.max_routes,
+            relative_accuracy=route_stats.relative_accuracy,
+        )
+
+    def _create_health_monitor(self) -> ActiveHealthMonitor | None:
+        """Create and start the active health monitor if enabled."""
+        probe_settings = self._settings.health_probes
+        if probe_settings is None or not probe_settings.enabled:
+            return None
+
+        monitor = ActiveHealthMonitor(
+            interval=probe_settings.interval,
+            failure_threshold=probe_settings.failure_threshold,
+            recovery_threshold=probe_settings.recovery_threshold,
+            on_state_change=self._on_health_state_change,
+            metrics=self.metrics,
+        )
+        mount_path = Path(self._settings.mount_path)
+        database_path = mount_path / self._settings.database_name
+        # The lag checker is resolved on each run: building it may start Raft
+        probes: dict[str, HealthProbe] = {
+            FUSE_READ_LATENCY: FuseReadLatencyProbe(
+                mount_path / f"{self._settings.database_name}-pos"
+            ),
+            QUERY_LATENCY: QueryLatencyProbe(database_path),
+            WAL_SIZE: WalSizeProbe(database_path),
+            FREE_DISK: FreeDiskProbe(self._settings.data_path),
+            REPLICATION_LAG: ReplicationLagProbe(
+                lambda: self.replication_lag_checker.check_lag()
+            ),
+        }
+        for name, probe in probes.items():
+            thresholds = probe_settings.probe_thresholds(name)
+            if thresholds is not None:
+                monitor.add_probe(probe, thresholds)
+        monitor.start()
+        return monitor
+
+    def _on_health_state_change(
+        self, previous: HealthState, current: HealthState
+    ) -> None:
+        """Keep the failover coordinator's health in step with the probes."""
+        coordinator = self.failover_coordinator
+        if current == "unhealthy":
+            coordinator.mark_unhealthy()
+            self._start_health_demotion(coordinator)
+        elif previous == "unhealthy":
+            coordinator.mark_healthy()
+
+    def _start_health_demotion(self, coordinator: FailoverCoordinator) -> None:
+        """Step down in a daemon thread, unless a demotion is still running.
+
+        A Raft leadership transfer blocks until a follower takes over, and
+        the state change callback runs on the probe thread: demoting there
+        would stall the probe rounds for the length of the transfer.
+        """
+        with self._lock:
+            thread = self._demotion_thread
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(
+                target=self._demote_for_health,
+                args=(coordinator,),
+                name="litefs-health-demotion",
+                daemon=True,
+            )
+            self._demotion_thread = thread
+        thread.start()
+
+    @staticmethod
+    def _demote_for_health(coordinator: FailoverCoordinator) -> None:
+        """Demote the node, logging failures of the demotion thread."""
+        try:
+            coordinator.demote_for_health()
+        except Exception:
+            logger.exception("Health demotion failed")
+
+    def _create_leader_election(self) -> LeaderElectionPort:
+        """Create the leader election port for the configured mode."""
+        if self._settings.leader_election == "static":
+            if self._settings.static_leader_config is None:
+                raise LiteFSConfigError(
+                    "Static leader election configured but no config found"
+                )
+            initializer = PrimaryInitializer(self._settings.static_leader_config)
+            return StaticLeaderElection(initializer, self.node_id)
+
+        factory = self._leader_election_factory
+        if factory is None:
+            from litefs.factories import create_raft_leader_election
+
+            factory = create_raft_leader_election
+        election = factory(self._settings, self.node_id)
+        if isinstance(election, RaftTimingPort):
+            self._report_raft_timing(election)
+        return election
+
+    def _report_raft_timing(self, election: RaftTimingPort) -> None:
+        """Export the election's heartbeat round trips and timing as metrics."""
+        metrics = self.metrics
+        metrics.set_raft_timing(
+            election.get_heartbeat_interval(), election.get_election_timeout()
+        )
+        election.add_rtt_listener(
+            lambda peer, rtt: metrics.observe_histogram(
+                RAFT_PEER_RTT, rtt, {"peer": peer}
+            )
+        )
+        election.add_timing_listener(metrics.set_raft_timing)
+
+    def _create_failover_coordinator(self) -> FailoverCoordinator:
+        """Create the coordinator, synced by the cluster state monitor."""
+        coordinator = FailoverCoordinator(self.leader_election, metrics=self.metrics)
+        monitor = self.cluster_state_monitor
+        if monitor is not None:
+            monitor.add_listener(lambda _status: coordinator.coordinate_transition())
+        return coordinator
+
+    def _create_split_brain(self) -> SplitBrainDetector | None:
+        """Create a split-brain detector for Raft elections."""
+        election = self.leader_election
+        if not isinstance(election, RaftLeaderElectionPort):
+            return None
+
+        from litefs.adapters.split_brain_detector_adapter import (
+            SplitBrainDetectorAdapter,
+        )
+
+        # Remote leadership is read locally when the election replicates it
+        cluster_metadata = (
+            election if isinstance(election, ClusterMetadataPort) else None
+        )
+        return SplitBrainDetector(
+            SplitBrainDetectorAdapter(
+                election, self.node_id, cluster_metadata=cluster_metadata
+            ),
+            metrics=self.metrics,
+        )
+
+    def _create_epoch_fence(self) -> EpochFence | None:
+        """Create the epoch fence if the election exposes its epoch."""
+        election = self.leader_election
+        if not isinstance(election, FencingEpochPort):
+            return None
+        return EpochFence(election, metrics=self.metrics)
+
+    def _create_cluster_state_monitor(self) -> SplitBrainMonitor | None:
+        """Create and start background cluster state queries for Raft."""
+        election = self.leader_election
+        if not isinstance(election, RaftLeaderElectionPort):
+            return None
+
+        from litefs.adapters.split_brain_detector_adapter import (
+            SplitBrainDetectorAdapter,
+        )
+
+        # Without cluster metadata, so that peers report their TXIDs
+        monitor = SplitBrainMonitor(
+            SplitBrainDetector(
+                SplitBrainDetectorAdapter(election, self.node_id),
+                metrics=self.metrics,
+            ),
+            interval=election.get_election_timeout(),
+        )
+        monitor.start()
+        return monitor
+
+    def _create_replication_lag_checker(self) -> ReplicationLagChecker:
+        """Create the replication lag checker.
+
+        With a Raft election, replicas compute their lag against the
+        leader's TXID from the background cluster state queries.
+        """
+        return ReplicationLagChecker(
+            position_reader=self.position_reader,
+            primary_detector=self.primary_detector,
+            settings=self._replication_settings,
+            rate_tracker=self.txid_rate_tracker,
+            metrics=self.metrics,
+            cluster_state_monitor=self.cluster_state_monitor,
+        )
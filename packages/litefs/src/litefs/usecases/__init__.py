@@ -7,12 +7,35 @@ from litefs.usecases.primary_marker_writer import PrimaryMarkerWriter
 from litefs.usecases.sql_detector import SQLDetector
 from litefs.usecases.health_checker import HealthChecker
 from litefs.usecases.failover_coordinator import FailoverCoordinator
-from litefs.usecases.split_brain_detector import SplitBrainDetector, SplitBrainStatus
+from litefs.usecases.split_brain_detector import (
+    SplitBrainDetector,
+    SplitBrainMonitor,
+    SplitBrainStatus,
+)
+from litefs.usecases.epoch_fence import EpochFence, TransactionFence
 from litefs.usecases.liveness_checker import LivenessChecker
 from litefs.usecases.readiness_checker import ReadinessChecker
 from litefs.usecases.primary_url_detector import PrimaryURLDetector
 from litefs.usecases.primary_url_resolver import PrimaryURLResolver
 from litefs.usecases.path_exclusion_matcher import PathExclusionMatcher
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.usecases.txid_rate_tracker import TxidRateTracker
+from litefs.usecases.txid_waiter import TxidWaiter
+from litefs.usecases.change_bus import ChangeBus
+from litefs.usecases.health_probes import ActiveHealthMonitor
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator, SnapshotResponse
+from litefs.usecases.query_cache import CachedQueryResult, QueryResultCache
+from litefs.usecases.server_timing import ServerTiming, TimingSpan
+from litefs.usecases.route_stats import LatencySketch, RouteStatsCollector
+from litefs.usecases.forwarding_status import ForwardingStatus
+from litefs.usecases.slow_query_log import SlowQuery, SlowQueryLog
+from litefs.usecases.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheKey,
+    cache_by_txid,
+)
 from litefs.usecases.installation_checker import (
     InstallationChecker,
     InstallationCheckResult,
@@ -28,12 +51,36 @@ __all__ = [
     "HealthChecker",
     "FailoverCoordinator",
     "SplitBrainDetector",
+    "SplitBrainMonitor",
     "SplitBrainStatus",
+    "EpochFence",
+    "TransactionFence",
     "LivenessChecker",
     "ReadinessChecker",
     "PrimaryURLDetector",
     "PrimaryURLResolver",
     "PathExclusionMatcher",
+    "ReplicationPositionReader",
+    "ReplicationLagChecker",
+    "TxidRateTracker",
+    "TxidWaiter",
+    "ChangeBus",
+    "ActiveHealthMonitor",
+    "HealthSnapshotEvaluator",
+    "SnapshotResponse",
+    "CachedQueryResult",
+    "QueryResultCache",
+    "ServerTiming",
+    "TimingSpan",
+    "LatencySketch",
+    "RouteStatsCollector",
+    "ForwardingStatus",
+    "SlowQuery",
+    "SlowQueryLog",
+    "CachedResponse",
+    "ResponseCache",
+    "ResponseCacheKey",
+    "cache_by_txid",
     "InstallationChecker",
     "InstallationCheckResult",
     "InstallationStatus",
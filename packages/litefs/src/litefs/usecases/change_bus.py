@@ -0,0 +1,271 @@
+"""Change bus use case for reacting to replicated transactions.
+
+Applications on replicas often need to react when new data arrives, e.g.
+to bust caches, push websocket updates or refresh search indexes. Instead
+of polling the database, they subscribe to a ChangeBus, which watches the
+LiteFS position file and publishes ReplicationChangeEvent objects.
+
+Bursts of transactions are coalesced: after publishing, the bus waits
+``min_interval`` before checking again, and every event covers all
+transactions applied since the previous one. Subscribers therefore see at
+most one event per interval no matter how many transactions arrive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from litefs.adapters.ports import RealTimeProvider, TimeProvider
+from litefs.domain.events import ReplicationChangeEvent
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.usecases.primary_detector import LiteFSNotRunningError
+
+if TYPE_CHECKING:
+    from litefs.adapters.ports import FileWatcherPort
+    from litefs.usecases.replication_lag_checker import (
+        ReplicationPositionReaderProtocol,
+    )
+
+logger = logging.getLogger(__name__)
+
+ChangeSubscriber = Callable[[ReplicationChangeEvent], None]
+
+# Longest uninterrupted watcher wait, bounding how long stop() takes
+_STOP_CHECK_INTERVAL = 0.1
+
+
+class ChangeBus:
+    """Publishes local replication position changes to in-process subscribers.
+
+    Subscribers are either synchronous callbacks or asyncio queues:
+    - Callbacks run one after another on the bus thread (or the thread
+      calling check()). A slow callback delays the next check, so the
+      transactions applied meanwhile are delivered as one event.
+    - Queues are bounded. When a queue is full, its pending events are
+      merged with the new one, so a consumer that falls behind receives a
+      single event spanning everything it missed.
+
+    The bus checks the position whenever the file watcher reports a change
+    and at least every ``poll_interval`` seconds, since LiteFS's FUSE mount
+    does not always emit file notifications.
+
+    Thread safety:
+        Subscription methods are protected by an internal lock and may be
+        called from any thread.
+    """
+
+    def __init__(
+        self,
+        position_reader: ReplicationPositionReaderProtocol,
+        watcher: FileWatcherPort | None = None,
+        time_provider: TimeProvider | None = None,
+        poll_interval: float = 0.5,
+        min_interval: float = 0.1,
+    ) -> None:
+        """Initialize the change bus.
+
+        Args:
+            position_reader: Reader for the local replication position.
+            watcher: Optional watcher for the position file. If None, the
+                    bus only polls.
+            time_provider: Clock used to timestamp events. Defaults to
+                          RealTimeProvider.
+            poll_interval: Maximum delay in seconds between position checks.
+            min_interval: Minimum delay in seconds between two published
+                         events. Changes within it are coalesced.
+        """
+        self._position_reader = position_reader
+        self._watcher = watcher
+        self._time_provider = time_provider or RealTimeProvider()
+        self._poll_interval = poll_interval
+        self._min_interval = min_interval
+        self._subscribers: list[ChangeSubscriber] = []
+        self._queues: list[
+            tuple[asyncio.AbstractEventLoop, asyncio.Queue[ReplicationChangeEvent]]
+        ] = []
+        self._lock = threading.Lock()
+        self._last_txid: int | None = None
+        self._primed = False
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, callback: ChangeSubscriber) -> Callable[[], None]:
+        """Register a synchronous callback.
+
+        Exceptions raised by the callback are logged and do not affect
+        other subscribers.
+
+        Args:
+            callback: Called with each ReplicationChangeEvent.
+
+        Returns:
+            Function that removes the subscription.
+        """
+        with self._lock:
+            self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if callback in self._subscribers:
+                    self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def subscribe_queue(
+        self,
+        maxsize: int = 1,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> asyncio.Queue[ReplicationChangeEvent]:
+        """Create an asyncio queue receiving change events.
+
+        Args:
+            maxsize: Maximum number of pending events. Must be at least 1.
+            loop: Event loop owning the queue. Defaults to the running loop.
+
+        Returns:
+            Queue to read events from. Remove it with unsubscribe_queue().
+
+        Raises:
+            ValueError: If maxsize is less than 1.
+            RuntimeError: If no loop is given and none is running.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        owner = loop or asyncio.get_running_loop()
+        queue: asyncio.Queue[ReplicationChangeEvent] = asyncio.Queue(maxsize)
+        with self._lock:
+            self._queues.append((owner, queue))
+        return queue
+
+    def unsubscribe_queue(self, queue: asyncio.Queue[ReplicationChangeEvent]) -> None:
+        """Stop delivering events to a queue.
+
+        Args:
+            queue: Queue returned by subscribe_queue().
+        """
+        with self._lock:
+            self._queues = [entry for entry in self._queues if entry[1] is not queue]
+
+    def check(self) -> ReplicationChangeEvent | None:
+        """Read the position and publish an event if the TXID changed.
+
+        The first check only records the starting position.
+
+        Returns:
+            The published event, or None if nothing changed.
+        """
+        try:
+            position = self._position_reader.read_position()
+        except (LiteFSNotRunningError, LiteFSConfigError) as e:
+            logger.warning(f"Failed to read replication position: {e}")
+            return None
+
+        txid = position.txid if position is not None else None
+        if not self._primed:
+            self._primed = True
+            self._last_txid = txid
+            return None
+        if txid is None or txid == self._last_txid:
+            return None
+
+        event = ReplicationChangeEvent(
+            old_txid=self._last_txid,
+            new_txid=txid,
+            timestamp=self._time_provider.get_time_seconds(),
+        )
+        self._last_txid = txid
+        self._publish(event)
+        return event
+
+    def start(self) -> None:
+        """Start watching in a daemon thread. Does nothing if running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="litefs-change-bus", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread and close the watcher.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread.
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        if self._watcher is not None:
+            self._watcher.close()
+
+    def _run(self) -> None:
+        """Check the position until stopped."""
+        self.check()
+        while not self._stop_event.is_set():
+            self._wait_for_change()
+            if self._stop_event.is_set():
+                return
+            if self.check() is not None:
+                # Coalesce the rest of a burst into the next event
+                self._stop_event.wait(self._min_interval)
+
+    def _wait_for_change(self) -> None:
+        """Wait for a watcher notification, the poll interval, or stop()."""
+        if self._watcher is None:
+            self._stop_event.wait(self._poll_interval)
+            return
+
+        deadline = time.monotonic() + self._poll_interval
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if self._watcher.wait(min(remaining, _STOP_CHECK_INTERVAL)):
+                return
+
+    def _publish(self, event: ReplicationChangeEvent) -> None:
+        """Deliver an event to all subscribers."""
+        with self._lock:
+            subscribers = list(self._subscribers)
+            queues = list(self._queues)
+
+        for callback in subscribers:
+            try:
+                callback(event)
+            except Exception:
+                logger.exception("Change bus subscriber failed")
+
+        for loop, queue in queues:
+            try:
+                loop.call_soon_threadsafe(_put_coalesced, queue, event)
+            except RuntimeError:
+                # Event loop closed: the subscriber is gone
+                self.unsubscribe_queue(queue)
+
+
+def _put_coalesced(
+    queue: asyncio.Queue[ReplicationChangeEvent], event: ReplicationChangeEvent
+) -> None:
+    """Add an event to a queue, merging pending events if it is full.
+
+    Must run in the queue's event loop.
+    """
+    if queue.full():
+        merged = queue.get_nowait()
+        while not queue.empty():
+            merged = merged.merge(queue.get_nowait())
+        event = merged.merge(event)
+    queue.put_nowait(event)
@@ -33,6 +33,14 @@ class ConfigGenerator:
                 settings.proxy.primary_redirect_timeout
             )
 
+        # Raft membership: voting peers and non-voting observers listed apart
+        lease_config: dict[str, object] = {"type": settings.leader_election}
+        if settings.leader_election == "raft":
+            lease_config["self_addr"] = settings.raft_self_addr
+            lease_config["peers"] = list(settings.raft_peers or [])
+            if settings.raft_observers:
+                lease_config["observers"] = list(settings.raft_observers)
+
         config = {
             "fuse": {
                 "dir": settings.mount_path,
@@ -45,9 +53,7 @@ class ConfigGenerator:
                     "path": settings.database_name,
                 }
             ],
-            "lease": {
-                "type": settings.leader_election,
-            },
+            "lease": lease_config,
             "proxy": proxy_config,
         }
 
@@ -45,6 +45,12 @@ class ConfigParser:
         if not database_name or not database_name.strip():
             raise LiteFSConfigError("database path cannot be empty")
 
+        # Extract Raft membership from the lease section
+        lease = config["lease"]
+        raft_self_addr = lease.get("self_addr")
+        raft_peers = lease.get("peers")
+        raft_observers = lease.get("observers")
+
         # Extract optional proxy.addr field (default to empty string)
         proxy_addr = ""
         if "proxy" in config and isinstance(config["proxy"], dict):
@@ -62,8 +68,9 @@ class ConfigParser:
             proxy_addr=proxy_addr,
             enabled=True,  # Default for non-YAML field
             retention="",  # Default for non-YAML field
-            raft_self_addr=None,  # Optional field
-            raft_peers=None,  # Optional field
+            raft_self_addr=raft_self_addr,
+            raft_peers=raft_peers,
+            raft_observers=raft_observers,
         )
 
 
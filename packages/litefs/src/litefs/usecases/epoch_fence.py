@@ -0,0 +1,136 @@
+"""Fencing of writes with the leader epoch.
+
+A primary deposed during a partition may keep accepting writes until
+LiteFS notices. Its leader election knows sooner, and the epoch of a
+leadership changes with every election, so comparing epochs locally
+rejects such writes without asking the peers:
+
+- A transaction records the epoch it began under; its writes are rejected
+  once this node no longer leads under that epoch.
+- A forwarded write carries the epoch of the leader the replica knows of;
+  it is rejected by a node not leading under that epoch or a newer one.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from litefs.domain.metrics import FENCED_WRITES
+
+if TYPE_CHECKING:
+    from litefs.adapters.metrics_port import MetricsPort
+    from litefs.adapters.ports import FencingEpochPort
+
+
+class EpochFence:
+    """Admits writes only under this node's current leader epoch.
+
+    Thread safety:
+        Stateless apart from the election, whose epoch reads are
+        thread-safe.
+    """
+
+    def __init__(
+        self, election: FencingEpochPort, metrics: MetricsPort | None = None
+    ) -> None:
+        """Initialize the fence.
+
+        Args:
+            election: Leader election exposing the epoch of this node.
+            metrics: Optional port counting rejected writes.
+        """
+        self._election = election
+        self._metrics = metrics
+
+    def current_epoch(self) -> int | None:
+        """Get the epoch this node leads under, None if it does not lead."""
+        return self._election.get_leader_epoch()
+
+    def admits_write(self, epoch: int | None = None) -> bool:
+        """Check whether a local write may proceed.
+
+        Args:
+            epoch: Epoch the write's transaction began under, or None for a
+                write outside a transaction.
+
+        Returns:
+            True if this node leads, under the given epoch if there is one.
+        """
+        current = self.current_epoch()
+        admitted = current is not None and (epoch is None or epoch == current)
+        if not admitted:
+            self._record_rejection("local")
+        return admitted
+
+    def admits_forwarded(self, epoch: int) -> bool:
+        """Check whether a write forwarded by a replica may proceed.
+
+        A replica may know of an older leadership of this node, never of a
+        newer one unless this node was deposed.
+
+        Args:
+            epoch: Leader epoch known to the forwarding replica.
+
+        Returns:
+            True if this node leads under the given epoch or a newer one.
+        """
+        current = self.current_epoch()
+        admitted = current is not None and epoch <= current
+        if not admitted:
+            self._record_rejection("forwarded")
+        return admitted
+
+    def _record_rejection(self, source: str) -> None:
+        """Count a rejected write."""
+        if self._metrics is not None:
+            self._metrics.increment_counter(FENCED_WRITES, labels={"source": source})
+
+
+class TransactionFence:
+    """Epoch fencing of the transactions of one database connection.
+
+    The epoch is recorded when a transaction begins, or at its first write
+    if the transaction was begun without begin(). It is forgotten when the
+    transaction ends.
+
+    Thread safety:
+        Not thread-safe: a connection is used by one thread at a time.
+    """
+
+    def __init__(self, fence: EpochFence) -> None:
+        """Initialize with no transaction in progress.
+
+        Args:
+            fence: Process-wide fence providing the current epoch.
+        """
+        self._fence = fence
+        self._epoch: int | None = None
+
+    @property
+    def epoch(self) -> int | None:
+        """Epoch the current transaction began under, if recorded."""
+        return self._epoch
+
+    def begin(self) -> None:
+        """Record the epoch of a transaction that just began."""
+        self._epoch = self._fence.current_epoch()
+
+    def end(self) -> None:
+        """Forget the epoch of the transaction that ended."""
+        self._epoch = None
+
+    def admits_write(self, in_transaction: bool) -> bool:
+        """Check whether a write on the connection may proceed.
+
+        Args:
+            in_transaction: Whether the connection is inside a transaction.
+
+        Returns:
+            True if this node leads under the transaction's epoch, or leads
+            at all for a write outside a transaction.
+        """
+        if not in_transaction:
+            return self._fence.admits_write()
+        if self._epoch is None:
+            self._epoch = self._fence.current_epoch()
+        return self._fence.admits_write(self._epoch)
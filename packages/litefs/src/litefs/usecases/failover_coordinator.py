@@ -5,8 +5,9 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from litefs.adapters.ports import LeaderElectionPort
+from litefs.adapters.ports import LeaderElectionPort, LeadershipTransferPort
 from litefs.domain.events import FailoverEvent, FailoverEventType
+from litefs.domain.metrics import LEADERSHIP_TRANSFER_DURATION
 
 if TYPE_CHECKING:
     from litefs.adapters.ports import EventEmitterPort, LoggingPort
@@ -45,6 +46,8 @@ class FailoverCoordinator:
     Dependencies:
         - LeaderElectionPort: Abstraction for leader election mechanism (static, RAFT, etc.)
         - RaftLeaderElectionPort (optional): For quorum-aware operations
+        - LeadershipTransferPort (optional): For handing leadership to a
+          follower instead of waiting out an election timeout
         - EventEmitterPort (optional): For emitting state transition events
 
     Thread safety:
@@ -230,15 +233,15 @@ class FailoverCoordinator:
         2. Demotes from leader role
         3. Transitions to REPLICA state
 
-        In Raft systems, this allows the node to gracefully step down
-        without causing service disruption. The demote_from_leader() call
-        on the election port signals to the cluster that this node will
-        not run for re-election.
+        If the election port supports LeadershipTransferPort, leadership
+        is handed to a caught-up follower, so writes are unavailable only
+        for the transfer; the event reason reports its outcome and duration.
+        Otherwise demote_from_leader() is called on the election port.
         """
         if self._current_state == NodeState.PRIMARY:
-            self.leader_election.demote_from_leader()
+            reason = self._step_down()
             self._current_state = NodeState.REPLICA
-            self._emit_event(FailoverEventType.GRACEFUL_HANDOFF)
+            self._emit_event(FailoverEventType.GRACEFUL_HANDOFF, reason)
 
     def mark_healthy(self) -> None:
         """Mark this node as healthy.
@@ -277,12 +280,14 @@ class FailoverCoordinator:
 
         Transitions from PRIMARY to REPLICA and emits a HEALTH_DEMOTION event.
         This is a specific demotion path for health-triggered failovers.
+        Leadership is transferred to a follower when the election port
+        supports it (see perform_graceful_handoff()).
         Only has effect if currently PRIMARY.
         """
         if self._current_state == NodeState.PRIMARY:
-            self.leader_election.demote_from_leader()
+            reason = self._step_down()
             self._current_state = NodeState.REPLICA
-            self._emit_event(FailoverEventType.HEALTH_DEMOTION)
+            self._emit_event(FailoverEventType.HEALTH_DEMOTION, reason)
 
     def demote_for_quorum_loss(self) -> None:
         """Demote from PRIMARY due to quorum loss.
@@ -296,6 +301,33 @@ class FailoverCoordinator:
             self._current_state = NodeState.REPLICA
             self._emit_event(FailoverEventType.QUORUM_LOSS_DEMOTION)
 
+    def _step_down(self) -> str | None:
+        """Give up leadership, transferring it to a follower if supported.
+
+        Returns:
+            A description of the transfer outcome, or None if the election
+            port cannot transfer leadership.
+        """
+        election = self.leader_election
+        if not isinstance(election, LeadershipTransferPort):
+            election.demote_from_leader()
+            return None
+
+        result = election.transfer_leadership()
+        if self._metrics is not None:
+            self._metrics.observe_histogram(
+                LEADERSHIP_TRANSFER_DURATION,
+                result.duration,
+                {"outcome": "succeeded" if result.succeeded else "failed"},
+            )
+        if result.succeeded:
+            return (
+                f"Leadership transferred to {result.new_leader or 'unknown node'} "
+                f"in {result.duration:.3f}s"
+            )
+        self._log_warning(f"Leadership transfer failed: {result.reason}")
+        return f"Leadership transfer failed: {result.reason}"
+
     def _emit_event(
         self,
         event_type: FailoverEventType,
@@ -0,0 +1,77 @@
+"""Process-wide write forwarding counters and circuit breaker state.
+
+WriteForwardingMiddleware records the outcome of every forwarded request
+and each circuit breaker transition here, so that status endpoints and
+the litefs_status dashboard can report the forwarding rate and the
+breaker state without access to the middleware instance. Rates are left
+to readers: they diff the monotonically increasing counters between two
+snapshots.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from litefs.domain.circuit_breaker import CircuitBreaker
+from litefs.usecases.route_stats import RouteSample
+
+# Circuit breaker state reported when the breaker is configured as disabled
+CIRCUIT_DISABLED = "disabled"
+
+
+class ForwardingStatus:
+    """Monotonic forwarding counters and the latest circuit breaker state.
+
+    Thread safety:
+        All methods are safe to call concurrently.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with zero counters and no circuit breaker."""
+        self._forwarded = 0
+        self._retries = 0
+        self._failed = 0
+        self._circuit_state: str | None = None
+        self._lock = threading.Lock()
+
+    def record(self, sample: RouteSample) -> None:
+        """Record the outcome of a request considered for forwarding.
+
+        Args:
+            sample: Forwarding outcome; ignored unless it was forwarded.
+        """
+        if not sample.forwarded:
+            return
+        with self._lock:
+            self._forwarded += 1
+            self._retries += sample.retries
+            self._failed += int(sample.failed)
+
+    def set_circuit_breaker(self, circuit_breaker: CircuitBreaker) -> None:
+        """Record the current circuit breaker state.
+
+        Args:
+            circuit_breaker: Circuit breaker after its latest transition.
+        """
+        state = (
+            CIRCUIT_DISABLED
+            if circuit_breaker.disabled
+            else circuit_breaker.state.value
+        )
+        with self._lock:
+            self._circuit_state = state
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the counters and breaker state as JSON-serializable data.
+
+        Returns:
+            Dict with forwarded, retries and failed totals since the process
+            started, and circuit_breaker (None if forwarding is not set up).
+        """
+        with self._lock:
+            return {
+                "forwarded": self._forwarded,
+                "retries": self._retries,
+                "failed": self._failed,
+                "circuit_breaker": self._circuit_state,
+            }
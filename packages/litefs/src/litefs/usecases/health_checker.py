@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
+from litefs.domain.exceptions import LiteFSConfigError
 from litefs.domain.health import HealthStatus
 from litefs.adapters.ports import PrimaryDetectorPort
 
 if TYPE_CHECKING:
     from litefs.adapters.metrics_port import MetricsPort
+    from litefs.domain.replication import ReplicationLag
+    from litefs.usecases.health_probes import ActiveHealthMonitor
+    from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+
+logger = logging.getLogger(__name__)
 
 
 class HealthChecker:
@@ -17,12 +24,13 @@ class HealthChecker:
     Use case that checks node health by consulting a primary detector port
     and evaluating health flags. Health status follows a priority hierarchy:
     1. unhealthy (highest priority - overrides all)
-    2. degraded (medium priority)
+    2. degraded (medium priority, also set when a replica lags too far behind)
     3. healthy (default/healthy state)
 
-    This is a stateless, pure logic component with zero framework dependencies.
-    It depends on the PrimaryDetectorPort for checking primary status, but does
-    not depend on whether the node is primary or replica.
+    This is a pure logic component with zero framework dependencies.
+    It depends on the PrimaryDetectorPort for checking primary status and,
+    optionally, on a ReplicationLagChecker to degrade lagging replicas and
+    on an ActiveHealthMonitor whose probes measure the node.
     """
 
     def __init__(
@@ -31,6 +39,8 @@ class HealthChecker:
         degraded: bool = False,
         unhealthy: bool = False,
         metrics: MetricsPort | None = None,
+        lag_checker: ReplicationLagChecker | None = None,
+        probe_monitor: ActiveHealthMonitor | None = None,
     ) -> None:
         """Initialize the health checker.
 
@@ -40,36 +50,81 @@ class HealthChecker:
             unhealthy: If True, node is unhealthy. Defaults to False.
                       Takes precedence over degraded flag.
             metrics: Optional port for emitting health metrics.
+            lag_checker: Optional replication lag checker. When provided,
+                        a replica whose lag exceeds the configured
+                        thresholds is reported as degraded.
+            probe_monitor: Optional active health monitor. When provided,
+                          its state (after hysteresis) degrades the node or
+                          makes it unhealthy.
         """
         self.primary_detector = primary_detector
         self.degraded = degraded
         self.unhealthy = unhealthy
         self._metrics = metrics
+        self._lag_checker = lag_checker
+        self._probe_monitor = probe_monitor
+        self._last_replication_lag: ReplicationLag | None = None
+        self._replica_lagging = False
+
+    @property
+    def last_replication_lag(self) -> ReplicationLag | None:
+        """Get the replication lag observed by the last health check.
+
+        Returns:
+            The last computed ReplicationLag, or None if no lag checker is
+            configured or no check has run yet.
+        """
+        return self._last_replication_lag
+
+    @property
+    def replica_lagging(self) -> bool:
+        """Check whether the last health check found this replica lagging.
+
+        Returns:
+            True if this node was a replica whose lag exceeded the
+            configured thresholds during the last check_health() call.
+        """
+        return self._replica_lagging
+
+    @property
+    def failing_probes(self) -> tuple[str, ...]:
+        """Get the names of the active health probes that are not healthy.
+
+        Returns:
+            Probe names, empty if no probe monitor is configured.
+        """
+        if self._probe_monitor is None:
+            return ()
+        return self._probe_monitor.failing_probes()
 
     def check_health(self) -> HealthStatus:
         """Check the current health status of this node.
 
         Evaluates health state based on configured flags using the following
         priority order (highest to lowest):
-        1. unhealthy flag -> returns unhealthy status
-        2. degraded flag -> returns degraded status
-        3. default -> returns healthy status
-
-        The primary detector is consulted but does not affect the health status
-        in the current implementation. It may be used for future enhancements
-        (e.g., replica lag detection, replication status checks).
+        1. unhealthy flag or unhealthy probes -> returns unhealthy status
+        2. degraded flag or degraded probes -> returns degraded status
+        3. replica lagging beyond thresholds (if lag checker configured)
+           -> returns degraded status
+        4. default -> returns healthy status
 
         Returns:
             HealthStatus value object representing the current health state.
+
+        Raises:
+            LiteFSNotRunningError: If the primary detector cannot reach LiteFS.
         """
-        # Call detector to ensure it's properly invoked (may be needed for
-        # side effects like metrics collection or connection validation)
-        self.primary_detector.is_primary()
+        is_primary = self.primary_detector.is_primary()
+        is_lagging = self._check_replication_lag(is_primary)
+        self._replica_lagging = not is_primary and is_lagging
+        probe_state = (
+            self._probe_monitor.state if self._probe_monitor is not None else "healthy"
+        )
 
         # Determine health state based on priority hierarchy
-        if self.unhealthy:
+        if self.unhealthy or probe_state == "unhealthy":
             state = "unhealthy"
-        elif self.degraded:
+        elif self.degraded or probe_state == "degraded" or self._replica_lagging:
             state = "degraded"
         else:
             state = "healthy"
@@ -79,3 +134,27 @@ class HealthChecker:
             self._metrics.set_health_status(state)  # type: ignore
 
         return HealthStatus(state=state)  # type: ignore
+
+    def _check_replication_lag(self, is_primary: bool) -> bool:
+        """Refresh the replication lag and check it against the thresholds.
+
+        Args:
+            is_primary: Whether this node is the primary, as read for this
+                       check, so the lag checker does not read it again.
+
+        Returns:
+            True if a lag checker is configured and the lag exceeds its
+            thresholds, False otherwise (including when the lag is unknown).
+        """
+        if self._lag_checker is None:
+            return False
+
+        try:
+            lag = self._lag_checker.check_lag(is_primary=is_primary)
+        except LiteFSConfigError as e:
+            logger.warning(f"Failed to check replication lag: {e}")
+            self._last_replication_lag = None
+            return False
+
+        self._last_replication_lag = lag
+        return self._lag_checker.is_lagging(lag)
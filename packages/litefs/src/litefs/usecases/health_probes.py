@@ -0,0 +1,550 @@
+"""Active health probes use case.
+
+HealthChecker's degraded and unhealthy flags are static: nothing measures
+the node. ActiveHealthMonitor runs probes on a background schedule (FUSE
+read latency, a query round-trip, WAL size, free disk, replication lag,
+event loop or thread pool delay), classifies each measurement against its
+thresholds, and applies hysteresis so that a single slow sample does not
+flap the node: a probe changes state only after failure_threshold
+consecutive worse samples, or recovery_threshold consecutive better ones.
+
+The node state is the worst probe state. HealthChecker reports it, and a
+state change callback lets the service container mark the failover
+coordinator unhealthy, so slow nodes are drained and step down.
+
+Each probe runs in a daemon worker thread of its own, bounded by a timeout,
+since a hung FUSE mount blocks file reads indefinitely. The worker is kept
+between rounds. A probe still running from an earlier round is not started
+again; the round counts as a timeout.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Protocol
+
+from litefs.domain.health import (
+    EVENT_LOOP_LAG,
+    EXECUTOR_DELAY,
+    FREE_DISK,
+    FUSE_READ_LATENCY,
+    HEALTH_STATES,
+    QUERY_LATENCY,
+    REPLICATION_LAG,
+    WAL_SIZE,
+    ProbeResult,
+    ProbeThresholds,
+)
+from litefs.domain.metrics import HEALTH_PROBE_TRANSITIONS
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from litefs.adapters.metrics_port import MetricsPort
+    from litefs.domain.replication import ReplicationLag
+
+logger = logging.getLogger(__name__)
+
+HealthState = Literal["healthy", "unhealthy", "degraded"]
+
+# Called with the previous and the new node state
+StateChangeCallback = Callable[[HealthState, HealthState], None]
+
+
+class HealthProbe(Protocol):
+    """Measures one aspect of the node."""
+
+    name: str
+
+    def measure(self) -> float | None:
+        """Measure the probed value.
+
+        Returns:
+            The value, or None if there is nothing to measure yet.
+
+        Raises:
+            Exception: If the measurement fails; the sample is unhealthy.
+        """
+        ...
+
+
+class FuseReadLatencyProbe:
+    """Time to read a small file on the LiteFS FUSE mount, in seconds."""
+
+    name = FUSE_READ_LATENCY
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the probe.
+
+        Args:
+            path: Small file on the mount, e.g. the database position file.
+        """
+        self._path = Path(path)
+
+    def measure(self) -> float | None:
+        """Read the file, or return None if it does not exist yet."""
+        started = time.perf_counter()
+        try:
+            self._path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return time.perf_counter() - started
+
+
+class QueryLatencyProbe:
+    """Round-trip time of a trivial query on the database, in seconds.
+
+    The query reads the schema page, so the round-trip goes through the
+    FUSE mount rather than being answered by SQLite alone. The read-only
+    connection is kept between runs and reopened after a failure.
+    """
+
+    name = QUERY_LATENCY
+
+    def __init__(self, database_path: str | Path) -> None:
+        """Initialize the probe.
+
+        Args:
+            database_path: Path of the database on the mount.
+        """
+        self._database_path = Path(database_path)
+        self._connection: sqlite3.Connection | None = None
+
+    def measure(self) -> float | None:
+        """Run the query, or return None if the database does not exist yet."""
+        if self._connection is None:
+            if not self._database_path.exists():
+                return None
+            self._connection = sqlite3.connect(
+                f"file:{self._database_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+        started = time.perf_counter()
+        try:
+            self._connection.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        except sqlite3.Error:
+            self.close()
+            raise
+        return time.perf_counter() - started
+
+    def close(self) -> None:
+        """Close the connection, if open."""
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            connection.close()
+
+
+class WalSizeProbe:
+    """Size of the database WAL file, in bytes (0 if there is none)."""
+
+    name = WAL_SIZE
+
+    def __init__(self, database_path: str | Path) -> None:
+        """Initialize the probe.
+
+        Args:
+            database_path: Path of the database; the WAL is "<path>-wal".
+        """
+        self._wal_path = Path(f"{database_path}-wal")
+
+    def measure(self) -> float | None:
+        """Return the WAL size."""
+        try:
+            return float(self._wal_path.stat().st_size)
+        except FileNotFoundError:
+            return 0.0
+
+
+class FreeDiskProbe:
+    """Free disk space of a directory's file system, in bytes.
+
+    Lower values are worse: use thresholds with higher_is_worse=False.
+    """
+
+    name = FREE_DISK
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the probe.
+
+        Args:
+            path: Directory whose file system is measured, e.g. the LiteFS
+                 data directory.
+        """
+        self._path = Path(path)
+
+    def measure(self) -> float | None:
+        """Return the free space."""
+        return float(shutil.disk_usage(self._path).free)
+
+
+class ReplicationLagProbe:
+    """Estimated replication lag behind the primary, in seconds."""
+
+    name = REPLICATION_LAG
+
+    def __init__(self, check_lag: Callable[[], ReplicationLag]) -> None:
+        """Initialize the probe.
+
+        Args:
+            check_lag: Returns the current lag, e.g.
+                      ReplicationLagChecker.check_lag.
+        """
+        self._check_lag = check_lag
+
+    def measure(self) -> float | None:
+        """Return the lag, or None if it cannot be estimated."""
+        return self._check_lag().seconds_lag
+
+
+class EventLoopLagProbe:
+    """Delay before an asyncio event loop runs a scheduled callback, in seconds.
+
+    A saturated loop (blocking calls in coroutines) runs callbacks late.
+    """
+
+    name = EVENT_LOOP_LAG
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, timeout: float = 5.0) -> None:
+        """Initialize the probe.
+
+        Args:
+            loop: Event loop serving requests.
+            timeout: Longest delay measured; a stalled loop reports it.
+        """
+        self._loop = loop
+        self._timeout = timeout
+
+    def measure(self) -> float | None:
+        """Schedule a callback on the loop and wait for it to run."""
+        ran = threading.Event()
+        started = time.perf_counter()
+        self._loop.call_soon_threadsafe(ran.set)
+        ran.wait(self._timeout)
+        return time.perf_counter() - started
+
+
+class ExecutorDelayProbe:
+    """Delay before a thread pool starts a submitted task, in seconds.
+
+    A saturated pool queues tasks until a worker is free.
+    """
+
+    name = EXECUTOR_DELAY
+
+    def __init__(self, executor: Executor, timeout: float = 5.0) -> None:
+        """Initialize the probe.
+
+        Args:
+            executor: Pool serving requests.
+            timeout: Longest delay measured; a saturated pool reports it.
+        """
+        self._executor = executor
+        self._timeout = timeout
+
+    def measure(self) -> float | None:
+        """Submit a no-op task and wait for it to start."""
+        started = time.perf_counter()
+        future = self._executor.submit(time.perf_counter)
+        try:
+            return future.result(self._timeout) - started
+        except FutureTimeoutError:
+            future.cancel()
+            return time.perf_counter() - started
+
+
+class _ProbeWorker:
+    """Daemon thread running one probe on request, reused between rounds."""
+
+    def __init__(self, probe: HealthProbe) -> None:
+        """Initialize the worker. The thread starts on the first run()."""
+        self._probe = probe
+        self._requested = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._stopped = False
+        self._value: float | None = None
+        self._error: str | None = None
+        self._thread: threading.Thread | None = None
+
+    def run(self, timeout: float) -> tuple[float | None, str | None]:
+        """Run the probe once, waiting at most timeout seconds.
+
+        Returns:
+            (value, None) on success, or (None, error message) on failure.
+        """
+        if not self._done.is_set():
+            return None, "previous run still in progress"
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop,
+                name=f"litefs-probe-{self._probe.name}",
+                daemon=True,
+            )
+            self._thread.start()
+        self._done.clear()
+        self._requested.set()
+        if not self._done.wait(timeout):
+            return None, f"timed out after {timeout:g}s"
+        return self._value, self._error
+
+    def stop(self) -> None:
+        """Let the thread exit once its current run, if any, finishes."""
+        self._stopped = True
+        self._requested.set()
+
+    def _loop(self) -> None:
+        """Run the probe each time a run is requested, until stopped."""
+        while True:
+            self._requested.wait()
+            self._requested.clear()
+            if self._stopped:
+                return
+            try:
+                self._value, self._error = self._probe.measure(), None
+            except Exception as e:
+                logger.debug(f"Health probe {self._probe.name} failed", exc_info=True)
+                self._value, self._error = None, str(e) or type(e).__name__
+            self._done.set()
+
+
+@dataclass
+class _ProbeState:
+    """Hysteresis state of one probe."""
+
+    probe: HealthProbe
+    thresholds: ProbeThresholds
+    result: ProbeResult
+    # Severity bound of the current streak: the best sample of a worsening
+    # streak, the worst sample of an improving one
+    streak_state: HealthState = "healthy"
+    worker: _ProbeWorker | None = None
+
+
+class ActiveHealthMonitor:
+    """Runs health probes on a schedule and derives the node state.
+
+    Thread safety:
+        state, results() and add_probe() may be called from any thread
+        while the monitor runs.
+    """
+
+    def __init__(
+        self,
+        interval: float = 5.0,
+        failure_threshold: int = 3,
+        recovery_threshold: int = 2,
+        probe_timeout: float | None = None,
+        on_state_change: StateChangeCallback | None = None,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        """Initialize the monitor without probes. Nothing runs until start().
+
+        Args:
+            interval: Delay in seconds between two rounds of probes.
+            failure_threshold: Consecutive worse samples before a probe
+                              degrades or becomes unhealthy.
+            recovery_threshold: Consecutive better samples before a probe
+                               recovers.
+            probe_timeout: Longest run of a probe in seconds; slower runs
+                          are unhealthy samples. Defaults to interval.
+            on_state_change: Called with the previous and new node state
+                            when the node state changes.
+            metrics: Optional port counting probe state transitions.
+        """
+        self._interval = interval
+        self._failure_threshold = failure_threshold
+        self._recovery_threshold = recovery_threshold
+        self._probe_timeout = interval if probe_timeout is None else probe_timeout
+        self._on_state_change = on_state_change
+        self._metrics = metrics
+        self._probes: dict[str, _ProbeState] = {}
+        self._state: HealthState = "healthy"
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def state(self) -> HealthState:
+        """Node state: the worst state among the probes."""
+        return self._state
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_probe(self, probe: HealthProbe, thresholds: ProbeThresholds) -> None:
+        """Add a probe, replacing any probe of the same name.
+
+        Args:
+            probe: Probe to run.
+            thresholds: Classification of its values.
+        """
+        with self._lock:
+            replaced = self._probes.get(probe.name)
+            self._probes[probe.name] = _ProbeState(
+                probe=probe,
+                thresholds=thresholds,
+                result=ProbeResult(name=probe.name, state="healthy"),
+            )
+        if replaced is not None and replaced.worker is not None:
+            replaced.worker.stop()
+
+    def results(self) -> dict[str, ProbeResult]:
+        """Return the latest result of each probe."""
+        with self._lock:
+            return {name: probe.result for name, probe in self._probes.items()}
+
+    def failing_probes(self) -> tuple[str, ...]:
+        """Return the names of the probes that are not healthy."""
+        return tuple(
+            name for name, result in self.results().items() if result.state != "healthy"
+        )
+
+    def run_once(self) -> HealthState:
+        """Run every probe once and update the states.
+
+        Returns:
+            The node state after this round.
+        """
+        with self._lock:
+            probes = list(self._probes.values())
+        for probe_state in probes:
+            value, error = self._measure(probe_state)
+            self._record(probe_state, value, error)
+
+        with self._lock:
+            previous = self._state
+            self._state = max(
+                (probe.result.state for probe in self._probes.values()),
+                key=HEALTH_STATES.index,
+                default="healthy",
+            )
+            current = self._state
+        if current != previous:
+            logger.warning(f"Active health probes: node {previous} -> {current}")
+            self._notify(previous, current)
+        return current
+
+    def start(self) -> None:
+        """Start probing in a daemon thread. Does nothing if running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="litefs-health-probes", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread and the probe workers.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread.
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+        with self._lock:
+            workers = [probe.worker for probe in self._probes.values()]
+            for probe in self._probes.values():
+                probe.worker = None
+        for worker in workers:
+            if worker is not None:
+                worker.stop()
+
+    def _run(self) -> None:
+        """Run a round of probes every interval until stopped."""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Active health probe round failed")
+            self._stop_event.wait(self._interval)
+
+    def _measure(self, probe_state: _ProbeState) -> tuple[float | None, str | None]:
+        """Run a probe in its worker thread, bounded by the probe timeout.
+
+        Returns:
+            (value, None) on success, or (None, error message) on failure.
+        """
+        with self._lock:
+            if probe_state.worker is None:
+                probe_state.worker = _ProbeWorker(probe_state.probe)
+            worker = probe_state.worker
+        return worker.run(self._probe_timeout)
+
+    def _record(
+        self, probe_state: _ProbeState, value: float | None, error: str | None
+    ) -> None:
+        """Apply one sample to a probe's hysteresis state."""
+        result = probe_state.result
+        if error is not None:
+            sample: HealthState = "unhealthy"
+        elif value is None:
+            # Nothing to measure: neither a breach nor a recovery
+            with self._lock:
+                probe_state.result = replace(result, value=None, error=None)
+            return
+        else:
+            sample = probe_state.thresholds.classify(value)
+
+        state = result.state
+        rank = HEALTH_STATES.index
+        if rank(sample) == rank(state):
+            streak = 0
+        else:
+            worsening = rank(sample) > rank(state)
+            continuing = result.streak > 0 and (
+                (rank(result.sample_state) > rank(state)) == worsening
+            )
+            if not continuing:
+                streak, bound = 1, sample
+            else:
+                streak = result.streak + 1
+                bound = (min if worsening else max)(
+                    probe_state.streak_state, sample, key=rank
+                )
+            probe_state.streak_state = bound
+            needed = self._failure_threshold if worsening else self._recovery_threshold
+            if streak >= needed:
+                self._count_transition(probe_state.probe.name, bound)
+                state, streak = bound, 0
+
+        with self._lock:
+            probe_state.result = ProbeResult(
+                name=result.name,
+                state=state,
+                value=value,
+                sample_state=sample,
+                error=error,
+                streak=streak,
+            )
+
+    def _count_transition(self, name: str, state: HealthState) -> None:
+        """Count a probe state transition."""
+        if self._metrics is not None:
+            self._metrics.increment_counter(
+                HEALTH_PROBE_TRANSITIONS, labels={"probe": name, "state": state}
+            )
+
+    def _notify(self, previous: HealthState, current: HealthState) -> None:
+        """Call the state change callback, logging its failures."""
+        if self._on_state_change is None:
+            return
+        try:
+            self._on_state_change(previous, current)
+        except Exception:
+            logger.exception("Active health probe state change callback failed")
@@ -0,0 +1,169 @@
+"""Health snapshot use case for serving precomputed probe responses.
+
+Orchestrators and monitoring poll health endpoints every few seconds on
+every node. Evaluating health, failover state and split-brain on each of
+those requests competes with application traffic, and probe latency grows
+exactly when the node is saturated, which can get a healthy pod killed.
+
+HealthSnapshotEvaluator evaluates the endpoints in a background thread on
+an interval (and immediately when asked to, e.g. on replication changes)
+and keeps each endpoint's serialized JSON body. Endpoints then return the
+stored bytes with an ``Age`` header.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from litefs.adapters.ports import RealTimeProvider, TimeProvider
+
+logger = logging.getLogger(__name__)
+
+# Returns an endpoint's JSON payload and HTTP status code
+SnapshotBuilder = Callable[[], tuple[dict[str, Any], int]]
+
+
+@dataclass(frozen=True)
+class SnapshotResponse:
+    """Precomputed response of one health endpoint.
+
+    Attributes:
+        body: Serialized JSON body.
+        status_code: HTTP status code.
+        computed_at: Time in seconds (from the evaluator's TimeProvider)
+                    at which the response was computed.
+    """
+
+    body: bytes
+    status_code: int
+    computed_at: float
+
+    def age(self, now: float) -> int:
+        """Return the age in whole seconds, as used by the Age header.
+
+        Args:
+            now: Current time in seconds.
+        """
+        return max(0, math.floor(now - self.computed_at))
+
+
+class HealthSnapshotEvaluator:
+    """Recomputes health endpoint responses in the background.
+
+    Each endpoint is described by a builder returning its payload and
+    status code. A builder that raises removes the endpoint's snapshot, so
+    callers fall back to evaluating synchronously and report the error
+    themselves.
+
+    Thread safety:
+        get() may be called from any thread while the evaluator runs.
+        Snapshots are replaced atomically.
+    """
+
+    def __init__(
+        self,
+        builders: Mapping[str, SnapshotBuilder],
+        interval: float = 1.0,
+        max_age: float = 10.0,
+        time_provider: TimeProvider | None = None,
+    ) -> None:
+        """Initialize the evaluator. Nothing is evaluated until refresh().
+
+        Args:
+            builders: Payload builder for each endpoint name.
+            interval: Delay in seconds between background evaluations.
+            max_age: Oldest snapshot in seconds that get() returns.
+            time_provider: Clock for snapshot times. Defaults to
+                          RealTimeProvider.
+        """
+        self._builders = dict(builders)
+        self._interval = interval
+        self._max_age = max_age
+        self._time_provider = time_provider or RealTimeProvider()
+        self._responses: dict[str, SnapshotResponse] = {}
+        self._wake_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def now(self) -> float:
+        """Return the current time of the evaluator's clock."""
+        return self._time_provider.get_time_seconds()
+
+    def get(self, name: str) -> SnapshotResponse | None:
+        """Return an endpoint's snapshot if it is fresh enough.
+
+        Args:
+            name: Endpoint name, as in the builders mapping.
+
+        Returns:
+            The snapshot, or None if there is none or it is older than
+            max_age (e.g. because the evaluator stopped).
+        """
+        response = self._responses.get(name)
+        if response is None or self.now() - response.computed_at > self._max_age:
+            return None
+        return response
+
+    def refresh(self) -> None:
+        """Evaluate every endpoint now and replace its snapshot."""
+        for name, builder in self._builders.items():
+            try:
+                payload, status_code = builder()
+            except Exception:
+                logger.exception(f"Health snapshot evaluation failed for {name}")
+                self._responses.pop(name, None)
+                continue
+            self._responses[name] = SnapshotResponse(
+                body=json.dumps(payload, separators=(",", ":")).encode(),
+                status_code=status_code,
+                computed_at=self.now(),
+            )
+
+    def request_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Ask the background thread to evaluate without waiting.
+
+        Accepts and ignores any arguments, so it can be subscribed directly
+        to event sources such as ChangeBus or Django signals.
+        """
+        self._wake_event.set()
+
+    def start(self) -> None:
+        """Start evaluating in a daemon thread. Does nothing if running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="litefs-health-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread.
+        """
+        self._stop_event.set()
+        self._wake_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Evaluate on every interval or wake-up until stopped."""
+        while not self._stop_event.is_set():
+            self.refresh()
+            self._wake_event.wait(self._interval)
+            self._wake_event.clear()
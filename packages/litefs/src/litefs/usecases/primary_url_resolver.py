@@ -6,6 +6,7 @@ static leader configuration and Raft-based dynamic discovery.
 
 from typing import Protocol
 
+from litefs.adapters.ports import ClusterMetadataPort
 from litefs.domain.settings import ForwardingSettings
 
 
@@ -33,7 +34,9 @@ class PrimaryURLResolver:
     This use case determines the primary URL based on configuration mode:
 
     1. Static leader mode: Uses the configured primary_url from ForwardingSettings
-    2. Raft mode: Uses PrimaryURLDetector to read from LiteFS .primary file
+    2. Raft mode: Uses the forwarding URL published by the leader in the
+       replicated cluster metadata, if available; otherwise uses
+       PrimaryURLDetector to read from LiteFS .primary file
 
     Static mode takes precedence when both are configured.
 
@@ -64,6 +67,7 @@ class PrimaryURLResolver:
         forwarding: ForwardingSettings | None = None,
         primary_url_detector: PrimaryURLDetectorProtocol | None = None,
         scheme: str = "http",
+        cluster_metadata: ClusterMetadataPort | None = None,
     ) -> None:
         """Initialize primary URL resolver.
 
@@ -75,17 +79,23 @@ class PrimaryURLResolver:
             scheme: HTTP scheme to use (default: "http").
                    Used when primary_url_detector is provided.
                    ForwardingSettings has its own scheme field.
+            cluster_metadata: Optional replicated cluster metadata for Raft
+                             mode. Its forwarding URL is preferred over the
+                             detector's, which remains used to tell whether
+                             this node is primary.
         """
         self._forwarding = forwarding
         self._detector = primary_url_detector
         self._scheme = scheme
+        self._cluster_metadata = cluster_metadata
 
     def resolve(self) -> str | None:
         """Resolve the primary node's full URL.
 
         Resolution order:
         1. Static mode: If forwarding is enabled with a primary_url, use it
-        2. Raft mode: If detector is available, query it for primary URL
+        2. Raft mode: Use the leader's forwarding URL from the cluster
+           metadata, or query the detector for the primary URL
         3. Return None if no primary can be resolved
 
         Returns:
@@ -119,25 +129,44 @@ class PrimaryURLResolver:
         return f"{scheme}://{self._forwarding.primary_url}"
 
     def _resolve_raft(self) -> str | None:
-        """Resolve URL from Raft-based PrimaryURLDetector.
+        """Resolve URL from cluster metadata or Raft-based PrimaryURLDetector.
 
         Returns:
             Full URL with scheme or None if:
-            - No detector configured
-            - No primary elected (detector returns None)
+            - Neither metadata nor detector configured
+            - No primary elected (no forwarding URL and detector returns None)
             - This node is primary (detector returns empty string)
         """
+        metadata_url = self._resolve_metadata()
         if self._detector is None:
-            return None
+            return metadata_url
 
         primary_url = self._detector.get_primary_url()
 
+        # Empty string means this node is primary
+        if primary_url == "":
+            return None
+
+        if metadata_url is not None:
+            return metadata_url
+
         # None means no primary elected
         if primary_url is None:
             return None
 
-        # Empty string means this node is primary
-        if primary_url == "":
+        return f"{self._scheme}://{primary_url}"
+
+    def _resolve_metadata(self) -> str | None:
+        """Resolve URL from the leader's entry in the cluster metadata.
+
+        Returns:
+            The forwarding URL published by the current leader, or None if
+            no metadata is configured or the leader published none.
+        """
+        if self._cluster_metadata is None:
             return None
 
-        return f"{self._scheme}://{primary_url}"
+        url = self._cluster_metadata.get_cluster_metadata().get("forwarding_url")
+        if not isinstance(url, str) or not url:
+            return None
+        return url
@@ -0,0 +1,283 @@
+"""Query-result cache use case.
+
+Views often run identical read queries many times between database
+changes. QueryResultCache memoizes the rows of read statements keyed on
+(SQL, params), tagged with the local replication position at read time.
+
+Entries are invalidated:
+- all at once when the local replication position moves forward, i.e.
+  whenever any transaction is applied on this node;
+- per table when this process writes to a table, using the table names the
+  SQL classifier extracts (or all at once if they cannot be determined).
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from litefs.domain.replication import ReplicationPosition
+
+if TYPE_CHECKING:
+    from litefs.adapters.metrics_port import MetricsPort
+
+# Index bucket for entries whose tables are unknown; invalidated by any write
+_UNKNOWN_TABLES = "*"
+
+# (SQL, frozen parameters)
+QueryCacheKey = tuple[str, Any]
+
+
+@dataclass(frozen=True)
+class CachedQueryResult:
+    """Result rows of a read statement stored in the query-result cache.
+
+    Attributes:
+        description: DB-API cursor description of the result columns.
+        rows: Result rows.
+    """
+
+    description: tuple[tuple[Any, ...], ...] | None
+    rows: tuple[tuple[Any, ...], ...]
+
+    @cached_property
+    def size(self) -> int:
+        """Approximate memory held by this result in bytes."""
+        size = sys.getsizeof(self.rows)
+        for row in self.rows:
+            size += sys.getsizeof(row)
+            size += sum(sys.getsizeof(value) for value in row)
+        return size
+
+
+def make_query_key(
+    sql: str, params: Sequence[Any] | Mapping[str, Any] | None
+) -> QueryCacheKey | None:
+    """Build a cache key from a statement and its parameters.
+
+    Args:
+        sql: SQL statement.
+        params: Positional (sequence) or named (mapping) parameters.
+
+    Returns:
+        Hashable key, or None if the parameters are not hashable.
+    """
+    if params is None:
+        frozen: Any = ()
+    elif isinstance(params, Mapping):
+        frozen = tuple(sorted(params.items()))
+    else:
+        frozen = tuple(params)
+
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return (sql, frozen)
+
+
+class QueryResultCache:
+    """Bounded in-memory LRU store for query results.
+
+    The cache tracks the newest replication position it has seen. A lookup
+    or store at a newer position drops every entry, since any table may
+    have changed. Lookups and stores at an older position miss and are
+    skipped.
+
+    Each entry is indexed by the tables its statement reads, so a write by
+    this process only drops the entries of the tables it touched.
+
+    Thread safety:
+        All methods are protected by an internal lock. A single instance is
+        meant to be shared by all connections of a process.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        """Initialize the query-result cache.
+
+        Args:
+            max_bytes: Upper bound on the memory held by cached results.
+                      Least recently used entries are evicted beyond it.
+            max_entry_bytes: Results larger than this are not stored.
+            metrics: Optional port for emitting hit/miss and size metrics.
+        """
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._metrics = metrics
+        self._entries: OrderedDict[QueryCacheKey, CachedQueryResult] = OrderedDict()
+        self._entry_tables: dict[QueryCacheKey, frozenset[str]] = {}
+        self._table_index: dict[str, set[QueryCacheKey]] = {}
+        self._position: ReplicationPosition | None = None
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        """Get the number of queries answered from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of cacheable queries not found in the cache."""
+        return self._misses
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the approximate memory held by cached results."""
+        return self._size_bytes
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Get the fraction of lookups that were hits, or None if none yet."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else None
+
+    def __len__(self) -> int:
+        """Get the number of cached results."""
+        return len(self._entries)
+
+    def get(
+        self, key: QueryCacheKey, position: ReplicationPosition
+    ) -> CachedQueryResult | None:
+        """Look up the result of a read statement.
+
+        Args:
+            key: Key from make_query_key().
+            position: Current local replication position.
+
+        Returns:
+            The cached result, or None on a miss.
+        """
+        with self._lock:
+            result = None
+            if self._advance(position):
+                result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        self._emit_metrics()
+        return result
+
+    def put(
+        self,
+        key: QueryCacheKey,
+        position: ReplicationPosition,
+        result: CachedQueryResult,
+        tables: frozenset[str] | None,
+    ) -> bool:
+        """Store the result of a read statement.
+
+        Args:
+            key: Key from make_query_key().
+            position: Replication position the statement was executed at.
+            result: Result to store.
+            tables: Tables the statement reads, or None if unknown.
+
+        Returns:
+            True if stored, False if the result is too large or was read
+            at an outdated position.
+        """
+        size = result.size
+        if size > self._max_entry_bytes:
+            return False
+
+        with self._lock:
+            if not self._advance(position):
+                return False
+            self._remove(key)
+            self._entries[key] = result
+            self._size_bytes += size
+            tags = tables if tables else frozenset({_UNKNOWN_TABLES})
+            self._entry_tables[key] = tags
+            for table in tags:
+                self._table_index.setdefault(table, set()).add(key)
+            while self._size_bytes > self._max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+        self._emit_metrics()
+        return True
+
+    def invalidate_tables(self, tables: Iterable[str] | None) -> None:
+        """Drop the cached results that read any of the given tables.
+
+        Entries whose tables are unknown are dropped by every invalidation.
+
+        Args:
+            tables: Lowercased names of written tables, or None to drop all
+                   entries (tables of the write could not be determined).
+        """
+        if tables is None:
+            self.clear()
+            return
+
+        with self._lock:
+            keys: set[QueryCacheKey] = set()
+            for table in (*tables, _UNKNOWN_TABLES):
+                keys |= self._table_index.get(table, set())
+            for key in keys:
+                self._remove(key)
+        self._emit_metrics()
+
+    def clear(self) -> None:
+        """Drop all cached results. Hit and miss counts are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._entry_tables.clear()
+            self._table_index.clear()
+            self._size_bytes = 0
+        self._emit_metrics()
+
+    def _advance(self, position: ReplicationPosition) -> bool:
+        """Move the cache to a position, dropping entries of older ones.
+
+        Must be called with the lock held.
+
+        Returns:
+            True if position is the current position, False if it is older.
+        """
+        current = self._position
+        if current == position:
+            return True
+        if current is not None and position.txid < current.txid:
+            return False
+        self._entries.clear()
+        self._entry_tables.clear()
+        self._table_index.clear()
+        self._size_bytes = 0
+        self._position = position
+        return True
+
+    def _remove(self, key: QueryCacheKey) -> None:
+        """Remove an entry and its index references.
+
+        Must be called with the lock held.
+        """
+        result = self._entries.pop(key, None)
+        if result is None:
+            return
+        self._size_bytes -= result.size
+        for table in self._entry_tables.pop(key, frozenset()):
+            keys = self._table_index.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._table_index[table]
+
+    def _emit_metrics(self) -> None:
+        """Emit cache metrics if a metrics port is configured."""
+        if self._metrics is None:
+            return
+        self._metrics.set_query_cache_stats(self._hits, self._misses, self._size_bytes)
@@ -12,12 +12,28 @@ from litefs.domain.health import HealthStatus, ReadinessResult
 from litefs.usecases.failover_coordinator import NodeState
 
 if TYPE_CHECKING:
+    from litefs.domain.replication import ReplicationLag
     from litefs.usecases.split_brain_detector import SplitBrainStatus
 
 
 class HealthCheckerProtocol(Protocol):
     """Protocol for health checking."""
 
+    @property
+    def last_replication_lag(self) -> ReplicationLag | None:
+        """Get the replication lag observed by the last check, if tracked."""
+        ...
+
+    @property
+    def replica_lagging(self) -> bool:
+        """Check whether the last check found this replica lagging."""
+        ...
+
+    @property
+    def failing_probes(self) -> tuple[str, ...]:
+        """Get the names of the active health probes that are not healthy."""
+        ...
+
     def check_health(self) -> HealthStatus:
         """Check current health status."""
         ...
@@ -47,6 +63,8 @@ class ReadinessChecker:
     to determine overall node readiness. A node is considered ready when:
     - Health status is "healthy" (not degraded or unhealthy)
     - No split-brain condition is detected (if detector is provided)
+    - It is not a replica lagging beyond the replication thresholds (if the
+      health checker tracks replication lag)
 
     The result also indicates whether the node can accept writes (is PRIMARY).
 
@@ -96,10 +114,20 @@ class ReadinessChecker:
             - split_brain_detected: True if multiple leaders detected
             - leader_node_ids: IDs of nodes claiming leadership
             - error: Error message if not ready
+            - replication_lag: Replication lag if tracked by the health checker
         """
         # Get health status
         health_status = self._health_checker.check_health()
 
+        # Replication lag is tracked by the health checker when configured
+        replication_lag = self._health_checker.last_replication_lag
+        replica_lagging = self._health_checker.replica_lagging
+        # Active health probes explaining a degraded or unhealthy status
+        failing_probes = self._health_checker.failing_probes
+        health_error = f"Node is {health_status.state}"
+        if failing_probes:
+            health_error += f" (probes: {', '.join(failing_probes)})"
+
         # Determine node role
         is_primary = self._failover_coordinator.state == NodeState.PRIMARY
 
@@ -126,17 +154,25 @@ class ReadinessChecker:
                 health_status.state == "healthy" and not split_brain_detected
             )
             if health_status.state != "healthy":
-                error = f"Node is {health_status.state}"
+                error = health_error
             elif split_brain_detected:
                 error = f"Split brain detected: multiple leaders {leader_node_ids}"
         else:
             # Replica nodes can tolerate degradation for reads
-            is_ready = health_status.state != "unhealthy" and not split_brain_detected
+            # Lagging replicas are drained so clients don't read stale data
+            is_ready = (
+                health_status.state != "unhealthy"
+                and not split_brain_detected
+                and not replica_lagging
+            )
             can_accept_writes = False  # Replicas never accept writes
             if health_status.state == "unhealthy":
-                error = f"Node is {health_status.state}"
+                error = health_error
             elif split_brain_detected:
                 error = f"Split brain detected: multiple leaders {leader_node_ids}"
+            elif replica_lagging:
+                txid_lag = replication_lag.txid_lag if replication_lag else None
+                error = f"Replication lag exceeds threshold ({txid_lag} txids behind)"
 
         return ReadinessResult(
             is_ready=is_ready,
@@ -145,4 +181,5 @@ class ReadinessChecker:
             split_brain_detected=split_brain_detected,
             leader_node_ids=leader_node_ids,
             error=error,
+            replication_lag=replication_lag,
         )
@@ -0,0 +1,210 @@
+"""Replication lag checker use case.
+
+Computes how far a replica trails the primary by comparing the local
+replication position (from the LiteFS position file) with the primary's
+position obtained from the cluster state.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Protocol
+
+from litefs.domain.replication import ReplicationLag, ReplicationPosition
+from litefs.domain.settings import ReplicationSettings
+from litefs.usecases.txid_rate_tracker import TxidRateTracker
+
+if TYPE_CHECKING:
+    from litefs.adapters.metrics_port import MetricsPort
+    from litefs.adapters.ports import PrimaryDetectorPort, SplitBrainDetectorPort
+    from litefs.usecases.split_brain_detector import SplitBrainMonitor
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicationPositionReaderProtocol(Protocol):
+    """Protocol for reading the local replication position."""
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Read the local replication position."""
+        ...
+
+
+class ReplicationLagChecker:
+    """Determines the replication lag of this node.
+
+    On the primary the lag is always zero. On a replica the lag is the
+    difference between the primary's TXID (as reported in the cluster state)
+    and the local TXID. The lag in seconds is estimated from the rate at
+    which the primary's TXID has been advancing.
+
+    Dependencies:
+        - ReplicationPositionReader: Local TXID from the LiteFS position file
+        - PrimaryDetectorPort: Whether this node is the primary
+        - SplitBrainDetectorPort (optional): Cluster state with the leader's TXID
+        - SplitBrainMonitor (optional): The same, refreshed in the background
+        - TxidRateTracker: Primary TXID rate for seconds estimates
+
+    Thread safety:
+        Safe for concurrent calls; the rate tracker synchronizes internally.
+    """
+
+    def __init__(
+        self,
+        position_reader: ReplicationPositionReaderProtocol,
+        primary_detector: PrimaryDetectorPort,
+        cluster_state_port: SplitBrainDetectorPort | None = None,
+        settings: ReplicationSettings | None = None,
+        rate_tracker: TxidRateTracker | None = None,
+        metrics: MetricsPort | None = None,
+        cluster_state_monitor: SplitBrainMonitor | None = None,
+    ) -> None:
+        """Initialize the replication lag checker.
+
+        Args:
+            position_reader: Reader for the local replication position.
+            primary_detector: Port for checking if this node is primary.
+            cluster_state_port: Optional port providing the cluster state,
+                               including the leader's TXID. Without it the
+                               primary position is unknown on replicas.
+            settings: Lag thresholds. Defaults to ReplicationSettings().
+            rate_tracker: Tracker for the primary's TXID rate. Defaults to a
+                         tracker using settings.rate_window_seconds.
+            metrics: Optional port for emitting replication metrics.
+            cluster_state_monitor: Optional running monitor whose latest
+                                  cluster state provides the leader's TXID.
+                                  Takes precedence over cluster_state_port,
+                                  so checks make no network calls.
+        """
+        self._position_reader = position_reader
+        self._primary_detector = primary_detector
+        self._cluster_state_port = cluster_state_port
+        self._settings = settings or ReplicationSettings()
+        self._rate_tracker = rate_tracker or TxidRateTracker(
+            window_seconds=self._settings.rate_window_seconds
+        )
+        self._metrics = metrics
+        self._cluster_state_monitor = cluster_state_monitor
+
+    @property
+    def settings(self) -> ReplicationSettings:
+        """Get the lag thresholds in use."""
+        return self._settings
+
+    def read_local_txid(self) -> int | None:
+        """Read the local TXID.
+
+        Returns:
+            The local TXID, or None if the position file doesn't exist yet.
+
+        Raises:
+            LiteFSNotRunningError: If LiteFS is not running.
+            LiteFSConfigError: If the position file is malformed.
+        """
+        position = self._position_reader.read_position()
+        return position.txid if position is not None else None
+
+    def check_lag(self, is_primary: bool | None = None) -> ReplicationLag:
+        """Compute the current replication lag of this node.
+
+        Args:
+            is_primary: Whether this node is the primary, if the caller has
+                       already read it. Defaults to asking the primary
+                       detector.
+
+        Returns:
+            ReplicationLag with the local and primary TXIDs, the lag in
+            transactions and the estimated lag in seconds. Fields that
+            cannot be determined are None.
+
+        Raises:
+            LiteFSNotRunningError: If LiteFS is not running.
+            LiteFSConfigError: If the position file is malformed.
+        """
+        local_txid = self.read_local_txid()
+        if is_primary is None:
+            is_primary = self._primary_detector.is_primary()
+
+        if is_primary:
+            if local_txid is not None:
+                self._rate_tracker.record(local_txid)
+            lag = ReplicationLag(
+                local_txid=local_txid,
+                primary_txid=local_txid,
+                txid_lag=0,
+                seconds_lag=0.0,
+            )
+            self._emit_metrics(lag)
+            return lag
+
+        primary_txid = self._read_primary_txid()
+        if primary_txid is not None:
+            self._rate_tracker.record(primary_txid)
+
+        if local_txid is None or primary_txid is None:
+            lag = ReplicationLag(local_txid=local_txid, primary_txid=primary_txid)
+            self._emit_metrics(lag)
+            return lag
+
+        txid_lag = max(0, primary_txid - local_txid)
+        lag = ReplicationLag(
+            local_txid=local_txid,
+            primary_txid=primary_txid,
+            txid_lag=txid_lag,
+            seconds_lag=self._rate_tracker.estimate_seconds(txid_lag),
+        )
+        self._emit_metrics(lag)
+        return lag
+
+    def is_lagging(self, lag: ReplicationLag) -> bool:
+        """Check whether a lag exceeds the configured thresholds.
+
+        Unknown values never count as lagging: a replica that cannot
+        determine the primary's position is not drained on that basis alone.
+
+        Args:
+            lag: The lag to evaluate.
+
+        Returns:
+            True if txid_lag or seconds_lag exceeds its threshold.
+        """
+        if lag.txid_lag is not None and lag.txid_lag > self._settings.max_lag_txids:
+            return True
+        return (
+            lag.seconds_lag is not None
+            and lag.seconds_lag > self._settings.max_lag_seconds
+        )
+
+    def _read_primary_txid(self) -> int | None:
+        """Get the primary's TXID from the cluster state.
+
+        Returns:
+            The leader's TXID, or None if unavailable.
+        """
+        if self._cluster_state_monitor is not None:
+            status = self._cluster_state_monitor.latest()
+            if status is None or status.cluster_state is None:
+                return None
+            return status.cluster_state.get_leader_txid()
+
+        if self._cluster_state_port is None:
+            return None
+
+        try:
+            cluster_state = self._cluster_state_port.get_cluster_state()
+        except Exception as e:
+            logger.warning(
+                f"Failed to get cluster state for lag check: {e}", exc_info=True
+            )
+            return None
+
+        return cluster_state.get_leader_txid()
+
+    def _emit_metrics(self, lag: ReplicationLag) -> None:
+        """Emit replication metrics if a metrics port is configured."""
+        if self._metrics is None:
+            return
+        if lag.local_txid is not None:
+            self._metrics.set_local_txid(lag.local_txid)
+        if lag.txid_lag is not None:
+            self._metrics.set_replication_lag(lag.txid_lag, lag.seconds_lag)
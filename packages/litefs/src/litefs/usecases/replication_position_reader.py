@@ -0,0 +1,54 @@
+"""Replication position reader use case for LiteFS."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.primary_detector import LiteFSNotRunningError
+
+# Suffix LiteFS appends to the database name for its position file
+POSITION_FILE_SUFFIX = "-pos"
+
+
+class ReplicationPositionReader:
+    """Reads the replication position of a database from the LiteFS mount.
+
+    LiteFS maintains a ``<database>-pos`` file next to each database on the
+    FUSE mount. The file contains the current TXID and checksum in
+    "TXID/CHECKSUM" hex format and is updated after every transaction is
+    applied, on the primary and on replicas alike.
+    """
+
+    def __init__(self, mount_path: str, database_name: str) -> None:
+        """Initialize replication position reader.
+
+        Args:
+            mount_path: Path to LiteFS mount point
+            database_name: Name of the database file on the mount
+        """
+        self.mount_path = Path(mount_path)
+        self.position_file = self.mount_path / f"{database_name}{POSITION_FILE_SUFFIX}"
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Read the current replication position.
+
+        Returns:
+            ReplicationPosition parsed from the position file, or None if the
+            position file does not exist yet (database not created).
+
+        Raises:
+            LiteFSNotRunningError: If mount path doesn't exist
+            LiteFSConfigError: If the position file content is malformed
+        """
+        if not self.mount_path.exists():
+            raise LiteFSNotRunningError(
+                f"LiteFS mount path does not exist: {self.mount_path}"
+            )
+
+        try:
+            content = self.position_file.read_text()
+        except FileNotFoundError:
+            return None
+
+        return ReplicationPosition.parse(content)
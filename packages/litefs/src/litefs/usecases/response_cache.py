@@ -0,0 +1,459 @@
+"""TXID-versioned HTTP response cache use case.
+
+Read-only pages usually stay the same until the database changes. This
+module caches rendered GET responses under a key that includes the local
+replication position (TXID and checksum), so every transaction applied on
+this node invalidates the cache implicitly: later lookups use a new key and
+the entries of older positions are dropped.
+
+The same position yields a strong ETag, which lets conditional requests be
+answered with 304 Not Modified without running the view.
+
+Views opt in with the cache_by_txid decorator; the framework middleware
+performs the lookup and stores responses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar, overload
+
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationPosition, format_txid
+from litefs.usecases.primary_detector import LiteFSNotRunningError
+
+if TYPE_CHECKING:
+    from litefs.adapters.metrics_port import MetricsPort
+    from litefs.usecases.replication_lag_checker import (
+        ReplicationPositionReaderProtocol,
+    )
+
+# Attribute set on views opted into the response cache
+CACHE_OPTIONS_ATTR = "litefs_response_cache"
+
+# Response header reporting whether the cache served the response
+CACHE_STATUS_HEADER_NAME = "X-LiteFS-Cache"
+
+# Approximate bookkeeping cost of an entry beyond its body and headers
+_ENTRY_OVERHEAD_BYTES = 256
+
+# Cache-Control directives that forbid storing a response in a shared cache
+_UNCACHEABLE_DIRECTIVES = frozenset({"no-store", "private", "no-cache"})
+
+_View = TypeVar("_View", bound=Callable[..., object])
+
+
+@dataclass(frozen=True)
+class ResponseCacheOptions:
+    """Per-view response cache options set by cache_by_txid.
+
+    Attributes:
+        vary_headers: Request headers whose values are part of the cache key
+                     for this view, or None to use the configured defaults.
+    """
+
+    vary_headers: tuple[str, ...] | None = None
+
+
+@overload
+def cache_by_txid(view: _View) -> _View: ...
+
+
+@overload
+def cache_by_txid(
+    view: None = None, *, vary: Iterable[str] | None = None
+) -> Callable[[_View], _View]: ...
+
+
+def cache_by_txid(
+    view: _View | None = None, *, vary: Iterable[str] | None = None
+) -> _View | Callable[[_View], _View]:
+    """Opt a view into the TXID-versioned response cache.
+
+    Only use for views whose output depends solely on the URL, the vary
+    headers and the database contents. The view is returned unchanged apart
+    from a marker attribute, so its signature is preserved for frameworks
+    that inspect it.
+
+    Usable with or without arguments:
+
+        @cache_by_txid
+        def article_list(request): ...
+
+        @cache_by_txid(vary=("Accept-Language",))
+        def article_detail(request, pk): ...
+
+    Args:
+        view: View to mark when used without arguments.
+        vary: Request headers whose values are part of the cache key for
+             this view. Defaults to the configured vary headers.
+
+    Returns:
+        The marked view, or a decorator when called with arguments.
+    """
+    options = ResponseCacheOptions(
+        vary_headers=tuple(vary) if vary is not None else None
+    )
+
+    def decorator(func: _View) -> _View:
+        setattr(func, CACHE_OPTIONS_ATTR, options)
+        return func
+
+    if view is not None:
+        return decorator(view)
+    return decorator
+
+
+def get_cache_options(view: object) -> ResponseCacheOptions | None:
+    """Get the response cache options of a view.
+
+    Args:
+        view: View callable (or any object) to inspect.
+
+    Returns:
+        The options set by cache_by_txid, or None if the view did not opt in.
+    """
+    options = getattr(view, CACHE_OPTIONS_ATTR, None)
+    return options if isinstance(options, ResponseCacheOptions) else None
+
+
+@dataclass(frozen=True)
+class ResponseCacheKey:
+    """Key identifying one cached response.
+
+    Attributes:
+        path: Request path.
+        query_string: Raw query string.
+        vary: (lowercased header name, value) pairs of the vary headers.
+        position: Local replication position the response was rendered at.
+    """
+
+    path: str
+    query_string: str
+    vary: tuple[tuple[str, str], ...]
+    position: ReplicationPosition
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        query_string: str,
+        vary_headers: Iterable[str],
+        get_header: Callable[[str], str | None],
+        position: ReplicationPosition,
+    ) -> ResponseCacheKey:
+        """Build a key from request attributes.
+
+        Args:
+            path: Request path.
+            query_string: Raw query string.
+            vary_headers: Names of the request headers to include.
+            get_header: Case-insensitive request header lookup.
+            position: Current local replication position.
+
+        Returns:
+            ResponseCacheKey for the request.
+        """
+        vary = tuple(
+            (name.lower(), get_header(name) or "")
+            for name in sorted(set(vary_headers), key=str.lower)
+        )
+        return cls(
+            path=path, query_string=query_string, vary=vary, position=position
+        )
+
+    @property
+    def etag(self) -> str:
+        """Strong ETag for the response identified by this key.
+
+        The ETag starts with the TXID and ends with a digest of the
+        checksum and request variant, so it changes with every applied
+        transaction and differs between variants of the same URL.
+        """
+        digest = hashlib.sha256()
+        digest.update(self.position.checksum.encode())
+        digest.update(b"\0" + self.path.encode())
+        digest.update(b"\0" + self.query_string.encode())
+        for name, value in self.vary:
+            digest.update(f"\0{name}:{value}".encode())
+        return f'"{format_txid(self.position.txid)}-{digest.hexdigest()[:16]}"'
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Rendered response stored in the response cache.
+
+    Attributes:
+        status_code: HTTP status code.
+        headers: Response headers as (name, value) pairs.
+        body: Response body.
+    """
+
+    status_code: int
+    headers: tuple[tuple[str, str], ...]
+    body: bytes
+
+    @property
+    def size(self) -> int:
+        """Approximate memory held by this entry in bytes."""
+        header_bytes = sum(len(name) + len(value) for name, value in self.headers)
+        return len(self.body) + header_bytes + _ENTRY_OVERHEAD_BYTES
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag.
+
+    Uses the weak comparison required for If-None-Match (RFC 9110), so a
+    W/ prefix on the client's tag is ignored.
+
+    Args:
+        if_none_match: Value of the If-None-Match request header, or None.
+        etag: ETag of the current representation.
+
+    Returns:
+        True if the client's copy is current and 304 may be returned.
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        candidate = candidate.removeprefix("W/")
+        if candidate == etag:
+            return True
+    return False
+
+
+def is_cacheable_response(
+    status_code: int,
+    headers: Mapping[str, str],
+    vary_headers: Iterable[str],
+) -> bool:
+    """Check whether a response may be stored in the response cache.
+
+    Only 200 responses without cookies, without Cache-Control directives
+    forbidding shared caching, and whose Vary header is covered by the
+    cache key are cacheable.
+
+    Args:
+        status_code: HTTP status code.
+        headers: Response headers with lowercased names.
+        vary_headers: Request headers that are part of the cache key.
+
+    Returns:
+        True if the response may be cached.
+    """
+    if status_code != 200:
+        return False
+    if "set-cookie" in headers:
+        return False
+
+    cache_control = headers.get("cache-control", "")
+    directives = {
+        part.split("=", 1)[0].strip().lower() for part in cache_control.split(",")
+    }
+    if directives & _UNCACHEABLE_DIRECTIVES:
+        return False
+
+    keyed = {name.lower() for name in vary_headers}
+    varied = {
+        name.strip().lower()
+        for name in headers.get("vary", "").split(",")
+        if name.strip()
+    }
+    return varied <= keyed
+
+
+def read_position_or_none(
+    position_reader: ReplicationPositionReaderProtocol,
+) -> ReplicationPosition | None:
+    """Read the local replication position, treating failures as unknown.
+
+    Args:
+        position_reader: Reader for the local replication position.
+
+    Returns:
+        The position, or None if it cannot be read (no position file,
+        LiteFS not running, or malformed content).
+    """
+    try:
+        return position_reader.read_position()
+    except (LiteFSNotRunningError, LiteFSConfigError):
+        return None
+
+
+async def read_position_or_none_async(
+    position_reader: ReplicationPositionReaderProtocol,
+) -> ReplicationPosition | None:
+    """Asynchronous variant of read_position_or_none() for ASGI applications.
+
+    Reading the position file is blocking file I/O (on a FUSE mount), so it
+    runs in a worker thread instead of on the event loop.
+
+    Args:
+        position_reader: Reader for the local replication position.
+
+    Returns:
+        The position, or None if it cannot be read.
+    """
+    return await asyncio.to_thread(read_position_or_none, position_reader)
+
+
+class ResponseCache:
+    """Bounded in-memory LRU store for TXID-versioned responses.
+
+    The cache tracks the newest replication position it has seen. A lookup
+    or store at a newer position drops every entry of older positions, so
+    memory is not spent on responses that can never be served again.
+    Lookups and stores at an older position (a request that read the
+    position just before a transaction was applied) miss and are skipped.
+
+    Beyond that, entries are evicted least recently used first whenever the
+    total size exceeds max_bytes.
+
+    Thread safety:
+        All methods are protected by an internal lock.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        """Initialize the response cache.
+
+        Args:
+            max_bytes: Upper bound on the memory held by cached responses.
+            max_entry_bytes: Responses larger than this are not stored.
+            metrics: Optional port for emitting hit/miss and size metrics.
+        """
+        self._max_bytes = max_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._metrics = metrics
+        self._entries: OrderedDict[ResponseCacheKey, CachedResponse] = OrderedDict()
+        self._position: ReplicationPosition | None = None
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @property
+    def max_entry_bytes(self) -> int:
+        """Get the largest response body size that is stored."""
+        return self._max_entry_bytes
+
+    @property
+    def hits(self) -> int:
+        """Get the number of lookups served from the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Get the number of lookups not found in the cache."""
+        return self._misses
+
+    @property
+    def size_bytes(self) -> int:
+        """Get the approximate memory held by cached responses."""
+        return self._size_bytes
+
+    @property
+    def hit_ratio(self) -> float | None:
+        """Get the fraction of lookups that were hits, or None if none yet."""
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else None
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    def get(self, key: ResponseCacheKey) -> CachedResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key of the request.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        with self._lock:
+            self._advance(key.position)
+            response = self._entries.get(key)
+            if response is None:
+                self._misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        self._emit_metrics()
+        return response
+
+    def put(self, key: ResponseCacheKey, response: CachedResponse) -> bool:
+        """Store a response.
+
+        Args:
+            key: Key of the request the response was rendered for.
+            response: Response to store.
+
+        Returns:
+            True if stored, False if the response is too large or was
+            rendered at an outdated position.
+        """
+        if len(response.body) > self._max_entry_bytes:
+            return False
+
+        with self._lock:
+            if not self._advance(key.position):
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= previous.size
+            self._entries[key] = response
+            self._size_bytes += response.size
+            while self._size_bytes > self._max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size
+        self._emit_metrics()
+        return True
+
+    def clear(self) -> None:
+        """Drop all cached responses. Hit and miss counts are kept."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._position = None
+        self._emit_metrics()
+
+    def _advance(self, position: ReplicationPosition) -> bool:
+        """Move the cache to a position, dropping entries of older ones.
+
+        Must be called with the lock held.
+
+        Returns:
+            True if position is the current position, False if it is older.
+        """
+        current = self._position
+        if current == position:
+            return True
+        if current is not None and position.txid < current.txid:
+            return False
+        # Newer TXID, or same TXID with a different checksum (database
+        # restored): nothing cached so far can be served again
+        self._entries.clear()
+        self._size_bytes = 0
+        self._position = position
+        return True
+
+    def _emit_metrics(self) -> None:
+        """Emit cache metrics if a metrics port is configured."""
+        if self._metrics is None:
+            return
+        self._metrics.set_response_cache_stats(
+            self._hits, self._misses, self._size_bytes
+        )
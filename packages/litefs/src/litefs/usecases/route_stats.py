@@ -0,0 +1,294 @@
+"""Per-route traffic and forwarding statistics.
+
+WriteForwardingMiddleware records each request it handles under its
+method and URL route (the pattern, never the raw path): request count,
+forwarded count, retries, failures, request and response bytes, and a
+latency distribution. The aggregate answers which endpoints cause
+forwarded writes and how they behave, to decide exclusions, caching or
+redesigns.
+
+Memory is bounded: at most max_routes routes are tracked, later routes
+are aggregated under OVERFLOW_ROUTE, and latencies are kept in a
+LatencySketch rather than as samples.
+
+Statistics are kept per process; under a multi-worker server each worker
+reports its own share of the traffic.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+# Route of requests beyond max_routes, and of requests matching no route
+OVERFLOW_ROUTE = "(other)"
+UNMATCHED_ROUTE = "(unmatched)"
+
+# Quantiles reported for each route
+REPORTED_QUANTILES = (0.5, 0.9, 0.99)
+
+# Smallest latency distinguished by the sketch, in seconds
+_MIN_LATENCY = 1e-6
+
+
+class LatencySketch:
+    """Streaming quantile sketch with a bounded relative error.
+
+    Values are counted in logarithmic buckets (the DDSketch layout), so a
+    reported quantile is within relative_accuracy of the exact one. With
+    the default 1% accuracy, latencies from 1 µs to 1,000 s use at most
+    about 1,050 buckets, whatever the number of values.
+
+    Not thread-safe; RouteStatsCollector serializes access.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of reported
+                              quantiles, between 0 and 1.
+        """
+        gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._gamma = gamma
+        self._log_gamma = math.log(gamma)
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of values added."""
+        return self._count
+
+    @property
+    def mean(self) -> float | None:
+        """Exact mean of the values, or None if empty."""
+        return self._sum / self._count if self._count else None
+
+    @property
+    def max(self) -> float | None:
+        """Exact maximum of the values, or None if empty."""
+        return self._max if self._count else None
+
+    def add(self, value: float) -> None:
+        """Add a value (seconds).
+
+        Args:
+            value: Non-negative latency in seconds.
+        """
+        self._count += 1
+        self._sum += value
+        self._max = max(self._max, value)
+        if value <= _MIN_LATENCY:
+            self._zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.99).
+
+        Returns:
+            The estimated quantile, or None if the sketch is empty.
+        """
+        if not self._count:
+            return None
+
+        rank = q * (self._count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if rank < seen:
+                # Midpoint of the bucket, within the relative accuracy
+                return min(2 * self._gamma**index / (self._gamma + 1), self._max)
+        return self._max
+
+
+@dataclass
+class RouteStats:
+    """Aggregate of the requests of one route.
+
+    Attributes:
+        method: HTTP method, or "*" for OVERFLOW_ROUTE.
+        route: URL route pattern.
+        requests: Requests handled.
+        forwarded: Requests forwarded to the primary.
+        retries: Forwarding attempts beyond the first.
+        failures: Forwarded requests that failed (connection errors, gateway
+                 errors after the last retry, or an open circuit).
+        request_bytes: Total request body bytes.
+        response_bytes: Total response body bytes.
+        latency: Distribution of the time spent handling the requests.
+    """
+
+    method: str
+    route: str
+    requests: int = 0
+    forwarded: int = 0
+    retries: int = 0
+    failures: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    latency: LatencySketch = field(default_factory=LatencySketch)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the aggregate as JSON-serializable data (latency in ms)."""
+        latency: dict[str, float | int | None] = {
+            "count": self.latency.count,
+            "mean_ms": _to_ms(self.latency.mean),
+        }
+        for q in REPORTED_QUANTILES:
+            latency[f"p{round(q * 100)}_ms"] = _to_ms(self.latency.quantile(q))
+        latency["max_ms"] = _to_ms(self.latency.max)
+        return {
+            "method": self.method,
+            "route": self.route,
+            "requests": self.requests,
+            "forwarded": self.forwarded,
+            "retries": self.retries,
+            "failures": self.failures,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency": latency,
+        }
+
+
+@dataclass
+class RouteSample:
+    """Forwarding outcome of one request, filled in while it is handled.
+
+    Attributes:
+        forwarded: Whether the request was forwarded to the primary.
+        retries: Forwarding attempts beyond the first.
+        failed: Whether forwarding failed.
+    """
+
+    forwarded: bool = False
+    retries: int = 0
+    failed: bool = False
+
+
+class RouteStatsCollector:
+    """Bounded in-memory per-route aggregate.
+
+    Thread safety:
+        All methods are safe to call concurrently.
+    """
+
+    def __init__(
+        self,
+        max_routes: int = 200,
+        relative_accuracy: float = 0.01,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty collector.
+
+        Args:
+            max_routes: Routes tracked individually; further routes are
+                       aggregated under OVERFLOW_ROUTE.
+            relative_accuracy: Relative error of the latency quantiles.
+            clock: Wall clock, injectable for tests.
+        """
+        self._max_routes = max_routes
+        self._relative_accuracy = relative_accuracy
+        self._clock = clock
+        self._routes: dict[tuple[str, str], RouteStats] = {}
+        self._since = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def max_routes(self) -> int:
+        """Routes tracked individually."""
+        return self._max_routes
+
+    def record(
+        self,
+        method: str,
+        route: str,
+        duration: float,
+        sample: RouteSample | None = None,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """Record a handled request.
+
+        Args:
+            method: HTTP method.
+            route: URL route pattern (not the raw path).
+            duration: Seconds spent handling the request.
+            sample: Forwarding outcome, if the request was considered for
+                   forwarding.
+            request_bytes: Request body size.
+            response_bytes: Response body size.
+        """
+        with self._lock:
+            stats = self._get_or_create(method, route)
+            stats.requests += 1
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.latency.add(duration)
+            if sample is not None and sample.forwarded:
+                stats.forwarded += 1
+                stats.retries += sample.retries
+                stats.failures += int(sample.failed)
+
+    def snapshot(self) -> dict[str, object]:
+        """Return all routes as JSON-serializable data.
+
+        Returns:
+            Dict with the start of the collection period ("since", Unix
+            time), max_routes and the routes, busiest first.
+        """
+        with self._lock:
+            busiest = sorted(
+                self._routes.values(), key=lambda stats: stats.requests, reverse=True
+            )
+            routes = [stats.to_dict() for stats in busiest]
+            since = self._since
+        return {"since": since, "max_routes": self._max_routes, "routes": routes}
+
+    def reset(self) -> None:
+        """Discard all statistics and start a new collection period."""
+        with self._lock:
+            self._routes.clear()
+            self._since = self._clock()
+
+    def _get_or_create(self, method: str, route: str) -> RouteStats:
+        """Return the aggregate of a route, creating it within the bound.
+
+        Must be called with the lock held.
+        """
+        key = (method, route)
+        stats = self._routes.get(key)
+        if stats is not None:
+            return stats
+
+        if len(self._routes) >= self._max_routes:
+            key = ("*", OVERFLOW_ROUTE)
+            stats = self._routes.get(key)
+            if stats is not None:
+                return stats
+
+        stats = RouteStats(
+            method=key[0],
+            route=key[1],
+            latency=LatencySketch(self._relative_accuracy),
+        )
+        self._routes[key] = stats
+        return stats
+
+
+def _to_ms(seconds: float | None) -> float | None:
+    """Convert seconds to milliseconds rounded to microseconds."""
+    return None if seconds is None else round(seconds * 1000, 3)
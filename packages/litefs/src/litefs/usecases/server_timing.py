@@ -0,0 +1,168 @@
+"""Per-request timing spans of the LiteFS layers.
+
+ServerTimingMiddleware (Django or FastAPI) opens a collector for each
+request; LiteFS components record spans into it while the request is
+handled, and the middleware reports them in a Server-Timing header:
+
+    Server-Timing: litefs-split-brain;dur=0.041,
+        litefs-forward;desc="attempt 1 success";dur=12.503, total;dur=13.112
+
+The collector is held in a context variable, so it follows the request
+across threads started with a copied context (e.g. FastAPI sync
+endpoints). Outside a collecting request, record_span() only reads the
+context variable.
+
+With ServerTimingSettings.log, the spans of each request are also logged
+at INFO as one JSON line by the litefs.usecases.server_timing logger.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER_NAME = "Server-Timing"
+
+# Span names
+PRIMARY_CHECK_SPAN = "litefs-primary"
+SPLIT_BRAIN_CHECK_SPAN = "litefs-split-brain"
+FORWARD_ATTEMPT_SPAN = "litefs-forward"
+FORWARD_BACKOFF_SPAN = "litefs-backoff"
+TXID_WAIT_SPAN = "litefs-txid-wait"
+DB_LOCK_WAIT_SPAN = "litefs-db-lock"
+TOTAL_SPAN = "total"
+
+_current_timing: ContextVar[ServerTiming | None] = ContextVar(
+    "litefs_server_timing", default=None
+)
+
+
+@dataclass(frozen=True)
+class TimingSpan:
+    """Time spent in one step of handling a request.
+
+    Attributes:
+        name: Span name, a Server-Timing metric name token.
+        duration: Duration in seconds.
+        description: Optional detail, e.g. the forwarding attempt number.
+    """
+
+    name: str
+    duration: float
+    description: str | None = None
+
+    def to_header_entry(self) -> str:
+        """Format the span as a Server-Timing entry (duration in ms)."""
+        entry = self.name
+        if self.description is not None:
+            escaped = self.description.replace("\\", "\\\\").replace('"', '\\"')
+            entry += f';desc="{escaped}"'
+        return f"{entry};dur={self.duration * 1000:.3f}"
+
+
+class ServerTiming:
+    """Spans recorded while handling one request.
+
+    Thread safety:
+        Spans are appended to a list, which is safe for the threads of one
+        request recording concurrently.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty collector."""
+        self._spans: list[TimingSpan] = []
+
+    @property
+    def spans(self) -> tuple[TimingSpan, ...]:
+        """Spans in the order they were recorded."""
+        return tuple(self._spans)
+
+    def record(
+        self, name: str, duration: float, description: str | None = None
+    ) -> None:
+        """Add a span.
+
+        Args:
+            name: Span name.
+            duration: Duration in seconds.
+            description: Optional detail shown with the span.
+        """
+        self._spans.append(TimingSpan(name, duration, description))
+
+    def header_value(self) -> str:
+        """Return the Server-Timing header value of all spans."""
+        return ", ".join(span.to_header_entry() for span in self._spans)
+
+    def to_log_fields(self) -> list[dict[str, object]]:
+        """Return the spans as JSON-serializable dicts (duration in ms)."""
+        fields: list[dict[str, object]] = []
+        for span in self._spans:
+            field: dict[str, object] = {
+                "name": span.name,
+                "dur_ms": round(span.duration * 1000, 3),
+            }
+            if span.description is not None:
+                field["desc"] = span.description
+            fields.append(field)
+        return fields
+
+
+@contextmanager
+def collect_server_timing() -> Iterator[ServerTiming]:
+    """Collect the spans recorded inside the block.
+
+    Yields:
+        The collector of the block.
+    """
+    timing = ServerTiming()
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+def record_span(name: str, started: float, description: str | None = None) -> None:
+    """Record a span ending now, if the current request collects timings.
+
+    Args:
+        name: Span name.
+        started: time.perf_counter() value when the span started.
+        description: Optional detail shown with the span.
+    """
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.record(name, time.perf_counter() - started, description)
+
+
+def log_server_timing(
+    timing: ServerTiming, method: str, path: str, status_code: int
+) -> None:
+    """Log the spans of a request as one structured line.
+
+    The fields are also attached to the record as the litefs_server_timing
+    attribute for structured log handlers.
+
+    Args:
+        timing: Spans of the request.
+        method: HTTP method of the request.
+        path: Path of the request.
+        status_code: Status code of the response.
+    """
+    fields = {
+        "method": method,
+        "path": path,
+        "status": status_code,
+        "spans": timing.to_log_fields(),
+    }
+    logger.info(
+        f"LiteFS server timing: {json.dumps(fields)}",
+        extra={"litefs_server_timing": fields},
+    )
@@ -0,0 +1,245 @@
+"""Slow-query log use case.
+
+On replicas every read runs against the local SQLite database, so a
+missing index shows up as CPU load rather than as a slow remote call.
+SlowQueryLog keeps the most recent statements slower than a threshold in
+a bounded ring buffer. For a sampled fraction of them, the caller captures
+the EXPLAIN QUERY PLAN output, and full table scans are flagged.
+
+Statements are grouped by fingerprint: the SQL with literals replaced by
+placeholders and whitespace collapsed, so that the same query with
+different arguments counts once. fingerprint_id() gives a short, stable
+identifier of a fingerprint, suitable as a metric label.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+# Fingerprint counting slow statements beyond max_fingerprints
+OVERFLOW_FINGERPRINT = "(other)"
+
+# String literals, numbers, and "IN (...)" lists of placeholders
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|:\w+|\?\d*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize a statement so that executions with other arguments match.
+
+    Literals and placeholders become "?", lists of them "(...)", and
+    whitespace is collapsed.
+
+    Args:
+        sql: SQL statement.
+
+    Returns:
+        The statement's fingerprint.
+    """
+    normalized = _STRING_LITERAL.sub("?", sql)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(statement_fingerprint: str) -> str:
+    """Return a short stable identifier of a fingerprint.
+
+    Args:
+        statement_fingerprint: Result of fingerprint().
+
+    Returns:
+        12 hexadecimal characters.
+    """
+    digest = hashlib.sha1(statement_fingerprint.encode(), usedforsecurity=False)
+    return digest.hexdigest()[:12]
+
+
+def has_full_scan(plan: Sequence[str]) -> bool:
+    """Check whether a query plan scans a whole table.
+
+    SQLite reports a full table scan as "SCAN <table>" (or "SCAN TABLE
+    <table>" before 3.36); scans of an index mention the index.
+
+    Args:
+        plan: Detail column of the EXPLAIN QUERY PLAN rows.
+
+    Returns:
+        True if any step scans a table without an index.
+    """
+    return any(detail.startswith("SCAN ") and "INDEX" not in detail for detail in plan)
+
+
+@dataclass(frozen=True)
+class SlowQuery:
+    """A statement slower than the slow-query threshold.
+
+    Attributes:
+        fingerprint: Normalized statement (see fingerprint()).
+        sql: Statement as executed, without its parameters.
+        duration: Execution time in seconds.
+        timestamp: Unix time the statement finished.
+        plan: EXPLAIN QUERY PLAN details, or None if not captured.
+        full_scan: Whether the plan scans a whole table, or None if the
+                  plan was not captured.
+    """
+
+    fingerprint: str
+    sql: str
+    duration: float
+    timestamp: float
+    plan: tuple[str, ...] | None = None
+    full_scan: bool | None = None
+
+    @property
+    def fingerprint_id(self) -> str:
+        """Short identifier of the fingerprint."""
+        return fingerprint_id(self.fingerprint)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return the entry as JSON-serializable data."""
+        return {
+            "fingerprint_id": self.fingerprint_id,
+            "fingerprint": self.fingerprint,
+            "sql": self.sql,
+            "duration_ms": round(self.duration * 1000, 3),
+            "timestamp": self.timestamp,
+            "plan": list(self.plan) if self.plan is not None else None,
+            "full_scan": self.full_scan,
+        }
+
+
+class SlowQueryLog:
+    """Bounded log of the most recent slow statements.
+
+    The buffer holds at most capacity entries, dropping the oldest. Counts
+    per fingerprint cover every slow statement since the log was created
+    or cleared, including those dropped from the buffer; at most
+    max_fingerprints are counted individually, later ones under
+    OVERFLOW_FINGERPRINT.
+
+    Thread safety:
+        All methods are safe to call concurrently.
+    """
+
+    def __init__(
+        self,
+        threshold: float,
+        capacity: int = 100,
+        explain_rate: float = 0.1,
+        max_fingerprints: int = 1000,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty log.
+
+        Args:
+            threshold: Minimum execution time, in seconds, of a slow statement.
+            capacity: Maximum number of entries kept.
+            explain_rate: Fraction of slow statements whose query plan is
+                         captured, between 0 and 1.
+            max_fingerprints: Fingerprints counted individually.
+            rng: Source of uniform random numbers in [0, 1), injectable for
+                tests.
+            clock: Wall clock, injectable for tests.
+        """
+        self._threshold = threshold
+        self._explain_rate = explain_rate
+        self._max_fingerprints = max_fingerprints
+        self._rng = rng
+        self._clock = clock
+        self._entries: deque[SlowQuery] = deque(maxlen=capacity)
+        self._counts: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def threshold(self) -> float:
+        """Minimum execution time of a slow statement, in seconds."""
+        return self._threshold
+
+    def is_slow(self, duration: float) -> bool:
+        """Check whether a statement execution time is above the threshold."""
+        return duration >= self._threshold
+
+    def should_explain(self) -> bool:
+        """Decide whether to capture the plan of the next slow statement."""
+        return self._explain_rate > 0 and self._rng() < self._explain_rate
+
+    def record(
+        self, sql: str, duration: float, plan: Sequence[str] | None = None
+    ) -> SlowQuery:
+        """Record a slow statement.
+
+        Args:
+            sql: Statement as executed.
+            duration: Execution time in seconds.
+            plan: EXPLAIN QUERY PLAN details, if captured.
+
+        Returns:
+            The recorded entry.
+        """
+        entry = SlowQuery(
+            fingerprint=fingerprint(sql),
+            sql=sql,
+            duration=duration,
+            timestamp=self._clock(),
+            plan=tuple(plan) if plan is not None else None,
+            full_scan=has_full_scan(plan) if plan is not None else None,
+        )
+        with self._lock:
+            self._entries.append(entry)
+            key = entry.fingerprint
+            if key not in self._counts and len(self._counts) >= self._max_fingerprints:
+                key = OVERFLOW_FINGERPRINT
+            self._counts[key] += 1
+        return entry
+
+    def entries(self) -> list[SlowQuery]:
+        """Return the entries in the buffer, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of slow statements per fingerprint."""
+        with self._lock:
+            return dict(self._counts)
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the log as JSON-serializable data.
+
+        Returns:
+            Dict with the threshold, the counts per fingerprint (most
+            frequent first) and the entries (most recent first).
+        """
+        with self._lock:
+            entries = list(self._entries)
+            counts = self._counts.most_common()
+        return {
+            "threshold_ms": round(self._threshold * 1000, 3),
+            "counts": [
+                {
+                    "fingerprint_id": fingerprint_id(statement_fingerprint),
+                    "fingerprint": statement_fingerprint,
+                    "count": count,
+                }
+                for statement_fingerprint, count in counts
+            ],
+            "entries": [entry.to_dict() for entry in reversed(entries)],
+        }
+
+    def clear(self) -> None:
+        """Discard all entries and counts."""
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
@@ -8,15 +8,22 @@ current state of all nodes in the cluster.
 
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from litefs.adapters.ports import SplitBrainDetectorPort
-from litefs.domain.split_brain import RaftNodeState
+from litefs.domain.metrics import CLUSTER_STATE_REFRESH_DURATION
+from litefs.domain.split_brain import RaftClusterState, RaftNodeState
 
 if TYPE_CHECKING:
     from litefs.adapters.metrics_port import MetricsPort
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class SplitBrainStatus:
@@ -31,10 +38,13 @@ class SplitBrainStatus:
         leader_nodes: List of RaftNodeState objects for all nodes claiming leadership.
                      May be empty if no leaders detected, contain one item in healthy
                      state, or multiple items if split-brain is detected.
+        cluster_state: Cluster state the detection was made from, including
+                      non-leader nodes, or None if not recorded.
     """
 
     is_split_brain: bool
     leader_nodes: list[RaftNodeState]
+    cluster_state: RaftClusterState | None = None
 
 
 class SplitBrainDetector:
@@ -65,7 +75,8 @@ class SplitBrainDetector:
 
         Args:
             port: Implementation of SplitBrainDetectorPort for cluster state access.
-            metrics: Optional port for emitting split-brain detection metrics.
+            metrics: Optional port for emitting split-brain detection and
+                    cluster state refresh duration metrics.
         """
         self.port = port
         self._metrics = metrics
@@ -85,7 +96,12 @@ class SplitBrainDetector:
             May propagate exceptions from port if cluster state cannot be determined.
         """
         # Get cluster state from port
+        started = time.perf_counter()
         cluster_state = self.port.get_cluster_state()
+        if self._metrics is not None:
+            self._metrics.observe_histogram(
+                CLUSTER_STATE_REFRESH_DURATION, time.perf_counter() - started
+            )
 
         # Get all nodes claiming leadership
         leader_nodes = cluster_state.get_leader_nodes()
@@ -98,5 +114,111 @@ class SplitBrainDetector:
             self._metrics.set_split_brain_detected(is_split_brain)
 
         return SplitBrainStatus(
-            is_split_brain=is_split_brain, leader_nodes=leader_nodes
+            is_split_brain=is_split_brain,
+            leader_nodes=leader_nodes,
+            cluster_state=cluster_state,
         )
+
+
+class SplitBrainMonitor:
+    """Runs split-brain detection in the background.
+
+    Detection queries every node of the cluster. Once writes are fenced by
+    the leader epoch (see litefs.usecases.epoch_fence), a stale primary no
+    longer needs that query before each request; the monitor refreshes
+    the status on a schedule and requests read the latest one.
+
+    Thread safety:
+        latest() may be called from any thread while the monitor runs.
+        Listeners are called on the thread running the round.
+    """
+
+    def __init__(self, detector: SplitBrainDetector, interval: float = 5.0) -> None:
+        """Initialize the monitor without starting it.
+
+        Args:
+            detector: Detector run on every round.
+            interval: Seconds between rounds.
+        """
+        self._detector = detector
+        self._interval = interval
+        self._status: SplitBrainStatus | None = None
+        self._listeners_lock = threading.Lock()
+        self._listeners: list[Callable[[SplitBrainStatus | None], None]] = []
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the background thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def latest(self) -> SplitBrainStatus | None:
+        """Get the status of the last round.
+
+        Returns:
+            The status, or None before the first round completed or if the
+            last round failed.
+        """
+        return self._status
+
+    def add_listener(
+        self, callback: Callable[[SplitBrainStatus | None], None]
+    ) -> None:
+        """Register a callback run after every round.
+
+        Args:
+            callback: Called with the round's status, or None if the round
+                failed.
+        """
+        with self._listeners_lock:
+            self._listeners.append(callback)
+
+    def run_once(self) -> SplitBrainStatus | None:
+        """Run one detection round, keep its status and notify listeners.
+
+        Returns:
+            The status, or None if detection failed.
+        """
+        try:
+            self._status = self._detector.detect_split_brain()
+        except Exception:
+            logger.exception("Background split-brain detection failed")
+            self._status = None
+        status = self._status
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(status)
+            except Exception:
+                logger.exception("Split-brain monitor listener failed")
+        return status
+
+    def start(self) -> None:
+        """Start detecting in a daemon thread. Does nothing if running."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="litefs-split-brain", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background thread.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the thread.
+        """
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        """Run a detection round every interval until stopped."""
+        while not self._stop_event.is_set():
+            self.run_once()
+            self._stop_event.wait(self._interval)
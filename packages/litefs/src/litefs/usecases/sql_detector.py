@@ -17,6 +17,40 @@ _CTE_WRITE_KEYWORD_RE = re.compile(
     r"(?<!FROM\s)\b(INSERT|UPDATE|DELETE)\b", re.IGNORECASE
 )
 
+# Pre-compiled regexes for table name extraction
+# String literals are blanked first so their contents never look like SQL
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+# Keywords that are followed by a table name (or a comma-separated list of
+# table names after FROM), with SQLite's optional conflict/existence clauses
+_TABLE_KEYWORD_RE = re.compile(
+    r"\b(FROM|JOIN|INTO|UPDATE|TABLE)\s+"
+    r"(?:OR\s+\w+\s+|IF\s+(?:NOT\s+)?EXISTS\s+)?",
+    re.IGNORECASE,
+)
+# Optionally schema-qualified identifier: "quoted", `quoted`, [quoted] or bare
+_IDENTIFIER = r'(?:"(?:[^"]|"")+"|`[^`]+`|\[[^\]]+\]|[A-Za-z_][\w$]*)'
+_TABLE_NAME_RE = re.compile(rf"({_IDENTIFIER})(?:\s*\.\s*({_IDENTIFIER}))?")
+# Keywords that may follow a table name in a FROM list and are not an alias
+_ALIAS_STOP_WORDS = (
+    "WHERE", "JOIN", "INNER", "LEFT", "RIGHT", "FULL", "CROSS", "NATURAL",
+    "ON", "USING", "GROUP", "ORDER", "LIMIT", "HAVING", "UNION", "EXCEPT",
+    "INTERSECT", "WINDOW", "SET", "VALUES", "DEFAULT", "SELECT", "RETURNING",
+)  # fmt: skip
+# Optional table alias following a table name in a FROM list
+_TABLE_ALIAS_RE = re.compile(
+    rf"\s+(?:AS\s+)?(?!(?:{'|'.join(_ALIAS_STOP_WORDS)})\b){_IDENTIFIER}",
+    re.IGNORECASE,
+)
+_LIST_SEPARATOR_RE = re.compile(r"\s*,\s*")
+
+# Statements that only control transactions and never modify tables
+_TRANSACTION_CONTROL_RE = re.compile(
+    r"^\s*(BEGIN|COMMIT|END|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE
+)
+
+# Statements that return rows of table data
+_QUERY_RE = re.compile(r"^\s*(SELECT|WITH|VALUES)\b", re.IGNORECASE)
+
 
 class SQLDetector:
     """Detects SQL write operations.
@@ -129,6 +163,84 @@ class SQLDetector:
 
         return False
 
+    def is_transaction_control(self, sql: str) -> bool:
+        """Check if SQL statement only controls a transaction.
+
+        BEGIN, COMMIT, END, ROLLBACK, SAVEPOINT and RELEASE statements never
+        modify any table, although is_write_operation() classifies some of
+        them as writes.
 
+        Args:
+            sql: SQL statement string
 
+        Returns:
+            True if statement is a transaction control statement
+        """
+        return bool(_TRANSACTION_CONTROL_RE.match(self.strip_sql_comments(sql)))
 
+    def is_query(self, sql: str) -> bool:
+        """Check if SQL statement is a read-only query.
+
+        Only SELECT, WITH and VALUES statements qualify; PRAGMA, EXPLAIN
+        and transaction control statements do not, even though they are
+        not writes.
+
+        Args:
+            sql: SQL statement string
+
+        Returns:
+            True if statement is a query that does not modify data
+        """
+        if not _QUERY_RE.match(self.strip_sql_comments(sql)):
+            return False
+        return not self.is_write_operation(sql)
+
+    def extract_table_names(self, sql: str) -> frozenset[str] | None:
+        """Extract the names of the tables a SQL statement reads or writes.
+
+        Recognizes tables after FROM (including comma-separated lists),
+        JOIN, INTO, UPDATE and TABLE. Names are unquoted, stripped of any
+        schema prefix and lowercased. CTE names are reported as tables too,
+        which only errs on the side of including more names.
+
+        Args:
+            sql: SQL statement string
+
+        Returns:
+            Table names for read statements (possibly empty), table names
+            for write statements, or None for write statements whose tables
+            cannot be determined (e.g., CREATE INDEX, VACUUM).
+        """
+        sql_clean = _STRING_LITERAL_RE.sub("''", self.strip_sql_comments(sql))
+        tables: set[str] = set()
+
+        for keyword in _TABLE_KEYWORD_RE.finditer(sql_clean):
+            position = keyword.end()
+            while True:
+                name = _TABLE_NAME_RE.match(sql_clean, position)
+                if name is None:
+                    break
+                tables.add(_normalize_identifier(name.group(2) or name.group(1)))
+                position = name.end()
+                if keyword.group(1).upper() != "FROM":
+                    break
+                alias = _TABLE_ALIAS_RE.match(sql_clean, position)
+                if alias is not None:
+                    position = alias.end()
+                separator = _LIST_SEPARATOR_RE.match(sql_clean, position)
+                if separator is None:
+                    break
+                position = separator.end()
+
+        if not tables and self.is_write_operation(sql):
+            return None
+        return frozenset(tables)
+
+
+def _normalize_identifier(identifier: str) -> str:
+    """Unquote and lowercase a SQL identifier."""
+    if identifier.startswith('"'):
+        identifier = identifier[1:-1].replace('""', '"')
+    elif identifier.startswith(("`", "[")):
+        identifier = identifier[1:-1]
+    return identifier.lower()
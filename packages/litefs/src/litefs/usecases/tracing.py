@@ -0,0 +1,69 @@
+"""Current trace context and span helpers for TracerPort hooks.
+
+The context of the innermost open span is held in a context variable.
+Spans started with trace_span() default to it as their parent, and
+HTTPXForwardingAdapter sends it to the primary in a traceparent header:
+
+    with trace_span(tracer, WRITE_FORWARDING_SPAN, parent=incoming):
+        with trace_span(tracer, FORWARD_REQUEST_SPAN) as span:
+            result = forwarding_port.forward_request(...)
+            span.set_attribute("http.response.status_code", result.status_code)
+
+With NoOpTracer, spans only carry the incoming context along.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from litefs.adapters.ports import SpanAttributeValue, TracerPort, TraceSpanPort
+    from litefs.domain.tracing import TraceContext
+
+_current_context: ContextVar[TraceContext | None] = ContextVar(
+    "litefs_trace_context", default=None
+)
+
+
+def current_trace_context() -> TraceContext | None:
+    """Return the context of the innermost open span, if any."""
+    return _current_context.get()
+
+
+@contextmanager
+def trace_span(
+    tracer: TracerPort,
+    name: str,
+    attributes: Mapping[str, SpanAttributeValue] | None = None,
+    parent: TraceContext | None = None,
+) -> Iterator[TraceSpanPort]:
+    """Open a span for the duration of the block.
+
+    The span is the current span inside the block. An exception escaping
+    the block is recorded in the error.type attribute.
+
+    Args:
+        tracer: Tracer starting the span.
+        name: Span name.
+        attributes: Initial span attributes.
+        parent: Parent context, e.g. from an incoming traceparent header.
+               Defaults to the current span.
+
+    Yields:
+        The open span.
+    """
+    if parent is None:
+        parent = _current_context.get()
+    span = tracer.start_span(name, parent, attributes)
+    token = _current_context.set(span.context)
+    try:
+        yield span
+    except BaseException as e:
+        span.set_attribute("error.type", type(e).__name__)
+        raise
+    finally:
+        _current_context.reset(token)
+        span.end()
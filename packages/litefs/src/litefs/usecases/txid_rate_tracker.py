@@ -0,0 +1,101 @@
+"""TXID rate tracker use case for estimating replication lag in seconds."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from litefs.adapters.ports import RealTimeProvider, TimeProvider
+
+
+class TxidRateTracker:
+    """Tracks how fast TXIDs advance over a sliding time window.
+
+    Records (timestamp, txid) samples and derives a transactions-per-second
+    rate from the oldest and newest samples in the window. The rate is used
+    to translate a lag measured in transactions into an estimated lag in
+    seconds.
+
+    Thread safety:
+        All methods are protected by an internal lock.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 60.0,
+        max_samples: int = 256,
+        time_provider: TimeProvider | None = None,
+    ) -> None:
+        """Initialize the rate tracker.
+
+        Args:
+            window_seconds: Samples older than this are discarded.
+            max_samples: Upper bound on retained samples.
+            time_provider: Clock used to timestamp samples. Defaults to
+                          RealTimeProvider.
+        """
+        self._window_seconds = window_seconds
+        self._samples: deque[tuple[float, int]] = deque(maxlen=max_samples)
+        self._time_provider = time_provider or RealTimeProvider()
+        self._lock = threading.Lock()
+
+    def record(self, txid: int) -> None:
+        """Record an observed TXID at the current time.
+
+        A TXID lower than the newest sample (e.g., database restored or
+        primary changed) resets the window.
+
+        Args:
+            txid: Observed transaction ID.
+        """
+        now = self._time_provider.get_time_seconds()
+        with self._lock:
+            if self._samples and txid < self._samples[-1][1]:
+                self._samples.clear()
+            self._samples.append((now, txid))
+            self._prune(now)
+
+    def get_rate(self) -> float | None:
+        """Get the observed TXID rate.
+
+        Returns:
+            Transactions per second over the window, or None if fewer than
+            two samples spanning a non-zero interval have been recorded.
+        """
+        with self._lock:
+            self._prune(self._time_provider.get_time_seconds())
+            if len(self._samples) < 2:
+                return None
+            oldest_time, oldest_txid = self._samples[0]
+            newest_time, newest_txid = self._samples[-1]
+
+        elapsed = newest_time - oldest_time
+        if elapsed <= 0:
+            return None
+        return (newest_txid - oldest_txid) / elapsed
+
+    def estimate_seconds(self, txid_lag: int) -> float | None:
+        """Estimate how many seconds a TXID lag represents.
+
+        Args:
+            txid_lag: Number of transactions behind.
+
+        Returns:
+            0.0 if there is no lag, the estimated seconds if the rate is
+            known and positive, None otherwise.
+        """
+        if txid_lag <= 0:
+            return 0.0
+        rate = self.get_rate()
+        if rate is None or rate <= 0:
+            return None
+        return txid_lag / rate
+
+    def _prune(self, now: float) -> None:
+        """Drop samples outside the window, always keeping the newest one.
+
+        Must be called with the lock held.
+        """
+        cutoff = now - self._window_seconds
+        while len(self._samples) > 1 and self._samples[0][0] < cutoff:
+            self._samples.popleft()
@@ -0,0 +1,198 @@
+"""TXID waiter use case for read-your-writes consistency on replicas."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING
+
+from litefs.adapters.ports import RealSleeper, RealTimeProvider, Sleeper, TimeProvider
+from litefs.domain.exceptions import LiteFSConfigError
+
+if TYPE_CHECKING:
+    from litefs.domain.events import ReplicationChangeEvent
+    from litefs.usecases.change_bus import ChangeBus
+    from litefs.usecases.replication_lag_checker import (
+        ReplicationPositionReaderProtocol,
+    )
+
+logger = logging.getLogger(__name__)
+
+
+class TxidWaiter:
+    """Waits until the local replication position reaches a given TXID.
+
+    Used on replicas to honour read-your-writes tokens: a client that just
+    wrote through the primary presents the primary's post-commit TXID, and
+    the replica holds the read until it has applied that transaction.
+
+    The position file is re-read whenever the wait wakes up. Wake-ups start
+    at ``poll_interval`` and back off exponentially up to
+    ``max_poll_interval``, so a replica that is only a few milliseconds
+    behind answers quickly while a long wait costs little I/O.
+
+    With a running ChangeBus, waits wake up on its change events instead,
+    and fall back to re-reading every ``max_poll_interval`` (the bus
+    coalesces bursts, so an event may come later than the change).
+
+    Thread safety:
+        Safe for concurrent use.
+    """
+
+    def __init__(
+        self,
+        position_reader: ReplicationPositionReaderProtocol,
+        time_provider: TimeProvider | None = None,
+        sleeper: Sleeper | None = None,
+        poll_interval: float = 0.002,
+        max_poll_interval: float = 0.05,
+        change_bus: ChangeBus | None = None,
+    ) -> None:
+        """Initialize the TXID waiter.
+
+        Args:
+            position_reader: Reader for the local replication position.
+            time_provider: Clock used for deadlines. Defaults to
+                          RealTimeProvider.
+            sleeper: Sleeper used between position checks in
+                    wait_for_txid(). Defaults to RealSleeper.
+            poll_interval: Initial delay in seconds between position checks.
+            max_poll_interval: Upper bound in seconds for the delay between
+                              position checks.
+            change_bus: Optional change bus whose events wake up waits
+                       while it is running.
+        """
+        self._position_reader = position_reader
+        self._time_provider = time_provider or RealTimeProvider()
+        self._sleeper = sleeper or RealSleeper()
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._change_bus = change_bus
+        self._changed = threading.Condition()
+        self._changes_seen = 0
+        if change_bus is not None:
+            change_bus.subscribe(self._on_change)
+
+    def _on_change(self, event: ReplicationChangeEvent) -> None:
+        """Wake up the blocking waits on a change bus event."""
+        with self._changed:
+            self._changes_seen += 1
+            self._changed.notify_all()
+
+    def _uses_change_bus(self) -> bool:
+        """Check whether waits can rely on change bus events."""
+        return self._change_bus is not None and self._change_bus.is_running
+
+    def current_txid(self) -> int | None:
+        """Read the local TXID.
+
+        Returns:
+            The local TXID, or None if it cannot be read (no position file,
+            LiteFS not running, or malformed content).
+        """
+        try:
+            position = self._position_reader.read_position()
+        except LiteFSConfigError as e:
+            logger.warning(f"Failed to read replication position: {e}")
+            return None
+        return position.txid if position is not None else None
+
+    def is_caught_up(self, txid: int) -> bool:
+        """Check whether the local position has reached a TXID.
+
+        Args:
+            txid: TXID the caller needs to observe.
+
+        Returns:
+            True if the local TXID is at least txid, False otherwise.
+        """
+        current = self.current_txid()
+        return current is not None and current >= txid
+
+    async def current_txid_async(self) -> int | None:
+        """Read the local TXID in a worker thread.
+
+        Reading the position file is blocking file I/O (on a FUSE mount), so
+        ASGI applications should not do it on the event loop.
+
+        Returns:
+            The local TXID, or None if it cannot be read.
+        """
+        return await asyncio.to_thread(self.current_txid)
+
+    def wait_for_txid(self, txid: int, timeout: float) -> bool:
+        """Block until the local position reaches a TXID or the timeout expires.
+
+        Args:
+            txid: TXID the caller needs to observe.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the TXID was reached, False if the deadline passed first.
+        """
+        deadline = self._time_provider.get_time_seconds() + timeout
+        interval = self._poll_interval
+        # Changes before this point are covered by the next position read
+        seen = self._changes_seen
+
+        while not self.is_caught_up(txid):
+            remaining = deadline - self._time_provider.get_time_seconds()
+            if remaining <= 0:
+                return False
+            if self._uses_change_bus():
+                with self._changed:
+                    self._changed.wait_for(
+                        lambda seen=seen: self._changes_seen != seen,
+                        min(self._max_poll_interval, remaining),
+                    )
+                    seen = self._changes_seen
+                continue
+            self._sleeper.sleep(min(interval, remaining))
+            interval = min(interval * 2, self._max_poll_interval)
+
+        return True
+
+    async def wait_for_txid_async(self, txid: int, timeout: float) -> bool:
+        """Asynchronous variant of wait_for_txid() for ASGI applications.
+
+        Yields to the event loop between position checks instead of
+        blocking the calling thread, and reads the position file in a
+        worker thread.
+
+        Args:
+            txid: TXID the caller needs to observe.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if the TXID was reached, False if the deadline passed first.
+        """
+        deadline = self._time_provider.get_time_seconds() + timeout
+        interval = self._poll_interval
+        bus = self._change_bus if self._uses_change_bus() else None
+        changes = bus.subscribe_queue() if bus is not None else None
+
+        try:
+            while not await self._is_caught_up_async(txid):
+                remaining = deadline - self._time_provider.get_time_seconds()
+                if remaining <= 0:
+                    return False
+                if changes is not None:
+                    change = asyncio.ensure_future(changes.get())
+                    await asyncio.wait(
+                        {change}, timeout=min(self._max_poll_interval, remaining)
+                    )
+                    change.cancel()
+                    continue
+                await asyncio.sleep(min(interval, remaining))
+                interval = min(interval * 2, self._max_poll_interval)
+        finally:
+            if bus is not None and changes is not None:
+                bus.unsubscribe_queue(changes)
+
+        return True
+
+    async def _is_caught_up_async(self, txid: int) -> bool:
+        """Check is_caught_up() without reading the file on the event loop."""
+        current = await self.current_txid_async()
+        return current is not None and current >= txid
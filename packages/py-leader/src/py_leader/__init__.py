@@ -1,5 +1,19 @@
 """py-leader: Minimal Raft leader election wrapper around PySyncObj."""
 
-from py_leader.election import RaftLeaderElection
+from py_leader.aio import AsyncRaftLeaderElection
+from py_leader.election import (
+    LeadershipTransfer,
+    MembershipChange,
+    RaftLeaderElection,
+    RaftTiming,
+)
+from py_leader.membership import RaftMembershipClient
 
-__all__ = ["RaftLeaderElection"]
+__all__ = [
+    "AsyncRaftLeaderElection",
+    "LeadershipTransfer",
+    "MembershipChange",
+    "RaftLeaderElection",
+    "RaftMembershipClient",
+    "RaftTiming",
+]
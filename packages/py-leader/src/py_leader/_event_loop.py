@@ -0,0 +1,159 @@
+"""Internal driver running a PySyncObj node on an asyncio event loop."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+
+from pysyncobj.poller import POLL_EVENT_TYPE, Poller
+
+if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Seconds before ticking again after a failed tick
+_RETRY_DELAY = 0.05
+
+
+class EventLoopPoller(Poller):
+    """PySyncObj poller whose socket events are dispatched by an event loop.
+
+    PySyncObj's sockets are non-blocking and only reach the network through
+    its poller, so registering them with the loop (add_reader/add_writer)
+    replaces the select or poll call of the tick thread. Subscriptions made
+    off the loop thread, e.g. by a send from a thread waiting for a
+    leadership transfer, are handed to the loop.
+    """
+
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, on_event: Callable[[], None]
+    ) -> None:
+        """Initialize with no subscription. Must be called on the loop thread.
+
+        Args:
+            loop: Event loop dispatching the socket events.
+            on_event: Called after each dispatched event.
+        """
+        self._loop = loop
+        self._on_event = on_event
+        self._thread = threading.get_ident()
+
+    def subscribe(
+        self, descr: int, callback: Callable[..., Any], eventMask: int
+    ) -> None:
+        """Call callback(descr, event) when descr is ready for eventMask."""
+        self._call(self._subscribe, descr, callback, eventMask)
+
+    def unsubscribe(self, descr: int) -> None:
+        """Stop watching descr."""
+        self._call(self._unsubscribe, descr)
+
+    def poll(self, timeout: float) -> None:
+        """Do nothing: the loop dispatches events as they arrive."""
+
+    def _subscribe(self, descr: int, callback: Callable[..., Any], mask: int) -> None:
+        """Register descr with the loop. Runs on the loop thread."""
+        self._unsubscribe(descr)
+        if mask & POLL_EVENT_TYPE.READ:
+            self._loop.add_reader(
+                descr, self._dispatch, callback, descr, POLL_EVENT_TYPE.READ
+            )
+        if mask & POLL_EVENT_TYPE.WRITE:
+            self._loop.add_writer(
+                descr, self._dispatch, callback, descr, POLL_EVENT_TYPE.WRITE
+            )
+
+    def _unsubscribe(self, descr: int) -> None:
+        """Unregister descr from the loop. Runs on the loop thread."""
+        self._loop.remove_reader(descr)
+        self._loop.remove_writer(descr)
+
+    def _dispatch(self, callback: Callable[..., Any], descr: int, event: int) -> None:
+        """Pass a socket event to PySyncObj."""
+        callback(descr, event)
+        self._on_event()
+
+    def _call(self, function: Callable[..., None], *args: Any) -> None:
+        """Run function on the loop thread, now if already there."""
+        if threading.get_ident() == self._thread:
+            function(*args)
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(function, *args)
+
+
+class EventLoopDriver:
+    """Ticks a PySyncObj node from timers on an event loop.
+
+    PySyncObj's tick thread waits for socket events for at most 50 ms, then
+    ticks, so an idle node wakes 20 times a second. The driver ticks soon
+    after socket events, coalescing the events of one loop iteration, and
+    otherwise when the node's next timer is due, as reported by each tick.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        tick: Callable[[], float],
+    ) -> None:
+        """Initialize without ticking. Must be called on the loop thread.
+
+        Args:
+            loop: Event loop running the node.
+            tick: Performs one PySyncObj tick without waiting; returns the
+                seconds until the next tick is due.
+        """
+        self.loop = loop
+        self.poller = EventLoopPoller(loop, self.wake)
+        self.ticks = 0
+        self._tick = tick
+        self._handle: asyncio.TimerHandle | None = None
+        self._stopped = False
+        self._thread = threading.get_ident()
+
+    @property
+    def on_loop_thread(self) -> bool:
+        """Whether the caller runs on the loop thread."""
+        return threading.get_ident() == self._thread
+
+    def start(self) -> None:
+        """Start ticking."""
+        self._schedule(0.0)
+
+    def wake(self) -> None:
+        """Tick soon, e.g. after a socket event. Callable from any thread."""
+        if self.on_loop_thread:
+            self._schedule(0.0)
+        elif not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._schedule, 0.0)
+
+    def stop(self) -> None:
+        """Stop ticking. Runs on the loop thread."""
+        self._stopped = True
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    def _schedule(self, delay: float) -> None:
+        """Tick after delay seconds, unless a tick is due earlier."""
+        if self._stopped:
+            return
+        when = self.loop.time() + delay
+        if self._handle is not None:
+            if self._handle.when() <= when:
+                return
+            self._handle.cancel()
+        self._handle = self.loop.call_at(when, self._run)
+
+    def _run(self) -> None:
+        """Tick and schedule the next tick."""
+        self._handle = None
+        self.ticks += 1
+        try:
+            delay = self._tick()
+        except Exception:
+            logger.exception("Raft tick failed")
+            delay = _RETRY_DELAY
+        self._schedule(delay)
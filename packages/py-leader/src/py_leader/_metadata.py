@@ -0,0 +1,63 @@
+"""Internal replicated cluster metadata stored on the Raft log."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pysyncobj import SyncObjConsumer, replicated
+
+# Keys written by the leader when it is elected
+LEADER = "leader"
+EPOCH = "epoch"
+FORWARDING_URL = "forwarding_url"
+# Key bumped by operators when the cluster configuration changes
+CONFIG_VERSION = "config_version"
+
+RESERVED_KEYS = frozenset({LEADER, EPOCH, FORWARDING_URL})
+
+
+class ClusterMetadata(SyncObjConsumer):  # type: ignore[misc]
+    """Small key-value map replicated through the Raft log.
+
+    Updates are appended to the log and applied on every node in log order,
+    so reads are local and need no network call. Updates stamped with an
+    epoch lower than the stored one are dropped: a deposed leader cannot
+    overwrite the entry of its successor.
+
+    Every update replaces the map, so a reader on another thread always sees
+    a complete version.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty map."""
+        super().__init__()
+        self.__data: dict[str, Any] = {}
+
+    @replicated
+    def apply(self, updates: dict[str, Any]) -> None:
+        """Merge updates into the map on every node.
+
+        Keys set to None are removed. Calls are appended to the Raft log and
+        return without waiting for the commit.
+
+        Args:
+            updates: Keys and values to set.
+        """
+        epoch = updates.get(EPOCH)
+        if epoch is not None and epoch < self.__data.get(EPOCH, 0):
+            return
+        data = dict(self.__data)
+        for key, value in updates.items():
+            if value is None:
+                data.pop(key, None)
+            else:
+                data[key] = value
+        self.__data = data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of a key, or default if it is not set."""
+        return self.__data.get(key, default)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a copy of the whole map."""
+        return dict(self.__data)
@@ -2,29 +2,255 @@
 
 from __future__ import annotations
 
+import logging
+import queue
+import random
 import threading
+import time
+import types
+from importlib.metadata import PackageNotFoundError, version
 from typing import TYPE_CHECKING
 
-from pysyncobj import SyncObj, SyncObjConf
+from pysyncobj import FAIL_REASON, SyncObj, SyncObjConf
+from pysyncobj.monotonic import monotonic as raft_clock
+from pysyncobj.transport import TCPTransport
+
+from py_leader._event_loop import EventLoopDriver
+from py_leader._metadata import EPOCH, FORWARDING_URL, LEADER, ClusterMetadata
+from py_leader._reachability import ReachabilityTracker
+from py_leader._timing import AdaptiveTimeouts
 
 if TYPE_CHECKING:
+    import asyncio
     from collections.abc import Callable
 
+    from pysyncobj.poller import Poller
+
+logger = logging.getLogger(__name__)
+
 # PySyncObj state constants
 _STATE_FOLLOWER = 0
 _STATE_CANDIDATE = 1
 _STATE_LEADER = 2
 
+# Seconds between adjustments of adaptive timeouts
+_TIMING_ADJUST_INTERVAL = 1.0
+
+# Seconds between retries of a membership change the leader denied
+_MEMBERSHIP_RETRY_INTERVAL = 0.05
+
+# Pre-vote messages, answered by this wrapper; PySyncObj ignores them
+_PRE_VOTE_REQUEST = "pre_vote_request"
+_PRE_VOTE_RESPONSE = "pre_vote_response"
+
+# Names of PySyncObj failure codes, for error messages
+_FAIL_REASONS = {
+    value: name.lower()
+    for name, value in vars(FAIL_REASON).items()
+    if name.isupper() and isinstance(value, int)
+}
+
+
+# PySyncObj version the internals below were verified against
+_TESTED_PYSYNCOBJ = "0.3.17"
+
+# PySyncObj internals this module overrides or reads, by class: methods
+# (including name-mangled ones) and attributes used by the class.
+# Besides, transferLeadership() is expected to report a refusal through
+# its callback before returning.
+_SYNCOBJ_METHODS = (
+    "_onTick",
+    "_applyCommand",
+    "_getConf",
+    "_getLeader",
+    "_SyncObj__getCurrentLogTerm",
+    "_SyncObj__getCurrentLogIndex",
+    "transferLeadership",
+)
+_SYNCOBJ_ATTRIBUTES = (
+    "_poller",
+    "_SyncObj__transport",
+    "_SyncObj__transferInProgress",
+    "_SyncObj__raftMatchIndex",
+    "_SyncObj__raftElectionDeadline",
+    "_SyncObj__newAppendEntriesTime",
+)
+_TRANSPORT_METHODS = ("_onNodeConnected", "_onNodeDisconnected", "_onMessageReceived")
+_TRANSPORT_ATTRIBUTES = ("_syncObj",)
+
+
+def _attribute_names(cls: type) -> set[str]:
+    """Names of the attributes read or assigned by the methods of a class."""
+    names: set[str] = set()
+    pending = [
+        value.__code__
+        for value in vars(cls).values()
+        if isinstance(value, types.FunctionType)
+    ]
+    while pending:
+        code = pending.pop()
+        names.update(code.co_names)
+        pending.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return names
+
+
+def _check_pysyncobj() -> None:
+    """Fail on import if PySyncObj lacks the internals this module uses.
+
+    PySyncObj has no public API for them, so an upgrade may rename or
+    remove them; failing here is clearer than misbehaving elections.
+
+    Raises:
+        RuntimeError: If an internal is missing.
+    """
+    missing = [
+        f"SyncObj.{name}" for name in _SYNCOBJ_METHODS if not hasattr(SyncObj, name)
+    ]
+    missing += [
+        f"TCPTransport.{name}"
+        for name in _TRANSPORT_METHODS
+        if not hasattr(TCPTransport, name)
+    ]
+    used = _attribute_names(SyncObj)
+    missing += [f"SyncObj.{n}" for n in _SYNCOBJ_ATTRIBUTES if n not in used]
+    used = _attribute_names(TCPTransport)
+    missing += [f"TCPTransport.{n}" for n in _TRANSPORT_ATTRIBUTES if n not in used]
+    if missing:
+        try:
+            installed = version("pysyncobj")
+        except PackageNotFoundError:
+            installed = "unknown"
+        raise RuntimeError(
+            f"py-leader does not support the installed PySyncObj {installed} "
+            f"(tested with {_TESTED_PYSYNCOBJ}): missing {', '.join(missing)}"
+        )
+
+
+_check_pysyncobj()
+
+
+class _ReachabilityTransport(TCPTransport):  # type: ignore[misc]
+    """TCP transport reporting partner activity to the node's tracker.
+
+    Nodes are reported by id: the address of a partner, or a counter for an
+    observer connected to this node, which the tracker ignores. Nodes added
+    or dropped on membership changes are reported to the node, as are
+    heartbeats and their acknowledgements, for timing.
+    """
+
+    def send(self, node, message) -> bool:
+        if isinstance(message, dict) and message.get("type") == "append_entries":
+            self._syncObj.on_heartbeat_sent(node.id)
+        return super().send(node, message)
+
+    def addNode(self, node) -> None:
+        super().addNode(node)
+        self._syncObj.mark_membership_changed()
+
+    def dropNode(self, node) -> None:
+        super().dropNode(node)
+        self._syncObj.mark_membership_changed()
+
+    def _onNodeConnected(self, node) -> None:
+        self._syncObj.reachability.on_connected(node.id)
+        super()._onNodeConnected(node)
+
+    def _onNodeDisconnected(self, node) -> None:
+        self._syncObj.reachability.on_disconnected(node.id)
+        self._syncObj.timing.on_disconnected(node.id)
+        super()._onNodeDisconnected(node)
+
+    def _onMessageReceived(self, node, message) -> None:
+        self._syncObj.reachability.on_message(node.id)
+        if isinstance(message, dict):
+            if message.get("type") in (_PRE_VOTE_REQUEST, _PRE_VOTE_RESPONSE):
+                self._syncObj.on_pre_vote_message(node, message)
+                return
+            self._syncObj.on_raft_message(node.id, message)
+        super()._onMessageReceived(node, message)
+
+
+class _TickRequest:
+    """Work handed to the tick thread, which owns PySyncObj's state."""
+
+    def __init__(self, work: Callable[[], None]) -> None:
+        self._work = work
+        self._done = threading.Event()
+        self._abandoned = False
+
+    def run(self) -> None:
+        """Do the work, unless the requester stopped waiting. On the tick thread."""
+        if self._abandoned:
+            return
+        try:
+            self._work()
+        finally:
+            self._done.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for the work to be done; give it up after the timeout."""
+        if self._done.wait(timeout):
+            return True
+        self._abandoned = True
+        return self._done.is_set()
+
 
 class LeaderElectionNode(SyncObj):
-    """Minimal SyncObj for leader election only - no replicated state.
+    """Minimal SyncObj for leader election.
 
     This class wraps PySyncObj's SyncObj to provide a simple leader election
-    mechanism. It does not use any replicated state - only the Raft consensus
-    for leader election.
+    mechanism. The only replicated state is the optional cluster metadata,
+    which a new leader stamps with its address and term.
+
+    Reachable partners are tracked from connection events and heartbeat
+    acknowledgements as they arrive, so quorum reads do not scan the
+    PySyncObj status.
+
+    An observer runs as a PySyncObj read-only node: it connects to the
+    voters and receives the log, so it knows the leader and term, but it
+    never votes or starts an election.
+
+    With dynamic membership, voters are added and removed one at a time
+    through the log. The member list is reconciled on the next tick after
+    the transport adds or drops a node.
+
+    A lower-priority node waits election_backoff_ms longer before standing
+    for election, so a preferred node usually times out first.
+
+    Heartbeat round trips (on the leader) and the gaps between heartbeats
+    (on followers) are always measured. With adaptive timing, the heartbeat
+    interval and election timeout follow them within their bounds; the
+    configured values are the upper bounds.
+
+    With pre-vote, a node whose election deadline passes first asks the
+    voters whether they would vote for it, without raising its term. A
+    voter agrees only if it has not heard from a leader for an election
+    timeout and the node's log is as up to date as its own. The election
+    starts once a majority agrees, so a node coming back from a partition
+    cannot depose a healthy leader by bringing a higher term. PySyncObj
+    has no pre-vote: the node postpones PySyncObj's private election
+    deadline until the pre-vote succeeds.
+
+    With check-quorum, a leader steps down once it has not heard from a
+    majority for an election timeout, instead of PySyncObj's default of
+    30 seconds.
+
+    Given an event loop, the node runs on it instead of PySyncObj's tick
+    thread: its sockets are registered with the loop and it ticks from the
+    loop's timers, so callbacks run on the loop thread. It must then be
+    created on that thread. Rather than every 50 ms, it ticks after socket
+    events and commands, and when its next heartbeat or election deadline
+    is due, at least once per heartbeat interval.
+
+    PySyncObj's Raft state and connections belong to the tick thread.
+    Leadership transfers requested from other threads are handed to it,
+    and follower match indexes are copied on each tick while leading.
 
     Attributes:
         is_leader: Thread-safe property indicating if this node is the leader.
+        reachability: Reachable partners and quorum of this node.
+        metadata: Replicated cluster metadata, None if not replicated.
+        timing: Measured delays and the timing derived from them.
     """
 
     def __init__(
@@ -34,32 +260,183 @@ class LeaderElectionNode(SyncObj):
         *,
         election_timeout_ms: int = 5000,
         heartbeat_interval_ms: int = 1000,
+        election_backoff_ms: int = 0,
         on_leader_change: Callable[[bool], None] | None = None,
+        metadata: ClusterMetadata | None = None,
+        forwarding_url: str | None = None,
+        observer: bool = False,
+        dynamic_membership: bool = False,
+        on_membership_change: Callable[[list[str]], None] | None = None,
+        min_election_timeout_ms: int | None = None,
+        min_heartbeat_interval_ms: int | None = None,
+        on_rtt: Callable[[str, float], None] | None = None,
+        on_timing_change: Callable[[float, float], None] | None = None,
+        pre_vote: bool = True,
+        check_quorum: bool = True,
+        event_loop: asyncio.AbstractEventLoop | None = None,
     ) -> None:
         """Initialize the leader election node.
 
         Args:
             self_address: This node's address in "host:port" format.
-            partners: List of partner node addresses in "host:port" format.
+            partners: List of voting partner addresses in "host:port" format.
             election_timeout_ms: Election timeout in milliseconds.
             heartbeat_interval_ms: Heartbeat interval in milliseconds.
+            election_backoff_ms: Delay in milliseconds added to this node's
+                randomized election timeout.
             on_leader_change: Optional callback called when leadership changes.
                 Receives True when becoming leader, False when losing leadership.
+            metadata: Optional cluster metadata to replicate through the log.
+            forwarding_url: URL published in the metadata while this node
+                leads, for replicas to forward writes to.
+            observer: Run as a non-voting observer of the partners.
+            dynamic_membership: Allow voters to be added and removed at
+                runtime.
+            on_membership_change: Optional callback called on the Raft
+                thread with the voting members after each change.
+            min_election_timeout_ms: Lowest adaptive election timeout in
+                milliseconds. Adaptive timing is enabled when both minimums
+                are given.
+            min_heartbeat_interval_ms: Lowest adaptive heartbeat interval
+                in milliseconds.
+            on_rtt: Optional callback called on the Raft thread with a
+                partner's address and each heartbeat round-trip time in
+                seconds.
+            on_timing_change: Optional callback called on the Raft thread
+                with the heartbeat interval and election timeout in seconds
+                when adaptive timing changes them.
+            pre_vote: Run a pre-vote before standing for election. Nodes
+                answer pre-votes whether or not they run them.
+            check_quorum: Step down as leader after an election timeout
+                without hearing from a majority.
+            event_loop: Run on this event loop instead of a tick thread.
         """
         self._is_leader = False
+        self._leader_epoch: int | None = None
+        self._leader_since: float | None = None
+        self._self_address = self_address
+        self._forwarding_url = forwarding_url
+        self.metadata = metadata
         self._lock = threading.Lock()
         self._on_leader_change = on_leader_change
+        self._on_membership_change = on_membership_change
+        self._voter_address = None if observer else self_address
+        self._members: tuple[str, ...] = (
+            tuple(partners) if observer else (self_address, *partners)
+        )
+        self._membership_changed = False
+        self._on_rtt = on_rtt
+        self._on_timing_change = on_timing_change
+        self._adaptive = (
+            min_election_timeout_ms is not None
+            and min_heartbeat_interval_ms is not None
+        )
+        self._election_backoff = election_backoff_ms / election_timeout_ms
+        self._next_timing_adjust = 0.0
+        self._check_quorum = check_quorum
+        self._pre_vote = pre_vote
+        self._raft_state = _STATE_FOLLOWER
+        self._last_leader_contact: float | None = None
+        self._pre_vote_round = 0
+        self._pre_vote_grants: set[str] = set()
+        self._pre_vote_granted = False
+        self._tick_thread: int | None = None
+        self._tick_requests: queue.SimpleQueue[_TickRequest] = queue.SimpleQueue()
+        self._match_indexes: dict[str, int] = {}
+        self.timing = AdaptiveTimeouts(
+            (
+                (min_heartbeat_interval_ms or heartbeat_interval_ms) / 1000.0,
+                heartbeat_interval_ms / 1000.0,
+            ),
+            (
+                (min_election_timeout_ms or election_timeout_ms) / 1000.0,
+                election_timeout_ms / 1000.0,
+            ),
+        )
+        self.reachability = ReachabilityTracker(
+            partners, stale_after=election_timeout_ms / 1000.0, voter=not observer
+        )
 
         conf = SyncObjConf(
             appendEntriesPeriod=heartbeat_interval_ms / 1000.0,
-            raftMinTimeout=election_timeout_ms / 1000.0,
-            raftMaxTimeout=(election_timeout_ms * 1.5) / 1000.0,
+            raftMinTimeout=(election_timeout_ms + election_backoff_ms) / 1000.0,
+            raftMaxTimeout=(election_timeout_ms * 1.5 + election_backoff_ms) / 1000.0,
             onStateChanged=self._handle_state_change,
-            autoTick=True,
-            dynamicMembershipChange=False,  # Static membership for simplicity
+            autoTick=event_loop is None,
+            dynamicMembershipChange=dynamic_membership,
+        )
+        if check_quorum:
+            conf.leaderFallbackTimeout = election_timeout_ms / 1000.0
+        self._driver: EventLoopDriver | None = None
+        self._socket_poller: Poller | None = None
+        if event_loop is not None:
+            self._driver = EventLoopDriver(event_loop, self._loop_tick)
+            self._socket_poller = self._driver.poller
+
+        super().__init__(
+            None if observer else self_address,
+            partners,
+            conf=conf,
+            transportClass=_ReachabilityTransport,
+            consumers=[metadata] if metadata is not None else None,
         )
+        self._membership_changed = False
+        self.addOnTickCallback(self._on_tick)
+        if self._driver is not None:
+            self._driver.start()
+
+    @property
+    def _poller(self) -> Poller:
+        """Poller of the transport's sockets."""
+        return self._socket_poller
+
+    @_poller.setter
+    def _poller(self, poller: Poller) -> None:
+        # PySyncObj creates a poll or select poller in __init__; a node on an
+        # event loop keeps the loop's
+        if self._socket_poller is None:
+            self._socket_poller = poller
+
+    def _loop_tick(self) -> float:
+        """Tick once on the event loop.
 
-        super().__init__(self_address, partners, conf=conf)
+        Returns:
+            Seconds until the next heartbeat or election deadline, at most
+            a heartbeat interval, which bounds the delay of PySyncObj's
+            other timers (reconnects, check-quorum, log flushes). The
+            deadlines are on PySyncObj's clock, which need not be
+            time.monotonic().
+        """
+        self.doTick(0.0)
+        heartbeat = self._getConf().appendEntriesPeriod
+        if self._raft_state == _STATE_LEADER:
+            due = self._SyncObj__newAppendEntriesTime
+        elif self.selfNode is not None:
+            due = self._SyncObj__raftElectionDeadline
+        else:
+            return heartbeat
+        return min(max(due - raft_clock(), 0.0), heartbeat)
+
+    def _applyCommand(self, command, callback, commandType=None) -> None:
+        """Queue a command for the next tick, waking the event loop for it."""
+        super()._applyCommand(command, callback, commandType)
+        if self._driver is not None:
+            self._driver.wake()
+
+    def destroy(self) -> None:
+        """Stop the node and close its connections.
+
+        On an event loop, this happens on the loop thread.
+        """
+        driver = self._driver
+        if driver is None:
+            super().destroy()
+            return
+        if not driver.on_loop_thread and driver.loop.is_running():
+            driver.loop.call_soon_threadsafe(self.destroy)
+            return
+        driver.stop()
+        super().destroy()
 
     @property
     def is_leader(self) -> bool:
@@ -70,36 +447,402 @@ class LeaderElectionNode(SyncObj):
         with self._lock:
             return self._is_leader
 
+    @property
+    def members(self) -> tuple[str, ...]:
+        """Addresses of the voting members, this node first if it votes."""
+        return self._members
+
+    @property
+    def leader_epoch(self) -> int | None:
+        """The term this node was elected leader in, None while not leader.
+
+        Recorded on the leadership change, so reading it is constant-time.
+        """
+        return self._leader_epoch
+
+    @property
+    def leader_since(self) -> float | None:
+        """Monotonic time this node became leader, None while not leader."""
+        return self._leader_since
+
+    def mark_membership_changed(self) -> None:
+        """Reconcile the members on the next tick. Called by the transport."""
+        self._membership_changed = True
+
+    def on_heartbeat_sent(self, address: str) -> None:
+        """Time a heartbeat to a partner. Called by the transport."""
+        if address in self._members:
+            self.timing.on_heartbeat_sent(address)
+
+    def on_raft_message(self, address: str, message: dict) -> None:
+        """Record heartbeats and their acknowledgements. Called by the transport."""
+        message_type = message.get("type")
+        if message_type == "append_entries":
+            self.timing.on_heartbeat_received()
+            if message.get("term", 0) >= self.raftCurrentTerm:
+                self._last_leader_contact = time.monotonic()
+                # Grants arriving late for a pre-vote in progress must not
+                # let this node depose the leader
+                self._pre_vote_granted = False
+                self._pre_vote_round += 1
+        elif message_type == "next_node_idx":
+            rtt = self.timing.on_heartbeat_acknowledged(address)
+            if rtt is not None and self._on_rtt is not None:
+                try:
+                    self._on_rtt(address, rtt)
+                except Exception:
+                    logger.exception("Round-trip time listener failed")
+
+    def on_pre_vote_message(self, node, message: dict) -> None:
+        """Answer a pre-vote request or count a grant. Called by the transport."""
+        if message.get("type") == _PRE_VOTE_RESPONSE:
+            if (
+                message.get("granted")
+                and message.get("round") == self._pre_vote_round
+                and node.id in self._members
+            ):
+                self._pre_vote_grants.add(node.id)
+                self._count_pre_votes()
+            return
+
+        candidate_log = (
+            message.get("last_log_term", 0),
+            message.get("last_log_index", 0),
+        )
+        granted = (
+            self.selfNode is not None
+            and node.id in self._members
+            and self._raft_state != _STATE_LEADER
+            and not self._heard_from_leader()
+            and candidate_log >= self._last_log_position()
+        )
+        self._SyncObj__transport.send(
+            node,
+            {
+                "type": _PRE_VOTE_RESPONSE,
+                "round": message.get("round"),
+                "granted": granted,
+            },
+        )
+
+    def _onTick(self, timeToWait: float = 0.0) -> None:
+        """Run a pre-vote before PySyncObj stands for election, then tick."""
+        self._tick_thread = threading.get_ident()
+        if self._pre_vote:
+            self._hold_election()
+        super()._onTick(timeToWait)
+
+    def _hold_election(self) -> None:
+        """Postpone an election that is due until a pre-vote succeeds.
+
+        A leadership transfer skips the pre-vote: the leader asked for the
+        election.
+        """
+        if self._raft_state == _STATE_LEADER or self.selfNode is None:
+            return
+        # PySyncObj's clock, which need not be time.monotonic()
+        if self._SyncObj__raftElectionDeadline >= raft_clock():
+            return
+        if self._pre_vote_granted or self._SyncObj__transferInProgress:
+            # Late grants of this round must not skip the next pre-vote
+            self._pre_vote_granted = False
+            self._pre_vote_round += 1
+            return
+        if len(self._members) > 1 and not self.reachability.reachable_peers:
+            # PySyncObj does not stand for election without a connection
+            return
+
+        conf = self._getConf()
+        self._SyncObj__raftElectionDeadline = raft_clock() + random.uniform(
+            conf.raftMinTimeout, conf.raftMaxTimeout
+        )
+        self._pre_vote_round += 1
+        self._pre_vote_grants = set()
+        last_log_term, last_log_index = self._last_log_position()
+        request = {
+            "type": _PRE_VOTE_REQUEST,
+            "term": self.raftCurrentTerm + 1,
+            "round": self._pre_vote_round,
+            "last_log_index": last_log_index,
+            "last_log_term": last_log_term,
+        }
+        for node in self.otherNodes:
+            self._SyncObj__transport.send(node, request)
+        self._count_pre_votes()
+
+    def _count_pre_votes(self) -> None:
+        """Let PySyncObj stand for election once a majority agreed."""
+        if len(self._pre_vote_grants) + 1 > len(self._members) / 2:
+            self._pre_vote_granted = True
+            self._SyncObj__raftElectionDeadline = 0.0
+
+    def _heard_from_leader(self) -> bool:
+        """Whether a leader was heard from within the election timeout."""
+        return (
+            self._last_leader_contact is not None
+            and time.monotonic() - self._last_leader_contact
+            < self.timing.election_timeout
+        )
+
+    def _last_log_position(self) -> tuple[int, int]:
+        """Term and index of the last entry of this node's log."""
+        return (
+            self._SyncObj__getCurrentLogTerm(),
+            self._SyncObj__getCurrentLogIndex(),
+        )
+
+    def _on_tick(self) -> None:
+        """Reconcile membership and timing, then expire silent partners.
+
+        Also copies the follower match indexes and runs the requests other
+        threads handed to the tick thread.
+        """
+        if self._membership_changed:
+            self._membership_changed = False
+            self._sync_membership()
+        if self._adaptive and time.monotonic() >= self._next_timing_adjust:
+            self._next_timing_adjust = time.monotonic() + _TIMING_ADJUST_INTERVAL
+            if self.timing.adjust(self.is_leader):
+                self._apply_timing()
+        self.reachability.expire()
+        self._copy_match_indexes()
+        self._run_tick_requests()
+
+    def _copy_match_indexes(self) -> None:
+        """Copy the match index of each connected follower while leading."""
+        if self._raft_state != _STATE_LEADER:
+            if self._match_indexes:
+                self._match_indexes = {}
+            return
+        match_indexes = self._SyncObj__raftMatchIndex
+        self._match_indexes = {
+            node.address: match_indexes.get(node, 0)
+            for node in self.otherNodes
+            if self.isNodeConnected(node)
+        }
+
+    def _run_tick_requests(self) -> None:
+        """Run the requests queued for the tick thread."""
+        while True:
+            try:
+                request = self._tick_requests.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                request.run()
+            except Exception:
+                logger.exception("Tick thread request failed")
+
+    def _run_on_tick_thread(self, work: Callable[[], None], timeout: float) -> bool:
+        """Run work on the tick thread and wait for it.
+
+        Runs it directly when called on the tick thread.
+
+        Args:
+            work: Reads or changes PySyncObj's state.
+            timeout: Maximum time in seconds to wait for the next tick.
+
+        Returns:
+            True if the work ran, False if no tick ran it in time.
+        """
+        if self._tick_thread == threading.get_ident():
+            work()
+            return True
+        request = _TickRequest(work)
+        self._tick_requests.put(request)
+        if self._driver is not None:
+            self._driver.wake()
+        return request.wait(timeout)
+
+    def _apply_timing(self) -> None:
+        """Use the adaptive heartbeat interval and election timeout.
+
+        PySyncObj reads its configuration whenever it schedules a heartbeat
+        or draws an election deadline, so new values apply from the next
+        heartbeat or election deadline.
+        """
+        heartbeat = self.timing.heartbeat_interval
+        election = self.timing.election_timeout
+        backoff = election * self._election_backoff
+        conf = self._getConf()
+        conf.appendEntriesPeriod = heartbeat
+        conf.raftMinTimeout = election + backoff
+        conf.raftMaxTimeout = election * 1.5 + backoff
+        if self._check_quorum:
+            conf.leaderFallbackTimeout = election
+        self.reachability.set_stale_after(election)
+        if self._on_timing_change is not None:
+            try:
+                self._on_timing_change(heartbeat, election)
+            except Exception:
+                logger.exception("Timing listener failed")
+
+    def _sync_membership(self) -> None:
+        """Update the members from the partners PySyncObj now has.
+
+        Members keep their order; added ones are appended.
+        """
+        partners = {node.id for node in self.otherNodes}
+        members = [
+            m for m in self._members if m in partners or m == self._voter_address
+        ]
+        known = set(members)
+        members.extend(sorted(partners - known))
+        if tuple(members) == self._members:
+            return
+        self._members = tuple(members)
+        self.reachability.set_partners(partners)
+        if self._on_membership_change is not None:
+            self._on_membership_change(list(members))
+
+    def change_membership(
+        self, action: str, address: str, timeout: float
+    ) -> str | None:
+        """Add or remove a voting member and wait until the change commits.
+
+        Changes the leader denies are retried until the timeout.
+
+        Args:
+            action: "add" or "remove".
+            address: Address of the member in "host:port" format.
+            timeout: Maximum time in seconds to wait for the commit.
+
+        Returns:
+            None if the change committed, otherwise why it failed.
+        """
+        change = (
+            self.addNodeToCluster if action == "add" else self.removeNodeFromCluster
+        )
+        deadline = time.monotonic() + timeout
+        while True:
+            done = threading.Event()
+            errors: list[int] = []
+
+            def on_result(_result, error: int, done=done, errors=errors) -> None:
+                errors.append(error)
+                done.set()
+
+            change(address, callback=on_result)
+            if not done.wait(max(0.0, deadline - time.monotonic())):
+                return "not committed in time"
+            # A new leader denies changes until the no-op entry of its term
+            # is applied, and while a previous change is uncommitted
+            if (
+                errors[0] != FAIL_REASON.REQUEST_DENIED
+                or time.monotonic() + _MEMBERSHIP_RETRY_INTERVAL >= deadline
+            ):
+                break
+            time.sleep(_MEMBERSHIP_RETRY_INTERVAL)
+        if errors[0] != FAIL_REASON.SUCCESS:
+            return _FAIL_REASONS.get(errors[0], f"error {errors[0]}")
+        return None
+
     def _handle_state_change(self, old_state: int, new_state: int) -> None:
         """Handle Raft state transitions.
 
         Called by PySyncObj when the node's role changes.
         """
+        self._raft_state = new_state
         was_leader = old_state == _STATE_LEADER
         is_now_leader = new_state == _STATE_LEADER
 
         if was_leader != is_now_leader:
             with self._lock:
                 self._is_leader = is_now_leader
+                self._leader_epoch = self.raftCurrentTerm if is_now_leader else None
+                self._leader_since = time.monotonic() if is_now_leader else None
+            self.reachability.set_leader(is_now_leader)
+            self.timing.on_leader_change()
+            if is_now_leader:
+                self._publish_leadership()
 
             if self._on_leader_change is not None:
                 self._on_leader_change(is_now_leader)
 
-    def get_responding_nodes_count(self) -> int:
-        """Get the number of nodes currently responding in the cluster.
+    def _publish_leadership(self) -> None:
+        """Record this node as leader in the cluster metadata.
+
+        Appended to the log without waiting: this runs on the Raft thread,
+        which is the one committing the entry.
+        """
+        if self.metadata is None:
+            return
+        self.metadata.apply(
+            {
+                LEADER: self._self_address,
+                EPOCH: self.raftCurrentTerm,
+                FORWARDING_URL: self._forwarding_url,
+            }
+        )
+
+    def get_raft_term(self) -> int:
+        """Get the current Raft term.
+
+        Returns:
+            The term this node is in; it increases with every election.
+        """
+        return self.raftCurrentTerm
+
+    def get_leader_address(self) -> str | None:
+        """Get the address of the last known leader.
+
+        Returns:
+            The leader's "host:port" address, or None while no leader is
+            known (e.g. during an election).
+        """
+        leader = self._getLeader()
+        return None if leader is None else leader.address
+
+    def get_follower_match_indexes(self) -> dict[str, int]:
+        """Get the replication progress of connected partners.
+
+        Only the leader tracks how much of its log each follower has
+        acknowledged. The copy taken on the last tick is returned.
+
+        Returns:
+            Match index by partner address, for connected partners only;
+            empty while this node does not lead.
+        """
+        return self._match_indexes
+
+    def get_commit_index(self) -> int:
+        """Get the index of the last log entry known to be committed."""
+        return self.raftCommitIndex
+
+    def request_leadership_transfer(
+        self, target: str, timeout: float | None = None
+    ) -> bool:
+        """Ask a follower to start an election immediately (Raft TimeoutNow).
+
+        The request is sent on the tick thread.
+
+        Args:
+            target: Address of the follower to hand leadership to.
+            timeout: Maximum time in seconds to wait for the tick thread.
+                Defaults to the election timeout.
 
         Returns:
-            Number of nodes that are responding (including self if leader).
+            True if the request was sent. False if it was denied: this node
+            is not the leader, or the target is unknown or not caught up;
+            or if the tick thread did not send it in time.
         """
-        status = self.getStatus()
-        if status is None:
-            return 1  # At minimum, self is responding
+        outcome: list[int] = []
 
-        # Count nodes that are responding
-        responding = 1  # Self
-        for key, value in status.items():
-            if key.startswith("partner_node_status_") and value == 2:
-                # Status 2 means node is connected
-                responding += 1
+        def transfer() -> None:
+            self.transferLeadership(
+                target, callback=lambda _result, error: outcome.append(error)
+            )
 
-        return responding
+        if timeout is None:
+            timeout = self.timing.election_timeout
+        if not self._run_on_tick_thread(transfer, timeout):
+            return False
+        return outcome == [FAIL_REASON.SUCCESS]
+
+    def get_responding_nodes_count(self) -> int:
+        """Get the number of nodes currently responding in the cluster.
+
+        Returns:
+            Number of reachable partners plus this node.
+        """
+        return len(self.reachability.reachable_peers) + 1
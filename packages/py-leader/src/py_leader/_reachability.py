@@ -0,0 +1,198 @@
+"""Internal tracking of reachable Raft partners from transport events."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class ReachabilityTracker:
+    """Reachable partners and quorum, maintained incrementally.
+
+    A partner is reachable while its connection is open. While this node is
+    the leader, it must also have sent a message within stale_after seconds:
+    followers acknowledge every heartbeat, so a hung follower behind an open
+    connection stops counting toward quorum.
+
+    An observer tracks the voters it follows but has no vote of its own,
+    so quorum needs a majority of the voters without counting this node.
+
+    The partners change with cluster membership (see set_partners()).
+    Connections are recorded for any address, so a member whose connection
+    opened just before its addition was applied still counts.
+
+    Updates arrive on the PySyncObj tick thread. Reads return immutable
+    values computed on update, so they are O(1) and need no lock.
+    """
+
+    def __init__(
+        self,
+        partners: Iterable[str],
+        stale_after: float,
+        *,
+        voter: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with no partner reachable.
+
+        Args:
+            partners: Addresses of the other voting cluster members.
+            stale_after: Seconds of silence after which a connected partner
+                is unreachable while this node leads.
+            voter: Whether this node votes. Observers do not count
+                themselves toward quorum.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self._partners = frozenset(partners)
+        self._own_votes = 1 if voter else 0
+        self._quorum_size = (len(self._partners) + self._own_votes) // 2 + 1
+        self._stale_after = stale_after
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connected: set[str] = set()
+        self._last_heard: dict[str, float] = {}
+        self._is_leader = False
+        self._listeners: list[Callable[[bool], None]] = []
+        self._reachable: frozenset[str] = frozenset()
+        self._has_quorum = self._quorum_size <= self._own_votes
+
+    @property
+    def reachable_peers(self) -> frozenset[str]:
+        """Addresses of the partners currently reachable."""
+        return self._reachable
+
+    @property
+    def has_quorum(self) -> bool:
+        """Whether the reachable voters, with this node if it votes, are a majority."""
+        return self._has_quorum
+
+    def add_listener(self, callback: Callable[[bool], None]) -> None:
+        """Call callback(has_quorum) whenever quorum is gained or lost.
+
+        Callbacks run on the Raft thread and must not block.
+        """
+        with self._lock:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[bool], None]) -> None:
+        """Stop notifying callback. Does nothing if it is not registered."""
+        with self._lock:
+            if callback in self._listeners:
+                self._listeners.remove(callback)
+
+    def on_connected(self, address: str) -> None:
+        """Record that the connection to a partner opened."""
+        with self._lock:
+            self._connected.add(address)
+            self._last_heard[address] = self._clock()
+            changed = self._refresh()
+        self._notify(changed)
+
+    def on_disconnected(self, address: str) -> None:
+        """Record that the connection to a partner closed."""
+        if address not in self._connected:
+            return
+        with self._lock:
+            self._connected.discard(address)
+            changed = self._refresh()
+        self._notify(changed)
+
+    def on_message(self, address: str) -> None:
+        """Record a message (e.g. a heartbeat acknowledgement) from a partner."""
+        if address not in self._partners:
+            return
+        self._last_heard[address] = self._clock()
+        if address in self._reachable or address not in self._connected:
+            return
+        with self._lock:
+            changed = self._refresh()
+        self._notify(changed)
+
+    def set_leader(self, is_leader: bool) -> None:
+        """Record a leadership change of this node.
+
+        A new leader gives every connected partner a full stale_after window
+        to acknowledge its first heartbeat.
+        """
+        with self._lock:
+            self._is_leader = is_leader
+            now = self._clock()
+            for address in self._connected:
+                self._last_heard[address] = now
+            changed = self._refresh()
+        self._notify(changed)
+
+    def set_partners(self, partners: Iterable[str]) -> None:
+        """Replace the partners after a cluster membership change.
+
+        Added partners get a full stale_after window to be heard from;
+        quorum is recomputed for the new cluster size.
+        """
+        with self._lock:
+            partners = frozenset(partners)
+            now = self._clock()
+            for address in partners - self._partners:
+                self._last_heard[address] = now
+            for address in self._partners - partners:
+                self._last_heard.pop(address, None)
+            self._partners = partners
+            self._quorum_size = (len(partners) + self._own_votes) // 2 + 1
+            changed = self._refresh()
+        self._notify(changed)
+
+    def set_stale_after(self, stale_after: float) -> None:
+        """Change the silence after which a partner is unreachable."""
+        with self._lock:
+            self._stale_after = stale_after
+            changed = self._refresh()
+        self._notify(changed)
+
+    def expire(self) -> None:
+        """Drop partners that went silent. Called on every Raft tick."""
+        if not self._is_leader:
+            return
+        cutoff = self._clock() - self._stale_after
+        if all(self._last_heard.get(a, cutoff) > cutoff for a in self._reachable):
+            return
+        with self._lock:
+            changed = self._refresh()
+        self._notify(changed)
+
+    def _refresh(self) -> bool:
+        """Recompute the reachable set. Must be called with the lock held.
+
+        Returns:
+            True if quorum was gained or lost.
+        """
+        reachable = self._connected & self._partners
+        if self._is_leader:
+            cutoff = self._clock() - self._stale_after
+            reachable = {
+                address
+                for address in reachable
+                if self._last_heard.get(address, cutoff) > cutoff
+            }
+        self._reachable = frozenset(reachable)
+        had_quorum = self._has_quorum
+        self._has_quorum = len(self._reachable) + self._own_votes >= self._quorum_size
+        return self._has_quorum != had_quorum
+
+    def _notify(self, changed: bool) -> None:
+        """Notify listeners of a quorum change."""
+        if not changed:
+            return
+        has_quorum = self._has_quorum
+        with self._lock:
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(has_quorum)
+            except Exception:
+                logger.exception("Quorum listener failed")
@@ -0,0 +1,210 @@
+"""Internal measurement of Raft delays and adaptive election timing."""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Recent samples kept per estimator; at a 100 ms heartbeat, about 25 seconds
+_WINDOW = 256
+# Samples needed before a measurement replaces the configured timing
+_MIN_SAMPLES = 16
+# Heartbeat interval as a multiple of the p99 round-trip time: heartbeats
+# are not sent faster than they can be acknowledged
+_HEARTBEAT_RTT_MULTIPLE = 2.0
+# Election timeout as a multiple of the p99 gap between heartbeats: a
+# follower tolerates this many lost or delayed heartbeats
+_ELECTION_GAP_MULTIPLE = 5.0
+# Relative changes smaller than this are ignored, so noise does not churn
+_HYSTERESIS = 0.1
+# Largest relative change per adjustment in the unsafe direction: a longer
+# heartbeat interval or a shorter election timeout
+_MAX_STEP = 0.25
+
+
+class DelayEstimator:
+    """Distribution of the most recent samples of a delay."""
+
+    def __init__(self, window: int = _WINDOW) -> None:
+        """Initialize with no samples.
+
+        Args:
+            window: Number of recent samples kept.
+        """
+        self._samples: deque[float] = deque(maxlen=window)
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
+
+    def add(self, sample: float) -> None:
+        """Record a sample in seconds."""
+        self._samples.append(sample)
+
+    def clear(self) -> None:
+        """Drop all samples."""
+        self._samples.clear()
+
+    def percentiles(self) -> dict[str, float]:
+        """Return the p50, p90, p99 and max of the window, empty without samples."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+        last = len(samples) - 1
+        return {
+            "p50": samples[last * 50 // 100],
+            "p90": samples[last * 90 // 100],
+            "p99": samples[last * 99 // 100],
+            "max": samples[last],
+        }
+
+
+class AdaptiveTimeouts:
+    """Heartbeat interval and election timeout derived from measured delays.
+
+    The leader times each heartbeat until its acknowledgement; its heartbeat
+    interval is a multiple of the p99 round-trip time. A follower times the
+    gaps between the heartbeats it receives, which add the network jitter to
+    the leader's interval; its election timeout is a multiple of the p99 gap.
+    A leader derives its own election timeout from its interval and
+    round-trip time, so it is ready should it become a follower.
+
+    Both values stay within their bounds and start at the upper bound.
+    Changes toward safety (more frequent heartbeats, a longer election
+    timeout) apply at once. The others are limited per adjustment: a
+    follower's election timeout then keeps up with a leader's growing
+    heartbeat interval, and a quiet spell does not shrink it abruptly.
+
+    Samples arrive on the PySyncObj tick thread, which is also the only
+    thread adjusting the values.
+    """
+
+    def __init__(
+        self,
+        heartbeat_bounds: tuple[float, float],
+        election_bounds: tuple[float, float],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize at the upper bounds with no samples.
+
+        Args:
+            heartbeat_bounds: Lowest and highest heartbeat interval in
+                seconds.
+            election_bounds: Lowest and highest election timeout in seconds.
+            clock: Monotonic clock, replaceable in tests.
+        """
+        self._heartbeat_bounds = heartbeat_bounds
+        self._election_bounds = election_bounds
+        self._clock = clock
+        self.rtt = DelayEstimator()
+        self.gaps = DelayEstimator()
+        self.heartbeat_interval = heartbeat_bounds[1]
+        self.election_timeout = election_bounds[1]
+        self._sent: dict[str, float] = {}
+        self._last_heartbeat: float | None = None
+
+    def on_heartbeat_sent(self, peer: str) -> None:
+        """Start timing a heartbeat, unless one to peer is already timed."""
+        self._sent.setdefault(peer, self._clock())
+
+    def on_heartbeat_acknowledged(self, peer: str) -> float | None:
+        """Stop timing the heartbeat to peer.
+
+        Returns:
+            The round-trip time, None if no heartbeat to peer was timed.
+        """
+        sent = self._sent.pop(peer, None)
+        if sent is None:
+            return None
+        rtt = self._clock() - sent
+        self.rtt.add(rtt)
+        return rtt
+
+    def on_heartbeat_received(self) -> None:
+        """Record the gap since the previous heartbeat from the leader."""
+        now = self._clock()
+        if self._last_heartbeat is not None:
+            self.gaps.add(now - self._last_heartbeat)
+        self._last_heartbeat = now
+
+    def on_disconnected(self, peer: str) -> None:
+        """Stop timing a heartbeat that will not be acknowledged."""
+        self._sent.pop(peer, None)
+
+    def on_leader_change(self) -> None:
+        """Forget pending timings: the next gap is not between heartbeats."""
+        self._sent.clear()
+        self._last_heartbeat = None
+        self.gaps.clear()
+
+    def adjust(self, is_leader: bool) -> bool:
+        """Move the timing toward the values the measurements call for.
+
+        Args:
+            is_leader: Whether this node leads, which selects the
+                measurement its election timeout is derived from.
+
+        Returns:
+            True if the heartbeat interval or election timeout changed.
+        """
+        rtt = (
+            self.rtt.percentiles().get("p99")
+            if self.rtt.count >= _MIN_SAMPLES
+            else None
+        )
+        heartbeat = self.heartbeat_interval
+        if rtt is not None:
+            heartbeat = self._step(
+                heartbeat,
+                _HEARTBEAT_RTT_MULTIPLE * rtt,
+                self._heartbeat_bounds,
+                limit_increase=True,
+            )
+
+        gap: float | None = None
+        if is_leader and rtt is not None:
+            gap = heartbeat + rtt
+        elif not is_leader and self.gaps.count >= _MIN_SAMPLES:
+            gap = self.gaps.percentiles()["p99"]
+        election = self.election_timeout
+        if gap is not None:
+            election = self._step(
+                election,
+                _ELECTION_GAP_MULTIPLE * gap,
+                self._election_bounds,
+                limit_increase=False,
+            )
+
+        changed = (heartbeat, election) != (
+            self.heartbeat_interval,
+            self.election_timeout,
+        )
+        self.heartbeat_interval = heartbeat
+        self.election_timeout = election
+        return changed
+
+    @staticmethod
+    def _step(
+        current: float,
+        target: float,
+        bounds: tuple[float, float],
+        *,
+        limit_increase: bool,
+    ) -> float:
+        """Return the next value on the way from current to target.
+
+        Args:
+            limit_increase: Limit increases instead of decreases.
+        """
+        target = min(max(target, bounds[0]), bounds[1])
+        if abs(target - current) < current * _HYSTERESIS:
+            return current
+        if target > current:
+            return min(target, current * (1 + _MAX_STEP)) if limit_increase else target
+        return target if limit_increase else max(target, current * (1 - _MAX_STEP))
@@ -0,0 +1,240 @@
+"""RaftLeaderElection running on an asyncio event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+from py_leader.election import (
+    LeadershipTransfer,
+    MembershipChange,
+    RaftLeaderElection,
+    RaftLeaderElectionError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable
+    from types import TracebackType
+
+
+class AsyncRaftLeaderElection(RaftLeaderElection):
+    """RaftLeaderElection driven by the event loop it is created on.
+
+    RaftLeaderElection runs PySyncObj on a tick thread per node. This class
+    registers the node's non-blocking sockets with the running event loop
+    and ticks from the loop's timers instead, so a single-loop application
+    (e.g. under uvicorn) runs the election without an extra thread, and
+    leadership, quorum and timing callbacks run on the loop thread.
+
+    The synchronous API of RaftLeaderElection is available, and the class
+    implements the same LiteFS ports. Calls that wait for the Raft node
+    (transfer_leadership(), demote_from_leader(), add_member() and
+    remove_member()) would block the loop the node needs, so on the loop
+    thread they raise; await their _async variants, which wait in a worker
+    thread. Host names of members are resolved on the loop, so prefer IP
+    addresses.
+
+    Example:
+        >>> async with AsyncRaftLeaderElection(
+        ...     node_id="node1",
+        ...     cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+        ... ) as election:
+        ...     await election.wait_for_leadership()
+        ...     async for is_leader in election.leadership_changes():
+        ...         print("leader" if is_leader else "follower")
+    """
+
+    def __init__(
+        self,
+        node_id: str,
+        cluster_members: list[str],
+        election_timeout: float = 5.0,
+        heartbeat_interval: float = 1.0,
+        *,
+        on_leader_change: Callable[[bool], None] | None = None,
+        **options: Any,
+    ) -> None:
+        """Start the node on the running event loop.
+
+        Args:
+            node_id: Unique identifier for this node (see RaftLeaderElection).
+            cluster_members: List of the voting cluster members in
+                "host:port" format.
+            election_timeout: Election timeout in seconds.
+            heartbeat_interval: Heartbeat interval in seconds.
+            on_leader_change: Optional callback called on the loop thread
+                when leadership changes.
+            **options: Further keyword arguments of RaftLeaderElection.
+
+        Raises:
+            RaftLeaderElectionError: If no event loop runs in this thread.
+            InvalidConfigurationError: If configuration is invalid.
+        """
+        try:
+            self._event_loop = asyncio.get_running_loop()
+        except RuntimeError as e:
+            raise RaftLeaderElectionError(
+                "AsyncRaftLeaderElection must be created on a running event loop"
+            ) from e
+        self._loop_thread = threading.get_ident()
+        self._leading = asyncio.Event()
+        self._subscribers: set[asyncio.Queue[bool | None]] = set()
+        self._closed = False
+        self._on_leader_change_callback = on_leader_change
+        super().__init__(
+            node_id,
+            cluster_members,
+            election_timeout,
+            heartbeat_interval,
+            on_leader_change=self._handle_leader_change,
+            **options,
+        )
+
+    async def __aenter__(self) -> AsyncRaftLeaderElection:  # noqa: PYI034
+        """Return the running election."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Shut the node down."""
+        await self.close_async()
+
+    async def wait_for_leadership(self) -> None:
+        """Wait until this node is the elected leader.
+
+        Returns at once if it leads. Wrap in asyncio.timeout() to give up
+        after a while.
+        """
+        while not self.is_leader_elected():
+            await self._leading.wait()
+            if not self.is_leader_elected():
+                # Leading but handing leadership over
+                await asyncio.sleep(self.get_heartbeat_interval())
+
+    async def leadership_changes(self) -> AsyncIterator[bool]:
+        """Iterate over this node's leadership.
+
+        Yields whether this node leads now, then True or False on every
+        change, until the election is closed.
+        """
+        queue: asyncio.Queue[bool | None] = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            if self._closed:
+                return
+            yield self._node.is_leader
+            while (is_leader := await queue.get()) is not None:
+                yield is_leader
+        finally:
+            self._subscribers.discard(queue)
+
+    async def transfer_leadership_async(
+        self, target: str | None = None, timeout: float | None = None
+    ) -> LeadershipTransfer:
+        """Asynchronous variant of transfer_leadership().
+
+        Returns:
+            The outcome, including how long the handoff took.
+        """
+        return await asyncio.to_thread(self.transfer_leadership, target, timeout)
+
+    async def demote_from_leader_async(self) -> None:
+        """Asynchronous variant of demote_from_leader()."""
+        await self.transfer_leadership_async()
+
+    async def add_member_async(
+        self, address: str, timeout: float | None = None
+    ) -> MembershipChange:
+        """Asynchronous variant of add_member().
+
+        Returns:
+            The outcome of the change.
+        """
+        return await asyncio.to_thread(self.add_member, address, timeout)
+
+    async def remove_member_async(
+        self, address: str, timeout: float | None = None
+    ) -> MembershipChange:
+        """Asynchronous variant of remove_member().
+
+        Returns:
+            The outcome of the change.
+        """
+        return await asyncio.to_thread(self.remove_member, address, timeout)
+
+    def transfer_leadership(
+        self, target: str | None = None, timeout: float | None = None
+    ) -> LeadershipTransfer:
+        """Hand leadership to a follower (see RaftLeaderElection).
+
+        Raises:
+            RaftLeaderElectionError: If called on the loop thread.
+        """
+        self._check_off_loop("transfer_leadership")
+        return super().transfer_leadership(target, timeout)
+
+    def _change_membership(
+        self, action: str, address: str, timeout: float | None
+    ) -> MembershipChange:
+        """Request a membership change off the loop thread.
+
+        Raises:
+            RaftLeaderElectionError: If called on the loop thread.
+        """
+        self._check_off_loop(f"{action}_member")
+        return super()._change_membership(action, address, timeout)
+
+    async def close_async(self) -> None:
+        """Shut the node down without blocking the loop.
+
+        A rebalancing transfer in progress is waited for in a worker thread.
+        """
+        self._stopped.set()
+        if self._rebalancer is not None:
+            await asyncio.to_thread(self._rebalancer.join)
+        self.destroy()
+
+    def destroy(self) -> None:
+        """Shut the node down and end the leadership iterators.
+
+        On the loop thread, a rebalancing transfer in progress is not
+        waited for: it needs the loop, and fails once the node is stopped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if threading.get_ident() == self._loop_thread:
+            self._stopped.set()
+            self._node.destroy()
+        else:
+            super().destroy()
+        self._leading.clear()
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    def _check_off_loop(self, method: str) -> None:
+        """Refuse to wait for the node on the loop that runs it."""
+        if threading.get_ident() == self._loop_thread:
+            raise RaftLeaderElectionError(
+                f"{method}() blocks the event loop running the Raft node; "
+                f"await {method}_async() instead"
+            )
+
+    def _handle_leader_change(self, is_leader: bool) -> None:
+        """Wake waiters and iterators, then call the user's callback."""
+        if threading.get_ident() != self._loop_thread:
+            self._event_loop.call_soon_threadsafe(self._handle_leader_change, is_leader)
+            return
+        if is_leader:
+            self._leading.set()
+        else:
+            self._leading.clear()
+        for queue in self._subscribers:
+            queue.put_nowait(is_leader)
+        if self._on_leader_change_callback is not None:
+            self._on_leader_change_callback(is_leader)
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
-import math
-from typing import TYPE_CHECKING
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
+from py_leader._metadata import (
+    EPOCH,
+    FORWARDING_URL,
+    LEADER,
+    RESERVED_KEYS,
+    ClusterMetadata,
+)
 from py_leader._raft_node import LeaderElectionNode
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    import asyncio
+    from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+# Delay between checks while a leadership or membership change is in progress
+_POLL_INTERVAL = 0.01
+
+# Election timeout added per priority level below the highest, as a fraction
+# of election_timeout. It equals the width of the randomized timeout range,
+# so the ranges of adjacent levels do not overlap.
+_PRIORITY_BACKOFF = 0.5
 
 
 class RaftLeaderElectionError(Exception):
@@ -19,11 +42,105 @@ class InvalidConfigurationError(RaftLeaderElectionError):
     """Raised when configuration is invalid."""
 
 
+@dataclass(frozen=True)
+class LeadershipTransfer:
+    """Outcome of a leadership transfer.
+
+    Attributes:
+        succeeded: Whether leadership moved to another node.
+        target: Address of the follower asked to take over, if one was.
+        new_leader: Address of the leader when the transfer ended, if known.
+        duration: Seconds from the request until a new leader was known
+            (or the transfer gave up). This node refuses writes meanwhile,
+            so this is the write unavailability of the handoff.
+        reason: Why the transfer failed, None if it succeeded.
+    """
+
+    succeeded: bool
+    target: str | None
+    new_leader: str | None
+    duration: float
+    reason: str | None = None
+
+
+@dataclass(frozen=True)
+class MembershipChange:
+    """Outcome of adding or removing a voting member.
+
+    Attributes:
+        succeeded: Whether the change was committed.
+        action: "add" or "remove".
+        member: Address of the member added or removed.
+        members: Voting members known to the node that made the request
+            once the change ended.
+        reason: Why the change failed, None if it succeeded.
+    """
+
+    succeeded: bool
+    action: str
+    member: str
+    members: tuple[str, ...]
+    reason: str | None = None
+
+
+@dataclass(frozen=True)
+class RaftTiming:
+    """Heartbeat and election timing of a node, and the delays measured.
+
+    Attributes:
+        heartbeat_interval: Seconds between heartbeats while leading.
+        election_timeout: Seconds without a heartbeat before a follower
+            stands for election (before randomization).
+        adaptive: Whether the values follow the measured delays.
+        rtt: Percentiles ("p50", "p90", "p99", "max") of recent heartbeat
+            round-trip times in seconds, measured while leading; empty
+            without samples.
+        heartbeat_gaps: Percentiles of recent gaps between heartbeats
+            received, in seconds, measured while following.
+    """
+
+    heartbeat_interval: float
+    election_timeout: float
+    adaptive: bool
+    rtt: Mapping[str, float]
+    heartbeat_gaps: Mapping[str, float]
+
+
 class RaftLeaderElection:
     """Implements RaftLeaderElectionPort using PySyncObj.
 
     This class provides a minimal Raft-based leader election mechanism.
-    It does NOT provide replicated state - only leader election.
+    Its only replicated state is the optional cluster metadata: a small map
+    holding the leader's address, its epoch (the Raft term it was elected
+    in) and forwarding URL, readable on every node without network calls.
+
+    Observers are non-voting members: they follow the leader and term
+    through the log, but never vote or stand for election. Read replicas
+    can be added as observers without growing the quorum of the voters.
+
+    With dynamic membership, voters are added and removed at runtime, one
+    at a time, through the Raft log (see add_member()). The live member
+    list can be persisted to a file that takes precedence over
+    cluster_members on restart, so a restarted node does not fall back to
+    its original configuration.
+
+    Leader priorities prefer some voters over others. A node with a lower
+    priority waits longer before standing for election, and a leader with a
+    lower priority hands leadership to a caught-up, higher-priority node
+    once it has led with quorum for rebalance_after seconds.
+
+    With adaptive timeouts, the heartbeat interval and election timeout
+    follow the measured heartbeat round trips and gaps (see get_timing()),
+    between the configured minimums and election_timeout and
+    heartbeat_interval, which are also the starting values.
+
+    Pre-vote and check-quorum keep a stable leader in place. A node whose
+    election timeout passes first asks the voters whether they would elect
+    it, and stands for election only if a majority has not heard from a
+    leader either; a node returning from a partition therefore cannot force
+    the leader out with its higher term. A leader that has not heard from a
+    majority for an election timeout steps down, so clients of a
+    partitioned leader fail over promptly.
 
     The class implements the RaftLeaderElectionPort protocol from litefs-py,
     allowing it to be used as a drop-in replacement for static leader election.
@@ -39,6 +156,10 @@ class RaftLeaderElection:
         ...     print("I am the leader!")
     """
 
+    # Event loop the node runs on instead of a tick thread (see
+    # AsyncRaftLeaderElection)
+    _event_loop: asyncio.AbstractEventLoop | None = None
+
     def __init__(
         self,
         node_id: str,
@@ -47,44 +168,162 @@ class RaftLeaderElection:
         heartbeat_interval: float = 1.0,
         *,
         on_leader_change: Callable[[bool], None] | None = None,
+        replicate_metadata: bool = False,
+        forwarding_url: str | None = None,
+        observers: list[str] | None = None,
+        dynamic_membership: bool = False,
+        membership_file: str | None = None,
+        priorities: Mapping[str, int] | None = None,
+        rebalance_after: float = 30.0,
+        adaptive_timeouts: bool = False,
+        min_election_timeout: float = 0.3,
+        min_heartbeat_interval: float = 0.03,
+        pre_vote: bool = True,
+        check_quorum: bool = True,
     ) -> None:
         """Initialize the Raft leader election.
 
         Args:
             node_id: Unique identifier for this node. Must be one of the
-                cluster members (the "host" part before the port).
-            cluster_members: List of all cluster members in "host:port" format.
-                Must include this node's address.
+                cluster members or observers (the "host" part before the
+                port).
+            cluster_members: List of the voting cluster members in
+                "host:port" format.
             election_timeout: Election timeout in seconds. Must be > 0 and
                 greater than heartbeat_interval.
             heartbeat_interval: Heartbeat interval in seconds. Must be > 0.
             on_leader_change: Optional callback called when leadership changes.
+            replicate_metadata: Replicate cluster metadata through the Raft
+                log (see get_cluster_metadata()).
+            forwarding_url: URL this node publishes in the metadata while it
+                leads. Requires replicate_metadata.
+            observers: List of non-voting members in "host:port" format.
+                Every node must be given the same members and observers.
+            dynamic_membership: Allow voters to be added and removed at
+                runtime with add_member() and remove_member().
+            membership_file: JSON file the voting members are saved to on
+                startup and after each change, and read from instead of
+                cluster_members when it exists. Requires dynamic_membership.
+            priorities: Leader priority by voting member address; higher is
+                preferred and unlisted members have priority 0. Every node
+                must be given the same priorities.
+            rebalance_after: Seconds a lower-priority leader keeps
+                leadership with quorum before handing it to a preferred
+                node. Must be > 0.
+            adaptive_timeouts: Derive the heartbeat interval and election
+                timeout from measured delays, with election_timeout and
+                heartbeat_interval as upper bounds.
+            min_election_timeout: Lowest adaptive election timeout in
+                seconds. Must be more than 3 * min_heartbeat_interval.
+            min_heartbeat_interval: Lowest adaptive heartbeat interval in
+                seconds.
+            pre_vote: Stand for election only after a majority agreed in a
+                pre-vote. Every node answers pre-votes either way.
+            check_quorum: Step down as leader after an election timeout
+                without hearing from a majority, instead of PySyncObj's
+                30 seconds.
 
         Raises:
             InvalidConfigurationError: If configuration is invalid.
         """
+        observers = list(observers or [])
+        if membership_file is not None:
+            if not dynamic_membership:
+                raise InvalidConfigurationError(
+                    "membership_file requires dynamic_membership"
+                )
+            cluster_members = self._load_membership(membership_file) or cluster_members
         self._validate_configuration(
             node_id, cluster_members, election_timeout, heartbeat_interval
         )
+        self._validate_observers(cluster_members, observers)
+        priorities = dict(priorities or {})
+        self._validate_priorities(cluster_members, priorities, rebalance_after)
+        if adaptive_timeouts:
+            self._validate_timeout_bounds(
+                election_timeout,
+                heartbeat_interval,
+                min_election_timeout,
+                min_heartbeat_interval,
+            )
+        if forwarding_url is not None and not replicate_metadata:
+            raise InvalidConfigurationError(
+                "forwarding_url requires replicate_metadata"
+            )
 
         self._node_id = node_id
         self._cluster_members = tuple(cluster_members)
+        self._observers = tuple(observers)
         self._election_timeout = election_timeout
         self._heartbeat_interval = heartbeat_interval
-        self._quorum_size = math.floor(len(cluster_members) / 2) + 1
+        self._transfer_lock = threading.Lock()
+        self._transferring = False
+        self._dynamic_membership = dynamic_membership
+        self._membership_file = membership_file
+        if membership_file is not None:
+            try:
+                self._save_membership(membership_file, list(cluster_members))
+            except OSError as e:
+                raise InvalidConfigurationError(
+                    f"Cannot write membership file {membership_file!r}: {e}"
+                ) from e
+        self._priorities = priorities
+        self._rebalance_after = rebalance_after
+        self._next_rebalance = 0.0
+        self._stopped = threading.Event()
+        self._adaptive_timeouts = adaptive_timeouts
+        self._listeners_lock = threading.Lock()
+        self._rtt_listeners: list[Callable[[str, float], None]] = []
+        self._timing_listeners: list[Callable[[float, float], None]] = []
 
-        # Find this node's address in cluster members
-        self_address = self._find_self_address(node_id, cluster_members)
+        # Find this node's address among the voters, then the observers
+        self_address = self._find_self_address(node_id, [*cluster_members, *observers])
+        self._is_observer = self_address in self._observers
         partners = [addr for addr in cluster_members if addr != self_address]
+        self._self_address = self_address
+        self._metadata = ClusterMetadata() if replicate_metadata else None
 
         self._node = LeaderElectionNode(
             self_address=self_address,
             partners=partners,
             election_timeout_ms=int(election_timeout * 1000),
             heartbeat_interval_ms=int(heartbeat_interval * 1000),
+            election_backoff_ms=int(
+                self._priority_level(self_address)
+                * _PRIORITY_BACKOFF
+                * election_timeout
+                * 1000
+            ),
             on_leader_change=on_leader_change,
+            metadata=self._metadata,
+            forwarding_url=forwarding_url,
+            observer=self._is_observer,
+            dynamic_membership=dynamic_membership,
+            on_membership_change=self._handle_membership_change,
+            min_election_timeout_ms=(
+                int(min_election_timeout * 1000) if adaptive_timeouts else None
+            ),
+            min_heartbeat_interval_ms=(
+                int(min_heartbeat_interval * 1000) if adaptive_timeouts else None
+            ),
+            on_rtt=self._handle_rtt,
+            on_timing_change=self._handle_timing_change,
+            pre_vote=pre_vote,
+            check_quorum=check_quorum,
+            event_loop=self._event_loop,
         )
 
+        self._rebalancer: threading.Thread | None = None
+        preferred = any(
+            self.get_priority(member) > self.get_priority(self_address)
+            for member in priorities
+        )
+        if preferred and not self._is_observer:
+            self._rebalancer = threading.Thread(
+                target=self._rebalance_loop, name="py-leader-rebalance", daemon=True
+            )
+            self._rebalancer.start()
+
     @staticmethod
     def _validate_configuration(
         node_id: str,
@@ -133,6 +372,148 @@ class RaftLeaderElection:
                 "heartbeat_interval must be less than election_timeout"
             )
 
+    @staticmethod
+    def _load_membership(path: str) -> list[str] | None:
+        """Read the voting members saved by a previous run.
+
+        Returns:
+            The saved members, or None if the file does not exist.
+
+        Raises:
+            InvalidConfigurationError: If the file cannot be parsed.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            raise InvalidConfigurationError(
+                f"Cannot read membership file {path!r}: {e}"
+            ) from e
+        members = data.get("members") if isinstance(data, dict) else None
+        if not isinstance(members, list) or not all(
+            isinstance(m, str) for m in members
+        ):
+            raise InvalidConfigurationError(
+                f"Membership file {path!r} must hold a list of members"
+            )
+        return members
+
+    def _handle_membership_change(self, members: list[str]) -> None:
+        """Save the live voting members, then record them.
+
+        The file is durable before get_cluster_members() reports the new
+        members. Runs on the Raft thread, so a failed save is logged, not
+        raised.
+        """
+        if self._membership_file is not None:
+            try:
+                self._save_membership(self._membership_file, members)
+            except OSError:
+                logger.exception(
+                    "Failed to save Raft membership to %s", self._membership_file
+                )
+        self._cluster_members = tuple(members)
+
+    @staticmethod
+    def _save_membership(path: str, members: list[str]) -> None:
+        """Atomically replace the membership file and fsync it.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump({"members": members}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, path)
+        # Make the rename itself durable
+        directory = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+        try:
+            os.fsync(directory)
+        finally:
+            os.close(directory)
+
+    @staticmethod
+    def _validate_observers(cluster_members: list[str], observers: list[str]) -> None:
+        """Validate the observer addresses.
+
+        Raises:
+            InvalidConfigurationError: If an observer is invalid, duplicated
+                or also a voting member.
+        """
+        if len(observers) != len(set(observers)):
+            raise InvalidConfigurationError("observers contains duplicate addresses")
+
+        for observer in observers:
+            if not observer or ":" not in observer:
+                raise InvalidConfigurationError(
+                    f"Invalid observer address: {observer!r}. "
+                    "Expected format: 'host:port'"
+                )
+
+        voters = set(cluster_members).intersection(observers)
+        if voters:
+            raise InvalidConfigurationError(
+                f"observers {sorted(voters)} are also cluster_members"
+            )
+
+    @staticmethod
+    def _validate_priorities(
+        cluster_members: list[str],
+        priorities: dict[str, int],
+        rebalance_after: float,
+    ) -> None:
+        """Validate the leader priorities.
+
+        Raises:
+            InvalidConfigurationError: If a priority is not an integer or
+                names an address outside cluster_members.
+        """
+        unknown = set(priorities).difference(cluster_members)
+        if unknown:
+            raise InvalidConfigurationError(
+                f"priorities {sorted(unknown)} are not cluster_members"
+            )
+        for address, priority in priorities.items():
+            if isinstance(priority, bool) or not isinstance(priority, int):
+                raise InvalidConfigurationError(
+                    f"priority of {address!r} must be an integer, got: {priority!r}"
+                )
+        if rebalance_after <= 0:
+            raise InvalidConfigurationError("rebalance_after must be > 0")
+
+    @staticmethod
+    def _validate_timeout_bounds(
+        election_timeout: float,
+        heartbeat_interval: float,
+        min_election_timeout: float,
+        min_heartbeat_interval: float,
+    ) -> None:
+        """Validate the bounds of adaptive timeouts.
+
+        Raises:
+            InvalidConfigurationError: If a minimum is not positive, exceeds
+                its maximum, or min_election_timeout is not more than three
+                heartbeats.
+        """
+        if min_heartbeat_interval <= 0:
+            raise InvalidConfigurationError("min_heartbeat_interval must be > 0")
+        if min_heartbeat_interval > heartbeat_interval:
+            raise InvalidConfigurationError(
+                "min_heartbeat_interval must not exceed heartbeat_interval"
+            )
+        if min_election_timeout > election_timeout:
+            raise InvalidConfigurationError(
+                "min_election_timeout must not exceed election_timeout"
+            )
+        if min_election_timeout <= 3 * min_heartbeat_interval:
+            raise InvalidConfigurationError(
+                "min_election_timeout must be more than 3 * min_heartbeat_interval"
+            )
+
     @staticmethod
     def _find_self_address(node_id: str, cluster_members: list[str]) -> str:
         """Find this node's address in the cluster members list.
@@ -160,10 +541,13 @@ class RaftLeaderElection:
     def is_leader_elected(self) -> bool:
         """Check if this node is the elected leader.
 
+        A leader handing over leadership reports False for the whole
+        transfer, so it stops taking writes before the new leader starts.
+
         Returns:
             True if this node is the elected leader, False otherwise.
         """
-        return self._node.is_leader
+        return self._node.is_leader and not self._transferring
 
     def elect_as_leader(self) -> None:
         """Request to become leader.
@@ -174,24 +558,312 @@ class RaftLeaderElection:
         # No-op: Raft consensus decides leadership, not explicit requests
 
     def demote_from_leader(self) -> None:
-        """Request to step down from leadership.
+        """Step down by transferring leadership to a follower.
+
+        Blocks for up to the election timeout (see transfer_leadership()).
+        If no follower can take over, this node remains leader. Does nothing
+        if this node is not the leader.
+        """
+        self.transfer_leadership()
+
+    def transfer_leadership(
+        self, target: str | None = None, timeout: float | None = None
+    ) -> LeadershipTransfer:
+        """Hand leadership to a follower (Raft leadership transfer).
+
+        The leader stops reporting itself as elected, then sends TimeoutNow
+        to the target so it starts an election immediately instead of
+        waiting out the election timeout. A target that has not yet
+        acknowledged the leader's whole log is retried until it catches up
+        or the timeout expires.
+
+        Args:
+            target: Address of the follower to hand leadership to. Defaults
+                to the connected follower with the most replicated log.
+            timeout: Maximum time in seconds to wait for a new leader.
+                Defaults to the election timeout.
+
+        Returns:
+            The outcome, including how long the handoff took.
+        """
+        started = time.monotonic()
+        deadline = started + (self._election_timeout if timeout is None else timeout)
+        with self._transfer_lock:
+            if not self._node.is_leader:
+                return LeadershipTransfer(
+                    succeeded=False,
+                    target=target,
+                    new_leader=self._node.get_leader_address(),
+                    duration=time.monotonic() - started,
+                    reason="not the leader",
+                )
+            self._transferring = True
+            try:
+                return self._transfer(target, started, deadline)
+            finally:
+                self._transferring = False
+
+    def _transfer(
+        self, target: str | None, started: float, deadline: float
+    ) -> LeadershipTransfer:
+        """Send TimeoutNow and wait for leadership to move.
+
+        Returns:
+            The outcome of the transfer.
+        """
+        requested: str | None = None
+        reason = "no connected follower"
+        while requested is None and time.monotonic() < deadline:
+            candidate = target or self._select_transfer_target()
+            if candidate is not None:
+                if self._node.request_leadership_transfer(candidate):
+                    requested = candidate
+                    break
+                reason = f"{candidate} did not catch up with the leader"
+            if not self._node.is_leader:
+                break
+            time.sleep(_POLL_INTERVAL)
+
+        # The old leader learns of its successor from its first heartbeat
+        while requested is not None and time.monotonic() < deadline:
+            leader = self._node.get_leader_address()
+            if not self._node.is_leader and leader not in (None, self._self_address):
+                break
+            time.sleep(_POLL_INTERVAL)
+
+        succeeded = not self._node.is_leader
+        if succeeded:
+            reason = None
+        elif requested is not None:
+            reason = f"{requested} did not take over in time"
+        return LeadershipTransfer(
+            succeeded=succeeded,
+            target=requested or target,
+            new_leader=self._node.get_leader_address(),
+            duration=time.monotonic() - started,
+            reason=reason,
+        )
+
+    def _select_transfer_target(self) -> str | None:
+        """Pick the connected follower with the most replicated log.
+
+        Returns:
+            The follower's address, or None if no follower is connected.
+        """
+        match_indexes = self._node.get_follower_match_indexes()
+        if not match_indexes:
+            return None
+        # Highest match index first; the address breaks ties deterministically
+        return min(
+            match_indexes, key=lambda address: (-match_indexes[address], address)
+        )
+
+    def get_priority(self, address: str) -> int:
+        """Get the leader priority of a voting member.
+
+        Args:
+            address: Address of the member in "host:port" format.
+
+        Returns:
+            The configured priority, 0 if none was given.
+        """
+        return self._priorities.get(address, 0)
+
+    def _priority_level(self, address: str) -> int:
+        """Count the distinct priorities above that of a member.
+
+        Returns:
+            0 for the most preferred members, 1 for the next level, etc.
+        """
+        priority = self.get_priority(address)
+        return len(
+            {p for p in map(self.get_priority, self._cluster_members) if p > priority}
+        )
+
+    def _rebalance_loop(self) -> None:
+        """Check every heartbeat interval whether to hand leadership over."""
+        while not self._stopped.wait(self._heartbeat_interval):
+            try:
+                self._rebalance()
+            except Exception:
+                logger.exception("Leader rebalancing failed")
+
+    def _rebalance(self) -> LeadershipTransfer | None:
+        """Hand leadership to a preferred node once this node led stably.
 
-        Note: In Raft, you cannot force step-down without network partition.
-        This is a no-op. The node will naturally lose leadership if it
-        becomes partitioned or unhealthy.
+        A failed transfer is retried after another rebalance_after seconds,
+        since this node refuses writes while a transfer is in progress.
+
+        Returns:
+            The outcome of the transfer, None if none was attempted.
+        """
+        leader_since = self._node.leader_since
+        if leader_since is None or not self._node.reachability.has_quorum:
+            return None
+        now = time.monotonic()
+        if now < max(leader_since + self._rebalance_after, self._next_rebalance):
+            return None
+        target = self._select_preferred_leader()
+        if target is None:
+            return None
+        transfer = self.transfer_leadership(target)
+        if transfer.succeeded:
+            logger.info("Handed leadership to preferred node %s", target)
+        else:
+            logger.warning(
+                "Failed to hand leadership to preferred node %s: %s",
+                target,
+                transfer.reason,
+            )
+            self._next_rebalance = time.monotonic() + self._rebalance_after
+        return transfer
+
+    def _select_preferred_leader(self) -> str | None:
+        """Pick the reachable, caught-up follower with the highest priority.
+
+        Returns:
+            The follower's address, or None if no follower with a higher
+            priority than this node is reachable and caught up.
         """
-        # No-op: Raft consensus handles leadership transitions
+        own_priority = self.get_priority(self._self_address)
+        commit_index = self._node.get_commit_index()
+        reachable = self._node.reachability.reachable_peers
+        candidates = [
+            (-self.get_priority(address), -match_index, address)
+            for address, match_index in self._node.get_follower_match_indexes().items()
+            if address in reachable
+            and match_index >= commit_index
+            and self.get_priority(address) > own_priority
+        ]
+        return min(candidates)[2] if candidates else None
 
     def get_cluster_members(self) -> list[str]:
         """Get list of all node addresses in the Raft cluster.
 
+        With dynamic membership, this is the live member list.
+
         Returns:
-            List of node addresses (strings) in the cluster.
+            List of the voting node addresses (strings) in the cluster.
         """
         return list(self._cluster_members)
 
+    def add_member(
+        self, address: str, timeout: float | None = None
+    ) -> MembershipChange:
+        """Add a voting member to the running cluster.
+
+        The change is appended to the Raft log and takes effect once
+        committed; the request is forwarded to the leader if this node does
+        not lead. Start the new node after it has been added, with the
+        current members as its peers.
+
+        Must not be called from a quorum or leadership callback, which run
+        on the Raft thread this call waits for.
+
+        Args:
+            address: Address of the new member in "host:port" format.
+            timeout: Maximum time in seconds to wait for the commit.
+                Defaults to the election timeout.
+
+        Returns:
+            The outcome of the change.
+
+        Raises:
+            RaftLeaderElectionError: If dynamic membership is disabled.
+            InvalidConfigurationError: If address is not "host:port".
+        """
+        return self._change_membership("add", address, timeout)
+
+    def remove_member(
+        self, address: str, timeout: float | None = None
+    ) -> MembershipChange:
+        """Remove a voting member from the running cluster.
+
+        Stop the removed node once the change has committed. A node cannot
+        remove itself; ask another member.
+
+        Args:
+            address: Address of the member in "host:port" format.
+            timeout: Maximum time in seconds to wait for the commit.
+                Defaults to the election timeout.
+
+        Returns:
+            The outcome of the change.
+
+        Raises:
+            RaftLeaderElectionError: If dynamic membership is disabled.
+            InvalidConfigurationError: If address is not "host:port".
+        """
+        return self._change_membership("remove", address, timeout)
+
+    def _change_membership(
+        self, action: str, address: str, timeout: float | None
+    ) -> MembershipChange:
+        """Request a membership change and wait until this node applies it.
+
+        Returns:
+            The outcome of the change.
+        """
+        if not self._dynamic_membership:
+            raise RaftLeaderElectionError("dynamic membership is disabled")
+        if not address or ":" not in address:
+            raise InvalidConfigurationError(
+                f"Invalid member address: {address!r}. Expected format: 'host:port'"
+            )
+
+        reason: str | None = None
+        if action == "add" and address in self._cluster_members:
+            reason = "already a member"
+        elif action == "add" and address in self._observers:
+            reason = "is an observer"
+        elif action == "remove" and address not in self._cluster_members:
+            reason = "not a member"
+        elif action == "remove" and address == self._self_address:
+            reason = "cannot remove this node; ask another member"
+        else:
+            deadline = time.monotonic() + (
+                self._election_timeout if timeout is None else timeout
+            )
+            reason = self._node.change_membership(
+                action, address, max(0.0, deadline - time.monotonic())
+            )
+            # The change reaches this node's member list on a later tick
+            while reason is None and (address in self._cluster_members) != (
+                action == "add"
+            ):
+                if time.monotonic() >= deadline:
+                    reason = "committed but not yet applied on this node"
+                    break
+                time.sleep(_POLL_INTERVAL)
+
+        return MembershipChange(
+            succeeded=reason is None,
+            action=action,
+            member=address,
+            members=self._cluster_members,
+            reason=reason,
+        )
+
+    def get_observers(self) -> list[str]:
+        """Get the addresses of the non-voting observers.
+
+        Returns:
+            List of observer addresses, empty if there are none.
+        """
+        return list(self._observers)
+
+    def is_observer(self) -> bool:
+        """Check if this node is a non-voting observer.
+
+        An observer is never elected leader.
+
+        Returns:
+            True if this node is an observer, False if it votes.
+        """
+        return self._is_observer
+
     def is_member_in_cluster(self, node_id: str) -> bool:
-        """Check if a node ID is a member of the Raft cluster.
+        """Check if a node ID is a voting member of the Raft cluster.
 
         Args:
             node_id: The node ID (hostname part) to check.
@@ -208,34 +880,222 @@ class RaftLeaderElection:
     def get_election_timeout(self) -> float:
         """Get the election timeout in seconds.
 
+        With adaptive timeouts, this is the value currently in use.
+
         Returns:
             Timeout duration in seconds.
         """
-        return self._election_timeout
+        return self._node.timing.election_timeout
 
     def get_heartbeat_interval(self) -> float:
         """Get the heartbeat interval in seconds.
 
+        With adaptive timeouts, this is the value currently in use.
+
         Returns:
             Interval duration in seconds.
         """
-        return self._heartbeat_interval
+        return self._node.timing.heartbeat_interval
+
+    def get_timing(self) -> RaftTiming:
+        """Get the timing in use and the distribution of measured delays.
+
+        Heartbeat round trips are measured while this node leads, and the
+        gaps between heartbeats while it follows, whether or not timeouts
+        are adaptive.
+
+        Returns:
+            A snapshot of the timing.
+        """
+        timing = self._node.timing
+        return RaftTiming(
+            heartbeat_interval=timing.heartbeat_interval,
+            election_timeout=timing.election_timeout,
+            adaptive=self._adaptive_timeouts,
+            rtt=timing.rtt.percentiles(),
+            heartbeat_gaps=timing.gaps.percentiles(),
+        )
+
+    def add_rtt_listener(self, callback: Callable[[str, float], None]) -> None:
+        """Call callback(peer, seconds) for each heartbeat round trip measured.
+
+        Round trips are measured while this node leads. Callbacks run on the
+        Raft thread for every heartbeat and must return quickly.
+
+        Args:
+            callback: Receives the partner's address and the round-trip time.
+        """
+        with self._listeners_lock:
+            self._rtt_listeners.append(callback)
+
+    def add_timing_listener(self, callback: Callable[[float, float], None]) -> None:
+        """Call callback(heartbeat_interval, election_timeout) on each change.
+
+        Adaptive timeouts change at most once per second. Callbacks run on
+        the Raft thread and must return quickly.
+
+        Args:
+            callback: Receives the new values in seconds.
+        """
+        with self._listeners_lock:
+            self._timing_listeners.append(callback)
+
+    def _handle_rtt(self, peer: str, rtt: float) -> None:
+        """Pass a measured round trip to the listeners."""
+        with self._listeners_lock:
+            listeners = list(self._rtt_listeners)
+        for callback in listeners:
+            try:
+                callback(peer, rtt)
+            except Exception:
+                logger.exception("Round-trip time listener failed")
+
+    def _handle_timing_change(
+        self, heartbeat_interval: float, election_timeout: float
+    ) -> None:
+        """Pass adjusted timeouts to the listeners."""
+        logger.debug(
+            "Raft timing adjusted: heartbeat %.3fs, election timeout %.3fs",
+            heartbeat_interval,
+            election_timeout,
+        )
+        with self._listeners_lock:
+            listeners = list(self._timing_listeners)
+        for callback in listeners:
+            try:
+                callback(heartbeat_interval, election_timeout)
+            except Exception:
+                logger.exception("Timing listener failed")
 
     def is_quorum_reached(self) -> bool:
         """Check if quorum is established in the cluster.
 
-        Quorum is reached when > n/2 nodes are responding,
-        where n is the total cluster size.
+        Quorum is reached when > n/2 voting nodes are responding, where n
+        is the number of cluster members; observers do not count. Reachability is maintained from
+        connection events and heartbeat acknowledgements, so this is a
+        constant-time read.
 
         Returns:
             True if quorum is reached, False otherwise.
         """
-        responding = self._node.get_responding_nodes_count()
-        return responding >= self._quorum_size
+        return self._node.reachability.has_quorum
+
+    def get_reachable_peers(self) -> list[str]:
+        """Get the other cluster members this node can currently reach.
+
+        A member is reachable while connected; while this node is leader it
+        must also have acknowledged a heartbeat within the election timeout.
+        Observers are not listed.
+
+        Returns:
+            Sorted addresses of the reachable voting members, excluding this
+            node.
+        """
+        return sorted(self._node.reachability.reachable_peers)
+
+    def add_quorum_listener(self, callback: Callable[[bool], None]) -> None:
+        """Call callback(has_quorum) whenever this node gains or loses quorum.
+
+        Callbacks run on the Raft thread: they must return quickly and must
+        not call transfer_leadership() or demote_from_leader(), which wait
+        for that thread.
+
+        Args:
+            callback: Receives True when quorum is gained, False when lost.
+        """
+        self._node.reachability.add_listener(callback)
+
+    def remove_quorum_listener(self, callback: Callable[[bool], None]) -> None:
+        """Stop notifying a callback added with add_quorum_listener().
+
+        Args:
+            callback: The callback to remove. Ignored if not registered.
+        """
+        self._node.reachability.remove_listener(callback)
+
+    def get_raft_term(self) -> int:
+        """Get the current Raft term of this node.
+
+        The term increases with every election, so a rising term on a
+        stable cluster points at repeated elections.
+
+        Returns:
+            The current term.
+        """
+        return self._node.get_raft_term()
+
+    def get_leader_epoch(self) -> int | None:
+        """Get the epoch of this node's leadership, for fencing writes.
+
+        The epoch is the Raft term this node was elected in. It is recorded
+        when leadership changes and only increases across leaders, so a
+        write started under one epoch must not commit under another.
+
+        Returns:
+            The epoch while this node is the elected leader; None while it
+            is a follower or hands leadership over.
+        """
+        if self._transferring:
+            return None
+        return self._node.leader_epoch
+
+    def get_cluster_metadata(self) -> dict[str, Any]:
+        """Get the replicated cluster metadata, read locally.
+
+        Keys written by the leader on election:
+
+        - "leader": the leader's "host:port" address.
+        - "epoch": the Raft term the leader was elected in. It increases
+          with every election, so it can serve as a fencing token.
+        - "forwarding_url": the URL the leader accepts forwarded writes on,
+          if it published one.
+
+        Other keys, such as "config_version", are set with
+        update_cluster_metadata(). The leader keys are left out while this
+        node knows of a newer term than the recorded epoch, i.e. until the
+        new leader's entry has been replicated here.
+
+        Returns:
+            A copy of the metadata; empty if metadata is not replicated.
+        """
+        if self._metadata is None:
+            return {}
+        metadata = self._metadata.snapshot()
+        if metadata.get(EPOCH, 0) < self._node.get_raft_term():
+            metadata.pop(LEADER, None)
+            metadata.pop(FORWARDING_URL, None)
+        return metadata
+
+    def update_cluster_metadata(self, values: Mapping[str, Any]) -> None:
+        """Set cluster metadata keys through the Raft log.
+
+        The update is forwarded to the leader and applied on every node once
+        committed; this call does not wait for it. Keys set to None are
+        removed.
+
+        Args:
+            values: Keys and values to set, e.g. {"config_version": 3}.
+
+        Raises:
+            RaftLeaderElectionError: If metadata is not replicated.
+            InvalidConfigurationError: If values set "leader", "epoch" or
+                "forwarding_url", which only the elected leader writes.
+        """
+        if self._metadata is None:
+            raise RaftLeaderElectionError("cluster metadata is not replicated")
+        reserved = RESERVED_KEYS.intersection(values)
+        if reserved:
+            raise InvalidConfigurationError(
+                f"cluster metadata keys {sorted(reserved)} are reserved"
+            )
+        self._metadata.apply(dict(values))
 
     def destroy(self) -> None:
         """Cleanly shut down the Raft node.
 
         Should be called when the election is no longer needed.
         """
+        self._stopped.set()
+        if self._rebalancer is not None:
+            self._rebalancer.join()
         self._node.destroy()
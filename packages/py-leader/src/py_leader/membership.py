@@ -0,0 +1,127 @@
+"""Remote membership changes of a running Raft cluster."""
+
+from __future__ import annotations
+
+from pysyncobj.utility import TcpUtility, UtilityException
+
+from py_leader.election import InvalidConfigurationError, MembershipChange
+
+# Prefix of the partner entries in a PySyncObj status
+_PARTNER_STATUS_PREFIX = "partner_node_status_server_"
+
+
+class RaftMembershipClient:
+    """Adds and removes voting members through a running cluster node.
+
+    Commands are sent to the Raft port of a voting member, which forwards
+    them to the leader, so they can be run from another process (e.g. a
+    management command) while the cluster serves traffic. The member must
+    run with dynamic membership enabled.
+
+    Example:
+        >>> client = RaftMembershipClient("node1:20202")
+        >>> change = client.add_member("node4:20202")
+        >>> change.succeeded
+        True
+    """
+
+    def __init__(self, node: str, *, timeout: float = 10.0) -> None:
+        """Initialize the client.
+
+        Args:
+            node: Raft address of a voting member in "host:port" format.
+            timeout: Maximum time in seconds to wait for each command.
+        """
+        self._node = node
+        self._timeout = timeout
+
+    def get_cluster_members(self) -> list[str]:
+        """Get the voting members as known to the node.
+
+        Returns:
+            The node's address followed by those of its partners.
+
+        Raises:
+            ConnectionError: If the node cannot be reached.
+        """
+        status = self._execute(["status"])
+        if not isinstance(status, dict):
+            raise ConnectionError(f"unexpected status from {self._node}: {status!r}")
+        partners = sorted(
+            key[len(_PARTNER_STATUS_PREFIX) :]
+            for key in status
+            if key.startswith(_PARTNER_STATUS_PREFIX)
+        )
+        return [self._node, *partners]
+
+    def add_member(self, address: str) -> MembershipChange:
+        """Add a voting member and wait until the change commits.
+
+        Args:
+            address: Address of the new member in "host:port" format.
+
+        Returns:
+            The outcome of the change.
+
+        Raises:
+            ConnectionError: If the node cannot be reached.
+            InvalidConfigurationError: If address is not "host:port".
+        """
+        return self._change("add", address)
+
+    def remove_member(self, address: str) -> MembershipChange:
+        """Remove a voting member and wait until the change commits.
+
+        Args:
+            address: Address of the member in "host:port" format. It must
+                not be the node the client talks to.
+
+        Returns:
+            The outcome of the change.
+
+        Raises:
+            ConnectionError: If the node cannot be reached.
+            InvalidConfigurationError: If address is not "host:port".
+        """
+        return self._change("remove", address)
+
+    def _change(self, action: str, address: str) -> MembershipChange:
+        """Send a membership command and read its outcome.
+
+        Returns:
+            The outcome of the change.
+        """
+        if not address or ":" not in address:
+            raise InvalidConfigurationError(
+                f"Invalid member address: {address!r}. Expected format: 'host:port'"
+            )
+        result = self._execute([action, address])
+        succeeded = isinstance(result, str) and result.startswith("SUCCESS")
+        reason = None
+        if not succeeded:
+            reason = "request denied or not committed in time"
+            if isinstance(result, str) and not result.startswith("FAIL"):
+                reason = result
+        return MembershipChange(
+            succeeded=succeeded,
+            action=action,
+            member=address,
+            members=tuple(self.get_cluster_members()),
+            reason=reason,
+        )
+
+    def _execute(self, command: list[str]) -> object:
+        """Run a PySyncObj utility command on the node.
+
+        Raises:
+            ConnectionError: If the node cannot be reached.
+        """
+        try:
+            result = TcpUtility(timeout=self._timeout).executeCommand(
+                self._node, command
+            )
+        except UtilityException as e:
+            raise ConnectionError(f"cannot reach {self._node}: {e}") from e
+        if result is None:
+            raise ConnectionError(f"cannot reach {self._node}")
+        return result
@@ -182,7 +182,7 @@ class FakeHttpxClient:
         def test_remote_node_query():
             client = FakeHttpxClient()
             client.add_response(
-                "http://node2:8080/health/status",
+                "http://node2:8080/health/position",
                 {"is_leader": True}
             )
             adapter = SplitBrainDetectorAdapter(..., client=client)
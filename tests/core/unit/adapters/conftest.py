@@ -29,7 +29,7 @@ def fake_httpx_client():
     Example:
         def test_remote_node_query(fake_httpx_client):
             fake_httpx_client.add_response(
-                "http://node2:8080/health/status",
+                "http://node2:8080/health/position",
                 {"is_leader": True}
             )
     """
@@ -120,6 +120,76 @@ class TestFakeMetricsAdapterLeaderElected:
         assert adapter.calls[0] == MetricCall("leader_elected", True)
 
 
+@pytest.mark.unit
+class TestFakeMetricsAdapterReplication:
+    """Tests for FakeMetricsAdapter replication tracking."""
+
+    def test_set_local_txid_records_state(self) -> None:
+        """set_local_txid should record the TXID."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_local_txid(42)
+        assert adapter.current_local_txid == 42
+        assert adapter.calls == [MetricCall("local_txid", 42)]
+
+    def test_set_replication_lag_records_state(self) -> None:
+        """set_replication_lag should record txids and seconds."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_replication_lag(10, 2.5)
+        assert adapter.current_replication_lag == (10, 2.5)
+        assert adapter.calls == [
+            MetricCall("replication_lag_txids", 10),
+            MetricCall("replication_lag_seconds", 2.5),
+        ]
+
+    def test_set_replication_lag_unknown_seconds(self) -> None:
+        """set_replication_lag with unknown seconds records only txids."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_replication_lag(10, None)
+        assert adapter.current_replication_lag == (10, None)
+        assert adapter.calls == [MetricCall("replication_lag_txids", 10)]
+
+    def test_reset_clears_replication_state(self) -> None:
+        """reset should clear replication state."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_local_txid(42)
+        adapter.set_replication_lag(10, 2.5)
+        adapter.reset()
+        assert adapter.current_local_txid is None
+        assert adapter.current_replication_lag is None
+
+    def test_set_response_cache_stats_records_state(self) -> None:
+        """set_response_cache_stats should record hits, misses and size."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_response_cache_stats(3, 1, 2048)
+        assert adapter.current_response_cache_stats == (3, 1, 2048)
+        assert adapter.calls == [
+            MetricCall("response_cache_hits", 3),
+            MetricCall("response_cache_misses", 1),
+            MetricCall("response_cache_bytes", 2048),
+        ]
+
+    def test_set_query_cache_stats_records_state(self) -> None:
+        """set_query_cache_stats should record hits, misses and size."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_query_cache_stats(5, 2, 4096)
+        assert adapter.current_query_cache_stats == (5, 2, 4096)
+        assert adapter.calls == [
+            MetricCall("query_cache_hits", 5),
+            MetricCall("query_cache_misses", 2),
+            MetricCall("query_cache_bytes", 4096),
+        ]
+
+    def test_set_raft_timing_records_state(self) -> None:
+        """set_raft_timing should record the heartbeat and election timeout."""
+        adapter = FakeMetricsAdapter()
+        adapter.set_raft_timing(0.05, 0.4)
+        assert adapter.current_raft_timing == (0.05, 0.4)
+        assert adapter.calls == [
+            MetricCall("raft_heartbeat_interval_seconds", 0.05),
+            MetricCall("raft_election_timeout_seconds", 0.4),
+        ]
+
+
 @pytest.mark.unit
 class TestFakeMetricsAdapterUtilityMethods:
     """Tests for FakeMetricsAdapter utility methods."""
@@ -194,3 +264,52 @@ class TestFakeMetricsAdapterUtilityMethods:
         assert adapter.calls[1] == MetricCall("health_status", "healthy")
         assert adapter.calls[2] == MetricCall("split_brain_detected", False)
         assert adapter.calls[3] == MetricCall("leader_elected", True)
+
+
+@pytest.mark.unit
+class TestFakeMetricsAdapterHistogramsAndCounters:
+    """Tests for FakeMetricsAdapter histogram and counter recording."""
+
+    def test_histogram_values_filtered_by_labels(self) -> None:
+        """histogram_values should return matching observations in order."""
+        fake = FakeMetricsAdapter()
+        fake.observe_histogram("statement_duration_seconds", 0.1, {"kind": "read"})
+        fake.observe_histogram("statement_duration_seconds", 0.2, {"kind": "write"})
+        fake.observe_histogram("statement_duration_seconds", 0.3, {"kind": "read"})
+
+        assert fake.histogram_values("statement_duration_seconds") == [0.1, 0.2, 0.3]
+        assert fake.histogram_values("statement_duration_seconds", kind="read") == [
+            0.1,
+            0.3,
+        ]
+        assert fake.histogram_values("unknown") == []
+
+    def test_counter_value_sums_increments(self) -> None:
+        """counter_value should sum increments with matching labels."""
+        fake = FakeMetricsAdapter()
+        fake.increment_counter("statements", labels={"kind": "read"})
+        fake.increment_counter("statements", 2, labels={"kind": "write"})
+        fake.increment_counter("statements", labels={"kind": "read"})
+
+        assert fake.counter_value("statements") == 4
+        assert fake.counter_value("statements", kind="read") == 2
+        assert fake.counter_value("forward_retries") == 0
+
+    def test_histograms_and_counters_not_in_calls(self) -> None:
+        """Only gauge updates should be listed in calls."""
+        fake = FakeMetricsAdapter()
+        fake.observe_histogram("statement_duration_seconds", 0.1)
+        fake.increment_counter("statements")
+
+        assert fake.calls == []
+
+    def test_reset_clears_histograms_and_counters(self) -> None:
+        """reset should clear recorded observations and increments."""
+        fake = FakeMetricsAdapter()
+        fake.observe_histogram("statement_duration_seconds", 0.1)
+        fake.increment_counter("statements")
+
+        fake.reset()
+
+        assert fake.histogram_values("statement_duration_seconds") == []
+        assert fake.counter_value("statements") == 0
@@ -340,6 +340,56 @@ class TestHTTPXForwardingAdapter:
         assert timeout.connect == 10.0
         assert timeout.read == 60.0
 
+    def test_forward_request_sends_current_trace_context(self) -> None:
+        """Test that the current span's context replaces the incoming traceparent."""
+        from litefs.adapters.fakes.fake_tracer import InMemoryTracer
+        from litefs.usecases.tracing import trace_span
+
+        mock_client = MagicMock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b""
+        mock_client.request.return_value = mock_response
+
+        adapter = HTTPXForwardingAdapter(client=mock_client)
+        with trace_span(InMemoryTracer(), "litefs.forward") as span:
+            adapter.forward_request(
+                primary_url="http://primary:8080",
+                method="POST",
+                path="/api/users",
+                headers={
+                    "Traceparent": (
+                        "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+                    )
+                },
+            )
+
+        headers = mock_client.request.call_args.kwargs["headers"]
+        assert "Traceparent" not in headers
+        assert headers["traceparent"] == span.context.to_traceparent()
+
+    def test_forward_request_without_trace_keeps_traceparent(self) -> None:
+        """Test that an incoming traceparent is passed through outside a span."""
+        mock_client = MagicMock()
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b""
+        mock_client.request.return_value = mock_response
+        traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        adapter = HTTPXForwardingAdapter(client=mock_client)
+        adapter.forward_request(
+            primary_url="http://primary:8080",
+            method="POST",
+            path="/api/users",
+            headers={"traceparent": traceparent},
+        )
+
+        headers = mock_client.request.call_args.kwargs["headers"]
+        assert headers["traceparent"] == traceparent
+
     def test_from_forwarding_settings_factory(self) -> None:
         """Test that factory method creates adapter from ForwardingSettings."""
         from litefs.domain.settings import ForwardingSettings
@@ -0,0 +1,51 @@
+"""Unit tests for InotifyFileWatcher adapter."""
+
+import sys
+import threading
+
+import pytest
+from litefs.adapters.inotify_file_watcher import (
+    InotifyFileWatcher,
+    create_file_watcher,
+)
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestInotifyFileWatcher:
+    """Test change notifications for a single file."""
+
+    def test_write_to_file_reported(self, tmp_path):
+        """Test that writing the watched file wakes up wait()."""
+        path = tmp_path / "db-pos"
+        watcher = InotifyFileWatcher(path)
+        try:
+            threading.Timer(0.05, path.write_text, args=("0000000000000001/00",)).start()
+            assert watcher.wait(2.0) is True
+        finally:
+            watcher.close()
+
+    def test_other_files_ignored(self, tmp_path):
+        """Test that changes to other files in the directory time out."""
+        watcher = InotifyFileWatcher(tmp_path / "db-pos")
+        try:
+            (tmp_path / "db").write_text("data")
+            assert watcher.wait(0.05) is False
+        finally:
+            watcher.close()
+
+    def test_timeout_without_change(self, tmp_path):
+        """Test that wait() returns False on timeout."""
+        watcher = InotifyFileWatcher(tmp_path / "db-pos")
+        try:
+            assert watcher.wait(0.01) is False
+        finally:
+            watcher.close()
+
+    def test_missing_directory_falls_back_to_polling(self, tmp_path):
+        """Test that create_file_watcher returns None if it cannot watch."""
+        assert create_file_watcher(tmp_path / "missing" / "db-pos") is None
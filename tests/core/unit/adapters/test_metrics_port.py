@@ -83,3 +83,45 @@ class TestNoOpMetricsAdapter:
         adapter = NoOpMetricsAdapter()
         result = adapter.set_leader_elected(False)
         assert result is None
+
+    def test_set_local_txid_is_noop(self) -> None:
+        """set_local_txid should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.set_local_txid(42)
+        assert result is None
+
+    def test_set_replication_lag_is_noop(self) -> None:
+        """set_replication_lag should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.set_replication_lag(10, None)
+        assert result is None
+
+    def test_set_response_cache_stats_is_noop(self) -> None:
+        """set_response_cache_stats should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.set_response_cache_stats(3, 1, 2048)
+        assert result is None
+
+    def test_set_query_cache_stats_is_noop(self) -> None:
+        """set_query_cache_stats should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.set_query_cache_stats(5, 2, 4096)
+        assert result is None
+
+    def test_set_raft_timing_is_noop(self) -> None:
+        """set_raft_timing should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.set_raft_timing(0.05, 0.4)
+        assert result is None
+
+    def test_observe_histogram_is_noop(self) -> None:
+        """observe_histogram should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.observe_histogram("statement_duration_seconds", 0.1)
+        assert result is None
+
+    def test_increment_counter_is_noop(self) -> None:
+        """increment_counter should not raise or return anything."""
+        adapter = NoOpMetricsAdapter()
+        result = adapter.increment_counter("statements", labels={"kind": "read"})
+        assert result is None
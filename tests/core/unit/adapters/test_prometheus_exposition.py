@@ -0,0 +1,141 @@
+"""Tests for PrometheusExposition."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Skip all tests if prometheus-client is not installed
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from litefs.adapters.prometheus_exposition import (
+    PrometheusExposition,
+    mark_process_dead,
+)
+from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("Adapter.Metrics")]
+
+# Records metrics in a worker process writing to PROMETHEUS_MULTIPROC_DIR
+WORKER_SCRIPT = textwrap.dedent(
+    """
+    import sys
+
+    from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+    prefix, role, hits = sys.argv[1], sys.argv[2], int(sys.argv[3])
+    adapter = PrometheusMetricsAdapter(prefix=prefix)
+    adapter.set_node_state(role == "primary")
+    adapter.set_query_cache_stats(hits=hits, misses=0, size_bytes=100)
+    adapter.increment_counter("statements", labels={"kind": "read"})
+    """
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def prefix() -> str:
+    """Create a unique prefix."""
+    return f"test_{uuid.uuid4().hex[:8]}"
+
+
+def run_worker(multiprocess_dir: Path, prefix: str, role: str, hits: int) -> None:
+    """Record metrics in a separate worker process."""
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(multiprocess_dir)}
+    subprocess.run(
+        [sys.executable, "-c", WORKER_SCRIPT, prefix, role, str(hits)],
+        env=env,
+        check=True,
+    )
+
+
+def sample(output: bytes, name: str) -> float:
+    """Return the value of a sample line of the text exposition."""
+    for line in output.decode().splitlines():
+        if line.startswith((f"{name} ", f"{name}{{")):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"sample {name} not found")
+
+
+class TestSingleProcessExposition:
+    """Tests rendering the default registry."""
+
+    def test_renders_default_registry(self, prefix, monkeypatch) -> None:
+        """Metrics of this process should be rendered."""
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        adapter = PrometheusMetricsAdapter(prefix=prefix)
+        adapter.set_node_state(True)
+        exposition = PrometheusExposition(ttl=0)
+
+        output = exposition.render()
+
+        assert not exposition.is_multiprocess
+        assert sample(output, f"{prefix}_node_state") == 1
+        assert exposition.content_type.startswith("text/plain")
+
+    def test_output_reused_within_ttl(self, prefix, monkeypatch) -> None:
+        """Renders within the TTL should return the cached output."""
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+        clock = FakeClock()
+        adapter = PrometheusMetricsAdapter(prefix=prefix)
+        exposition = PrometheusExposition(ttl=5.0, clock=clock)
+
+        adapter.set_local_txid(1)
+        first = exposition.render()
+        adapter.set_local_txid(2)
+        clock.now = 4.9
+        cached = exposition.render()
+        clock.now = 5.0
+        refreshed = exposition.render()
+
+        assert cached is first
+        assert sample(cached, f"{prefix}_local_txid") == 1
+        assert sample(refreshed, f"{prefix}_local_txid") == 2
+
+
+class TestMultiprocessExposition:
+    """Tests aggregating the values of several worker processes."""
+
+    def test_aggregates_workers(self, tmp_path, prefix) -> None:
+        """Role uses the max of workers; counters and cache sizes are summed."""
+        run_worker(tmp_path, prefix, "replica", hits=3)
+        run_worker(tmp_path, prefix, "primary", hits=4)
+        exposition = PrometheusExposition(ttl=0, multiprocess_dir=str(tmp_path))
+
+        output = exposition.render()
+
+        assert exposition.is_multiprocess
+        assert sample(output, f"{prefix}_node_state") == 1
+        assert sample(output, f"{prefix}_query_cache_hits") == 7
+        assert sample(output, f"{prefix}_query_cache_bytes") == 200
+        assert sample(output, f"{prefix}_statements_total") == 2
+
+    def test_mark_process_dead_drops_live_gauges(self, tmp_path) -> None:
+        """Live gauge files of an exited worker should be removed."""
+        (tmp_path / "gauge_livemax_4242.db").write_bytes(b"")
+        (tmp_path / "counter_4242.db").write_bytes(b"")
+
+        mark_process_dead(4242, str(tmp_path))
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["counter_4242.db"]
+
+    def test_mark_process_dead_without_directory_is_noop(self, monkeypatch) -> None:
+        """Outside multiprocess mode there is nothing to discard."""
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+        mark_process_dead(4242)
@@ -136,6 +136,68 @@ class TestPrometheusMetricsAdapterLeaderElected:
         assert adapter._leader_elected._value.get() == 0
 
 
+@pytest.mark.unit
+class TestPrometheusMetricsAdapterReplication:
+    """Tests for PrometheusMetricsAdapter replication gauges."""
+
+    @pytest.fixture
+    def adapter(self):
+        """Create adapter with unique prefix."""
+        import uuid
+
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        prefix = f"test_{uuid.uuid4().hex[:8]}"
+        return PrometheusMetricsAdapter(prefix=prefix)
+
+    def test_set_local_txid_sets_gauge(self, adapter) -> None:
+        """set_local_txid should set the TXID gauge."""
+        adapter.set_local_txid(42)
+        assert adapter._local_txid._value.get() == 42
+
+    def test_set_replication_lag_sets_gauges(self, adapter) -> None:
+        """set_replication_lag should set txid and seconds gauges."""
+        adapter.set_replication_lag(10, 2.5)
+        assert adapter._replication_lag_txids._value.get() == 10
+        assert adapter._replication_lag_seconds._value.get() == 2.5
+
+    def test_unknown_seconds_lag_sets_nan(self, adapter) -> None:
+        """set_replication_lag with unknown seconds should set NaN."""
+        import math
+
+        adapter.set_replication_lag(10, None)
+        assert math.isnan(adapter._replication_lag_seconds._value.get())
+
+    def test_set_response_cache_stats_sets_gauges(self, adapter) -> None:
+        """set_response_cache_stats should set counts, ratio and size gauges."""
+        adapter.set_response_cache_stats(3, 1, 2048)
+        assert adapter._response_cache_hits._value.get() == 3
+        assert adapter._response_cache_misses._value.get() == 1
+        assert adapter._response_cache_hit_ratio._value.get() == 0.75
+        assert adapter._response_cache_bytes._value.get() == 2048
+
+    def test_set_query_cache_stats_sets_gauges(self, adapter) -> None:
+        """set_query_cache_stats should set counts, ratio and size gauges."""
+        adapter.set_query_cache_stats(3, 1, 4096)
+        assert adapter._query_cache_hits._value.get() == 3
+        assert adapter._query_cache_misses._value.get() == 1
+        assert adapter._query_cache_hit_ratio._value.get() == 0.75
+        assert adapter._query_cache_bytes._value.get() == 4096
+
+    def test_set_raft_timing_sets_gauges(self, adapter) -> None:
+        """set_raft_timing should set heartbeat and election timeout gauges."""
+        adapter.set_raft_timing(0.05, 0.4)
+        assert adapter._raft_heartbeat_interval._value.get() == 0.05
+        assert adapter._raft_election_timeout._value.get() == 0.4
+
+    def test_query_cache_hit_ratio_nan_without_lookups(self, adapter) -> None:
+        """Hit ratio should be NaN before any lookup."""
+        import math
+
+        adapter.set_query_cache_stats(0, 0, 0)
+        assert math.isnan(adapter._query_cache_hit_ratio._value.get())
+
+
 @pytest.mark.unit
 class TestPrometheusMetricsAdapterMetricNames:
     """Tests for Prometheus metric naming."""
@@ -160,3 +222,92 @@ class TestPrometheusMetricsAdapterMetricNames:
         assert adapter._health_status._name == "myapp_health_status"
         assert adapter._split_brain_detected._name == "myapp_split_brain_detected"
         assert adapter._leader_elected._name == "myapp_is_leader_elected"
+
+
+@pytest.mark.unit
+class TestPrometheusMetricsAdapterHistogramsAndCounters:
+    """Tests for PrometheusMetricsAdapter histograms and counters."""
+
+    @pytest.fixture
+    def prefix(self) -> str:
+        """Create a unique prefix."""
+        import uuid
+
+        return f"test_{uuid.uuid4().hex[:8]}"
+
+    @staticmethod
+    def _sample(prefix: str, name: str, labels: dict[str, str] | None = None):
+        """Read a sample from the default registry."""
+        return prometheus_client.REGISTRY.get_sample_value(
+            f"{prefix}_{name}", labels or {}
+        )
+
+    def test_observe_histogram_registers_on_first_use(self, prefix) -> None:
+        """observe_histogram should create and update the histogram."""
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        adapter = PrometheusMetricsAdapter(prefix=prefix)
+        adapter.observe_histogram(
+            "write_guard_duration_seconds", 0.002, {"check": "primary"}
+        )
+        adapter.observe_histogram(
+            "write_guard_duration_seconds", 0.004, {"check": "primary"}
+        )
+
+        labels = {"check": "primary"}
+        assert self._sample(prefix, "write_guard_duration_seconds_count", labels) == 2
+        assert self._sample(
+            prefix, "write_guard_duration_seconds_sum", labels
+        ) == pytest.approx(0.006)
+
+    def test_histogram_uses_configured_buckets(self, prefix) -> None:
+        """Per-metric bucket layouts should override the default layout."""
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        adapter = PrometheusMetricsAdapter(
+            prefix=prefix,
+            histogram_buckets={
+                "default": (1.0, 2.0),
+                "statement_duration_seconds": (0.5,),
+            },
+        )
+        adapter.observe_histogram("statement_duration_seconds", 0.1)
+        adapter.observe_histogram("connection_setup_duration_seconds", 1.5)
+
+        assert (
+            self._sample(prefix, "statement_duration_seconds_bucket", {"le": "0.5"})
+            == 1
+        )
+        assert (
+            self._sample(
+                prefix, "connection_setup_duration_seconds_bucket", {"le": "1.0"}
+            )
+            == 0
+        )
+        assert (
+            self._sample(
+                prefix, "connection_setup_duration_seconds_bucket", {"le": "2.0"}
+            )
+            == 1
+        )
+
+    def test_default_buckets(self, prefix) -> None:
+        """Histograms without configured layout use the default buckets."""
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+        from litefs.domain.metrics import DEFAULT_HISTOGRAM_BUCKETS
+
+        adapter = PrometheusMetricsAdapter(prefix=prefix)
+
+        assert adapter.get_histogram_buckets("any") == DEFAULT_HISTOGRAM_BUCKETS
+
+    def test_increment_counter(self, prefix) -> None:
+        """increment_counter should update the labelled counter."""
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        adapter = PrometheusMetricsAdapter(prefix=prefix)
+        adapter.increment_counter("statements", labels={"kind": "read"})
+        adapter.increment_counter("statements", 2, labels={"kind": "read"})
+        adapter.increment_counter("forward_retries")
+
+        assert self._sample(prefix, "statements_total", {"kind": "read"}) == 3
+        assert self._sample(prefix, "forward_retries_total") == 1
@@ -135,7 +135,7 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             {"is_leader": False},
         )
 
@@ -149,7 +149,7 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
 
         assert len(state.nodes) == 2
         # Check that HTTP request was made
-        assert "http://node2:8080/health/status" in fake_client.requests_made
+        assert "http://node2:8080/health/position" in fake_client.requests_made
         # Check remote node state
         node2_state = next(n for n in state.nodes if n.node_id == "node2")
         assert node2_state.is_leader is False
@@ -162,7 +162,7 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             {"is_leader": True},
         )
 
@@ -177,6 +177,79 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
         node2_state = next(n for n in state.nodes if n.node_id == "node2")
         assert node2_state.is_leader is True
 
+    def test_remote_node_reachability_and_latency_recorded(self) -> None:
+        """Test that remote nodes record reachability and query latency."""
+        fake_raft = FakeRaftLeaderElection(
+            is_leader=True,
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+        )
+        fake_client = FakeHttpxClient()
+        fake_client.add_response(
+            "http://node2:8080/health/position", {"is_leader": False}
+        )
+        fake_client.add_response(
+            "http://node3:8080/health/position",
+            error=httpx.ConnectError("Connection refused"),
+        )
+
+        adapter = SplitBrainDetectorAdapter(
+            raft_election=fake_raft,
+            this_node_id="node1",
+            client=fake_client,
+        )
+
+        node1, node2, node3 = adapter.get_cluster_state().nodes
+        assert node1.reachable and node1.latency_seconds is None
+        assert node2.reachable and node2.latency_seconds is not None
+        assert node2.latency_seconds >= 0
+        assert not node3.reachable and node3.latency_seconds is None
+
+    def test_remote_node_txid_recorded(self) -> None:
+        """Test that a remote node's reported TXID is recorded."""
+        fake_raft = FakeRaftLeaderElection(
+            is_leader=False,
+            cluster_members=["node1:20202", "node2:20202"],
+        )
+        fake_client = FakeHttpxClient()
+        fake_client.add_response(
+            "http://node2:8080/health/position",
+            {"is_leader": True, "txid": 42},
+        )
+
+        adapter = SplitBrainDetectorAdapter(
+            raft_election=fake_raft,
+            this_node_id="node1",
+            client=fake_client,
+        )
+
+        state = adapter.get_cluster_state()
+
+        assert state.get_leader_txid() == 42
+
+    def test_invalid_remote_txid_ignored(self) -> None:
+        """Test that a non-integer TXID is treated as unknown."""
+        fake_raft = FakeRaftLeaderElection(
+            is_leader=False,
+            cluster_members=["node1:20202", "node2:20202"],
+        )
+        fake_client = FakeHttpxClient()
+        fake_client.add_response(
+            "http://node2:8080/health/position",
+            {"is_leader": True, "txid": "42"},
+        )
+
+        adapter = SplitBrainDetectorAdapter(
+            raft_election=fake_raft,
+            this_node_id="node1",
+            client=fake_client,
+        )
+
+        state = adapter.get_cluster_state()
+
+        node2_state = next(n for n in state.nodes if n.node_id == "node2")
+        assert node2_state.is_leader is True
+        assert node2_state.txid is None
+
     def test_uses_custom_health_endpoint_port(self) -> None:
         """Test that custom health endpoint port is used."""
         fake_raft = FakeRaftLeaderElection(
@@ -185,7 +258,7 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:9000/health/status",
+            "http://node2:9000/health/position",
             {"is_leader": False},
         )
 
@@ -198,7 +271,7 @@ class TestSplitBrainDetectorAdapterRemoteNodes:
 
         adapter.get_cluster_state()
 
-        assert "http://node2:9000/health/status" in fake_client.requests_made
+        assert "http://node2:9000/health/position" in fake_client.requests_made
 
     def test_uses_custom_health_endpoint_path(self) -> None:
         """Test that custom health endpoint path is used."""
@@ -237,7 +310,7 @@ class TestSplitBrainDetectorAdapterErrorHandling:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             error=httpx.ConnectError("Connection refused"),
         )
 
@@ -260,7 +333,7 @@ class TestSplitBrainDetectorAdapterErrorHandling:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             status_code=500,
             json_data=None,
         )
@@ -284,7 +357,7 @@ class TestSplitBrainDetectorAdapterErrorHandling:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             json_data=None,  # Will raise ValueError on .json() call
         )
 
@@ -313,10 +386,10 @@ class TestSplitBrainDetectorAdapterMultiNode:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status", {"is_leader": False}
+            "http://node2:8080/health/position", {"is_leader": False}
         )
         fake_client.add_response(
-            "http://node3:8080/health/status", {"is_leader": False}
+            "http://node3:8080/health/position", {"is_leader": False}
         )
 
         adapter = SplitBrainDetectorAdapter(
@@ -339,11 +412,11 @@ class TestSplitBrainDetectorAdapterMultiNode:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status",
+            "http://node2:8080/health/position",
             {"is_leader": True},  # Split brain!
         )
         fake_client.add_response(
-            "http://node3:8080/health/status", {"is_leader": False}
+            "http://node3:8080/health/position", {"is_leader": False}
         )
 
         adapter = SplitBrainDetectorAdapter(
@@ -369,10 +442,10 @@ class TestSplitBrainDetectorAdapterMultiNode:
         )
         fake_client = FakeHttpxClient()
         fake_client.add_response(
-            "http://node2:8080/health/status", {"is_leader": False}
+            "http://node2:8080/health/position", {"is_leader": False}
         )
         fake_client.add_response(
-            "http://node3:8080/health/status", {"is_leader": False}
+            "http://node3:8080/health/position", {"is_leader": False}
         )
 
         adapter = SplitBrainDetectorAdapter(
@@ -422,3 +495,69 @@ class TestSplitBrainDetectorAdapterReturnType:
 
         for node in state.nodes:
             assert isinstance(node, RaftNodeState)
+
+
+class FakeClusterMetadata:
+    """Replicated cluster metadata returning a fixed map."""
+
+    def __init__(self, metadata: dict) -> None:
+        """Initialize with the metadata to return."""
+        self.metadata = metadata
+
+    def get_cluster_metadata(self) -> dict:
+        """Return the configured metadata."""
+        return self.metadata
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.SplitBrainDetector")
+class TestSplitBrainDetectorAdapterClusterMetadata:
+    """Test remote leadership read from replicated cluster metadata."""
+
+    def make_adapter(
+        self, is_leader: bool, metadata: dict
+    ) -> tuple[SplitBrainDetectorAdapter, FakeHttpxClient]:
+        """Create an adapter for node1 of a 3-node cluster."""
+        fake_raft = FakeRaftLeaderElection(
+            is_leader=is_leader,
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+        )
+        fake_client = FakeHttpxClient()
+        fake_client.set_default_response({"is_leader": False})
+        adapter = SplitBrainDetectorAdapter(
+            raft_election=fake_raft,
+            this_node_id="node1",
+            client=fake_client,
+            cluster_metadata=FakeClusterMetadata(metadata),
+        )
+        return adapter, fake_client
+
+    def test_remote_leader_read_without_network(self) -> None:
+        """The recorded leader is the only remote leader; no node is queried."""
+        adapter, client = self.make_adapter(
+            is_leader=False, metadata={"leader": "node2:20202", "epoch": 4}
+        )
+
+        state = adapter.get_cluster_state()
+
+        assert [node.node_id for node in state.get_leader_nodes()] == ["node2"]
+        assert client.requests_made == []
+
+    def test_stale_local_leader_is_split_brain(self) -> None:
+        """A node still leading after another was recorded is a second leader."""
+        adapter, _ = self.make_adapter(
+            is_leader=True, metadata={"leader": "node2:20202", "epoch": 4}
+        )
+
+        state = adapter.get_cluster_state()
+
+        assert state.count_leaders() == 2
+
+    def test_falls_back_to_http_without_current_leader(self) -> None:
+        """Nodes are queried while the metadata records no current leader."""
+        adapter, client = self.make_adapter(is_leader=True, metadata={"epoch": 4})
+
+        state = adapter.get_cluster_state()
+
+        assert state.has_single_leader() is True
+        assert len(client.requests_made) == 2
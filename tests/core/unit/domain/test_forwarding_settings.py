@@ -193,3 +193,18 @@ class TestForwardingSettings:
         fwd1 = ForwardingSettings(connect_timeout=5.0, read_timeout=30.0)
         fwd2 = ForwardingSettings(connect_timeout=10.0, read_timeout=30.0)
         assert hash(fwd1) != hash(fwd2)
+
+    def test_read_your_writes_defaults(self) -> None:
+        """Test read-your-writes is enabled with a 1 second wait by default."""
+        fwd = ForwardingSettings()
+        assert fwd.read_your_writes is True
+        assert fwd.read_your_writes_timeout == 1.0
+
+    def test_read_your_writes_timeout_validation_zero_raises(self) -> None:
+        """Test that zero read_your_writes_timeout raises LiteFSConfigError."""
+        from litefs.domain.exceptions import LiteFSConfigError
+
+        with pytest.raises(
+            LiteFSConfigError, match="read_your_writes_timeout must be positive"
+        ):
+            ForwardingSettings(read_your_writes_timeout=0.0)
@@ -77,6 +77,26 @@ class TestRaftSettings:
                 cluster_members=["node1", "node2", "node3"],
             )
 
+    def test_observers_do_not_change_quorum(self):
+        """Test that quorum is computed from the voting members only."""
+        settings = RaftSettings(
+            node_id="replica1",
+            cluster_members=["node1", "node2", "node3"],
+            observers=["replica1", "replica2", "replica3", "replica4"],
+        )
+        assert settings.quorum_size == 2
+        assert settings.observers == ("replica1", "replica2", "replica3", "replica4")
+        assert settings.is_observer
+
+    def test_reject_observer_that_votes(self):
+        """Test that a node cannot be both a voter and an observer."""
+        with pytest.raises(LiteFSConfigError, match="also cluster_members"):
+            RaftSettings(
+                node_id="node1",
+                cluster_members=["node1", "node2", "node3"],
+                observers=["node3"],
+            )
+
     def test_reject_empty_node_id(self):
         """Test that empty node_id is rejected."""
         with pytest.raises(LiteFSConfigError, match="node_id cannot be empty"):
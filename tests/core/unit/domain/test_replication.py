@@ -0,0 +1,111 @@
+"""Unit tests for replication position and lag value objects."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import (
+    ReplicationLag,
+    ReplicationPosition,
+    format_txid,
+    parse_txid,
+)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ReplicationPosition")
+class TestReplicationPosition:
+    """Test ReplicationPosition value object."""
+
+    def test_parse_litefs_position_format(self):
+        """Test parsing the TXID/CHECKSUM hex format written by LiteFS."""
+        position = ReplicationPosition.parse("0000000000000003/f8c4d8c1bbcbd4a2\n")
+
+        assert position.txid == 3
+        assert position.checksum == "f8c4d8c1bbcbd4a2"
+
+    def test_parse_normalizes_checksum_case(self):
+        """Test that the checksum is stored lowercase."""
+        position = ReplicationPosition.parse("00000000000000FF/ABCDEF0123456789")
+
+        assert position.txid == 255
+        assert position.checksum == "abcdef0123456789"
+
+    @pytest.mark.parametrize(
+        "content",
+        ["", "0000000000000003", "/f8c4d8c1bbcbd4a2", "0000000000000003/", "xyz/abc"],
+    )
+    def test_parse_rejects_malformed_content(self, content):
+        """Test that malformed position content raises LiteFSConfigError."""
+        with pytest.raises(LiteFSConfigError, match="invalid replication position"):
+            ReplicationPosition.parse(content)
+
+    def test_negative_txid_rejected(self):
+        """Test that a negative TXID is rejected."""
+        with pytest.raises(LiteFSConfigError, match="txid cannot be negative"):
+            ReplicationPosition(txid=-1, checksum="0")
+
+    def test_format_txid_matches_litefs(self):
+        """Test that format_txid produces 16-digit zero-padded hex."""
+        assert ReplicationPosition(txid=3, checksum="0").format_txid() == (
+            "0000000000000003"
+        )
+
+    def test_is_frozen(self):
+        """Test that ReplicationPosition is immutable."""
+        position = ReplicationPosition(txid=1, checksum="0")
+        with pytest.raises(AttributeError):
+            position.txid = 2  # type: ignore[misc]
+
+    @given(txid=st.integers(min_value=0, max_value=2**64 - 1))
+    def test_format_and_parse_round_trip(self, txid):
+        """PBT: formatting then parsing a position preserves the TXID."""
+        position = ReplicationPosition(txid=txid, checksum="f8c4d8c1bbcbd4a2")
+        content = f"{position.format_txid()}/{position.checksum}"
+
+        assert ReplicationPosition.parse(content) == position
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ReplicationLag")
+class TestReplicationLag:
+    """Test ReplicationLag value object."""
+
+    def test_defaults_are_unknown(self):
+        """Test that a default lag is unknown."""
+        lag = ReplicationLag()
+
+        assert lag.local_txid is None
+        assert lag.primary_txid is None
+        assert lag.seconds_lag is None
+        assert lag.is_known is False
+
+    def test_is_known_when_txid_lag_set(self):
+        """Test that is_known reflects whether txid_lag is set."""
+        lag = ReplicationLag(local_txid=5, primary_txid=8, txid_lag=3)
+
+        assert lag.is_known is True
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ReplicationPosition")
+class TestTxidTokens:
+    """Test TXID token formatting and parsing."""
+
+    def test_parse_padded_and_unpadded(self):
+        """Test parsing TXIDs with and without zero padding."""
+        assert parse_txid("000000000000002a") == 42
+        assert parse_txid("2A") == 42
+
+    @pytest.mark.parametrize(
+        "value", ["", "0x2a", "-1", "+1", "1_0", "zz", "00000000000000001"]
+    )
+    def test_parse_rejects_invalid_tokens(self, value):
+        """Test that non-hex or oversized tokens are rejected."""
+        with pytest.raises(LiteFSConfigError, match="invalid txid"):
+            parse_txid(value)
+
+    @given(txid=st.integers(min_value=0, max_value=2**64 - 1))
+    def test_round_trip(self, txid):
+        """PBT: parse_txid inverts format_txid."""
+        assert parse_txid(format_txid(txid)) == txid
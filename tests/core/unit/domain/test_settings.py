@@ -4,7 +4,18 @@ import pytest
 from pathlib import Path
 from hypothesis import given, strategies as st
 
-from litefs.domain.settings import LiteFSSettings, LiteFSConfigError, ForwardingSettings
+from litefs.domain.settings import (
+    LiteFSSettings,
+    LiteFSConfigError,
+    RaftConfig,
+    ForwardingSettings,
+    ReplicationSettings,
+    ResponseCacheSettings,
+    ChangeBusSettings,
+    HealthSnapshotSettings,
+    HealthProbeSettings,
+)
+from litefs.domain.health import FREE_DISK, QUERY_LATENCY, ProbeThresholds
 
 
 @pytest.mark.tier(1)
@@ -200,6 +211,160 @@ class TestLiteFSSettings:
                 raft_peers=[],
             )
 
+    @pytest.mark.parametrize(
+        ("cluster_metadata", "forwarding_url", "match"),
+        [
+            (False, "http://node1:8000", "requires raft_cluster_metadata"),
+            (True, "node1:8000", "full URL"),
+        ],
+    )
+    def test_raft_forwarding_url_validated(
+        self, cluster_metadata, forwarding_url, match
+    ):
+        """Test that the forwarding URL needs metadata and a scheme."""
+        with pytest.raises(LiteFSConfigError, match=match):
+            LiteFSSettings(
+                mount_path="/litefs",
+                data_path="/var/lib/litefs",
+                database_name="db.sqlite3",
+                leader_election="raft",
+                proxy_addr=":8080",
+                enabled=True,
+                retention="1h",
+                raft_self_addr="127.0.0.1:20202",
+                raft_peers=["127.0.0.2:20202"],
+                raft_cluster_metadata=cluster_metadata,
+                raft_forwarding_url=forwarding_url,
+            )
+
+    @pytest.mark.parametrize(
+        ("observers", "match"),
+        [
+            (["127.0.0.3:20202", "127.0.0.3:20202"], "duplicates"),
+            (["  "], "empty"),
+            (["127.0.0.2:20202"], "also in raft_peers"),
+        ],
+    )
+    def test_raft_observers_validated(self, observers, match):
+        """Test that observers are distinct addresses outside raft_peers."""
+        with pytest.raises(LiteFSConfigError, match=match):
+            LiteFSSettings(
+                mount_path="/litefs",
+                data_path="/var/lib/litefs",
+                database_name="db.sqlite3",
+                leader_election="raft",
+                proxy_addr=":8080",
+                enabled=True,
+                retention="1h",
+                raft_self_addr="127.0.0.1:20202",
+                raft_peers=["127.0.0.2:20202"],
+                raft_observers=observers,
+            )
+
+    @pytest.mark.parametrize(
+        ("dynamic", "membership_file", "match"),
+        [
+            (False, "/data/members.json", "requires raft_dynamic_membership"),
+            (True, "members.json", "absolute path"),
+        ],
+    )
+    def test_raft_membership_file_validated(self, dynamic, membership_file, match):
+        """Test that the membership file is absolute and needs dynamic membership."""
+        with pytest.raises(LiteFSConfigError, match=match):
+            LiteFSSettings(
+                mount_path="/litefs",
+                data_path="/var/lib/litefs",
+                database_name="db.sqlite3",
+                leader_election="raft",
+                proxy_addr=":8080",
+                enabled=True,
+                retention="1h",
+                raft_self_addr="127.0.0.1:20202",
+                raft_peers=["127.0.0.2:20202"],
+                raft_dynamic_membership=dynamic,
+                raft_membership_file=membership_file,
+            )
+
+    @pytest.mark.parametrize(
+        ("priorities", "self_addr", "rebalance_after", "match"),
+        [
+            ({"127.0.0.9:20202": 1}, "127.0.0.1:20202", 30.0, "not Raft voters"),
+            ({"127.0.0.3:20202": 1}, "127.0.0.3:20202", 30.0, "not Raft voters"),
+            ({"127.0.0.2:20202": 1.5}, "127.0.0.1:20202", 30.0, "integer"),
+            ({"127.0.0.2:20202": 1}, "127.0.0.1:20202", 0.0, "raft_rebalance_after"),
+        ],
+    )
+    def test_raft_priorities_validated(
+        self, priorities, self_addr, rebalance_after, match
+    ):
+        """Test that priorities are integers of voters, not of observers."""
+        with pytest.raises(LiteFSConfigError, match=match):
+            LiteFSSettings(
+                mount_path="/litefs",
+                data_path="/var/lib/litefs",
+                database_name="db.sqlite3",
+                leader_election="raft",
+                proxy_addr=":8080",
+                enabled=True,
+                retention="1h",
+                raft_self_addr=self_addr,
+                raft_peers=["127.0.0.2:20202"],
+                raft_observers=["127.0.0.3:20202"],
+                raft_priorities=priorities,
+                raft_rebalance_after=rebalance_after,
+            )
+
+    @pytest.mark.parametrize(
+        ("timing", "match"),
+        [
+            ({"raft_heartbeat_interval": 0.0}, "raft_heartbeat_interval"),
+            ({"raft_election_timeout": 1.0}, "greater than raft_heartbeat"),
+            (
+                {"raft_adaptive_timeouts": True, "raft_min_heartbeat_interval": 2.0},
+                "raft_min_heartbeat_interval",
+            ),
+            (
+                {"raft_adaptive_timeouts": True, "raft_min_election_timeout": 6.0},
+                "at most raft_election_timeout",
+            ),
+            (
+                {"raft_adaptive_timeouts": True, "raft_min_election_timeout": 0.09},
+                "more than 3",
+            ),
+        ],
+    )
+    def test_raft_timing_validated(self, timing, match):
+        """Test that adaptive timing bounds fit the configured timing."""
+        with pytest.raises(LiteFSConfigError, match=match):
+            LiteFSSettings(
+                mount_path="/litefs",
+                data_path="/var/lib/litefs",
+                database_name="db.sqlite3",
+                leader_election="raft",
+                proxy_addr=":8080",
+                enabled=True,
+                retention="1h",
+                raft_self_addr="127.0.0.1:20202",
+                raft_peers=["127.0.0.2:20202"],
+                **timing,
+            )
+
+    def test_raft_config_priority(self):
+        """Test that RaftConfig reports this node's priority, 0 by default."""
+        config = RaftConfig(
+            self_addr="127.0.0.1:20202",
+            peers=["127.0.0.2:20202"],
+            priorities={"127.0.0.2:20202": 2},
+        )
+
+        assert config.priority == 0
+        with pytest.raises(LiteFSConfigError, match="not Raft voters"):
+            RaftConfig(
+                self_addr="127.0.0.1:20202",
+                peers=["127.0.0.2:20202"],
+                priorities={"127.0.0.3:20202": 1},
+            )
+
     def test_static_ignores_raft_fields(self):
         """Test that static leader election ignores raft_self_addr and raft_peers."""
         # Should not raise error even with None values
@@ -295,9 +460,7 @@ class TestDatabaseNameValidationPBT:
         )
         assert settings.database_name == database_name
 
-    @given(
-        whitespace=st.sampled_from([" ", "  ", "   ", "\t", " \t ", "\t\t"])
-    )
+    @given(whitespace=st.sampled_from([" ", "  ", "   ", "\t", " \t ", "\t\t"]))
     def test_whitespace_only_database_names_rejected(self, whitespace):
         """PBT: Whitespace-only database names should be rejected."""
         with pytest.raises(LiteFSConfigError):
@@ -346,9 +509,7 @@ class TestRaftConfigValidationPBT:
         assert settings.raft_self_addr == self_addr
         assert settings.raft_peers == peers
 
-    @given(
-        num_peers=st.integers(min_value=1, max_value=10)
-    )
+    @given(num_peers=st.integers(min_value=1, max_value=10))
     def test_raft_missing_self_addr_pbt(self, num_peers):
         """PBT: Missing raft_self_addr in raft mode should be rejected."""
         peers = [f"node{i}:20202" for i in range(1, num_peers + 1)]
@@ -570,5 +731,159 @@ class TestForwardingField:
         assert settings.proxy.addr == ":8080"
 
 
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ReplicationSettings")
+class TestReplicationSettings:
+    """Test ReplicationSettings value object and LiteFSSettings field."""
+
+    def test_defaults(self) -> None:
+        """Test default replication lag thresholds."""
+        settings = ReplicationSettings()
+
+        assert settings.max_lag_txids == 1000
+        assert settings.max_lag_seconds == 30.0
+        assert settings.rate_window_seconds == 60.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_lag_txids": 0},
+            {"max_lag_seconds": 0.0},
+            {"rate_window_seconds": -1.0},
+        ],
+    )
+    def test_reject_non_positive_values(self, kwargs) -> None:
+        """Test that non-positive thresholds are rejected."""
+        with pytest.raises(LiteFSConfigError):
+            ReplicationSettings(**kwargs)
+
+    def test_replication_defaults_to_none(self) -> None:
+        """Test that replication defaults to None on LiteFSSettings."""
+        settings = LiteFSSettings(
+            mount_path="/litefs",
+            data_path="/var/lib/litefs",
+            database_name="db.sqlite3",
+            leader_election="static",
+            proxy_addr=":8080",
+            enabled=True,
+            retention="1h",
+        )
+        assert settings.replication is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ResponseCacheSettings")
+class TestResponseCacheSettings:
+    """Test ResponseCacheSettings value object."""
+
+    def test_defaults(self) -> None:
+        """Test default response cache configuration."""
+        settings = ResponseCacheSettings()
+
+        assert settings.enabled is False
+        assert settings.max_bytes == 32 * 1024 * 1024
+        assert settings.max_entry_bytes == 1024 * 1024
+        assert settings.vary_headers == ("Accept", "Accept-Encoding")
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_bytes": 0},
+            {"max_entry_bytes": 0},
+            {"max_bytes": 100, "max_entry_bytes": 200},
+        ],
+    )
+    def test_reject_invalid_sizes(self, kwargs) -> None:
+        """Test that invalid memory limits are rejected."""
+        with pytest.raises(LiteFSConfigError):
+            ResponseCacheSettings(**kwargs)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ChangeBusSettings")
+class TestChangeBusSettings:
+    """Test ChangeBusSettings value object."""
+
+    def test_defaults(self) -> None:
+        """Test default change bus configuration."""
+        settings = ChangeBusSettings()
+
+        assert settings.enabled is False
+        assert settings.poll_interval == 0.5
+        assert settings.min_interval == 0.1
+        assert settings.use_inotify is True
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"poll_interval": 0}, {"poll_interval": -1.0}, {"min_interval": -0.1}],
+    )
+    def test_reject_invalid_intervals(self, kwargs) -> None:
+        """Test that invalid intervals are rejected."""
+        with pytest.raises(LiteFSConfigError):
+            ChangeBusSettings(**kwargs)
+
+    def test_zero_min_interval_allowed(self) -> None:
+        """Test that coalescing can be disabled."""
+        assert ChangeBusSettings(min_interval=0).min_interval == 0
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.HealthSnapshotSettings")
+class TestHealthSnapshotSettings:
+    """Test HealthSnapshotSettings value object."""
+
+    def test_defaults(self) -> None:
+        """Test default health snapshot configuration."""
+        settings = HealthSnapshotSettings()
+
+        assert settings.enabled is False
+        assert settings.interval == 1.0
+        assert settings.max_age == 10.0
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"interval": 0}, {"interval": -1.0}, {"interval": 5.0, "max_age": 2.0}],
+    )
+    def test_reject_invalid_intervals(self, kwargs) -> None:
+        """Test that invalid interval and max_age values are rejected."""
+        with pytest.raises(LiteFSConfigError):
+            HealthSnapshotSettings(**kwargs)
 
 
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.HealthProbeSettings")
+class TestHealthProbeSettings:
+    """Test HealthProbeSettings value object."""
+
+    def test_defaults(self) -> None:
+        """Test default health probe configuration."""
+        settings = HealthProbeSettings()
+
+        assert settings.enabled is False
+        assert settings.interval == 5.0
+        assert settings.failure_threshold == 3
+        assert settings.recovery_threshold == 2
+        assert settings.probe_thresholds(FREE_DISK).higher_is_worse is False
+
+    def test_thresholds_override_and_disable(self) -> None:
+        """Test that listed probes override or disable the defaults."""
+        settings = HealthProbeSettings(
+            thresholds={QUERY_LATENCY: ProbeThresholds(degraded=0.5), FREE_DISK: None}
+        )
+
+        assert settings.probe_thresholds(QUERY_LATENCY) == ProbeThresholds(degraded=0.5)
+        assert settings.probe_thresholds(FREE_DISK) is None
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"interval": 0},
+            {"failure_threshold": 0},
+            {"recovery_threshold": 0},
+            {"thresholds": {"cpu": ProbeThresholds(degraded=0.5)}},
+        ],
+    )
+    def test_reject_invalid_values(self, kwargs) -> None:
+        """Test that invalid schedules and unknown probes are rejected."""
+        with pytest.raises(LiteFSConfigError):
+            HealthProbeSettings(**kwargs)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from litefs.domain.exceptions import LiteFSConfigError
 from litefs.domain.settings import LiteFSSettings
 
 
@@ -45,3 +46,36 @@ class TestLiteFSSettingsMetrics:
         """metrics_prefix can be set to a custom value."""
         settings = create_minimal_settings(metrics_prefix="myapp_litefs")
         assert settings.metrics_prefix == "myapp_litefs"
+
+    def test_metrics_histogram_buckets_defaults_to_none(self) -> None:
+        """metrics_histogram_buckets should default to None."""
+        settings = create_minimal_settings()
+        assert settings.metrics_histogram_buckets is None
+
+    def test_metrics_histogram_buckets_normalized_to_float_tuples(self) -> None:
+        """Bucket layouts should be stored as tuples of floats."""
+        settings = create_minimal_settings(
+            metrics_histogram_buckets={"default": [1, 2.5, 10]}
+        )
+        assert settings.metrics_histogram_buckets == {"default": (1.0, 2.5, 10.0)}
+
+    @pytest.mark.parametrize(
+        "buckets",
+        [[], [0.0, 1.0], [-1.0], [0.5, 0.5], [2.0, 1.0], ["fast"], None],
+    )
+    def test_invalid_metrics_histogram_buckets_rejected(self, buckets) -> None:
+        """Empty, non-positive, unsorted or non-numeric layouts are invalid."""
+        with pytest.raises(LiteFSConfigError, match="metrics_histogram_buckets"):
+            create_minimal_settings(
+                metrics_histogram_buckets={"statement_duration_seconds": buckets}
+            )
+
+    def test_metrics_exposition_ttl_defaults_to_one_second(self) -> None:
+        """metrics_exposition_ttl should default to 1 second."""
+        settings = create_minimal_settings()
+        assert settings.metrics_exposition_ttl == 1.0
+
+    def test_negative_metrics_exposition_ttl_rejected(self) -> None:
+        """A negative exposition TTL is invalid."""
+        with pytest.raises(LiteFSConfigError, match="metrics_exposition_ttl"):
+            create_minimal_settings(metrics_exposition_ttl=-1.0)
@@ -247,6 +247,28 @@ class TestRaftClusterState:
         assert cluster.has_single_leader() is True
         assert len(cluster.get_replica_nodes()) == 0
 
+    def test_get_leader_txid_single_leader(self) -> None:
+        """Test that the leader's TXID is returned with a single leader."""
+        cluster = RaftClusterState(
+            nodes=[
+                RaftNodeState(node_id="node1", is_leader=True, txid=42),
+                RaftNodeState(node_id="node2", is_leader=False, txid=40),
+            ]
+        )
+
+        assert cluster.get_leader_txid() == 42
+
+    def test_get_leader_txid_none_during_split_brain(self) -> None:
+        """Test that no leader TXID is returned with multiple leaders."""
+        cluster = RaftClusterState(
+            nodes=[
+                RaftNodeState(node_id="node1", is_leader=True, txid=42),
+                RaftNodeState(node_id="node2", is_leader=True, txid=40),
+            ]
+        )
+
+        assert cluster.get_leader_txid() is None
+
 
 @pytest.mark.tier(3)
 @pytest.mark.tra("Domain.Invariant")
@@ -0,0 +1,80 @@
+"""Unit tests for the W3C trace context value object."""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+from litefs.domain.tracing import TraceContext
+
+TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.TraceContext")
+class TestTraceContext:
+    """Test TraceContext parsing, formatting and generation."""
+
+    def test_parse_traceparent(self):
+        """Test parsing a version 00 traceparent header."""
+        context = TraceContext.from_traceparent(TRACEPARENT)
+
+        assert context == TraceContext(
+            trace_id="4bf92f3577b34da6a3ce929d0e0e4736",
+            span_id="00f067aa0ba902b7",
+            sampled=True,
+        )
+
+    def test_parse_unsampled_flag(self):
+        """Test that the sampled flag is read from the trace flags."""
+        context = TraceContext.from_traceparent(TRACEPARENT[:-2] + "00")
+
+        assert context is not None
+        assert not context.sampled
+
+    def test_parse_future_version_prefix(self):
+        """Test that future versions are parsed by their 00 prefix."""
+        context = TraceContext.from_traceparent("cc" + TRACEPARENT[2:] + "-extra")
+
+        assert context is not None
+        assert context.span_id == "00f067aa0ba902b7"
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "",
+            "garbage",
+            TRACEPARENT.upper(),
+            TRACEPARENT + "-extra",
+            "ff" + TRACEPARENT[2:],
+            "00-00000000000000000000000000000000-00f067aa0ba902b7-01",
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-0000000000000000-01",
+        ],
+    )
+    def test_invalid_traceparent_is_ignored(self, value):
+        """Test that invalid headers are ignored rather than rejected."""
+        assert TraceContext.from_traceparent(value) is None
+
+    def test_generate_child_keeps_trace(self):
+        """Test that a child span joins its parent's trace."""
+        parent = TraceContext.from_traceparent(TRACEPARENT[:-2] + "00")
+
+        child = TraceContext.generate(parent)
+
+        assert child.trace_id == parent.trace_id
+        assert child.span_id != parent.span_id
+        assert not child.sampled
+
+    def test_generate_root_starts_sampled_trace(self):
+        """Test that a span without parent starts a new sampled trace."""
+        context = TraceContext.generate()
+
+        assert len(context.trace_id) == 32
+        assert len(context.span_id) == 16
+        assert context.sampled
+
+    @given(sampled=st.booleans())
+    def test_round_trip(self, sampled):
+        """Test that formatting and parsing a generated context round-trips."""
+        context = TraceContext.generate()
+        context = TraceContext(context.trace_id, context.span_id, sampled)
+
+        assert TraceContext.from_traceparent(context.to_traceparent()) == context
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from litefs.domain.health import HealthStatus
+from litefs.domain.replication import ReplicationLag
 
 
 class FakeHealthChecker:
@@ -25,6 +26,9 @@ class FakeHealthChecker:
         """Initialize with healthy status."""
         self._health_status: HealthStatus = HealthStatus(state="healthy")
         self._error: str | None = None
+        self.last_replication_lag: ReplicationLag | None = None
+        self.replica_lagging = False
+        self.failing_probes: tuple[str, ...] = ()
 
     def check_health(self) -> HealthStatus:
         """Return configured health status or raise configured error.
@@ -3,8 +3,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
 
+from litefs.adapters.metrics_port import NoOpMetricsAdapter
 from litefs.factories import (
+    create_metrics_adapter,
     create_raft_leader_election,
+    create_raft_membership_client,
     PyLeaderNotInstalledError,
 )
 from litefs.domain.settings import LiteFSSettings
@@ -143,6 +146,203 @@ class TestCreateRaftLeaderElection:
         with pytest.raises(ValueError, match="raft_peers is required"):
             create_raft_leader_election(settings=settings, node_id="node1")
 
+    def test_observer_node_joins_voters_as_observer(self) -> None:
+        """An observer's peers are the voters; observers are passed apart."""
+        settings = make_raft_settings(raft_self_addr="replica1:20202")
+        settings.raft_observers = ["replica1:20202", "replica2:20202"]
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="replica1")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="replica1",
+            cluster_members=["node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+            observers=["replica1:20202", "replica2:20202"],
+        )
+
+    def test_passes_cluster_metadata_settings(self) -> None:
+        """Factory enables replicated metadata with the forwarding URL."""
+        settings = make_raft_settings()
+        settings.raft_cluster_metadata = True
+        settings.raft_forwarding_url = "http://node1:8000"
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+            replicate_metadata=True,
+            forwarding_url="http://node1:8000",
+        )
+
+    def test_passes_dynamic_membership_settings(self) -> None:
+        """Factory enables dynamic membership with the membership file."""
+        settings = make_raft_settings()
+        settings.raft_dynamic_membership = True
+        settings.raft_membership_file = "/data/members.json"
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+            dynamic_membership=True,
+            membership_file="/data/members.json",
+        )
+
+    def test_passes_leader_priorities(self) -> None:
+        """Factory passes priorities and the rebalancing window."""
+        settings = make_raft_settings()
+        settings.raft_priorities = {"node1:20202": 2, "node2:20202": 2}
+        settings.raft_rebalance_after = 60.0
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+            priorities={"node1:20202": 2, "node2:20202": 2},
+            rebalance_after=60.0,
+        )
+
+    def test_passes_adaptive_timing(self) -> None:
+        """Factory uses the configured timing as bounds of adaptive timeouts."""
+        settings = make_raft_settings()
+        settings.raft_election_timeout = 3.0
+        settings.raft_heartbeat_interval = 0.5
+        settings.raft_adaptive_timeouts = True
+        settings.raft_min_election_timeout = 0.2
+        settings.raft_min_heartbeat_interval = 0.05
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=3.0,
+            heartbeat_interval=0.5,
+            adaptive_timeouts=True,
+            min_election_timeout=0.2,
+            min_heartbeat_interval=0.05,
+        )
+
+    def test_passes_disabled_leader_protection(self) -> None:
+        """Factory disables pre-vote and check-quorum only when asked to."""
+        settings = make_raft_settings()
+        settings.raft_pre_vote = False
+        settings.raft_check_quorum = False
+        mock_raft_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftLeaderElection=mock_raft_class)},
+        ):
+            create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+        mock_raft_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+            pre_vote=False,
+            check_quorum=False,
+        )
+
+    def test_creates_async_election_on_event_loop(self) -> None:
+        """Factory runs the node on the event loop only when asked to."""
+        settings = make_raft_settings()
+        settings.raft_event_loop = True
+        mock_raft_class = MagicMock()
+        mock_async_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {
+                "py_leader": MagicMock(
+                    RaftLeaderElection=mock_raft_class,
+                    AsyncRaftLeaderElection=mock_async_class,
+                )
+            },
+        ):
+            result = create_raft_leader_election(
+                settings=settings, node_id="node1:20202"
+            )
+
+        assert result is mock_async_class.return_value
+        mock_raft_class.assert_not_called()
+        mock_async_class.assert_called_once_with(
+            node_id="node1:20202",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            election_timeout=5.0,
+            heartbeat_interval=1.0,
+        )
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant")
+class TestCreateRaftMembershipClient:
+    """Tests for create_raft_membership_client factory function."""
+
+    @pytest.mark.parametrize(
+        ("self_addr", "observers", "node"),
+        [
+            ("node1:20202", None, "node1:20202"),
+            ("replica1:20202", ["replica1:20202"], "node2:20202"),
+        ],
+    )
+    def test_connects_to_a_voter(self, self_addr, observers, node) -> None:
+        """The client talks to this node, or to a voter from an observer."""
+        settings = make_raft_settings(raft_self_addr=self_addr)
+        settings.raft_observers = observers
+        settings.raft_dynamic_membership = True
+        mock_client_class = MagicMock()
+
+        with patch.dict(
+            "sys.modules",
+            {"py_leader": MagicMock(RaftMembershipClient=mock_client_class)},
+        ):
+            result = create_raft_membership_client(settings, timeout=3.0)
+
+        mock_client_class.assert_called_once_with(node, timeout=3.0)
+        assert result is mock_client_class.return_value
+
+    def test_raises_error_without_dynamic_membership(self) -> None:
+        """Factory raises ValueError when dynamic membership is disabled."""
+        with pytest.raises(ValueError, match="raft_dynamic_membership"):
+            create_raft_membership_client(make_raft_settings())
+
 
 @pytest.mark.tier(1)
 @pytest.mark.tra("Domain.Invariant")
@@ -168,3 +368,36 @@ class TestPyLeaderNotInstalledError:
         with patch.dict("sys.modules", {"py_leader": None}):
             with pytest.raises(PyLeaderNotInstalledError):
                 create_raft_leader_election(settings=settings, node_id="node1:20202")
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Metrics")
+class TestCreateMetricsAdapter:
+    """Test create_metrics_adapter factory function."""
+
+    def test_returns_noop_when_metrics_disabled(self) -> None:
+        """Test that disabled metrics use the no-op adapter."""
+        assert isinstance(
+            create_metrics_adapter(make_raft_settings()), NoOpMetricsAdapter
+        )
+
+    def test_shares_prometheus_adapter_per_prefix(self) -> None:
+        """Test that settings with the same prefix share one adapter."""
+        pytest.importorskip("prometheus_client")
+        import uuid
+
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        prefix = f"test_{uuid.uuid4().hex[:8]}"
+        first_settings = make_raft_settings()
+        first_settings.metrics_enabled = True
+        first_settings.metrics_prefix = prefix
+        second_settings = make_raft_settings()
+        second_settings.metrics_enabled = True
+        second_settings.metrics_prefix = prefix
+
+        first = create_metrics_adapter(first_settings)
+        second = create_metrics_adapter(second_settings)
+
+        assert isinstance(first, PrometheusMetricsAdapter)
+        assert first is second
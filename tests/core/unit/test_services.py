@@ -0,0 +1,443 @@
+"""Unit tests for the LiteFSServices container."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.adapters.metrics_port import NoOpMetricsAdapter
+from litefs.adapters.static_leader_election import StaticLeaderElection
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.settings import (
+    HealthProbeSettings,
+    LiteFSSettings,
+    StaticLeaderConfig,
+)
+from litefs.services import LiteFSServices
+from litefs.usecases.failover_coordinator import NodeState
+
+from .adapters.adapter_fakes import FakeRaftLeaderElection
+
+
+class FakeNodeIDResolver:
+    """Node ID resolver returning a fixed ID and counting calls."""
+
+    def __init__(self, node_id: str = "node1") -> None:
+        """Initialize with the node ID to return."""
+        self.node_id = node_id
+        self.calls = 0
+
+    def resolve_node_id(self) -> str:
+        """Return the configured node ID."""
+        self.calls += 1
+        return self.node_id
+
+
+class DestroyableRaftElection(FakeRaftLeaderElection):
+    """Fake Raft election recording destroy() calls."""
+
+    def __init__(self, **kwargs) -> None:
+        """Initialize as not destroyed."""
+        super().__init__(**kwargs)
+        self.destroyed = False
+
+    def destroy(self) -> None:
+        """Record the shutdown."""
+        self.destroyed = True
+
+
+class FencedRaftElection(DestroyableRaftElection):
+    """Fake Raft election exposing a leader epoch."""
+
+    def get_leader_epoch(self) -> int | None:
+        """Return epoch 1 while leading."""
+        return 1 if self.is_leader_elected() else None
+
+
+class TimedRaftElection(DestroyableRaftElection):
+    """Fake Raft election reporting heartbeat round trips and timing."""
+
+    def __init__(self, **kwargs) -> None:
+        """Initialize without listeners."""
+        super().__init__(**kwargs)
+        self.rtt_listeners: list = []
+        self.timing_listeners: list = []
+
+    def add_rtt_listener(self, callback) -> None:
+        """Register a round-trip listener."""
+        self.rtt_listeners.append(callback)
+
+    def add_timing_listener(self, callback) -> None:
+        """Register a timing listener."""
+        self.timing_listeners.append(callback)
+
+
+def make_settings(leader_election: str = "static") -> LiteFSSettings:
+    """Create settings for static or Raft leader election."""
+    return LiteFSSettings(
+        mount_path="/litefs",
+        data_path="/data",
+        database_name="app.db",
+        leader_election=leader_election,
+        proxy_addr="localhost:8080",
+        enabled=True,
+        retention="24h",
+        static_leader_config=(
+            StaticLeaderConfig(primary_hostname="node1")
+            if leader_election == "static"
+            else None
+        ),
+        raft_self_addr="node1:20202" if leader_election == "raft" else None,
+        raft_peers=["node2:20202"] if leader_election == "raft" else None,
+    )
+
+
+def make_raft_services(election: FakeRaftLeaderElection) -> LiteFSServices:
+    """Create a Raft-mode container whose factory counts created elections."""
+    created: list[FakeRaftLeaderElection] = []
+
+    def factory(settings: LiteFSSettings, node_id: str) -> FakeRaftLeaderElection:
+        created.append(election)
+        return election
+
+    services = LiteFSServices(
+        make_settings("raft"),
+        node_id_resolver=FakeNodeIDResolver("node1:20202"),
+        leader_election_factory=factory,
+    )
+    services.created_elections = created  # type: ignore[attr-defined]
+    return services
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesSharing:
+    """Test that members are built once and shared."""
+
+    def test_members_are_reused(self) -> None:
+        """Test that repeated accesses return the same objects."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert services.readiness_checker is services.readiness_checker
+        assert services.health_checker is services.health_checker
+        assert services.failover_coordinator is services.failover_coordinator
+
+    def test_members_share_dependencies(self) -> None:
+        """Test that checkers are built on the same detector and election."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        health_checker = services.health_checker
+
+        assert health_checker.primary_detector is services.primary_detector
+        assert health_checker._lag_checker is services.replication_lag_checker
+        assert services.readiness_checker._health_checker is health_checker
+        assert services.failover_coordinator.leader_election is services.leader_election
+
+    def test_node_id_resolved_once(self) -> None:
+        """Test that the node ID is resolved on first use only."""
+        resolver = FakeNodeIDResolver()
+        services = LiteFSServices(make_settings(), node_id_resolver=resolver)
+
+        assert services.leader_election is not None
+        assert services.node_id is not None
+
+        assert resolver.calls == 1
+
+    def test_nothing_built_until_used(self) -> None:
+        """Test that creating the container has no side effects."""
+        resolver = FakeNodeIDResolver()
+        LiteFSServices(make_settings("raft"), node_id_resolver=resolver)
+
+        assert resolver.calls == 0
+
+    def test_concurrent_first_access_builds_once(self) -> None:
+        """Test that racing threads get the same election."""
+        election = DestroyableRaftElection()
+        services = make_raft_services(election)
+        barrier = threading.Barrier(8)
+        results: list[object] = []
+
+        def access() -> None:
+            barrier.wait()
+            results.append(services.leader_election)
+
+        threads = [threading.Thread(target=access) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert services.created_elections == [election]  # type: ignore[attr-defined]
+        assert all(result is election for result in results)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesElection:
+    """Test leader election selection."""
+
+    def test_static_mode_uses_static_election(self) -> None:
+        """Test that static mode elects the configured primary."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert isinstance(services.leader_election, StaticLeaderElection)
+        assert services.failover_coordinator.state == NodeState.PRIMARY
+        assert services.split_brain_detector is None
+
+    def test_static_mode_without_config_rejected(self) -> None:
+        """Test that a missing static leader config is a config error."""
+        settings = make_settings()
+        object.__setattr__(settings, "static_leader_config", None)
+        services = LiteFSServices(settings, node_id_resolver=FakeNodeIDResolver())
+
+        with pytest.raises(LiteFSConfigError):
+            _ = services.leader_election
+
+    def test_raft_mode_uses_factory(self) -> None:
+        """Test that Raft mode creates the election through the factory."""
+        election = DestroyableRaftElection(is_leader=True)
+        services = make_raft_services(election)
+
+        assert services.leader_election is election
+        assert services.split_brain_detector is not None
+        monitor = services.cluster_state_monitor
+        assert monitor is not None and monitor.is_running
+        assert services.replication_lag_checker._cluster_state_monitor is monitor
+
+    def test_close_stops_cluster_state_monitor(self) -> None:
+        """Test that background cluster state queries stop on close."""
+        services = make_raft_services(DestroyableRaftElection(is_leader=True))
+        monitor = services.cluster_state_monitor
+        assert monitor is not None
+
+        services.close()
+
+        assert not monitor.is_running
+
+    def test_coordinator_follows_election_after_monitor_round(self) -> None:
+        """Test that the coordinator syncs in the background, not on reads."""
+        election = DestroyableRaftElection(is_leader=True)
+        services = make_raft_services(election)
+        coordinator = services.failover_coordinator
+        monitor = services.cluster_state_monitor
+        assert monitor is not None
+        monitor.stop(timeout=1.0)
+
+        election.set_leader(False)
+        assert services.failover_coordinator.state == NodeState.PRIMARY
+
+        monitor.run_once()
+
+        assert coordinator.state == NodeState.REPLICA
+        services.close()
+
+    def test_static_mode_has_no_cluster_state_monitor(self) -> None:
+        """Test that static elections query no peers."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert services.cluster_state_monitor is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesMetrics:
+    """Test the shared metrics adapter."""
+
+    def test_metrics_disabled_by_default(self) -> None:
+        """Test that members emit to a no-op adapter unless enabled."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert isinstance(services.metrics, NoOpMetricsAdapter)
+
+    def test_members_share_metrics_adapter(self) -> None:
+        """Test that checkers emit to the container's adapter."""
+        services = make_raft_services(DestroyableRaftElection(is_leader=True))
+
+        assert services.health_checker._metrics is services.metrics
+        assert services.split_brain_detector._metrics is services.metrics
+
+    def test_raft_timing_exported(self) -> None:
+        """Test that heartbeat round trips and timing changes reach metrics."""
+        election = TimedRaftElection(is_leader=True)
+        services = make_raft_services(election)
+        metrics = FakeMetricsAdapter()
+        services._members["metrics"] = metrics
+
+        assert services.leader_election is election
+        assert metrics.current_raft_timing == (1.0, 5.0)
+
+        for callback in election.rtt_listeners:
+            callback("node2:20202", 0.002)
+        for callback in election.timing_listeners:
+            callback(0.03, 0.3)
+
+        assert metrics.histogram_values(
+            "raft_peer_rtt_seconds", peer="node2:20202"
+        ) == [0.002]
+        assert metrics.current_raft_timing == (0.03, 0.3)
+
+    def test_metrics_exposition_none_when_disabled(self) -> None:
+        """Test that /metrics has nothing to render unless enabled."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert services.metrics_exposition is None
+
+    def test_metrics_exposition_uses_configured_ttl(self) -> None:
+        """Test that the exposition is built once with the settings TTL."""
+        pytest.importorskip("prometheus_client")
+        settings = make_settings()
+        settings.metrics_enabled = True
+        settings.metrics_exposition_ttl = 2.5
+        services = LiteFSServices(settings, node_id_resolver=FakeNodeIDResolver())
+
+        exposition = services.metrics_exposition
+
+        assert exposition is services.metrics_exposition
+        assert exposition._ttl == 2.5
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesEpochFence:
+    """Test epoch fencing and background split-brain detection."""
+
+    def test_unavailable_without_leader_epoch(self) -> None:
+        """Test that elections without an epoch neither fence nor monitor."""
+        services = make_raft_services(DestroyableRaftElection(is_leader=True))
+
+        assert services.epoch_fence is None
+        assert services.split_brain_monitor is None
+
+    def test_fenced_election_runs_monitor_until_close(self) -> None:
+        """Test that fencing reads split-brain status from the shared monitor."""
+        services = make_raft_services(FencedRaftElection(is_leader=True))
+
+        assert services.epoch_fence is not None
+        assert services.epoch_fence.current_epoch() == 1
+        monitor = services.split_brain_monitor
+        assert monitor is not None and monitor.is_running
+        assert monitor is services.cluster_state_monitor
+
+        services.close()
+
+        assert not monitor.is_running
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesClose:
+    """Test releasing the container."""
+
+    def test_close_destroys_raft_election(self) -> None:
+        """Test that closing shuts down the Raft node."""
+        election = DestroyableRaftElection()
+        services = make_raft_services(election)
+        assert services.failover_coordinator is not None
+
+        services.close()
+
+        assert election.destroyed
+
+    def test_close_without_election_is_safe(self) -> None:
+        """Test closing a container whose election was never started."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        services.close()
+
+    def test_closed_container_rejects_access(self) -> None:
+        """Test that members cannot be rebuilt after close()."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+        services.close()
+
+        with pytest.raises(RuntimeError):
+            _ = services.health_checker
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestLiteFSServicesHealthMonitor:
+    """Test the active health monitor member."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that no monitor is created without health_probes."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+
+        assert services.health_monitor is None
+        assert services.health_checker.failing_probes == ()
+
+    def test_enabled_monitor_started_and_shared(self, tmp_path) -> None:
+        """Test that the monitor runs and drives the health checker."""
+        settings = make_settings()
+        settings.mount_path = str(tmp_path)
+        settings.data_path = str(tmp_path)
+        settings.health_probes = HealthProbeSettings(enabled=True, interval=60.0)
+        services = LiteFSServices(settings, node_id_resolver=FakeNodeIDResolver())
+
+        monitor = services.health_monitor
+        try:
+            assert monitor is not None and monitor.is_running
+            assert services.health_checker._probe_monitor is monitor
+            assert "free_disk" in monitor.results()
+        finally:
+            services.close()
+
+        assert not monitor.is_running
+
+    def test_unhealthy_probes_mark_coordinator(self) -> None:
+        """Test that probe state changes reach the failover coordinator."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+        coordinator = services.failover_coordinator
+
+        services._on_health_state_change("healthy", "unhealthy")
+        assert not coordinator.is_healthy()
+
+        services._on_health_state_change("unhealthy", "degraded")
+        assert coordinator.is_healthy()
+
+    def test_health_demotion_runs_off_the_probe_thread(self) -> None:
+        """Test that a blocking demotion does not stall the callback."""
+        services = LiteFSServices(
+            make_settings(), node_id_resolver=FakeNodeIDResolver()
+        )
+        coordinator = services.failover_coordinator
+        started = threading.Event()
+        release = threading.Event()
+        threads: list[threading.Thread] = []
+
+        def demote() -> None:
+            threads.append(threading.current_thread())
+            started.set()
+            release.wait(5.0)
+
+        with patch.object(coordinator, "demote_for_health", side_effect=demote):
+            try:
+                services._on_health_state_change("healthy", "unhealthy")
+                assert started.wait(1.0)
+                # A demotion in progress is not started again
+                services._on_health_state_change("degraded", "unhealthy")
+            finally:
+                release.set()
+                services.close()
+
+            assert coordinator.demote_for_health.call_count == 1
+        assert threads[0] is not threading.current_thread()
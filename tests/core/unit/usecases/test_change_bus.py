@@ -0,0 +1,297 @@
+"""Unit tests for ChangeBus use case."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from litefs.domain.events import ReplicationChangeEvent
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.change_bus import ChangeBus
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider with a settable time."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at 100 seconds."""
+        self.now = 100.0
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class SettablePositionReader:
+    """Position reader with a settable TXID or error."""
+
+    def __init__(self, txid: int | None = 1) -> None:
+        """Initialize with a TXID (None means no position file)."""
+        self.txid = txid
+        self.error: Exception | None = None
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Return the current fake position or raise the configured error."""
+        if self.error is not None:
+            raise self.error
+        if self.txid is None:
+            return None
+        return ReplicationPosition(txid=self.txid, checksum="abcd")
+
+
+class SignalingWatcher:
+    """File watcher whose wait() returns as soon as notify() is called."""
+
+    def __init__(self) -> None:
+        """Initialize with no pending notification."""
+        self._event = threading.Event()
+        self.closed = False
+
+    def notify(self) -> None:
+        """Report a change."""
+        self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait for a notification."""
+        notified = self._event.wait(timeout)
+        self._event.clear()
+        return notified
+
+    def close(self) -> None:
+        """Record that the watcher was closed."""
+        self.closed = True
+
+
+def wait_until_primed(bus: ChangeBus) -> None:
+    """Wait for the bus thread to record its baseline position."""
+    deadline = time.monotonic() + 2.0
+    while not bus._primed and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def make_bus(reader: SettablePositionReader, **kwargs) -> ChangeBus:
+    """Create a bus with a fake clock."""
+    return ChangeBus(reader, time_provider=FakeTimeProvider(), **kwargs)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.ReplicationChangeEvent")
+class TestReplicationChangeEvent:
+    """Test ReplicationChangeEvent value object."""
+
+    def test_merge_spans_both_events(self):
+        """Test that merging keeps the first old TXID and the last new TXID."""
+        first = ReplicationChangeEvent(old_txid=1, new_txid=2, timestamp=10.0)
+        second = ReplicationChangeEvent(old_txid=2, new_txid=5, timestamp=11.0)
+
+        assert first.merge(second) == ReplicationChangeEvent(
+            old_txid=1, new_txid=5, timestamp=11.0
+        )
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestChangeBusCheck:
+    """Test position checks and callback delivery."""
+
+    def test_first_check_records_baseline(self):
+        """Test that the starting position is not published."""
+        bus = make_bus(SettablePositionReader(txid=5))
+        events = []
+        bus.subscribe(events.append)
+
+        assert bus.check() is None
+        assert events == []
+
+    def test_txid_change_publishes_event(self):
+        """Test that a new TXID is delivered to callbacks."""
+        reader = SettablePositionReader(txid=5)
+        bus = make_bus(reader)
+        events = []
+        bus.subscribe(events.append)
+        bus.check()
+
+        reader.txid = 9
+        event = bus.check()
+
+        assert event == ReplicationChangeEvent(old_txid=5, new_txid=9, timestamp=100.0)
+        assert events == [event]
+
+    def test_unchanged_txid_publishes_nothing(self):
+        """Test that checks without a change are silent."""
+        bus = make_bus(SettablePositionReader(txid=5))
+        events = []
+        bus.subscribe(events.append)
+        bus.check()
+
+        assert bus.check() is None
+        assert events == []
+
+    def test_database_creation_has_no_old_txid(self):
+        """Test the first event after the database is created."""
+        reader = SettablePositionReader(txid=None)
+        bus = make_bus(reader)
+        bus.check()
+
+        reader.txid = 1
+
+        assert bus.check().old_txid is None
+
+    def test_burst_coalesced_between_checks(self):
+        """Test that transactions applied between checks give one event."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        events = []
+        bus.subscribe(events.append)
+        bus.check()
+
+        for txid in range(2, 50):
+            reader.txid = txid
+        bus.check()
+
+        assert [(e.old_txid, e.new_txid) for e in events] == [(1, 49)]
+
+    def test_read_error_skips_check(self):
+        """Test that position read failures publish nothing."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        bus.check()
+        reader.error = LiteFSConfigError("malformed")
+
+        assert bus.check() is None
+
+    def test_failing_subscriber_does_not_block_others(self):
+        """Test that callback exceptions are isolated."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        events = []
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(failing)
+        bus.subscribe(events.append)
+        bus.check()
+        reader.txid = 2
+        bus.check()
+
+        assert len(events) == 1
+
+    def test_unsubscribe(self):
+        """Test that unsubscribed callbacks stop receiving events."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        events = []
+        unsubscribe = bus.subscribe(events.append)
+        bus.check()
+
+        unsubscribe()
+        reader.txid = 2
+        bus.check()
+
+        assert events == []
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestChangeBusQueues:
+    """Test asyncio queue subscribers."""
+
+    def test_queue_receives_event(self):
+        """Test delivery to an asyncio queue."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        bus.check()
+
+        async def scenario():
+            queue = bus.subscribe_queue()
+            reader.txid = 2
+            bus.check()
+            return await asyncio.wait_for(queue.get(), timeout=1.0)
+
+        event = asyncio.run(scenario())
+
+        assert (event.old_txid, event.new_txid) == (1, 2)
+
+    def test_full_queue_merges_pending_events(self):
+        """Test backpressure: a slow consumer gets one merged event."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        bus.check()
+
+        async def scenario():
+            queue = bus.subscribe_queue(maxsize=1)
+            for txid in (2, 3, 4):
+                reader.txid = txid
+                bus.check()
+            await asyncio.sleep(0)
+            return [queue.get_nowait() for _ in range(queue.qsize())]
+
+        events = asyncio.run(scenario())
+
+        assert [(e.old_txid, e.new_txid) for e in events] == [(1, 4)]
+
+    def test_unsubscribe_queue(self):
+        """Test that removed queues receive nothing."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader)
+        bus.check()
+
+        async def scenario():
+            queue = bus.subscribe_queue()
+            bus.unsubscribe_queue(queue)
+            reader.txid = 2
+            bus.check()
+            await asyncio.sleep(0)
+            return queue.qsize()
+
+        assert asyncio.run(scenario()) == 0
+
+    def test_invalid_maxsize_rejected(self):
+        """Test that unbounded queues are not allowed."""
+        bus = make_bus(SettablePositionReader())
+
+        with pytest.raises(ValueError):
+            bus.subscribe_queue(maxsize=0, loop=asyncio.new_event_loop())
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestChangeBusThread:
+    """Test the background watch thread."""
+
+    def test_watcher_notification_publishes_event(self):
+        """Test that the thread checks the position on watcher wake-ups."""
+        reader = SettablePositionReader(txid=1)
+        watcher = SignalingWatcher()
+        bus = make_bus(reader, watcher=watcher, poll_interval=10.0, min_interval=0)
+        received = threading.Event()
+        bus.subscribe(lambda event: received.set())
+
+        bus.start()
+        try:
+            wait_until_primed(bus)
+            reader.txid = 2
+            watcher.notify()
+            assert received.wait(2.0)
+        finally:
+            bus.stop(timeout=2.0)
+
+        assert not bus.is_running
+        assert watcher.closed
+
+    def test_polls_without_watcher(self):
+        """Test that changes are found by polling when no watcher is set."""
+        reader = SettablePositionReader(txid=1)
+        bus = make_bus(reader, poll_interval=0.01, min_interval=0)
+        received = threading.Event()
+        bus.subscribe(lambda event: received.set())
+
+        bus.start()
+        try:
+            wait_until_primed(bus)
+            reader.txid = 2
+            assert received.wait(2.0)
+        finally:
+            bus.stop(timeout=2.0)
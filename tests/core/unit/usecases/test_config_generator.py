@@ -107,6 +107,32 @@ class TestConfigGenerator:
 class TestConfigParser:
     """Test ConfigParser use case."""
 
+    def test_raft_members_round_trip(self):
+        """Test that voters and observers are listed apart and parsed back."""
+        settings = LiteFSSettings(
+            mount_path="/litefs",
+            data_path="/var/lib/litefs",
+            database_name="db.sqlite3",
+            leader_election="raft",
+            proxy_addr=":8080",
+            enabled=True,
+            retention="1h",
+            raft_self_addr="replica1:20202",
+            raft_peers=["node1:20202", "node2:20202", "node3:20202"],
+            raft_observers=["replica1:20202", "replica2:20202"],
+        )
+        from litefs.usecases.config_parser import ConfigParser
+
+        yaml_str = ConfigGenerator().generate(settings)
+        lease = yaml.safe_load(yaml_str)["lease"]
+        parsed = ConfigParser().parse(yaml_str)
+
+        assert lease["peers"] == ["node1:20202", "node2:20202", "node3:20202"]
+        assert lease["observers"] == ["replica1:20202", "replica2:20202"]
+        assert parsed.raft_self_addr == settings.raft_self_addr
+        assert parsed.raft_peers == settings.raft_peers
+        assert parsed.raft_observers == settings.raft_observers
+
     def test_parse_yaml_to_settings(self):
         """Test basic parsing of YAML to LiteFSSettings."""
         yaml_str = """
@@ -0,0 +1,120 @@
+"""Unit tests for fencing writes with the leader epoch."""
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.adapters.ports import FencingEpochPort
+from litefs.domain.fencing import parse_epoch
+from litefs.domain.metrics import FENCED_WRITES
+from litefs.usecases.epoch_fence import EpochFence, TransactionFence
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.EpochFence")]
+
+
+class FakeEpochElection:
+    """Election whose leader epoch is set by the test."""
+
+    def __init__(self, epoch: int | None = None) -> None:
+        """Initialize leading under epoch, or not leading if None."""
+        self.epoch = epoch
+
+    def get_leader_epoch(self) -> int | None:
+        """Return the configured epoch."""
+        return self.epoch
+
+
+class TestParseEpoch:
+    """Test parsing of the epoch header."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("7", 7), (" 12 ", 12), ("0", 0), (None, None), ("", None), ("-1", None)],
+    )
+    def test_parse(self, value: str | None, expected: int | None) -> None:
+        """Only non-negative decimal integers are epochs."""
+        assert parse_epoch(value) == expected
+
+    def test_non_ascii_digits_rejected(self) -> None:
+        """Unicode digits accepted by int() are not epochs."""
+        assert parse_epoch("٣") is None
+
+
+class TestEpochFence:
+    """Test admission of local and forwarded writes."""
+
+    def test_election_satisfies_port(self) -> None:
+        """The fake election implements FencingEpochPort."""
+        assert isinstance(FakeEpochElection(), FencingEpochPort)
+
+    def test_write_admitted_only_while_leading(self) -> None:
+        """Writes outside a transaction need this node to lead."""
+        election = FakeEpochElection(3)
+        fence = EpochFence(election)
+
+        assert fence.admits_write() is True
+        election.epoch = None
+        assert fence.admits_write() is False
+
+    def test_write_rejected_under_other_epoch(self) -> None:
+        """A transaction's writes need the epoch it began under."""
+        fence = EpochFence(FakeEpochElection(4))
+
+        assert fence.admits_write(4) is True
+        assert fence.admits_write(3) is False
+
+    def test_forwarded_write_admitted_up_to_current_epoch(self) -> None:
+        """A replica may know of an older leadership, not a newer one."""
+        fence = EpochFence(FakeEpochElection(5))
+
+        assert fence.admits_forwarded(4) is True
+        assert fence.admits_forwarded(5) is True
+        assert fence.admits_forwarded(6) is False
+
+    def test_rejections_counted_by_source(self) -> None:
+        """Rejected local and forwarded writes are counted separately."""
+        metrics = FakeMetricsAdapter()
+        fence = EpochFence(FakeEpochElection(2), metrics=metrics)
+
+        fence.admits_write(1)
+        fence.admits_forwarded(3)
+        fence.admits_forwarded(3)
+
+        assert metrics.counter_value(FENCED_WRITES, source="local") == 1
+        assert metrics.counter_value(FENCED_WRITES, source="forwarded") == 2
+
+
+class TestTransactionFence:
+    """Test the epoch recorded per transaction."""
+
+    def test_transaction_fenced_after_reelection(self) -> None:
+        """A new term fences the transaction even if this node leads again."""
+        election = FakeEpochElection(1)
+        fence = TransactionFence(EpochFence(election))
+
+        fence.begin()
+        assert fence.admits_write(in_transaction=True) is True
+        election.epoch = 2
+        assert fence.admits_write(in_transaction=True) is False
+
+        fence.end()
+        fence.begin()
+        assert fence.epoch == 2
+        assert fence.admits_write(in_transaction=True) is True
+
+    def test_epoch_recorded_at_first_write(self) -> None:
+        """A transaction not begun through begin() records its first write."""
+        election = FakeEpochElection(1)
+        fence = TransactionFence(EpochFence(election))
+
+        assert fence.admits_write(in_transaction=True) is True
+        assert fence.epoch == 1
+        election.epoch = 2
+        assert fence.admits_write(in_transaction=True) is False
+
+    def test_autocommit_write_needs_leadership_only(self) -> None:
+        """Writes outside a transaction are admitted under any epoch."""
+        election = FakeEpochElection(1)
+        fence = TransactionFence(EpochFence(election))
+
+        election.epoch = 9
+        assert fence.admits_write(in_transaction=False) is True
+        assert fence.epoch is None
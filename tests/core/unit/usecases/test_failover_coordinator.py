@@ -1,8 +1,13 @@
 """Unit tests for FailoverCoordinator use case."""
 
+from dataclasses import dataclass
+
 import pytest
 from hypothesis import given, strategies as st
 
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.metrics import LEADERSHIP_TRANSFER_DURATION
+
 from litefs.usecases.failover_coordinator import FailoverCoordinator, NodeState
 from litefs.adapters.ports import LeaderElectionPort
 from litefs.domain.events import FailoverEvent, FailoverEventType
@@ -777,3 +782,94 @@ class TestFailoverCoordinatorLogging:
 
         assert result is True
         assert len(logger.warnings) == 0
+
+
+@dataclass(frozen=True)
+class TransferResult:
+    """Leadership transfer outcome returned by the mock port."""
+
+    succeeded: bool
+    new_leader: str | None = None
+    duration: float = 0.0
+    reason: str | None = None
+
+
+class MockTransferringLeaderElectionPort(MockLeaderElectionPort):
+    """Mock election port supporting leadership transfer."""
+
+    def __init__(self, result: TransferResult) -> None:
+        """Initialize as leader returning the given transfer outcome."""
+        super().__init__(is_elected=True)
+        self.result = result
+        self.transfers = 0
+
+    def transfer_leadership(self) -> TransferResult:
+        """Record the transfer and return the configured outcome."""
+        self.transfers += 1
+        self.is_elected = not self.result.succeeded
+        return self.result
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase.FailoverCoordinator")
+class TestFailoverCoordinatorLeadershipTransfer:
+    """Test stepping down through leadership transfer."""
+
+    def test_graceful_handoff_transfers_leadership(self) -> None:
+        """Test that handoff transfers leadership and reports its duration."""
+        port = MockTransferringLeaderElectionPort(
+            TransferResult(succeeded=True, new_leader="node2:20202", duration=0.012)
+        )
+        emitter = MockEventEmitter()
+        metrics = FakeMetricsAdapter()
+        coordinator = FailoverCoordinator(
+            leader_election=port, event_emitter=emitter, metrics=metrics
+        )
+
+        coordinator.perform_graceful_handoff()
+
+        assert port.transfers == 1
+        assert not port.demote_called
+        assert coordinator.state == NodeState.REPLICA
+        assert emitter.events == [
+            FailoverEvent(
+                event_type=FailoverEventType.GRACEFUL_HANDOFF,
+                reason="Leadership transferred to node2:20202 in 0.012s",
+            )
+        ]
+        assert metrics.histogram_values(
+            LEADERSHIP_TRANSFER_DURATION, outcome="succeeded"
+        ) == [0.012]
+
+    def test_health_demotion_reports_failed_transfer(self) -> None:
+        """Test that a failed transfer is logged and the node still demotes."""
+        port = MockTransferringLeaderElectionPort(
+            TransferResult(
+                succeeded=False, duration=5.0, reason="no connected follower"
+            )
+        )
+        emitter = MockEventEmitter()
+        logger = MockLoggingPort()
+        coordinator = FailoverCoordinator(
+            leader_election=port, event_emitter=emitter, logger=logger
+        )
+
+        coordinator.demote_for_health()
+
+        assert coordinator.state == NodeState.REPLICA
+        assert emitter.events[-1].event_type == FailoverEventType.HEALTH_DEMOTION
+        assert emitter.events[-1].reason == (
+            "Leadership transfer failed: no connected follower"
+        )
+        assert logger.warnings == ["Leadership transfer failed: no connected follower"]
+
+    def test_handoff_without_transfer_support_demotes(self) -> None:
+        """Test that ports without transfer support are demoted as before."""
+        port = MockLeaderElectionPort(is_elected=True)
+        emitter = MockEventEmitter()
+        coordinator = FailoverCoordinator(leader_election=port, event_emitter=emitter)
+
+        coordinator.perform_graceful_handoff()
+
+        assert port.demote_called
+        assert emitter.events[-1].reason is None
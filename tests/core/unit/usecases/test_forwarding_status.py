@@ -0,0 +1,40 @@
+"""Unit tests for process-wide write forwarding status."""
+
+import pytest
+from litefs.domain.circuit_breaker import CircuitBreaker
+from litefs.usecases.forwarding_status import CIRCUIT_DISABLED, ForwardingStatus
+from litefs.usecases.route_stats import RouteSample
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.ForwardingStatus")]
+
+
+class TestForwardingStatus:
+    """Test forwarding counters and circuit breaker state."""
+
+    def test_counts_forwarded_samples_only(self) -> None:
+        """Requests handled locally are not counted."""
+        status = ForwardingStatus()
+
+        status.record(RouteSample())
+        status.record(RouteSample(forwarded=True, retries=2))
+        status.record(RouteSample(forwarded=True, retries=1, failed=True))
+
+        assert status.snapshot() == {
+            "forwarded": 2,
+            "retries": 3,
+            "failed": 1,
+            "circuit_breaker": None,
+        }
+
+    def test_reports_circuit_breaker_state(self) -> None:
+        """The latest breaker state is reported, or disabled."""
+        status = ForwardingStatus()
+        breaker = CircuitBreaker(threshold=1, reset_timeout=30.0)
+
+        status.set_circuit_breaker(breaker.record_failure(100.0))
+        assert status.snapshot()["circuit_breaker"] == "open"
+
+        status.set_circuit_breaker(
+            CircuitBreaker(threshold=1, reset_timeout=30.0, disabled=True)
+        )
+        assert status.snapshot()["circuit_breaker"] == CIRCUIT_DISABLED
@@ -5,7 +5,10 @@ from hypothesis import given, strategies as st
 from unittest.mock import Mock
 
 from litefs.usecases.health_checker import HealthChecker
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.domain.exceptions import LiteFSConfigError
 from litefs.domain.health import HealthStatus
+from litefs.domain.replication import ReplicationLag
 from litefs.adapters.ports import PrimaryDetectorPort
 
 
@@ -233,3 +236,96 @@ class TestHealthCheckerPBT:
 
         assert result1 == result2 == result3
         assert result1 == HealthStatus(state="healthy")  # type: ignore
+
+
+class FakeLagChecker:
+    """Fake ReplicationLagChecker with a fixed lag."""
+
+    def __init__(self, lag: ReplicationLag, lagging: bool) -> None:
+        """Initialize with the lag to report and whether it exceeds thresholds."""
+        self.lag = lag
+        self.lagging = lagging
+        self.is_primary: bool | None = None
+
+    def check_lag(self, is_primary: bool | None = None) -> ReplicationLag:
+        """Return the configured lag, recording the primary flag passed."""
+        self.is_primary = is_primary
+        return self.lag
+
+    def is_lagging(self, lag: ReplicationLag) -> bool:
+        """Return the configured lagging flag."""
+        return self.lagging
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestHealthCheckerReplicationLag:
+    """Test HealthChecker replication lag integration."""
+
+    def test_lagging_replica_is_degraded(self):
+        """Test that a replica beyond the lag thresholds is degraded."""
+        mock_detector: PrimaryDetectorPort = Mock()
+        mock_detector.is_primary.return_value = False
+        lag = ReplicationLag(local_txid=1, primary_txid=5000, txid_lag=4999)
+
+        checker = HealthChecker(
+            primary_detector=mock_detector,
+            lag_checker=FakeLagChecker(lag, lagging=True),
+        )
+
+        assert checker.check_health() == HealthStatus(state="degraded")
+        assert checker.last_replication_lag == lag
+        assert checker.replica_lagging is True
+
+    def test_replica_within_threshold_is_healthy(self):
+        """Test that a replica within the lag thresholds stays healthy."""
+        mock_detector: PrimaryDetectorPort = Mock()
+        mock_detector.is_primary.return_value = False
+
+        checker = HealthChecker(
+            primary_detector=mock_detector,
+            lag_checker=FakeLagChecker(ReplicationLag(txid_lag=3), lagging=False),
+        )
+
+        assert checker.check_health() == HealthStatus(state="healthy")
+        assert checker.replica_lagging is False
+
+    def test_primary_never_lagging(self):
+        """Test that the primary is not degraded by lag."""
+        mock_detector: PrimaryDetectorPort = Mock()
+        mock_detector.is_primary.return_value = True
+
+        checker = HealthChecker(
+            primary_detector=mock_detector,
+            lag_checker=FakeLagChecker(ReplicationLag(txid_lag=0), lagging=True),
+        )
+
+        assert checker.check_health() == HealthStatus(state="healthy")
+        assert checker.replica_lagging is False
+
+    def test_primary_status_read_once_per_check(self):
+        """Test that the lag check reuses the primary flag of the health check."""
+        mock_detector: PrimaryDetectorPort = Mock()
+        mock_detector.is_primary.return_value = False
+        position_reader = Mock()
+        position_reader.read_position.return_value = None
+
+        checker = HealthChecker(
+            primary_detector=mock_detector,
+            lag_checker=ReplicationLagChecker(position_reader, mock_detector),
+        )
+        checker.check_health()
+
+        assert mock_detector.is_primary.call_count == 1
+
+    def test_lag_errors_do_not_fail_health(self):
+        """Test that an unreadable position file leaves the node healthy."""
+        mock_detector: PrimaryDetectorPort = Mock()
+        mock_detector.is_primary.return_value = False
+        lag_checker = Mock()
+        lag_checker.check_lag.side_effect = LiteFSConfigError("bad position")
+
+        checker = HealthChecker(primary_detector=mock_detector, lag_checker=lag_checker)
+
+        assert checker.check_health() == HealthStatus(state="healthy")
+        assert checker.last_replication_lag is None
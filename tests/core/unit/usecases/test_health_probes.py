@@ -0,0 +1,304 @@
+"""Unit tests for active health probes and their hysteresis."""
+
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.health import HealthStatus, ProbeThresholds
+from litefs.domain.metrics import HEALTH_PROBE_TRANSITIONS
+from litefs.domain.replication import ReplicationLag
+from litefs.usecases.health_checker import HealthChecker
+from litefs.usecases.health_probes import (
+    ActiveHealthMonitor,
+    EventLoopLagProbe,
+    ExecutorDelayProbe,
+    FreeDiskProbe,
+    FuseReadLatencyProbe,
+    QueryLatencyProbe,
+    ReplicationLagProbe,
+    WalSizeProbe,
+)
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.HealthProbes")]
+
+
+class ScriptedProbe:
+    """Probe returning queued values; exceptions in the queue are raised."""
+
+    def __init__(self, name: str = "scripted", values: list | None = None) -> None:
+        """Initialize with the values to return, in order."""
+        self.name = name
+        self.values = list(values or [])
+
+    def measure(self) -> float | None:
+        """Return or raise the next queued value."""
+        value = self.values.pop(0)
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+def run(monitor: ActiveHealthMonitor, rounds: int) -> list[str]:
+    """Run rounds of probes and return the node state after each."""
+    return [monitor.run_once() for _ in range(rounds)]
+
+
+class TestProbeThresholds:
+    """Test classification of measured values."""
+
+    def test_higher_is_worse(self) -> None:
+        """Values above the thresholds breach them."""
+        thresholds = ProbeThresholds(degraded=0.1, unhealthy=1.0)
+
+        assert thresholds.classify(0.1) == "healthy"
+        assert thresholds.classify(0.5) == "degraded"
+        assert thresholds.classify(2.0) == "unhealthy"
+
+    def test_lower_is_worse(self) -> None:
+        """Values below the thresholds breach them when lower is worse."""
+        thresholds = ProbeThresholds(degraded=100, unhealthy=10, higher_is_worse=False)
+
+        assert thresholds.classify(500) == "healthy"
+        assert thresholds.classify(50) == "degraded"
+        assert thresholds.classify(5) == "unhealthy"
+
+    def test_inverted_thresholds_rejected(self) -> None:
+        """The unhealthy threshold must be beyond the degraded one."""
+        with pytest.raises(LiteFSConfigError):
+            ProbeThresholds(degraded=1.0, unhealthy=0.1)
+
+
+class TestActiveHealthMonitorHysteresis:
+    """Test state transitions after consecutive samples."""
+
+    def test_degrades_after_failure_threshold(self) -> None:
+        """One slow sample does not degrade; N consecutive ones do."""
+        probe = ScriptedProbe(values=[0.5, 0.0, 0.5, 0.5, 0.5])
+        monitor = ActiveHealthMonitor(failure_threshold=3)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1))
+
+        states = run(monitor, 5)
+
+        assert states == ["healthy", "healthy", "healthy", "healthy", "degraded"]
+        assert monitor.failing_probes() == ("scripted",)
+
+    def test_recovers_after_recovery_threshold(self) -> None:
+        """M consecutive good samples are needed to recover."""
+        probe = ScriptedProbe(values=[0.5, 0.0, 0.5, 0.0, 0.0])
+        monitor = ActiveHealthMonitor(failure_threshold=1, recovery_threshold=2)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1))
+
+        states = run(monitor, 5)
+
+        assert states == ["degraded", "degraded", "degraded", "degraded", "healthy"]
+
+    def test_transition_uses_mildest_sample_of_streak(self) -> None:
+        """A streak mixing degraded and unhealthy samples only degrades."""
+        probe = ScriptedProbe(values=[2.0, 0.5, 2.0, 2.0, 2.0, 2.0])
+        monitor = ActiveHealthMonitor(failure_threshold=3)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1, unhealthy=1.0))
+
+        states = run(monitor, 6)
+
+        assert states[2:] == ["degraded", "degraded", "degraded", "unhealthy"]
+
+    def test_node_state_is_worst_probe(self) -> None:
+        """The node takes the state of its worst probe."""
+        monitor = ActiveHealthMonitor(failure_threshold=1)
+        monitor.add_probe(ScriptedProbe("a", [0.5]), ProbeThresholds(degraded=0.1))
+        monitor.add_probe(ScriptedProbe("b", [2.0]), ProbeThresholds(unhealthy=1.0))
+
+        assert monitor.run_once() == "unhealthy"
+        assert monitor.results()["a"].state == "degraded"
+
+    def test_failure_is_unhealthy_sample(self) -> None:
+        """A probe raising counts as an unhealthy sample with its error."""
+        probe = ScriptedProbe(values=[OSError("Transport endpoint is not connected")])
+        monitor = ActiveHealthMonitor(failure_threshold=1)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1))
+
+        assert monitor.run_once() == "unhealthy"
+        result = monitor.results()["scripted"]
+        assert result.error == "Transport endpoint is not connected"
+        assert result.value is None
+
+    def test_missing_value_is_ignored(self) -> None:
+        """A probe with nothing to measure neither breaches nor recovers."""
+        probe = ScriptedProbe(values=[0.5, None, 0.5])
+        monitor = ActiveHealthMonitor(failure_threshold=2)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1))
+
+        assert run(monitor, 3) == ["healthy", "healthy", "degraded"]
+
+    def test_hung_probe_times_out(self) -> None:
+        """A probe exceeding the timeout is unhealthy and not restarted."""
+        release = threading.Event()
+        probe = Mock()
+        probe.name = "hung"
+        probe.measure.side_effect = lambda: release.wait(5.0)
+        monitor = ActiveHealthMonitor(failure_threshold=1, probe_timeout=0.05)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1))
+
+        try:
+            states = run(monitor, 2)
+        finally:
+            release.set()
+
+        assert states == ["unhealthy", "unhealthy"]
+        assert probe.measure.call_count == 1
+        assert "in progress" in monitor.results()["hung"].error
+
+    def test_probe_thread_reused_between_rounds(self) -> None:
+        """Each probe keeps one worker thread, which stop() ends."""
+        threads: list[threading.Thread] = []
+        probe = Mock()
+        probe.name = "tick"
+        probe.measure.side_effect = lambda: threads.append(
+            threading.current_thread()
+        )
+        monitor = ActiveHealthMonitor()
+        monitor.add_probe(probe, ProbeThresholds(degraded=1.0))
+
+        run(monitor, 3)
+        monitor.stop()
+
+        (worker,) = set(threads)
+        assert len(threads) == 3
+        assert worker is not threading.current_thread()
+        worker.join(1.0)
+        assert not worker.is_alive()
+
+    def test_state_change_callback_and_metrics(self) -> None:
+        """Node state changes are reported; probe transitions are counted."""
+        changes: list[tuple[str, str]] = []
+        metrics = FakeMetricsAdapter()
+        probe = ScriptedProbe(values=[2.0, 0.0])
+        monitor = ActiveHealthMonitor(
+            failure_threshold=1,
+            recovery_threshold=1,
+            on_state_change=lambda previous, current: changes.append(
+                (previous, current)
+            ),
+            metrics=metrics,
+        )
+        monitor.add_probe(probe, ProbeThresholds(unhealthy=1.0))
+
+        run(monitor, 2)
+
+        assert changes == [("healthy", "unhealthy"), ("unhealthy", "healthy")]
+        assert (
+            metrics.counter_value(
+                HEALTH_PROBE_TRANSITIONS, probe="scripted", state="unhealthy"
+            )
+            == 1
+        )
+
+    def test_start_and_stop(self) -> None:
+        """The background thread runs rounds until stopped."""
+        ran = threading.Event()
+        probe = Mock()
+        probe.name = "tick"
+        probe.measure.side_effect = lambda: ran.set() or 0.0
+        monitor = ActiveHealthMonitor(interval=0.01)
+        monitor.add_probe(probe, ProbeThresholds(degraded=1.0))
+
+        monitor.start()
+        try:
+            assert ran.wait(2.0)
+            assert monitor.is_running
+        finally:
+            monitor.stop(timeout=1.0)
+
+        assert not monitor.is_running
+
+
+class TestProbes:
+    """Test the built-in probes."""
+
+    def test_fuse_read_latency(self, tmp_path: Path) -> None:
+        """The read time is measured; a missing file measures nothing."""
+        position = tmp_path / "app.db-pos"
+
+        assert FuseReadLatencyProbe(position).measure() is None
+        position.write_text("0000000000000001/0000000000000000")
+        assert FuseReadLatencyProbe(position).measure() >= 0.0
+
+    def test_query_latency(self, tmp_path: Path) -> None:
+        """The query round-trip is measured once the database exists."""
+        database = tmp_path / "app.db"
+        probe = QueryLatencyProbe(database)
+
+        assert probe.measure() is None
+        sqlite3.connect(database).close()
+        try:
+            assert probe.measure() >= 0.0
+        finally:
+            probe.close()
+
+    def test_wal_size(self, tmp_path: Path) -> None:
+        """The WAL size is its file size, 0 without a WAL."""
+        database = tmp_path / "app.db"
+
+        assert WalSizeProbe(database).measure() == 0.0
+        Path(f"{database}-wal").write_bytes(b"x" * 128)
+        assert WalSizeProbe(database).measure() == 128.0
+
+    def test_free_disk(self, tmp_path: Path) -> None:
+        """Free disk space is positive for an existing directory."""
+        assert FreeDiskProbe(tmp_path).measure() > 0
+
+    def test_replication_lag(self) -> None:
+        """The lag in seconds is reported, None when unknown."""
+        assert (
+            ReplicationLagProbe(lambda: ReplicationLag(seconds_lag=4.0)).measure()
+            == 4.0
+        )
+        assert ReplicationLagProbe(lambda: ReplicationLag()).measure() is None
+
+    def test_event_loop_lag(self) -> None:
+        """The delay of a callback on a running loop is measured."""
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            assert EventLoopLagProbe(loop, timeout=1.0).measure() < 1.0
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(1.0)
+            loop.close()
+
+    def test_executor_delay_reports_saturation(self) -> None:
+        """A saturated pool reports the timeout."""
+        release = threading.Event()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert ExecutorDelayProbe(executor, timeout=1.0).measure() < 1.0
+            executor.submit(release.wait, 5.0)
+            try:
+                assert ExecutorDelayProbe(executor, timeout=0.05).measure() >= 0.05
+            finally:
+                release.set()
+
+
+class TestHealthCheckerWithProbes:
+    """Test that the probe state drives HealthChecker."""
+
+    @pytest.mark.parametrize("state", ["degraded", "unhealthy"])
+    def test_probe_state_reported(self, state: str) -> None:
+        """The node is as unhealthy as its probes."""
+        detector = Mock()
+        detector.is_primary.return_value = True
+        probe = ScriptedProbe(values=[2.0 if state == "unhealthy" else 0.5])
+        monitor = ActiveHealthMonitor(failure_threshold=1)
+        monitor.add_probe(probe, ProbeThresholds(degraded=0.1, unhealthy=1.0))
+        monitor.run_once()
+
+        checker = HealthChecker(primary_detector=detector, probe_monitor=monitor)
+
+        assert checker.check_health() == HealthStatus(state=state)
+        assert checker.failing_probes == ("scripted",)
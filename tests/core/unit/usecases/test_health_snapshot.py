@@ -0,0 +1,157 @@
+"""Unit tests for HealthSnapshotEvaluator use case."""
+
+import json
+import threading
+import time
+
+import pytest
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator, SnapshotResponse
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider with a settable time."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at 100 seconds."""
+        self.now = 100.0
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class CountingBuilder:
+    """Payload builder counting its calls."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        """Initialize with the status code to return."""
+        self.status_code = status_code
+        self.calls = 0
+        self.called = threading.Event()
+
+    def __call__(self) -> tuple[dict, int]:
+        """Return a payload containing the call count."""
+        self.calls += 1
+        self.called.set()
+        return {"calls": self.calls}, self.status_code
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Domain.Invariant.SnapshotResponse")
+class TestSnapshotResponse:
+    """Test SnapshotResponse value object."""
+
+    def test_age_in_whole_seconds(self):
+        """Test that the age is floored, as required for the Age header."""
+        response = SnapshotResponse(body=b"{}", status_code=200, computed_at=10.0)
+
+        assert response.age(12.9) == 2
+
+    def test_age_never_negative(self):
+        """Test clock skew does not produce a negative age."""
+        response = SnapshotResponse(body=b"{}", status_code=200, computed_at=10.0)
+
+        assert response.age(9.0) == 0
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestHealthSnapshotEvaluatorRefresh:
+    """Test synchronous evaluation."""
+
+    def test_no_snapshot_before_refresh(self):
+        """Test that get() returns None until evaluated."""
+        evaluator = HealthSnapshotEvaluator({"health": CountingBuilder()})
+
+        assert evaluator.get("health") is None
+
+    def test_refresh_serializes_payload(self):
+        """Test that snapshots hold the JSON body and status code."""
+        clock = FakeTimeProvider()
+        evaluator = HealthSnapshotEvaluator(
+            {"ready": CountingBuilder(status_code=503)}, time_provider=clock
+        )
+
+        evaluator.refresh()
+        snapshot = evaluator.get("ready")
+
+        assert json.loads(snapshot.body) == {"calls": 1}
+        assert snapshot.status_code == 503
+        assert snapshot.computed_at == 100.0
+
+    def test_stale_snapshot_not_served(self):
+        """Test that snapshots older than max_age are ignored."""
+        clock = FakeTimeProvider()
+        evaluator = HealthSnapshotEvaluator(
+            {"health": CountingBuilder()}, max_age=5.0, time_provider=clock
+        )
+        evaluator.refresh()
+
+        clock.now += 5.0
+        assert evaluator.get("health") is not None
+        clock.now += 0.1
+        assert evaluator.get("health") is None
+
+    def test_failing_builder_drops_snapshot(self):
+        """Test that a failure removes the snapshot instead of serving it."""
+        healthy = True
+
+        def builder() -> tuple[dict, int]:
+            if not healthy:
+                raise RuntimeError("boom")
+            return {"ok": True}, 200
+
+        other = CountingBuilder()
+        evaluator = HealthSnapshotEvaluator({"health": builder, "live": other})
+        evaluator.refresh()
+
+        healthy = False
+        evaluator.refresh()
+
+        assert evaluator.get("health") is None
+        assert other.calls == 2
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestHealthSnapshotEvaluatorThread:
+    """Test the background evaluation thread."""
+
+    def test_thread_evaluates_on_start(self):
+        """Test that starting the evaluator computes snapshots."""
+        builder = CountingBuilder()
+        evaluator = HealthSnapshotEvaluator({"health": builder}, interval=10.0)
+
+        evaluator.start()
+        try:
+            assert builder.called.wait(2.0)
+        finally:
+            evaluator.stop(timeout=2.0)
+
+        assert not evaluator.is_running
+
+    def test_request_refresh_wakes_thread(self):
+        """Test that state-change events trigger an early evaluation."""
+        builder = CountingBuilder()
+        evaluator = HealthSnapshotEvaluator({"health": builder}, interval=10.0)
+
+        evaluator.start()
+        try:
+            assert builder.called.wait(2.0)
+            builder.called.clear()
+            evaluator.request_refresh(sender=None, event=object())
+            assert builder.called.wait(2.0)
+        finally:
+            evaluator.stop(timeout=2.0)
+
+        assert builder.calls >= 2
+
+    def test_stop_returns_promptly(self):
+        """Test that stop() interrupts the interval wait."""
+        evaluator = HealthSnapshotEvaluator({"health": CountingBuilder()}, interval=60)
+        evaluator.start()
+
+        started = time.monotonic()
+        evaluator.stop(timeout=2.0)
+
+        assert time.monotonic() - started < 1.0
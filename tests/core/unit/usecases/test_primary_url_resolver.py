@@ -145,6 +145,70 @@ class TestPrimaryURLResolverRaftMode:
         assert result == "https://raft-primary.local:20202"
 
 
+class FakeClusterMetadata:
+    """Fake replicated cluster metadata."""
+
+    def __init__(self, metadata: dict) -> None:
+        """Initialize with the metadata to return."""
+        self._metadata = metadata
+
+    def get_cluster_metadata(self) -> dict:
+        """Return configured metadata."""
+        return self._metadata
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase.PrimaryURLResolver")
+class TestPrimaryURLResolverClusterMetadata:
+    """Test PrimaryURLResolver with replicated cluster metadata."""
+
+    def test_prefers_forwarding_url_from_metadata(self) -> None:
+        """Test that the leader's published URL is used as is."""
+        resolver = PrimaryURLResolver(
+            primary_url_detector=FakePrimaryURLDetector("raft-primary.local:20202"),
+            cluster_metadata=FakeClusterMetadata(
+                {"leader": "node2:20202", "forwarding_url": "https://node2:8443"}
+            ),
+        )
+
+        result = resolver.resolve()
+
+        assert result == "https://node2:8443"
+
+    def test_returns_none_when_this_node_is_primary(self) -> None:
+        """Test that this node does not forward to itself."""
+        resolver = PrimaryURLResolver(
+            primary_url_detector=FakePrimaryURLDetector(""),
+            cluster_metadata=FakeClusterMetadata({"forwarding_url": "http://node1"}),
+        )
+
+        result = resolver.resolve()
+
+        assert result is None
+
+    def test_falls_back_to_detector_without_forwarding_url(self) -> None:
+        """Test that the .primary file is used until a URL is replicated."""
+        resolver = PrimaryURLResolver(
+            primary_url_detector=FakePrimaryURLDetector("raft-primary.local:20202"),
+            cluster_metadata=FakeClusterMetadata({"epoch": 3}),
+        )
+
+        result = resolver.resolve()
+
+        assert result == "http://raft-primary.local:20202"
+
+    def test_metadata_without_detector(self) -> None:
+        """Test that metadata alone resolves the primary URL."""
+        resolver = PrimaryURLResolver(
+            cluster_metadata=FakeClusterMetadata({"forwarding_url": "http://node2"}),
+        )
+
+        result = resolver.resolve()
+
+        assert result == "http://node2"
+
+
 @pytest.mark.unit
 @pytest.mark.tier(1)
 @pytest.mark.tra("UseCase.PrimaryURLResolver")
@@ -0,0 +1,190 @@
+"""Unit tests for the query-result cache use case."""
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.query_cache import (
+    CachedQueryResult,
+    QueryResultCache,
+    make_query_key,
+)
+
+
+def make_position(txid: int = 5, checksum: str = "abcd") -> ReplicationPosition:
+    """Build a replication position."""
+    return ReplicationPosition(txid=txid, checksum=checksum)
+
+
+def make_result(*values: int) -> CachedQueryResult:
+    """Build a single-column result with one row per value."""
+    return CachedQueryResult(
+        description=(("id", None, None, None, None, None, None),),
+        rows=tuple((value,) for value in values),
+    )
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestMakeQueryKey:
+    """Test make_query_key."""
+
+    def test_positional_params(self):
+        """Test that sequence params are frozen into a tuple."""
+        assert make_query_key("SELECT ?", [1]) == ("SELECT ?", (1,))
+        assert make_query_key("SELECT ?", [1]) == make_query_key("SELECT ?", (1,))
+
+    def test_named_params_order_insensitive(self):
+        """Test that mapping params are keyed independent of order."""
+        first = make_query_key("SELECT :a, :b", {"a": 1, "b": 2})
+        second = make_query_key("SELECT :a, :b", {"b": 2, "a": 1})
+
+        assert first == second
+
+    def test_no_params(self):
+        """Test statements without parameters."""
+        assert make_query_key("SELECT 1", None) == ("SELECT 1", ())
+
+    def test_unhashable_params_not_cacheable(self):
+        """Test that unhashable params bypass the cache."""
+        assert make_query_key("SELECT ?", [[1, 2]]) is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestQueryResultCache:
+    """Test QueryResultCache storage, invalidation and eviction."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored result is served for the same key and position."""
+        cache = QueryResultCache()
+        key = make_query_key("SELECT id FROM a", None)
+
+        assert cache.get(key, make_position()) is None
+        assert cache.put(key, make_position(), make_result(1, 2), frozenset({"a"}))
+        assert cache.get(key, make_position()) == make_result(1, 2)
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_ratio == pytest.approx(0.5)
+
+    def test_hit_ratio_unknown_without_lookups(self):
+        """Test hit ratio before any lookup."""
+        assert QueryResultCache().hit_ratio is None
+
+    def test_newer_txid_invalidates_entries(self):
+        """Test that advancing replication drops all entries."""
+        cache = QueryResultCache()
+        key = make_query_key("SELECT id FROM a", None)
+        cache.put(key, make_position(txid=5), make_result(1), frozenset({"a"}))
+
+        assert cache.get(key, make_position(txid=6)) is None
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    def test_changed_checksum_invalidates_entries(self):
+        """Test that a restored database with the same TXID drops entries."""
+        cache = QueryResultCache()
+        key = make_query_key("SELECT id FROM a", None)
+        cache.put(key, make_position(checksum="aaaa"), make_result(1), None)
+
+        assert cache.get(key, make_position(checksum="bbbb")) is None
+
+    def test_outdated_position_not_stored(self):
+        """Test that a result read before the latest TXID is skipped."""
+        cache = QueryResultCache()
+        cache.get(make_query_key("SELECT 1", None), make_position(txid=6))
+
+        assert not cache.put(
+            make_query_key("SELECT id FROM a", None),
+            make_position(txid=5),
+            make_result(1),
+            frozenset({"a"}),
+        )
+        assert len(cache) == 0
+
+    def test_invalidate_tables_drops_only_matching_entries(self):
+        """Test per-table invalidation."""
+        cache = QueryResultCache()
+        key_a = make_query_key("SELECT id FROM a", None)
+        key_b = make_query_key("SELECT id FROM b", None)
+        key_ab = make_query_key("SELECT a.id FROM a JOIN b", None)
+        cache.put(key_a, make_position(), make_result(1), frozenset({"a"}))
+        cache.put(key_b, make_position(), make_result(2), frozenset({"b"}))
+        cache.put(key_ab, make_position(), make_result(3), frozenset({"a", "b"}))
+
+        cache.invalidate_tables({"a"})
+
+        assert cache.get(key_a, make_position()) is None
+        assert cache.get(key_ab, make_position()) is None
+        assert cache.get(key_b, make_position()) == make_result(2)
+        assert cache.size_bytes == make_result(2).size
+
+    def test_entries_with_unknown_tables_dropped_by_any_write(self):
+        """Test that entries without table names are always invalidated."""
+        cache = QueryResultCache()
+        key = make_query_key("SELECT 1", None)
+        cache.put(key, make_position(), make_result(1), None)
+
+        cache.invalidate_tables({"unrelated"})
+
+        assert len(cache) == 0
+
+    def test_invalidate_unknown_tables_clears_all(self):
+        """Test that a write with unknown tables drops every entry."""
+        cache = QueryResultCache()
+        cache.put(
+            make_query_key("SELECT id FROM a", None),
+            make_position(),
+            make_result(1),
+            frozenset({"a"}),
+        )
+
+        cache.invalidate_tables(None)
+
+        assert len(cache) == 0
+
+    def test_oversized_entry_not_stored(self):
+        """Test max_entry_bytes."""
+        cache = QueryResultCache(max_bytes=10_000, max_entry_bytes=4)
+
+        assert not cache.put(
+            make_query_key("SELECT 1", None), make_position(), make_result(1), None
+        )
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_size(self):
+        """Test that least recently used entries are evicted beyond max_bytes."""
+        entry_size = make_result(1).size
+        cache = QueryResultCache(max_bytes=entry_size * 2, max_entry_bytes=entry_size)
+        keys = [make_query_key(f"SELECT {n}", None) for n in range(3)]
+        cache.put(keys[0], make_position(), make_result(1), frozenset({"a"}))
+        cache.put(keys[1], make_position(), make_result(1), frozenset({"a"}))
+        cache.get(keys[0], make_position())
+        cache.put(keys[2], make_position(), make_result(1), frozenset({"a"}))
+
+        assert cache.get(keys[0], make_position()) is not None
+        assert cache.get(keys[1], make_position()) is None
+        assert cache.get(keys[2], make_position()) is not None
+        assert cache.size_bytes <= entry_size * 2
+
+    def test_replacing_entry_keeps_index_consistent(self):
+        """Test that storing a key again replaces its size and tables."""
+        cache = QueryResultCache()
+        key = make_query_key("SELECT id FROM a", None)
+        cache.put(key, make_position(), make_result(1), frozenset({"a"}))
+        cache.put(key, make_position(), make_result(1), frozenset({"b"}))
+
+        cache.invalidate_tables({"a"})
+
+        assert len(cache) == 1
+        assert cache.size_bytes == make_result(1).size
+
+    def test_emits_metrics(self):
+        """Test that lookups and stores update the query cache metrics."""
+        metrics = FakeMetricsAdapter()
+        cache = QueryResultCache(metrics=metrics)
+        key = make_query_key("SELECT id FROM a", None)
+
+        cache.get(key, make_position())
+        cache.put(key, make_position(), make_result(1), frozenset({"a"}))
+        cache.get(key, make_position())
+
+        assert metrics.current_query_cache_stats == (1, 1, make_result(1).size)
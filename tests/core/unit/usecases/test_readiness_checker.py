@@ -6,6 +6,7 @@ from litefs.usecases.readiness_checker import ReadinessChecker
 from litefs.usecases.failover_coordinator import NodeState
 from litefs.usecases.split_brain_detector import SplitBrainStatus
 from litefs.domain.health import HealthStatus
+from litefs.domain.replication import ReplicationLag
 from litefs.domain.split_brain import RaftNodeState
 
 
@@ -13,8 +14,11 @@ class FakeHealthChecker:
     """Fake HealthChecker for testing."""
 
     def __init__(self, state: str = "healthy") -> None:
-        """Initialize with configurable health state."""
+        """Initialize with configurable health state and no lag tracking."""
         self._state = state
+        self.last_replication_lag: ReplicationLag | None = None
+        self.replica_lagging = False
+        self.failing_probes: tuple[str, ...] = ()
 
     def check_health(self) -> HealthStatus:
         """Return configured health status."""
@@ -318,3 +322,69 @@ class TestReadinessChecker:
         assert result.can_accept_writes is False
         assert result.error is not None
         assert "unhealthy" in result.error.lower()
+
+    def test_error_names_failing_probes(self) -> None:
+        """Test that the error names the active probes failing."""
+        health_checker = FakeHealthChecker(state="unhealthy")
+        health_checker.failing_probes = ("query_latency", "free_disk")
+
+        checker = ReadinessChecker(
+            health_checker=health_checker,
+            failover_coordinator=FakeFailoverCoordinator(is_primary=True),
+        )
+        result = checker.check_readiness()
+
+        assert result.error == "Node is unhealthy (probes: query_latency, free_disk)"
+
+
+class FakeLaggingHealthChecker(FakeHealthChecker):
+    """Fake HealthChecker that tracks replication lag."""
+
+    def __init__(self, lag: ReplicationLag, lagging: bool) -> None:
+        """Initialize with the lag and whether the replica is lagging."""
+        super().__init__(state="degraded" if lagging else "healthy")
+        self.last_replication_lag = lag
+        self.replica_lagging = lagging
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestReadinessCheckerReplicationLag:
+    """Test ReadinessChecker with replication lag tracking."""
+
+    def test_lagging_replica_is_not_ready(self) -> None:
+        """Test that a lagging replica is drained from traffic."""
+        lag = ReplicationLag(local_txid=1, primary_txid=5000, txid_lag=4999)
+        checker = ReadinessChecker(
+            health_checker=FakeLaggingHealthChecker(lag, lagging=True),
+            failover_coordinator=FakeFailoverCoordinator(is_primary=False),
+        )
+
+        result = checker.check_readiness()
+
+        assert result.is_ready is False
+        assert result.replication_lag == lag
+        assert result.error is not None
+        assert "4999" in result.error
+
+    def test_replica_within_threshold_is_ready(self) -> None:
+        """Test that a replica within the thresholds is ready."""
+        lag = ReplicationLag(local_txid=10, primary_txid=12, txid_lag=2)
+        checker = ReadinessChecker(
+            health_checker=FakeLaggingHealthChecker(lag, lagging=False),
+            failover_coordinator=FakeFailoverCoordinator(is_primary=False),
+        )
+
+        result = checker.check_readiness()
+
+        assert result.is_ready is True
+        assert result.replication_lag == lag
+
+    def test_replication_lag_none_without_tracking(self) -> None:
+        """Test that replication_lag is None when the health checker has no lag."""
+        checker = ReadinessChecker(
+            health_checker=FakeHealthChecker(),
+            failover_coordinator=FakeFailoverCoordinator(is_primary=False),
+        )
+
+        assert checker.check_readiness().replication_lag is None
@@ -0,0 +1,213 @@
+"""Unit tests for ReplicationLagChecker use case."""
+
+from unittest.mock import Mock
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.replication import ReplicationLag, ReplicationPosition
+from litefs.domain.settings import ReplicationSettings
+from litefs.domain.split_brain import RaftClusterState, RaftNodeState
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.usecases.split_brain_detector import SplitBrainDetector, SplitBrainMonitor
+from litefs.usecases.txid_rate_tracker import TxidRateTracker
+
+
+class FakePositionReader:
+    """Fake position reader returning a configurable TXID."""
+
+    def __init__(self, txid: int | None) -> None:
+        """Initialize with the local TXID (None for no position file)."""
+        self.txid = txid
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Return the configured position."""
+        if self.txid is None:
+            return None
+        return ReplicationPosition(txid=self.txid, checksum="0")
+
+
+class FakeClusterStatePort:
+    """Fake cluster state port reporting a leader TXID."""
+
+    def __init__(self, leader_txid: int | None) -> None:
+        """Initialize with the leader's TXID."""
+        self.leader_txid = leader_txid
+
+    def get_cluster_state(self) -> RaftClusterState:
+        """Return a two-node cluster with node1 as leader."""
+        return RaftClusterState(
+            nodes=[
+                RaftNodeState(node_id="node1", is_leader=True, txid=self.leader_txid),
+                RaftNodeState(node_id="node2", is_leader=False),
+            ]
+        )
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider with a manually advanced clock."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now = 0.0
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+def _detector(is_primary: bool) -> Mock:
+    detector = Mock()
+    detector.is_primary.return_value = is_primary
+    return detector
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestReplicationLagChecker:
+    """Test ReplicationLagChecker use case."""
+
+    def test_primary_has_zero_lag(self):
+        """Test that the primary is never behind."""
+        checker = ReplicationLagChecker(FakePositionReader(42), _detector(True))
+
+        assert checker.check_lag() == ReplicationLag(
+            local_txid=42, primary_txid=42, txid_lag=0, seconds_lag=0.0
+        )
+
+    def test_given_primary_flag_skips_detector(self):
+        """Test that a caller's primary flag is used instead of re-reading it."""
+        detector = _detector(True)
+        checker = ReplicationLagChecker(
+            FakePositionReader(40),
+            detector,
+            cluster_state_port=FakeClusterStatePort(leader_txid=50),
+        )
+
+        lag = checker.check_lag(is_primary=False)
+
+        assert lag.txid_lag == 10
+        detector.is_primary.assert_not_called()
+
+    def test_replica_lag_from_cluster_state(self):
+        """Test replica lag computed against the leader's TXID."""
+        checker = ReplicationLagChecker(
+            FakePositionReader(40),
+            _detector(False),
+            cluster_state_port=FakeClusterStatePort(leader_txid=50),
+        )
+
+        lag = checker.check_lag()
+
+        assert lag.local_txid == 40
+        assert lag.primary_txid == 50
+        assert lag.txid_lag == 10
+
+    def test_replica_ahead_of_reported_primary_is_zero_lag(self):
+        """Test that a stale leader report never yields negative lag."""
+        checker = ReplicationLagChecker(
+            FakePositionReader(60),
+            _detector(False),
+            cluster_state_port=FakeClusterStatePort(leader_txid=50),
+        )
+
+        assert checker.check_lag().txid_lag == 0
+
+    def test_replica_without_cluster_state_is_unknown(self):
+        """Test that lag is unknown without a cluster state port."""
+        checker = ReplicationLagChecker(FakePositionReader(40), _detector(False))
+
+        lag = checker.check_lag()
+
+        assert lag.local_txid == 40
+        assert lag.is_known is False
+
+    def test_cluster_state_failure_is_unknown(self):
+        """Test that cluster state errors leave the lag unknown."""
+        port = Mock()
+        port.get_cluster_state.side_effect = RuntimeError("network down")
+        checker = ReplicationLagChecker(
+            FakePositionReader(40), _detector(False), cluster_state_port=port
+        )
+
+        assert checker.check_lag().is_known is False
+
+    def test_replica_lag_from_cluster_state_monitor(self):
+        """Test that the monitor's latest state is read, not the port."""
+        port = FakeClusterStatePort(leader_txid=50)
+        monitor = SplitBrainMonitor(SplitBrainDetector(port))
+        unused_port = Mock()
+        checker = ReplicationLagChecker(
+            FakePositionReader(40),
+            _detector(False),
+            cluster_state_port=unused_port,
+            cluster_state_monitor=monitor,
+        )
+
+        assert checker.check_lag().primary_txid is None
+
+        monitor.run_once()
+        port.leader_txid = 70
+
+        assert checker.check_lag().txid_lag == 10
+        unused_port.get_cluster_state.assert_not_called()
+
+    def test_seconds_lag_estimated_from_primary_rate(self):
+        """Test that seconds lag uses the observed primary TXID rate."""
+        clock = FakeTimeProvider()
+        port = FakeClusterStatePort(leader_txid=100)
+        checker = ReplicationLagChecker(
+            FakePositionReader(100),
+            _detector(False),
+            cluster_state_port=port,
+            rate_tracker=TxidRateTracker(time_provider=clock),
+        )
+        checker.check_lag()
+
+        clock.now += 10
+        port.leader_txid = 200
+        lag = checker.check_lag()
+
+        assert lag.txid_lag == 100
+        assert lag.seconds_lag == pytest.approx(10.0)
+
+    def test_is_lagging_txid_threshold(self):
+        """Test that exceeding max_lag_txids counts as lagging."""
+        checker = ReplicationLagChecker(
+            FakePositionReader(0),
+            _detector(False),
+            settings=ReplicationSettings(max_lag_txids=10),
+        )
+
+        assert checker.is_lagging(ReplicationLag(txid_lag=10)) is False
+        assert checker.is_lagging(ReplicationLag(txid_lag=11)) is True
+
+    def test_is_lagging_seconds_threshold(self):
+        """Test that exceeding max_lag_seconds counts as lagging."""
+        checker = ReplicationLagChecker(
+            FakePositionReader(0),
+            _detector(False),
+            settings=ReplicationSettings(max_lag_seconds=5.0),
+        )
+
+        assert checker.is_lagging(ReplicationLag(txid_lag=1, seconds_lag=6.0)) is True
+
+    def test_unknown_lag_is_not_lagging(self):
+        """Test that an unknown lag never drains a replica."""
+        checker = ReplicationLagChecker(FakePositionReader(0), _detector(False))
+
+        assert checker.is_lagging(ReplicationLag()) is False
+
+    def test_emits_metrics(self):
+        """Test that local TXID and lag are emitted to the metrics port."""
+        metrics = FakeMetricsAdapter()
+        checker = ReplicationLagChecker(
+            FakePositionReader(40),
+            _detector(False),
+            cluster_state_port=FakeClusterStatePort(leader_txid=50),
+            metrics=metrics,
+        )
+
+        checker.check_lag()
+
+        assert metrics.current_local_txid == 40
+        assert metrics.current_replication_lag == (10, None)
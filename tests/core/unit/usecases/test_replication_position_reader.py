@@ -0,0 +1,49 @@
+"""Unit tests for ReplicationPositionReader use case."""
+
+import pytest
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.primary_detector import LiteFSNotRunningError
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestReplicationPositionReader:
+    """Test ReplicationPositionReader use case."""
+
+    def test_position_file_path(self, tmp_path):
+        """Test that the position file lives next to the database."""
+        reader = ReplicationPositionReader(str(tmp_path), "db.sqlite3")
+
+        assert reader.position_file == tmp_path / "db.sqlite3-pos"
+
+    def test_read_position(self, tmp_path):
+        """Test reading the position written by LiteFS."""
+        (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        reader = ReplicationPositionReader(str(tmp_path), "db.sqlite3")
+
+        assert reader.read_position() == ReplicationPosition(
+            txid=42, checksum="f8c4d8c1bbcbd4a2"
+        )
+
+    def test_missing_position_file_returns_none(self, tmp_path):
+        """Test that a database without a position file has no position."""
+        reader = ReplicationPositionReader(str(tmp_path), "db.sqlite3")
+
+        assert reader.read_position() is None
+
+    def test_missing_mount_raises_not_running(self, tmp_path):
+        """Test that a missing mount path raises LiteFSNotRunningError."""
+        reader = ReplicationPositionReader(str(tmp_path / "missing"), "db.sqlite3")
+
+        with pytest.raises(LiteFSNotRunningError):
+            reader.read_position()
+
+    def test_malformed_position_raises_config_error(self, tmp_path):
+        """Test that malformed content raises LiteFSConfigError."""
+        (tmp_path / "db.sqlite3-pos").write_text("garbage")
+        reader = ReplicationPositionReader(str(tmp_path), "db.sqlite3")
+
+        with pytest.raises(LiteFSConfigError):
+            reader.read_position()
@@ -0,0 +1,327 @@
+"""Unit tests for the TXID-versioned response cache use case."""
+
+import asyncio
+import threading
+
+import pytest
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.primary_detector import LiteFSNotRunningError
+from litefs.usecases.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    ResponseCacheKey,
+    ResponseCacheOptions,
+    cache_by_txid,
+    etag_matches,
+    get_cache_options,
+    is_cacheable_response,
+    read_position_or_none,
+    read_position_or_none_async,
+)
+
+
+def make_key(
+    txid: int = 5,
+    path: str = "/articles",
+    checksum: str = "abcd",
+    accept: str = "text/html",
+) -> ResponseCacheKey:
+    """Build a key for a request at a given position."""
+    headers = {"accept": accept}
+    return ResponseCacheKey.build(
+        path=path,
+        query_string="",
+        vary_headers=("Accept",),
+        get_header=lambda name: headers.get(name.lower()),
+        position=ReplicationPosition(txid=txid, checksum=checksum),
+    )
+
+
+def make_response(body: bytes = b"hello") -> CachedResponse:
+    """Build a cached 200 response."""
+    return CachedResponse(
+        status_code=200, headers=(("Content-Type", "text/html"),), body=body
+    )
+
+
+class StaticPositionReader:
+    """Position reader returning a fixed result or raising an error."""
+
+    def __init__(self, result: ReplicationPosition | Exception | None) -> None:
+        """Initialize with the result to return."""
+        self.result = result
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Return the configured position or raise the configured error."""
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestCacheByTxid:
+    """Test the cache_by_txid view decorator."""
+
+    def test_bare_decorator_marks_view(self):
+        """Test that the decorator marks the view and returns it unchanged."""
+
+        def view():
+            return "ok"
+
+        decorated = cache_by_txid(view)
+
+        assert decorated is view
+        assert get_cache_options(view) == ResponseCacheOptions()
+
+    def test_decorator_with_vary(self):
+        """Test per-view vary headers."""
+
+        @cache_by_txid(vary=["Accept-Language"])
+        def view():
+            return "ok"
+
+        assert get_cache_options(view) == ResponseCacheOptions(
+            vary_headers=("Accept-Language",)
+        )
+
+    def test_unmarked_view_has_no_options(self):
+        """Test that views without the decorator are not cached."""
+        assert get_cache_options(lambda: None) is None
+        assert get_cache_options(None) is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestResponseCacheKey:
+    """Test ResponseCacheKey construction and ETags."""
+
+    def test_vary_header_names_normalized(self):
+        """Test that vary header order and case do not change the key."""
+        position = ReplicationPosition(txid=1, checksum="ab")
+        headers = {"accept": "text/html", "accept-language": "en"}
+
+        def get_header(name: str) -> str | None:
+            return headers.get(name.lower())
+
+        first = ResponseCacheKey.build(
+            "/", "", ("Accept", "accept-language"), get_header, position
+        )
+        second = ResponseCacheKey.build(
+            "/", "", ("Accept-Language", "accept"), get_header, position
+        )
+
+        assert first == second
+        assert first.vary == (("accept", "text/html"), ("accept-language", "en"))
+
+    def test_etag_is_strong_and_starts_with_txid(self):
+        """Test ETag format."""
+        etag = make_key(txid=42).etag
+
+        assert etag.startswith('"000000000000002a-')
+        assert etag.endswith('"')
+        assert not etag.startswith("W/")
+
+    def test_etag_changes_with_position_and_variant(self):
+        """Test that ETags differ per TXID, checksum, path and vary value."""
+        base = make_key()
+
+        assert make_key().etag == base.etag
+        assert make_key(txid=6).etag != base.etag
+        assert make_key(checksum="ffff").etag != base.etag
+        assert make_key(path="/other").etag != base.etag
+        assert make_key(accept="application/json").etag != base.etag
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestEtagMatches:
+    """Test If-None-Match evaluation."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, False),
+            ("", False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"xyz", "abc"', True),
+            ("*", True),
+            ('"xyz"', False),
+        ],
+    )
+    def test_etag_matches(self, header, expected):
+        """Test weak comparison against the current ETag."""
+        assert etag_matches(header, '"abc"') is expected
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestIsCacheableResponse:
+    """Test which responses may be cached."""
+
+    def test_plain_ok_response_cacheable(self):
+        """Test that a 200 without cookies or restrictions is cacheable."""
+        assert is_cacheable_response(200, {"content-type": "text/html"}, ())
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"set-cookie": "session=1"},
+            {"cache-control": "private, max-age=60"},
+            {"cache-control": "no-store"},
+            {"vary": "Cookie"},
+        ],
+    )
+    def test_uncacheable_headers(self, headers):
+        """Test that cookies, private responses and unkeyed Vary are skipped."""
+        assert not is_cacheable_response(200, headers, ("Accept",))
+
+    def test_vary_covered_by_key_is_cacheable(self):
+        """Test that a Vary header covered by the key is fine."""
+        assert is_cacheable_response(200, {"vary": "accept"}, ("Accept",))
+
+    def test_non_200_not_cacheable(self):
+        """Test that only 200 responses are cached."""
+        assert not is_cacheable_response(404, {}, ())
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestReadPositionOrNone:
+    """Test read_position_or_none."""
+
+    def test_returns_position(self):
+        """Test that a readable position is returned."""
+        position = ReplicationPosition(txid=3, checksum="ab")
+
+        assert read_position_or_none(StaticPositionReader(position)) == position
+
+    @pytest.mark.parametrize(
+        "error",
+        [LiteFSNotRunningError("no mount"), LiteFSConfigError("malformed")],
+    )
+    def test_errors_treated_as_unknown(self, error):
+        """Test that read failures bypass the cache."""
+        assert read_position_or_none(StaticPositionReader(error)) is None
+
+    def test_async_variant_reads_off_the_event_loop(self):
+        """Test that the async variant reads the position in a worker thread."""
+        position = ReplicationPosition(txid=3, checksum="ab")
+        reader = StaticPositionReader(position)
+        readers: list[threading.Thread] = []
+        read_position = reader.read_position
+
+        def record_thread() -> ReplicationPosition | None:
+            readers.append(threading.current_thread())
+            return read_position()
+
+        reader.read_position = record_thread
+
+        assert asyncio.run(read_position_or_none_async(reader)) == position
+        assert readers and readers[0] is not threading.current_thread()
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestResponseCache:
+    """Test ResponseCache storage, invalidation and eviction."""
+
+    def test_miss_then_hit(self):
+        """Test that a stored response is served for the same key."""
+        cache = ResponseCache()
+        key = make_key()
+
+        assert cache.get(key) is None
+        assert cache.put(key, make_response())
+        assert cache.get(key) == make_response()
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_ratio == pytest.approx(0.5)
+
+    def test_hit_ratio_unknown_without_lookups(self):
+        """Test hit ratio before any lookup."""
+        assert ResponseCache().hit_ratio is None
+
+    def test_newer_txid_invalidates_entries(self):
+        """Test that advancing replication drops older entries."""
+        cache = ResponseCache()
+        cache.put(make_key(txid=5, path="/a"), make_response())
+        cache.put(make_key(txid=5, path="/b"), make_response())
+
+        assert cache.get(make_key(txid=6, path="/a")) is None
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    def test_changed_checksum_invalidates_entries(self):
+        """Test that a restored database with the same TXID drops entries."""
+        cache = ResponseCache()
+        cache.put(make_key(checksum="aaaa"), make_response())
+
+        assert cache.get(make_key(checksum="bbbb")) is None
+        assert len(cache) == 0
+
+    def test_outdated_position_not_stored(self):
+        """Test that a response rendered before the latest TXID is skipped."""
+        cache = ResponseCache()
+        cache.put(make_key(txid=6), make_response())
+
+        assert not cache.put(make_key(txid=5), make_response())
+        assert cache.get(make_key(txid=6)) is not None
+
+    def test_oversized_entry_not_stored(self):
+        """Test max_entry_bytes."""
+        cache = ResponseCache(max_bytes=10_000, max_entry_bytes=4)
+
+        assert not cache.put(make_key(), make_response(b"hello"))
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_size(self):
+        """Test that least recently used entries are evicted beyond max_bytes."""
+        entry_size = make_response(b"x" * 100).size
+        cache = ResponseCache(max_bytes=entry_size * 2, max_entry_bytes=100)
+        cache.put(make_key(path="/a"), make_response(b"x" * 100))
+        cache.put(make_key(path="/b"), make_response(b"x" * 100))
+        cache.get(make_key(path="/a"))
+        cache.put(make_key(path="/c"), make_response(b"x" * 100))
+
+        assert cache.get(make_key(path="/a")) is not None
+        assert cache.get(make_key(path="/b")) is None
+        assert cache.get(make_key(path="/c")) is not None
+        assert cache.size_bytes <= entry_size * 2
+
+    def test_replacing_entry_keeps_size_consistent(self):
+        """Test that storing the same key twice does not double count."""
+        cache = ResponseCache()
+        cache.put(make_key(), make_response())
+        cache.put(make_key(), make_response())
+
+        assert len(cache) == 1
+        assert cache.size_bytes == make_response().size
+
+    def test_clear(self):
+        """Test that clear drops entries but keeps counters."""
+        cache = ResponseCache()
+        cache.put(make_key(), make_response())
+        cache.get(make_key())
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 1
+
+    def test_emits_metrics(self):
+        """Test that lookups and stores update the cache metrics."""
+        metrics = FakeMetricsAdapter()
+        cache = ResponseCache(metrics=metrics)
+        key = make_key()
+
+        cache.get(key)
+        cache.put(key, make_response())
+        cache.get(key)
+
+        assert metrics.current_response_cache_stats == (
+            1,
+            1,
+            make_response().size,
+        )
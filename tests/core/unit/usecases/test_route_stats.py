@@ -0,0 +1,115 @@
+"""Unit tests for per-route traffic statistics."""
+
+import random
+
+import pytest
+from litefs.usecases.route_stats import (
+    OVERFLOW_ROUTE,
+    LatencySketch,
+    RouteSample,
+    RouteStatsCollector,
+)
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.RouteStats")]
+
+
+class TestLatencySketch:
+    """Test quantile estimation with bounded memory."""
+
+    def test_empty_sketch(self) -> None:
+        """An empty sketch reports no quantiles."""
+        sketch = LatencySketch()
+
+        assert sketch.count == 0
+        assert sketch.quantile(0.5) is None
+        assert sketch.mean is None
+        assert sketch.max is None
+
+    def test_quantiles_within_relative_accuracy(self) -> None:
+        """Quantiles stay within the relative accuracy of the exact ones."""
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(-4, 1.5) for _ in range(10_000))
+        sketch = LatencySketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = values[round(q * (len(values) - 1))]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+        assert sketch.max == values[-1]
+
+    def test_buckets_are_bounded(self) -> None:
+        """Repeated values do not grow the sketch."""
+        sketch = LatencySketch()
+        for _ in range(1000):
+            sketch.add(0.005)
+            sketch.add(0.0)
+
+        assert len(sketch._buckets) == 1
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(1.0) == pytest.approx(0.005, rel=0.01)
+
+
+class TestRouteStatsCollector:
+    """Test per-route aggregation."""
+
+    def test_records_forwarding_outcome(self) -> None:
+        """Forwarded requests add their retries and failures."""
+        collector = RouteStatsCollector(clock=lambda: 1000.0)
+
+        collector.record("GET", "/items/<int:pk>", 0.002, request_bytes=0)
+        collector.record(
+            "POST",
+            "/items/",
+            0.050,
+            RouteSample(forwarded=True, retries=2, failed=True),
+            request_bytes=120,
+            response_bytes=40,
+        )
+        collector.record("POST", "/items/", 0.030, RouteSample(forwarded=True))
+
+        snapshot = collector.snapshot()
+        assert snapshot["since"] == 1000.0
+        post, get = snapshot["routes"]
+        assert post["method"] == "POST"
+        assert post["requests"] == 2
+        assert post["forwarded"] == 2
+        assert post["retries"] == 2
+        assert post["failures"] == 1
+        assert post["request_bytes"] == 120
+        assert post["response_bytes"] == 40
+        assert post["latency"]["count"] == 2
+        assert post["latency"]["max_ms"] == 50.0
+        assert get["forwarded"] == 0
+        assert get["latency"]["p50_ms"] == pytest.approx(2.0, rel=0.01)
+
+    def test_overflow_routes_are_aggregated(self) -> None:
+        """Routes beyond max_routes share one overflow entry."""
+        collector = RouteStatsCollector(max_routes=2)
+
+        for i in range(5):
+            collector.record("GET", f"/route-{i}", 0.001)
+        collector.record("GET", "/route-0", 0.001)
+
+        routes = {
+            (route["method"], route["route"]): route
+            for route in collector.snapshot()["routes"]
+        }
+        assert len(routes) == 3
+        assert routes[("GET", "/route-0")]["requests"] == 2
+        assert routes[("*", OVERFLOW_ROUTE)]["requests"] == 3
+
+    def test_reset_starts_new_period(self) -> None:
+        """Reset discards routes and moves the period start."""
+        now = [1000.0]
+        collector = RouteStatsCollector(clock=lambda: now[0])
+        collector.record("GET", "/", 0.001)
+
+        now[0] = 2000.0
+        collector.reset()
+
+        assert collector.snapshot() == {
+            "since": 2000.0,
+            "max_routes": 200,
+            "routes": [],
+        }
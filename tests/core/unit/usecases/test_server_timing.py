@@ -0,0 +1,88 @@
+"""Unit tests for per-request Server-Timing spans."""
+
+import threading
+import time
+from contextvars import copy_context
+
+import pytest
+from litefs.usecases.server_timing import (
+    PRIMARY_CHECK_SPAN,
+    ServerTiming,
+    TimingSpan,
+    collect_server_timing,
+    record_span,
+)
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.ServerTiming")]
+
+
+class TestTimingSpan:
+    """Test formatting of Server-Timing entries."""
+
+    def test_entry_in_milliseconds(self) -> None:
+        """Durations are reported in milliseconds."""
+        span = TimingSpan("litefs-primary", 0.0012345)
+
+        assert span.to_header_entry() == "litefs-primary;dur=1.234"
+
+    def test_description_is_quoted_and_escaped(self) -> None:
+        """Descriptions are quoted strings with quotes escaped."""
+        span = TimingSpan("litefs-forward", 0.01, 'attempt "1"')
+
+        assert span.to_header_entry() == (
+            'litefs-forward;desc="attempt \\"1\\"";dur=10.000'
+        )
+
+
+class TestServerTiming:
+    """Test collecting spans of a request."""
+
+    def test_header_value_joins_spans_in_order(self) -> None:
+        """Spans are reported in the order they were recorded."""
+        timing = ServerTiming()
+        timing.record("litefs-split-brain", 0.001)
+        timing.record("total", 0.002)
+
+        assert timing.header_value() == "litefs-split-brain;dur=1.000, total;dur=2.000"
+
+    def test_log_fields(self) -> None:
+        """Spans are converted to JSON-serializable fields."""
+        timing = ServerTiming()
+        timing.record("litefs-db-lock", 0.0005, "IMMEDIATE")
+
+        assert timing.to_log_fields() == [
+            {"name": "litefs-db-lock", "dur_ms": 0.5, "desc": "IMMEDIATE"}
+        ]
+
+    def test_record_span_without_collector_is_noop(self) -> None:
+        """Spans recorded outside a collecting request are dropped."""
+        record_span(PRIMARY_CHECK_SPAN, time.perf_counter())
+
+        with collect_server_timing() as timing:
+            pass
+
+        assert timing.spans == ()
+
+    def test_collects_spans_recorded_in_block(self) -> None:
+        """Spans recorded inside the block are collected, then collection stops."""
+        with collect_server_timing() as timing:
+            record_span(PRIMARY_CHECK_SPAN, time.perf_counter(), "check")
+        record_span(PRIMARY_CHECK_SPAN, time.perf_counter())
+
+        assert [(span.name, span.description) for span in timing.spans] == [
+            (PRIMARY_CHECK_SPAN, "check")
+        ]
+        assert timing.spans[0].duration >= 0
+
+    def test_collector_follows_copied_context(self) -> None:
+        """Threads running in a copy of the request context record spans."""
+        with collect_server_timing() as timing:
+            context = copy_context()
+            thread = threading.Thread(
+                target=context.run,
+                args=(record_span, PRIMARY_CHECK_SPAN, time.perf_counter()),
+            )
+            thread.start()
+            thread.join()
+
+        assert [span.name for span in timing.spans] == [PRIMARY_CHECK_SPAN]
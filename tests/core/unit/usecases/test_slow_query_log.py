@@ -0,0 +1,148 @@
+"""Unit tests for the slow-query log."""
+
+import pytest
+from litefs.usecases.slow_query_log import (
+    OVERFLOW_FINGERPRINT,
+    SlowQueryLog,
+    fingerprint,
+    fingerprint_id,
+    has_full_scan,
+)
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.SlowQueryLog")]
+
+
+class TestFingerprint:
+    """Test statement normalization."""
+
+    def test_literals_and_placeholders_normalized(self) -> None:
+        """Executions with other arguments share a fingerprint."""
+        first = fingerprint("SELECT * FROM t WHERE a = 1 AND b = 'x''y'")
+        second = fingerprint("SELECT *  FROM t\n WHERE a = %s AND b = %s")
+
+        assert first == second == "SELECT * FROM t WHERE a = ? AND b = ?"
+
+    def test_in_lists_collapsed(self) -> None:
+        """IN lists of any length share a fingerprint."""
+        assert fingerprint("SELECT id FROM t WHERE id IN (%s, %s, %s)") == (
+            fingerprint("SELECT id FROM t WHERE id IN (1)")
+        )
+
+    def test_identifiers_with_digits_kept(self) -> None:
+        """Digits inside identifiers are not literals."""
+        assert fingerprint("SELECT col1 FROM t2") == "SELECT col1 FROM t2"
+
+    def test_fingerprint_id_is_short_and_stable(self) -> None:
+        """The identifier is 12 hex characters derived from the fingerprint."""
+        ident = fingerprint_id("SELECT ?")
+
+        assert ident == fingerprint_id("SELECT ?")
+        assert len(ident) == 12
+        assert ident != fingerprint_id("SELECT ? FROM t")
+
+
+class TestHasFullScan:
+    """Test full table scan detection in query plans."""
+
+    @pytest.mark.parametrize(
+        ("plan", "expected"),
+        [
+            (["SCAN articles"], True),
+            (["SCAN TABLE articles"], True),
+            (["SEARCH articles USING INTEGER PRIMARY KEY (rowid=?)"], False),
+            (["SCAN articles USING COVERING INDEX idx_title"], False),
+            ([], False),
+        ],
+    )
+    def test_detects_scans_without_index(self, plan: list[str], expected: bool) -> None:
+        """Only scans not using an index are full scans."""
+        assert has_full_scan(plan) is expected
+
+
+class TestSlowQueryLog:
+    """Test recording and bounding of slow statements."""
+
+    def test_threshold(self) -> None:
+        """Statements at or above the threshold are slow."""
+        log = SlowQueryLog(threshold=0.1)
+
+        assert log.is_slow(0.1)
+        assert not log.is_slow(0.099)
+
+    def test_buffer_is_bounded_but_counts_are_not(self) -> None:
+        """The buffer keeps the newest entries; counts include dropped ones."""
+        log = SlowQueryLog(threshold=0.0, capacity=2)
+        for i in range(5):
+            log.record(f"SELECT * FROM t WHERE id = {i}", 0.5)
+
+        assert [entry.sql for entry in log.entries()] == [
+            "SELECT * FROM t WHERE id = 3",
+            "SELECT * FROM t WHERE id = 4",
+        ]
+        assert log.counts() == {"SELECT * FROM t WHERE id = ?": 5}
+
+    def test_overflow_fingerprints_are_aggregated(self) -> None:
+        """Fingerprints beyond max_fingerprints share one count."""
+        log = SlowQueryLog(threshold=0.0, max_fingerprints=2)
+        for table in ("a", "b", "c", "d", "a"):
+            log.record(f"SELECT * FROM {table}", 0.5)
+
+        assert log.counts() == {
+            "SELECT * FROM a": 2,
+            "SELECT * FROM b": 1,
+            OVERFLOW_FINGERPRINT: 2,
+        }
+
+    def test_plan_flags_full_scan(self) -> None:
+        """Entries with a plan report whether it scans a whole table."""
+        log = SlowQueryLog(threshold=0.0)
+
+        with_plan = log.record("SELECT * FROM t", 0.5, ["SCAN t"])
+        without_plan = log.record("SELECT * FROM t", 0.5)
+
+        assert with_plan.plan == ("SCAN t",)
+        assert with_plan.full_scan is True
+        assert without_plan.plan is None
+        assert without_plan.full_scan is None
+
+    def test_should_explain_samples_with_rng(self) -> None:
+        """Plans are captured when the random draw is below the rate."""
+        draws = iter([0.05, 0.5])
+        log = SlowQueryLog(threshold=0.0, explain_rate=0.1, rng=lambda: next(draws))
+
+        assert log.should_explain()
+        assert not log.should_explain()
+        assert not SlowQueryLog(threshold=0.0, explain_rate=0.0).should_explain()
+
+    def test_snapshot(self) -> None:
+        """The snapshot lists counts by frequency and entries newest first."""
+        log = SlowQueryLog(threshold=0.25, clock=lambda: 1000.0)
+        log.record("SELECT * FROM a", 0.5)
+        log.record("SELECT * FROM b WHERE id = 1", 0.3, ["SCAN b"])
+        log.record("SELECT * FROM b WHERE id = 2", 0.3)
+
+        snapshot = log.snapshot()
+
+        assert snapshot["threshold_ms"] == 250.0
+        assert [count["count"] for count in snapshot["counts"]] == [2, 1]
+        assert snapshot["counts"][0]["fingerprint"] == "SELECT * FROM b WHERE id = ?"
+        assert snapshot["entries"][0]["sql"] == "SELECT * FROM b WHERE id = 2"
+        assert snapshot["entries"][1] == {
+            "fingerprint_id": fingerprint_id("SELECT * FROM b WHERE id = ?"),
+            "fingerprint": "SELECT * FROM b WHERE id = ?",
+            "sql": "SELECT * FROM b WHERE id = 1",
+            "duration_ms": 300.0,
+            "timestamp": 1000.0,
+            "plan": ["SCAN b"],
+            "full_scan": True,
+        }
+
+    def test_clear(self) -> None:
+        """Clear discards entries and counts."""
+        log = SlowQueryLog(threshold=0.0)
+        log.record("SELECT 1", 0.5)
+
+        log.clear()
+
+        assert log.entries() == []
+        assert log.counts() == {}
@@ -1,9 +1,16 @@
 """Unit tests for SplitBrainDetector use case."""
 
+import threading
+from unittest.mock import Mock
+
 import pytest
 from hypothesis import given, strategies as st
 
-from litefs.usecases.split_brain_detector import SplitBrainDetector, SplitBrainStatus
+from litefs.usecases.split_brain_detector import (
+    SplitBrainDetector,
+    SplitBrainMonitor,
+    SplitBrainStatus,
+)
 from litefs.domain.split_brain import RaftNodeState, RaftClusterState
 from litefs.adapters.ports import SplitBrainDetectorPort
 
@@ -55,6 +62,20 @@ class TestSplitBrainDetector:
         assert len(status.leader_nodes) == 1
         assert status.leader_nodes[0].node_id == "node1"
 
+    def test_status_records_cluster_state(self) -> None:
+        """Test that the status keeps the cluster state it was made from."""
+        cluster = RaftClusterState(
+            nodes=[
+                RaftNodeState(node_id="node1", is_leader=True),
+                RaftNodeState(node_id="node2", is_leader=False, reachable=False),
+            ]
+        )
+        detector = SplitBrainDetector(port=MockSplitBrainDetectorPort(cluster))
+
+        status = detector.detect_split_brain()
+
+        assert status.cluster_state is cluster
+
     def test_detect_split_brain_two_leaders(self) -> None:
         """Test detection when cluster has two leaders (split-brain)."""
         cluster = RaftClusterState(
@@ -390,3 +411,81 @@ class TestSplitBrainDetectorPBT:
 
         # All results should be identical
         assert all(r.is_split_brain == results[0].is_split_brain for r in results)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestSplitBrainMonitor:
+    """Test background split-brain detection."""
+
+    def test_latest_is_none_before_first_round(self) -> None:
+        """Test that no status is known before a round completes."""
+        monitor = SplitBrainMonitor(SplitBrainDetector(MockSplitBrainDetectorPort()))
+
+        assert monitor.latest() is None
+
+    def test_run_once_keeps_status(self) -> None:
+        """Test that a round's status is returned by latest()."""
+        cluster = RaftClusterState(
+            nodes=[
+                RaftNodeState(node_id="node1", is_leader=True),
+                RaftNodeState(node_id="node2", is_leader=True),
+            ]
+        )
+        monitor = SplitBrainMonitor(
+            SplitBrainDetector(MockSplitBrainDetectorPort(cluster))
+        )
+
+        status = monitor.run_once()
+
+        assert status is not None and status.is_split_brain
+        assert monitor.latest() is status
+
+    def test_failed_round_clears_status(self) -> None:
+        """Test that a failing detector leaves no stale status."""
+        detector = Mock()
+        detector.detect_split_brain.side_effect = [
+            SplitBrainStatus(is_split_brain=False, leader_nodes=[]),
+            ConnectionError("peer unreachable"),
+        ]
+        monitor = SplitBrainMonitor(detector)
+
+        monitor.run_once()
+        assert monitor.run_once() is None
+        assert monitor.latest() is None
+
+    def test_listeners_notified_after_each_round(self) -> None:
+        """Test that listeners get every status, even if one fails."""
+        detector = Mock()
+        status = SplitBrainStatus(is_split_brain=False, leader_nodes=[])
+        detector.detect_split_brain.side_effect = [
+            status,
+            ConnectionError("peer unreachable"),
+        ]
+        monitor = SplitBrainMonitor(detector)
+        failing = Mock(side_effect=RuntimeError("listener bug"))
+        received: list[SplitBrainStatus | None] = []
+        monitor.add_listener(failing)
+        monitor.add_listener(received.append)
+
+        monitor.run_once()
+        monitor.run_once()
+
+        assert received == [status, None]
+        assert failing.call_count == 2
+
+    def test_start_and_stop(self) -> None:
+        """Test that the background thread runs rounds until stopped."""
+        ran = threading.Event()
+        detector = Mock()
+        detector.detect_split_brain.side_effect = lambda: ran.set()
+        monitor = SplitBrainMonitor(detector, interval=0.01)
+
+        monitor.start()
+        try:
+            assert ran.wait(2.0)
+            assert monitor.is_running
+        finally:
+            monitor.stop(timeout=1.0)
+
+        assert not monitor.is_running
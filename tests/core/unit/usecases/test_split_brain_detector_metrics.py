@@ -7,6 +7,7 @@ import pytest
 from litefs.usecases.split_brain_detector import SplitBrainDetector
 from litefs.domain.split_brain import RaftClusterState, RaftNodeState
 from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.metrics import CLUSTER_STATE_REFRESH_DURATION
 
 
 class FakeSplitBrainDetectorPort:
@@ -104,3 +105,18 @@ class TestSplitBrainDetectorMetrics:
 
         detector.detect_split_brain()
         assert len(metrics.calls) == 2
+
+    def test_observes_cluster_state_refresh_duration(self) -> None:
+        """Each detection should observe the cluster state read time."""
+        metrics = FakeMetricsAdapter()
+        port = FakeSplitBrainDetectorPort(
+            nodes=[RaftNodeState(node_id="node-1", is_leader=True)]
+        )
+        detector = SplitBrainDetector(port=port, metrics=metrics)
+
+        detector.detect_split_brain()
+        detector.detect_split_brain()
+
+        durations = metrics.histogram_values(CLUSTER_STATE_REFRESH_DURATION)
+        assert len(durations) == 2
+        assert all(duration >= 0 for duration in durations)
@@ -73,6 +73,55 @@ class TestSQLDetector:
         assert detector.is_write_operation("WITH UPDATE AS (SELECT 1) UPDATE test SET x = 1") is True
 
 
-
-
-
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestSQLDetectorQueryClassification:
+    """Test query, transaction control and table name classification."""
+
+    @pytest.mark.parametrize(
+        "sql",
+        ["BEGIN IMMEDIATE", "COMMIT", "END", "ROLLBACK", "SAVEPOINT s1", "RELEASE s1"],
+    )
+    def test_is_transaction_control(self, sql):
+        """Test transaction control statements."""
+        assert SQLDetector().is_transaction_control(sql) is True
+
+    @pytest.mark.parametrize(
+        "sql", ["SELECT 1", "INSERT INTO t VALUES (1)", "PRAGMA journal_mode=WAL"]
+    )
+    def test_is_not_transaction_control(self, sql):
+        """Test that other statements are not transaction control."""
+        assert SQLDetector().is_transaction_control(sql) is False
+
+    def test_is_query(self):
+        """Test that only read-only SELECT/WITH/VALUES statements are queries."""
+        detector = SQLDetector()
+        assert detector.is_query("SELECT * FROM test") is True
+        assert detector.is_query("/* c */ WITH c AS (SELECT 1) SELECT * FROM c") is True
+        assert detector.is_query("WITH c AS (SELECT 1) DELETE FROM test") is False
+        assert detector.is_query("PRAGMA table_info(test)") is False
+        assert detector.is_query("EXPLAIN QUERY PLAN SELECT 1") is False
+        assert detector.is_query("BEGIN") is False
+
+    @pytest.mark.parametrize(
+        ("sql", "expected"),
+        [
+            ("SELECT * FROM articles WHERE id = ?", {"articles"}),
+            ('SELECT * FROM "Articles" a JOIN authors ON 1', {"articles", "authors"}),
+            ("SELECT * FROM a, b AS bb, main.c", {"a", "b", "c"}),
+            ("INSERT INTO [logs] (msg) VALUES ('FROM secrets')", {"logs"}),
+            ("UPDATE `users` SET name = ?", {"users"}),
+            ("DELETE FROM sessions WHERE expired", {"sessions"}),
+            ("INSERT OR REPLACE INTO kv VALUES (1, 2)", {"kv"}),
+            ("CREATE TABLE IF NOT EXISTS t (id INTEGER)", {"t"}),
+            ("SELECT 1", set()),
+        ],
+    )
+    def test_extract_table_names(self, sql, expected):
+        """Test table names extracted from reads and writes."""
+        assert SQLDetector().extract_table_names(sql) == frozenset(expected)
+
+    @pytest.mark.parametrize("sql", ["CREATE INDEX i ON t (a)", "VACUUM"])
+    def test_extract_table_names_unknown_for_writes(self, sql):
+        """Test that writes without recognizable tables return None."""
+        assert SQLDetector().extract_table_names(sql) is None
@@ -0,0 +1,71 @@
+"""Unit tests for tracing spans and the current trace context."""
+
+import pytest
+from litefs.adapters.fakes.fake_tracer import InMemoryTracer
+from litefs.adapters.ports import NoOpTracer, TracerPort
+from litefs.domain.tracing import TraceContext
+from litefs.usecases.tracing import current_trace_context, trace_span
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("UseCase.Tracing")]
+
+INCOMING = TraceContext.from_traceparent(
+    "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+)
+
+
+class TestTraceSpan:
+    """Test opening spans around a block."""
+
+    def test_nested_spans_form_a_tree(self) -> None:
+        """Spans default to the current span as their parent."""
+        tracer = InMemoryTracer()
+
+        with (
+            trace_span(tracer, "outer", parent=INCOMING),
+            trace_span(tracer, "inner", {"litefs.forward.attempt": 1}),
+        ):
+            pass
+
+        outer, inner = tracer.spans
+        assert outer.parent == INCOMING
+        assert inner.is_child_of(outer)
+        assert inner.context.trace_id == INCOMING.trace_id
+        assert inner.attributes == {"litefs.forward.attempt": 1}
+        assert outer.ended and inner.ended
+
+    def test_current_context_is_restored(self) -> None:
+        """The span is current only inside the block."""
+        tracer = InMemoryTracer()
+
+        with trace_span(tracer, "outer") as span:
+            assert current_trace_context() == span.context
+
+        assert current_trace_context() is None
+
+    def test_error_type_recorded(self) -> None:
+        """An escaping exception is recorded and re-raised."""
+        tracer = InMemoryTracer()
+
+        with pytest.raises(ConnectionError), trace_span(tracer, "litefs.forward"):
+            raise ConnectionError("refused")
+
+        (span,) = tracer.spans
+        assert span.attributes["error.type"] == "ConnectionError"
+        assert span.ended
+
+
+class TestNoOpTracer:
+    """Test the default tracer."""
+
+    def test_satisfies_tracer_port(self) -> None:
+        """NoOpTracer satisfies the TracerPort protocol."""
+        assert isinstance(NoOpTracer(), TracerPort)
+        assert isinstance(InMemoryTracer(), TracerPort)
+
+    def test_propagates_incoming_context(self) -> None:
+        """Without a tracer, the incoming context stays current."""
+        with trace_span(NoOpTracer(), "outer", parent=INCOMING):
+            assert current_trace_context() == INCOMING
+
+        with trace_span(NoOpTracer(), "outer"):
+            assert current_trace_context() is None
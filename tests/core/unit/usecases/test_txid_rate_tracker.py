@@ -0,0 +1,94 @@
+"""Unit tests for TxidRateTracker use case."""
+
+import pytest
+from litefs.usecases.txid_rate_tracker import TxidRateTracker
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider with a manually advanced clock."""
+
+    def __init__(self, start: float = 1000.0) -> None:
+        """Initialize with a starting time."""
+        self.now = start
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestTxidRateTracker:
+    """Test TxidRateTracker use case."""
+
+    def test_rate_unknown_with_single_sample(self):
+        """Test that one sample is not enough to compute a rate."""
+        tracker = TxidRateTracker(time_provider=FakeTimeProvider())
+        tracker.record(10)
+
+        assert tracker.get_rate() is None
+
+    def test_rate_from_samples(self):
+        """Test rate computed from oldest and newest samples."""
+        clock = FakeTimeProvider()
+        tracker = TxidRateTracker(time_provider=clock)
+        tracker.record(100)
+        clock.now += 10
+        tracker.record(150)
+
+        assert tracker.get_rate() == pytest.approx(5.0)
+
+    def test_old_samples_pruned(self):
+        """Test that samples outside the window are discarded."""
+        clock = FakeTimeProvider()
+        tracker = TxidRateTracker(window_seconds=10.0, time_provider=clock)
+        tracker.record(0)
+        clock.now += 20
+        tracker.record(1000)
+        clock.now += 5
+        tracker.record(1010)
+
+        assert tracker.get_rate() == pytest.approx(2.0)
+
+    def test_txid_going_backwards_resets_window(self):
+        """Test that a lower TXID (e.g., restore) discards earlier samples."""
+        clock = FakeTimeProvider()
+        tracker = TxidRateTracker(time_provider=clock)
+        tracker.record(500)
+        clock.now += 1
+        tracker.record(10)
+
+        assert tracker.get_rate() is None
+
+    def test_estimate_seconds(self):
+        """Test converting a TXID lag into seconds."""
+        clock = FakeTimeProvider()
+        tracker = TxidRateTracker(time_provider=clock)
+        tracker.record(0)
+        clock.now += 10
+        tracker.record(100)
+
+        assert tracker.estimate_seconds(50) == pytest.approx(5.0)
+
+    def test_estimate_seconds_zero_lag(self):
+        """Test that no lag is zero seconds even without a rate."""
+        tracker = TxidRateTracker(time_provider=FakeTimeProvider())
+
+        assert tracker.estimate_seconds(0) == 0.0
+
+    def test_estimate_seconds_unknown_rate(self):
+        """Test that lag cannot be estimated without a rate."""
+        tracker = TxidRateTracker(time_provider=FakeTimeProvider())
+        tracker.record(5)
+
+        assert tracker.estimate_seconds(10) is None
+
+    def test_estimate_seconds_idle_primary(self):
+        """Test that a stalled TXID gives no seconds estimate."""
+        clock = FakeTimeProvider()
+        tracker = TxidRateTracker(time_provider=clock)
+        tracker.record(5)
+        clock.now += 10
+        tracker.record(5)
+
+        assert tracker.estimate_seconds(3) is None
@@ -0,0 +1,214 @@
+"""Unit tests for TxidWaiter use case."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from litefs.domain.exceptions import LiteFSConfigError
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.change_bus import ChangeBus
+from litefs.usecases.txid_waiter import TxidWaiter
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider advanced by FakeSleeper."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at zero."""
+        self.now = 0.0
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+class FakeSleeper:
+    """Fake Sleeper that advances the fake clock and records sleeps."""
+
+    def __init__(self, clock: FakeTimeProvider) -> None:
+        """Initialize with the clock to advance."""
+        self.clock = clock
+        self.sleeps: list[float] = []
+
+    def sleep(self, seconds: float) -> None:
+        """Record the sleep and advance the clock."""
+        self.sleeps.append(seconds)
+        self.clock.now += seconds
+
+
+class SequencePositionReader:
+    """Position reader returning a sequence of TXIDs, repeating the last."""
+
+    def __init__(self, txids: list[int | None]) -> None:
+        """Initialize with the TXIDs to return on successive reads."""
+        self.txids = txids
+        self.reads = 0
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Return the next TXID in the sequence."""
+        txid = self.txids[min(self.reads, len(self.txids) - 1)]
+        self.reads += 1
+        if txid is None:
+            return None
+        return ReplicationPosition(txid=txid, checksum="0")
+
+
+class MutablePositionReader:
+    """Position reader whose TXID is changed by the test."""
+
+    def __init__(self, txid: int) -> None:
+        """Initialize with the starting TXID."""
+        self.txid = txid
+
+    def read_position(self) -> ReplicationPosition:
+        """Return the current TXID."""
+        return ReplicationPosition(txid=self.txid, checksum="0")
+
+
+def _apply_later(reader: MutablePositionReader, txid: int) -> threading.Timer:
+    """Set the reader's TXID shortly after the wait starts."""
+    timer = threading.Timer(0.05, lambda: setattr(reader, "txid", txid))
+    timer.start()
+    return timer
+
+
+def _waiter(
+    reader: SequencePositionReader,
+) -> tuple[TxidWaiter, FakeSleeper]:
+    clock = FakeTimeProvider()
+    sleeper = FakeSleeper(clock)
+    waiter = TxidWaiter(
+        reader,
+        time_provider=clock,
+        sleeper=sleeper,
+        poll_interval=0.01,
+        max_poll_interval=0.04,
+    )
+    return waiter, sleeper
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("UseCase")
+class TestTxidWaiter:
+    """Test TxidWaiter use case."""
+
+    def test_already_caught_up_returns_without_sleeping(self):
+        """Test that no wait happens when the TXID is already applied."""
+        waiter, sleeper = _waiter(SequencePositionReader([10]))
+
+        assert waiter.wait_for_txid(10, timeout=1.0) is True
+        assert sleeper.sleeps == []
+
+    def test_waits_until_txid_applied(self):
+        """Test that the wait returns once the local TXID catches up."""
+        waiter, sleeper = _waiter(SequencePositionReader([5, 7, 9, 10]))
+
+        assert waiter.wait_for_txid(10, timeout=1.0) is True
+        assert len(sleeper.sleeps) == 3
+
+    def test_poll_interval_backs_off(self):
+        """Test that wake-ups back off exponentially up to the maximum."""
+        waiter, sleeper = _waiter(SequencePositionReader([1, 1, 1, 1, 1, 10]))
+
+        waiter.wait_for_txid(10, timeout=1.0)
+
+        assert sleeper.sleeps == pytest.approx([0.01, 0.02, 0.04, 0.04, 0.04])
+
+    def test_times_out(self):
+        """Test that the wait gives up at the deadline."""
+        waiter, sleeper = _waiter(SequencePositionReader([1]))
+
+        assert waiter.wait_for_txid(10, timeout=0.1) is False
+        assert sum(sleeper.sleeps) == pytest.approx(0.1)
+
+    def test_missing_position_file_is_not_caught_up(self):
+        """Test that an unknown position never satisfies a token."""
+        waiter, _ = _waiter(SequencePositionReader([None]))
+
+        assert waiter.is_caught_up(0) is False
+
+    def test_read_errors_treated_as_unknown(self):
+        """Test that position read errors yield an unknown TXID."""
+
+        class FailingReader:
+            def read_position(self):
+                raise LiteFSConfigError("malformed")
+
+        waiter = TxidWaiter(FailingReader())
+
+        assert waiter.current_txid() is None
+
+    def test_async_wait(self):
+        """Test the asynchronous wait variant."""
+        waiter = TxidWaiter(
+            SequencePositionReader([5, 10]), poll_interval=0.001
+        )
+
+        assert asyncio.run(waiter.wait_for_txid_async(10, timeout=1.0)) is True
+
+    def test_async_wait_times_out(self):
+        """Test that the asynchronous wait gives up at the deadline."""
+        waiter = TxidWaiter(
+            SequencePositionReader([5]), poll_interval=0.001, max_poll_interval=0.005
+        )
+
+        assert asyncio.run(waiter.wait_for_txid_async(10, timeout=0.02)) is False
+
+    def test_change_bus_event_wakes_wait(self):
+        """Test that a running change bus wakes the wait instead of polling."""
+        reader = MutablePositionReader(5)
+        bus = ChangeBus(reader, poll_interval=0.01, min_interval=0.0)
+        sleeper = FakeSleeper(FakeTimeProvider())
+        waiter = TxidWaiter(
+            reader,
+            sleeper=sleeper,
+            poll_interval=10.0,
+            max_poll_interval=10.0,
+            change_bus=bus,
+        )
+        bus.start()
+        try:
+            started = time.monotonic()
+            timer = _apply_later(reader, 10)
+
+            assert waiter.wait_for_txid(10, timeout=5.0) is True
+            assert time.monotonic() - started < 2.0
+            assert sleeper.sleeps == []
+            timer.join()
+        finally:
+            bus.stop(timeout=1.0)
+
+    def test_change_bus_event_wakes_async_wait(self):
+        """Test that a running change bus wakes the asynchronous wait."""
+        reader = MutablePositionReader(5)
+        bus = ChangeBus(reader, poll_interval=0.01, min_interval=0.0)
+        waiter = TxidWaiter(
+            reader, poll_interval=10.0, max_poll_interval=10.0, change_bus=bus
+        )
+        bus.start()
+        try:
+            started = time.monotonic()
+            timer = _apply_later(reader, 10)
+
+            assert asyncio.run(waiter.wait_for_txid_async(10, timeout=5.0)) is True
+            assert time.monotonic() - started < 2.0
+            timer.join()
+        finally:
+            bus.stop(timeout=1.0)
+
+    def test_stopped_change_bus_falls_back_to_polling(self):
+        """Test that waits poll when the change bus is not running."""
+        reader = SequencePositionReader([5, 10])
+        clock = FakeTimeProvider()
+        sleeper = FakeSleeper(clock)
+        waiter = TxidWaiter(
+            reader,
+            time_provider=clock,
+            sleeper=sleeper,
+            poll_interval=0.01,
+            change_bus=ChangeBus(reader),
+        )
+
+        assert waiter.wait_for_txid(10, timeout=1.0) is True
+        assert sleeper.sleeps == [0.01]
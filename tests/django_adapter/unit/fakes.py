@@ -202,6 +202,9 @@ class FakeHealthChecker:
         from litefs.domain.health import HealthStatus
 
         self._health_status = HealthStatus(state=health_status)  # type: ignore[arg-type]
+        self.last_replication_lag = None
+        self.replica_lagging = False
+        self.failing_probes: tuple[str, ...] = ()
 
     def check_health(self) -> "HealthStatus":
         """Return configured health status.
@@ -5,8 +5,10 @@ from unittest.mock import patch, Mock
 
 import pytest
 
-from litefs.domain.settings import LiteFSSettings, StaticLeaderConfig
+from litefs.domain.events import ReplicationChangeEvent
+from litefs.domain.settings import ChangeBusSettings, LiteFSSettings, StaticLeaderConfig
 from litefs_django.apps import LiteFSDjangoConfig
+from litefs_django.signals import replication_changed
 from .fakes import (
     FakeMountValidator,
     FakeNodeIDResolver,
@@ -789,3 +791,101 @@ class TestPrimaryMarkerWriting:
 
         # Call cleanup - should not raise
         config._cleanup_primary_marker()
+
+
+class FakeChangeBus:
+    """Change bus recording subscriptions without a background thread."""
+
+    def __init__(self) -> None:
+        """Initialize a stopped bus."""
+        self.subscribers = []
+        self.is_running = False
+
+    def subscribe(self, callback):
+        """Record a subscriber."""
+        self.subscribers.append(callback)
+        return lambda: self.subscribers.remove(callback)
+
+    def start(self) -> None:
+        """Mark the bus as running."""
+        self.is_running = True
+
+    def stop(self, timeout=None) -> None:
+        """Mark the bus as stopped."""
+        self.is_running = False
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.AppConfig")
+class TestChangeBusStartup:
+    """Test that ready() starts the change bus when enabled."""
+
+    def _settings(self, change_bus: ChangeBusSettings | None) -> LiteFSSettings:
+        """Create raft-mode settings with an optional change bus config."""
+        return LiteFSSettings(
+            mount_path="/litefs",
+            data_path="/var/lib/litefs",
+            database_name="db.sqlite3",
+            leader_election="raft",
+            proxy_addr=":8080",
+            enabled=True,
+            retention="1h",
+            raft_self_addr="localhost:4321",
+            raft_peers=["node1:4321", "node2:4321"],
+            change_bus=change_bus,
+        )
+
+    def _ready(self, settings: LiteFSSettings, fake_bus: FakeChangeBus):
+        """Run ready() with fakes and return the config."""
+        config = create_test_config()
+        config.change_bus = None
+        config.mount_validator_factory = lambda: FakeMountValidator()
+        config.primary_detector_factory = lambda _: FakePrimaryDetector(
+            is_primary=False
+        )
+        config.change_bus_factory = lambda _: fake_bus
+        config._start_change_bus = LiteFSDjangoConfig._start_change_bus.__get__(
+            config
+        )
+        with (
+            patch("litefs_django.apps.getattr") as mock_getattr,
+            patch("litefs_django.apps.get_litefs_settings") as mock_settings,
+            patch("litefs_django.apps.atexit.register"),
+        ):
+            mock_getattr.return_value = {"ENABLED": True}
+            mock_settings.return_value = settings
+            config.ready()
+        return config
+
+    def test_enabled_change_bus_sends_signal(self):
+        """Test that bus events are forwarded to replication_changed."""
+        fake_bus = FakeChangeBus()
+        received = []
+
+        def receiver(sender, event, **kwargs):
+            received.append(event)
+
+        replication_changed.connect(receiver)
+        try:
+            config = self._ready(
+                self._settings(ChangeBusSettings(enabled=True)), fake_bus
+            )
+            event = ReplicationChangeEvent(old_txid=1, new_txid=3, timestamp=10.0)
+            for subscriber in fake_bus.subscribers:
+                subscriber(event)
+        finally:
+            replication_changed.disconnect(receiver)
+
+        assert config.change_bus is fake_bus
+        assert fake_bus.is_running
+        assert received == [event]
+
+    @pytest.mark.parametrize("change_bus", [None, ChangeBusSettings(enabled=False)])
+    def test_change_bus_not_started_unless_enabled(self, change_bus):
+        """Test that the bus is opt-in."""
+        fake_bus = FakeChangeBus()
+
+        config = self._ready(self._settings(change_bus), fake_bus)
+
+        assert config.change_bus is None
+        assert not fake_bus.is_running
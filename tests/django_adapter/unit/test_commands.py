@@ -140,6 +140,8 @@ class TestLiteFSStatusCommand:
         # Mock settings and primary detector
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -168,6 +170,8 @@ class TestLiteFSStatusCommand:
         # Mock settings and primary detector
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -195,6 +199,8 @@ class TestLiteFSStatusCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/custom/litefs/path"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -221,6 +227,8 @@ class TestLiteFSStatusCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -248,6 +256,8 @@ class TestLiteFSStatusCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False
         mock_settings.leader_election = "static"
 
@@ -275,6 +285,8 @@ class TestLiteFSStatusCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/nonexistent"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -314,6 +326,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -351,6 +365,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -386,6 +402,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/nonexistent"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -423,6 +441,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False
 
         # Mock Django settings with correct database backend
@@ -454,6 +474,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -510,6 +532,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with wrong database backend
@@ -545,6 +569,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -582,6 +608,8 @@ class TestLiteFSCheckCommand:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
 
         # Mock Django settings with correct database backend
@@ -625,6 +653,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False  # Issue 1: disabled
 
         # Mock Django settings with wrong backend (Issue 2)
@@ -661,6 +691,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False  # Issue: disabled
 
         mock_django_settings = Mock()
@@ -700,6 +732,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False  # Single issue
 
         mock_django_settings = Mock()
@@ -728,6 +762,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False
 
         mock_django_settings = Mock()
@@ -766,6 +802,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True  # enabled OK
 
         mock_django_settings = Mock()
@@ -797,6 +835,8 @@ class TestLiteFSCheckMultiIssueReporting:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/nonexistent"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False  # Issue 1
 
         mock_django_settings = Mock()
@@ -852,6 +892,8 @@ class TestVerbosityLevels:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -879,6 +921,8 @@ class TestVerbosityLevels:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -907,6 +951,8 @@ class TestVerbosityLevels:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
         mock_settings.data_path = "/var/lib/litefs"
@@ -1019,6 +1065,8 @@ class TestJSONOutput:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False  # Issue
 
         mock_django_settings = Mock()
@@ -1056,6 +1104,8 @@ class TestJSONOutput:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False
 
         mock_django_settings = Mock()
@@ -1091,6 +1141,8 @@ class TestJSONOutput:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
         mock_settings.data_path = "/var/lib/litefs"
@@ -1126,6 +1178,8 @@ class TestJSONOutput:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "consul"
         mock_settings.data_path = "/var/lib/litefs"
@@ -1160,6 +1214,8 @@ class TestJSONOutput:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = False
         mock_settings.leader_election = "static"
 
@@ -1191,6 +1247,8 @@ class TestLiteFSStatusHealthStatus:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -1209,6 +1267,7 @@ class TestLiteFSStatusHealthStatus:
                     mock_detector_class.return_value = detector
 
                     health_checker = Mock()
+                    health_checker.last_replication_lag = None
                     health_checker.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
@@ -1228,6 +1287,8 @@ class TestLiteFSStatusHealthStatus:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -1246,6 +1307,7 @@ class TestLiteFSStatusHealthStatus:
                     mock_detector_class.return_value = detector
 
                     health_checker = Mock()
+                    health_checker.last_replication_lag = None
                     health_checker.check_health.return_value = HealthStatus(
                         state="degraded"
                     )
@@ -1265,6 +1327,8 @@ class TestLiteFSStatusHealthStatus:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -1283,6 +1347,7 @@ class TestLiteFSStatusHealthStatus:
                     mock_detector_class.return_value = detector
 
                     health_checker = Mock()
+                    health_checker.last_replication_lag = None
                     health_checker.check_health.return_value = HealthStatus(
                         state="unhealthy"
                     )
@@ -1303,6 +1368,8 @@ class TestLiteFSStatusHealthStatus:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
         mock_settings.data_path = "/var/lib/litefs"
@@ -1325,6 +1392,7 @@ class TestLiteFSStatusHealthStatus:
                     mock_detector_class.return_value = detector
 
                     health_checker = Mock()
+                    health_checker.last_replication_lag = None
                     health_checker.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
@@ -1346,6 +1414,8 @@ class TestLiteFSStatusHealthStatus:
 
         mock_settings = Mock(spec=LiteFSSettings)
         mock_settings.mount_path = "/litefs"
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
         mock_settings.enabled = True
         mock_settings.leader_election = "static"
 
@@ -1364,6 +1434,7 @@ class TestLiteFSStatusHealthStatus:
                     mock_detector_class.return_value = detector
 
                     health_checker = Mock()
+                    health_checker.last_replication_lag = None
                     health_checker.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
@@ -1377,6 +1448,56 @@ class TestLiteFSStatusHealthStatus:
                     health_checker.check_health.assert_called_once()
 
 
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Django")
+class TestLiteFSStatusReplication:
+    """Test replication position display in litefs_status command."""
+
+    def _settings(self, mount_path: Path) -> Mock:
+        mock_settings = Mock(spec=LiteFSSettings)
+        mock_settings.mount_path = str(mount_path)
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
+        mock_settings.enabled = True
+        mock_settings.leader_election = "static"
+        return mock_settings
+
+    def test_status_json_includes_txid(self, tmp_path: Path) -> None:
+        """Test that JSON output includes the TXID and zero lag on the primary."""
+        import json
+
+        (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        (tmp_path / ".primary").write_text("node1")
+        out = StringIO()
+        cmd = LiteFSStatusCommand(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_status.get_litefs_settings",
+            return_value=self._settings(tmp_path),
+        ):
+            cmd.handle(format="json")
+
+        data = json.loads(out.getvalue())
+        assert data["txid"] == 42
+        assert data["replication_lag"]["txids"] == 0
+
+    def test_status_text_shows_txid_and_lag(self, tmp_path: Path) -> None:
+        """Test that text output shows the TXID and an unknown lag on replicas."""
+        (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        out = StringIO()
+        cmd = LiteFSStatusCommand(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_status.get_litefs_settings",
+            return_value=self._settings(tmp_path),
+        ):
+            cmd.handle()
+
+        output = out.getvalue()
+        assert "TXID:          42" in output
+        assert "Lag:           Unknown" in output
+
+
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter.Django")
 class TestLiteFSDownloadCommand:
@@ -1713,3 +1834,488 @@ class TestLiteFSDownloadCommand:
                 "unsupported" in error_message.lower()
                 or "platform" in error_message.lower()
             )
+
+
+def cluster_payload(term: int = 3, forwarded: int = 10) -> dict:
+    """Build a cluster status view payload for litefs_status --watch."""
+    return {
+        "node_id": "node2",
+        "node_state": "replica",
+        "leader_election": "raft",
+        "raft": {
+            "term": term,
+            "quorum": True,
+            "members": ["node1:20202", "node2:20202", "node3:20202"],
+        },
+        "split_brain": {"detected": False, "leaders": ["node1"]},
+        "peers": [
+            {
+                "node_id": "node1",
+                "is_leader": True,
+                "reachable": True,
+                "latency_ms": 1.5,
+                "txid": 50,
+            },
+            {
+                "node_id": "node3",
+                "is_leader": False,
+                "reachable": False,
+                "latency_ms": None,
+                "txid": None,
+            },
+        ],
+        "forwarding": {
+            "forwarded": forwarded,
+            "retries": 0,
+            "failed": 1,
+            "circuit_breaker": "closed",
+        },
+    }
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Django")
+class TestLiteFSStatusWatch:
+    """Test litefs_status --watch live dashboard."""
+
+    def _settings(self, mount_path: Path) -> Mock:
+        mock_settings = Mock(spec=LiteFSSettings)
+        mock_settings.mount_path = str(mount_path)
+        mock_settings.database_name = "db.sqlite3"
+        mock_settings.replication = None
+        mock_settings.enabled = True
+        mock_settings.leader_election = "raft"
+        return mock_settings
+
+    @staticmethod
+    def _response(payload: dict) -> Mock:
+        response = Mock(status_code=200)
+        response.json.return_value = payload
+        return response
+
+    def test_watch_json_streams_ndjson_with_rates(self, tmp_path: Path) -> None:
+        """Test that each refresh is one JSON line with deltas and rates."""
+        import json
+
+        pos = tmp_path / "db.sqlite3-pos"
+        pos.write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        (tmp_path / ".primary").write_text("node1:20202")
+        out = StringIO()
+        cmd = LiteFSStatusCommand(stdout=out)
+
+        def advance(interval: float) -> None:
+            if mock_time.sleep.call_count == 2:
+                raise KeyboardInterrupt
+            pos.write_text("0000000000000032/f8c4d8c1bbcbd4a2")
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_status.get_litefs_settings",
+                return_value=self._settings(tmp_path),
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_status.httpx.get",
+                side_effect=[
+                    self._response(cluster_payload(forwarded=10)),
+                    self._response(cluster_payload(forwarded=14)),
+                ],
+            ),
+            patch("litefs_django.management.commands.litefs_status.time") as mock_time,
+        ):
+            mock_time.time.side_effect = [100.0, 102.0]
+            mock_time.sleep.side_effect = advance
+            cmd.handle(watch=True, format="json", interval=2.0)
+
+        first, second = (json.loads(line) for line in out.getvalue().splitlines())
+        assert first["role"] == "primary"
+        assert first["primary_url"] == "node1:20202"
+        assert first["txid"] == 42
+        assert first["rates"] == {"txid_per_second": None, "forwarded_per_second": None}
+        assert second["txid"] == 50
+        assert second["deltas"]["txid"] == 8
+        assert second["deltas"]["raft_term"] == 0
+        assert second["deltas"]["forwarded"] == 4
+        assert second["rates"] == {"txid_per_second": 4.0, "forwarded_per_second": 2.0}
+        mock_time.sleep.assert_called_with(2.0)
+
+    def test_watch_text_dashboard(self, tmp_path: Path) -> None:
+        """Test that the text dashboard shows cluster, peers and forwarding."""
+        (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        (tmp_path / ".primary").write_text("node1:20202")
+        out = StringIO()
+        cmd = LiteFSStatusCommand(stdout=out)
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_status.get_litefs_settings",
+                return_value=self._settings(tmp_path),
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_status.httpx.get",
+                return_value=self._response(cluster_payload()),
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_status.time.sleep",
+                side_effect=KeyboardInterrupt,
+            ),
+        ):
+            cmd.handle(watch=True)
+
+        output = out.getvalue()
+        assert output.startswith("\x1b[H\x1b[2J")
+        assert "Node Role:     Primary" in output
+        assert "Primary:       node1:20202" in output
+        assert "TXID:          42" in output
+        assert "Raft Term:     3" in output
+        assert "Quorum:        Reached (3 members)" in output
+        assert "Split-Brain:   No" in output
+        assert "10 forwarded, 1 failed, breaker closed" in output
+        assert "node3                unreachable" in output
+
+    def test_watch_without_cluster_view(self, tmp_path: Path) -> None:
+        """Test that local status is shown when the cluster view is unreachable."""
+        import httpx
+
+        (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+        out = StringIO()
+        cmd = LiteFSStatusCommand(stdout=out)
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_status.get_litefs_settings",
+                return_value=self._settings(tmp_path),
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_status.httpx.get",
+                side_effect=httpx.ConnectError("refused"),
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_status.time.sleep",
+                side_effect=KeyboardInterrupt,
+            ),
+        ):
+            cmd.handle(watch=True, url="http://127.0.0.1:9000/cluster")
+
+        output = out.getvalue()
+        assert "Node Role:     Replica" in output
+        assert "Primary:       None elected" in output
+        assert "Lag:           Unknown" in output
+        assert "unavailable at http://127.0.0.1:9000/cluster" in output
+
+
+ROUTES_SNAPSHOT = {
+    "since": 1_700_000_000.0,
+    "max_routes": 200,
+    "routes": [
+        {
+            "method": "GET",
+            "route": "/articles/<int:pk>/",
+            "requests": 90,
+            "forwarded": 0,
+            "retries": 0,
+            "failures": 0,
+            "request_bytes": 0,
+            "response_bytes": 450_000,
+            "latency": {
+                "count": 90,
+                "mean_ms": 3.1,
+                "p50_ms": 2.9,
+                "p90_ms": 4.0,
+                "p99_ms": 7.5,
+                "max_ms": 8.0,
+            },
+        },
+        {
+            "method": "POST",
+            "route": "/articles/",
+            "requests": 10,
+            "forwarded": 10,
+            "retries": 3,
+            "failures": 1,
+            "request_bytes": 2048,
+            "response_bytes": 400,
+            "latency": {
+                "count": 10,
+                "mean_ms": 40.0,
+                "p50_ms": 35.0,
+                "p90_ms": 60.0,
+                "p99_ms": 120.0,
+                "max_ms": 121.0,
+            },
+        },
+    ],
+}
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Django")
+class TestLiteFSTopCommand:
+    """Test litefs_top management command."""
+
+    @staticmethod
+    def _response(status_code: int = 200, payload: object = ROUTES_SNAPSHOT) -> Mock:
+        response = Mock(status_code=status_code, text="Not Found\n")
+        response.json.return_value = payload
+        return response
+
+    def test_once_prints_table_sorted_by_column(self) -> None:
+        """Test that routes are sorted by the requested column."""
+        from litefs_django.management.commands.litefs_top import Command
+
+        out = StringIO()
+        cmd = Command(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_top.httpx.get",
+            return_value=self._response(),
+        ) as mock_get:
+            cmd.handle(url="http://127.0.0.1:8000/routes", sort="p99", once=True)
+
+        mock_get.assert_called_once_with("http://127.0.0.1:8000/routes", timeout=5.0)
+        lines = out.getvalue().splitlines()
+        assert "sorted by p99" in lines[0]
+        assert lines[2].split()[:4] == ["METHOD", "ROUTE", "REQS", "FWD"]
+        assert lines[3].split()[:6] == ["POST", "/articles/", "10", "10", "3", "1"]
+        assert lines[4].startswith("GET")
+        assert "\x1b[2J" not in out.getvalue()
+
+    def test_once_json_applies_limit(self) -> None:
+        """Test that JSON output contains the top routes only."""
+        import json
+
+        from litefs_django.management.commands.litefs_top import Command
+
+        out = StringIO()
+        cmd = Command(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_top.httpx.get",
+            return_value=self._response(),
+        ):
+            cmd.handle(once=True, format="json", limit=1)
+
+        data = json.loads(out.getvalue())
+        assert [route["route"] for route in data["routes"]] == ["/articles/<int:pk>/"]
+        assert data["since"] == ROUTES_SNAPSHOT["since"]
+
+    def test_once_raises_when_endpoint_unavailable(self) -> None:
+        """Test that a disabled endpoint is reported as a command error."""
+        from litefs_django.management.commands.litefs_top import Command
+
+        cmd = Command(stdout=StringIO())
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_top.httpx.get",
+                return_value=self._response(status_code=404),
+            ),
+            pytest.raises(CommandError, match="HTTP 404"),
+        ):
+            cmd.handle(once=True)
+
+    def test_live_mode_refreshes_until_interrupted(self) -> None:
+        """Test that live mode redraws every interval and survives errors."""
+        import httpx
+        from litefs_django.management.commands.litefs_top import Command
+
+        out = StringIO()
+        cmd = Command(stdout=out)
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_top.httpx.get",
+                side_effect=[httpx.ConnectError("refused"), self._response()],
+            ),
+            patch(
+                "litefs_django.management.commands.litefs_top.time.sleep",
+                side_effect=[None, KeyboardInterrupt],
+            ) as mock_sleep,
+        ):
+            cmd.handle(interval=0.5)
+
+        output = out.getvalue()
+        assert output.count("\x1b[2J") == 2
+        assert "Failed to read" in output
+        assert "/articles/" in output
+        mock_sleep.assert_called_with(0.5)
+
+
+SLOW_QUERIES_SNAPSHOT = {
+    "aliases": {
+        "default": {
+            "threshold_ms": 100.0,
+            "counts": [
+                {
+                    "fingerprint_id": "a1b2c3d4e5f6",
+                    "fingerprint": "SELECT * FROM articles WHERE title = ?",
+                    "count": 7,
+                },
+                {
+                    "fingerprint_id": "0f9e8d7c6b5a",
+                    "fingerprint": "SELECT * FROM articles WHERE id = ?",
+                    "count": 2,
+                },
+            ],
+            "entries": [
+                {
+                    "fingerprint_id": "0f9e8d7c6b5a",
+                    "fingerprint": "SELECT * FROM articles WHERE id = ?",
+                    "sql": "SELECT * FROM articles WHERE id = %s",
+                    "duration_ms": 150.0,
+                    "timestamp": 1000.0,
+                    "plan": None,
+                    "full_scan": None,
+                },
+                {
+                    "fingerprint_id": "a1b2c3d4e5f6",
+                    "fingerprint": "SELECT * FROM articles WHERE title = ?",
+                    "sql": "SELECT * FROM articles WHERE title = %s",
+                    "duration_ms": 420.5,
+                    "timestamp": 999.0,
+                    "plan": ["SCAN articles"],
+                    "full_scan": True,
+                },
+            ],
+        }
+    }
+}
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Django")
+class TestLiteFSSlowQueriesCommand:
+    """Test litefs_slow_queries management command."""
+
+    @staticmethod
+    def _response(
+        status_code: int = 200, payload: object = SLOW_QUERIES_SNAPSHOT
+    ) -> Mock:
+        response = Mock(status_code=status_code, text="Not Found\n")
+        response.json.return_value = payload
+        return response
+
+    def test_text_output_lists_counts_and_plans(self) -> None:
+        """Test that text output shows counts, entries and full scans."""
+        from litefs_django.management.commands.litefs_slow_queries import Command
+
+        out = StringIO()
+        cmd = Command(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_slow_queries.httpx.get",
+            return_value=self._response(),
+        ) as mock_get:
+            cmd.handle(url="http://127.0.0.1:8000/slow-queries")
+
+        mock_get.assert_called_once_with(
+            "http://127.0.0.1:8000/slow-queries", timeout=5.0
+        )
+        output = out.getvalue()
+        assert "Database 'default' (threshold 100 ms)" in output
+        assert "      7  a1b2c3d4e5f6  SELECT * FROM articles WHERE title = ?" in output
+        assert "420.5 ms  a1b2c3d4e5f6  FULL SCAN" in output
+        assert "      SCAN articles" in output
+
+    def test_json_output_filters_full_scans(self) -> None:
+        """Test that --full-scans keeps only entries scanning a whole table."""
+        import json
+
+        from litefs_django.management.commands.litefs_slow_queries import Command
+
+        out = StringIO()
+        cmd = Command(stdout=out)
+
+        with patch(
+            "litefs_django.management.commands.litefs_slow_queries.httpx.get",
+            return_value=self._response(),
+        ):
+            cmd.handle(full_scans=True, limit=1, format="json")
+
+        log = json.loads(out.getvalue())["aliases"]["default"]
+        assert [count["count"] for count in log["counts"]] == [7]
+        assert [entry["fingerprint_id"] for entry in log["entries"]] == [
+            "a1b2c3d4e5f6"
+        ]
+
+    def test_endpoint_error_raises_command_error(self) -> None:
+        """Test that an unavailable endpoint is reported."""
+        from litefs_django.management.commands.litefs_slow_queries import Command
+
+        cmd = Command(stdout=StringIO())
+
+        with (
+            patch(
+                "litefs_django.management.commands.litefs_slow_queries.httpx.get",
+                return_value=self._response(status_code=404),
+            ),
+            pytest.raises(CommandError, match="HTTP 404"),
+        ):
+            cmd.handle()
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Django")
+class TestLiteFSMembersCommand:
+    """Test litefs_members management command."""
+
+    @staticmethod
+    def _run(client: Mock, **options: object) -> str:
+        """Run the command against client and return its output."""
+        from litefs_django.management.commands.litefs_members import Command
+
+        out = StringIO()
+        with patch(
+            "litefs_django.management.commands.litefs_members.get_litefs_settings"
+        ), patch(
+            "litefs_django.management.commands.litefs_members."
+            "create_raft_membership_client",
+            return_value=client,
+        ):
+            Command(stdout=out).handle(**options)
+        return out.getvalue()
+
+    def test_list_members(self) -> None:
+        """Test that list prints one member per line."""
+        client = Mock()
+        client.get_cluster_members.return_value = ["node1:20202", "node2:20202"]
+
+        output = self._run(client, action="list")
+
+        assert output.split() == ["node1:20202", "node2:20202"]
+
+    def test_add_member_reports_members(self) -> None:
+        """Test that a committed addition is reported with the new members."""
+        import json
+
+        client = Mock()
+        client.add_member.return_value = Mock(
+            succeeded=True, members=("node1:20202", "node4:20202"), reason=None
+        )
+
+        output = self._run(client, action="add", member="node4:20202", format="json")
+
+        client.add_member.assert_called_once_with("node4:20202")
+        assert json.loads(output)["members"] == ["node1:20202", "node4:20202"]
+
+    def test_failed_removal_raises_command_error(self) -> None:
+        """Test that a change that did not commit fails the command."""
+        client = Mock()
+        client.remove_member.return_value = Mock(
+            succeeded=False, members=("node1:20202",), reason="not a member"
+        )
+
+        with pytest.raises(CommandError, match="not a member"):
+            self._run(client, action="remove", member="node9:20202")
+
+    def test_unreachable_node_raises_command_error(self) -> None:
+        """Test that a node that cannot be reached is reported."""
+        client = Mock()
+        client.get_cluster_members.side_effect = ConnectionError("refused")
+
+        with pytest.raises(CommandError, match="refused"):
+            self._run(client, action="list")
+
+    def test_member_address_required(self) -> None:
+        """Test that add and remove need a host:port address."""
+        with pytest.raises(CommandError, match="host:port"):
+            self._run(Mock(), action="add", member="node4")
@@ -219,6 +219,9 @@ class TestDatabaseBackend:
                 f"BEGIN IMMEDIATE not found in transaction start. Found: {begin_statements}"
             )
 
+            # Release the write lock for later tests on the same file
+            wrapper.close()
+
     @override_settings(LITEFS={"ENABLED": True})
     def test_start_transaction_under_autocommit_uses_immediate(self):
         """Test that _start_transaction_under_autocommit executes BEGIN IMMEDIATE (DJANGO-020)."""
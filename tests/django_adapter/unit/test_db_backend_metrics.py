@@ -0,0 +1,145 @@
+"""Unit tests for LiteFS database backend metrics.
+
+Tests cover statement counts and latency, write checks, SQL
+classification, query cache lookups and connection setup time.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.metrics import (
+    CONNECTION_SETUP_DURATION,
+    QUERY_CACHE_LOOKUPS,
+    SQL_CLASSIFICATION_DURATION,
+    STATEMENT_DURATION,
+    STATEMENTS,
+    WRITE_GUARD_DURATION,
+)
+from litefs.usecases.split_brain_detector import SplitBrainDetector
+from litefs_django.db.backends.litefs.base import DatabaseWrapper, LiteFSCursor
+
+from .conftest import create_litefs_settings_dict
+from .fakes import FakePrimaryDetector, FakeSplitBrainDetector
+
+pytestmark = [
+    pytest.mark.tier(1),
+    pytest.mark.tra("Adapter.Django.Backend.Metrics"),
+]
+
+
+@pytest.fixture
+def metrics() -> FakeMetricsAdapter:
+    """Metrics adapter recording observations."""
+    return FakeMetricsAdapter()
+
+
+@pytest.fixture
+def cursor(metrics: FakeMetricsAdapter):
+    """Cursor on an in-memory database with both write checks."""
+    connection = sqlite3.connect(":memory:")
+    cursor = LiteFSCursor(
+        connection,
+        primary_detector=FakePrimaryDetector(is_primary=True),
+        split_brain_detector=SplitBrainDetector(FakeSplitBrainDetector()),
+        metrics=metrics,
+    )
+    cursor.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+    metrics.reset()
+    yield cursor
+    cursor.close()
+    connection.close()
+
+
+class TestCursorMetrics:
+    """Test metrics emitted by LiteFSCursor."""
+
+    def test_counts_and_times_statements_by_kind(self, cursor, metrics):
+        """Test that reads and writes are counted and timed separately."""
+        cursor.execute("INSERT INTO articles (title) VALUES (%s)", ("first",))
+        cursor.execute("SELECT title FROM articles")
+        cursor.execute("SELECT id FROM articles")
+
+        assert metrics.counter_value(STATEMENTS, kind="write") == 1
+        assert metrics.counter_value(STATEMENTS, kind="read") == 2
+        assert len(metrics.histogram_values(STATEMENT_DURATION, kind="write")) == 1
+        assert len(metrics.histogram_values(STATEMENT_DURATION, kind="read")) == 2
+
+    def test_times_write_checks(self, cursor, metrics):
+        """Test that writes observe the split-brain and primary checks."""
+        cursor.execute("INSERT INTO articles (title) VALUES (%s)", ("first",))
+        cursor.execute("SELECT title FROM articles")
+
+        assert len(metrics.histogram_values(WRITE_GUARD_DURATION, check="primary")) == 1
+        assert (
+            len(metrics.histogram_values(WRITE_GUARD_DURATION, check="split_brain"))
+            == 1
+        )
+
+    def test_classifies_each_statement_once(self, cursor, metrics):
+        """Test that one execute() classifies its statement only once."""
+        cursor.execute("INSERT INTO articles (title) VALUES (%s)", ("first",))
+
+        assert len(metrics.histogram_values(SQL_CLASSIFICATION_DURATION)) == 1
+
+    def test_executemany_counted_as_one_statement(self, cursor, metrics):
+        """Test that executemany() is counted and timed once."""
+        cursor.executemany(
+            "INSERT INTO articles (title) VALUES (%s)", [("a",), ("b",), ("c",)]
+        )
+
+        assert metrics.counter_value(STATEMENTS, kind="write") == 1
+        assert len(metrics.histogram_values(STATEMENT_DURATION)) == 1
+
+
+@pytest.fixture
+def mount_path(tmp_path: Path) -> Path:
+    """LiteFS mount on which this node is the primary."""
+    mount_path = tmp_path / "litefs"
+    mount_path.mkdir()
+    (mount_path / ".primary").write_text("node-1")
+    (mount_path / "test.db-pos").write_text(f"{1:016x}/{'0' * 16}")
+    return mount_path
+
+
+class TestDatabaseWrapperMetrics:
+    """Test metrics emitted by DatabaseWrapper."""
+
+    def test_connection_setup_time_observed(self, mount_path, metrics):
+        """Test that opening a connection observes its setup time."""
+        with override_settings(LITEFS={"ENABLED": True}):
+            wrapper = DatabaseWrapper(
+                create_litefs_settings_dict(mount_path),
+                alias=f"test-{uuid.uuid4().hex[:8]}",
+                metrics=metrics,
+            )
+            wrapper.ensure_connection()
+            wrapper.close()
+
+        assert len(metrics.histogram_values(CONNECTION_SETUP_DURATION)) == 1
+
+    def test_query_cache_hits_and_misses_counted(self, mount_path, metrics):
+        """Test that query cache lookups are counted by result."""
+        settings_dict = create_litefs_settings_dict(mount_path)
+        settings_dict["OPTIONS"]["litefs_query_cache"] = True
+        with override_settings(LITEFS={"ENABLED": True}):
+            wrapper = DatabaseWrapper(
+                settings_dict,
+                alias=f"test-{uuid.uuid4().hex[:8]}",
+                metrics=metrics,
+            )
+            with wrapper.cursor() as cursor:
+                cursor.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY)")
+                cursor.execute("SELECT id FROM articles")
+                cursor.fetchall()
+                cursor.execute("SELECT id FROM articles")
+                cursor.fetchall()
+            wrapper.close()
+
+        assert metrics.counter_value(QUERY_CACHE_LOOKUPS, result="miss") == 1
+        assert metrics.counter_value(QUERY_CACHE_LOOKUPS, result="hit") == 1
@@ -0,0 +1,223 @@
+"""Unit tests for fencing Django writes with the leader epoch.
+
+Tests cover the cursor and connection fencing of transactions, the epoch
+carried by forwarded writes, and background split-brain detection in
+SplitBrainMiddleware.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from litefs.adapters.ports import ForwardingPort, ForwardingResult
+from litefs.domain.split_brain import RaftNodeState
+from litefs.usecases.epoch_fence import EpochFence, TransactionFence
+from litefs.usecases.split_brain_detector import SplitBrainMonitor, SplitBrainStatus
+from litefs_django.db.backends.litefs.base import DatabaseWrapper, LiteFSCursor
+from litefs_django.exceptions import NotPrimaryError, StaleEpochError
+from litefs_django.middleware import SplitBrainMiddleware, WriteForwardingMiddleware
+
+from .conftest import create_litefs_settings_dict
+from .fakes import FakePrimaryDetector
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("Adapter.Django.EpochFencing")]
+
+
+class FakeEpochElection:
+    """Election whose leader epoch is set by the test."""
+
+    def __init__(self, epoch: int | None) -> None:
+        """Initialize leading under epoch, or not leading if None."""
+        self.epoch = epoch
+
+    def get_leader_epoch(self) -> int | None:
+        """Return the configured epoch."""
+        return self.epoch
+
+
+def make_cursor(election: FakeEpochElection) -> LiteFSCursor:
+    """Fenced cursor on an in-memory database with an articles table."""
+    connection = sqlite3.connect(":memory:", isolation_level=None)
+    connection.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+    return LiteFSCursor(
+        connection,
+        primary_detector=FakePrimaryDetector(is_primary=True),
+        transaction_fence=TransactionFence(EpochFence(election)),
+    )
+
+
+class TestCursorEpochFence:
+    """Test writes fenced by LiteFSCursor."""
+
+    def test_write_rejected_after_epoch_change(self) -> None:
+        """Test that a transaction cannot write under a newer epoch."""
+        election = FakeEpochElection(1)
+        cursor = make_cursor(election)
+        cursor.execute("BEGIN")
+        cursor.execute("INSERT INTO articles (title) VALUES (%s)", ["first"])
+
+        election.epoch = 2
+
+        with pytest.raises(StaleEpochError, match="epoch 1"):
+            cursor.execute("INSERT INTO articles (title) VALUES (%s)", ["second"])
+        with pytest.raises(StaleEpochError):
+            cursor.executemany("INSERT INTO articles (title) VALUES (%s)", [["x"]])
+        cursor.execute("SELECT title FROM articles")
+        assert cursor.fetchall() == [("first",)]
+
+    def test_autocommit_write_admitted_while_leading(self) -> None:
+        """Test that writes outside a transaction only need leadership."""
+        election = FakeEpochElection(1)
+        cursor = make_cursor(election)
+
+        election.epoch = 2
+        cursor.execute("INSERT INTO articles (title) VALUES (%s)", ["first"])
+        election.epoch = None
+
+        with pytest.raises(StaleEpochError):
+            cursor.executescript("DELETE FROM articles;")
+
+    def test_stale_epoch_is_not_primary(self) -> None:
+        """Test that existing NotPrimaryError handlers catch fenced writes."""
+        assert issubclass(StaleEpochError, NotPrimaryError)
+
+
+class TestDatabaseWrapperEpochFence:
+    """Test the transaction epoch kept by DatabaseWrapper."""
+
+    @override_settings(LITEFS={"ENABLED": True})
+    def test_epoch_recorded_per_transaction(self, tmp_path: Path) -> None:
+        """Test that each transaction is fenced by the epoch it began under."""
+        election = FakeEpochElection(1)
+        wrapper = DatabaseWrapper(
+            create_litefs_settings_dict(tmp_path),
+            primary_detector=FakePrimaryDetector(is_primary=True),
+            epoch_fence=EpochFence(election),
+        )
+        try:
+            with wrapper.cursor() as cursor:
+                cursor.execute("CREATE TABLE articles (title TEXT)")
+
+            wrapper._start_transaction_under_autocommit()
+            election.epoch = 2
+            with pytest.raises(StaleEpochError), wrapper.cursor() as cursor:
+                cursor.execute("INSERT INTO articles VALUES (%s)", ["stale"])
+            wrapper.rollback()
+
+            wrapper._start_transaction_under_autocommit()
+            with wrapper.cursor() as cursor:
+                cursor.execute("INSERT INTO articles VALUES (%s)", ["current"])
+            wrapper.commit()
+        finally:
+            wrapper.close()
+
+    @override_settings(LITEFS={"ENABLED": False})
+    def test_no_fence_in_dev_mode(self, tmp_path: Path) -> None:
+        """Test that dev mode does not fence writes."""
+        settings_dict = create_litefs_settings_dict(tmp_path)
+        settings_dict["NAME"] = str(tmp_path / "dev.db")
+        wrapper = DatabaseWrapper(
+            settings_dict, epoch_fence=EpochFence(FakeEpochElection(None))
+        )
+
+        assert wrapper._get_transaction_fence() is None
+
+
+def make_forwarding_middleware(
+    is_primary: bool, election: FakeEpochElection
+) -> tuple[WriteForwardingMiddleware, Mock, Mock]:
+    """Middleware forwarding writes, with the leader epoch of the election.
+
+    Returns:
+        The middleware, its get_response and its forwarding port.
+    """
+    get_response = Mock(return_value=HttpResponse("OK"))
+    port = Mock(spec=ForwardingPort)
+    port.forward_request.return_value = ForwardingResult(
+        status_code=200, headers={}, body=b""
+    )
+    detector = Mock()
+    detector.is_primary.return_value = is_primary
+    cluster_metadata = Mock()
+    cluster_metadata.get_cluster_metadata.return_value = {"epoch": election.epoch}
+
+    middleware = WriteForwardingMiddleware(get_response)
+    middleware._forwarding_port = port
+    middleware._primary_detector = detector
+    middleware._primary_url = "http://primary.local:8000"
+    middleware._forwarding_enabled = True
+    middleware._cluster_metadata = cluster_metadata
+    middleware._epoch_fence = EpochFence(election)
+    return middleware, get_response, port
+
+
+class TestForwardedEpoch:
+    """Test the leader epoch carried by forwarded writes."""
+
+    def test_replica_sends_known_epoch(self) -> None:
+        """Test that the replica replaces any client epoch with its own."""
+        middleware, _, port = make_forwarding_middleware(False, FakeEpochElection(7))
+        request = RequestFactory().post("/articles/", HTTP_X_LITEFS_EPOCH="99")
+
+        middleware(request)
+
+        headers = port.forward_request.call_args.kwargs["headers"]
+        epochs = {k: v for k, v in headers.items() if k.lower() == "x-litefs-epoch"}
+        assert epochs == {"X-LiteFS-Epoch": "7"}
+
+    @pytest.mark.parametrize(("epoch", "status"), [("3", 200), ("4", 200), ("5", 503)])
+    def test_deposed_primary_rejects_newer_epoch(self, epoch: str, status: int) -> None:
+        """Test that a primary rejects writes sent under a newer leader."""
+        middleware, get_response, _ = make_forwarding_middleware(
+            True, FakeEpochElection(4)
+        )
+        request = RequestFactory().post("/articles/", HTTP_X_LITEFS_EPOCH=epoch)
+
+        response = middleware(request)
+
+        assert response.status_code == status
+        assert get_response.called is (status == 200)
+        if status == 503:
+            assert response["Retry-After"] == "1"
+
+
+class TestSplitBrainMiddlewareMonitor:
+    """Test SplitBrainMiddleware reading background detection."""
+
+    @staticmethod
+    def make_middleware(status: SplitBrainStatus | None) -> SplitBrainMiddleware:
+        """Middleware whose monitor reports the given status."""
+        monitor = Mock(spec=SplitBrainMonitor)
+        monitor.latest.return_value = status
+        middleware = SplitBrainMiddleware(get_response=lambda r: HttpResponse())
+        middleware.detector = Mock()
+        middleware.monitor = monitor
+        return middleware
+
+    def test_split_brain_status_rejects_request(self) -> None:
+        """Test that the monitor's status is used instead of detection."""
+        leaders = [
+            RaftNodeState(node_id="node1", is_leader=True),
+            RaftNodeState(node_id="node2", is_leader=True),
+        ]
+        middleware = self.make_middleware(
+            SplitBrainStatus(is_split_brain=True, leader_nodes=leaders)
+        )
+
+        response = middleware(RequestFactory().post("/articles/"))
+
+        assert response.status_code == 503
+        middleware.detector.detect_split_brain.assert_not_called()
+
+    def test_unknown_status_allows_request(self) -> None:
+        """Test that requests are allowed before the first round completes."""
+        middleware = self.make_middleware(None)
+
+        response = middleware(RequestFactory().post("/articles/"))
+
+        assert response.status_code == 200
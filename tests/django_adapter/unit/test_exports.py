@@ -16,7 +16,10 @@ class TestPublicAPIExports:
             "LiteFSDjangoConfig",
             "NotPrimaryError",
             "SplitBrainError",
+            "StaleEpochError",
+            "cache_by_txid",
             "get_litefs_settings",
+            "replication_changed",
             "split_brain_detected",
         }
         assert set(litefs_django.__all__) == expected_exports
@@ -56,6 +59,12 @@ class TestPublicAPIExports:
         assert get_litefs_settings is not None
         assert callable(get_litefs_settings)
 
+    def test_cache_by_txid_exportable(self):
+        """Test that cache_by_txid can be imported from litefs_django."""
+        from litefs_django import cache_by_txid
+
+        assert callable(cache_by_txid)
+
     def test_split_brain_detected_signal_still_exported(self):
         """Test that split_brain_detected signal remains exported."""
         from litefs_django import split_brain_detected
@@ -39,6 +39,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -67,6 +68,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -95,6 +97,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -123,6 +126,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -152,6 +156,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="degraded"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -180,6 +185,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="unhealthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -208,6 +214,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -237,6 +244,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -267,6 +275,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -303,6 +312,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="unhealthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -333,6 +343,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
@@ -361,6 +372,7 @@ class TestHealthCheckView:
                     mock_health.check_health.return_value = HealthStatus(
                         state="healthy"
                     )
+                    mock_health.last_replication_lag = None
                     mock_health_func.return_value = mock_health
 
                     mock_coord = Mock()
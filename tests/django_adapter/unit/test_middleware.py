@@ -646,3 +646,169 @@ class TestForwardingConfiguration:
         mock_forwarding_port.forward_request.assert_not_called()
         # get_response SHOULD be called
         mock_get_response.assert_called_once_with(request)
+
+
+# ---------------------------------------------------------------------------
+# Read-Your-Writes Tests
+# ---------------------------------------------------------------------------
+
+
+class FakeTxidWaiter:
+    """Fake TxidWaiter with a fixed local TXID."""
+
+    def __init__(self, local_txid: int | None) -> None:
+        """Initialize with the local TXID."""
+        self.local_txid = local_txid
+        self.waits: list[tuple[int, float]] = []
+
+    def current_txid(self) -> int | None:
+        """Return the local TXID."""
+        return self.local_txid
+
+    def wait_for_txid(self, txid: int, timeout: float) -> bool:
+        """Record the wait and report whether the local TXID suffices."""
+        self.waits.append((txid, timeout))
+        return self.local_txid is not None and self.local_txid >= txid
+
+
+def create_middleware_with_txid_waiter(
+    get_response: Callable[[HttpRequest], HttpResponse],
+    forwarding_port: ForwardingPort,
+    primary_detector: Mock,
+    txid_waiter: FakeTxidWaiter,
+) -> WriteForwardingMiddleware:
+    """Create middleware with read-your-writes enabled."""
+    middleware = create_middleware_with_mocks(
+        get_response, forwarding_port, primary_detector
+    )
+    middleware._txid_waiter = txid_waiter  # type: ignore[assignment]
+    middleware._read_your_writes_timeout = 0.5
+    return middleware
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.WriteForwardingMiddleware")
+class TestReadYourWrites:
+    """TXID tokens give clients read-your-writes consistency on replicas."""
+
+    def test_primary_write_response_carries_txid_token(
+        self,
+        request_factory: RequestFactory,
+        mock_forwarding_port: Mock,
+        mock_primary_detector_is_primary: Mock,
+    ) -> None:
+        """Writes on the primary return the post-commit TXID."""
+        middleware = create_middleware_with_txid_waiter(
+            lambda request: HttpResponse("OK"),
+            mock_forwarding_port,
+            mock_primary_detector_is_primary,
+            FakeTxidWaiter(local_txid=42),
+        )
+
+        response = middleware(request_factory.post("/api/resource"))
+
+        assert response["X-LiteFS-TXID"] == "000000000000002a"
+        assert response.cookies["__litefs_txid"].value == "000000000000002a"
+
+    def test_forwarded_write_sets_cookie_from_primary_token(
+        self,
+        request_factory: RequestFactory,
+        mock_get_response: Mock,
+        mock_forwarding_port: Mock,
+        mock_primary_detector: Mock,
+    ) -> None:
+        """Replicas hand the primary's TXID token to the client as a cookie."""
+        mock_forwarding_port.forward_request.return_value = ForwardingResult(
+            status_code=201,
+            headers={"x-litefs-txid": "000000000000002a"},
+            body=b"created",
+        )
+        middleware = create_middleware_with_txid_waiter(
+            mock_get_response,
+            mock_forwarding_port,
+            mock_primary_detector,
+            FakeTxidWaiter(local_txid=40),
+        )
+
+        response = middleware(request_factory.post("/api/resource"))
+
+        assert response.cookies["__litefs_txid"].value == "000000000000002a"
+
+    def test_replica_serves_read_once_caught_up(
+        self,
+        request_factory: RequestFactory,
+        mock_get_response: Mock,
+        mock_forwarding_port: Mock,
+        mock_primary_detector: Mock,
+    ) -> None:
+        """Reads with a satisfied token are handled locally."""
+        waiter = FakeTxidWaiter(local_txid=42)
+        middleware = create_middleware_with_txid_waiter(
+            mock_get_response, mock_forwarding_port, mock_primary_detector, waiter
+        )
+        request_factory.cookies["__litefs_txid"] = "000000000000002a"
+
+        middleware(request_factory.get("/api/resource"))
+
+        assert waiter.waits == [(42, 0.5)]
+        mock_get_response.assert_called_once()
+        mock_forwarding_port.forward_request.assert_not_called()
+
+    def test_replica_forwards_read_after_deadline(
+        self,
+        request_factory: RequestFactory,
+        mock_get_response: Mock,
+        mock_forwarding_port: Mock,
+        mock_primary_detector: Mock,
+    ) -> None:
+        """Reads are forwarded to the primary if the replica stays behind."""
+        middleware = create_middleware_with_txid_waiter(
+            mock_get_response,
+            mock_forwarding_port,
+            mock_primary_detector,
+            FakeTxidWaiter(local_txid=10),
+        )
+
+        middleware(
+            request_factory.get("/api/resource", HTTP_X_LITEFS_TXID="000000000000002a")
+        )
+
+        mock_get_response.assert_not_called()
+        call_kwargs = mock_forwarding_port.forward_request.call_args.kwargs
+        assert call_kwargs["method"] == "GET"
+
+    def test_read_without_token_does_not_wait(
+        self,
+        request_factory: RequestFactory,
+        mock_get_response: Mock,
+        mock_forwarding_port: Mock,
+        mock_primary_detector: Mock,
+    ) -> None:
+        """Reads without a token are served immediately."""
+        waiter = FakeTxidWaiter(local_txid=None)
+        middleware = create_middleware_with_txid_waiter(
+            mock_get_response, mock_forwarding_port, mock_primary_detector, waiter
+        )
+
+        middleware(request_factory.get("/api/resource"))
+
+        assert waiter.waits == []
+        mock_get_response.assert_called_once()
+
+    def test_invalid_token_ignored(
+        self,
+        request_factory: RequestFactory,
+        mock_get_response: Mock,
+        mock_forwarding_port: Mock,
+        mock_primary_detector: Mock,
+    ) -> None:
+        """Malformed tokens are ignored rather than failing the request."""
+        waiter = FakeTxidWaiter(local_txid=None)
+        middleware = create_middleware_with_txid_waiter(
+            mock_get_response, mock_forwarding_port, mock_primary_detector, waiter
+        )
+
+        middleware(request_factory.get("/api/resource", HTTP_X_LITEFS_TXID="nope"))
+
+        assert waiter.waits == []
+        mock_get_response.assert_called_once()
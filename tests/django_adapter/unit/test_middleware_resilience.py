@@ -10,9 +10,30 @@ from unittest.mock import Mock, patch
 import pytest
 from django.http import HttpRequest, HttpResponse
 
-from litefs.adapters.ports import ForwardingResult
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.adapters.fakes.fake_tracer import InMemoryTracer
+from litefs.adapters.ports import ForwardingResult, NoOpTracer
 from litefs.domain.circuit_breaker import CircuitBreaker, CircuitBreakerState
+from litefs.domain.metrics import (
+    CIRCUIT_BREAKER_TRANSITIONS,
+    FORWARD_ATTEMPT_DURATION,
+    FORWARD_RETRIES,
+)
 from litefs.domain.retry import RetryPolicy
+from litefs.domain.tracing import (
+    CIRCUIT_BREAKER_SPAN,
+    FORWARD_REQUEST_SPAN,
+    RETRY_BACKOFF_SPAN,
+    WRITE_FORWARDING_SPAN,
+    TraceContext,
+)
+from litefs.usecases.route_stats import UNMATCHED_ROUTE, RouteStatsCollector
+from litefs.usecases.server_timing import (
+    FORWARD_ATTEMPT_SPAN,
+    FORWARD_BACKOFF_SPAN,
+    collect_server_timing,
+)
+from litefs.usecases.tracing import current_trace_context
 
 if TYPE_CHECKING:
     pass
@@ -455,6 +476,292 @@ class TestCircuitBreaker:
         assert port.call_count == 1
 
 
+class TestForwardingMetrics:
+    """Test metrics emitted while forwarding."""
+
+    def test_observes_each_attempt_and_counts_retries(self) -> None:
+        """Each attempt's round trip is observed with its outcome."""
+        port = FakeForwardingPort(
+            responses=[
+                ConnectionError("Connection refused"),
+                ForwardingResult(status_code=502, headers={}, body=b""),
+                ForwardingResult(status_code=200, headers={}, body=b"ok"),
+            ]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=3, backoff_base=0.1, max_backoff=1.0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+        metrics = FakeMetricsAdapter()
+        middleware._metrics = metrics
+
+        middleware(create_request())
+
+        for outcome in ("connection_error", "gateway_error", "success"):
+            assert (
+                len(metrics.histogram_values(FORWARD_ATTEMPT_DURATION, outcome=outcome))
+                == 1
+            )
+        assert metrics.counter_value(FORWARD_RETRIES) == 2
+
+    def test_records_server_timing_spans(self) -> None:
+        """Each attempt and each backoff is recorded as a timing span."""
+        port = FakeForwardingPort(
+            responses=[
+                ConnectionError("Connection refused"),
+                ForwardingResult(status_code=200, headers={}, body=b"ok"),
+            ]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=3, backoff_base=0.1, max_backoff=1.0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+
+        with collect_server_timing() as timing:
+            middleware(create_request())
+
+        spans = [
+            (span.name, span.description)
+            for span in timing.spans
+            if span.name in (FORWARD_ATTEMPT_SPAN, FORWARD_BACKOFF_SPAN)
+        ]
+        assert spans == [
+            (FORWARD_ATTEMPT_SPAN, "attempt 1 connection_error"),
+            (FORWARD_BACKOFF_SPAN, "after attempt 1"),
+            (FORWARD_ATTEMPT_SPAN, "attempt 2 success"),
+        ]
+
+    def test_counts_circuit_breaker_transitions(self) -> None:
+        """Circuit state changes are counted by source and target state."""
+        port = FakeForwardingPort(responses=[ConnectionError("fail")])
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=0, backoff_base=0.1, max_backoff=1.0),
+            CircuitBreaker(
+                threshold=3,
+                reset_timeout=30.0,
+                state=CircuitBreakerState.OPEN,
+                opened_at=100.0,
+                failure_count=3,
+            ),
+            FakeTimeProvider(initial_time=135.0),
+            FakeSleeper(),
+        )
+        metrics = FakeMetricsAdapter()
+        middleware._metrics = metrics
+
+        middleware(create_request())
+
+        assert (
+            metrics.counter_value(
+                CIRCUIT_BREAKER_TRANSITIONS, from_state="open", to_state="half_open"
+            )
+            == 1
+        )
+        assert (
+            metrics.counter_value(
+                CIRCUIT_BREAKER_TRANSITIONS, from_state="half_open", to_state="open"
+            )
+            == 1
+        )
+
+
+class TestForwardingTracing:
+    """Test spans reported to the tracer while forwarding."""
+
+    def test_reports_decision_breaker_attempts_and_backoff(self) -> None:
+        """Attempts, backoffs and the breaker check are children of the request."""
+        port = FakeForwardingPort(
+            responses=[
+                ConnectionError("Connection refused"),
+                ForwardingResult(status_code=200, headers={}, body=b"ok"),
+            ]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=3, backoff_base=0.1, max_backoff=1.0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+        tracer = InMemoryTracer()
+        middleware._tracer = tracer
+
+        middleware(create_request())
+
+        assert tracer.span_names() == [
+            WRITE_FORWARDING_SPAN,
+            CIRCUIT_BREAKER_SPAN,
+            FORWARD_REQUEST_SPAN,
+            RETRY_BACKOFF_SPAN,
+            FORWARD_REQUEST_SPAN,
+        ]
+        root, breaker, failed, backoff, succeeded = tracer.spans
+        assert root.attributes["litefs.decision"] == "forward"
+        assert breaker.attributes["litefs.circuit_breaker.allowed"] is True
+        assert failed.attributes["error.type"] == "ConnectionError"
+        assert backoff.attributes["litefs.forward.backoff_seconds"] == 0.1
+        assert succeeded.attributes["litefs.forward.attempt"] == 2
+        assert succeeded.attributes["http.response.status_code"] == 200
+        assert all(span.is_child_of(root) for span in tracer.spans[1:])
+
+    def test_attempt_span_is_current_while_forwarding(self) -> None:
+        """The forwarding port sees the attempt span as the current context."""
+        seen: list[TraceContext | None] = []
+
+        class RecordingPort(FakeForwardingPort):
+            def forward_request(self, *args, **kwargs) -> ForwardingResult:
+                seen.append(current_trace_context())
+                return super().forward_request(*args, **kwargs)
+
+        port = RecordingPort(
+            responses=[ForwardingResult(status_code=200, headers={}, body=b"ok")]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+        tracer = InMemoryTracer()
+        middleware._tracer = tracer
+
+        middleware(create_request())
+
+        (attempt,) = tracer.find(FORWARD_REQUEST_SPAN)
+        assert seen == [attempt.context]
+
+    def test_incoming_traceparent_is_parent_on_primary(self) -> None:
+        """On the primary, the request span joins the replica's trace."""
+        middleware = create_middleware_with_resilience(
+            FakeForwardingPort(responses=[]),
+            RetryPolicy(max_retries=0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+            is_primary=True,
+        )
+        tracer = InMemoryTracer()
+        middleware._tracer = tracer
+        request = create_request()
+        request.META["HTTP_TRACEPARENT"] = (
+            "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+        )
+
+        middleware(request)
+
+        (root,) = tracer.spans
+        assert root.parent == TraceContext.from_traceparent(
+            request.META["HTTP_TRACEPARENT"]
+        )
+        assert root.attributes["litefs.decision"] == "primary"
+
+
+class TestRouteStats:
+    """Test per-route statistics recorded while forwarding."""
+
+    def test_records_retries_and_failure_under_route(self) -> None:
+        """A forwarded request records its retries and final failure."""
+        port = FakeForwardingPort(
+            responses=[
+                ForwardingResult(status_code=503, headers={}, body=b"busy"),
+                ForwardingResult(status_code=503, headers={}, body=b"busy"),
+            ]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=1, backoff_base=0.1, max_backoff=1.0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+        middleware._route_stats = RouteStatsCollector()
+        request = create_request()
+        request.path_info = "/api/test"
+        request.META["CONTENT_LENGTH"] = "16"
+
+        with patch(
+            "litefs_django.middleware.resolve", return_value=Mock(route="api/test")
+        ):
+            middleware(request)
+
+        (route,) = middleware._route_stats.snapshot()["routes"]
+        assert (route["method"], route["route"]) == ("POST", "/api/test")
+        assert route["forwarded"] == 1
+        assert route["retries"] == 1
+        assert route["failures"] == 1
+        assert route["request_bytes"] == 16
+        assert route["response_bytes"] == len(b"busy")
+
+    def test_records_local_request_as_unmatched(self) -> None:
+        """A request handled locally is recorded without forwarding."""
+        from django.urls import Resolver404
+
+        middleware = create_middleware_with_resilience(
+            FakeForwardingPort(responses=[]),
+            RetryPolicy(max_retries=0),
+            CircuitBreaker(threshold=5, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+            is_primary=True,
+        )
+        middleware._route_stats = RouteStatsCollector()
+        request = create_request()
+        request.path_info = "/nowhere"
+
+        with patch("litefs_django.middleware.resolve", side_effect=Resolver404()):
+            middleware(request)
+
+        (route,) = middleware._route_stats.snapshot()["routes"]
+        assert route["route"] == UNMATCHED_ROUTE
+        assert route["requests"] == 1
+        assert route["forwarded"] == 0
+        assert route["response_bytes"] == len(b"Local response")
+
+
+class TestForwardingStatus:
+    """Test forwarding counters and breaker state published process-wide."""
+
+    def test_records_outcomes_and_breaker_transitions(self) -> None:
+        """Forwarded requests and breaker transitions are published."""
+        from litefs.usecases.forwarding_status import ForwardingStatus
+
+        port = FakeForwardingPort(
+            responses=[
+                ConnectionError("Connection refused"),
+                ForwardingResult(status_code=200, headers={}, body=b"ok"),
+            ]
+        )
+        middleware = create_middleware_with_resilience(
+            port,
+            RetryPolicy(max_retries=0),
+            CircuitBreaker(threshold=1, reset_timeout=30.0),
+            FakeTimeProvider(),
+            FakeSleeper(),
+        )
+        status = ForwardingStatus()
+        middleware._forwarding_status = status
+
+        middleware(create_request())
+        assert status.snapshot() == {
+            "forwarded": 1,
+            "retries": 0,
+            "failed": 1,
+            "circuit_breaker": "open",
+        }
+
+        middleware(create_request())
+        assert status.snapshot()["forwarded"] == 2
+        assert status.snapshot()["failed"] == 2
+
+
 class TestBackoffCalculation:
     """Test exponential backoff behavior."""
 
@@ -565,3 +872,43 @@ class TestSettingsIntegration:
 
                 assert middleware._circuit_breaker is not None
                 assert middleware._circuit_breaker.disabled is True
+
+    @pytest.mark.parametrize(
+        ("tracer_path", "tracer_type"),
+        [
+            ("litefs.adapters.fakes.fake_tracer.InMemoryTracer", InMemoryTracer),
+            ("litefs.adapters.fakes.missing.Tracer", NoOpTracer),
+        ],
+    )
+    def test_tracer_loaded_from_dotted_path(
+        self, tracer_path: str, tracer_type: type
+    ) -> None:
+        """LITEFS["TRACER"] is instantiated; a bad path disables tracing only."""
+        from litefs_django.middleware import WriteForwardingMiddleware
+
+        litefs_config = {
+            "ENABLED": True,
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "static",
+            "PRIMARY_HOSTNAME": "primary",
+            "PROXY_ADDR": ":8080",
+            "RETENTION": "24h",
+            "FORWARDING": {
+                "ENABLED": True,
+                "PRIMARY_URL": "http://primary:8000",
+            },
+            "TRACER": tracer_path,
+        }
+
+        with patch("litefs_django.middleware.django_settings") as mock_settings:
+            mock_settings.LITEFS = litefs_config
+
+            def get_response(r: HttpRequest) -> HttpResponse:
+                return HttpResponse("OK")
+
+            middleware = WriteForwardingMiddleware(get_response)
+
+            assert middleware._forwarding_enabled
+            assert isinstance(middleware._tracer, tracer_type)
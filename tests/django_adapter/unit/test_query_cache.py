@@ -0,0 +1,215 @@
+"""Unit tests for the LiteFS backend query-result cache.
+
+Tests cover per-alias and per-queryset opt-in, invalidation when the
+replication position advances, and per-table invalidation on local writes.
+"""
+
+from __future__ import annotations
+
+import uuid
+from pathlib import Path
+
+import pytest
+from django.db import models
+from django.test import override_settings
+from litefs_django.db.backends.litefs.base import DatabaseWrapper
+from litefs_django.db.query_cache import (
+    QueryCacheQuerySet,
+    get_query_cache,
+    is_query_cache_enabled,
+    use_query_cache,
+)
+
+from .conftest import create_litefs_settings_dict
+
+
+class LiteFSDatabase:
+    """Production-mode LiteFS connection on a temporary mount."""
+
+    def __init__(self, mount_path: Path, cache_all_queries: bool) -> None:
+        """Create the mount, position file, connection and a test table."""
+        mount_path.mkdir()
+        (mount_path / ".primary").write_text("node-1")
+        self.position_file = mount_path / "test.db-pos"
+        self.set_txid(1)
+
+        settings_dict = create_litefs_settings_dict(mount_path)
+        settings_dict["OPTIONS"]["litefs_query_cache"] = cache_all_queries
+        # Unique alias per test, since caches are process-wide per alias
+        self.alias = f"test-{uuid.uuid4().hex[:8]}"
+        self.wrapper = DatabaseWrapper(settings_dict, alias=self.alias)
+        self.wrapper.ensure_connection()
+
+        self.statements: list[str] = []
+        self.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT)")
+        self.execute("CREATE TABLE authors (id INTEGER PRIMARY KEY, name TEXT)")
+        self.execute("INSERT INTO articles (title) VALUES (%s)", ["first"])
+        self.wrapper.connection.set_trace_callback(self.statements.append)
+
+    def set_txid(self, txid: int) -> None:
+        """Write the LiteFS position file."""
+        self.position_file.write_text(f"{txid:016x}/{'0' * 16}")
+
+    def execute(self, sql: str, params: list | None = None) -> list[tuple]:
+        """Execute a statement through Django's cursor wrapper."""
+        with self.wrapper.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+
+    def count_executed(self, fragment: str) -> int:
+        """Count statements that reached SQLite containing a fragment."""
+        return sum(fragment in statement for statement in self.statements)
+
+
+@pytest.fixture
+def database(tmp_path: Path):
+    """LiteFS connection caching every read query."""
+    with override_settings(LITEFS={"ENABLED": True}):
+        db = LiteFSDatabase(tmp_path / "litefs", cache_all_queries=True)
+        yield db
+        db.wrapper.close()
+
+
+@pytest.fixture
+def opt_in_database(tmp_path: Path):
+    """LiteFS connection caching only inside use_query_cache()."""
+    with override_settings(LITEFS={"ENABLED": True}):
+        db = LiteFSDatabase(tmp_path / "litefs", cache_all_queries=False)
+        yield db
+        db.wrapper.close()
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestQueryCacheBackend:
+    """Test query-result caching in LiteFSCursor."""
+
+    def test_repeated_query_served_from_cache(self, database: LiteFSDatabase):
+        """Test that an identical read runs once per TXID."""
+        first = database.execute("SELECT title FROM articles WHERE id = %s", [1])
+        second = database.execute("SELECT title FROM articles WHERE id = %s", [1])
+
+        assert first == second == [("first",)]
+        assert database.count_executed("FROM articles") == 1
+        cache = get_query_cache(database.alias)
+        assert cache is not None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_cached_result_exposes_description(self, database: LiteFSDatabase):
+        """Test that cached results keep their column description."""
+        database.execute("SELECT id, title FROM articles")
+
+        with database.wrapper.cursor() as cursor:
+            cursor.execute("SELECT id, title FROM articles")
+            assert [column[0] for column in cursor.description] == ["id", "title"]
+            assert cursor.fetchone() == (1, "first")
+            assert cursor.fetchone() is None
+
+    def test_different_params_cached_separately(self, database: LiteFSDatabase):
+        """Test that parameters are part of the key."""
+        database.execute("SELECT title FROM articles WHERE id = %s", [1])
+
+        assert database.execute("SELECT title FROM articles WHERE id = %s", [2]) == []
+        assert database.count_executed("FROM articles") == 2
+
+    def test_txid_advance_invalidates(self, database: LiteFSDatabase):
+        """Test that a new local TXID runs the query again."""
+        database.execute("SELECT title FROM articles")
+        database.set_txid(2)
+        database.execute("SELECT title FROM articles")
+
+        assert database.count_executed("FROM articles") == 2
+
+    def test_write_invalidates_written_table_only(self, database: LiteFSDatabase):
+        """Test per-table invalidation on a local write."""
+        database.execute("SELECT title FROM articles")
+        database.execute("SELECT name FROM authors")
+
+        database.execute("INSERT INTO articles (title) VALUES (%s)", ["second"])
+        articles = database.execute("SELECT title FROM articles")
+        database.execute("SELECT name FROM authors")
+
+        assert articles == [("first",), ("second",)]
+        assert database.count_executed("SELECT name FROM authors") == 1
+
+    def test_reads_after_write_in_transaction_bypass_cache(
+        self, database: LiteFSDatabase
+    ):
+        """Test that uncommitted rows are neither served nor stored."""
+        database.execute("SELECT title FROM articles")
+
+        database.wrapper.set_autocommit(False)
+        database.execute("INSERT INTO articles (title) VALUES (%s)", ["second"])
+        in_transaction = database.execute("SELECT title FROM articles")
+        database.wrapper.rollback()
+        database.wrapper.set_autocommit(True)
+        after_rollback = database.execute("SELECT title FROM articles")
+
+        assert in_transaction == [("first",), ("second",)]
+        assert after_rollback == [("first",)]
+
+    def test_commit_invalidates_written_tables(self, database: LiteFSDatabase):
+        """Test that committing a transaction drops results of written tables."""
+        database.wrapper.set_autocommit(False)
+        database.execute("UPDATE articles SET title = %s", ["edited"])
+        database.wrapper.commit()
+        database.wrapper.set_autocommit(True)
+
+        assert database.execute("SELECT title FROM articles") == [("edited",)]
+        assert database.execute("SELECT title FROM articles") == [("edited",)]
+        assert database.count_executed("SELECT title FROM articles") == 1
+
+    def test_not_cached_without_opt_in(self, opt_in_database: LiteFSDatabase):
+        """Test that caching is off unless the alias or the caller opts in."""
+        opt_in_database.execute("SELECT title FROM articles")
+        opt_in_database.execute("SELECT title FROM articles")
+
+        assert opt_in_database.count_executed("FROM articles") == 2
+
+    def test_use_query_cache_opts_in(self, opt_in_database: LiteFSDatabase):
+        """Test per-block opt-in."""
+        with use_query_cache():
+            opt_in_database.execute("SELECT title FROM articles")
+            opt_in_database.execute("SELECT title FROM articles")
+
+        assert opt_in_database.count_executed("FROM articles") == 1
+
+    def test_cache_options_not_passed_to_sqlite(self, database: LiteFSDatabase):
+        """Test that query cache options are removed from connection params."""
+        params = database.wrapper.get_connection_params()
+
+        assert "litefs_query_cache" not in params
+        assert "litefs_query_cache_max_bytes" not in params
+
+    @override_settings(LITEFS={"ENABLED": False})
+    def test_disabled_in_dev_mode(self, tmp_path: Path):
+        """Test that dev mode never caches, as there is no LiteFS position."""
+        settings_dict = create_litefs_settings_dict(tmp_path)
+        settings_dict["NAME"] = str(tmp_path / "dev.db")
+        settings_dict["OPTIONS"]["litefs_query_cache"] = True
+
+        wrapper = DatabaseWrapper(settings_dict, alias=f"dev-{uuid.uuid4().hex[:8]}")
+
+        assert wrapper._query_cache is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestQueryCacheQuerySet:
+    """Test per-queryset opt-in."""
+
+    def test_cached_enables_cache_while_fetching(self, monkeypatch):
+        """Test that evaluating a cached() queryset runs inside use_query_cache."""
+        enabled_during_fetch: list[bool] = []
+        monkeypatch.setattr(
+            models.QuerySet,
+            "_fetch_all",
+            lambda self: enabled_during_fetch.append(is_query_cache_enabled()),
+        )
+        queryset = QueryCacheQuerySet()
+
+        queryset._fetch_all()
+        queryset.cached().filter()._fetch_all()
+
+        assert enabled_during_fetch == [False, True]
+        assert is_query_cache_enabled() is False
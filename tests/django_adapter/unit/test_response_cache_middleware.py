@@ -0,0 +1,249 @@
+"""Unit tests for ResponseCacheMiddleware.
+
+Tests cover TXID-keyed caching of opted-in views, conditional requests
+answered with 304, and automatic invalidation when replication advances.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from django.http import HttpRequest, HttpResponse
+from django.test import RequestFactory, override_settings
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.replication import ReplicationPosition
+from litefs.usecases.response_cache import ResponseCache, cache_by_txid
+from litefs_django.middleware import ResponseCacheMiddleware
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FakePositionReader:
+    """Position reader with a settable position."""
+
+    def __init__(self, txid: int | None = 1) -> None:
+        """Initialize with a TXID (None means no position file)."""
+        self.txid = txid
+
+    def read_position(self) -> ReplicationPosition | None:
+        """Return the current fake position."""
+        if self.txid is None:
+            return None
+        return ReplicationPosition(txid=self.txid, checksum="abcd")
+
+
+class CountingView:
+    """View that counts calls and returns a configurable response."""
+
+    def __init__(self, response_factory: Callable[[], HttpResponse] | None = None):
+        """Initialize with an optional response factory."""
+        self.calls = 0
+        self.response_factory = response_factory or (lambda: HttpResponse("page"))
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        """Render the response."""
+        self.calls += 1
+        return self.response_factory()
+
+
+def create_middleware(
+    view: Callable[[HttpRequest], HttpResponse],
+    position_reader: FakePositionReader,
+) -> ResponseCacheMiddleware:
+    """Create middleware whose get_response runs process_view and the view."""
+    middleware: ResponseCacheMiddleware
+
+    def get_response(request: HttpRequest) -> HttpResponse:
+        short_circuit = middleware.process_view(request, view, (), {})
+        if short_circuit is not None:
+            return short_circuit
+        return view(request)
+
+    middleware = ResponseCacheMiddleware(get_response)
+    middleware._cache = ResponseCache()
+    middleware._position_reader = position_reader
+    middleware._vary_headers = ("Accept",)
+    return middleware
+
+
+@pytest.fixture
+def request_factory() -> RequestFactory:
+    """Django RequestFactory for creating test requests."""
+    return RequestFactory()
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.ResponseCacheMiddleware")
+class TestResponseCacheMiddleware:
+    """Test TXID-versioned response caching."""
+
+    def test_disabled_by_default_in_dev_mode(self) -> None:
+        """Test that the cache is off without LiteFS configuration."""
+        middleware = ResponseCacheMiddleware(lambda request: HttpResponse("page"))
+
+        assert middleware.cache is None
+
+    def test_reports_stats_through_shared_metrics(
+        self, request_factory: RequestFactory, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a cache built from settings reports to the shared adapter."""
+        metrics = FakeMetricsAdapter()
+        monkeypatch.setattr(
+            "litefs_django.services.get_shared_metrics", lambda: metrics
+        )
+        litefs = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "static",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "PRIMARY_HOSTNAME": "node1",
+            "RESPONSE_CACHE": {"ENABLED": True},
+        }
+        view = cache_by_txid(CountingView())
+        with override_settings(LITEFS=litefs, DEBUG=False):
+            middleware = create_middleware(view, FakePositionReader(txid=1))
+            cache = ResponseCacheMiddleware(lambda request: HttpResponse()).cache
+        middleware._cache = cache
+
+        middleware(request_factory.get("/articles"))
+        middleware(request_factory.get("/articles"))
+
+        hits, misses, size_bytes = metrics.current_response_cache_stats
+        assert (hits, misses) == (1, 1)
+        assert size_bytes > 0
+
+    def test_second_request_served_from_cache(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that an opted-in view runs once per TXID."""
+        view = cache_by_txid(CountingView())
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+
+        first = middleware(request_factory.get("/articles"))
+        second = middleware(request_factory.get("/articles"))
+
+        assert view.calls == 1
+        assert first["X-LiteFS-Cache"] == "MISS"
+        assert second["X-LiteFS-Cache"] == "HIT"
+        assert second.content == b"page"
+        assert first["ETag"] == second["ETag"]
+
+    def test_txid_advance_invalidates(self, request_factory: RequestFactory) -> None:
+        """Test that a new TXID renders the view again with a new ETag."""
+        view = cache_by_txid(CountingView())
+        reader = FakePositionReader(txid=1)
+        middleware = create_middleware(view, reader)
+
+        first = middleware(request_factory.get("/articles"))
+        reader.txid = 2
+        second = middleware(request_factory.get("/articles"))
+
+        assert view.calls == 2
+        assert second["X-LiteFS-Cache"] == "MISS"
+        assert first["ETag"] != second["ETag"]
+
+    def test_if_none_match_returns_304_without_view(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test conditional requests answered from the TXID alone."""
+        view = cache_by_txid(CountingView())
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+        etag = middleware(request_factory.get("/articles"))["ETag"]
+
+        response = middleware(
+            request_factory.get("/articles", HTTP_IF_NONE_MATCH=etag)
+        )
+
+        assert response.status_code == 304
+        assert response["ETag"] == etag
+        assert view.calls == 1
+
+    def test_vary_header_values_cached_separately(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that vary header values are part of the key."""
+        view = cache_by_txid(CountingView())
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+
+        middleware(request_factory.get("/articles", HTTP_ACCEPT="text/html"))
+        middleware(request_factory.get("/articles", HTTP_ACCEPT="application/json"))
+        middleware(request_factory.get("/articles", HTTP_ACCEPT="text/html"))
+
+        assert view.calls == 2
+
+    def test_view_without_decorator_not_cached(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that caching is per-view opt-in."""
+        view = CountingView()
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+
+        response = middleware(request_factory.get("/articles"))
+        middleware(request_factory.get("/articles"))
+
+        assert view.calls == 2
+        assert "ETag" not in response
+
+    def test_post_not_cached(self, request_factory: RequestFactory) -> None:
+        """Test that only GET requests are cached."""
+        view = cache_by_txid(CountingView())
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+
+        middleware(request_factory.post("/articles"))
+        middleware(request_factory.post("/articles"))
+
+        assert view.calls == 2
+
+    def test_response_with_cookie_not_cached(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that responses setting cookies are never cached."""
+
+        def render() -> HttpResponse:
+            response = HttpResponse("page")
+            response.set_cookie("session", "1")
+            return response
+
+        view = cache_by_txid(CountingView(render))
+        middleware = create_middleware(view, FakePositionReader(txid=1))
+
+        response = middleware(request_factory.get("/articles"))
+        middleware(request_factory.get("/articles"))
+
+        assert view.calls == 2
+        assert "ETag" not in response
+
+    def test_unknown_position_bypasses_cache(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the cache is bypassed before the database exists."""
+        view = cache_by_txid(CountingView())
+        middleware = create_middleware(view, FakePositionReader(txid=None))
+
+        middleware(request_factory.get("/articles"))
+        middleware(request_factory.get("/articles"))
+
+        assert view.calls == 2
+
+    def test_response_not_stored_if_txid_advanced_during_view(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that a response rendered across a TXID change is not stored."""
+        reader = FakePositionReader(txid=1)
+
+        def render() -> HttpResponse:
+            reader.txid += 1
+            return HttpResponse("page")
+
+        view = cache_by_txid(CountingView(render))
+        middleware = create_middleware(view, reader)
+
+        middleware(request_factory.get("/articles"))
+
+        assert middleware.cache is not None
+        assert len(middleware.cache) == 0
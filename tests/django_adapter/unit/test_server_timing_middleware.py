@@ -0,0 +1,156 @@
+"""Unit tests for ServerTimingMiddleware and the spans it reports."""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from litefs.usecases.server_timing import (
+    DB_LOCK_WAIT_SPAN,
+    PRIMARY_CHECK_SPAN,
+    SPLIT_BRAIN_CHECK_SPAN,
+    collect_server_timing,
+    record_span,
+)
+from litefs.usecases.split_brain_detector import SplitBrainDetector
+from litefs_django.db.backends.litefs.base import DatabaseWrapper, LiteFSCursor
+from litefs_django.middleware import ServerTimingMiddleware
+
+from .conftest import create_litefs_settings_dict
+from .fakes import FakePrimaryDetector, FakeSplitBrainDetector
+
+pytestmark = [
+    pytest.mark.tier(1),
+    pytest.mark.tra("Adapter.Http.ServerTimingMiddleware"),
+]
+
+LITEFS_SETTINGS = {
+    "MOUNT_PATH": "/litefs",
+    "DATA_PATH": "/var/lib/litefs",
+    "DATABASE_NAME": "db.sqlite3",
+    "LEADER_ELECTION": "static",
+    "PRIMARY_HOSTNAME": "node1",
+    "PROXY_ADDR": ":8080",
+    "ENABLED": True,
+    "RETENTION": "1h",
+}
+
+
+def view_recording_primary_check(request) -> HttpResponse:
+    """View whose handling includes a primary check span."""
+    record_span(PRIMARY_CHECK_SPAN, time.perf_counter(), "view")
+    return HttpResponse("ok")
+
+
+class TestServerTimingMiddleware:
+    """Test the Server-Timing header and log line."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    @override_settings(LITEFS={**LITEFS_SETTINGS, "SERVER_TIMING": {"ENABLED": True}})
+    def test_header_reports_spans_and_total(self, request_factory) -> None:
+        """Spans recorded during the request are reported with the total."""
+        middleware = ServerTimingMiddleware(view_recording_primary_check)
+
+        response = middleware(request_factory.post("/articles/"))
+
+        header = response["Server-Timing"]
+        assert header.startswith('litefs-primary;desc="view";dur=')
+        assert ", total;dur=" in header
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_disabled_by_default(self, request_factory) -> None:
+        """Without SERVER_TIMING the response is left untouched."""
+        middleware = ServerTimingMiddleware(view_recording_primary_check)
+
+        response = middleware(request_factory.get("/"))
+
+        assert not response.has_header("Server-Timing")
+
+    @override_settings(LITEFS={**LITEFS_SETTINGS, "SERVER_TIMING": {"ENABLED": True}})
+    def test_appends_to_application_header(self, request_factory) -> None:
+        """An existing Server-Timing header of the view is kept."""
+
+        def view(request) -> HttpResponse:
+            response = HttpResponse("ok")
+            response["Server-Timing"] = "render;dur=1.5"
+            return response
+
+        response = ServerTimingMiddleware(view)(request_factory.get("/"))
+
+        assert response["Server-Timing"].startswith("render;dur=1.5, total;dur=")
+
+    @override_settings(
+        LITEFS={**LITEFS_SETTINGS, "SERVER_TIMING": {"ENABLED": True, "LOG": True}}
+    )
+    def test_logs_structured_line(self, request_factory, caplog) -> None:
+        """With LOG, the spans are logged as JSON with the request."""
+        middleware = ServerTimingMiddleware(view_recording_primary_check)
+
+        with caplog.at_level(logging.INFO, logger="litefs.usecases.server_timing"):
+            middleware(request_factory.get("/articles/"))
+
+        record = caplog.records[-1]
+        fields = json.loads(record.getMessage().split(": ", 1)[1])
+        assert fields["method"] == "GET"
+        assert fields["path"] == "/articles/"
+        assert fields["status"] == 200
+        assert [span["name"] for span in fields["spans"]] == [
+            PRIMARY_CHECK_SPAN,
+            "total",
+        ]
+        assert record.litefs_server_timing == fields
+
+
+class TestDatabaseSpans:
+    """Test spans recorded by the database backend."""
+
+    def test_cursor_records_write_checks(self) -> None:
+        """Writes record the split-brain and primary check spans."""
+        connection = sqlite3.connect(":memory:")
+        cursor = LiteFSCursor(
+            connection,
+            primary_detector=FakePrimaryDetector(is_primary=True),
+            split_brain_detector=SplitBrainDetector(FakeSplitBrainDetector()),
+        )
+
+        with collect_server_timing() as timing:
+            cursor.execute("CREATE TABLE articles (id INTEGER PRIMARY KEY)")
+            cursor.execute("SELECT id FROM articles")
+
+        assert [span.name for span in timing.spans] == [
+            SPLIT_BRAIN_CHECK_SPAN,
+            PRIMARY_CHECK_SPAN,
+        ]
+        cursor.close()
+        connection.close()
+
+    def test_transaction_start_records_lock_wait(self, tmp_path: Path) -> None:
+        """Starting a transaction records the wait for the write lock."""
+        mount_path = tmp_path / "litefs"
+        mount_path.mkdir()
+        (mount_path / ".primary").write_text("node-1")
+        with override_settings(LITEFS={"ENABLED": True}):
+            wrapper = DatabaseWrapper(
+                create_litefs_settings_dict(mount_path),
+                alias=f"test-{uuid.uuid4().hex[:8]}",
+            )
+            wrapper.ensure_connection()
+            with collect_server_timing() as timing:
+                wrapper._start_transaction_under_autocommit()
+            wrapper.connection.execute("COMMIT")
+            wrapper.close()
+
+        assert [(span.name, span.description) for span in timing.spans] == [
+            (DB_LOCK_WAIT_SPAN, "IMMEDIATE")
+        ]
@@ -0,0 +1,145 @@
+"""Unit tests for the process-wide LiteFS service container."""
+
+from __future__ import annotations
+
+import pytest
+from django.test import override_settings
+from litefs.usecases.primary_detector import PrimaryDetector
+from litefs_django import services as services_module
+from litefs_django.services import (
+    get_health_snapshot_evaluator,
+    get_services,
+    get_shared_primary_detector,
+    reset_services,
+)
+from litefs_django.signals import replication_changed
+from litefs_django.views import get_readiness_checker
+
+LITEFS_SETTINGS = {
+    "MOUNT_PATH": "/litefs",
+    "DATA_PATH": "/var/lib/litefs",
+    "DATABASE_NAME": "db.sqlite3",
+    "LEADER_ELECTION": "static",
+    "PRIMARY_HOSTNAME": "node1",
+    "PROXY_ADDR": ":8080",
+    "ENABLED": True,
+    "RETENTION": "1h",
+}
+
+
+@pytest.fixture(autouse=True)
+def fresh_services():
+    """Start and end every test without a process-wide container."""
+    reset_services()
+    yield
+    reset_services()
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestProcessWideServices:
+    """Test sharing and rebuilding of the Django service container."""
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_container_shared_between_calls(self, monkeypatch) -> None:
+        """Test that the container and its members are built once."""
+        monkeypatch.setenv("LITEFS_NODE_ID", "node1")
+
+        assert get_services() is get_services()
+        assert get_readiness_checker() is get_readiness_checker()
+
+    @override_settings(LITEFS=None)
+    def test_missing_settings_raise(self) -> None:
+        """Test that using the container without LITEFS settings fails."""
+        with pytest.raises(RuntimeError):
+            get_services()
+
+    def test_setting_changed_rebuilds_container(self) -> None:
+        """Test that overriding LITEFS discards the previous container."""
+        with override_settings(LITEFS=LITEFS_SETTINGS):
+            first = get_services()
+
+        with override_settings(LITEFS={**LITEFS_SETTINGS, "MOUNT_PATH": "/other"}):
+            second = get_services()
+
+        assert second is not first
+        assert second.settings.mount_path == "/other"
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_unrelated_setting_change_keeps_container(self) -> None:
+        """Test that only LITEFS changes rebuild the container."""
+        first = get_services()
+
+        with override_settings(USE_TZ=False):
+            assert get_services() is first
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_reset_closes_container(self, monkeypatch) -> None:
+        """Test that reset_services() releases the previous container."""
+        services = get_services()
+        closed = []
+        monkeypatch.setattr(services, "close", lambda: closed.append(True))
+
+        reset_services()
+
+        assert closed == [True]
+        assert services_module._services is None
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestSharedPrimaryDetector:
+    """Test the primary detector shared with the database backend."""
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_same_mount_shares_container_detector(self) -> None:
+        """Test that the backend reuses the container's detector."""
+        detector = get_shared_primary_detector("/litefs")
+
+        assert detector is get_services().primary_detector
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_other_mount_gets_own_detector(self) -> None:
+        """Test that a backend on another mount gets its own detector."""
+        detector = get_shared_primary_detector("/elsewhere")
+
+        assert detector is not get_services().primary_detector
+        assert detector.mount_path.as_posix() == "/elsewhere"
+
+    @override_settings(LITEFS={"ENABLED": True})
+    def test_invalid_settings_fall_back(self) -> None:
+        """Test that incomplete LITEFS settings do not break the backend."""
+        assert isinstance(get_shared_primary_detector("/litefs"), PrimaryDetector)
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestHealthSnapshotEvaluatorLifecycle:
+    """Test the process-wide health snapshot evaluator."""
+
+    @override_settings(LITEFS=LITEFS_SETTINGS)
+    def test_disabled_by_default(self) -> None:
+        """Test that no evaluator runs unless HEALTH_SNAPSHOT is enabled."""
+        assert get_health_snapshot_evaluator() is None
+
+    @override_settings(LITEFS=None)
+    def test_missing_settings_return_none(self) -> None:
+        """Test that views can fall back when LITEFS is not configured."""
+        assert get_health_snapshot_evaluator() is None
+
+    @override_settings(
+        LITEFS={**LITEFS_SETTINGS, "HEALTH_SNAPSHOT": {"ENABLED": True}}
+    )
+    def test_enabled_evaluator_started_once_and_stopped_on_reset(self) -> None:
+        """Test that the evaluator is shared, subscribed and stopped."""
+        evaluator = get_health_snapshot_evaluator()
+
+        assert evaluator is not None
+        assert evaluator.is_running
+        assert get_health_snapshot_evaluator() is evaluator
+        assert replication_changed.has_listeners()
+
+        reset_services()
+
+        assert not evaluator.is_running
+        assert not replication_changed.has_listeners()
@@ -7,8 +7,16 @@ from litefs.domain.settings import (
     LiteFSSettings,
     StaticLeaderConfig,
     ForwardingSettings,
+    ReplicationSettings,
+    ResponseCacheSettings,
+    ChangeBusSettings,
+    HealthSnapshotSettings,
+    RouteStatsSettings,
+    HealthProbeSettings,
+    ServerTimingSettings,
     LiteFSConfigError,
 )
+from litefs.domain.health import ProbeThresholds
 from litefs_django.settings import get_litefs_settings, is_dev_mode
 
 
@@ -57,6 +65,128 @@ class TestSettingsReader:
         assert settings.raft_self_addr == "localhost:4321"
         assert settings.raft_peers == ["node1:4321", "node2:4321"]
 
+    def test_raft_cluster_metadata_mapping(self):
+        """Test that the cluster metadata keys map to the Raft settings."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "node1:4321",
+            "RAFT_PEERS": ["node2:4321"],
+            "RAFT_CLUSTER_METADATA": True,
+            "RAFT_FORWARDING_URL": "http://node1:8000",
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_cluster_metadata is True
+        assert settings.raft_forwarding_url == "http://node1:8000"
+
+    def test_raft_observers_mapping(self):
+        """Test that RAFT_OBSERVERS maps to the non-voting members."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "replica1:4321",
+            "RAFT_PEERS": ["node1:4321", "node2:4321", "node3:4321"],
+            "RAFT_OBSERVERS": ["replica1:4321"],
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_observers == ["replica1:4321"]
+
+    def test_raft_dynamic_membership_mapping(self):
+        """Test that RAFT_DYNAMIC_MEMBERSHIP and RAFT_MEMBERSHIP_FILE map."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "node1:4321",
+            "RAFT_PEERS": ["node2:4321", "node3:4321"],
+            "RAFT_DYNAMIC_MEMBERSHIP": True,
+            "RAFT_MEMBERSHIP_FILE": "/var/lib/litefs/members.json",
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_dynamic_membership is True
+        assert settings.raft_membership_file == "/var/lib/litefs/members.json"
+
+    def test_raft_priorities_mapping(self):
+        """Test that RAFT_PRIORITIES and RAFT_REBALANCE_AFTER map."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "node1:4321",
+            "RAFT_PEERS": ["node2:4321", "standby:4321"],
+            "RAFT_PRIORITIES": {"node1:4321": 2, "node2:4321": 2},
+            "RAFT_REBALANCE_AFTER": 60.0,
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_priorities == {"node1:4321": 2, "node2:4321": 2}
+        assert settings.raft_rebalance_after == 60.0
+
+    def test_raft_timing_mapping(self):
+        """Test that the Raft timing settings map."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "node1:4321",
+            "RAFT_PEERS": ["node2:4321"],
+            "RAFT_ELECTION_TIMEOUT": 2.0,
+            "RAFT_HEARTBEAT_INTERVAL": 0.2,
+            "RAFT_ADAPTIVE_TIMEOUTS": True,
+            "RAFT_MIN_ELECTION_TIMEOUT": 0.5,
+            "RAFT_MIN_HEARTBEAT_INTERVAL": 0.05,
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_election_timeout == 2.0
+        assert settings.raft_heartbeat_interval == 0.2
+        assert settings.raft_adaptive_timeouts is True
+        assert settings.raft_min_election_timeout == 0.5
+        assert settings.raft_min_heartbeat_interval == 0.05
+
+    def test_raft_leader_protection_mapping(self):
+        """Test that pre-vote and check-quorum map and default to enabled."""
+        django_settings = {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "raft",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "RAFT_SELF_ADDR": "node1:4321",
+            "RAFT_PEERS": ["node2:4321"],
+        }
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_pre_vote is True
+        assert settings.raft_check_quorum is True
+
+        django_settings["RAFT_PRE_VOTE"] = False
+        django_settings["RAFT_CHECK_QUORUM"] = False
+        settings = get_litefs_settings(django_settings)
+        assert settings.raft_pre_vote is False
+        assert settings.raft_check_quorum is False
+
     def test_optional_fields_with_none(self):
         """Test that optional fields can be None."""
         django_settings = {
@@ -774,6 +904,19 @@ class TestForwardingConfigParsing:
         assert settings.forwarding.excluded_paths == ()
         assert settings.forwarding.scheme == "http"
 
+    def test_parse_forwarding_read_your_writes(self) -> None:
+        """Test parsing read-your-writes options from FORWARDING config."""
+        django_settings = self._base_settings()
+        django_settings["FORWARDING"] = {
+            "READ_YOUR_WRITES": False,
+            "READ_YOUR_WRITES_TIMEOUT": 2.5,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.forwarding is not None
+        assert settings.forwarding.read_your_writes is False
+        assert settings.forwarding.read_your_writes_timeout == 2.5
+
     def test_parse_forwarding_config_excluded_paths_list_to_tuple(self) -> None:
         """Test that EXCLUDED_PATHS list is converted to tuple."""
         django_settings = self._base_settings()
@@ -794,6 +937,222 @@ class TestForwardingConfigParsing:
         assert settings.forwarding is None
 
 
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestReplicationConfigParsing:
+    """Test parsing of REPLICATION configuration from Django settings."""
+
+    def _base_settings(self) -> dict:
+        """Return minimal valid Django settings dict."""
+        return {
+            "MOUNT_PATH": "/litefs",
+            "DATA_PATH": "/var/lib/litefs",
+            "DATABASE_NAME": "db.sqlite3",
+            "LEADER_ELECTION": "static",
+            "PROXY_ADDR": ":8080",
+            "ENABLED": True,
+            "RETENTION": "1h",
+            "PRIMARY_HOSTNAME": "node1",
+        }
+
+    def test_parse_replication_config(self) -> None:
+        """Test parsing REPLICATION config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["REPLICATION"] = {
+            "MAX_LAG_TXIDS": 50,
+            "MAX_LAG_SECONDS": 5.0,
+            "RATE_WINDOW_SECONDS": 120.0,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.replication == ReplicationSettings(
+            max_lag_txids=50, max_lag_seconds=5.0, rate_window_seconds=120.0
+        )
+
+    def test_parse_replication_config_defaults(self) -> None:
+        """Test that ReplicationSettings defaults apply to an empty dict."""
+        django_settings = self._base_settings()
+        django_settings["REPLICATION"] = {}
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.replication == ReplicationSettings()
+
+    def test_parse_without_replication_config(self) -> None:
+        """Test parsing without REPLICATION key (backward compat)."""
+        settings = get_litefs_settings(self._base_settings())
+
+        assert settings.replication is None
+
+    def test_parse_response_cache_config(self) -> None:
+        """Test parsing RESPONSE_CACHE config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["RESPONSE_CACHE"] = {
+            "ENABLED": True,
+            "MAX_BYTES": 4096,
+            "MAX_ENTRY_BYTES": 1024,
+            "VARY_HEADERS": ["Accept-Language"],
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.response_cache == ResponseCacheSettings(
+            enabled=True,
+            max_bytes=4096,
+            max_entry_bytes=1024,
+            vary_headers=("Accept-Language",),
+        )
+
+    def test_parse_response_cache_config_defaults(self) -> None:
+        """Test that ResponseCacheSettings defaults apply to an empty dict."""
+        django_settings = self._base_settings()
+        django_settings["RESPONSE_CACHE"] = {}
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.response_cache == ResponseCacheSettings()
+        assert get_litefs_settings(self._base_settings()).response_cache is None
+
+    def test_parse_change_bus_config(self) -> None:
+        """Test parsing CHANGE_BUS config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["CHANGE_BUS"] = {
+            "ENABLED": True,
+            "POLL_INTERVAL": 1.0,
+            "MIN_INTERVAL": 0.25,
+            "USE_INOTIFY": False,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.change_bus == ChangeBusSettings(
+            enabled=True, poll_interval=1.0, min_interval=0.25, use_inotify=False
+        )
+
+    def test_parse_change_bus_config_defaults(self) -> None:
+        """Test that ChangeBusSettings defaults apply to an empty dict."""
+        django_settings = self._base_settings()
+        django_settings["CHANGE_BUS"] = {}
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.change_bus == ChangeBusSettings()
+        assert get_litefs_settings(self._base_settings()).change_bus is None
+
+    def test_parse_health_snapshot_config(self) -> None:
+        """Test parsing HEALTH_SNAPSHOT config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["HEALTH_SNAPSHOT"] = {
+            "ENABLED": True,
+            "INTERVAL": 2.0,
+            "MAX_AGE": 6.0,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.health_snapshot == HealthSnapshotSettings(
+            enabled=True, interval=2.0, max_age=6.0
+        )
+
+    def test_parse_health_snapshot_config_defaults(self) -> None:
+        """Test that HealthSnapshotSettings defaults apply to an empty dict."""
+        django_settings = self._base_settings()
+        django_settings["HEALTH_SNAPSHOT"] = {}
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.health_snapshot == HealthSnapshotSettings()
+        assert get_litefs_settings(self._base_settings()).health_snapshot is None
+
+    def test_parse_server_timing_config(self) -> None:
+        """Test parsing SERVER_TIMING config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["SERVER_TIMING"] = {"ENABLED": True, "LOG": True}
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.server_timing == ServerTimingSettings(enabled=True, log=True)
+        assert get_litefs_settings(self._base_settings()).server_timing is None
+
+    def test_parse_route_stats_config(self) -> None:
+        """Test parsing ROUTE_STATS config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["ROUTE_STATS"] = {
+            "ENABLED": True,
+            "MAX_ROUTES": 50,
+            "RELATIVE_ACCURACY": 0.02,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.route_stats == RouteStatsSettings(
+            enabled=True, max_routes=50, relative_accuracy=0.02
+        )
+        assert get_litefs_settings(self._base_settings()).route_stats is None
+
+    def test_parse_route_stats_rejects_invalid_bounds(self) -> None:
+        """Test that ROUTE_STATS bounds are validated."""
+        django_settings = self._base_settings()
+        django_settings["ROUTE_STATS"] = {"ENABLED": True, "MAX_ROUTES": 0}
+
+        with pytest.raises(LiteFSConfigError):
+            get_litefs_settings(django_settings)
+
+    def test_parse_health_probes_config(self) -> None:
+        """Test parsing HEALTH_PROBES config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["HEALTH_PROBES"] = {
+            "ENABLED": True,
+            "INTERVAL": 10.0,
+            "FAILURE_THRESHOLD": 5,
+            "RECOVERY_THRESHOLD": 4,
+            "THRESHOLDS": {
+                "free_disk": {"DEGRADED": 2**31, "UNHEALTHY": 2**28},
+                "wal_size": None,
+            },
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.health_probes == HealthProbeSettings(
+            enabled=True,
+            interval=10.0,
+            failure_threshold=5,
+            recovery_threshold=4,
+            thresholds={
+                "free_disk": ProbeThresholds(
+                    degraded=2**31, unhealthy=2**28, higher_is_worse=False
+                ),
+                "wal_size": None,
+            },
+        )
+        assert get_litefs_settings(self._base_settings()).health_probes is None
+
+    def test_parse_health_probes_rejects_unknown_probe(self) -> None:
+        """Test that HEALTH_PROBES thresholds must name known probes."""
+        django_settings = self._base_settings()
+        django_settings["HEALTH_PROBES"] = {"THRESHOLDS": {"cpu": {"DEGRADED": 1}}}
+
+        with pytest.raises(LiteFSConfigError):
+            get_litefs_settings(django_settings)
+
+    def test_parse_metrics_config(self) -> None:
+        """Test parsing METRICS config with all fields specified."""
+        django_settings = self._base_settings()
+        django_settings["METRICS"] = {
+            "ENABLED": True,
+            "PREFIX": "myapp_litefs",
+            "HISTOGRAM_BUCKETS": {"default": [0.01, 0.1, 1]},
+            "EXPOSITION_TTL": 5,
+        }
+        settings = get_litefs_settings(django_settings)
+
+        assert settings.metrics_enabled is True
+        assert settings.metrics_prefix == "myapp_litefs"
+        assert settings.metrics_histogram_buckets == {"default": (0.01, 0.1, 1.0)}
+        assert settings.metrics_exposition_ttl == 5
+
+    def test_parse_metrics_config_defaults(self) -> None:
+        """Test that metrics stay disabled without METRICS."""
+        settings = get_litefs_settings(self._base_settings())
+
+        assert settings.metrics_enabled is False
+        assert settings.metrics_prefix == "litefs"
+        assert settings.metrics_histogram_buckets is None
+        assert settings.metrics_exposition_ttl == 1.0
+
+
 @pytest.mark.unit
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter")
@@ -0,0 +1,175 @@
+"""Unit tests for the LiteFS backend slow-query log.
+
+Tests cover recording slow statements, sampled query plan capture, the
+slow-query metric and the per-alias OPTIONS.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import uuid
+from pathlib import Path
+
+import pytest
+from django.test import override_settings
+from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+from litefs.domain.metrics import SLOW_QUERIES
+from litefs.usecases.slow_query_log import SlowQueryLog, fingerprint_id
+from litefs_django.db.backends.litefs.base import DatabaseWrapper, LiteFSCursor
+from litefs_django.db.slow_query_log import get_slow_query_log
+
+from .conftest import create_litefs_settings_dict
+from .fakes import FakePrimaryDetector
+
+pytestmark = [
+    pytest.mark.tier(1),
+    pytest.mark.tra("Adapter.Django.Backend.SlowQueryLog"),
+]
+
+
+@pytest.fixture
+def metrics() -> FakeMetricsAdapter:
+    """Metrics adapter recording observations."""
+    return FakeMetricsAdapter()
+
+
+def make_cursor(
+    metrics: FakeMetricsAdapter, slow_query_log: SlowQueryLog
+) -> LiteFSCursor:
+    """Cursor on an in-memory database with an articles table."""
+    cursor = LiteFSCursor(
+        sqlite3.connect(":memory:"),
+        primary_detector=FakePrimaryDetector(is_primary=True),
+        metrics=metrics,
+        slow_query_log=slow_query_log,
+    )
+    cursor.executescript(
+        "CREATE TABLE articles (id INTEGER PRIMARY KEY, title TEXT);"
+        "INSERT INTO articles (title) VALUES ('first'), ('second');"
+    )
+    return cursor
+
+
+class TestCursorSlowQueryLog:
+    """Test slow statements recorded by LiteFSCursor."""
+
+    def test_full_scan_flagged_with_plan(self, metrics: FakeMetricsAdapter) -> None:
+        """Test that a slow read captures its plan and keeps its rows."""
+        log = SlowQueryLog(threshold=0.0, explain_rate=1.0)
+        cursor = make_cursor(metrics, log)
+
+        cursor.execute("SELECT id FROM articles WHERE title = %s", ["second"])
+
+        assert cursor.fetchall() == [(2,)]
+        (entry,) = log.entries()
+        assert entry.sql == "SELECT id FROM articles WHERE title = %s"
+        assert entry.full_scan is True
+        assert entry.plan is not None and entry.plan[0].startswith("SCAN")
+        assert (
+            metrics.counter_value(SLOW_QUERIES, fingerprint_id=entry.fingerprint_id)
+            == 1
+        )
+
+    def test_index_lookup_not_flagged(self, metrics: FakeMetricsAdapter) -> None:
+        """Test that a primary key lookup is not a full scan."""
+        log = SlowQueryLog(threshold=0.0, explain_rate=1.0)
+        cursor = make_cursor(metrics, log)
+
+        cursor.execute("SELECT title FROM articles WHERE id = %s", [1])
+
+        assert cursor.fetchone() == ("first",)
+        assert log.entries()[0].full_scan is False
+
+    def test_writes_recorded_without_plan(self, metrics: FakeMetricsAdapter) -> None:
+        """Test that only reads are explained."""
+        log = SlowQueryLog(threshold=0.0, explain_rate=1.0)
+        cursor = make_cursor(metrics, log)
+
+        cursor.execute("UPDATE articles SET title = %s WHERE id = %s", ["x", 1])
+        cursor.executemany("INSERT INTO articles (title) VALUES (%s)", [["a"], ["b"]])
+
+        assert [entry.plan for entry in log.entries()] == [None, None]
+
+    def test_fast_statements_ignored(self, metrics: FakeMetricsAdapter) -> None:
+        """Test that statements below the threshold are not recorded."""
+        log = SlowQueryLog(threshold=60.0, explain_rate=1.0)
+        cursor = make_cursor(metrics, log)
+
+        cursor.execute("SELECT id FROM articles")
+
+        assert log.entries() == []
+        assert metrics.counter_value(SLOW_QUERIES) == 0
+
+    def test_plan_not_captured_when_not_sampled(
+        self, metrics: FakeMetricsAdapter
+    ) -> None:
+        """Test that unsampled slow reads are recorded without a plan."""
+        log = SlowQueryLog(threshold=0.0, explain_rate=0.0)
+        cursor = make_cursor(metrics, log)
+
+        cursor.execute("SELECT id FROM articles")
+
+        (entry,) = log.entries()
+        assert entry.plan is None
+        assert (
+            metrics.counter_value(
+                SLOW_QUERIES, fingerprint_id=fingerprint_id("SELECT id FROM articles")
+            )
+            == 1
+        )
+
+
+class TestDatabaseWrapperSlowQueryLog:
+    """Test the slow-query log OPTIONS of DatabaseWrapper."""
+
+    @override_settings(LITEFS={"ENABLED": False})
+    def test_log_shared_per_alias(self, tmp_path: Path) -> None:
+        """Test that the threshold option creates the alias's log."""
+        settings_dict = create_litefs_settings_dict(tmp_path)
+        settings_dict["NAME"] = str(tmp_path / "dev.db")
+        settings_dict["OPTIONS"]["litefs_slow_query_threshold"] = 0.0
+        settings_dict["OPTIONS"]["litefs_slow_query_explain_rate"] = 1.0
+        alias = f"test-{uuid.uuid4().hex[:8]}"
+
+        wrapper = DatabaseWrapper(settings_dict, alias=alias)
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        params = wrapper.get_connection_params()
+        wrapper.close()
+
+        log = get_slow_query_log(alias)
+        assert log is not None
+        assert [entry.sql for entry in log.entries()] == ["SELECT 1"]
+        assert not any(key.startswith("litefs_slow_query") for key in params)
+
+    @override_settings(LITEFS={"ENABLED": False})
+    def test_disabled_without_threshold(self, tmp_path: Path) -> None:
+        """Test that no log is created by default."""
+        settings_dict = create_litefs_settings_dict(tmp_path)
+        settings_dict["NAME"] = str(tmp_path / "dev.db")
+        alias = f"test-{uuid.uuid4().hex[:8]}"
+
+        wrapper = DatabaseWrapper(settings_dict, alias=alias)
+
+        assert wrapper._slow_query_log is None
+        assert get_slow_query_log(alias) is None
+
+    @pytest.mark.parametrize(
+        ("option", "value"),
+        [
+            ("litefs_slow_query_threshold", -1),
+            ("litefs_slow_query_log_size", 0),
+            ("litefs_slow_query_explain_rate", 1.5),
+        ],
+    )
+    @override_settings(LITEFS={"ENABLED": False})
+    def test_invalid_options_rejected(
+        self, tmp_path: Path, option: str, value: float
+    ) -> None:
+        """Test that out-of-range options fail fast."""
+        settings_dict = create_litefs_settings_dict(tmp_path)
+        settings_dict["OPTIONS"]["litefs_slow_query_threshold"] = 0.1
+        settings_dict["OPTIONS"][option] = value
+
+        with pytest.raises(ValueError, match=option):
+            DatabaseWrapper(settings_dict, alias=f"test-{uuid.uuid4().hex[:8]}")
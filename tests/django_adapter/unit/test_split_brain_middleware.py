@@ -1,12 +1,36 @@
 """Unit tests for Django split-brain detection middleware."""
 
 import pytest
+from types import SimpleNamespace
 from unittest.mock import Mock
 from django.http import HttpResponse, HttpRequest
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 
 from litefs.domain.split_brain import RaftNodeState, RaftClusterState
-from litefs.usecases.split_brain_detector import SplitBrainDetector, SplitBrainStatus
+from litefs.usecases.split_brain_detector import (
+    SplitBrainDetector,
+    SplitBrainMonitor,
+    SplitBrainStatus,
+)
+
+
+def litefs_settings(leader_election: str) -> dict:
+    """Return production LITEFS settings for a leader election mode."""
+    settings = {
+        "MOUNT_PATH": "/litefs",
+        "DATA_PATH": "/var/lib/litefs",
+        "DATABASE_NAME": "db.sqlite3",
+        "LEADER_ELECTION": leader_election,
+        "PROXY_ADDR": ":8080",
+        "ENABLED": True,
+        "RETENTION": "1h",
+    }
+    if leader_election == "raft":
+        settings["RAFT_SELF_ADDR"] = "node1:4321"
+        settings["RAFT_PEERS"] = ["node1:4321", "node2:4321"]
+    else:
+        settings["PRIMARY_HOSTNAME"] = "node1"
+    return settings
 
 
 @pytest.mark.tier(1)
@@ -303,3 +327,59 @@ class TestSplitBrainMiddleware:
 
         # Assert: Request passes through
         assert response.status_code == 200
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.SplitBrainMiddleware")
+class TestSplitBrainMiddlewareInitialization:
+    """Test the detection SplitBrainMiddleware sets up from settings."""
+
+    @staticmethod
+    def fake_services(
+        monkeypatch: pytest.MonkeyPatch,
+        cluster_state_monitor: SplitBrainMonitor | None,
+    ) -> Mock:
+        """Share fake services, returning their detector port."""
+        port = Mock()
+        services = SimpleNamespace(
+            split_brain_detector=SplitBrainDetector(port),
+            cluster_state_monitor=cluster_state_monitor,
+        )
+        monkeypatch.setattr("litefs_django.services.get_services", lambda: services)
+        return port
+
+    def test_raft_mode_reads_cluster_state_monitor(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requests read the cluster state monitor instead of the peers."""
+        from litefs_django.middleware import SplitBrainMiddleware
+
+        monitor = Mock(spec=SplitBrainMonitor)
+        leaders = [
+            RaftNodeState(node_id="node1", is_leader=True),
+            RaftNodeState(node_id="node2", is_leader=True),
+        ]
+        monitor.latest.return_value = SplitBrainStatus(
+            is_split_brain=True, leader_nodes=leaders
+        )
+        port = self.fake_services(monkeypatch, monitor)
+
+        with override_settings(LITEFS=litefs_settings("raft"), DEBUG=False):
+            middleware = SplitBrainMiddleware(get_response=lambda r: HttpResponse())
+        response = middleware(RequestFactory().post("/test/"))
+
+        assert middleware.monitor is monitor
+        assert response.status_code == 503
+        port.get_cluster_state.assert_not_called()
+
+    def test_static_mode_does_not_detect(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """With a single configured primary, the middleware does nothing."""
+        from litefs_django.middleware import SplitBrainMiddleware
+
+        self.fake_services(monkeypatch, Mock(spec=SplitBrainMonitor))
+
+        with override_settings(LITEFS=litefs_settings("static"), DEBUG=False):
+            middleware = SplitBrainMiddleware(get_response=lambda r: HttpResponse())
+
+        assert middleware.detector is None
+        assert middleware.monitor is None
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import uuid
 from typing import TYPE_CHECKING
 from unittest.mock import Mock, patch
 
@@ -10,9 +11,23 @@ import pytest
 from django.test import RequestFactory
 
 from litefs.domain.health import HealthStatus, LivenessResult, ReadinessResult
+from litefs.domain.replication import ReplicationLag
+from litefs.usecases.health_snapshot import HealthSnapshotEvaluator
 from litefs.usecases.liveness_checker import LivenessChecker
 from litefs.usecases.readiness_checker import ReadinessChecker
-from litefs_django.views import health_check_view, liveness_view, readiness_view
+from litefs.usecases.route_stats import RouteStatsCollector
+from litefs.usecases.slow_query_log import SlowQueryLog
+from litefs_django.views import (
+    build_cluster_payload,
+    cluster_status_view,
+    health_check_view,
+    liveness_view,
+    metrics_view,
+    position_view,
+    readiness_view,
+    route_stats_view,
+    slow_queries_view,
+)
 
 if TYPE_CHECKING:
     pass
@@ -302,6 +317,7 @@ class TestHealthCheckViewIsReady:
 
         mock_health_checker = Mock()
         mock_health_checker.check_health.return_value = HealthStatus(state="healthy")
+        mock_health_checker.last_replication_lag = None
 
         mock_coordinator = Mock()
         mock_coordinator.state.value = "primary"
@@ -328,6 +344,7 @@ class TestHealthCheckViewIsReady:
 
         mock_health_checker = Mock()
         mock_health_checker.check_health.return_value = HealthStatus(state="unhealthy")
+        mock_health_checker.last_replication_lag = None
 
         mock_coordinator = Mock()
         mock_coordinator.state.value = "replica"
@@ -354,6 +371,7 @@ class TestHealthCheckViewIsReady:
 
         mock_health_checker = Mock()
         mock_health_checker.check_health.return_value = HealthStatus(state="degraded")
+        mock_health_checker.last_replication_lag = None
 
         mock_coordinator = Mock()
         mock_coordinator.state.value = "primary"
@@ -392,6 +410,7 @@ class TestHealthCheckViewNodeState:
 
         mock_health_checker = Mock()
         mock_health_checker.check_health.return_value = HealthStatus(state="healthy")
+        mock_health_checker.last_replication_lag = None
 
         mock_coordinator = Mock()
         mock_coordinator.state.value = "primary"
@@ -418,6 +437,7 @@ class TestHealthCheckViewNodeState:
 
         mock_health_checker = Mock()
         mock_health_checker.check_health.return_value = HealthStatus(state="healthy")
+        mock_health_checker.last_replication_lag = None
 
         mock_coordinator = Mock()
         mock_coordinator.state.value = "replica"
@@ -432,3 +452,562 @@ class TestHealthCheckViewNodeState:
         data = json.loads(response.content)
         assert "node_state" in data
         assert data["node_state"] == "REPLICA"
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestHealthViewsReplicationLag:
+    """Test replication position and lag in health responses."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    def test_health_check_view_includes_txid_and_lag(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that health_check_view reports the local TXID and lag."""
+        request = request_factory.get("/health/")
+
+        mock_detector = Mock()
+        mock_detector.is_primary.return_value = False
+
+        mock_health_checker = Mock()
+        mock_health_checker.check_health.return_value = HealthStatus(state="healthy")
+        mock_health_checker.last_replication_lag = ReplicationLag(
+            local_txid=40, primary_txid=50, txid_lag=10, seconds_lag=2.0
+        )
+
+        mock_coordinator = Mock()
+        mock_coordinator.state.value = "replica"
+
+        with (
+            patch("litefs_django.views.get_primary_detector", return_value=mock_detector),
+            patch("litefs_django.views.get_health_checker", return_value=mock_health_checker),
+            patch("litefs_django.views.get_failover_coordinator", return_value=mock_coordinator),
+        ):
+            response = health_check_view(request)
+
+        data = json.loads(response.content)
+        assert data["txid"] == 40
+        assert data["replication_lag"] == {
+            "primary_txid": 50,
+            "txids": 10,
+            "seconds": 2.0,
+        }
+
+    def test_readiness_view_includes_lag_when_not_ready(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that readiness_view reports lag for a lagging replica."""
+        request = request_factory.get("/health/ready")
+
+        mock_checker = Mock(spec=ReadinessChecker)
+        mock_checker.check_readiness.return_value = ReadinessResult(
+            is_ready=False,
+            can_accept_writes=False,
+            health_status=HealthStatus(state="degraded"),
+            split_brain_detected=False,
+            leader_node_ids=(),
+            error="Replication lag exceeds threshold (4999 txids behind)",
+            replication_lag=ReplicationLag(
+                local_txid=1, primary_txid=5000, txid_lag=4999
+            ),
+        )
+
+        with patch(
+            "litefs_django.views.get_readiness_checker", return_value=mock_checker
+        ):
+            response = readiness_view(request)
+
+        assert response.status_code == 503
+        data = json.loads(response.content)
+        assert data["txid"] == 1
+        assert data["replication_lag"]["txids"] == 4999
+
+
+class FakeTimeProvider:
+    """Fake TimeProvider with a settable time."""
+
+    def __init__(self) -> None:
+        """Initialize the clock at 100 seconds."""
+        self.now = 100.0
+
+    def get_time_seconds(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestHealthViewsSnapshots:
+    """Test serving precomputed health snapshots."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    @pytest.fixture
+    def clock(self) -> FakeTimeProvider:
+        """Create the evaluator clock."""
+        return FakeTimeProvider()
+
+    @pytest.fixture
+    def evaluator(self, clock: FakeTimeProvider) -> HealthSnapshotEvaluator:
+        """Create an evaluator with fixed payloads, evaluated once."""
+        evaluator = HealthSnapshotEvaluator(
+            {
+                "health": lambda: ({"health_status": "healthy"}, 200),
+                "live": lambda: ({"is_live": True}, 200),
+                "ready": lambda: ({"is_ready": False}, 503),
+            },
+            time_provider=clock,
+        )
+        evaluator.refresh()
+        return evaluator
+
+    def test_views_return_snapshot_with_age(
+        self,
+        request_factory: RequestFactory,
+        evaluator: HealthSnapshotEvaluator,
+        clock: FakeTimeProvider,
+    ) -> None:
+        """Test that views return the cached bytes without evaluating."""
+        clock.now += 3.5
+        liveness_checker = Mock(spec=LivenessChecker)
+
+        with (
+            patch(
+                "litefs_django.views.get_health_snapshot_evaluator",
+                return_value=evaluator,
+            ),
+            patch(
+                "litefs_django.views.get_liveness_checker",
+                return_value=liveness_checker,
+            ),
+        ):
+            health = health_check_view(request_factory.get("/health"))
+            live = liveness_view(request_factory.get("/health/live"))
+            ready = readiness_view(request_factory.get("/health/ready"))
+
+        assert json.loads(health.content) == {"health_status": "healthy"}
+        assert health["Content-Type"] == "application/json"
+        assert health["Age"] == "3"
+        assert live.status_code == 200
+        assert ready.status_code == 503
+        liveness_checker.check_liveness.assert_not_called()
+
+    def test_views_evaluate_without_fresh_snapshot(
+        self,
+        request_factory: RequestFactory,
+        evaluator: HealthSnapshotEvaluator,
+        clock: FakeTimeProvider,
+    ) -> None:
+        """Test the synchronous fallback when the snapshot is too old."""
+        clock.now += 60.0
+        mock_checker = Mock(spec=LivenessChecker)
+        mock_checker.check_liveness.return_value = LivenessResult(is_live=True)
+
+        with (
+            patch(
+                "litefs_django.views.get_health_snapshot_evaluator",
+                return_value=evaluator,
+            ),
+            patch(
+                "litefs_django.views.get_liveness_checker", return_value=mock_checker
+            ),
+        ):
+            response = liveness_view(request_factory.get("/health/live"))
+
+        assert response.status_code == 200
+        assert not response.has_header("Age")
+        mock_checker.check_liveness.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestMetricsView:
+    """Test metrics_view Django endpoint."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    def test_metrics_view_renders_exposition(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the exposition is returned in the Prometheus format."""
+        pytest.importorskip("prometheus_client")
+        from litefs.adapters.prometheus_exposition import PrometheusExposition
+        from litefs.adapters.prometheus_metrics import PrometheusMetricsAdapter
+
+        prefix = f"test_{uuid.uuid4().hex[:8]}"
+        PrometheusMetricsAdapter(prefix=prefix).set_node_state(True)
+        services = Mock(metrics_exposition=PrometheusExposition(ttl=0))
+
+        with patch("litefs_django.views.get_services", return_value=services):
+            response = metrics_view(request_factory.get("/metrics"))
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("text/plain")
+        assert f"{prefix}_node_state 1.0" in response.content.decode()
+
+    def test_metrics_view_not_found_when_disabled(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the view is 404 when metrics are disabled."""
+        services = Mock(metrics_exposition=None)
+
+        with patch("litefs_django.views.get_services", return_value=services):
+            response = metrics_view(request_factory.get("/metrics"))
+
+        assert response.status_code == 404
+
+    def test_metrics_view_not_found_without_settings(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the view is 404 when LITEFS settings are missing."""
+        with patch(
+            "litefs_django.views.get_services",
+            side_effect=RuntimeError("LITEFS settings not configured"),
+        ):
+            response = metrics_view(request_factory.get("/metrics"))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestRouteStatsView:
+    """Test route_stats_view Django endpoint."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    def test_route_stats_view_returns_snapshot_locally(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that loopback requests get the statistics."""
+        collector = RouteStatsCollector(clock=lambda: 1000.0)
+        collector.record("GET", "/articles/", 0.002)
+
+        with patch(
+            "litefs_django.views.get_shared_route_stats", return_value=collector
+        ):
+            response = route_stats_view(
+                request_factory.get("/routes", REMOTE_ADDR="::1")
+            )
+
+        assert response.status_code == 200
+        data = json.loads(response.content)
+        assert data["since"] == 1000.0
+        assert data["routes"][0]["route"] == "/articles/"
+
+    def test_route_stats_view_forbidden_for_remote_clients(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that non-loopback requests are rejected."""
+        with patch(
+            "litefs_django.views.get_shared_route_stats",
+            return_value=RouteStatsCollector(),
+        ):
+            response = route_stats_view(
+                request_factory.get("/routes", REMOTE_ADDR="10.0.0.5")
+            )
+
+        assert response.status_code == 403
+
+    def test_route_stats_view_not_found_when_disabled(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the view is 404 when route statistics are disabled."""
+        with patch("litefs_django.views.get_shared_route_stats", return_value=None):
+            response = route_stats_view(request_factory.get("/routes"))
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestClusterStatusView:
+    """Test cluster_status_view Django endpoint."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    @staticmethod
+    def _raft_services() -> Mock:
+        from litefs.adapters.ports import RaftLeaderElectionPort
+        from litefs.domain.split_brain import RaftClusterState, RaftNodeState
+        from litefs.usecases.forwarding_status import ForwardingStatus
+        from litefs.usecases.split_brain_detector import SplitBrainStatus
+
+        election = Mock(spec=RaftLeaderElectionPort)
+        election.get_raft_term = Mock(return_value=4)
+        election.is_quorum_reached.return_value = True
+        election.get_cluster_members.return_value = [
+            "node1:20202",
+            "node2:20202",
+            "node3:20202",
+        ]
+        nodes = [
+            RaftNodeState(node_id="node1", is_leader=True),
+            RaftNodeState(node_id="node2", is_leader=False, latency_seconds=0.0025),
+            RaftNodeState(node_id="node3", is_leader=False, reachable=False),
+        ]
+        split_brain_detector = Mock()
+        split_brain_detector.detect_split_brain.return_value = SplitBrainStatus(
+            is_split_brain=False,
+            leader_nodes=nodes[:1],
+            cluster_state=RaftClusterState(nodes=nodes),
+        )
+        services = Mock(
+            node_id="node1",
+            leader_election=election,
+            split_brain_detector=split_brain_detector,
+            forwarding_status=ForwardingStatus(),
+        )
+        services.settings.leader_election = "raft"
+        services.failover_coordinator.state.value = "primary"
+        return services
+
+    def test_build_cluster_payload_reports_raft_and_peers(self) -> None:
+        """Test that Raft mode reports the term, quorum and peers."""
+        with patch(
+            "litefs_django.views.get_services", return_value=self._raft_services()
+        ):
+            payload = build_cluster_payload()
+
+        assert payload["node_state"] == "primary"
+        assert payload["raft"] == {
+            "term": 4,
+            "quorum": True,
+            "members": ["node1:20202", "node2:20202", "node3:20202"],
+        }
+        assert payload["split_brain"] == {"detected": False, "leaders": ["node1"]}
+        assert payload["peers"] == [
+            {
+                "node_id": "node2",
+                "is_leader": False,
+                "reachable": True,
+                "latency_ms": 2.5,
+                "txid": None,
+            },
+            {
+                "node_id": "node3",
+                "is_leader": False,
+                "reachable": False,
+                "latency_ms": None,
+                "txid": None,
+            },
+        ]
+        assert payload["forwarding"]["forwarded"] == 0
+
+    def test_build_cluster_payload_static_mode(self) -> None:
+        """Test that static mode reports no Raft or split-brain state."""
+        services = self._raft_services()
+        services.leader_election = Mock(spec=[])
+        services.split_brain_detector = None
+
+        with patch("litefs_django.views.get_services", return_value=services):
+            payload = build_cluster_payload()
+
+        assert payload["raft"] is None
+        assert payload["split_brain"] is None
+        assert payload["peers"] == []
+
+    def test_cluster_status_view_local_only(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the view only answers loopback requests."""
+        response = cluster_status_view(
+            request_factory.get("/cluster", REMOTE_ADDR="10.0.0.5")
+        )
+
+        assert response.status_code == 403
+
+    def test_cluster_status_view_error_is_503(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that failures to collect the payload are reported as 503."""
+        with patch(
+            "litefs_django.views.get_services",
+            side_effect=RuntimeError("LITEFS settings not configured"),
+        ):
+            response = cluster_status_view(request_factory.get("/cluster"))
+
+        assert response.status_code == 503
+        assert "not configured" in json.loads(response.content)["error"]
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestSlowQueriesView:
+    """Test slow_queries_view Django endpoint."""
+
+    @pytest.fixture
+    def request_factory(self) -> RequestFactory:
+        """Create Django request factory."""
+        return RequestFactory()
+
+    def test_slow_queries_view_returns_logs_by_alias(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that loopback requests get the log of each alias."""
+        log = SlowQueryLog(threshold=0.1, clock=lambda: 1000.0)
+        log.record("SELECT * FROM articles", 0.5, ["SCAN articles"])
+
+        with patch(
+            "litefs_django.views.get_slow_query_logs", return_value={"default": log}
+        ):
+            response = slow_queries_view(
+                request_factory.get("/slow-queries", REMOTE_ADDR="127.0.0.1")
+            )
+
+        assert response.status_code == 200
+        data = json.loads(response.content)["aliases"]["default"]
+        assert data["threshold_ms"] == 100.0
+        assert data["counts"][0]["count"] == 1
+        assert data["entries"][0]["full_scan"] is True
+
+    def test_slow_queries_view_forbidden_for_remote_clients(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that non-loopback requests are rejected."""
+        with patch(
+            "litefs_django.views.get_slow_query_logs",
+            return_value={"default": SlowQueryLog(threshold=0.1)},
+        ):
+            response = slow_queries_view(
+                request_factory.get("/slow-queries", REMOTE_ADDR="10.0.0.5")
+            )
+
+        assert response.status_code == 403
+
+    def test_slow_queries_view_not_found_when_disabled(
+        self, request_factory: RequestFactory
+    ) -> None:
+        """Test that the view is 404 when no alias has a slow-query log."""
+        with patch("litefs_django.views.get_slow_query_logs", return_value={}):
+            response = slow_queries_view(
+                request_factory.get("/slow-queries", REMOTE_ADDR="127.0.0.1")
+            )
+
+        assert response.status_code == 404
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestPositionView:
+    """Test position_view as queried by the split-brain detector adapter."""
+
+    @staticmethod
+    def _services(is_leader: bool, txid: int | None) -> Mock:
+        from litefs.domain.replication import ReplicationPosition
+        from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+
+        reader = Mock()
+        reader.read_position.return_value = (
+            None if txid is None else ReplicationPosition(txid=txid, checksum="0")
+        )
+        services = Mock()
+        services.leader_election.is_leader_elected.return_value = is_leader
+        services.replication_lag_checker = ReplicationLagChecker(reader, Mock())
+        return services
+
+    def test_reports_leadership_and_txid(self) -> None:
+        """Test the payload of a leader with a replication position."""
+        with patch(
+            "litefs_django.views.get_services",
+            return_value=self._services(is_leader=True, txid=42),
+        ):
+            response = position_view(RequestFactory().get("/health/position"))
+
+        assert response.status_code == 200
+        assert json.loads(response.content) == {"is_leader": True, "txid": 42}
+
+    def test_litefs_not_running_is_503(self) -> None:
+        """Test that an unreadable position is reported as 503."""
+        from litefs.usecases.primary_detector import LiteFSNotRunningError
+
+        services = self._services(is_leader=False, txid=None)
+        services.leader_election.is_leader_elected.side_effect = (
+            LiteFSNotRunningError("mount missing")
+        )
+        with patch("litefs_django.views.get_services", return_value=services):
+            response = position_view(RequestFactory().get("/health/position"))
+
+        assert response.status_code == 503
+
+    def test_adapter_reads_leader_txid_from_view(self) -> None:
+        """Test that a replica computes its lag from the leader's view."""
+        import httpx
+        from django.core.handlers.wsgi import WSGIHandler
+        from django.test import override_settings
+        from litefs.adapters.ports import RaftLeaderElectionPort
+        from litefs.adapters.split_brain_detector_adapter import (
+            SplitBrainDetectorAdapter,
+        )
+
+        election = Mock(spec=RaftLeaderElectionPort)
+        election.get_cluster_members.return_value = ["node1:20202", "node2:20202"]
+        election.is_leader_elected.return_value = False
+        client = httpx.Client(transport=httpx.WSGITransport(app=WSGIHandler()))
+        adapter = SplitBrainDetectorAdapter(election, "node1", client=client)
+
+        with (
+            override_settings(
+                ROOT_URLCONF="litefs_django.urls", ALLOWED_HOSTS=["node2"]
+            ),
+            patch(
+                "litefs_django.views.get_services",
+                return_value=self._services(is_leader=True, txid=42),
+            ),
+        ):
+            state = adapter.get_cluster_state()
+
+        assert [node.node_id for node in state.get_leader_nodes()] == ["node2"]
+        assert state.get_leader_txid() == 42
+
+
+@pytest.mark.unit
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+class TestAdminURLConf:
+    """Test that the local admin endpoints are opt-in."""
+
+    @pytest.mark.parametrize("path", ["/routes", "/cluster", "/slow-queries"])
+    def test_admin_endpoints_not_in_default_urls(self, path: str) -> None:
+        """Test that including litefs_django.urls exposes no admin view."""
+        from django.urls import Resolver404, resolve
+
+        with pytest.raises(Resolver404):
+            resolve(path, urlconf="litefs_django.urls")
+
+    @pytest.mark.parametrize(
+        ("path", "view"),
+        [
+            ("/routes", route_stats_view),
+            ("/cluster", cluster_status_view),
+            ("/slow-queries", slow_queries_view),
+        ],
+    )
+    def test_admin_endpoints_in_admin_urls(self, path: str, view) -> None:
+        """Test that litefs_django.admin_urls serves the admin views."""
+        from django.urls import resolve
+
+        assert resolve(path, urlconf="litefs_django.admin_urls").func is view
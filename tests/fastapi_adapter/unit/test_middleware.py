@@ -315,6 +315,126 @@ def test_write_forwarding_forwards_writes_on_replica(
     assert fake_forwarding.last_path == "/write"
 
 
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.WriteForwardingMiddleware")
+def test_write_forwarding_observes_round_trip_time(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that each forwarding attempt is observed with its outcome."""
+    from litefs.adapters.fakes.fake_metrics import FakeMetricsAdapter
+    from litefs.adapters.ports import ForwardingResult
+    from litefs.domain.metrics import FORWARD_ATTEMPT_DURATION
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    class FakeForwardingPort:
+        def __init__(self):
+            self.responses: list[ForwardingResult | Exception] = [
+                ForwardingResult(status_code=201, headers={}, body=b"{}"),
+                ForwardingResult(status_code=503, headers={}, body=b""),
+                ConnectionError("Connection refused"),
+            ]
+
+        def forward_request(self, *args, **kwargs) -> ForwardingResult:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    metrics = FakeMetricsAdapter()
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=FakeForwardingPort(),
+        primary_url="http://primary:8000",
+        metrics=metrics,
+    )
+    client = TestClient(simple_app)
+
+    for _ in range(3):
+        client.post("/write")
+
+    for outcome in ("success", "gateway_error", "connection_error"):
+        assert (
+            len(metrics.histogram_values(FORWARD_ATTEMPT_DURATION, outcome=outcome))
+            == 1
+        )
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.WriteForwardingMiddleware")
+def test_write_forwarding_reports_spans_in_incoming_trace(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that forwarding spans join the caller's trace."""
+    from litefs.adapters.fakes.fake_tracer import InMemoryTracer
+    from litefs.adapters.ports import ForwardingResult
+    from litefs.domain.tracing import TraceContext
+    from litefs.usecases.tracing import current_trace_context
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    seen: list[TraceContext | None] = []
+
+    class FakeForwardingPort:
+        def forward_request(self, *args, **kwargs) -> ForwardingResult:
+            seen.append(current_trace_context())
+            return ForwardingResult(status_code=201, headers={}, body=b"{}")
+
+    tracer = InMemoryTracer()
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=FakeForwardingPort(),
+        primary_url="http://primary:8000",
+        tracer=tracer,
+    )
+    client = TestClient(simple_app)
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    client.post("/write", headers={"traceparent": traceparent})
+
+    root, attempt = tracer.spans
+    assert root.parent == TraceContext.from_traceparent(traceparent)
+    assert root.attributes["litefs.decision"] == "forward"
+    assert attempt.is_child_of(root)
+    assert attempt.attributes["http.response.status_code"] == 201
+    assert seen == [attempt.context]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.WriteForwardingMiddleware")
+def test_write_forwarding_reports_local_decisions(
+    simple_app: FastAPI,
+    fake_primary_detector: FakePrimaryDetector,
+) -> None:
+    """Test that requests handled locally report their routing decision."""
+    from litefs.adapters.fakes.fake_tracer import InMemoryTracer
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    class FakeForwardingPort:
+        def forward_request(self, *args, **kwargs):
+            raise AssertionError("should not forward")
+
+    tracer = InMemoryTracer()
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_primary_detector,
+        forwarding_port=FakeForwardingPort(),
+        primary_url="http://primary:8000",
+        tracer=tracer,
+    )
+    client = TestClient(simple_app)
+
+    client.get("/read")
+    client.post("/write")
+
+    assert [span.attributes["litefs.decision"] for span in tracer.spans] == [
+        "local_read",
+        "primary",
+    ]
+
+
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter")
 def test_write_forwarding_adds_headers(
@@ -402,3 +522,414 @@ def test_write_forwarding_disabled_when_no_forwarding_port(
     response = client.post("/write")
     assert response.status_code == 200
     assert response.json() == {"action": "write"}
+
+
+# =============================================================================
+# Read-Your-Writes Tests
+# =============================================================================
+
+
+class FakeTxidWaiter:
+    """Fake TxidWaiter with a fixed local TXID."""
+
+    def __init__(self, local_txid: int | None) -> None:
+        self.local_txid = local_txid
+        self.waits: list[tuple[int, float]] = []
+
+    def current_txid(self) -> int | None:
+        return self.local_txid
+
+    async def current_txid_async(self) -> int | None:
+        return self.local_txid
+
+    async def wait_for_txid_async(self, txid: int, timeout: float) -> bool:
+        self.waits.append((txid, timeout))
+        return self.local_txid is not None and self.local_txid >= txid
+
+
+class RecordingForwardingPort:
+    """Forwarding port that records calls and returns a TXID token."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def forward_request(
+        self,
+        primary_url: str,
+        method: str,
+        path: str,
+        headers: dict,
+        body: bytes | None = None,
+        query_string: str = "",
+    ):
+        from litefs.adapters.ports import ForwardingResult
+
+        self.calls.append((method, path))
+        return ForwardingResult(
+            status_code=200,
+            headers={"Content-Type": "application/json", "x-litefs-txid": "000000000000002a"},
+            body=b'{"forwarded": true}',
+        )
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_primary_write_returns_token(
+    simple_app: FastAPI,
+    fake_primary_detector: FakePrimaryDetector,
+) -> None:
+    """Test that writes on the primary return the post-commit TXID token."""
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_primary_detector,
+        forwarding_port=RecordingForwardingPort(),
+        primary_url="http://primary:8000",
+        txid_waiter=FakeTxidWaiter(local_txid=42),
+    )
+    client = TestClient(simple_app)
+
+    response = client.post("/write")
+    assert response.headers["X-LiteFS-TXID"] == "000000000000002a"
+    assert response.cookies["__litefs_txid"] == "000000000000002a"
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_token_read_off_event_loop(
+    simple_app: FastAPI,
+    fake_primary_detector: FakePrimaryDetector,
+) -> None:
+    """Test that the post-commit TXID is read outside the event loop."""
+    import asyncio
+
+    from litefs.domain.replication import ReplicationPosition
+    from litefs.usecases.txid_waiter import TxidWaiter
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    reads_on_loop: list[bool] = []
+
+    class LoopCheckingReader:
+        def read_position(self) -> ReplicationPosition:
+            try:
+                asyncio.get_running_loop()
+                reads_on_loop.append(True)
+            except RuntimeError:
+                reads_on_loop.append(False)
+            return ReplicationPosition(txid=42, checksum="0")
+
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_primary_detector,
+        forwarding_port=RecordingForwardingPort(),
+        primary_url="http://primary:8000",
+        txid_waiter=TxidWaiter(LoopCheckingReader()),
+    )
+
+    response = TestClient(simple_app).post("/write")
+
+    assert response.headers["X-LiteFS-TXID"] == "000000000000002a"
+    assert reads_on_loop == [False]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_forwarded_write_sets_cookie(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that replicas pass the primary's TXID token to the client."""
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=RecordingForwardingPort(),
+        primary_url="http://primary:8000",
+        txid_waiter=FakeTxidWaiter(local_txid=40),
+    )
+    client = TestClient(simple_app)
+
+    response = client.post("/write")
+    assert response.cookies["__litefs_txid"] == "000000000000002a"
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_replica_serves_read_once_caught_up(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that reads with a satisfied token are handled locally."""
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    waiter = FakeTxidWaiter(local_txid=42)
+    forwarding = RecordingForwardingPort()
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=forwarding,
+        primary_url="http://primary:8000",
+        txid_waiter=waiter,
+        read_your_writes_timeout=0.5,
+    )
+    client = TestClient(simple_app)
+
+    response = client.get("/read", headers={"X-LiteFS-TXID": "000000000000002a"})
+    assert response.json() == {"action": "read"}
+    assert waiter.waits == [(42, 0.5)]
+    assert forwarding.calls == []
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_replica_forwards_read_after_deadline(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that reads are forwarded when the replica stays behind."""
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    forwarding = RecordingForwardingPort()
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=forwarding,
+        primary_url="http://primary:8000",
+        txid_waiter=FakeTxidWaiter(local_txid=10),
+    )
+    client = TestClient(simple_app)
+    client.cookies.set("__litefs_txid", "000000000000002a")
+
+    response = client.get("/read")
+    assert response.json() == {"forwarded": True}
+    assert forwarding.calls == [("GET", "/read")]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_read_your_writes_ignores_invalid_token(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+) -> None:
+    """Test that malformed tokens are ignored."""
+    from litefs_fastapi.middleware import WriteForwardingMiddleware
+
+    waiter = FakeTxidWaiter(local_txid=None)
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=RecordingForwardingPort(),
+        primary_url="http://primary:8000",
+        txid_waiter=waiter,
+    )
+    client = TestClient(simple_app)
+
+    response = client.get("/read", headers={"X-LiteFS-TXID": "not-a-txid"})
+    assert response.json() == {"action": "read"}
+    assert waiter.waits == []
+
+
+# =============================================================================
+# ResponseCacheMiddleware Tests
+# =============================================================================
+
+
+class FakePositionReader:
+    """Position reader with a settable TXID."""
+
+    def __init__(self, txid: int | None = 1) -> None:
+        self.txid = txid
+
+    def read_position(self):
+        from litefs.domain.replication import ReplicationPosition
+
+        if self.txid is None:
+            return None
+        return ReplicationPosition(txid=self.txid, checksum="abcd")
+
+
+def create_cached_app(reader: FakePositionReader) -> tuple[FastAPI, dict[str, int]]:
+    """Create an app with one opted-in and one plain endpoint."""
+    from litefs.domain.settings import ResponseCacheSettings
+    from litefs_fastapi import ResponseCacheMiddleware, cache_by_txid
+
+    app = FastAPI()
+    calls = {"cached": 0, "plain": 0}
+
+    @app.get("/cached/{item_id}")
+    @cache_by_txid
+    def cached_endpoint(item_id: int) -> dict:
+        calls["cached"] += 1
+        return {"item": item_id}
+
+    @app.get("/plain")
+    def plain_endpoint() -> dict:
+        calls["plain"] += 1
+        return {"plain": True}
+
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        position_reader=reader,
+        settings=ResponseCacheSettings(enabled=True),
+    )
+    return app, calls
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_response_cache_serves_repeat_requests_from_cache() -> None:
+    """Test that an opted-in endpoint runs once per TXID."""
+    app, calls = create_cached_app(FakePositionReader(txid=1))
+    client = TestClient(app)
+
+    first = client.get("/cached/7")
+    second = client.get("/cached/7")
+
+    assert calls["cached"] == 1
+    assert first.headers["X-LiteFS-Cache"] == "MISS"
+    assert second.headers["X-LiteFS-Cache"] == "HIT"
+    assert second.json() == {"item": 7}
+    assert first.headers["ETag"] == second.headers["ETag"]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_response_cache_invalidated_by_txid_advance() -> None:
+    """Test that a new TXID runs the endpoint again."""
+    reader = FakePositionReader(txid=1)
+    app, calls = create_cached_app(reader)
+    client = TestClient(app)
+
+    first = client.get("/cached/7")
+    reader.txid = 2
+    second = client.get("/cached/7")
+
+    assert calls["cached"] == 2
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_response_cache_if_none_match_returns_304() -> None:
+    """Test conditional requests answered without running the endpoint."""
+    app, calls = create_cached_app(FakePositionReader(txid=1))
+    client = TestClient(app)
+    etag = client.get("/cached/7").headers["ETag"]
+
+    response = client.get("/cached/7", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert calls["cached"] == 1
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_response_cache_ignores_endpoints_without_decorator() -> None:
+    """Test that caching is per-route opt-in."""
+    app, calls = create_cached_app(FakePositionReader(txid=1))
+    client = TestClient(app)
+
+    response = client.get("/plain")
+    client.get("/plain")
+
+    assert calls["plain"] == 2
+    assert "ETag" not in response.headers
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_response_cache_disabled_without_position_reader(simple_app: FastAPI) -> None:
+    """Test that the middleware passes requests through when disabled."""
+    from litefs_fastapi.middleware import ResponseCacheMiddleware
+
+    simple_app.add_middleware(ResponseCacheMiddleware, position_reader=None)
+    client = TestClient(simple_app)
+
+    response = client.get("/read")
+    assert response.json() == {"action": "read"}
+    assert "X-LiteFS-Cache" not in response.headers
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.ServerTimingMiddleware")
+def test_server_timing_reports_litefs_spans(
+    simple_app: FastAPI,
+    fake_replica_detector: FakePrimaryDetector,
+    fake_healthy_split_brain_detector: FakeSplitBrainDetector,
+) -> None:
+    """Test that the spans of the LiteFS middleware are reported."""
+    from litefs.adapters.ports import ForwardingResult
+    from litefs_fastapi.middleware import (
+        ServerTimingMiddleware,
+        SplitBrainMiddleware,
+        WriteForwardingMiddleware,
+    )
+
+    class FakeForwardingPort:
+        def forward_request(self, *args, **kwargs) -> ForwardingResult:
+            return ForwardingResult(status_code=201, headers={}, body=b"{}")
+
+    simple_app.add_middleware(
+        WriteForwardingMiddleware,
+        primary_detector=fake_replica_detector,
+        forwarding_port=FakeForwardingPort(),
+        primary_url="http://primary:8000",
+    )
+    simple_app.add_middleware(
+        SplitBrainMiddleware, detector=fake_healthy_split_brain_detector
+    )
+    simple_app.add_middleware(ServerTimingMiddleware)
+    client = TestClient(simple_app)
+
+    response = client.post("/write")
+
+    names = [
+        entry.split(";")[0] for entry in response.headers["server-timing"].split(", ")
+    ]
+    assert names == ["litefs-split-brain", "litefs-primary", "litefs-forward", "total"]
+    assert 'desc="attempt 1 success"' in response.headers["server-timing"]
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.ServerTimingMiddleware")
+def test_server_timing_disabled_passes_through(simple_app: FastAPI) -> None:
+    """Test that a disabled middleware leaves responses untouched."""
+    from litefs.domain.settings import ServerTimingSettings
+    from litefs_fastapi.middleware import ServerTimingMiddleware
+
+    simple_app.add_middleware(
+        ServerTimingMiddleware, settings=ServerTimingSettings(enabled=False)
+    )
+    client = TestClient(simple_app)
+
+    response = client.get("/")
+
+    assert "server-timing" not in response.headers
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter.Http.ServerTimingMiddleware")
+def test_server_timing_logs_structured_line(simple_app: FastAPI, caplog) -> None:
+    """Test that spans are logged with the response status when enabled."""
+    import json
+    import logging
+
+    from litefs.domain.settings import ServerTimingSettings
+    from litefs_fastapi.middleware import ServerTimingMiddleware
+
+    simple_app.add_middleware(
+        ServerTimingMiddleware, settings=ServerTimingSettings(enabled=True, log=True)
+    )
+    client = TestClient(simple_app)
+
+    with caplog.at_level(logging.INFO, logger="litefs.usecases.server_timing"):
+        client.get("/read")
+
+    fields = json.loads(caplog.records[-1].getMessage().split(": ", 1)[1])
+    assert fields["method"] == "GET"
+    assert fields["path"] == "/read"
+    assert fields["status"] == 200
+    assert [span["name"] for span in fields["spans"]] == ["total"]
@@ -8,9 +8,14 @@ from litefs.domain.split_brain import RaftClusterState, RaftNodeState
 from litefs.usecases.health_checker import HealthChecker
 from litefs.usecases.liveness_checker import LivenessChecker
 from litefs.usecases.readiness_checker import ReadinessChecker
+from litefs.usecases.replication_lag_checker import ReplicationLagChecker
+from litefs.usecases.replication_position_reader import ReplicationPositionReader
 from litefs.usecases.split_brain_detector import SplitBrainDetector
 from litefs.usecases.failover_coordinator import NodeState
-from litefs_fastapi.routes import create_health_router
+from litefs_fastapi.routes import (
+    create_health_router,
+    create_health_snapshot_evaluator,
+)
 
 from .fakes import (
     FakePrimaryDetector,
@@ -283,6 +288,40 @@ def test_health_endpoint_with_degraded_health(
     assert data["is_split_brain"] is False
 
 
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_health_endpoint_includes_txid_when_lag_tracked(
+    tmp_path,
+    split_brain_detector: SplitBrainDetector,
+    liveness_checker: LivenessChecker,
+    readiness_checker: ReadinessChecker,
+) -> None:
+    """Test that /health reports the TXID when the health checker tracks lag."""
+    (tmp_path / "db.sqlite3-pos").write_text("000000000000002a/f8c4d8c1bbcbd4a2")
+    fake_detector = FakePrimaryDetector(is_primary=True)
+    health_checker = HealthChecker(
+        primary_detector=fake_detector,
+        lag_checker=ReplicationLagChecker(
+            position_reader=ReplicationPositionReader(str(tmp_path), "db.sqlite3"),
+            primary_detector=fake_detector,
+        ),
+    )
+    app = FastAPI()
+    router = create_health_router(
+        health_checker=health_checker,
+        split_brain_detector=split_brain_detector,
+        liveness_checker=liveness_checker,
+        readiness_checker=readiness_checker,
+    )
+    app.include_router(router)
+    client = TestClient(app)
+
+    data = client.get("/health").json()
+
+    assert data["txid"] == 42
+    assert data["replication_lag"] == {"primary_txid": 42, "txids": 0, "seconds": 0.0}
+
+
 @pytest.mark.tier(1)
 @pytest.mark.tra("Adapter")
 def test_health_endpoint_with_unhealthy_status(
@@ -496,3 +535,78 @@ def test_readiness_replica_cannot_accept_writes(
     data = response.json()
     assert data["is_ready"] is True  # Replica can still be ready for reads
     assert data["can_accept_writes"] is False
+
+
+# =============================================================================
+# Health Snapshot Tests
+# =============================================================================
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_snapshots_served_with_age_header(
+    health_checker: HealthChecker,
+    split_brain_detector: SplitBrainDetector,
+    liveness_checker: LivenessChecker,
+    readiness_checker: ReadinessChecker,
+    fake_primary_detector: FakePrimaryDetector,
+) -> None:
+    """Test that endpoints return the precomputed snapshot bytes."""
+    snapshots = create_health_snapshot_evaluator(
+        health_checker, split_brain_detector, liveness_checker, readiness_checker
+    )
+    snapshots.refresh()
+    app = FastAPI()
+    app.include_router(
+        create_health_router(
+            health_checker,
+            split_brain_detector,
+            liveness_checker,
+            readiness_checker,
+            snapshots=snapshots,
+        )
+    )
+    client = TestClient(app)
+
+    # Changes after the snapshot are not visible until the next evaluation
+    fake_primary_detector.set_litefs_not_running()
+    live = client.get("/health/live")
+    health = client.get("/health")
+
+    assert live.status_code == 200
+    assert live.json() == {"is_live": True}
+    assert live.headers["age"] == "0"
+    assert live.headers["content-type"] == "application/json"
+    assert health.json()["leader_nodes"][0]["node_id"] == "node-1"
+
+    snapshots.refresh()
+    assert client.get("/health/live").status_code == 503
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_endpoints_evaluate_until_first_snapshot(
+    health_checker: HealthChecker,
+    split_brain_detector: SplitBrainDetector,
+    liveness_checker: LivenessChecker,
+    readiness_checker: ReadinessChecker,
+) -> None:
+    """Test the synchronous fallback before the evaluator has run."""
+    snapshots = create_health_snapshot_evaluator(
+        health_checker, split_brain_detector, liveness_checker, readiness_checker
+    )
+    app = FastAPI()
+    app.include_router(
+        create_health_router(
+            health_checker,
+            split_brain_detector,
+            liveness_checker,
+            readiness_checker,
+            snapshots=snapshots,
+        )
+    )
+
+    response = TestClient(app).get("/health/ready")
+
+    assert response.status_code == 200
+    assert "age" not in response.headers
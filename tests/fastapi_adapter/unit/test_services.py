@@ -0,0 +1,244 @@
+"""Tests for the lifespan-managed LiteFS service container."""
+
+import asyncio
+import time
+import uuid
+from pathlib import Path
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from litefs.domain.settings import (
+    HealthSnapshotSettings,
+    LiteFSSettings,
+    StaticLeaderConfig,
+)
+from litefs.services import LiteFSServices
+from litefs_fastapi.routes import create_metrics_router, create_services_health_router
+from litefs_fastapi.services import (
+    create_lifespan,
+    get_health_snapshots,
+    get_services,
+)
+
+
+class FixedNodeIDResolver:
+    """Node ID resolver returning a fixed ID."""
+
+    def resolve_node_id(self) -> str:
+        """Return the node ID."""
+        return "node1"
+
+
+@pytest.fixture
+def mount_path(tmp_path: Path) -> Path:
+    """LiteFS mount on which this node is the primary."""
+    (tmp_path / ".primary").write_text("")
+    return tmp_path
+
+
+@pytest.fixture
+def settings(mount_path: Path) -> LiteFSSettings:
+    """Static leader settings for the temporary mount."""
+    return LiteFSSettings(
+        mount_path=str(mount_path),
+        data_path="/data",
+        database_name="app.db",
+        leader_election="static",
+        proxy_addr="localhost:8080",
+        enabled=True,
+        retention="24h",
+        static_leader_config=StaticLeaderConfig(primary_hostname="node1"),
+    )
+
+
+@pytest.fixture
+def app(settings: LiteFSSettings) -> FastAPI:
+    """App with the LiteFS lifespan and the services health router."""
+    app = FastAPI(
+        lifespan=create_lifespan(settings, node_id_resolver=FixedNodeIDResolver())
+    )
+    app.include_router(create_services_health_router())
+
+    @app.get("/services-id")
+    def services_id(services: Annotated[LiteFSServices, Depends(get_services)]) -> dict:
+        return {"id": id(services), "checker": id(services.readiness_checker)}
+
+    return app
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_lifespan_shares_container_across_requests(app: FastAPI) -> None:
+    """Test that requests see the same container and members."""
+    with TestClient(app) as client:
+        first = client.get("/services-id").json()
+        second = client.get("/services-id").json()
+
+    assert first == second
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_lifespan_closes_container_on_shutdown(app: FastAPI) -> None:
+    """Test that the container is removed and closed at shutdown."""
+    with TestClient(app) as client:
+        client.get("/services-id")
+        services = app.state.litefs_services
+
+    assert not hasattr(app.state, "litefs_services")
+    with pytest.raises(RuntimeError):
+        _ = services.health_checker
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_services_health_router_uses_container(app: FastAPI) -> None:
+    """Test the health endpoints backed by the container."""
+    with TestClient(app) as client:
+        health = client.get("/health")
+        live = client.get("/health/live")
+        ready = client.get("/health/ready")
+
+    assert health.status_code == 200
+    assert health.json()["health_state"] == "healthy"
+    assert health.json()["is_split_brain"] is False
+    assert live.status_code == 200
+    assert ready.json()["can_accept_writes"] is True
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_get_services_without_lifespan_fails() -> None:
+    """Test that the dependency requires the LiteFS lifespan."""
+    app = FastAPI()
+
+    @app.get("/services")
+    def services(services: Annotated[LiteFSServices, Depends(get_services)]) -> dict:
+        return {}
+
+    with pytest.raises(RuntimeError):
+        TestClient(app).get("/services")
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_position_endpoint_reports_leadership_and_txid(
+    app: FastAPI, mount_path: Path
+) -> None:
+    """Test /health/position, queried by Raft peers for the leader's TXID."""
+    (mount_path / "app.db-pos").write_text("000000000000002a/00000000000000ff")
+
+    with TestClient(app) as client:
+        response = client.get("/health/position")
+
+    assert response.status_code == 200
+    assert response.json() == {"is_leader": True, "txid": 42}
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_lifespan_runs_health_snapshots_when_enabled(
+    settings: LiteFSSettings,
+) -> None:
+    """Test that the lifespan starts and stops the snapshot evaluator."""
+    settings.health_snapshot = HealthSnapshotSettings(enabled=True, interval=0.05)
+    app = FastAPI(
+        lifespan=create_lifespan(settings, node_id_resolver=FixedNodeIDResolver())
+    )
+    app.include_router(create_services_health_router())
+
+    @app.get("/snapshots")
+    def snapshots_running(request: Request) -> dict:
+        snapshots = get_health_snapshots(request)
+        return {"running": snapshots is not None and snapshots.is_running}
+
+    with TestClient(app) as client:
+        assert client.get("/snapshots").json() == {"running": True}
+        snapshots = app.state.litefs_health_snapshots
+        deadline = time.monotonic() + 2.0
+        while snapshots.get("live") is None and time.monotonic() < deadline:
+            time.sleep(0.01)
+        response = client.get("/health/live")
+
+    assert response.status_code == 200
+    assert "age" in response.headers
+    assert not snapshots.is_running
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_metrics_router_renders_container_metrics(settings: LiteFSSettings) -> None:
+    """Test that /metrics renders the metrics of the container's adapter."""
+    pytest.importorskip("prometheus_client")
+    settings.metrics_enabled = True
+    settings.metrics_prefix = f"test_{uuid.uuid4().hex[:8]}"
+    app = FastAPI(
+        lifespan=create_lifespan(settings, node_id_resolver=FixedNodeIDResolver())
+    )
+    app.include_router(create_metrics_router())
+
+    with TestClient(app) as client:
+        app.state.litefs_services.metrics.set_node_state(True)
+        response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert f"{settings.metrics_prefix}_node_state 1.0" in response.text
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_metrics_router_not_found_when_disabled(app: FastAPI) -> None:
+    """Test that /metrics is 404 unless metrics are enabled."""
+    app.include_router(create_metrics_router())
+
+    with TestClient(app) as client:
+        response = client.get("/metrics")
+
+    assert response.status_code == 404
+
+
+class RecordingElection:
+    """Leader election recording the loop it was created on and its shutdown."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.destroyed = False
+
+    def is_leader_elected(self) -> bool:
+        """Return whether this node leads."""
+        return False
+
+    def destroy(self) -> None:
+        """Record the shutdown."""
+        self.destroyed = True
+
+
+@pytest.mark.tier(1)
+@pytest.mark.tra("Adapter")
+def test_lifespan_starts_raft_on_event_loop(settings: LiteFSSettings) -> None:
+    """Test that a Raft node on the event loop starts with the application."""
+    settings.leader_election = "raft"
+    settings.raft_self_addr = "node1:20202"
+    settings.raft_peers = ["node2:20202", "node3:20202"]
+    settings.raft_event_loop = True
+    elections: list[RecordingElection] = []
+
+    def factory(settings: LiteFSSettings, node_id: str) -> RecordingElection:
+        elections.append(RecordingElection())
+        return elections[-1]
+
+    app = FastAPI(
+        lifespan=create_lifespan(
+            settings,
+            node_id_resolver=FixedNodeIDResolver(),
+            leader_election_factory=factory,
+        )
+    )
+
+    with TestClient(app):
+        assert len(elections) == 1
+
+    assert elections[0].destroyed
@@ -3,7 +3,14 @@
 import pytest
 from hypothesis import given, strategies as st
 
-from litefs.domain.settings import LiteFSSettings, StaticLeaderConfig
+from litefs.domain.settings import (
+    ChangeBusSettings,
+    HealthSnapshotSettings,
+    LiteFSSettings,
+    ResponseCacheSettings,
+    ServerTimingSettings,
+    StaticLeaderConfig,
+)
 from litefs.domain.exceptions import LiteFSConfigError
 from litefs_fastapi.settings import get_litefs_settings
 
@@ -53,6 +60,117 @@ class TestFastAPISettingsReader:
         assert settings.raft_self_addr == "localhost:4321"
         assert settings.raft_peers == ["node1:4321", "node2:4321"]
 
+    def test_raft_event_loop_mapping(self):
+        """Test that the Raft node can be run on the event loop."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "raft",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "raft_self_addr": "node1:4321",
+            "raft_peers": ["node2:4321", "node3:4321"],
+        }
+        assert get_litefs_settings(pydantic_settings).raft_event_loop is False
+
+        pydantic_settings["raft_event_loop"] = True
+        assert get_litefs_settings(pydantic_settings).raft_event_loop is True
+
+    def test_response_cache_mapping(self):
+        """Test that the response_cache dict maps to ResponseCacheSettings."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "static",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "primary_hostname": "node1",
+            "response_cache": {"enabled": True, "vary_headers": ["Accept-Language"]},
+        }
+        settings = get_litefs_settings(pydantic_settings)
+        assert settings.response_cache == ResponseCacheSettings(
+            enabled=True, vary_headers=("Accept-Language",)
+        )
+
+    def test_change_bus_mapping(self):
+        """Test that the change_bus dict maps to ChangeBusSettings."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "static",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "primary_hostname": "node1",
+            "change_bus": {"enabled": True, "poll_interval": 2.0},
+        }
+        settings = get_litefs_settings(pydantic_settings)
+        assert settings.change_bus == ChangeBusSettings(enabled=True, poll_interval=2.0)
+
+    def test_health_snapshot_mapping(self):
+        """Test that the health_snapshot dict maps to HealthSnapshotSettings."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "static",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "primary_hostname": "node1",
+            "health_snapshot": {"enabled": True, "interval": 0.5},
+        }
+        settings = get_litefs_settings(pydantic_settings)
+        assert settings.health_snapshot == HealthSnapshotSettings(
+            enabled=True, interval=0.5
+        )
+
+    def test_server_timing_mapping(self):
+        """Test that the server_timing dict maps to ServerTimingSettings."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "static",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "primary_hostname": "node1",
+            "server_timing": {"enabled": True, "log": True},
+        }
+        settings = get_litefs_settings(pydantic_settings)
+        assert settings.server_timing == ServerTimingSettings(enabled=True, log=True)
+
+    def test_metrics_mapping(self):
+        """Test that the metrics dict maps to the metrics fields."""
+        pydantic_settings = {
+            "mount_path": "/litefs",
+            "data_path": "/var/lib/litefs",
+            "database_name": "db.sqlite3",
+            "leader_election": "static",
+            "proxy_addr": ":8080",
+            "enabled": True,
+            "retention": "1h",
+            "primary_hostname": "node1",
+            "metrics": {
+                "enabled": True,
+                "histogram_buckets": {"statement_duration_seconds": [0.001, 0.01]},
+                "exposition_ttl": 0.5,
+            },
+        }
+        settings = get_litefs_settings(pydantic_settings)
+        assert settings.metrics_enabled is True
+        assert settings.metrics_prefix == "litefs"
+        assert settings.metrics_histogram_buckets == {
+            "statement_duration_seconds": (0.001, 0.01)
+        }
+        assert settings.metrics_exposition_ttl == 0.5
+
     def test_optional_fields_with_none(self):
         """Test that optional fields can be None."""
         pydantic_settings = {
@@ -0,0 +1,90 @@
+"""Helpers running real PySyncObj clusters on loopback addresses."""
+
+from __future__ import annotations
+
+import socket
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from py_leader.election import RaftLeaderElection
+
+ELECTION_TIMEOUT = 1.0
+HEARTBEAT_INTERVAL = 0.1
+
+# One loopback address per node: node IDs are the host part of the address
+HOSTS = ["127.0.0.1", "127.0.0.2", "127.0.0.3"]
+OBSERVER_HOSTS = ["127.0.0.4", "127.0.0.5"]
+
+
+def _reserve_addresses(hosts: list[str] = HOSTS) -> list[str]:
+    """Return a free "host:port" address on each loopback host."""
+    addresses = []
+    for host in hosts:
+        with socket.socket() as sock:
+            try:
+                sock.bind((host, 0))
+            except OSError:
+                pytest.skip(f"loopback address {host} is not available")
+            addresses.append(f"{host}:{sock.getsockname()[1]}")
+    return addresses
+
+
+def wait_for_leader(
+    nodes: list[RaftLeaderElection], timeout: float = 10.0
+) -> RaftLeaderElection:
+    """Wait until one of the nodes is leader and return it."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for node in nodes:
+            if node.is_leader_elected():
+                return node
+        time.sleep(0.001)
+    pytest.fail(f"no leader elected within {timeout}s")
+
+
+def forwarding_url(host: str) -> str:
+    """Forwarding URL a node of start_cluster(replicate_metadata=True) publishes."""
+    return f"http://{host}:8000"
+
+
+@contextmanager
+def start_cluster(
+    replicate_metadata: bool = False,
+    observers: int = 0,
+    dynamic_membership: bool = False,
+    priorities: list[int] | None = None,
+    rebalance_after: float = 30.0,
+    adaptive_timeouts: bool = False,
+) -> Iterator[list[RaftLeaderElection]]:
+    """Start a 3-node cluster; yields its running nodes.
+
+    Nodes removed from the yielded list are not destroyed again on exit.
+    With replicate_metadata, each node publishes forwarding_url(host).
+    The given number of observers follow the voters at the end of the list.
+    Priorities are given per voter, in HOSTS order.
+    """
+    addresses = _reserve_addresses()
+    observer_addresses = _reserve_addresses(OBSERVER_HOSTS[:observers])
+    running = [
+        RaftLeaderElection(
+            node_id=host,
+            cluster_members=addresses,
+            election_timeout=ELECTION_TIMEOUT,
+            heartbeat_interval=HEARTBEAT_INTERVAL,
+            replicate_metadata=replicate_metadata,
+            forwarding_url=forwarding_url(host) if replicate_metadata else None,
+            observers=observer_addresses,
+            dynamic_membership=dynamic_membership,
+            priorities=dict(zip(addresses, priorities or [])),
+            rebalance_after=rebalance_after,
+            adaptive_timeouts=adaptive_timeouts,
+        )
+        for host in HOSTS + OBSERVER_HOSTS[:observers]
+    ]
+    try:
+        yield running
+    finally:
+        for node in running:
+            node.destroy()
@@ -0,0 +1,200 @@
+"""Multi-process Raft cluster with injectable network partitions.
+
+Each node runs RaftLeaderElection in its own process, so a partitioned node
+keeps its own clock, threads and term exactly as on a separate host. The
+parent cuts links through a shared matrix: a node drops the messages it
+would send over a cut link, while the TCP connections stay open, as in a
+brief network blip that does not reset connections.
+
+Nodes report every change of their term and leadership to the parent,
+which counts the elections and leader changes a partition causes.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from .conftest import ELECTION_TIMEOUT, HEARTBEAT_INTERVAL, _reserve_addresses
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Seconds between polls of a node's term and leadership
+_POLL_INTERVAL = 0.005
+# Seconds a node process may take to start
+_START_TIMEOUT = 30.0
+
+
+@dataclass(frozen=True)
+class NodeEvent:
+    """Term and leadership of a node after a change.
+
+    Attributes:
+        node: Index of the node in the cluster.
+        at: Monotonic time of the change.
+        term: Raft term of the node.
+        is_leader: Whether the node leads.
+    """
+
+    node: int
+    at: float
+    term: int
+    is_leader: bool
+
+
+def _run_node(
+    index: int,
+    addresses: list[str],
+    options: dict[str, Any],
+    cut: Any,
+    events: Any,
+    stop: Any,
+) -> None:
+    """Run node index until stop is set, reporting changes to events."""
+    from py_leader import _raft_node
+    from py_leader.election import RaftLeaderElection
+
+    size = len(addresses)
+    peers = {address: peer for peer, address in enumerate(addresses)}
+    send = _raft_node._ReachabilityTransport.send
+
+    def partitioned_send(transport, node, message) -> bool:
+        peer = peers.get(node.id)
+        if peer is not None and cut[index * size + peer]:
+            return True
+        return send(transport, node, message)
+
+    _raft_node._ReachabilityTransport.send = partitioned_send
+
+    election = RaftLeaderElection(
+        node_id=addresses[index].split(":")[0],
+        cluster_members=addresses,
+        election_timeout=ELECTION_TIMEOUT,
+        heartbeat_interval=HEARTBEAT_INTERVAL,
+        **options,
+    )
+    try:
+        state = None
+        while not stop.is_set():
+            current = (election.get_raft_term(), election.is_leader_elected())
+            if current != state:
+                state = current
+                events.put(NodeEvent(index, time.monotonic(), *current))
+            time.sleep(_POLL_INTERVAL)
+    finally:
+        election.destroy()
+
+
+class PartitionedCluster:
+    """A 3-node cluster of processes whose links can be cut and restored."""
+
+    def __init__(self, **options: Any) -> None:
+        """Start the nodes.
+
+        Args:
+            **options: Keyword arguments for every RaftLeaderElection.
+        """
+        self._addresses = _reserve_addresses()
+        self.size = len(self._addresses)
+        context = multiprocessing.get_context("spawn")
+        self._cut = context.Array("b", self.size * self.size)
+        self._events = context.Queue()
+        self._stop = context.Event()
+        self.history: list[NodeEvent] = []
+        self._state: dict[int, NodeEvent] = {}
+        self._processes = [
+            context.Process(
+                target=_run_node,
+                args=(
+                    index,
+                    self._addresses,
+                    options,
+                    self._cut,
+                    self._events,
+                    self._stop,
+                ),
+                daemon=True,
+            )
+            for index in range(self.size)
+        ]
+        for process in self._processes:
+            process.start()
+
+    def stop(self) -> None:
+        """Stop the nodes."""
+        self._stop.set()
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.kill()
+
+    def isolate(self, node: int) -> None:
+        """Cut every link to and from node."""
+        for peer in range(self.size):
+            if peer != node:
+                self._cut[node * self.size + peer] = 1
+                self._cut[peer * self.size + node] = 1
+
+    def heal(self) -> None:
+        """Restore every link."""
+        for link in range(self.size * self.size):
+            self._cut[link] = 0
+
+    def collect(self, seconds: float) -> None:
+        """Record the events reported over the next seconds."""
+        deadline = time.monotonic() + seconds
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                event = self._events.get(timeout=remaining)
+            except queue.Empty:
+                return
+            self.history.append(event)
+            self._state[event.node] = event
+
+    def leaders(self) -> list[int]:
+        """Nodes that last reported leading."""
+        return sorted(node for node, event in self._state.items() if event.is_leader)
+
+    def is_leader(self, node: int) -> bool:
+        """Whether node last reported leading."""
+        return node in self.leaders()
+
+    def wait_for_leader(self, timeout: float = _START_TIMEOUT) -> int:
+        """Wait until exactly one node leads and every node shares its term."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            self.collect(_POLL_INTERVAL)
+            terms = {event.term for event in self._state.values()}
+            if len(self._state) == self.size and len(terms) == 1:
+                leaders = self.leaders()
+                if len(leaders) == 1:
+                    return leaders[0]
+        pytest.fail(f"no stable leader within {timeout}s")
+
+    def elections_since(self, since: float) -> int:
+        """Term increments on the highest term reported after since."""
+        terms = [event.term for event in self.history if event.at <= since]
+        baseline = max(terms, default=0)
+        latest = max((event.term for event in self.history), default=0)
+        return latest - baseline
+
+    def leader_changes_since(self, since: float) -> int:
+        """Times a node became leader after since."""
+        return sum(1 for event in self.history if event.at > since and event.is_leader)
+
+
+@contextmanager
+def partitioned_cluster(**options: Any) -> Iterator[PartitionedCluster]:
+    """Start a PartitionedCluster; yields it and stops it on exit."""
+    cluster = PartitionedCluster(**options)
+    try:
+        yield cluster
+    finally:
+        cluster.stop()
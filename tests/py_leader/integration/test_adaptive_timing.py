@@ -0,0 +1,69 @@
+"""Adaptive heartbeat and election timing on a real running cluster."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import (
+    ELECTION_TIMEOUT,
+    HEARTBEAT_INTERVAL,
+    start_cluster,
+    wait_for_leader,
+)
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.AdaptiveTiming"),
+]
+
+# Seconds the cluster is given to adapt. A follower's p99 heartbeat gap only
+# drops once the gaps from before the leader sped up leave the estimator
+# window (256 heartbeats), which takes 15-20 seconds on a loaded machine.
+ADAPT_SECONDS = 60.0
+
+
+def test_timing_follows_loopback_delays() -> None:
+    """Loopback round trips shorten heartbeats and elections without churn."""
+    with start_cluster(adaptive_timeouts=True) as nodes:
+        changes: list[tuple[float, float]] = []
+        for node in nodes:
+            node.add_timing_listener(lambda hb, et: changes.append((hb, et)))
+        leader = wait_for_leader(nodes)
+        epoch = leader.get_leader_epoch()
+        followers = [node for node in nodes if node is not leader]
+
+        deadline = time.monotonic() + ADAPT_SECONDS
+        while time.monotonic() < deadline and not (
+            leader.get_heartbeat_interval() < HEARTBEAT_INTERVAL
+            and all(f.get_election_timeout() < ELECTION_TIMEOUT / 2 for f in followers)
+        ):
+            time.sleep(0.1)
+
+        timing = leader.get_timing()
+        assert timing.adaptive
+        assert timing.heartbeat_interval < HEARTBEAT_INTERVAL
+        assert timing.rtt["p99"] < HEARTBEAT_INTERVAL
+        assert all(f.get_election_timeout() < ELECTION_TIMEOUT / 2 for f in followers)
+        assert all(f.get_timing().heartbeat_gaps for f in followers)
+        assert changes
+        assert leader.is_leader_elected()
+        assert leader.get_leader_epoch() == epoch
+
+
+def test_configured_timing_without_adaptation() -> None:
+    """Delays are measured but the configured timing stays in use."""
+    with start_cluster() as nodes:
+        leader = wait_for_leader(nodes)
+        time.sleep(2.5)
+
+        timing = leader.get_timing()
+        assert not timing.adaptive
+        assert timing.rtt
+        assert (timing.heartbeat_interval, timing.election_timeout) == (
+            HEARTBEAT_INTERVAL,
+            ELECTION_TIMEOUT,
+        )
@@ -0,0 +1,68 @@
+"""Replicated cluster metadata on a real 3-node cluster."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import forwarding_url, start_cluster, wait_for_leader
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.ClusterMetadata"),
+]
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_leader_entry_replicated_to_every_node() -> None:
+    """Every node reads the leader, its epoch and forwarding URL locally."""
+    with start_cluster(replicate_metadata=True) as nodes:
+        leader = wait_for_leader(nodes)
+        expected = {
+            "leader": leader._self_address,
+            "epoch": leader.get_raft_term(),
+            "forwarding_url": forwarding_url(leader._node_id),
+        }
+
+        assert _wait_until(
+            lambda: all(node.get_cluster_metadata() == expected for node in nodes)
+        )
+
+
+def test_new_leader_raises_epoch() -> None:
+    """After failover the successor overwrites the entry with a higher epoch."""
+    with start_cluster(replicate_metadata=True) as nodes:
+        leader = wait_for_leader(nodes)
+        assert _wait_until(lambda: "leader" in nodes[0].get_cluster_metadata())
+        epoch = leader.get_cluster_metadata()["epoch"]
+        leader.update_cluster_metadata({"config_version": 2})
+        assert _wait_until(
+            lambda: all("config_version" in n.get_cluster_metadata() for n in nodes)
+        )
+
+        leader.destroy()
+        nodes.remove(leader)
+        successor = wait_for_leader(nodes)
+
+        def replicated() -> bool:
+            return all(
+                node.get_cluster_metadata().get("leader") == successor._self_address
+                for node in nodes
+            )
+
+        assert _wait_until(replicated)
+        metadata = nodes[0].get_cluster_metadata()
+        assert metadata["epoch"] > epoch
+        assert metadata["config_version"] == 2
@@ -0,0 +1,96 @@
+"""Spurious elections caused by network blips, with and without protection.
+
+Runs 3-node clusters with one process per node and cuts a node off for a
+little longer than the election timeout, then restores its links:
+
+- unprotected (no pre-vote, no check-quorum): the cut-off follower stands
+  for election, and its higher term deposes the healthy leader on return;
+- protected: the follower's pre-votes are refused while the leader is
+  heard from, so neither term nor leader changes.
+
+Run with ``pytest -s`` to see the counts.
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import ELECTION_TIMEOUT
+from .partition_harness import PartitionedCluster, partitioned_cluster
+
+BLIPS = 2
+# A blip outlasts the highest randomized election timeout
+BLIP_SECONDS = 2.5 * ELECTION_TIMEOUT
+SETTLE_SECONDS = 3 * ELECTION_TIMEOUT
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.DisruptiveElections"),
+]
+
+
+def _blip_followers(cluster: PartitionedCluster) -> tuple[int, int]:
+    """Cut off a follower BLIPS times; return the elections and leader changes."""
+    cluster.wait_for_leader()
+    cluster.collect(SETTLE_SECONDS)
+    started = time.monotonic()
+    for _ in range(BLIPS):
+        follower = next(
+            node for node in range(cluster.size) if not cluster.is_leader(node)
+        )
+        cluster.isolate(follower)
+        cluster.collect(BLIP_SECONDS)
+        cluster.heal()
+        cluster.collect(SETTLE_SECONDS)
+        cluster.wait_for_leader()
+    return cluster.elections_since(started), cluster.leader_changes_since(started)
+
+
+def test_pre_vote_prevents_spurious_elections(record_property) -> None:
+    """Follower blips depose the leader only without pre-vote and check-quorum."""
+    counts = {}
+    for mode, enabled in (("unprotected", False), ("protected", True)):
+        with partitioned_cluster(pre_vote=enabled, check_quorum=enabled) as cluster:
+            counts[mode] = _blip_followers(cluster)
+
+    print(f"\nSpurious elections over {BLIPS} follower blips of {BLIP_SECONDS}s:")
+    for mode, (elections, leader_changes) in counts.items():
+        record_property(f"{mode}_elections", elections)
+        record_property(f"{mode}_leader_changes", leader_changes)
+        print(
+            f"  {mode:<12} {elections} term increments, {leader_changes} leader changes"
+        )
+    assert counts["protected"] == (0, 0)
+    assert counts["unprotected"][0] > 0
+
+
+def test_check_quorum_steps_down_partitioned_leader() -> None:
+    """A cut-off leader steps down and the majority elects another."""
+    with partitioned_cluster() as cluster:
+        leader = cluster.wait_for_leader()
+        cluster.collect(SETTLE_SECONDS)
+
+        cluster.isolate(leader)
+        cluster.collect(2 * ELECTION_TIMEOUT)
+        assert not cluster.is_leader(leader)
+
+        cluster.collect(2 * ELECTION_TIMEOUT)
+        assert len(cluster.leaders()) == 1
+        assert leader not in cluster.leaders()
+
+
+def test_partitioned_leader_stays_without_check_quorum() -> None:
+    """Without check-quorum, a cut-off leader keeps leading for 30 seconds."""
+    with partitioned_cluster(check_quorum=False) as cluster:
+        leader = cluster.wait_for_leader()
+        cluster.collect(SETTLE_SECONDS)
+
+        cluster.isolate(leader)
+        cluster.collect(4 * ELECTION_TIMEOUT)
+
+        assert cluster.is_leader(leader)
+        assert len(cluster.leaders()) == 2
@@ -0,0 +1,180 @@
+"""Raft clusters running on a single asyncio event loop.
+
+Runs real 3-node PySyncObj clusters on loopback addresses, either with a
+tick thread per node (RaftLeaderElection) or with every node on the test's
+event loop (AsyncRaftLeaderElection), and compares an idle cluster's CPU
+time and wakeups (ticks):
+
+- threaded: each node's thread waits for socket events for at most 50 ms,
+  then ticks;
+- event loop: nodes tick after socket events and when a heartbeat or
+  election deadline is due.
+
+Run with ``pytest -s`` to see the figures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+from py_leader import AsyncRaftLeaderElection
+from py_leader.election import RaftLeaderElection, RaftLeaderElectionError
+
+from .conftest import (
+    ELECTION_TIMEOUT,
+    HEARTBEAT_INTERVAL,
+    _reserve_addresses,
+    start_cluster,
+    wait_for_leader,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Seconds an idle cluster is measured for
+IDLE_SECONDS = 5.0
+# Seconds a new leader is given to settle before measuring
+SETTLE_SECONDS = 1.0
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.EventLoopDriver"),
+]
+
+
+def _start_async_cluster() -> list[AsyncRaftLeaderElection]:
+    """Start a 3-node cluster on the running event loop."""
+    addresses = _reserve_addresses()
+    return [
+        AsyncRaftLeaderElection(
+            node_id=address.split(":")[0],
+            cluster_members=addresses,
+            election_timeout=ELECTION_TIMEOUT,
+            heartbeat_interval=HEARTBEAT_INTERVAL,
+        )
+        for address in addresses
+    ]
+
+
+async def _wait_for_async_leader(
+    nodes: list[AsyncRaftLeaderElection], timeout: float = 10.0
+) -> AsyncRaftLeaderElection:
+    """Wait until one of the nodes is leader and return it."""
+    waiters = [asyncio.ensure_future(node.wait_for_leadership()) for node in nodes]
+    try:
+        await asyncio.wait(
+            waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+    for node in nodes:
+        if node.is_leader_elected():
+            return node
+    pytest.fail(f"no leader elected within {timeout}s")
+
+
+def _count_ticks(nodes: list[RaftLeaderElection]) -> Callable[[], int]:
+    """Count the ticks of every node; returns a function reading the count."""
+    ticks = 0
+
+    def on_tick() -> None:
+        nonlocal ticks
+        ticks += 1
+
+    for node in nodes:
+        node._node.addOnTickCallback(on_tick)
+    return lambda: ticks
+
+
+def _threaded_idle_usage() -> tuple[float, int, int]:
+    """CPU seconds, ticks and extra threads of an idle threaded cluster."""
+    baseline = threading.active_count()
+    with start_cluster() as nodes:
+        wait_for_leader(nodes)
+        time.sleep(SETTLE_SECONDS)
+        count = _count_ticks(nodes)
+        cpu, ticks = time.process_time(), count()
+        time.sleep(IDLE_SECONDS)
+        usage = time.process_time() - cpu, count() - ticks
+        threads = threading.active_count() - baseline
+    # Let the tick threads exit before the event loop run counts threads
+    deadline = time.monotonic() + ELECTION_TIMEOUT
+    while threading.active_count() > baseline and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return (*usage, threads)
+
+
+async def _event_loop_idle_usage() -> tuple[float, int, int]:
+    """CPU seconds, ticks and extra threads of an idle cluster on the loop."""
+    baseline = threading.active_count()
+    nodes = _start_async_cluster()
+    try:
+        await _wait_for_async_leader(nodes)
+        await asyncio.sleep(SETTLE_SECONDS)
+        count = _count_ticks(nodes)
+        cpu, ticks = time.process_time(), count()
+        await asyncio.sleep(IDLE_SECONDS)
+        usage = time.process_time() - cpu, count() - ticks
+        threads = threading.active_count() - baseline
+    finally:
+        for node in nodes:
+            await node.close_async()
+    return (*usage, threads)
+
+
+def test_cluster_on_one_loop_elects_and_hands_over() -> None:
+    """Nodes sharing a loop elect a leader and hand leadership over."""
+
+    async def run() -> tuple[list[bool], bool, int]:
+        baseline = threading.active_count()
+        nodes = _start_async_cluster()
+        try:
+            leader = await _wait_for_async_leader(nodes)
+            threads = threading.active_count() - baseline
+            changes = leader.leadership_changes()
+            seen = [await anext(changes)]
+            await asyncio.sleep(5 * HEARTBEAT_INTERVAL)
+            with pytest.raises(RaftLeaderElectionError, match="_async"):
+                leader.transfer_leadership()
+
+            result = await leader.transfer_leadership_async()
+            seen.append(await asyncio.wait_for(anext(changes), ELECTION_TIMEOUT))
+            new_leader = await _wait_for_async_leader(nodes)
+            await changes.aclose()
+        finally:
+            for node in nodes:
+                await node.close_async()
+        return seen, result.succeeded and new_leader is not leader, threads
+
+    seen, handed_over, threads = asyncio.run(run())
+
+    assert seen == [True, False]
+    assert handed_over
+    assert threads == 0
+
+
+def test_idle_overhead_benchmark(record_property) -> None:
+    """Compare idle CPU time and wakeups of the threaded and loop drivers."""
+    usage = {
+        "threaded": _threaded_idle_usage(),
+        "event loop": asyncio.run(_event_loop_idle_usage()),
+    }
+
+    print(f"\nIdle 3-node cluster over {IDLE_SECONDS}s:")
+    for mode, (cpu, ticks, threads) in usage.items():
+        key = mode.replace(" ", "_")
+        record_property(f"{key}_cpu_seconds", cpu)
+        record_property(f"{key}_ticks", ticks)
+        print(
+            f"  {mode:<11} cpu {cpu * 1000:7.1f} ms  ticks {ticks:5d}  "
+            f"extra threads {threads}"
+        )
+    assert usage["event loop"][1] < usage["threaded"][1]
+    assert usage["event loop"][2] == 0 < usage["threaded"][2]
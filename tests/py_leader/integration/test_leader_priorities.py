@@ -0,0 +1,44 @@
+"""Leader priorities and rebalancing on a real running cluster."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import start_cluster, wait_for_leader
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.Priorities"),
+]
+
+REBALANCE_AFTER = 0.5
+
+
+def test_leadership_returns_to_preferred_node() -> None:
+    """A standby that took over hands leadership back after the window."""
+    with start_cluster(priorities=[2, 2, 0], rebalance_after=REBALANCE_AFTER) as nodes:
+        standby = nodes[2]
+        leader = wait_for_leader(nodes)
+        if leader is not standby:
+            transfer = leader.transfer_leadership(target=standby._self_address)
+            assert transfer.succeeded, transfer.reason
+        wait_for_leader([standby])
+
+        started = time.monotonic()
+        preferred = wait_for_leader(nodes[:2])
+
+        assert time.monotonic() - started >= REBALANCE_AFTER / 2
+        assert not standby.is_leader_elected()
+        assert preferred.get_priority(preferred._self_address) == 2
+
+
+def test_preferred_nodes_win_elections() -> None:
+    """The standby's longer election timeout keeps it from being elected."""
+    with start_cluster(priorities=[2, 2, 0]) as nodes:
+        leader = wait_for_leader(nodes)
+
+        assert leader is not nodes[2]
@@ -0,0 +1,100 @@
+"""Benchmark of write unavailability during a planned leader handoff.
+
+Runs real 3-node PySyncObj clusters on loopback addresses and measures the
+time from the start of a handoff until another node is leader:
+
+- with transfer: the leader calls transfer_leadership() (Raft TimeoutNow);
+- without transfer: the leader goes away, as when demote_from_leader() was
+  a no-op and a deploy stopped the primary, so followers wait out the
+  election timeout.
+
+Run with ``pytest -s`` to see the timings.
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import pytest
+from py_leader.election import RaftLeaderElection
+
+from .conftest import (
+    ELECTION_TIMEOUT,
+    HEARTBEAT_INTERVAL,
+    start_cluster,
+    wait_for_leader,
+)
+
+ROUNDS = 3
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.LeadershipTransfer"),
+]
+
+
+def _handoff_with_transfer(nodes: list[RaftLeaderElection]) -> float:
+    """Hand leadership over with a transfer; return the unavailability."""
+    leader = wait_for_leader(nodes)
+    # Let followers acknowledge the leader's log so the transfer is accepted
+    time.sleep(5 * HEARTBEAT_INTERVAL)
+    started = time.monotonic()
+    result = leader.transfer_leadership()
+    assert result.succeeded, result.reason
+    wait_for_leader([node for node in nodes if node is not leader])
+    return time.monotonic() - started
+
+
+def _handoff_without_transfer(nodes: list[RaftLeaderElection]) -> float:
+    """Stop the leader; return the time until a follower takes over."""
+    leader = wait_for_leader(nodes)
+    time.sleep(5 * HEARTBEAT_INTERVAL)
+    started = time.monotonic()
+    leader.destroy()
+    nodes.remove(leader)
+    wait_for_leader(nodes)
+    return time.monotonic() - started
+
+
+def test_transfer_hands_over_to_target() -> None:
+    """The chosen follower becomes leader well within the election timeout."""
+    with start_cluster() as nodes:
+        leader = wait_for_leader(nodes)
+        time.sleep(5 * HEARTBEAT_INTERVAL)
+
+        result = leader.transfer_leadership()
+        new_leader = wait_for_leader(nodes)
+
+    assert result.succeeded, result.reason
+    assert new_leader is not leader
+    assert result.new_leader == result.target == new_leader._self_address
+    assert result.duration < ELECTION_TIMEOUT / 2
+
+
+def test_write_unavailability_benchmark(record_property) -> None:
+    """Compare write unavailability with and without leadership transfer."""
+    timings: dict[str, list[float]] = {"transfer": [], "no transfer": []}
+    for _ in range(ROUNDS):
+        for mode, handoff in (
+            ("transfer", _handoff_with_transfer),
+            ("no transfer", _handoff_without_transfer),
+        ):
+            with start_cluster() as nodes:
+                timings[mode].append(handoff(nodes))
+
+    medians = {mode: statistics.median(values) for mode, values in timings.items()}
+    print(
+        f"\nWrite unavailability over {ROUNDS} handoffs "
+        f"(election timeout {ELECTION_TIMEOUT}s):"
+    )
+    for mode, values in timings.items():
+        record_property(f"{mode.replace(' ', '_')}_median_seconds", medians[mode])
+        print(
+            f"  {mode:<12} median {medians[mode] * 1000:8.1f} ms  "
+            f"max {max(values) * 1000:8.1f} ms"
+        )
+    assert medians["transfer"] < medians["no transfer"]
+    assert medians["no transfer"] >= ELECTION_TIMEOUT
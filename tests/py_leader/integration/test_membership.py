@@ -0,0 +1,77 @@
+"""Dynamic membership changes on a real running cluster."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+from py_leader.election import RaftLeaderElection
+from py_leader.membership import RaftMembershipClient
+
+from .conftest import (
+    ELECTION_TIMEOUT,
+    HEARTBEAT_INTERVAL,
+    _reserve_addresses,
+    start_cluster,
+    wait_for_leader,
+)
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.Membership"),
+]
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_member_added_and_removed_at_runtime(tmp_path: Path) -> None:
+    """A voter joins and leaves without restarting the others."""
+    with start_cluster(dynamic_membership=True) as nodes:
+        leader = wait_for_leader(nodes)
+        follower = next(node for node in nodes if node is not leader)
+        [address] = _reserve_addresses(["127.0.0.4"])
+
+        # Added through a follower, which forwards the change to the leader
+        added = follower.add_member(address)
+        assert added.succeeded, added.reason
+        assert address in added.members
+
+        membership_file = tmp_path / "members.json"
+        joined = RaftLeaderElection(
+            node_id="127.0.0.4",
+            cluster_members=leader.get_cluster_members(),
+            election_timeout=ELECTION_TIMEOUT,
+            heartbeat_interval=HEARTBEAT_INTERVAL,
+            dynamic_membership=True,
+            membership_file=str(membership_file),
+        )
+        nodes.append(joined)
+        assert _wait_until(lambda: len(leader.get_reachable_peers()) == 3)
+        assert all(len(node.get_cluster_members()) == 4 for node in nodes)
+
+        # Removed from another process through the leader's Raft port
+        removed_address = follower.get_cluster_members()[0]
+        client = RaftMembershipClient(leader.get_cluster_members()[0])
+        removed = client.remove_member(removed_address)
+        assert removed.succeeded, removed.reason
+
+        def saved_members() -> list[str]:
+            return json.loads(membership_file.read_text())["members"]
+
+        # The file is saved before the members are published
+        assert _wait_until(lambda: removed_address not in saved_members())
+        saved = saved_members()
+        assert len(saved) == 3
+        assert _wait_until(lambda: joined.get_cluster_members() == saved)
@@ -0,0 +1,58 @@
+"""Non-voting observers following a real 3-node cluster."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import start_cluster, wait_for_leader
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.Observers"),
+]
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_observers_follow_leader_without_voting() -> None:
+    """Observers learn the leader and term but never count toward quorum."""
+    with start_cluster(replicate_metadata=True, observers=2) as nodes:
+        voters, observers = nodes[:3], nodes[3:]
+        leader = wait_for_leader(voters)
+        leader_address = leader._self_address
+
+        for observer in observers:
+            assert observer.is_observer()
+            assert _wait_until(
+                lambda o=observer: (
+                    o.get_cluster_metadata().get("leader") == leader_address
+                )
+            )
+            assert observer.get_raft_term() == leader.get_raft_term()
+            assert observer.is_quorum_reached()
+        assert _wait_until(lambda: len(leader.get_reachable_peers()) == 2)
+        assert set(leader.get_reachable_peers()).isdisjoint(
+            observers[0].get_observers()
+        )
+
+        # Two voters down: the observers cannot make up the quorum
+        followers = [node for node in voters if node is not leader]
+        for follower in followers:
+            follower.destroy()
+            nodes.remove(follower)
+
+        assert _wait_until(lambda: not leader.is_quorum_reached())
+        assert _wait_until(lambda: not observers[0].is_quorum_reached())
+        assert not any(observer.is_leader_elected() for observer in observers)
@@ -0,0 +1,49 @@
+"""Reachability and quorum tracking on a real 3-node cluster."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from .conftest import ELECTION_TIMEOUT, start_cluster, wait_for_leader
+
+pytestmark = [
+    pytest.mark.tier(3),
+    pytest.mark.integration,
+    pytest.mark.no_parallel,
+    pytest.mark.tra("Adapter.py_leader.QuorumTracking"),
+]
+
+
+def _wait_until(condition, timeout: float = 5.0) -> bool:
+    """Poll condition until it holds or the timeout expires."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_quorum_loss_is_pushed_to_listeners() -> None:
+    """Stopping followers shrinks the reachable set and notifies quorum loss."""
+    with start_cluster() as nodes:
+        leader = wait_for_leader(nodes)
+        followers = [node for node in nodes if node is not leader]
+        assert _wait_until(lambda: len(leader.get_reachable_peers()) == 2)
+        assert leader.is_quorum_reached()
+        changes: list[bool] = []
+        leader.add_quorum_listener(changes.append)
+
+        followers[0].destroy()
+        nodes.remove(followers[0])
+        assert _wait_until(lambda: len(leader.get_reachable_peers()) == 1)
+        assert leader.is_quorum_reached()
+
+        followers[1].destroy()
+        nodes.remove(followers[1])
+
+        assert _wait_until(lambda: changes == [False], timeout=2 * ELECTION_TIMEOUT)
+        assert leader.get_reachable_peers() == []
+        assert not leader.is_quorum_reached()
@@ -10,9 +10,25 @@ Integration tests (with actual Raft consensus) are in tests/py_leader/integratio
 
 from __future__ import annotations
 
+import json
+import queue
+import threading
+import time
+from typing import ClassVar
+from unittest.mock import Mock
+
 import pytest
+from pysyncobj import FAIL_REASON
 
-from py_leader.election import InvalidConfigurationError, RaftLeaderElection
+from py_leader._metadata import ClusterMetadata
+from py_leader._raft_node import _STATE_FOLLOWER, _STATE_LEADER, LeaderElectionNode
+from py_leader.election import (
+    InvalidConfigurationError,
+    LeadershipTransfer,
+    MembershipChange,
+    RaftLeaderElection,
+    RaftLeaderElectionError,
+)
 
 
 class TestRaftLeaderElectionValidation:
@@ -196,6 +212,349 @@ class TestFindSelfAddress:
             )
 
 
+class TestObservers:
+    """Test validation of non-voting observers."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    @pytest.mark.parametrize(
+        ("observers", "match"),
+        [
+            (["node3:20202", "node3:20202"], "duplicate"),
+            (["node3"], "Invalid observer address"),
+            (["node2:20202"], "also cluster_members"),
+        ],
+    )
+    def test_invalid_observers_raise_error(
+        self, observers: list[str], match: str
+    ) -> None:
+        """Observers must be distinct "host:port" addresses of non-voters."""
+        with pytest.raises(InvalidConfigurationError, match=match):
+            RaftLeaderElection(
+                node_id="node1",
+                cluster_members=["node1:20202", "node2:20202"],
+                observers=observers,
+            )
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_observer_node_is_read_only(self, monkeypatch) -> None:
+        """A node listed as observer runs read-only against the voters."""
+        created: dict = {}
+
+        def fake_node(**kwargs) -> Mock:
+            created.update(kwargs)
+            return Mock()
+
+        monkeypatch.setattr("py_leader.election.LeaderElectionNode", fake_node)
+        election = RaftLeaderElection(
+            node_id="node3",
+            cluster_members=["node1:20202", "node2:20202"],
+            observers=["node3:20202"],
+        )
+
+        assert election.is_observer()
+        assert election.get_observers() == ["node3:20202"]
+        assert election.get_cluster_members() == ["node1:20202", "node2:20202"]
+        assert not election.is_member_in_cluster("node3")
+        assert created["observer"] is True
+        assert created["partners"] == ["node1:20202", "node2:20202"]
+
+
+class TestDynamicMembership:
+    """Test membership changes and their persistence without network."""
+
+    @staticmethod
+    def make_election(monkeypatch, **kwargs) -> tuple[RaftLeaderElection, dict]:
+        """Election on a fake node; returns it and the node's arguments."""
+        created: dict = {}
+
+        def fake_node(**node_kwargs) -> Mock:
+            created.update(node_kwargs)
+            return Mock()
+
+        monkeypatch.setattr("py_leader.election.LeaderElectionNode", fake_node)
+        election = RaftLeaderElection(
+            node_id="node1",
+            cluster_members=["node1:20202", "node2:20202", "node3:20202"],
+            **kwargs,
+        )
+        return election, created
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_saved_membership_overrides_configuration(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """A restarted node uses the members saved by its last change."""
+        membership_file = tmp_path / "members.json"
+        election, created = self.make_election(
+            monkeypatch, dynamic_membership=True, membership_file=str(membership_file)
+        )
+
+        created["on_membership_change"](["node1:20202", "node3:20202", "node4:20202"])
+        restarted, created = self.make_election(
+            monkeypatch, dynamic_membership=True, membership_file=str(membership_file)
+        )
+
+        assert election.get_cluster_members() == [
+            "node1:20202",
+            "node3:20202",
+            "node4:20202",
+        ]
+        assert restarted.get_cluster_members() == election.get_cluster_members()
+        assert created["partners"] == ["node3:20202", "node4:20202"]
+        assert created["dynamic_membership"] is True
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_membership_saved_on_startup(self, monkeypatch, tmp_path) -> None:
+        """The configured members are saved before any change happens."""
+        membership_file = tmp_path / "members.json"
+        self.make_election(
+            monkeypatch, dynamic_membership=True, membership_file=str(membership_file)
+        )
+
+        assert json.loads(membership_file.read_text())["members"] == [
+            "node1:20202",
+            "node2:20202",
+            "node3:20202",
+        ]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_membership_saved_before_published(self, monkeypatch, tmp_path) -> None:
+        """Readers of the new members can rely on the file holding them."""
+        membership_file = tmp_path / "members.json"
+        election, created = self.make_election(
+            monkeypatch, dynamic_membership=True, membership_file=str(membership_file)
+        )
+        members = ["node1:20202", "node2:20202"]
+        published_when_saved = []
+        save = RaftLeaderElection._save_membership
+
+        def recording_save(path: str, saved: list[str]) -> None:
+            save(path, saved)
+            published_when_saved.append(election.get_cluster_members())
+
+        monkeypatch.setattr(election, "_save_membership", recording_save)
+        created["on_membership_change"](members)
+
+        assert len(published_when_saved[0]) == 3
+        assert json.loads(membership_file.read_text())["members"] == members
+        assert election.get_cluster_members() == members
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_membership_file_requires_dynamic_membership(self, tmp_path) -> None:
+        """Saving membership is only meaningful when it can change."""
+        with pytest.raises(InvalidConfigurationError, match="dynamic_membership"):
+            RaftLeaderElection(
+                node_id="node1",
+                cluster_members=["node1:20202", "node2:20202"],
+                membership_file=str(tmp_path / "members.json"),
+            )
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_invalid_membership_file_raises_error(self, tmp_path) -> None:
+        """A corrupt membership file is a configuration error."""
+        membership_file = tmp_path / "members.json"
+        membership_file.write_text('{"members": "node1:20202"}')
+
+        with pytest.raises(InvalidConfigurationError, match="list of members"):
+            RaftLeaderElection(
+                node_id="node1",
+                cluster_members=["node1:20202", "node2:20202"],
+                dynamic_membership=True,
+                membership_file=str(membership_file),
+            )
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_changes_require_dynamic_membership(self, monkeypatch) -> None:
+        """Static clusters refuse membership changes."""
+        election, _ = self.make_election(monkeypatch)
+
+        with pytest.raises(RaftLeaderElectionError, match="disabled"):
+            election.add_member("node4:20202")
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    @pytest.mark.parametrize(
+        ("action", "address", "reason"),
+        [
+            ("add", "node2:20202", "already a member"),
+            ("remove", "node4:20202", "not a member"),
+            ("remove", "node1:20202", "cannot remove this node"),
+        ],
+    )
+    def test_pointless_changes_are_not_sent(
+        self, monkeypatch, action: str, address: str, reason: str
+    ) -> None:
+        """Changes that cannot apply fail without reaching the log."""
+        election, _ = self.make_election(monkeypatch, dynamic_membership=True)
+        change = getattr(election, f"{action}_member")
+
+        outcome = change(address)
+
+        assert not outcome.succeeded
+        assert reason in outcome.reason
+        election._node.change_membership.assert_not_called()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_failed_commit_is_reported(self, monkeypatch) -> None:
+        """The reason PySyncObj gives is returned."""
+        election, _ = self.make_election(monkeypatch, dynamic_membership=True)
+        election._node.change_membership.return_value = "not_leader"
+
+        outcome = election.add_member("node4:20202", timeout=0.1)
+
+        assert outcome == MembershipChange(
+            succeeded=False,
+            action="add",
+            member="node4:20202",
+            members=("node1:20202", "node2:20202", "node3:20202"),
+            reason="not_leader",
+        )
+
+
+class TestLeaderPriorities:
+    """Test leader priorities and rebalancing without network."""
+
+    MEMBERS: ClassVar[list[str]] = ["node1:20202", "node2:20202", "node3:20202"]
+    PRIORITIES: ClassVar[dict[str, int]] = {
+        "node1:20202": 2,
+        "node2:20202": 2,
+        "node3:20202": 0,
+    }
+
+    @staticmethod
+    def make_election(
+        monkeypatch, node_id: str = "node3", **kwargs
+    ) -> tuple[RaftLeaderElection, dict]:
+        """Election on a fake follower node; returns it and the node's arguments."""
+        created: dict = {}
+
+        def fake_node(**node_kwargs) -> Mock:
+            created.update(node_kwargs)
+            return Mock(leader_since=None)
+
+        monkeypatch.setattr("py_leader.election.LeaderElectionNode", fake_node)
+        election = RaftLeaderElection(
+            node_id=node_id,
+            cluster_members=TestLeaderPriorities.MEMBERS,
+            priorities=TestLeaderPriorities.PRIORITIES,
+            **kwargs,
+        )
+        return election, created
+
+    @staticmethod
+    def lead(election: RaftLeaderElection, match_indexes: dict[str, int]) -> Mock:
+        """Make the fake node a leader with quorum for a minute."""
+        node = election._node
+        node.leader_since = time.monotonic() - 60.0
+        node.reachability.has_quorum = True
+        node.reachability.reachable_peers = frozenset(match_indexes)
+        node.get_follower_match_indexes.return_value = match_indexes
+        node.get_commit_index.return_value = 10
+        election.transfer_leadership = Mock(
+            return_value=LeadershipTransfer(
+                succeeded=True, target=None, new_leader=None, duration=0.1
+            )
+        )
+        return node
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    @pytest.mark.parametrize(
+        ("priorities", "rebalance_after", "match"),
+        [
+            ({"node4:20202": 1}, 30.0, "not cluster_members"),
+            ({"node1:20202": "high"}, 30.0, "must be an integer"),
+            ({"node1:20202": 1}, 0.0, "rebalance_after"),
+        ],
+    )
+    def test_invalid_priorities_raise_error(
+        self, priorities: dict, rebalance_after: float, match: str
+    ) -> None:
+        """Priorities are integers of voting members."""
+        with pytest.raises(InvalidConfigurationError, match=match):
+            RaftLeaderElection(
+                node_id="node1",
+                cluster_members=["node1:20202", "node2:20202"],
+                priorities=priorities,
+                rebalance_after=rebalance_after,
+            )
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    @pytest.mark.parametrize(("node_id", "backoff_ms"), [("node1", 0), ("node3", 2500)])
+    def test_lower_priority_waits_longer(
+        self, monkeypatch, node_id: str, backoff_ms: int
+    ) -> None:
+        """Each priority level below the highest adds half an election timeout."""
+        election, created = self.make_election(monkeypatch, node_id=node_id)
+        election.destroy()
+
+        assert created["election_backoff_ms"] == backoff_ms
+        assert election.get_priority("node2:20202") == 2
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_hands_over_to_caught_up_preferred_node(self, monkeypatch) -> None:
+        """The preferred follower that has the committed log is chosen."""
+        election, _ = self.make_election(monkeypatch)
+        election.destroy()
+        self.lead(election, {"node1:20202": 9, "node2:20202": 10})
+
+        election._rebalance()
+
+        election.transfer_leadership.assert_called_once_with("node2:20202")
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_waits_for_stability_window(self, monkeypatch) -> None:
+        """A new leader keeps leadership for rebalance_after seconds."""
+        election, _ = self.make_election(monkeypatch, rebalance_after=120.0)
+        election.destroy()
+        self.lead(election, {"node1:20202": 10})
+
+        assert election._rebalance() is None
+        election.transfer_leadership.assert_not_called()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_failed_handover_backs_off(self, monkeypatch) -> None:
+        """After a failed transfer, the next attempt waits another window."""
+        election, _ = self.make_election(monkeypatch)
+        election.destroy()
+        self.lead(election, {"node1:20202": 10})
+        election.transfer_leadership.return_value = LeadershipTransfer(
+            succeeded=False,
+            target="node1:20202",
+            new_leader="node3:20202",
+            duration=5.0,
+            reason="node1:20202 did not take over in time",
+        )
+
+        election._rebalance()
+        election._rebalance()
+
+        election.transfer_leadership.assert_called_once_with("node1:20202")
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_preferred_leader_keeps_leadership(self, monkeypatch) -> None:
+        """A leader with the highest priority never rebalances."""
+        election, _ = self.make_election(monkeypatch, node_id="node1")
+        self.lead(election, {"node2:20202": 10, "node3:20202": 10})
+
+        assert election._rebalancer is None
+        assert election._rebalance() is None
+
+
 class TestIsMemberInCluster:
     """Test is_member_in_cluster without network.
 
@@ -216,3 +575,497 @@ class TestIsMemberInCluster:
 
         # Non-member
         assert "node4" not in [m.split(":")[0] for m in cluster_members]
+
+
+class TestRaftTerm:
+    """Test reading the Raft term without network."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_get_raft_term_reads_node_term(self) -> None:
+        """get_raft_term returns the term of the underlying node."""
+        election = RaftLeaderElection.__new__(RaftLeaderElection)
+        election._node = Mock()
+        election._node.get_raft_term.return_value = 7
+
+        assert election.get_raft_term() == 7
+
+
+class TestLeaderEpoch:
+    """Test the leader epoch used to fence writes."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_epoch_recorded_on_leadership_change(self) -> None:
+        """The node records the term it was elected in, None once deposed."""
+        node = LeaderElectionNode.__new__(LeaderElectionNode)
+        node._lock = threading.Lock()
+        node._is_leader = False
+        node._leader_epoch = None
+        node._on_leader_change = None
+        node.metadata = None
+        node.reachability = Mock()
+        node.timing = Mock()
+        node._SyncObj__raftCurrentTerm = 4
+
+        node._handle_state_change(_STATE_FOLLOWER, _STATE_LEADER)
+        assert node.leader_epoch == 4
+
+        node._handle_state_change(_STATE_LEADER, _STATE_FOLLOWER)
+        assert node.leader_epoch is None
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_no_epoch_during_transfer(self) -> None:
+        """A leader handing over leadership fences its writes."""
+        election = RaftLeaderElection.__new__(RaftLeaderElection)
+        election._node = Mock()
+        election._node.leader_epoch = 3
+        election._transferring = False
+
+        assert election.get_leader_epoch() == 3
+        election._transferring = True
+        assert election.get_leader_epoch() is None
+
+
+class TestClusterMetadata:
+    """Test reading and updating cluster metadata without network."""
+
+    @staticmethod
+    def make_election(
+        term: int, metadata: ClusterMetadata | None
+    ) -> RaftLeaderElection:
+        """Create an election whose node is in the given term."""
+        election = RaftLeaderElection.__new__(RaftLeaderElection)
+        election._node = Mock()
+        election._node.get_raft_term.return_value = term
+        election._metadata = metadata
+        return election
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_forwarding_url_requires_metadata(self) -> None:
+        """A forwarding URL is useless without replicated metadata."""
+        with pytest.raises(InvalidConfigurationError, match="replicate_metadata"):
+            RaftLeaderElection(
+                node_id="node1",
+                cluster_members=["node1:20202", "node2:20202"],
+                forwarding_url="http://node1:8000",
+            )
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_disabled_metadata_is_empty(self) -> None:
+        """Without replication there is no metadata and it cannot be set."""
+        election = self.make_election(term=1, metadata=None)
+
+        assert election.get_cluster_metadata() == {}
+        with pytest.raises(RaftLeaderElectionError, match="not replicated"):
+            election.update_cluster_metadata({"config_version": 1})
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_leader_entry_hidden_until_current(self) -> None:
+        """The leader keys are left out while a newer term is known."""
+        metadata = ClusterMetadata()
+        metadata.apply(
+            {
+                "leader": "node1:20202",
+                "epoch": 3,
+                "forwarding_url": "http://node1:8000",
+                "config_version": 2,
+            },
+            _doApply=True,
+        )
+
+        assert self.make_election(term=3, metadata=metadata).get_cluster_metadata() == {
+            "leader": "node1:20202",
+            "epoch": 3,
+            "forwarding_url": "http://node1:8000",
+            "config_version": 2,
+        }
+        assert self.make_election(term=4, metadata=metadata).get_cluster_metadata() == {
+            "epoch": 3,
+            "config_version": 2,
+        }
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_update_appends_to_log(self) -> None:
+        """Updates go through the Raft log; leader keys are reserved."""
+        metadata = Mock()
+        election = self.make_election(term=1, metadata=metadata)
+
+        election.update_cluster_metadata({"config_version": 4})
+
+        metadata.apply.assert_called_once_with({"config_version": 4})
+        with pytest.raises(InvalidConfigurationError, match="reserved"):
+            election.update_cluster_metadata({"epoch": 99})
+
+
+class FakeTransferNode:
+    """Leader node whose followers accept a transfer once caught up.
+
+    The target takes over as soon as the request is accepted.
+    """
+
+    def __init__(self, match_indexes: dict[str, int], caught_up_after: int = 0) -> None:
+        """Initialize as leader with the given follower progress."""
+        self.is_leader = True
+        self.leader = "node1:20202"
+        self.match_indexes = match_indexes
+        self.caught_up_after = caught_up_after
+        self.requests: list[str] = []
+        self.elected_during_transfer: list[bool] = []
+        self.election: RaftLeaderElection | None = None
+
+    def get_leader_address(self) -> str | None:
+        """Return the known leader."""
+        return self.leader
+
+    def get_follower_match_indexes(self) -> dict[str, int]:
+        """Return the configured follower progress."""
+        return self.match_indexes
+
+    def request_leadership_transfer(self, target: str) -> bool:
+        """Accept the request once the target has caught up."""
+        self.requests.append(target)
+        if self.election is not None:
+            self.elected_during_transfer.append(self.election.is_leader_elected())
+        if len(self.requests) <= self.caught_up_after:
+            return False
+        self.is_leader = False
+        self.leader = target
+        return True
+
+
+def make_transfer_election(node: FakeTransferNode) -> RaftLeaderElection:
+    """Create an election on node1 without starting PySyncObj."""
+    election = RaftLeaderElection.__new__(RaftLeaderElection)
+    election._node = node
+    election._self_address = "node1:20202"
+    election._election_timeout = 1.0
+    election._transfer_lock = threading.Lock()
+    election._transferring = False
+    node.election = election
+    return election
+
+
+class TestLeadershipTransfer:
+    """Test leadership transfer without network."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_transfers_to_most_caught_up_follower(self) -> None:
+        """Without a target, the follower with the highest match index is used."""
+        node = FakeTransferNode({"node2:20202": 7, "node3:20202": 9})
+        election = make_transfer_election(node)
+
+        result = election.transfer_leadership()
+
+        assert result.succeeded
+        assert result.target == result.new_leader == "node3:20202"
+        assert result.reason is None
+        assert node.elected_during_transfer == [False]
+        assert not election.is_leader_elected()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_retries_until_target_caught_up(self) -> None:
+        """A denied request is retried while the target catches up."""
+        node = FakeTransferNode({"node2:20202": 3}, caught_up_after=2)
+        election = make_transfer_election(node)
+
+        result = election.transfer_leadership(target="node2:20202")
+
+        assert result.succeeded
+        assert node.requests == ["node2:20202"] * 3
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_gives_up_without_connected_follower(self) -> None:
+        """The leader stays leader when no follower can take over."""
+        node = FakeTransferNode({})
+        election = make_transfer_election(node)
+
+        result = election.transfer_leadership(timeout=0.05)
+
+        assert result == LeadershipTransfer(
+            succeeded=False,
+            target=None,
+            new_leader="node1:20202",
+            duration=result.duration,
+            reason="no connected follower",
+        )
+        assert result.duration >= 0.05
+        assert election.is_leader_elected()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_follower_cannot_transfer(self) -> None:
+        """Only the leader can hand over leadership."""
+        node = FakeTransferNode({"node2:20202": 1})
+        node.is_leader = False
+        node.leader = "node2:20202"
+        election = make_transfer_election(node)
+
+        result = election.transfer_leadership()
+
+        assert not result.succeeded
+        assert result.reason == "not the leader"
+        assert node.requests == []
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_demote_transfers_leadership(self) -> None:
+        """demote_from_leader() hands leadership over instead of doing nothing."""
+        node = FakeTransferNode({"node2:20202": 1})
+        election = make_transfer_election(node)
+
+        election.demote_from_leader()
+
+        assert node.leader == "node2:20202"
+
+
+def make_tick_node() -> LeaderElectionNode:
+    """Create a leader node whose tick thread is driven by the test."""
+    node = LeaderElectionNode.__new__(LeaderElectionNode)
+    node._tick_thread = None
+    node._tick_requests = queue.SimpleQueue()
+    node._driver = None
+    node._raft_state = _STATE_LEADER
+    node._match_indexes = {}
+    node.timing = Mock(election_timeout=1.0)
+    return node
+
+
+class TestTickThreadAccess:
+    """Test that PySyncObj state is only used on the tick thread."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_transfer_request_sent_on_tick_thread(self) -> None:
+        """A transfer requested by another thread is sent by the next tick."""
+        node = make_tick_node()
+        senders: list[threading.Thread] = []
+
+        def transfer(target: str, callback) -> None:
+            senders.append(threading.current_thread())
+            callback(None, FAIL_REASON.SUCCESS)
+
+        node.transferLeadership = transfer
+        stop = threading.Event()
+
+        def tick() -> None:
+            node._tick_thread = threading.get_ident()
+            while not stop.wait(0.01):
+                node._run_tick_requests()
+
+        ticker = threading.Thread(target=tick, daemon=True)
+        ticker.start()
+        try:
+            assert node.request_leadership_transfer("node2:20202")
+        finally:
+            stop.set()
+            ticker.join(1.0)
+
+        assert senders == [ticker]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_transfer_request_abandoned_without_tick(self) -> None:
+        """A request no tick ran in time is reported as failed and dropped."""
+        node = make_tick_node()
+        node.transferLeadership = Mock()
+
+        assert not node.request_leadership_transfer("node2:20202", timeout=0.01)
+        node._run_tick_requests()
+
+        node.transferLeadership.assert_not_called()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_match_indexes_copied_while_leading(self) -> None:
+        """Match indexes of connected followers are copied on the tick."""
+        node = make_tick_node()
+        node2 = Mock(address="node2:20202")
+        node3 = Mock(address="node3:20202")
+        node._SyncObj__otherNodes = {node2, node3}
+        node._SyncObj__connectedNodes = {node2}
+        node._SyncObj__raftMatchIndex = {node2: 7, node3: 9}
+
+        node._copy_match_indexes()
+        assert node.get_follower_match_indexes() == {"node2:20202": 7}
+
+        node._raft_state = _STATE_FOLLOWER
+        node._copy_match_indexes()
+        assert node.get_follower_match_indexes() == {}
+
+
+def make_pre_vote_node(log: tuple[int, int] = (2, 10)) -> LeaderElectionNode:
+    """Create a voting follower of a 3-node cluster with the given log position."""
+    node = LeaderElectionNode.__new__(LeaderElectionNode)
+    node._SyncObj__selfNode = Mock()
+    node._SyncObj__raftCurrentTerm = 2
+    node._SyncObj__getCurrentLogTerm = lambda: log[0]
+    node._SyncObj__getCurrentLogIndex = lambda: log[1]
+    node._SyncObj__transport = Mock()
+    node._members = ("node1:20202", "node2:20202", "node3:20202")
+    node._raft_state = _STATE_FOLLOWER
+    node._last_leader_contact = None
+    node._pre_vote_round = 0
+    node._pre_vote_grants = set()
+    node._pre_vote_granted = False
+    node.timing = Mock(election_timeout=1.0)
+    return node
+
+
+def pre_vote(node: LeaderElectionNode, sender: str, log: tuple[int, int]) -> bool:
+    """Send node a pre-vote request; return whether it was granted."""
+    candidate = Mock(id=sender)
+    node.on_pre_vote_message(
+        candidate,
+        {
+            "type": "pre_vote_request",
+            "term": 3,
+            "round": 1,
+            "last_log_term": log[0],
+            "last_log_index": log[1],
+        },
+    )
+    reply = node._SyncObj__transport.send.call_args.args
+    assert reply[0] is candidate
+    assert reply[1]["round"] == 1
+    return reply[1]["granted"]
+
+
+class TestPreVote:
+    """Test the answers to pre-votes and the counting of grants."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_granted_without_leader(self) -> None:
+        """A follower without a leader agrees to an up-to-date candidate."""
+        node = make_pre_vote_node()
+
+        assert pre_vote(node, "node2:20202", (2, 10))
+        assert pre_vote(node, "node2:20202", (3, 1))
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_refused_while_leader_heard(self) -> None:
+        """A follower hearing from its leader refuses, as does the leader."""
+        node = make_pre_vote_node()
+        node.on_raft_message("node3:20202", {"type": "append_entries", "term": 2})
+
+        assert not pre_vote(node, "node2:20202", (2, 10))
+
+        node._last_leader_contact = time.monotonic() - 2.0
+        assert pre_vote(node, "node2:20202", (2, 10))
+
+        node._raft_state = _STATE_LEADER
+        assert not pre_vote(node, "node2:20202", (2, 10))
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_refused_to_stale_log_or_non_member(self) -> None:
+        """Candidates behind this node's log or outside the cluster are refused."""
+        node = make_pre_vote_node()
+
+        assert not pre_vote(node, "node2:20202", (2, 9))
+        assert not pre_vote(node, "node2:20202", (1, 50))
+        assert not pre_vote(node, "node9:20202", (2, 10))
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_majority_of_grants_starts_election(self) -> None:
+        """A grant of the current round makes a majority; stale rounds do not."""
+        node = make_pre_vote_node()
+        node._pre_vote_round = 2
+        node._SyncObj__raftElectionDeadline = time.monotonic() + 10.0
+        response = {"type": "pre_vote_response", "granted": True}
+
+        node.on_pre_vote_message(Mock(id="node2:20202"), {**response, "round": 1})
+        assert not node._pre_vote_granted
+
+        node.on_pre_vote_message(Mock(id="node2:20202"), {**response, "round": 2})
+        assert node._pre_vote_granted
+        assert node._SyncObj__raftElectionDeadline == 0.0
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_leader_heard_ends_pre_vote(self) -> None:
+        """Grants arriving after a leader was heard from start no election."""
+        node = make_pre_vote_node()
+        node._pre_vote_round = 2
+        node._SyncObj__raftElectionDeadline = time.monotonic() + 10.0
+
+        node.on_raft_message("node3:20202", {"type": "append_entries", "term": 2})
+        node.on_pre_vote_message(
+            Mock(id="node2:20202"),
+            {"type": "pre_vote_response", "granted": True, "round": 2},
+        )
+
+        assert not node._pre_vote_granted
+        assert node._SyncObj__raftElectionDeadline > 0.0
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_deadline_read_on_pysyncobj_clock(self, monkeypatch) -> None:
+        """The pre-vote starts when PySyncObj's deadline passes on its clock."""
+        raft_now = time.monotonic() - 1000.0
+        monkeypatch.setattr("py_leader._raft_node.raft_clock", lambda: raft_now)
+        node = make_pre_vote_node()
+        node.reachability = Mock(reachable_peers={"node2:20202"})
+        node._SyncObj__transferInProgress = False
+        node._SyncObj__otherNodes = {Mock(id="node2:20202"), Mock(id="node3:20202")}
+        node._SyncObj__conf = Mock(raftMinTimeout=1.0, raftMaxTimeout=1.5)
+
+        # Due in a second on PySyncObj's clock, long past on time.monotonic()
+        node._SyncObj__raftElectionDeadline = raft_now + 1.0
+        node._hold_election()
+        assert node._SyncObj__transport.send.call_count == 0
+
+        node._SyncObj__raftElectionDeadline = raft_now - 0.1
+        node._hold_election()
+        assert node._SyncObj__transport.send.call_count == 2
+        assert raft_now + 1.0 <= node._SyncObj__raftElectionDeadline <= raft_now + 1.5
+
+
+class TestPySyncObjCompatibility:
+    """Test the import-time check of the PySyncObj internals in use."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_installed_pysyncobj_is_supported(self) -> None:
+        """The installed PySyncObj provides every internal in use."""
+        from py_leader._raft_node import _check_pysyncobj
+
+        _check_pysyncobj()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_missing_method_fails_loudly(self, monkeypatch) -> None:
+        """A PySyncObj without an overridden method is rejected."""
+        from py_leader._raft_node import _check_pysyncobj
+        from pysyncobj import SyncObj
+
+        monkeypatch.delattr(SyncObj, "transferLeadership")
+
+        with pytest.raises(RuntimeError, match=r"SyncObj\.transferLeadership"):
+            _check_pysyncobj()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_missing_private_attribute_fails_loudly(self, monkeypatch) -> None:
+        """A renamed private attribute is detected without an instance."""
+        from py_leader import _raft_node
+
+        monkeypatch.setattr(
+            _raft_node,
+            "_SYNCOBJ_ATTRIBUTES",
+            (*_raft_node._SYNCOBJ_ATTRIBUTES, "_SyncObj__renamedDeadline"),
+        )
+
+        with pytest.raises(RuntimeError, match="_SyncObj__renamedDeadline"):
+            _raft_node._check_pysyncobj()
@@ -0,0 +1,158 @@
+"""Unit tests for running PySyncObj from an asyncio event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+
+import pytest
+from py_leader import AsyncRaftLeaderElection
+from py_leader._event_loop import EventLoopDriver
+from py_leader.election import RaftLeaderElectionError
+from pysyncobj.poller import POLL_EVENT_TYPE
+
+
+class TestEventLoopPoller:
+    """Test socket events dispatched by the loop."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_read_event_dispatched_and_ticks(self) -> None:
+        """A readable socket calls back PySyncObj, then ticks the node."""
+
+        async def run() -> tuple[list[tuple[int, int]], int]:
+            loop = asyncio.get_running_loop()
+            ticked = asyncio.Event()
+
+            def tick() -> float:
+                ticked.set()
+                return 60.0
+
+            driver = EventLoopDriver(loop, tick)
+            events: list[tuple[int, int]] = []
+            reader, writer = socket.socketpair()
+            with reader, writer:
+                driver.poller.subscribe(
+                    reader.fileno(),
+                    lambda descr, event: events.append((descr, event)),
+                    POLL_EVENT_TYPE.READ | POLL_EVENT_TYPE.ERROR,
+                )
+                writer.send(b"x")
+                await asyncio.wait_for(ticked.wait(), 1.0)
+                driver.poller.unsubscribe(reader.fileno())
+                driver.stop()
+                return events[:1], reader.fileno()
+
+        events, descr = asyncio.run(run())
+
+        assert events == [(descr, POLL_EVENT_TYPE.READ)]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_subscription_from_other_thread_runs_on_loop(self) -> None:
+        """A send from a worker thread registers its socket on the loop."""
+
+        async def run() -> bool:
+            loop = asyncio.get_running_loop()
+            driver = EventLoopDriver(loop, lambda: 60.0)
+            writable = asyncio.Event()
+            reader, writer = socket.socketpair()
+            with reader, writer:
+                thread = threading.Thread(
+                    target=driver.poller.subscribe,
+                    args=(
+                        writer.fileno(),
+                        lambda descr, event: writable.set(),
+                        POLL_EVENT_TYPE.WRITE,
+                    ),
+                )
+                thread.start()
+                thread.join()
+                await asyncio.wait_for(writable.wait(), 1.0)
+                driver.poller.unsubscribe(writer.fileno())
+                driver.stop()
+            return writable.is_set()
+
+        assert asyncio.run(run())
+
+
+class TestEventLoopDriver:
+    """Test tick scheduling on the loop."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_wakes_coalesce_into_one_tick(self) -> None:
+        """Events of one loop iteration tick once; idle ticks follow the delay."""
+
+        async def run() -> tuple[int, int]:
+            loop = asyncio.get_running_loop()
+            ticks: list[float] = []
+
+            def tick() -> float:
+                ticks.append(loop.time())
+                return 0.05
+
+            driver = EventLoopDriver(loop, tick)
+            driver.start()
+            for _ in range(5):
+                driver.wake()
+            await asyncio.sleep(0.01)
+            after_wakes = len(ticks)
+            await asyncio.sleep(0.22)
+            driver.stop()
+            return after_wakes, len(ticks)
+
+        after_wakes, total = asyncio.run(run())
+
+        assert after_wakes == 1
+        assert 4 <= total <= 6
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_earlier_deadline_replaces_later_tick(self) -> None:
+        """A wake before the next due tick ticks at once."""
+
+        async def run() -> int:
+            loop = asyncio.get_running_loop()
+            driver = EventLoopDriver(loop, lambda: 60.0)
+            driver.start()
+            await asyncio.sleep(0.01)
+            driver.wake()
+            await asyncio.sleep(0.01)
+            driver.stop()
+            return driver.ticks
+
+        assert asyncio.run(run()) == 2
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_failed_tick_is_retried(self) -> None:
+        """A tick raising does not stop the node from ticking."""
+
+        async def run() -> int:
+            loop = asyncio.get_running_loop()
+
+            def tick() -> float:
+                raise RuntimeError("boom")
+
+            driver = EventLoopDriver(loop, tick)
+            driver.start()
+            await asyncio.sleep(0.12)
+            driver.stop()
+            return driver.ticks
+
+        assert asyncio.run(run()) >= 2
+
+
+class TestAsyncRaftLeaderElection:
+    """Test the asyncio election without a cluster."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_requires_running_loop(self) -> None:
+        """Creating the election outside of an event loop fails clearly."""
+        with pytest.raises(RaftLeaderElectionError, match="running event loop"):
+            AsyncRaftLeaderElection(
+                node_id="node1", cluster_members=["node1:20202", "node2:20202"]
+            )
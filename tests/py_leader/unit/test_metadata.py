@@ -0,0 +1,60 @@
+"""Unit tests for the replicated cluster metadata map.
+
+Replicated methods are applied directly with _doApply=True, as PySyncObj
+does when a committed log entry is applied.
+"""
+
+from __future__ import annotations
+
+import pytest
+from py_leader._metadata import ClusterMetadata
+
+pytestmark = [pytest.mark.tier(1), pytest.mark.tra("Domain.Invariant.py_leader")]
+
+
+class TestClusterMetadata:
+    """Test applying metadata updates in log order."""
+
+    def test_updates_are_merged(self) -> None:
+        """Updates set keys without removing the others."""
+        metadata = ClusterMetadata()
+
+        metadata.apply({"leader": "node1:20202", "epoch": 1}, _doApply=True)
+        metadata.apply({"config_version": 3}, _doApply=True)
+
+        assert metadata.snapshot() == {
+            "leader": "node1:20202",
+            "epoch": 1,
+            "config_version": 3,
+        }
+        assert metadata.get("config_version") == 3
+        assert metadata.get("missing", "default") == "default"
+
+    def test_none_removes_key(self) -> None:
+        """A key set to None is removed."""
+        metadata = ClusterMetadata()
+        metadata.apply(
+            {"leader": "node1:20202", "forwarding_url": "http://a"}, _doApply=True
+        )
+
+        metadata.apply({"forwarding_url": None}, _doApply=True)
+
+        assert metadata.snapshot() == {"leader": "node1:20202"}
+
+    def test_lower_epoch_is_ignored(self) -> None:
+        """An entry of a deposed leader cannot overwrite its successor's."""
+        metadata = ClusterMetadata()
+        metadata.apply({"leader": "node2:20202", "epoch": 5}, _doApply=True)
+
+        metadata.apply({"leader": "node1:20202", "epoch": 4}, _doApply=True)
+
+        assert metadata.snapshot() == {"leader": "node2:20202", "epoch": 5}
+
+    def test_snapshot_is_a_copy(self) -> None:
+        """Changing a snapshot does not change the map."""
+        metadata = ClusterMetadata()
+        metadata.apply({"epoch": 1}, _doApply=True)
+
+        metadata.snapshot()["epoch"] = 9
+
+        assert metadata.get("epoch") == 1
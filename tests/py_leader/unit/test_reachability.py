@@ -0,0 +1,144 @@
+"""Unit tests for incremental reachability and quorum tracking."""
+
+from __future__ import annotations
+
+import pytest
+from py_leader._reachability import ReachabilityTracker
+
+PARTNERS = ["node2:20202", "node3:20202", "node4:20202", "node5:20202"]
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_tracker(clock: FakeClock) -> tuple[ReachabilityTracker, list[bool]]:
+    """Create a 5-node tracker recording quorum notifications."""
+    tracker = ReachabilityTracker(PARTNERS, stale_after=1.0, clock=clock)
+    changes: list[bool] = []
+    tracker.add_listener(changes.append)
+    return tracker, changes
+
+
+class TestReachabilityTracker:
+    """Test reachability updates from transport events."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_quorum_follows_connections(self) -> None:
+        """Quorum needs two connected partners out of four; changes are pushed."""
+        tracker, changes = make_tracker(FakeClock())
+        assert not tracker.has_quorum
+
+        tracker.on_connected("node2:20202")
+        tracker.on_connected("node3:20202")
+        tracker.on_connected("node4:20202")
+        tracker.on_disconnected("node2:20202")
+        tracker.on_disconnected("node3:20202")
+
+        assert tracker.reachable_peers == frozenset({"node4:20202"})
+        assert not tracker.has_quorum
+        assert changes == [True, False]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_unknown_addresses_ignored(self) -> None:
+        """Events from non-members (e.g. read-only nodes) do not count."""
+        tracker, _ = make_tracker(FakeClock())
+
+        tracker.on_connected("observer:20202")
+        tracker.on_message("observer:20202")
+
+        assert tracker.reachable_peers == frozenset()
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_leader_drops_silent_followers(self) -> None:
+        """A leader stops counting followers that do not acknowledge."""
+        clock = FakeClock()
+        tracker, changes = make_tracker(clock)
+        for partner in PARTNERS[:3]:
+            tracker.on_connected(partner)
+        tracker.set_leader(True)
+
+        clock.now = 0.8
+        tracker.on_message("node2:20202")
+        clock.now = 1.5
+        tracker.expire()
+
+        assert tracker.reachable_peers == frozenset({"node2:20202"})
+        assert changes == [True, False]
+
+        tracker.on_message("node3:20202")
+
+        assert tracker.has_quorum
+        assert changes == [True, False, True]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_follower_counts_connections_only(self) -> None:
+        """Followers do not hear from other followers; silence is not expiry."""
+        clock = FakeClock()
+        tracker, _ = make_tracker(clock)
+        for partner in PARTNERS[:2]:
+            tracker.on_connected(partner)
+
+        clock.now = 10.0
+        tracker.expire()
+
+        assert tracker.has_quorum
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_observer_needs_majority_of_voters(self) -> None:
+        """An observer does not count itself: 3 of 4 voters are needed."""
+        tracker = ReachabilityTracker(PARTNERS, stale_after=1.0, voter=False)
+        for partner in PARTNERS[:2]:
+            tracker.on_connected(partner)
+
+        assert not tracker.has_quorum
+        tracker.on_connected(PARTNERS[2])
+        assert tracker.has_quorum
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_membership_change_resizes_quorum(self) -> None:
+        """Removing partners shrinks the quorum; an early connection counts."""
+        tracker, changes = make_tracker(FakeClock())
+        tracker.on_connected("node2:20202")
+        tracker.on_connected("node6:20202")
+        assert not tracker.has_quorum
+
+        tracker.set_partners(["node2:20202", "node3:20202"])
+        assert tracker.has_quorum
+        tracker.set_partners(["node2:20202", "node6:20202", "node7:20202"])
+
+        assert tracker.reachable_peers == frozenset({"node2:20202", "node6:20202"})
+        assert tracker.has_quorum
+        assert changes == [True]
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_failing_listener_does_not_stop_others(self) -> None:
+        """A listener raising is logged; later listeners still run."""
+        tracker = ReachabilityTracker(PARTNERS[:1], stale_after=1.0)
+        received: list[bool] = []
+
+        def failing(has_quorum: bool) -> None:
+            raise RuntimeError("boom")
+
+        tracker.add_listener(failing)
+        tracker.add_listener(received.append)
+        tracker.on_connected("node2:20202")
+        tracker.remove_listener(received.append)
+        tracker.on_disconnected("node2:20202")
+
+        assert received == [True]
@@ -0,0 +1,146 @@
+"""Unit tests for delay measurement and adaptive Raft timing."""
+
+from __future__ import annotations
+
+import pytest
+from py_leader._timing import AdaptiveTimeouts, DelayEstimator
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        """Start at zero."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+def make_timing(clock: FakeClock) -> AdaptiveTimeouts:
+    """Timing between 30 ms and 1 s heartbeats, 300 ms and 5 s elections."""
+    return AdaptiveTimeouts((0.03, 1.0), (0.3, 5.0), clock=clock)
+
+
+def measure_rtt(
+    timing: AdaptiveTimeouts, clock: FakeClock, rtt: float, count: int
+) -> None:
+    """Time count heartbeats to one follower, each acknowledged after rtt."""
+    for _ in range(count):
+        clock.now += 0.1
+        timing.on_heartbeat_sent("node2:20202")
+        clock.now += rtt
+        timing.on_heartbeat_acknowledged("node2:20202")
+
+
+def receive_heartbeats(
+    timing: AdaptiveTimeouts, clock: FakeClock, gap: float, count: int
+) -> None:
+    """Receive count heartbeats, gap seconds apart."""
+    for _ in range(count):
+        clock.now += gap
+        timing.on_heartbeat_received()
+
+
+class TestDelayEstimator:
+    """Test the distribution of recent delays."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_percentiles_of_window(self) -> None:
+        """Percentiles cover the most recent samples only."""
+        estimator = DelayEstimator(window=100)
+        assert estimator.percentiles() == {}
+
+        for sample in range(1000, 0, -1):
+            estimator.add(float(sample))
+
+        assert estimator.count == 100
+        assert estimator.percentiles() == {
+            "p50": 50.0,
+            "p90": 90.0,
+            "p99": 99.0,
+            "max": 100.0,
+        }
+
+
+class TestAdaptiveTimeouts:
+    """Test timing derived from measured delays."""
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_configured_timing_kept_without_samples(self) -> None:
+        """Too few measurements leave the upper bounds in place."""
+        clock = FakeClock()
+        timing = make_timing(clock)
+        measure_rtt(timing, clock, 0.01, 15)
+
+        assert not timing.adjust(is_leader=True)
+        assert (timing.heartbeat_interval, timing.election_timeout) == (1.0, 5.0)
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_leader_shortens_heartbeat_at_once(self) -> None:
+        """Heartbeats speed up at once; the election timeout follows in steps."""
+        clock = FakeClock()
+        timing = make_timing(clock)
+        measure_rtt(timing, clock, 0.01, 16)
+
+        assert timing.adjust(is_leader=True)
+        assert timing.heartbeat_interval == 0.03
+        assert timing.election_timeout == pytest.approx(3.75)
+
+        while timing.adjust(is_leader=True):
+            pass
+        assert timing.election_timeout == 0.3
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_heartbeat_slows_gradually(self) -> None:
+        """A growing round trip lengthens the heartbeat interval in steps."""
+        clock = FakeClock()
+        timing = make_timing(clock)
+        measure_rtt(timing, clock, 0.01, 16)
+        timing.adjust(is_leader=True)
+
+        measure_rtt(timing, clock, 0.2, 256)
+        timing.adjust(is_leader=True)
+
+        assert timing.heartbeat_interval == pytest.approx(0.0375)
+        while timing.adjust(is_leader=True):
+            pass
+        assert timing.heartbeat_interval == pytest.approx(0.4)
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_follower_lengthens_election_timeout_at_once(self) -> None:
+        """Followers derive the timeout from gaps; longer gaps apply at once."""
+        clock = FakeClock()
+        timing = make_timing(clock)
+        receive_heartbeats(timing, clock, 0.1, 17)
+        while timing.adjust(is_leader=False):
+            pass
+        assert timing.election_timeout == pytest.approx(0.5, rel=0.1)
+        assert timing.heartbeat_interval == 1.0
+
+        receive_heartbeats(timing, clock, 0.8, 16)
+
+        assert timing.adjust(is_leader=False)
+        assert timing.election_timeout == pytest.approx(4.0)
+
+    @pytest.mark.tier(1)
+    @pytest.mark.tra("Domain.Invariant.py_leader")
+    def test_leader_change_discards_pending_timings(self) -> None:
+        """No round trip or gap spans a change of leader."""
+        clock = FakeClock()
+        timing = make_timing(clock)
+        receive_heartbeats(timing, clock, 0.1, 5)
+        timing.on_heartbeat_sent("node2:20202")
+
+        timing.on_leader_change()
+        clock.now += 3.0
+        timing.on_heartbeat_received()
+
+        assert timing.on_heartbeat_acknowledged("node2:20202") is None
+        assert timing.gaps.count == 0